@@ -1,36 +1,52 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Blueprint, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.middleware.proxy_fix import ProxyFix
+from jinja2 import FileSystemBytecodeCache
 from dcf_loader import load_data_from_api
 from dcf_code import DCFModel, DCFAssumptions
 import os
 import re
+import json
 import math
 import logging
 import time
+import threading
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from functools import lru_cache
+
+# Optional: faster JSON encoding for API responses (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
+dcf_bp = Blueprint('dcf', __name__)
 
 # =============================================================================
 # SECURITY: Input Validation
 # =============================================================================
-TICKER_REGEX = re.compile(r'^[A-Z]{1,5}$')
-
 def validate_ticker(ticker: str) -> str:
     """Validate ticker: 1-5 uppercase letters only"""
     if not ticker:
         raise ValueError("Ticker symbol is required")
     ticker = ticker.strip().upper()
-    if not TICKER_REGEX.match(ticker):
+    # Plain str checks instead of a regex: ASCII letters only, 1-5 chars
+    if not (1 <= len(ticker) <= 5 and ticker.isascii() and ticker.isalpha()):
         raise ValueError(f"Invalid ticker format: {ticker}. Must be 1-5 letters.")
     return ticker
 
+_isfinite = math.isfinite
+_G_FIELDS = tuple(f'g{i}' for i in range(1, 6))  # form names for the 5 projection years
+
 def validate_growth_rate(val, min_val=-0.5, max_val=1.0, default=0.0) -> float:
     """Validate numeric input: reject NaN/Inf, clamp to bounds"""
     try:
         val = float(val)
-        if math.isnan(val) or math.isinf(val):
+        if not _isfinite(val):
             return default
         return max(min_val, min(max_val, val))
     except (TypeError, ValueError):
@@ -39,7 +55,7 @@ def validate_growth_rate(val, min_val=-0.5, max_val=1.0, default=0.0) -> float:
 # =============================================================================
 # SECURITY: Headers Middleware
 # =============================================================================
-@app.after_request
+@dcf_bp.after_app_request
 def set_security_headers(response):
     """Add security headers to all responses"""
     response.headers['X-Content-Type-Options'] = 'nosniff'
@@ -61,86 +77,191 @@ def set_security_headers(response):
 # =============================================================================
 # RATE LIMITING: Valuation Endpoint
 # =============================================================================
-_valuation_rate_limit = {}
 VALUATION_RATE_WINDOW = 60  # seconds
 VALUATION_RATE_MAX = 10     # max valuations per minute per IP
+VALUATION_RATE_SHARDS = 16  # power of two; each shard has its own lock
+VALUATION_RATE_MAX_IPS = 10_000  # sweep idle IPs once the table grows past this
+
+_VALUATION_RATE_WINDOW_NS = VALUATION_RATE_WINDOW * 1_000_000_000
+_SHARD_MAX_IPS = VALUATION_RATE_MAX_IPS // VALUATION_RATE_SHARDS
+# Each shard maps ip -> deque of monotonic_ns request timestamps (oldest first)
+_valuation_rate_shards = [({}, threading.Lock()) for _ in range(VALUATION_RATE_SHARDS)]
 
 def check_valuation_rate_limit(ip: str) -> bool:
     """Returns True if request is allowed, False if rate limited"""
+    now = time.monotonic_ns()
+    cutoff = now - _VALUATION_RATE_WINDOW_NS
+    table, lock = _valuation_rate_shards[hash(ip) & (VALUATION_RATE_SHARDS - 1)]
+    with lock:
+        if len(table) > _SHARD_MAX_IPS:
+            for stale_ip in [k for k, dq in table.items() if not dq or dq[-1] <= cutoff]:
+                del table[stale_ip]
+        dq = table.setdefault(ip, deque())
+        while dq and dq[0] <= cutoff:
+            dq.popleft()
+        if len(dq) >= VALUATION_RATE_MAX:
+            return False
+        dq.append(now)
+        return True
+
+# =============================================================================
+# CACHING: Financial Data per Ticker
+# =============================================================================
+_data_cache = OrderedDict()  # ticker -> (fetched_at, FinancialData), LRU order
+_data_cache_lock = threading.Lock()
+DATA_CACHE_TTL = 900         # seconds
+DATA_CACHE_MAX = 256         # max tickers held in memory
+
+def get_cached_data(ticker: str):
+    """Return FinancialData for ticker, re-fetching only when the entry is stale"""
     now = time.time()
-    if ip not in _valuation_rate_limit:
-        _valuation_rate_limit[ip] = []
-    _valuation_rate_limit[ip] = [t for t in _valuation_rate_limit[ip] if now - t < VALUATION_RATE_WINDOW]
-    if len(_valuation_rate_limit[ip]) >= VALUATION_RATE_MAX:
-        return False
-    _valuation_rate_limit[ip].append(now)
-    return True
+    with _data_cache_lock:
+        entry = _data_cache.get(ticker)
+        if entry and now - entry[0] < DATA_CACHE_TTL:
+            _data_cache.move_to_end(ticker)
+            return entry[1]
+
+    data = load_data_from_api(ticker)
+
+    with _data_cache_lock:
+        _data_cache[ticker] = (now, data)
+        _data_cache.move_to_end(ticker)
+        while len(_data_cache) > DATA_CACHE_MAX:
+            _data_cache.popitem(last=False)
+    return data
+
+# Model runs for identical inputs; entries are only valid for the data object
+# they were computed from, so they expire with the ticker's data cache entry.
+_model_cache = OrderedDict()  # (ticker, g_rates, term_g) -> (data, model, val, g_steps, matrix)
+_model_cache_lock = threading.Lock()
+MODEL_CACHE_MAX = 256
+
+def run_valuation(ticker: str, g_rates: tuple, term_g: float):
+    """Return (data, model, target_price, g_steps, matrix), reusing identical recent runs"""
+    data = get_cached_data(ticker)
+    key = (ticker, g_rates, term_g)
+    with _model_cache_lock:
+        entry = _model_cache.get(key)
+        if entry and entry[0] is data:
+            _model_cache.move_to_end(key)
+            return entry
+
+    assumptions = DCFAssumptions(
+        revenue_growth_rates=list(g_rates),
+        terminal_growth_rate=term_g
+    )
+    # Web runs only need calculation_log; keep the tables off the shared worker stdout
+    model = DCFModel(data, assumptions, echo=False)
+    val = model.calculate_intrinsic_value()
+    g_steps, matrix = model.generate_sensitivity_table()
+    entry = (data, model, val, g_steps, matrix)
+
+    with _model_cache_lock:
+        _model_cache[key] = entry
+        _model_cache.move_to_end(key)
+        while len(_model_cache) > MODEL_CACHE_MAX:
+            _model_cache.popitem(last=False)
+    return entry
+
+# =============================================================================
+# TICKER SEARCH: Autocomplete
+# =============================================================================
+TICKERS_JS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'js', 'tickers.js')
+_TICKER_ENTRY_RE = re.compile(r'"?s"?\s*:\s*"([^"]*)"\s*,\s*"?n"?\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+def load_ticker_universe(path: str = TICKERS_JS_PATH) -> list:
+    """Parse (symbol, name) pairs out of the generated static/js/tickers.js"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            text = f.read()
+    except OSError as e:
+        logger.warning(f"Ticker list unavailable for search: {e}")
+        return []
+    # Current files hold a JSON array literal; older ones used bare JS object keys
+    try:
+        entries = (orjson.loads if orjson else json.loads)(text[text.index('['):text.rindex(']') + 1])
+        return [(e['s'], e['n']) for e in entries]
+    except (ValueError, KeyError, TypeError):
+        return [(sym, name.replace('\\"', '"')) for sym, name in _TICKER_ENTRY_RE.findall(text)]
+
+_ticker_universe = load_ticker_universe()
+# Sorted by symbol, so every symbol prefix is one contiguous range found by bisection
+_universe_by_symbol = sorted(_ticker_universe, key=lambda row: row[0])
+_sorted_symbols = [sym for sym, _ in _universe_by_symbol]
+_upper_names = [name.upper() for _, name in _ticker_universe]
+
+def search_tickers(query: str, limit: int = 12) -> list:
+    """Symbol-prefix matches first (shortest symbol first), then company-name matches"""
+    q = query.strip().upper()
+    if not q:
+        return []
+    lo = bisect_left(_sorted_symbols, q)
+    hi = bisect_left(_sorted_symbols, q + '\U0010ffff', lo)  # past every symbol starting with q
+    by_symbol = sorted(_universe_by_symbol[lo:hi], key=lambda row: (len(row[0]), row[0]))
+    # Short prefixes fill the page from symbols alone; only scan names when they don't
+    if len(by_symbol) < limit:
+        by_symbol += [
+            row for row, upper in zip(_ticker_universe, _upper_names)
+            if q in upper and not row[0].startswith(q)
+        ]
+    return [{"symbol": sym, "shortname": name} for sym, name in by_symbol[:limit]]
+
+@lru_cache(maxsize=4096)
+def _cached_search(query: str, limit: int) -> tuple:
+    """Autocomplete repeats the same prefixes constantly; the universe is static per process"""
+    return tuple(search_tickers(query, limit))
 
 # =============================================================================
 # ROUTES
 # =============================================================================
 
-@app.route('/', methods=['GET', 'POST'])
+def wants_json() -> bool:
+    """API clients opt into raw JSON via ?format=json or an Accept header"""
+    return (request.args.get('format') == 'json'
+            or request.accept_mimetypes.best == 'application/json')
+
+@dcf_bp.route('/', methods=['GET', 'POST'])
 def index():
     if request.method == 'POST':
         # Rate limiting for expensive valuation endpoint
-        client_ip = request.headers.get('X-Forwarded-For', request.remote_addr)
+        client_ip = request.remote_addr  # resolved from X-Forwarded-For by ProxyFix
         if not check_valuation_rate_limit(client_ip):
+            if wants_json():
+                return jsonify(error="Rate limit exceeded. Please wait 1 minute before submitting again."), 429
             return render_template('index.html', error="Rate limit exceeded. Please wait 1 minute before submitting again.")
         
         try:
             # 1. Validate Inputs
             ticker = validate_ticker(request.form.get('ticker', ''))
             
-            g_rates = [
-                validate_growth_rate(request.form.get(f'g{i}', 0.0), min_val=-0.5, max_val=1.0)
-                for i in range(1, 6)
-            ]
-            term_g = validate_growth_rate(request.form.get('term_g', 0.0), min_val=-0.1, max_val=0.15)
-            
-            # 2. Run Model (with timeout protection from loader)
-            data = load_data_from_api(ticker)
-            assumptions = DCFAssumptions(
-                revenue_growth_rates=g_rates,
-                terminal_growth_rate=term_g
+            form = request.form
+            g_rates = tuple(
+                validate_growth_rate(form.get(k, 0.0), min_val=-0.5, max_val=1.0)
+                for k in _G_FIELDS
             )
-            model = DCFModel(data, assumptions)
-            val = model.calculate_intrinsic_value()
+            term_g = validate_growth_rate(form.get('term_g', 0.0), min_val=-0.1, max_val=0.15)
             
-            # 3. Sensitivity & Heatmap Logic
-            g_steps, matrix = model.generate_sensitivity_table()
+            # 2. Run Model + Sensitivity (cached per ticker/inputs; timeout protection from loader)
+            data, model, val, g_steps, matrix = run_valuation(ticker, g_rates, term_g)
             
-            all_prices = [p for _, row in matrix for p in row]
-            min_p, max_p = min(all_prices), max(all_prices)
+            # 3. Heatmap Logic
             current_p = data.stock_price
             
-            sensitivity_data = {
-                "headers": ["WACC"] + [f"{g:.1%}" for g in g_steps],
-                "rows": []
-            }
+            # API clients get the raw grid and colour it themselves
+            if wants_json():
+                return jsonify(
+                    ticker=ticker,
+                    value=val,
+                    headers=g_steps,
+                    wacc=[w for w, _ in matrix],
+                    prices=[row for _, row in matrix],
+                    current_price=current_p
+                )
             
-            for wacc, prices in matrix:
-                row_items = [{"value": f"{wacc:.1%}", "style": "font-weight: bold; background-color: #f3f4f6;"}]
-                
-                for p in prices:
-                    if p >= current_p:
-                        denom = max_p - current_p
-                        intensity = (p - current_p) / denom if denom > 0 else 0
-                        alpha = 0.1 + (0.6 * intensity)
-                        bg_color = f"rgba(34, 197, 94, {alpha:.2f})"
-                    else:
-                        denom = current_p - min_p
-                        intensity = (current_p - p) / denom if denom > 0 else 0
-                        alpha = 0.1 + (0.6 * intensity)
-                        bg_color = f"rgba(239, 68, 68, {alpha:.2f})"
-                        
-                    row_items.append({
-                        "value": f"${p:,.2f}", 
-                        "style": f"background-color: {bg_color};"
-                    })
-                    
-                sensitivity_data["rows"].append(row_items)
+            # Raw prices only; result.html colours the heatmap in the browser
+            sensitivity_data = {"g_steps": g_steps, "rows": matrix}
 
+            # Render inside the try so template errors reach the handlers below
             return render_template(
                 'result.html',
                 ticker=ticker,
@@ -154,14 +275,60 @@ def index():
             
         except ValueError as e:
             # User input errors - safe to display
+            if wants_json():
+                return jsonify(error=str(e)), 400
             return render_template('index.html', error=str(e))
         except Exception as e:
             # Internal errors - log full, show generic
             logger.error(f"DCF Calculation Error: {e}", exc_info=True)
-            return render_template('index.html', error="An error occurred processing your request. Please check the ticker symbol and try again.")
+            error = "An error occurred processing your request. Please check the ticker symbol and try again."
+            if wants_json():
+                return jsonify(error=error), 500
+            return render_template('index.html', error=error)
             
     return render_template('index.html')
 
+@dcf_bp.route('/api/search')
+def api_search():
+    query = request.args.get('q', '').strip()[:32]
+    limit = min(request.args.get('limit', default=12, type=int) or 12, 20)
+    results = list(_cached_search(query.lower(), limit))
+    # Results only change when the ticker list does: let clients revalidate with
+    # If-None-Match and get a bodiless 304 instead of the same JSON again
+    resp = jsonify(results)
+    resp.add_etag()
+    return resp.make_conditional(request)
+
+# =============================================================================
+# APP FACTORY
+# =============================================================================
+class OrjsonProvider(DefaultJSONProvider):
+    """jsonify() through orjson; anything orjson rejects goes to the stdlib encoder"""
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        try:
+            return orjson.dumps(obj, option=self.option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+def create_app() -> Flask:
+    """Build the Flask app; every entrypoint (gunicorn, serverless) shares this"""
+    flask_app = Flask(__name__)
+    # Trust exactly one proxy hop (Render's load balancer) for client IP/scheme
+    flask_app.wsgi_app = ProxyFix(flask_app.wsgi_app, x_for=1, x_proto=1)
+    if orjson is not None:
+        flask_app.json = OrjsonProvider(flask_app)
+    flask_app.register_blueprint(dcf_bp)
+    # Share compiled templates across workers/restarts, and compile them now
+    # rather than on the first request each worker serves
+    flask_app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+    for name in ('index.html', 'result.html'):
+        flask_app.jinja_env.get_template(name)
+    return flask_app
+
+app = create_app()
+
 # Production: debug is controlled by environment variable
 if __name__ == '__main__':
     debug_mode = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
@@ -12,7 +12,7 @@ Output:
 - static/js/tickers.js containing: const TICKER_DATA = [ { s: "...", n: "..." }, ... ];
 
 USAGE:
-  pip install pandas yfinance requests
+  pip install requests yfinance
   python build_ticker_array.py
 
 NOTES:
@@ -23,13 +23,16 @@ NOTES:
 
 from __future__ import annotations
 
+import csv
+import json
 import re
 import time
 import os
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
-import pandas as pd
 import requests
 
 # Optional (only used if ENABLE_YFINANCE_FILTERING=True)
@@ -38,13 +41,22 @@ try:
 except Exception:
     yf = None  # type: ignore
 
+# Optional: faster parsing of the batched quote responses (falls back to stdlib json)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 # -----------------------------
 # Config
 # -----------------------------
 
 ENABLE_YFINANCE_FILTERING = False  # Set False for speed (directory only ~30s), True for high quality (~15m)
-YFINANCE_SLEEP_SECONDS = 0.25      # throttle to reduce HTTP 429 / blocks
+YFINANCE_WORKERS = 16              # concurrent get_info() calls (I/O bound)
+YFINANCE_MAX_RPS = 40              # global request rate cap to reduce HTTP 429 / blocks
+YFINANCE_MAX_RETRIES = 3           # retries on HTTP 429, with exponential backoff
+YFINANCE_BACKOFF_SECONDS = 1.0     # first backoff delay; doubles per retry
 MAX_YFINANCE_TICKERS = 3000        # safety cap
 
 # Exclusion toggles (yfinance-based)
@@ -55,6 +67,12 @@ EXCLUDE_LPS_MLPS = True            # partnership/LP/MLP heuristics
 NASDAQ_LISTED_URL = "https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqlisted.txt"
 OTHER_LISTED_URL  = "https://www.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt"
 
+# Batched quote endpoint: quoteType/names for up to 20 symbols per request
+YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+YAHOO_QUOTE_BATCH_SIZE = 20
+# Only what yf_passes_filters/build_final_list read; the full quote carries ~80 fields
+YAHOO_QUOTE_FIELDS = "symbol,quoteType,shortName,longName,sector,industry"
+
 # Output path relative to this script
 OUTPUT_PATH = "static/js/tickers.js"
 
@@ -62,49 +80,54 @@ OUTPUT_PATH = "static/js/tickers.js"
 # Helpers
 # -----------------------------
 
-def fetch_symbol_file(url: str) -> pd.DataFrame:
+def fetch_symbol_file(url: str, session: Optional[requests.Session] = None) -> List[Dict[str, str]]:
     """
     Nasdaq Trader files are pipe-delimited with header and a trailing footer line.
+    Returns one {column: value} dict per well-formed row, values as literal strings.
+    Pass a shared Session to reuse pooled connections to the same host.
     """
     print(f"Fetching {url}...")
     headers = {
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
     }
-    resp = requests.get(url, timeout=30, headers=headers)
+    resp = (session or requests).get(url, timeout=30, headers=headers)
     resp.raise_for_status()
-    text = resp.text.strip().splitlines()
-
-    # Drop footer lines that start with "File Creation Time"
-    rows = [line for line in text if not line.startswith("File Creation Time") and line.strip()]
-    # Convert to DataFrame
-    data = [r.split("|") for r in rows]
-    header = data[0]
-    values = data[1:]
-    # Handle potential ragged rows
-    valid_values = [v for v in values if len(v) == len(header)]
-    
-    df = pd.DataFrame(valid_values, columns=header)
-    return df
+
+    reader = csv.reader(resp.text.splitlines(), delimiter="|", quoting=csv.QUOTE_NONE)
+    header = next(reader, [])
+    # Ragged rows are dropped; the "File Creation Time" footer is a single field
+    return [
+        dict(zip(header, row))
+        for row in reader
+        if len(row) == len(header) and not row[0].startswith("File Creation Time")
+    ]
+
+
+# Upper-case ASCII letters and map "." -> "-" in a single translate pass
+_SYMBOL_TABLE = str.maketrans(
+    {**{c: c.upper() for c in "abcdefghijklmnopqrstuvwxyz"}, ".": "-"}
+)
 
 
 def normalize_symbol(sym: str) -> str:
-    sym = sym.strip().upper()
     # yfinance expects BRK-B, BF-B, etc (dash not dot) in many contexts.
     # But your list uses BRK.B; we can keep dots in output if you prefer.
     # We'll standardize internals to yfinance-friendly (dash) and output with dash.
-    sym = sym.replace(".", "-")
-    return sym
+    return sym.strip().translate(_SYMBOL_TABLE)
+
+
+# Remove common suffix clutter from directory names, e.g.
+# "Microsoft Corporation - Common Stock": everything from the first match on
+_WHITESPACE_RE = re.compile(r"\s+")
+_CLEAN_RE = re.compile(
+    r"\s*-\s*(?:Common Stock|Ordinary Shares|Class [A-Z]|American Depositary Shares|ADS)\b.*$",
+    re.IGNORECASE,
+)
 
 
 def clean_company_name(name: str) -> str:
-    name = re.sub(r"\s+", " ", (name or "").strip())
-    # Remove common suffix clutter from directory names:
-    # e.g., "Microsoft Corporation - Common Stock"
-    name = re.sub(r"\s*-\s*Common Stock\b.*$", "", name, flags=re.IGNORECASE)
-    name = re.sub(r"\s*-\s*Ordinary Shares\b.*$", "", name, flags=re.IGNORECASE)
-    name = re.sub(r"\s*-\s*Class [A-Z]\b.*$", "", name, flags=re.IGNORECASE)
-    name = re.sub(r"\s*-\s*American Depositary Shares\b.*$", "", name, flags=re.IGNORECASE)
-    name = re.sub(r"\s*-\s*ADS\b.*$", "", name, flags=re.IGNORECASE)
+    name = _WHITESPACE_RE.sub(" ", (name or "").strip())
+    name = _CLEAN_RE.sub("", name)
     name = name.strip(" -")
     return name
 
@@ -133,10 +156,57 @@ EXCLUDE_NAME_PATTERNS = [
     r"\bSPAC\b",
     r"\bACQUISITION\b",
 ]
-EXCLUDE_NAME_RE = re.compile("|".join(EXCLUDE_NAME_PATTERNS), re.IGNORECASE)
 
-LP_MLP_RE = re.compile(r"\b(LP|L\.P\.|MASTER LIMITED PARTNERSHIP|MLP)\b", re.IGNORECASE)
-REIT_RE   = re.compile(r"\bREIT\b|\bREAL ESTATE INVESTMENT TRUST\b", re.IGNORECASE)
+LP_MLP_PATTERN = r"\b(?:LP|L\.P\.|MASTER LIMITED PARTNERSHIP|MLP)\b"
+REIT_PATTERN   = r"\bREIT\b|\bREAL ESTATE INVESTMENT TRUST\b"
+
+# Upper-case substrings at least one of which every pattern above needs in
+# order to match. Most names contain none, so they skip the regex entirely.
+# Keep in sync when adding patterns.
+EXCLUDE_NAME_KEYWORDS = (
+    "ETF", "ETN", "EXCHANGE", "INDEX", "TRUST", "FUND", "PORTFOLIO", "NOTE",
+    "DEPOSITARY", "ADR", "UNIT", "WARRANT", "RIGHT", "PREFERRED", "SERIES",
+    "SPAC", "ACQUISITION",
+)
+LP_MLP_KEYWORDS = ("LP", "L.P.", "MASTER LIMITED PARTNERSHIP")
+REIT_KEYWORDS   = ("REIT", "REAL ESTATE INVESTMENT TRUST")
+
+
+@lru_cache(maxsize=None)
+def _name_exclusion_re(exclude_lps: bool, exclude_reits: bool) -> re.Pattern:
+    """
+    One alternation covering every *enabled* name exclusion, so a single scan
+    decides. Disabled categories are left out rather than matched and ignored:
+    leftmost matching would otherwise let e.g. "REAL ESTATE INVESTMENT TRUST"
+    consume the "TRUST" the fund patterns need to see.
+    """
+    parts = list(EXCLUDE_NAME_PATTERNS)
+    if exclude_lps:
+        parts.append(LP_MLP_PATTERN)
+    if exclude_reits:
+        parts.append(REIT_PATTERN)
+    return re.compile("|".join(parts), re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _name_exclusion_keywords(exclude_lps: bool, exclude_reits: bool) -> Tuple[str, ...]:
+    """Substring prefilter matching _name_exclusion_re's enabled categories"""
+    keywords = EXCLUDE_NAME_KEYWORDS
+    if exclude_lps:
+        keywords += LP_MLP_KEYWORDS
+    if exclude_reits:
+        keywords += REIT_KEYWORDS
+    return keywords
+
+
+def name_is_excluded(name: str) -> bool:
+    """Fund/note/trust/etc. names, plus LP/MLP and REIT names when those toggles are on"""
+    if not name:
+        return False
+    upper = name.upper()
+    if not any(k in upper for k in _name_exclusion_keywords(EXCLUDE_LPS_MLPS, EXCLUDE_REITS)):
+        return False  # no keyword present, the regex cannot match
+    return _name_exclusion_re(EXCLUDE_LPS_MLPS, EXCLUDE_REITS).search(name) is not None
 
 
 def is_probably_non_common_equity(sym: str, name: str) -> bool:
@@ -155,28 +225,27 @@ def is_probably_non_common_equity(sym: str, name: str) -> bool:
     if len(s) > 5: 
         return True # Tickers > 5 chars usually test, preferred, or warrants
 
-    # Exclude if the name looks like a fund/note/trust/etc
-    if EXCLUDE_NAME_RE.search(name or ""):
-        return True
+    # Exclude if the name looks like a fund/note/trust/etc (or LP/MLP/REIT if enabled)
+    return name_is_excluded(name)
 
-    # Exclude LP/MLP if enabled
-    if EXCLUDE_LPS_MLPS and LP_MLP_RE.search(name or ""):
-        return True
-
-    # Exclude REIT if enabled (heuristic)
-    if EXCLUDE_REITS and REIT_RE.search(name or ""):
-        return True
-
-    return False
 
-
-@dataclass
-class TickerRow:
+class TickerRow(NamedTuple):
     s: str
     n: str
 
 
-def df_to_candidates(nasdaq_df: pd.DataFrame, other_df: pd.DataFrame) -> Dict[str, str]:
+def _listing_rows(rows: List[Dict[str, str]], symbol_col: str) -> Iterable[Tuple[str, str]]:
+    """
+    Drop ETF / test-issue rows of one directory file and yield normalized
+    (symbol, name) pairs.
+    """
+    for row in rows:
+        if row.get("ETF", "").strip().upper() == "Y" or row.get("Test Issue", "").strip().upper() == "Y":
+            continue
+        yield normalize_symbol(row[symbol_col]), row["Security Name"].strip()
+
+
+def listings_to_candidates(nasdaq_rows: List[Dict[str, str]], other_rows: List[Dict[str, str]]) -> Dict[str, str]:
     """
     Build initial candidate map: symbol -> company name (best-effort).
     """
@@ -184,14 +253,8 @@ def df_to_candidates(nasdaq_df: pd.DataFrame, other_df: pd.DataFrame) -> Dict[st
 
     # Nasdaq file columns: Symbol, Security Name, Market Category, Test Issue, Financial Status, Round Lot Size, ETF, NextShares
     print("Processing Nasdaq listings...")
-    if 'Symbol' in nasdaq_df.columns:
-        for _, r in nasdaq_df.iterrows():
-            if str(r.get("ETF", "")).strip().upper() == "Y": continue
-            if str(r.get("Test Issue", "")).strip().upper() == "Y": continue
-            
-            sym = normalize_symbol(str(r.get("Symbol", "")))
-            name = str(r.get("Security Name", "")).strip()
-            
+    if nasdaq_rows and 'Symbol' in nasdaq_rows[0]:
+        for sym, name in _listing_rows(nasdaq_rows, "Symbol"):
             if not sym or is_probably_non_common_equity(sym, name):
                 continue
 
@@ -199,20 +262,14 @@ def df_to_candidates(nasdaq_df: pd.DataFrame, other_df: pd.DataFrame) -> Dict[st
 
     # Other file columns: ACT Symbol, Security Name, Exchange, CQS Symbol, ETF, Round Lot Size, Test Issue, NASDAQ Symbol
     print("Processing Other listings...")
-    if 'ACT Symbol' in other_df.columns:
-        for _, r in other_df.iterrows():
-            if str(r.get("ETF", "")).strip().upper() == "Y": continue
-            if str(r.get("Test Issue", "")).strip().upper() == "Y": continue
-            
-            sym = normalize_symbol(str(r.get("ACT Symbol", "")))
-            name = str(r.get("Security Name", "")).strip()
-
-            if not sym or is_probably_non_common_equity(sym, name):
+    if other_rows and 'ACT Symbol' in other_rows[0]:
+        for sym, name in _listing_rows(other_rows, "ACT Symbol"):
+            # Prefer existing name if present (Nasdaq usually has better names),
+            # so skip duplicates before any name heuristics run
+            if not sym or sym in candidates or is_probably_non_common_equity(sym, name):
                 continue
-            
-            # Prefer existing name if present (Nasdaq usually has better names)
-            if sym not in candidates:
-                candidates[sym] = clean_company_name(name)
+
+            candidates[sym] = clean_company_name(name)
 
     # Manual inclusions for things that might get filtered aggressively
     # e.g. BRK-B is filtered by >5 char check usually, but it's valid.
@@ -221,18 +278,86 @@ def df_to_candidates(nasdaq_df: pd.DataFrame, other_df: pd.DataFrame) -> Dict[st
     return candidates
 
 
+class RateLimiter:
+    """
+    Thread-safe token bucket: allows bursts up to `rate` and refills at `rate`
+    tokens per second. acquire() blocks until a token is available.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_yf_rate_limiter = RateLimiter(YFINANCE_MAX_RPS)
+
+
+def _is_rate_limited(exc: Exception) -> bool:
+    msg = str(exc)
+    return "429" in msg or "Too Many Requests" in msg or type(exc).__name__ == "YFRateLimitError"
+
+
 def yf_info_safe(ticker: str) -> Optional[dict]:
     """
     yfinance can error, time out, or return partial data.
+    Rate limited globally; HTTP 429s are retried with exponential backoff.
     """
     if yf is None:
         return None
-    try:
-        t = yf.Ticker(ticker)
-        info = t.get_info()
-        return info if isinstance(info, dict) else None
-    except Exception:
-        return None
+    for attempt in range(YFINANCE_MAX_RETRIES + 1):
+        _yf_rate_limiter.acquire()
+        try:
+            t = yf.Ticker(ticker)
+            info = t.get_info()
+            return info if isinstance(info, dict) else None
+        except Exception as e:
+            if attempt < YFINANCE_MAX_RETRIES and _is_rate_limited(e):
+                time.sleep(YFINANCE_BACKOFF_SECONDS * 2 ** attempt)
+                continue
+            return None
+    return None
+
+
+def fetch_quotes_batch(symbols: List[str]) -> Dict[str, dict]:
+    """
+    Pre-fetch lightweight quote fields (quoteType, shortName/longName) for many
+    symbols, YAHOO_QUOTE_BATCH_SIZE per HTTP request. Failed chunks are simply
+    missing from the result; if the very first chunk is refused (Yahoo may demand
+    a crumb/cookie), batching is abandoned and callers fall back to get_info().
+    """
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    }
+    quotes: Dict[str, dict] = {}
+    with requests.Session() as session:
+        for i in range(0, len(symbols), YAHOO_QUOTE_BATCH_SIZE):
+            chunk = symbols[i:i + YAHOO_QUOTE_BATCH_SIZE]
+            _yf_rate_limiter.acquire()
+            try:
+                resp = session.get(YAHOO_QUOTE_URL, params={"symbols": ",".join(chunk), "fields": YAHOO_QUOTE_FIELDS}, headers=headers, timeout=15)
+                resp.raise_for_status()
+                for q in _json_loads(resp.content).get("quoteResponse", {}).get("result", []):
+                    if q.get("symbol"):
+                        quotes[q["symbol"].upper()] = q
+            except Exception as e:
+                if i == 0:
+                    print(f"Batched quote endpoint unavailable ({e}); using per-symbol lookups.")
+                    return {}
+    return quotes
 
 
 def yf_passes_filters(symbol: str, info: dict, fallback_name: str) -> bool:
@@ -241,7 +366,7 @@ def yf_passes_filters(symbol: str, info: dict, fallback_name: str) -> bool:
         return False
 
     name = (info.get("shortName") or info.get("longName") or fallback_name or "").strip()
-    if EXCLUDE_NAME_RE.search(name):
+    if name_is_excluded(name):
         return False
 
     sector = (info.get("sector") or "").strip().lower()
@@ -252,10 +377,7 @@ def yf_passes_filters(symbol: str, info: dict, fallback_name: str) -> bool:
         if any(k in industry for k in ["banks", "insurance", "capital markets", "mortgage", "credit services"]):
             return False
 
-    if EXCLUDE_REITS and (sector == "real estate" or "reit" in industry or REIT_RE.search(name)):
-        return False
-
-    if EXCLUDE_LPS_MLPS and LP_MLP_RE.search(name):
+    if EXCLUDE_REITS and (sector == "real estate" or "reit" in industry):
         return False
 
     return True
@@ -265,50 +387,69 @@ def build_final_list(candidates: Dict[str, str]) -> List[TickerRow]:
     """
     Optionally enrich and filter with yfinance. Always de-dupe by symbol.
     """
-    out: List[TickerRow] = []
-
     # Sort for stability
-    symbols = sorted(candidates.keys())
+    items = sorted(candidates.items())
 
     if not ENABLE_YFINANCE_FILTERING:
         print("Skipping yfinance enrichment (ENABLE_YFINANCE_FILTERING=False)")
-        for sym in symbols:
-            out.append(TickerRow(s=sym, n=candidates[sym]))
-        return out
+        return [TickerRow(sym, name) for sym, name in items]
+
+    symbols = [sym for sym, _ in items]
 
     if yf is None:
         raise RuntimeError("yfinance not installed, but ENABLE_YFINANCE_FILTERING=True.")
 
-    print(f"Enriching top {MAX_YFINANCE_TICKERS} candidates with yfinance...")
+    print(f"Enriching top {MAX_YFINANCE_TICKERS} candidates with yfinance ({YFINANCE_WORKERS} threads)...")
     count = 0
     start_time = time.time()
-    
-    for i, sym in enumerate(symbols):
-        if count >= MAX_YFINANCE_TICKERS:
-            break
-            
-        if i % 50 == 0:
+
+    # One batched pass first: quoteType and names are enough to reject funds and
+    # name-pattern exclusions without a per-symbol get_info() round trip.
+    quotes = fetch_quotes_batch(symbols)
+    print(f"Batched quotes fetched for {len(quotes):,} symbols")
+    needs_profile = EXCLUDE_FINANCIALS or EXCLUDE_REITS
+
+    def resolve_info(sym: str) -> Optional[dict]:
+        quote = quotes.get(sym)
+        if quote is None:
+            return yf_info_safe(sym)
+        if needs_profile and not quote.get("sector") and yf_passes_filters(sym, quote, candidates[sym]):
+            # Survivor still needs sector/industry, which only get_info() carries
+            return yf_info_safe(sym) or quote
+        return quote
+
+    # Fetch in ordered batches so the kept-ticker cap and output order stay
+    # deterministic while each batch's HTTP calls overlap.
+    batch_size = YFINANCE_WORKERS * 4
+    out: List[TickerRow] = []
+    with ThreadPoolExecutor(max_workers=YFINANCE_WORKERS) as ex:
+        for i in range(0, len(symbols), batch_size):
+            if count >= MAX_YFINANCE_TICKERS:
+                break
+
             elapsed = time.time() - start_time
             print(f"Processed {i}/{len(symbols)}... ({count} kept) - {elapsed:.1f}s")
 
-        info = yf_info_safe(sym)
-        time.sleep(YFINANCE_SLEEP_SECONDS)
-
-        fallback_name = candidates[sym]
-        if not info:
-             # Keep if yfinance fails? Let's say yes for robustness, or no for strictness.
-             # User said "work in yfinance", implying we need valid yfinance tickers.
-             # But if yfinance network flakes, we might lose valid ones. 
-             # Let's keep them but use directory name.
-            out.append(TickerRow(s=sym, n=fallback_name))
-            count += 1
-            continue
-
-        if yf_passes_filters(sym, info, fallback_name):
-            name = (info.get("longName") or info.get("shortName") or fallback_name or "").strip()
-            name = clean_company_name(name)
-            out.append(TickerRow(s=sym, n=name))
-            count += 1
+            batch = items[i:i + batch_size]
+            infos = ex.map(resolve_info, [sym for sym, _ in batch])
+            for (sym, fallback_name), info in zip(batch, infos):
+                if count >= MAX_YFINANCE_TICKERS:
+                    break
+
+                if not info:
+                     # Keep if yfinance fails? Let's say yes for robustness, or no for strictness.
+                     # User said "work in yfinance", implying we need valid yfinance tickers.
+                     # But if yfinance network flakes, we might lose valid ones. 
+                     # Let's keep them but use directory name.
+                    out.append(TickerRow(s=sym, n=fallback_name))
+                    count += 1
+                    continue
+
+                if yf_passes_filters(sym, info, fallback_name):
+                    name = (info.get("longName") or info.get("shortName") or fallback_name or "").strip()
+                    name = clean_company_name(name)
+                    out.append(TickerRow(s=sym, n=name))
+                    count += 1
 
     return out
 
@@ -319,38 +460,43 @@ def write_js_array(rows: List[TickerRow], path: str) -> None:
     rows.sort(key=lambda x: x.s)
     
     print(f"Writing {len(rows)} tickers to {path}...")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("// Auto-generated by build_ticker_array.py\n")
-        f.write(f"// Generated at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"// Total count: {len(rows)}\n")
-        f.write("const TICKER_DATA = [\n")
-        for r in rows:
-            # Escape quotes minimally
-            name = r.n.replace('"', '\\"')
-            f.write(f'  {{ s: "{r.s}", n: "{name}" }},\n')
-        f.write("];\n")
+    # Compact JSON array literal (quoted keys, no whitespace) from the C encoder
+    data = json.dumps(
+        [{"s": r.s, "n": r.n} for r in rows], separators=(",", ":"), ensure_ascii=False
+    )
+    payload = "".join([
+        "// Auto-generated by build_ticker_array.py\n",
+        f"// Generated at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n",
+        f"// Total count: {len(rows)}\n",
+        f"const TICKER_DATA = {data};\n",
+    ])
+    with open(path, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+        f.write(payload)
     print("Done.")
 
 
 def main() -> None:
     # Ensure dependencies
     try:
-        import pandas
         import requests
     except ImportError:
-        print("Please run: pip install pandas requests yfinance")
+        print("Please run: pip install requests yfinance")
         return
 
     print("Downloading symbol directories...")
     try:
-        nasdaq_df = fetch_symbol_file(NASDAQ_LISTED_URL)
-        other_df = fetch_symbol_file(OTHER_LISTED_URL)
+        # Both directories live on the same host: download them concurrently
+        # over one pooled session
+        with requests.Session() as session, ThreadPoolExecutor(max_workers=2) as ex:
+            fut_nasdaq = ex.submit(fetch_symbol_file, NASDAQ_LISTED_URL, session)
+            fut_other = ex.submit(fetch_symbol_file, OTHER_LISTED_URL, session)
+            nasdaq_rows, other_rows = fut_nasdaq.result(), fut_other.result()
     except Exception as e:
         print(f"Error fetching data: {e}")
         return
 
     print("Building candidate universe...")
-    candidates = df_to_candidates(nasdaq_df, other_df)
+    candidates = listings_to_candidates(nasdaq_rows, other_rows)
     print(f"Candidates found: {len(candidates):,}")
 
     final_rows = build_final_list(candidates)
@@ -1,7 +1,11 @@
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import List
 
-@dataclass
+import numpy as np
+
+@dataclass(slots=True)
 class DCFAssumptions:
     """
     Container for USER inputs: only growth rates and terminal parameters.
@@ -18,6 +22,7 @@ class FinancialData:
     Container for all data fetched from the API (Company financials + Market data).
     Stores LISTS of floats for historical data (e.g., last 3 years).
     Order: [Year n-2, Year n-1, Year n (most recent)]
+    Not slotted: the cached_property derivations below live in __dict__.
     """
     # Income Statement (Historical)
     years: List[str]          # ['2021', '2022', '2023']
@@ -57,41 +62,200 @@ class FinancialData:
     risk_free_rate: float
     market_return_rate: float    
 
-    @property
-    def nwc(self) -> List[float]:
+    @cached_property
+    def nwc(self) -> np.ndarray:
         # Calculate NWC for each year in history
         # (CA - Cash) - (CL - Short Term Debt)
-        nwc_list = []
-        for i in range(len(self.current_assets)):
-            op_assets = self.current_assets[i] - self.cash_and_equivalents[i]
-            op_liabs = self.current_liabilities[i] - self.short_term_debt[i]
-            nwc_list.append(op_assets - op_liabs)
-        return nwc_list
-
-    @property
-    def book_value(self) -> List[float]:
+        op_assets = np.asarray(self.current_assets, dtype=np.float64) - np.asarray(self.cash_and_equivalents, dtype=np.float64)
+        op_liabs = np.asarray(self.current_liabilities, dtype=np.float64) - np.asarray(self.short_term_debt, dtype=np.float64)
+        return op_assets - op_liabs
+
+    @cached_property
+    def book_value(self) -> np.ndarray:
         # TA - TL for each year
-        return [a - l for a, l in zip(self.total_assets, self.total_liabilities)]
+        return np.asarray(self.total_assets, dtype=np.float64) - np.asarray(self.total_liabilities, dtype=np.float64)
+
+    @cached_property
+    def _matrix(self) -> np.ndarray:
+        """
+        Margin drivers stacked row-wise into one (5, years) float64 array:
+        [revenue, ebit, d_and_a, nwc, capex]
+        """
+        return np.asarray(
+            [self.revenue, self.ebit, self.d_and_a, self.nwc, self.capex], dtype=np.float64
+        )
 
 
-import numpy as np
-import io
-import sys
+# Optional: Numba JIT for the sensitivity sweep (falls back to plain Python loops)
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def _dcf_price(ufcfs, wacc, terminal_growth_rate, net_debt, shares):
+    """
+    Per-cell DCF kernel: discount UFCFs, add Gordon Growth TV, roll the EV
+    forward 12 months and bridge to a per-share price. Returns 0.0 for
+    invalid scenarios (WACC <= g, no shares, no cash flows).
+    """
+    n = ufcfs.shape[0]
+    if n == 0 or wacc <= terminal_growth_rate or shares <= 0:
+        return 0.0
+
+    # Discount factors as a running product; TV sits at the end of the
+    # forecast horizon, so it takes the final year's factor
+    growth = 1 + wacc
+    factor = 1.0
+    pv_ufcf_sum = 0.0
+    for i in range(n):
+        factor *= growth
+        pv_ufcf_sum += ufcfs[i] / factor
+
+    tv = (ufcfs[n - 1] * (1 + terminal_growth_rate)) / (wacc - terminal_growth_rate)
+    pv_tv = tv / factor
+
+    current_ev = pv_ufcf_sum + pv_tv
+    ev_12m = (current_ev * (1 + wacc)) - ufcfs[0]
+    return (ev_12m - net_debt) / shares
+
+
+@njit(cache=True)
+def _dcf_price_grid(ufcfs, waccs, growths, net_debt, shares):
+    """
+    Fills a (len(waccs), len(growths)) matrix of target prices, one WACC row
+    at a time. Same arithmetic as _dcf_price, but the stage-1 PV and
+    the horizon-end TV discount depend only on WACC, so each row computes them once.
+    """
+    out = np.zeros((waccs.shape[0], growths.shape[0]))
+    n = ufcfs.shape[0]
+    if n == 0 or shares <= 0:
+        return out
+
+    for i in range(waccs.shape[0]):
+        wacc = waccs[i]
+        growth = 1 + wacc
+        factor = 1.0
+        pv_ufcf_sum = 0.0
+        for k in range(n):
+            factor *= growth
+            pv_ufcf_sum += ufcfs[k] / factor
+
+        for j in range(growths.shape[0]):
+            g = growths[j]
+            if wacc <= g:
+                continue
+            tv = (ufcfs[n - 1] * (1 + g)) / (wacc - g)
+            current_ev = pv_ufcf_sum + tv / factor
+            ev_12m = (current_ev * (1 + wacc)) - ufcfs[0]
+            out[i, j] = (ev_12m - net_debt) / shares
+    return out
+
+
+def _dcf_price_grid_numpy(ufcfs, waccs, growths, net_debt, shares):
+    """
+    Same grid as _dcf_price_grid, broadcast over (wacc, g) in NumPy.
+    Used when numba is not installed so the sweep never drops to Python loops.
+    """
+    out = np.zeros((waccs.shape[0], growths.shape[0]))
+    n = ufcfs.shape[0]
+    if n == 0 or shares <= 0:
+        return out
+
+    w = waccs[:, None]
+    g = growths[None, :]
+    factors = np.cumprod(np.broadcast_to(1 + w, (w.shape[0], n)), axis=1)
+    pv_ufcf_sum = (ufcfs / factors).sum(axis=1)[:, None]
+    tv_discount = factors[:, -1:]
+
+    valid = w > g
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tv = (ufcfs[-1] * (1 + g)) / (w - g)
+    pv_tv = tv / tv_discount
+
+    current_ev = pv_ufcf_sum + pv_tv
+    ev_12m = (current_ev * (1 + w)) - ufcfs[0]
+    np.divide(ev_12m - net_debt, shares, out=out, where=valid)
+    return out
+
+
+if not HAS_NUMBA:
+    _dcf_price_grid = _dcf_price_grid_numpy
+
+def _fmt_list(arr) -> str:
+    """[1,234, 5,678] style whole-number list for the calculation log"""
+    return "[" + ", ".join(map("{:,.0f}".format, arr)) + "]"
+
+
+# Forecast columns of DCFModel.projections_arr (one row per projected year)
+PROJECTION_COLS = ("Revenue", "EBIT", "Taxes", "NOPAT", "D&A", "CapEx", "NWC", "Change NWC", "UFCF")
+_PROJ_IDX = {c: i for i, c in enumerate(PROJECTION_COLS)}
+# Keys of the per-year dicts in DCFModel.projections (after "Year")
+_PROJECTION_VIEW_COLS = ("Revenue", "EBIT", "Taxes", "D&A", "CapEx", "NWC", "Change NWC", "UFCF")
+
+# Per-year log row templates, parsed once. Forecast rows take (year, *PROJECTION_COLS)
+# and skip the NWC level (field 7); discount rows take (year, UFCF, factor, PV)
+_FORECAST_ROW_FMT = "{0:<5} | {1:,.0f} | {2:,.0f} | {3:,.0f} | {4:,.0f} | {5:,.0f} | {6:,.0f} | {8:,.0f} | {9:,.0f}".format
+_DISCOUNT_ROW_FMT = "{:<5} | {:,.0f} | {:.4f}       | {:,.0f}".format
+
+# Sensitivity grid offsets around the base WACC / terminal growth
+_SENSITIVITY_OFFSETS = np.array([-0.002, -0.001, 0.0, 0.001, 0.002])
+
 
 class DCFModel:
-    def __init__(self, data: FinancialData, assumptions: DCFAssumptions):
+    def __init__(self, data: FinancialData, assumptions: DCFAssumptions, verbose: bool = True, echo: bool = True):
         self.data = data
         self.assumptions = assumptions
+        self.verbose = verbose     # False skips all log formatting, printing and storage
+        self.echo = echo           # False keeps calculation_log but never touches stdout
         self.wacc = 0.0
         self.projections = []
+        self.projections_arr = np.empty((0, len(PROJECTION_COLS)))  # SoA source of self.projections
+        self._ufcf_arr = np.empty(0)  # UFCF column of self.projections, for the pricing kernels
         self.calculation_log = []  # Stores output for web display
+        self._log_buf = []         # Table rows stored but not yet printed
+
+        # Equity bridge inputs are fixed per model; resolve them once for the pricing kernels
+        total_debt = data.total_debt[-1] if data.total_debt else 0
+        cash = data.cash_and_equivalents[-1] if data.cash_and_equivalents else 0
+        self._net_debt = float(total_debt - cash)
+        self._shares = float(data.shares_outstanding)
         
     def _log(self, message: str):
         """Print AND store message for web transparency"""
-        print(message)
+        if not self.verbose:
+            return
+        if self.echo:
+            sys.stdout.write(message + "\n")
         self.calculation_log.append(message)
+
+    def _logb(self, message: str):
+        """Store now, print with the rest of the table on _flush_log()"""
+        if not self.verbose:
+            return
+        self.calculation_log.append(message)
+        if self.echo:
+            self._log_buf.append(message)
+
+    def _flush_log(self):
+        """Print buffered table rows in one write"""
+        if self._log_buf:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
+            self._log_buf.clear()
         
     def _print_header(self, title):
+        if not self.verbose:
+            return
+        # Phase boundary: push the previous phase out in one flush
+        if self.echo:
+            sys.stdout.flush()
         self._log(f"\n{'='*60}")
         self._log(f" {title}")
         self._log(f"{'='*60}")
@@ -105,50 +269,37 @@ class DCFModel:
         """
         self._print_header("PHASE 1: HISTORICAL DRIVERS (BASELINE)")
         
-        # Convert List[float] to numpy arrays for vector math
         rec_count = min(len(self.data.revenue), 3) # Strict 3-year window for averaging
         
-        # Extract last 'rec_count' years (Order: Oldest -> Newest)
-        rev = np.array(self.data.revenue[-rec_count:])
-        ebit = np.array(self.data.ebit[-rec_count:])
-        da = np.array(self.data.d_and_a[-rec_count:])
-        
-        # NWC List handling
-        nwc_list = self.data.nwc
-        nwc = np.array(nwc_list[-rec_count:])
-        
-        # CapEx Handling
-        capex = np.array(self.data.capex[-rec_count:])
+        # Extract last 'rec_count' years (Order: Oldest -> Newest) from the
+        # stacked driver matrix; rows unpack as views, no per-series copies
+        m = self.data._matrix[:, -rec_count:]
+        rev, ebit, da, nwc, capex = m
 
         # Print Historical Inputs
-        def fmt_list(arr):
-            return "[" + ", ".join([f"{x:,.0f}" for x in arr]) + "]"
+        if self.verbose:
+            self._log(f"Years Used:           {self.data.years[-rec_count:]}")
+            self._log(f"Historical Revenue:   {_fmt_list(rev)}")
+            self._log(f"Historical EBIT:      {_fmt_list(ebit)}")
+            self._log(f"Historical D&A:       {_fmt_list(da)}")
+            self._log(f"Historical CapEx:     {_fmt_list(capex)}")
+            self._log(f"Historical NWC:       {_fmt_list(nwc)}")
 
-        self._log(f"Years Used:           {self.data.years[-rec_count:]}")
-        self._log(f"Historical Revenue:   {fmt_list(rev)}")
-        self._log(f"Historical EBIT:      {fmt_list(ebit)}")
-        self._log(f"Historical D&A:       {fmt_list(da)}")
-        self._log(f"Historical CapEx:     {fmt_list(capex)}")
-        self._log(f"Historical NWC:       {fmt_list(nwc)}")
+        # Array division never raises: a zero-revenue year would turn into inf/nan
+        # margins, so check for it before dividing
+        if not rev.all():
+            self._log("Error: Zero Revenue found, cannot calculate margins.")
+            return 0,0,0,0,0
 
-        try:
-            # 1. OPERATING MARGINS (ROWS 13-29)
-            # EBIT Margin = EBIT / Revenue
-            ebit_margins = ebit / rev
-            avg_ebit_m = np.mean(ebit_margins)
-            
-            # D&A Margin = D&A / Revenue
-            da_margins = da / rev
-            avg_da_m = np.mean(da_margins)
-            
-            # NWC Margin = Net Working Capital / Revenue
-            nwc_margins = nwc / rev
-            avg_nwc_m = np.mean(nwc_margins)
-            
-            # CapEx Margin = CapEx / Revenue (Absolute value)
-            capex_margins = np.abs(capex) / rev
-            avg_capex_m = np.mean(capex_margins)
-            
+        # 1. OPERATING MARGINS (ROWS 13-29)
+        # EBIT, D&A and NWC Margins = line item / Revenue, in one division;
+        # CapEx Margin uses the absolute CapEx
+        margins = m[1:] / rev
+        margins[3] = np.abs(capex) / rev
+        ebit_margins, da_margins, nwc_margins, capex_margins = margins
+        avg_ebit_m, avg_da_m, avg_nwc_m, avg_capex_m = margins.mean(axis=1)
+        
+        if self.verbose:
             self._log(f"\n--- Calculated Margins (Last 3 Years) ---")
             self._log(f"EBIT Margins:   {ebit_margins}")
             self._log(f"Avg EBIT Margin: {avg_ebit_m:.4%}")
@@ -161,10 +312,6 @@ class DCFModel:
             
             self._log(f"CapEx Margins:  {capex_margins}")
             self._log(f"Avg CapEx Margin:{avg_capex_m:.4%}")
-            
-        except ZeroDivisionError:
-            print("Error: Zero Revenue found, cannot calculate margins.")
-            return 0,0,0,0,0
 
         # Return averages + the most recent actual NWC balance (Year 0 baseline for Year 1 change)
         return avg_ebit_m, avg_da_m, avg_nwc_m, avg_capex_m, nwc[-1]
@@ -240,108 +387,81 @@ class DCFModel:
         self._print_header("PHASE 2 & 3: PROJECTIONS & UFCF")
         self._log(f"Base Revenue: ${self.data.revenue[-1]:,.0f}")
         
-        projections = []
-        curr_rev = self.data.revenue[-1] # Base Revenue (Year 0)
-        
-        # NWC Anchor
-        prev_nwc = last_nwc
-        
         # Tax Rate used for projections
         tax_rate = self.data.effective_tax_rate[-1] if self.data.effective_tax_rate else 0.21
         
+        # 1. Project Revenue: Base Revenue (Year 0) compounded year by year
+        #    (cumprod seeded with the base keeps the sequential multiply order)
+        growth = 1 + np.asarray(self.assumptions.revenue_growth_rates, dtype=np.float64)
+        rev = np.cumprod(np.concatenate(([self.data.revenue[-1]], growth)))[1:]
+        
+        # 2. Derive Operating Line Items
+        ebit = rev * ebit_m
+        taxes = ebit * tax_rate # Tax Expense
+        nopat = ebit - taxes
+        da = rev * da_m
+        capex = rev * capex_m
+        
+        # 3. Calculate Change in NWC (Year 1 anchored on the last actual NWC)
+        nwc_level = rev * nwc_m
+        change_nwc = np.diff(np.concatenate(([last_nwc], nwc_level)))
+        
+        # 4. UFCF Formula
+        # UFCF = NOPAT + D&A - CapEx - Change NWC
+        ufcf = nopat + da - capex - change_nwc
+        
+        arr = np.column_stack((rev, ebit, taxes, nopat, da, capex, nwc_level, change_nwc, ufcf))
+        
         self._log(f"{'Year':<5} | {'Revenue':<15} | {'EBIT':<15} | {'Taxes':<12} | {'NOPAT':<15} | {'D&A':<12} | {'CapEx':<12} | {'Chg NWC':<12} | {'UFCF':<15}")
         self._log("-" * 140)
 
-        for i, g in enumerate(self.assumptions.revenue_growth_rates):
-            # 1. Project Revenue
-            curr_rev *= (1 + g)
-            
-            # 2. Derive Operating Line Items
-            ebit = curr_rev * ebit_m
-            taxes = ebit * tax_rate # Tax Expense
-            nopat = ebit - taxes
-            da = curr_rev * da_m
-            capex = curr_rev * capex_m
-            
-            # 3. Calculate Change in NWC
-            nwc_level = curr_rev * nwc_m
-            change_nwc = nwc_level - prev_nwc
-            
-            # 4. UFCF Formula
-            # UFCF = NOPAT + D&A - CapEx - Change NWC
-            ufcf = nopat + da - capex - change_nwc
-            
-            if i == 0:
-                 # Special logic check for Year 1 NWC change
-                 pass 
-
-            row = {
-                "Year": i + 1,
-                "Revenue": curr_rev,
-                "EBIT": ebit,
-                "Taxes": taxes,
-                "D&A": da,
-                "CapEx": capex,
-                "NWC": nwc_level,
-                "Change NWC": change_nwc,
-                "UFCF": ufcf
-            }
-            projections.append(row)
+        if self.verbose:
+            for i, row in enumerate(arr.tolist(), 1):
+                self._logb(_FORECAST_ROW_FMT(i, *row))
             
-            self._log(f"{i+1:<5} | {curr_rev:,.0f} | {ebit:,.0f} | {taxes:,.0f} | {nopat:,.0f} | {da:,.0f} | {capex:,.0f} | {change_nwc:,.0f} | {ufcf:,.0f}")
-            
-            prev_nwc = nwc_level 
-            
-        self.projections = projections
-        return projections
+        self._flush_log()
+        self.projections_arr = arr
+        self._ufcf_arr = np.ascontiguousarray(arr[:, _PROJ_IDX["UFCF"]])
+        # Dict-per-year view for the template / external callers
+        self.projections = [
+            {"Year": i + 1, **{c: row[_PROJ_IDX[c]] for c in _PROJECTION_VIEW_COLS}}
+            for i, row in enumerate(arr.tolist())
+        ]
+        return self.projections
+
+    def _forecast_silent(self):
+        """forecast_cash_flows() with logging off, for the pure pricing paths"""
+        verbose, self.verbose = self.verbose, False
+        try:
+            return self.forecast_cash_flows()
+        finally:
+            self.verbose = verbose
 
     def compute_intrinsic_value(self, wacc: float, terminal_growth_rate: float) -> float:
         """
         Pure calculation helper. Returns share price.
         Used for Sensitivity Analysis without printing side effects.
         """
+        # Plain floats: NumPy scalars would box every op in the scalar math
+        wacc = float(wacc)
+        terminal_growth_rate = float(terminal_growth_rate)
+
+        # Invalid scenario (no Gordon Growth TV): skip the forecast entirely
+        if wacc <= terminal_growth_rate:
+            return 0.0
+
         # 1. Re-calculate Projections (if needed, or assume base case projections stick)
         # Note: WACC/Growth don't change operating projections (Revenue/EBIT), 
         # only the discounting and TV. So we reuse self.projections if populated.
         if not self.projections:
-            self.forecast_cash_flows()
+            self._forecast_silent()
             
-        ufcfs = [p['UFCF'] for p in self.projections]
-        if not ufcfs:
-            return 0.0
+        ufcfs, net_debt, shares = self._pricing_inputs()
+        return float(_dcf_price(ufcfs, wacc, terminal_growth_rate, net_debt, shares))
 
-        # 2. PV of Stage 1
-        pv_ufcf_sum = 0.0
-        for i, flow in enumerate(ufcfs):
-            pv_ufcf_sum += flow / ((1 + wacc) ** (i + 1))
-            
-        # 3. PV of Terminal Value
-        if wacc <= terminal_growth_rate:
-            return 0.0 # Invalid scenario
-            
-        final_ufcf = ufcfs[-1]
-        tv = (final_ufcf * (1 + terminal_growth_rate)) / (wacc - terminal_growth_rate)
-        pv_tv = tv / ((1 + wacc) ** 5)
-        
-        # 4. Enterprise Value
-        current_ev = pv_ufcf_sum + pv_tv
-        
-        # 5. Equity Value
-        # EV_12m logic: (Current EV * (1+WACC)) - Year 1 Cash Flow
-        ev_12m = (current_ev * (1 + wacc)) - ufcfs[0]
-        
-        total_debt = self.data.total_debt[-1] if self.data.total_debt else 0
-        cats = self.data.cash_and_equivalents[-1] if self.data.cash_and_equivalents else 0
-        net_debt = total_debt - cats
-        
-        equity_val = ev_12m - net_debt
-        
-        # 6. Per Share
-        shares = self.data.shares_outstanding
-        if shares <= 0:
-            return 0.0
-            
-        return equity_val / shares
+    def _pricing_inputs(self):
+        """UFCF vector, net debt and share count consumed by the DCF kernels"""
+        return self._ufcf_arr, self._net_debt, self._shares
 
     def calculate_intrinsic_value(self) -> float:
         """
@@ -349,37 +469,40 @@ class DCFModel:
         (Main execution method with logging)
         """
         self._log(f"\n{'#'*60}")
-        print(" STARTING VALUATION")
+        if self.verbose and self.echo:
+            print(" STARTING VALUATION")
         self._log(f"{'#'*60}")
 
         # Step 1: WACC
-        wacc = self.calculate_wacc()
+        wacc = float(self.calculate_wacc())
         
         # Step 2: Forecast
         self.forecast_cash_flows()
-        ufcfs = [p['UFCF'] for p in self.projections]
+        ufcfs = self._ufcf_arr
         
-        if not ufcfs:
+        if not ufcfs.size:
             return 0.0
             
         self._print_header("PHASE 4: DCF VALUATION")
 
         # Step 3: Discount Stage 1
-        pv_ufcf_sum = 0
+        # Discount factors (1 + wacc) ** (i + 1) as one cumulative product
+        factors = np.cumprod(np.full(ufcfs.shape[0], 1 + wacc))
+        pvs = ufcfs / factors
+        pv_ufcf_sum = float(pvs.sum())
         self._log(f"{'Year':<5} | {'UFCF':<15} | {'Discount Fac':<12} | {'PV':<15}")
         self._log("-" * 60)
         
-        for i, flow in enumerate(ufcfs):
-            factor = (1 + wacc) ** (i + 1)
-            pv = flow / factor
-            pv_ufcf_sum += pv
-            self._log(f"{i+1:<5} | {flow:,.0f} | {factor:.4f}       | {pv:,.0f}")
+        if self.verbose:
+            for i, row in enumerate(zip(ufcfs.tolist(), factors.tolist(), pvs.tolist()), 1):
+                self._logb(_DISCOUNT_ROW_FMT(i, *row))
             
+        self._flush_log()
         self._log(f"{'-'*60}")
         self._log(f"Stage 1 PV Sum: ${pv_ufcf_sum:,.0f}")
         
         # Step 4: Terminal Value (Stage 2)
-        final_ufcf = ufcfs[-1]
+        first_ufcf, final_ufcf = float(ufcfs[0]), float(ufcfs[-1])
         g = self.assumptions.terminal_growth_rate
         
         tv = 0.0
@@ -393,8 +516,8 @@ class DCFModel:
         else:
             self._log(f"Error: WACC ({wacc}) <= Terminal Growth ({g})")
 
-        pv_tv = tv / ((1 + wacc) ** 5)
-        self._log(f"Discounting TV 5 years back...")
+        pv_tv = tv / float(factors[-1])  # (1 + wacc) ** len(ufcfs): end of the forecast horizon
+        self._log(f"Discounting TV {len(ufcfs)} years back...")
         self._log(f"   PV of TV:     ${pv_tv:,.0f}")
         
         # Step 5: Current Enterprise Value
@@ -406,10 +529,10 @@ class DCFModel:
         
         self._log(f"1. Current Enterprise Value:     ${current_ev:,.0f}")
         self._log(f"2. Plus: Growth (1 Year @ WACC): +${current_ev * wacc:,.0f}")
-        self._log(f"3. Less: Year 1 Cash Flow Paid:  -${ufcfs[0]:,.0f}")
+        self._log(f"3. Less: Year 1 Cash Flow Paid:  -${first_ufcf:,.0f}")
         
         # EV_12m = (Current EV * (1+WACC)) - Year 1 Cash Flow
-        ev_12m = (current_ev * (1 + wacc)) - ufcfs[0]
+        ev_12m = (current_ev * (1 + wacc)) - first_ufcf
         self._log(f"-> 12-MONTH ENTERPRISE VALUE:    ${ev_12m:,.0f}")
         
         # Step 7: Equity Value
@@ -444,22 +567,22 @@ class DCFModel:
         Rows: WACC (+- 0.5% steps)
         Cols: Terminal Growth (+- 1.0% steps)
         """
-        base_wacc = self.wacc
-        base_g = self.assumptions.terminal_growth_rate
+        base_wacc = float(self.wacc)
+        base_g = float(self.assumptions.terminal_growth_rate)
         
         # Ranges (0.1% steps for finer granularity)
-        wacc_steps = [base_wacc - 0.002, base_wacc - 0.001, base_wacc, base_wacc + 0.001, base_wacc + 0.002]
-        g_steps =    [base_g - 0.002, base_g - 0.001, base_g, base_g + 0.001, base_g + 0.002]
-        
-        matrix = []
-        for w in wacc_steps:
-            row = []
-            for g in g_steps:
-                price = self.compute_intrinsic_value(w, g)
-                row.append(price)
-            matrix.append((w, row))
-            
-        return g_steps, matrix
+        waccs = base_wacc + _SENSITIVITY_OFFSETS
+        growths = base_g + _SENSITIVITY_OFFSETS
+        
+        if not self.projections:
+            self._forecast_silent()
+        
+        # Whole 5x5 grid in one kernel call
+        ufcfs, net_debt, shares = self._pricing_inputs()
+        prices = _dcf_price_grid(ufcfs, waccs, growths, net_debt, shares)
+        
+        matrix = list(zip(waccs.tolist(), prices.tolist()))
+        return growths.tolist(), matrix
 
 # --- Example Usage (Commented out until implemented) ---
 # data = FinancialData(revenue=[100,110,120], ...)
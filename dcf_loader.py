@@ -3,15 +3,27 @@ import os
 import time
 import json
 import logging
+import re
+import sqlite3
+import threading
 import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from contextlib import closing
+from dataclasses import fields
+from functools import lru_cache
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
-import yfinance as yf
-from datetime import datetime
 from dotenv import load_dotenv
-from typing import List, Optional, Dict, Any
-from edgar import Company, set_identity
+from typing import List, NamedTuple, Optional, Dict, Any, Tuple
+
+# Optional: faster cache (de)serialization (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import the data class from dcf_code
 from dcf_code import FinancialData
@@ -28,7 +40,8 @@ def create_session_with_retry():
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["GET"]
     )
-    adapter = HTTPAdapter(max_retries=retries)
+    # Sized for the fetch pool's concurrent statement/market calls
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
@@ -36,6 +49,47 @@ def create_session_with_retry():
 # Global session for reuse
 _http_session = create_session_with_retry()
 
+# --- Concurrent Fetching ---
+# Market data (YFinance) and statements (Edgar) are independent, so they are
+# fetched side by side. Edgar calls are capped to stay under the SEC's 10 req/s.
+_fetch_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="dcf_fetch")
+# Edgar gets its own workers so EDGAR_TIMEOUT never includes time queued behind Yahoo calls
+_edgar_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="dcf_edgar")
+_edgar_throttle = threading.Semaphore(8)
+
+EDGAR_TIMEOUT = 8  # seconds assemble() waits on Edgar before using YFinance
+EDGAR_HEDGE_DELAY = 2  # seconds Edgar runs alone before the YFinance statements start alongside it
+
+# Edgar circuit breaker: after EDGAR_BREAKER_THRESHOLD consecutive failures, go
+# straight to yfinance for EDGAR_BREAKER_COOLDOWN seconds instead of paying for
+# a doomed SEC round trip on every valuation.
+EDGAR_BREAKER_THRESHOLD = 3
+EDGAR_BREAKER_COOLDOWN = 300  # seconds
+_edgar_breaker = {"failures": 0, "open_until": 0.0}
+_edgar_breaker_lock = threading.Lock()
+
+def _edgar_allowed() -> bool:
+    return time.time() >= _edgar_breaker["open_until"]
+
+def _is_transport_error(exc: Exception) -> bool:
+    """
+    Network/HTTP failures (requests, edgartools' httpx, sockets) say Edgar itself is
+    unhealthy; anything else is about the ticker (unknown symbol, no 10-K, no data).
+    """
+    if isinstance(exc, (requests.RequestException, OSError)):
+        return True
+    return type(exc).__module__.split(".")[0] == "httpx"
+
+def _record_edgar_result(ok: bool):
+    with _edgar_breaker_lock:
+        if ok:
+            _edgar_breaker["failures"] = 0
+            return
+        _edgar_breaker["failures"] += 1
+        if _edgar_breaker["failures"] >= EDGAR_BREAKER_THRESHOLD:
+            _edgar_breaker.update(failures=0, open_until=time.time() + EDGAR_BREAKER_COOLDOWN)
+            logger.warning(f"Edgar failed {EDGAR_BREAKER_THRESHOLD}x in a row; skipping it for {EDGAR_BREAKER_COOLDOWN}s")
+
 # --- Configuration & Setup ---
 load_dotenv('.env')
 
@@ -49,93 +103,202 @@ if not EDGAR_IDENTITY:
     # Fallback to prevent crash (User Agent required by SEC)
     logger.warning("EDGAR_IDENTITY not found. Using fallback 'DCF_Valuation_App <no_email@example.com>'")
     EDGAR_IDENTITY = "DCF_Valuation_App <no_email@example.com>"
-set_identity(EDGAR_IDENTITY)
 
 # 3. Configure Local Storage for Edgartools (Speed Boost)
 if os.getenv("EDGAR_USE_LOCAL_DATA", "False").lower() == "true":
     logger.info("Edgartools Local Data Caching: ENABLED (Expect faster repeat runs)")
 
-# --- Caching Layer (Market Data) ---
-CACHE_FILE = "/tmp/market_data_cache.json" # Use /tmp for Vercel/Lambda read-write consistency
+# 4. Edgar as the primary statement source (opt-in). Edgar-built FinancialData
+# differs from yfinance's (statements, total_debt, valuations), so live runs stay
+# on yfinance until EDGAR_ENABLED=true is set deliberately.
+EDGAR_ENABLED = os.getenv("EDGAR_ENABLED", "False").lower() == "true"
+
+# --- Lazy Provider Imports ---
+# yfinance and edgartools are slow to import and unneeded on a warm cache hit,
+# so they load on first use (cold starts on Vercel/Lambda skip them entirely).
+_yf = None
+_edgar = None
+
+def _get_yf():
+    global _yf
+    if _yf is None:
+        import yfinance
+        _yf = yfinance
+    return _yf
+
+def _get_edgar():
+    global _edgar
+    if _edgar is None:
+        import edgar
+        edgar.set_identity(EDGAR_IDENTITY)
+        _edgar = edgar
+    return _edgar
+
+# --- Caching Layer (Market Data + Assembled Financials) ---
+# SQLite keyed by ticker: lookups/writes touch one row instead of re-reading and
+# rewriting a whole JSON file, and concurrent workers get atomic upserts.
+CACHE_DB = "/tmp/market_data_cache.db" # Use /tmp for Vercel/Lambda read-write consistency
 CACHE_EXPIRY_HOURS = 24
-
-
-def load_cache() -> Dict[str, Any]:
-    if os.path.exists(CACHE_FILE):
+_CACHE_TTL_SECONDS = CACHE_EXPIRY_HOURS * 3600
+_CACHE_TABLES = ("market_data", "financials")
+
+
+# In-process copy of rows already read or written, so repeat lookups within
+# one process skip the DB round-trip and JSON decode.
+_cache_mem = OrderedDict()   # (table, ticker) -> (ts, data), LRU order
+_cache_mem_lock = threading.Lock()
+CACHE_MEM_MAX = 512          # rows held in memory across both tables
+_cache_schema_ready = False
+
+
+if orjson is not None:
+    # fast_info can hand back NumPy scalars, which orjson only takes with this flag
+    def _cache_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    _cache_loads = orjson.loads
+else:
+    _cache_dumps, _cache_loads = json.dumps, json.loads
+
+
+def _cache_connect() -> sqlite3.Connection:
+    global _cache_schema_ready
+    conn = sqlite3.connect(CACHE_DB, timeout=5)
+    if not _cache_schema_ready:
+        conn.execute("PRAGMA journal_mode=WAL")
+        for table in _CACHE_TABLES:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(ticker TEXT PRIMARY KEY, ts REAL NOT NULL, data TEXT NOT NULL)"
+            )
+        _cache_schema_ready = True
+    return conn
+
+def _cache_mem_put(key: Tuple[str, str], entry: Tuple[float, Dict[str, Any]]):
+    with _cache_mem_lock:
+        _cache_mem[key] = entry
+        _cache_mem.move_to_end(key)
+        while len(_cache_mem) > CACHE_MEM_MAX:
+            _cache_mem.popitem(last=False)
+
+def _cache_get(table: str, ticker: str, label: str) -> Optional[Dict[str, Any]]:
+    key = (table, ticker)
+    with _cache_mem_lock:
+        entry = _cache_mem.get(key)
+        if entry is not None:
+            _cache_mem.move_to_end(key)
+    if entry is None:
         try:
-            with open(CACHE_FILE, 'r') as f:
-                return json.load(f)
-        except Exception as e:
+            with closing(_cache_connect()) as conn:
+                row = conn.execute(
+                    f"SELECT ts, data FROM {table} WHERE ticker = ?", (ticker,)
+                ).fetchone()
+        except sqlite3.Error as e:
             logger.warning(f"Failed to load cache: {e}")
-    return {}
+            return None
+        if row is None:
+            return None
+        entry = (row[0], _cache_loads(row[1]))
+        _cache_mem_put(key, entry)
+    ts, data = entry
+    age = time.time() - ts
+    if age < _CACHE_TTL_SECONDS:
+        logger.info(f"Using Cached {label} for {ticker} (Age: {age / 3600:.1f}h)")
+        return dict(data)
+    with _cache_mem_lock:
+        _cache_mem.pop(key, None)
+    return None
 
-def save_cache(cache: Dict[str, Any]):
+def _cache_set(table: str, ticker: str, data: Dict[str, Any]):
+    ts = time.time()
+    _cache_mem_put((table, ticker), (ts, dict(data)))
     try:
-        with open(CACHE_FILE, 'w') as f:
-            json.dump(cache, f, indent=2)
-    except Exception as e:
+        with closing(_cache_connect()) as conn, conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {table} (ticker, ts, data) VALUES (?, ?, ?)",
+                (ticker, ts, _cache_dumps(data)),
+            )
+    except (sqlite3.Error, TypeError) as e:
         logger.warning(f"Failed to save cache: {e}")
 
 def get_cached_market_data(ticker: str) -> Optional[Dict[str, Any]]:
-    cache = load_cache()
-    if ticker in cache:
-        entry = cache[ticker]
-        cached_time = datetime.fromisoformat(entry['timestamp'])
-        age_hours = (datetime.now() - cached_time).total_seconds() / 3600
-        if age_hours < CACHE_EXPIRY_HOURS:
-            logger.info(f"Using Cached Market Data for {ticker} (Age: {age_hours:.1f}h)")
-            return entry['data']
-    return None
+    return _cache_get("market_data", ticker, "Market Data")
 
 def set_cached_market_data(ticker: str, data: Dict[str, Any]):
-    cache = load_cache()
-    cache[ticker] = {
-        "timestamp": datetime.now().isoformat(),
-        "data": data
-    }
-    save_cache(cache)
+    _cache_set("market_data", ticker, data)
+
+def get_cached_financials(ticker: str) -> Optional[FinancialData]:
+    """Fully assembled FinancialData from a previous run, so a warm ticker skips all fetching/parsing"""
+    data = _cache_get("financials", ticker, "Financials")
+    if data is None:
+        return None
+    try:
+        return FinancialData(**data)
+    except TypeError as e:  # Row written by an older FinancialData layout
+        logger.warning(f"Discarding stale financials cache for {ticker}: {e}")
+        return None
+
+def set_cached_financials(ticker: str, fd: FinancialData):
+    _cache_set("financials", ticker, {f.name: getattr(fd, f.name) for f in fields(FinancialData)})
 
 
 # --- Helper Functions ---
 
-def _safe_float(val, default=0.0):
-    try:
-        if isinstance(val, (pd.Series, list)):
-            val = val[0] if len(val) > 0 else default
-        if val is None or pd.isna(val):
-            return default
-        return float(val)
-    except:
-        return default
-
-def _get_series_from_row(df: pd.DataFrame, tags: List[str], count: int = 3) -> List[float]:
+class EdgarKeys(NamedTuple):
+    labels: Optional[pd.Series]       # lowercased 'label' column (None if absent)
+    label_pos: Optional[Dict[str, int]]  # lowercased label -> first row position
+    concepts: pd.Index                # lowercased concept index
+    year_cols: List[str]              # 'FY...' columns, newest first
+
+def _edgar_year_cols(df: pd.DataFrame) -> List[str]:
+    """Year Columns (keys starting with 'FY'), sorted descending (newest first)"""
+    year_cols = [c for c in df.columns if str(c).startswith('FY')]
+    year_cols.sort(reverse=True, key=lambda x: str(x))
+    return year_cols
+
+@lru_cache(maxsize=256)
+def _any_of(phrases: Tuple[str, ...]) -> str:
+    """Regex matching any of the literal phrases (compiled by pandas once, then cached by re)"""
+    return "|".join(map(re.escape, phrases))
+
+class TagSpec(NamedTuple):
+    """A field -> candidate-tags map compiled once: every distinct tag in one Index,
+    plus each field's candidate positions into it (in priority order)."""
+    tags: pd.Index
+    fields: Tuple[Tuple[str, Tuple[int, ...]], ...]
+
+def _compile_tags(fields: Dict[str, List[str]]) -> TagSpec:
+    flat = list(dict.fromkeys(tag for tags in fields.values() for tag in tags))
+    pos = {tag: i for i, tag in enumerate(flat)}
+    return TagSpec(pd.Index(flat), tuple((name, tuple(pos[t] for t in tags)) for name, tags in fields.items()))
+
+def _get_series_block(df: pd.DataFrame, spec: TagSpec, count: int = 3) -> Dict[str, List[float]]:
     """
-    Tries to find a row in the DataFrame matching one of the 'tags'.
-    Returns the most recent 'count' values as a list of floats.
+    Resolves several fields against one statement DataFrame at once.
+    Each field in 'spec' gets the most recent 'count' values of its first
+    candidate tag whose row has a non-zero value.
     """
-    matched_row = None
-    
-    for tag in tags:
-        if tag in df.index:
-            candidate = df.loc[tag]
-            if candidate.fillna(0).abs().sum() > 0:
-                matched_row = candidate
-                break
-            
-    if matched_row is None:
-        return [0.0] * count
-
-    # Extract values
-    values = matched_row.head(count).values.tolist()
-    
-    clean_values = []
-    for v in values:
-        clean_values.append(_safe_float(v))
-        
-    while len(clean_values) < count:
-        clean_values.append(0.0)
-        
-    return clean_values[::-1]
+    if not df.index.is_unique:
+        df = df[~df.index.duplicated()]
+    # One get_indexer call maps every candidate tag to its row position (-1 when absent)
+    rows = df.index.get_indexer(spec.tags).tolist()
+    arr = df.to_numpy(dtype=float, na_value=0.0)
+    nonzero = np.abs(arr).sum(axis=1) > 0
+
+    out = {}
+    for name, positions in spec.fields:
+        row = next((rows[p] for p in positions if rows[p] >= 0 and nonzero[rows[p]]), None)
+        if row is None:
+            out[name] = [0.0] * count
+            continue
+        values = arr[row, :count].tolist()
+        values.extend([0.0] * (count - len(values)))
+        out[name] = values[::-1]
+    return out
+
+def _effective_tax_rates(tax: List[float], pretax: List[float], default: float = 0.21) -> List[float]:
+    """tax / pretax per year, or 'default' (statutory rate) where pretax income is zero"""
+    tax, pretax = np.asarray(tax, dtype=float), np.asarray(pretax, dtype=float)
+    return np.divide(tax, pretax, out=np.full_like(tax, default), where=pretax != 0).tolist()
 
 def _get_dates_from_cols(df: pd.DataFrame, count: int = 3) -> List[str]:
     cols = df.columns[:count]
@@ -147,11 +310,92 @@ def _get_dates_from_cols(df: pd.DataFrame, count: int = 3) -> List[str]:
             dates.append("Unknown")
     return dates[::-1]
 
+# --- Field Maps (FinancialData field -> candidate yfinance row labels, in priority order) ---
+# 'tax' and 'pretax' only feed the effective tax rate and are not FinancialData fields.
+YF_INCOME_TAGS = {
+    "revenue": ['Total Revenue', 'Operating Revenue', 'Revenue'],
+    "ebit": ['EBIT', 'Operating Income', 'Operating Profit'],
+    "ebitda": ['EBITDA', 'Normalized EBITDA'],
+    "net_income": ['Net Income', 'Net Income Common Stockholders'],
+    "interest_expense": ['Interest Expense', 'Interest Expense Non Operating'],
+    "tax": ['Tax Provision', 'Income Tax Expense'],
+    "pretax": ['Pretax Income', 'Income Before Tax'],
+}
+YF_BALANCE_TAGS = {
+    "current_assets": ['Total Current Assets', 'Current Assets'],
+    "current_liabilities": ['Total Current Liabilities', 'Current Liabilities'],
+    "cash_and_equivalents": ['Cash And Cash Equivalents', 'Cash'],
+    "short_term_debt": ['Current Debt', 'Short Term Debt', 'Commercial Paper'],
+    "long_term_debt": ['Long Term Debt'],
+    "total_debt": ['Total Debt'],
+    "total_assets": ['Total Assets'],
+    "total_liabilities": ['Total Liabilities'],
+    "property_plant_equipment_net": ['Net PPE', 'Plant Property Equipment Net', 'Property Plant And Equipment Net'],
+    "preferred_equity": ['Preferred Stock', 'Preferred Stock Equity'],
+}
+YF_CASHFLOW_TAGS = {
+    "d_and_a": ['Depreciation And Amortization', 'Reconciled Depreciation'],
+    "capex": ['Capital Expenditure', 'Capital Expenditures'],
+}
+
+_YF_INCOME_SPEC = _compile_tags(YF_INCOME_TAGS)
+_YF_BALANCE_SPEC = _compile_tags(YF_BALANCE_TAGS)
+_YF_CASHFLOW_SPEC = _compile_tags(YF_CASHFLOW_TAGS)
+
+# FinancialData field -> key in the get_market_data() dict
+MARKET_FIELDS = {
+    "shares_outstanding": "shares",
+    "beta": "beta",
+    "stock_price": "price",
+    "market_cap": "market_cap",
+    "risk_free_rate": "treasury_yield",
+    "market_return_rate": "market_return",
+}
+
+def _market_fields(mkt: Dict[str, Any]) -> Dict[str, float]:
+    return {field: float(mkt[key]) for field, key in MARKET_FIELDS.items()}
+
+# Shared across fetchers so ^TNX is not rebuilt (and its state re-initialised) per valuation
+_tnx_ticker = None
+# The 10Y yield is the same for every ticker, so one lookup serves all valuations for an hour
+TNX_TTL_SECONDS = 3600
+_tnx_cache = {"ts": 0.0, "val": None, "refreshing": False}
+_tnx_lock = threading.Lock()  # guards _tnx_cache only; never held across the HTTP call
+
+def _fetch_treasury_yield() -> Optional[float]:
+    """Latest 10Y treasury yield (^TNX) as a decimal, or None if unavailable"""
+    global _tnx_ticker
+    with _tnx_lock:
+        stale = _tnx_cache["val"]
+        if stale is not None and time.time() - _tnx_cache["ts"] < TNX_TTL_SECONDS:
+            return stale
+        # One thread refreshes; the rest take the stale value (or None -> default)
+        # instead of queueing behind a slow Yahoo call
+        if _tnx_cache["refreshing"]:
+            return stale
+        _tnx_cache["refreshing"] = True
+
+    val = None
+    try:
+        if _tnx_ticker is None:
+            _tnx_ticker = _get_yf().Ticker("^TNX", session=_http_session)
+        hist = _tnx_ticker.history(period="1d", timeout=5)
+        if not hist.empty:
+            val = float(hist['Close'].iloc[-1] / 100)
+    except Exception:
+        pass
+    with _tnx_lock:
+        _tnx_cache["refreshing"] = False
+        if val is not None:
+            _tnx_cache.update(ts=time.time(), val=val)
+    return val
+
 # --- KEY CLASS 1: Hybrid Fetcher (Preferred) ---
 class HybridDataFetcher:
     def __init__(self, ticker: str):
         self.ticker = ticker.upper()
-        self.yf_ticker = yf.Ticker(self.ticker)
+        # Shared session: Yahoo calls reuse pooled keep-alive connections
+        self.yf_ticker = _get_yf().Ticker(self.ticker, session=_http_session)
         
     def get_market_data(self) -> Dict[str, Any]:
         cached = get_cached_market_data(self.ticker)
@@ -159,6 +403,8 @@ class HybridDataFetcher:
             return cached
             
         logger.info(f"Fetching Live Market Data for {self.ticker}...")
+        # Treasury yield is independent of the ticker lookup: fetch it alongside
+        tnx_future = _fetch_pool.submit(_fetch_treasury_yield)
         try:
             info = self.yf_ticker.info
             data = {
@@ -186,37 +432,47 @@ class HybridDataFetcher:
                 logger.error(f"YFinance .fast_info also failed: {e2}")
                 raise
 
-        # Fetch treasury yield with timeout (independent checks)
-        try:
-            tnx = yf.Ticker("^TNX")
-            hist = tnx.history(period="1d", timeout=5)
-            if not hist.empty:
-                data["treasury_yield"] = float(hist['Close'].iloc[-1] / 100)
-        except Exception:
-            pass
+        treasury_yield = tnx_future.result()
+        if treasury_yield is not None:
+            data["treasury_yield"] = treasury_yield
             
         set_cached_market_data(self.ticker, data)
         return data
 
-    def get_financials_via_yfinance(self):
+    def _submit_yfinance_statements(self):
         logger.info("Fetching Financial Statements (Standardized via YFinance)...")
-        inc = self.yf_ticker.financials
-        bal = self.yf_ticker.balance_sheet
-        cf = self.yf_ticker.cashflow
+        # Each statement is its own Yahoo request; issue all three at once
+        return [
+            _fetch_pool.submit(getattr, self.yf_ticker, name)
+            for name in ("financials", "balance_sheet", "cashflow")
+        ]
+
+    def get_financials_via_yfinance(self):
+        inc, bal, cf = (f.result() for f in self._submit_yfinance_statements())
         return inc, bal, cf
 
 # --- KEY CLASS 2: Edgar Fetcher (Financials) ---
     def get_financials_via_edgar(self):
         logger.info("Fetching Financial Statements from SEC Edgar...")
-        try:
-            company = Company(self.ticker)
-        except Exception as e:
-            raise ValueError(f"Edgar Init Failed: {e}")
-            
-        # These calls retrieve the standardized MultiPeriodStatement
-        inc = company.income_statement()
-        bal = company.balance_sheet()
-        cf = company.cash_flow()
+        with _edgar_throttle:
+            try:
+                company = _get_edgar().Company(self.ticker)
+            except Exception as e:
+                if _is_transport_error(e):
+                    raise
+                raise ValueError(f"Edgar Init Failed: {e}")
+            if company is None:
+                raise ValueError(f"{self.ticker} not found on Edgar")
+
+            # Preflight: the filing index comes with the Company lookup, so tickers
+            # without annual reports (foreign listings, ETFs) fail before any statement fetch
+            if len(company.get_filings(form="10-K")) == 0:
+                raise ValueError(f"No 10-K filings on Edgar for {self.ticker}")
+
+            # These calls retrieve the standardized MultiPeriodStatement
+            inc = company.income_statement()
+            bal = company.balance_sheet()
+            cf = company.cash_flow()
         
         # Convert to DataFrames
         return (
@@ -225,18 +481,27 @@ class HybridDataFetcher:
             cf.to_dataframe() if cf else pd.DataFrame()
         )
 
-    def _get_edgar_series(self, df: pd.DataFrame, phrases: List[str], count: int = 3) -> List[float]:
+    @staticmethod
+    def _edgar_keys(df: pd.DataFrame) -> EdgarKeys:
+        """Per-statement lookup structures for _get_edgar_series, computed once per statement"""
+        labels = label_pos = None
+        if 'label' in df.columns:
+            labels = df['label'].astype(str).str.lower()
+            lowered = labels.tolist()
+            label_pos = dict(zip(reversed(lowered), range(len(lowered) - 1, -1, -1)))
+        return EdgarKeys(labels, label_pos, df.index.astype(str).str.lower(), _edgar_year_cols(df))
+
+    def _get_edgar_series(self, df: pd.DataFrame, phrases: List[str], count: int = 3, keys=None) -> List[float]:
         """
         Robustly finds a row in Edgar DataFrame by checking 'label' column and Index.
         Returns the data for the most recent 'count' years.
+        'keys' is the statement's precomputed _edgar_keys(df), if the caller has it.
         """
         if df.empty:
             return [0.0] * count
             
-        # 1. Identify Year Columns (keys starting with 'FY')
-        year_cols = [c for c in df.columns if str(c).startswith('FY')]
-        # Sort years descending (newest first)
-        year_cols.sort(reverse=True, key=lambda x: str(x))
+        labels, label_pos, concepts, year_cols = keys if keys is not None else self._edgar_keys(df)
+        # 1. Year Columns (newest first)
         target_years = year_cols[:count]
         
         matched_row = None
@@ -245,68 +510,93 @@ class HybridDataFetcher:
         phrases = [p.lower() for p in phrases]
         
         # 2. Search by Label (Priority)
-        if 'label' in df.columns:
+        # One fused pass over the labels rules out every phrase at once on a miss
+        if labels is not None and labels.str.contains(_any_of(tuple(phrases))).any():
             for phrase in phrases:
-                # Exact match first
-                mask = df['label'].astype(str).str.lower() == phrase
-                if mask.any():
-                    matched_row = df[mask].iloc[0]
-                    break
-                    
-                # Contains match (secondary)
-                mask = df['label'].astype(str).str.lower().str.contains(phrase, regex=False)
-                if mask.any():
-                    matched_row = df[mask].iloc[0]
+                # Exact match first (dict lookup)
+                pos = label_pos.get(phrase)
+                if pos is None:
+                    # Contains match (secondary)
+                    mask = labels.str.contains(phrase, regex=False).to_numpy()
+                    if mask.any():
+                        pos = mask.argmax()
+                if pos is not None:
+                    matched_row = df.iloc[pos]
                     break
 
         # 3. Search by Index (Concept Name) if no label match
         if matched_row is None:
-            for phrase in phrases:
-                 # Remove spaces for concept matching (e.g. "Gross Profit" -> "GrossProfit")
-                 concept_phrase = phrase.replace(" ", "")
-                 mask = df.index.astype(str).str.lower().str.contains(concept_phrase, regex=False)
-                 if mask.any():
-                     matched_row = df[mask].iloc[0]
-                     break
+            # Remove spaces for concept matching (e.g. "Gross Profit" -> "GrossProfit")
+            concept_phrases = [p.replace(" ", "") for p in phrases]
+            if concepts.str.contains(_any_of(tuple(concept_phrases))).any():
+                for concept_phrase in concept_phrases:
+                     mask = concepts.str.contains(concept_phrase, regex=False)
+                     if mask.any():
+                         matched_row = df.iloc[mask.argmax()]
+                         break
                      
         if matched_row is None:
             return [0.0] * count
             
-        # 4. Extract Values
-        values = []
-        for y in target_years:
-            val = matched_row.get(y, 0.0)
-            values.append(_safe_float(val))
+        # 4. Extract Values (non-numeric/missing -> 0.0 in one vectorized pass)
+        values = pd.to_numeric(matched_row[target_years], errors='coerce').to_numpy(dtype=float, na_value=0.0).tolist()
             
         # Pad if missing years
-        while len(values) < count:
-            values.append(0.0)
+        values.extend([0.0] * (count - len(values)))
             
         # Return oldest to newest (DCF expectation)
         return values[::-1]
 
-    def _get_edgar_years(self, df: pd.DataFrame, count: int = 3) -> List[str]:
+    def _get_edgar_years(self, df: pd.DataFrame, count: int = 3, keys=None) -> List[str]:
         if df.empty:
             return ["YYYY"] * count
-        year_cols = [c for c in df.columns if str(c).startswith('FY')]
-        year_cols.sort(reverse=True, key=lambda x: str(x))
+        year_cols = keys.year_cols if keys is not None else _edgar_year_cols(df)
         return year_cols[:count][::-1]
 
     def assemble(self) -> FinancialData:
+        # Start Edgar in the background while market data loads; the YFinance
+        # statements are only requested if Edgar fails or stalls
+        edgar_future = None
+        yf_futures = None
+        if EDGAR_ENABLED and _edgar_allowed():
+            edgar_future = _edgar_pool.submit(self.get_financials_via_edgar)
         mkt = self.get_market_data()
         
-        # 1. Try Edgar First (Official Data)
-        try:
-            inc, bal, cf = self.get_financials_via_edgar()
-            if not inc.empty and not bal.empty:
-                 logger.info("Using SEC Edgar Data.")
-                 return self._process_edgar_data(inc, bal, cf, mkt)
-        except Exception as e:
-             logger.warning(f"Edgar Financials Failed: {e}")
-
-        # 2. Fallback to YFinance (Live Data provider)
+        # 1. Try Edgar First (Official Data), but never wait on it past EDGAR_TIMEOUT.
+        #    If it is still running after EDGAR_HEDGE_DELAY, race the YFinance
+        #    statements against the rest of its budget, so a stalled Edgar costs
+        #    at most EDGAR_TIMEOUT overall instead of EDGAR_TIMEOUT + YFinance.
+        if edgar_future is not None:
+            hedge = min(EDGAR_HEDGE_DELAY, EDGAR_TIMEOUT)
+            try:
+                try:
+                    inc, bal, cf = edgar_future.result(timeout=hedge)
+                except FutureTimeout:
+                    yf_futures = self._submit_yfinance_statements()
+                    inc, bal, cf = edgar_future.result(timeout=EDGAR_TIMEOUT - hedge)
+                if not inc.empty and not bal.empty:
+                     logger.info("Using SEC Edgar Data.")
+                     fd = self._process_edgar_data(inc, bal, cf, mkt)
+                     _record_edgar_result(True)
+                     return fd
+            except FutureTimeout:
+                 logger.warning(f"Edgar Financials timed out after {EDGAR_TIMEOUT}s")
+                 # Frees the worker if the fetch is still queued; a call already in
+                 # flight finishes in the background, bounded by its HTTP timeouts
+                 edgar_future.cancel()
+                 _record_edgar_result(False)
+            except Exception as e:
+                 logger.warning(f"Edgar Financials Failed: {e}")
+                 # Only outages count toward the breaker; a ticker Edgar has no
+                 # data for (ETF, foreign listing, typo) just falls back to YFinance
+                 if _is_transport_error(e):
+                     _record_edgar_result(False)
+
+        # 2. Fallback to YFinance (Live Data provider), already in flight if Edgar stalled
         try:
-            inc, bal, cf = self.get_financials_via_yfinance()
+            if yf_futures is None:
+                yf_futures = self._submit_yfinance_statements()
+            inc, bal, cf = (f.result() for f in yf_futures)
             if not inc.empty and not bal.empty:
                  logger.info("Falling back to YFinance Data.")
                  return self._process_yfinance_data(inc, bal, cf, mkt)
@@ -316,86 +606,49 @@ class HybridDataFetcher:
         raise ValueError(f"Could not fetch data for {self.ticker} from Edgar or YFinance.")
 
     def _process_yfinance_data(self, inc, bal, cf, mkt) -> FinancialData:
-        rev_tags = ['Total Revenue', 'Operating Revenue', 'Revenue']
-        ebit_tags = ['EBIT', 'Operating Income', 'Operating Profit']
-        ebitda_tags = ['EBITDA', 'Normalized EBITDA']
-        net_inc_tags = ['Net Income', 'Net Income Common Stockholders']
-        tax_tags = ['Tax Provision', 'Income Tax Expense']
-        int_exp_tags = ['Interest Expense', 'Interest Expense Non Operating']
-        
-        ca_tags = ['Total Current Assets', 'Current Assets']
-        cl_tags = ['Total Current Liabilities', 'Current Liabilities']
-        cash_tags = ['Cash And Cash Equivalents', 'Cash']
-        std_tags = ['Current Debt', 'Short Term Debt', 'Commercial Paper']
-        ltd_tags = ['Long Term Debt']
-        td_tags = ['Total Debt']
-        ta_tags = ['Total Assets']
-        tl_tags = ['Total Liabilities']
-        ppe_tags = ['Net PPE', 'Plant Property Equipment Net', 'Property Plant And Equipment Net']
-        pref_tags = ['Preferred Stock', 'Preferred Stock Equity']
+        inc_vals = _get_series_block(inc, _YF_INCOME_SPEC)
+        eff_rates = _effective_tax_rates(inc_vals.pop("tax"), inc_vals.pop("pretax"))
         
-        da_tags = ['Depreciation And Amortization', 'Reconciled Depreciation']
-        capex_tags = ['Capital Expenditure', 'Capital Expenditures'] 
-        
-        years = _get_dates_from_cols(inc)
-        
-        fd = FinancialData(
-            years=years,
-            revenue=_get_series_from_row(inc, rev_tags),
-            ebit=_get_series_from_row(inc, ebit_tags),
-            ebitda=_get_series_from_row(inc, ebitda_tags),
-            net_income=_get_series_from_row(inc, net_inc_tags),
-            effective_tax_rate=[], 
-            interest_expense=_get_series_from_row(inc, int_exp_tags),
-            
-            current_assets=_get_series_from_row(bal, ca_tags),
-            current_liabilities=_get_series_from_row(bal, cl_tags),
-            cash_and_equivalents=_get_series_from_row(bal, cash_tags),
-            short_term_debt=_get_series_from_row(bal, std_tags),
-            long_term_debt=_get_series_from_row(bal, ltd_tags),
-            total_debt=_get_series_from_row(bal, td_tags),
-            total_assets=_get_series_from_row(bal, ta_tags),
-            total_liabilities=_get_series_from_row(bal, tl_tags),
-            property_plant_equipment_net=_get_series_from_row(bal, ppe_tags),
-            preferred_equity=_get_series_from_row(bal, pref_tags),
-            
-            d_and_a=_get_series_from_row(cf, da_tags),
-            capex=_get_series_from_row(cf, capex_tags),
+        return FinancialData(
+            years=_get_dates_from_cols(inc),
+            effective_tax_rate=eff_rates,
             preferred_dividends=[],
-            
-            shares_outstanding=float(mkt['shares']),
-            beta=float(mkt['beta']),
-            stock_price=float(mkt['price']),
-            market_cap=float(mkt['market_cap']),
-            risk_free_rate=float(mkt['treasury_yield']),
-            market_return_rate=float(mkt['market_return'])
+            **inc_vals,
+            **_get_series_block(bal, _YF_BALANCE_SPEC),
+            **_get_series_block(cf, _YF_CASHFLOW_SPEC),
+            **_market_fields(mkt),
         )
-        
-        tax_vals = _get_series_from_row(inc, tax_tags)
-        inc_vals = _get_series_from_row(inc, ['Pretax Income', 'Income Before Tax'])
-        
-        eff_rates = []
-        for t, i in zip(tax_vals, inc_vals):
-            if i != 0:
-                eff_rates.append(t / i)
-            else:
-                eff_rates.append(0.21)
-        fd.effective_tax_rate = eff_rates
-
-        return fd
 
     def _process_edgar_data(self, inc, bal, cf, mkt) -> FinancialData:
         # Mappings based on common US GAAP labels in Edgar
-        years = self._get_edgar_years(inc)
+        # Lowercase labels/concepts and find year columns once per statement, not once per field
+        keys = {id(df): self._edgar_keys(df) for df in (inc, bal, cf) if not df.empty}
+        years = self._get_edgar_years(inc, keys=keys.get(id(inc)))
+        
+        def getter(df, phrases):
+            return self._get_edgar_series(df, phrases, keys=keys.get(id(df)))
+        
+        ebit = getter(inc, ['Operating Income', 'Operating Profit', 'Operating Income (Loss)'])
+        ebitda = getter(inc, ['Net Income', 'Net Loss']) # Approx starter, usually need to calc
+        d_and_a = getter(cf, ['Depreciation, Depletion and Amortization', 'Depreciation'])
         
-        getter = self._get_edgar_series
+        # Patch EBITDA if missing
+        ebitda = np.asarray(ebitda)
+        ebitda = np.where(ebitda == 0, np.add(ebit, d_and_a), ebitda).tolist()
+        
+        # Recalc helpers
+        eff_rates = _effective_tax_rates(
+            getter(inc, ['Income Tax Expense (Benefit)', 'Income Tax Provision']),
+            getter(inc, ['Income (Loss) Before Income Taxes', 'Income Before Tax']),
+        )
         
-        fd = FinancialData(
+        return FinancialData(
             years=years,
             revenue=getter(inc, ['Total Revenue', 'Revenues', 'Revenue']),
-            ebit=getter(inc, ['Operating Income', 'Operating Profit', 'Operating Income (Loss)']),
-            ebitda=getter(inc, ['Net Income', 'Net Loss']), # Approx starter, usually need to calc
+            ebit=ebit,
+            ebitda=ebitda,
             net_income=getter(inc, ['Net Income', 'Net Income (Loss)', 'Net Loss']),
+            effective_tax_rate=eff_rates,
             
             # Interest is tricky in standardized views, often net
             interest_expense=getter(inc, ['Interest Expense', 'Interest and Dividend Income']),
@@ -417,46 +670,26 @@ class HybridDataFetcher:
             preferred_equity=getter(bal, ['Preferred Stock']),
             
             # Cash Flow
-            d_and_a=getter(cf, ['Depreciation, Depletion and Amortization', 'Depreciation']),
+            d_and_a=d_and_a,
             capex=getter(cf, ['Payments to Acquire Property, Plant, and Equipment', 'Capital Expenditures']),
             preferred_dividends=getter(cf, ['Payment of Preferred Stock Dividends']),
             
             # Market Data (YF)
-            shares_outstanding=float(mkt['shares']),
-            beta=float(mkt['beta']),
-            stock_price=float(mkt['price']),
-            market_cap=float(mkt['market_cap']),
-            risk_free_rate=float(mkt['treasury_yield']),
-            market_return_rate=float(mkt['market_return'])
+            **_market_fields(mkt),
         )
-        
-        # Recalc helpers
-        tax_prov = getter(inc, ['Income Tax Expense (Benefit)', 'Income Tax Provision'])
-        pre_tax = getter(inc, ['Income (Loss) Before Income Taxes', 'Income Before Tax'])
-        
-        eff_rates = []
-        for t, p in zip(tax_prov, pre_tax):
-            if p != 0:
-                eff_rates.append(t / p)
-            else:
-                eff_rates.append(0.21)
-        fd.effective_tax_rate = eff_rates
-        
-        # Patch EBITDA if missing
-        for i in range(3):
-            if fd.ebitda[i] == 0:
-                fd.ebitda[i] = fd.ebit[i] + fd.d_and_a[i]
-
-        return fd
 
 
 # Wrapper Logic Updated
 def load_data_from_api(ticker: str) -> FinancialData:
     start_time = time.time()
+    cached = get_cached_financials(ticker.upper())
+    if cached is not None:
+        return cached
     try:
         fetcher = HybridDataFetcher(ticker)
         data = fetcher.assemble()
         logger.info(f"Data Load Complete for {ticker} in {time.time() - start_time:.2f}s")
+        set_cached_financials(fetcher.ticker, data)
         return data
     except Exception as e:
         logger.critical(f"FATAL: All data sources failed for {ticker}. Error: {e}")
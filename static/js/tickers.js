@@ -1,5352 +1,4 @@
 // Auto-generated by build_ticker_array.py
-// Generated at: 2026-07-19 01:24:55
+// Generated at: 2026-10-15 03:13:36
 // Total count: 5347
-const TICKER_DATA = [
-  { s: "A", n: "Agilent Technologies, Inc. Common Stock" },
-  { s: "AA", n: "Alcoa Corporation Common Stock" },
-  { s: "AACG", n: "ATA Creativity Global" },
-  { s: "AADX", n: "Applied Aerospace & Defense, Inc. Common Stock" },
-  { s: "AAL", n: "American Airlines Group, Inc." },
-  { s: "AAME", n: "Atlantic American Corporation" },
-  { s: "AAMI", n: "Acadian Asset Management Inc. Common Stock" },
-  { s: "AAOI", n: "Applied Optoelectronics, Inc." },
-  { s: "AAON", n: "AAON, Inc." },
-  { s: "AAP", n: "Advance Auto Parts Inc." },
-  { s: "AAPG", n: "Ascentage Pharma Group International - American Depository Shares" },
-  { s: "AAPL", n: "Apple Inc." },
-  { s: "AARD", n: "Aardvark Therapeutics, Inc." },
-  { s: "AAUC", n: "Allied Gold Corporation Common Shares" },
-  { s: "AB", n: "AllianceBernstein Holding L.P. Units" },
-  { s: "ABAT", n: "American Battery Technology Company" },
-  { s: "ABBV", n: "AbbVie Inc. Common Stock" },
-  { s: "ABCB", n: "Ameris Bancorp Common Stock" },
-  { s: "ABCL", n: "AbCellera Biologics Inc. - Common Shares" },
-  { s: "ABEO", n: "Abeona Therapeutics Inc." },
-  { s: "ABEV", n: "Ambev S.A. American Depositary Shares (Each representing 1 Common Share)" },
-  { s: "ABG", n: "Asbury Automotive Group Inc Common Stock" },
-  { s: "ABLV", n: "Able View Global Inc." },
-  { s: "ABM", n: "ABM Industries Incorporated Common Stock" },
-  { s: "ABNB", n: "Airbnb, Inc." },
-  { s: "ABOS", n: "Acumen Pharmaceuticals, Inc." },
-  { s: "ABSI", n: "Absci Corporation" },
-  { s: "ABT", n: "Abbott Laboratories Common Stock" },
-  { s: "ABTC", n: "American Bitcoin Corp." },
-  { s: "ABTS", n: "Abits Group Inc" },
-  { s: "ABUS", n: "Arbutus Biopharma Corporation" },
-  { s: "ABVC", n: "ABVC BioPharma, Inc." },
-  { s: "ABVX", n: "Abivax SA" },
-  { s: "ABX", n: "Abacus Global Management, Inc. Class A Common Stock" },
-  { s: "ACA", n: "Arcosa, Inc. Common Stock" },
-  { s: "ACAD", n: "ACADIA Pharmaceuticals Inc." },
-  { s: "ACB", n: "Aurora Cannabis Inc. - Common Shares" },
-  { s: "ACCL", n: "Acco Group Holdings Limited" },
-  { s: "ACCO", n: "Acco Brands Corporation Common Stock" },
-  { s: "ACCS", n: "ACCESS Newswire Inc. Common Stock" },
-  { s: "ACDC", n: "ProFrac Holding Corp." },
-  { s: "ACEL", n: "Accel Entertainment, Inc." },
-  { s: "ACET", n: "Adicet Bio, Inc." },
-  { s: "ACFN", n: "Acorn Energy, Inc." },
-  { s: "ACGL", n: "Arch Capital Group Ltd." },
-  { s: "ACH", n: "Accendra Health, Inc. Common Stock" },
-  { s: "ACHC", n: "Acadia Healthcare Company, Inc." },
-  { s: "ACHR", n: "Archer Aviation Inc. Class A Common Stock" },
-  { s: "ACHV", n: "Achieve Life Sciences, Inc. - Common Shares" },
-  { s: "ACI", n: "Albertsons Companies, Inc. Class A Common Stock" },
-  { s: "ACIC", n: "American Coastal Insurance Corporation" },
-  { s: "ACIU", n: "AC Immune SA" },
-  { s: "ACIW", n: "ACI Worldwide, Inc." },
-  { s: "ACLS", n: "Axcelis Technologies, Inc." },
-  { s: "ACM", n: "AECOM Common Stock" },
-  { s: "ACMR", n: "ACM Research, Inc." },
-  { s: "ACN", n: "Accenture plc Class A Ordinary Shares (Ireland)" },
-  { s: "ACNB", n: "ACNB Corporation" },
-  { s: "ACNT", n: "Ascent Industries Co." },
-  { s: "ACOG", n: "Alpha Cognition Inc." },
-  { s: "ACON", n: "Aclarion, Inc." },
-  { s: "ACR", n: "ACRES Commercial Realty Corp. Common Stock" },
-  { s: "ACRE", n: "Ares Commercial Real Estate Corporation Common Stock" },
-  { s: "ACRS", n: "Aclaris Therapeutics, Inc." },
-  { s: "ACRV", n: "Acrivon Therapeutics, Inc." },
-  { s: "ACT", n: "Enact Holdings, Inc." },
-  { s: "ACTG", n: "Acacia Research Corporation" },
-  { s: "ACTU", n: "Actuate Therapeutics, Inc." },
-  { s: "ACU", n: "Acme United Corporation. Common Stock" },
-  { s: "ACVA", n: "ACV Auctions Inc. Class A Common Stock" },
-  { s: "ACXP", n: "Acurx Pharmaceuticals, Inc." },
-  { s: "AD", n: "Array Digital Infrastructure, Inc. Common Shares" },
-  { s: "ADAG", n: "Adagene Inc." },
-  { s: "ADBE", n: "Adobe Inc." },
-  { s: "ADC", n: "Agree Realty Corporation Common Stock" },
-  { s: "ADCT", n: "ADC Therapeutics SA Common Shares" },
-  { s: "ADEA", n: "Adeia Inc." },
-  { s: "ADGM", n: "Adagio Medical Holdings, Inc" },
-  { s: "ADI", n: "Analog Devices, Inc." },
-  { s: "ADIL", n: "Adial Pharmaceuticals, Inc" },
-  { s: "ADM", n: "Archer-Daniels-Midland Company Common Stock" },
-  { s: "ADMA", n: "ADMA Biologics Inc" },
-  { s: "ADNT", n: "Adient plc Ordinary Shares" },
-  { s: "ADP", n: "Automatic Data Processing, Inc." },
-  { s: "ADPT", n: "Adaptive Biotechnologies Corporation" },
-  { s: "ADSE", n: "ADS-TEC ENERGY PLC" },
-  { s: "ADSK", n: "Autodesk, Inc." },
-  { s: "ADT", n: "ADT Inc. Common Stock" },
-  { s: "ADTN", n: "ADTRAN Holdings, Inc." },
-  { s: "ADUR", n: "Aduro Clean Technologies Inc." },
-  { s: "ADUS", n: "Addus HomeCare Corporation" },
-  { s: "ADV", n: "Advantage Solutions Inc." },
-  { s: "ADVB", n: "Advanced Biomed Inc." },
-  { s: "ADXN", n: "Addex Therapeutics Ltd" },
-  { s: "AEBI", n: "Aebi Schmidt Holding AG" },
-  { s: "AEC", n: "Anfield Energy Inc. - Common Shares" },
-  { s: "AEE", n: "Ameren Corporation Common Stock" },
-  { s: "AEG", n: "Aegon Ltd. New York Registry Shares" },
-  { s: "AEHL", n: "Antelope Enterprise Holdings Limited" },
-  { s: "AEHR", n: "Aehr Test Systems" },
-  { s: "AEI", n: "Alset Inc." },
-  { s: "AEIS", n: "Advanced Energy Industries, Inc." },
-  { s: "AEM", n: "Agnico Eagle Mines Limited Common Stock" },
-  { s: "AEMD", n: "Aethlon Medical, Inc." },
-  { s: "AENT", n: "Alliance Entertainment Holding Corporation" },
-  { s: "AENTW", n: "Alliance Entertainment Holding Corporation - Warrants" },
-  { s: "AEO", n: "American Eagle Outfitters, Inc. Common Stock" },
-  { s: "AEON", n: "AEON Biopharma, Inc. Class A Common Stock" },
-  { s: "AEP", n: "American Electric Power Company, Inc." },
-  { s: "AER", n: "AerCap Holdings N.V. Ordinary Shares" },
-  { s: "AERO", n: "Grupo Aeromexico, S.A.B. de C.V. American Depositary Shares (each representing ten (10) Common Shares)" },
-  { s: "AERT", n: "Aeries Technology, Inc." },
-  { s: "AES", n: "The AES Corporation Common Stock" },
-  { s: "AESI", n: "Atlas Energy Solutions Inc. Common Stock" },
-  { s: "AEVA", n: "Aeva Technologies, Inc." },
-  { s: "AEYE", n: "AudioEye, Inc." },
-  { s: "AFBI", n: "Affinity Bancshares, Inc." },
-  { s: "AFCG", n: "Advanced Flower Capital Inc." },
-  { s: "AFG", n: "American Financial Group, Inc. Common Stock" },
-  { s: "AFGB", n: "American Financial Group, Inc. 5.875% Subordinated Debentures due 2059" },
-  { s: "AFGC", n: "American Financial Group, Inc. 5.125% Subordinated Debentures due 2059" },
-  { s: "AFGD", n: "American Financial Group, Inc. 5.625% Subordinated Debentures due 2060" },
-  { s: "AFGE", n: "American Financial Group, Inc. 4.500% Subordinated Debentures due 2060" },
-  { s: "AFJK", n: "Aimei Health Technology Co., Ltd - Ordinary Share" },
-  { s: "AFL", n: "AFLAC Incorporated Common Stock" },
-  { s: "AFRI", n: "Forafric Global PLC" },
-  { s: "AFRIW", n: "Forafric Global PLC - Warrants" },
-  { s: "AFRM", n: "Affirm Holdings, Inc." },
-  { s: "AFYA", n: "Afya Limited" },
-  { s: "AG", n: "First Majestic Silver Corp. Ordinary Shares (Canada)" },
-  { s: "AGBK", n: "AGI Inc Class A Common Shares" },
-  { s: "AGCC", n: "Agencia Comercial Spirits Ltd" },
-  { s: "AGCO", n: "AGCO Corporation Common Stock" },
-  { s: "AGEN", n: "Agenus Inc." },
-  { s: "AGI", n: "Alamos Gold Inc. Class A Common Shares" },
-  { s: "AGIG", n: "Abundia Global Impact Group Inc. Common stock" },
-  { s: "AGIO", n: "Agios Pharmaceuticals, Inc." },
-  { s: "AGL", n: "agilon health, inc. Common Stock" },
-  { s: "AGM", n: "Federal Agricultural Mortgage Corporation Common Stock" },
-  { s: "AGM-A", n: "Federal Agricultural Mortgage Corporation Common Stock" },
-  { s: "AGMH", n: "AGM Group Holdings Inc." },
-  { s: "AGNC", n: "AGNC Investment Corp." },
-  { s: "AGNT", n: "AGNT, Inc." },
-  { s: "AGO", n: "Assured Guaranty Ltd. Common Stock" },
-  { s: "AGPU", n: "Axe Compute Inc." },
-  { s: "AGRO", n: "Adecoagro S.A. Common Shares" },
-  { s: "AGRZ", n: "Agroz Inc." },
-  { s: "AGX", n: "Argan, Inc. Common Stock" },
-  { s: "AGYS", n: "Agilysys, Inc." },
-  { s: "AHCO", n: "AdaptHealth Corp." },
-  { s: "AHG", n: "Akso Health Group" },
-  { s: "AHMA", n: "Ambitions Enterprise Management Co. L.L.C" },
-  { s: "AI", n: "C3.ai, Inc. Class A Common Stock" },
-  { s: "AIAI", n: "AIAI Holdings Corporation" },
-  { s: "AIB", n: "AIB Data Centers Inc. Common Stock" },
-  { s: "AIBZ", n: "Bitzero Holdings Inc. - Common Shares" },
-  { s: "AIDX", n: "20/20 Biolabs, Inc." },
-  { s: "AIFA", n: "All In FutureTech Alliance, Inc." },
-  { s: "AIFC", n: "AI Financial Corporation" },
-  { s: "AIFF", n: "Firefly Neuroscience, Inc." },
-  { s: "AIFU", n: "AIFU Inc." },
-  { s: "AIG", n: "American International Group, Inc. New Common Stock" },
-  { s: "AIHS", n: "Senmiao Technology Limited" },
-  { s: "AII", n: "American Integrity Insurance Group, Inc. Common Stock" },
-  { s: "AIIO", n: "Robo.ai Inc." },
-  { s: "AIIR", n: "Air Global PLC" },
-  { s: "AIM", n: "AIM ImmunoTech Inc. Common Stock" },
-  { s: "AIMD", n: "Ainos, Inc." },
-  { s: "AIMDW", n: "Ainos, Inc. - warrants" },
-  { s: "AIN", n: "Albany International Corporation Common Stock" },
-  { s: "AIOS", n: "AIOS Tech Inc." },
-  { s: "AIOT", n: "PowerFleet, Inc." },
-  { s: "AIP", n: "Arteris, Inc." },
-  { s: "AIR", n: "AAR Corp. Common Stock" },
-  { s: "AIRE", n: "reAlpha Tech Corp." },
-  { s: "AIRG", n: "Airgain, Inc." },
-  { s: "AIRI", n: "Air Industries Group Common Stock" },
-  { s: "AIRJ", n: "AirJoule Technologies Corporation" },
-  { s: "AIRO", n: "AIRO Group Holdings, Inc." },
-  { s: "AIRS", n: "AirSculpt Technologies, Inc." },
-  { s: "AIRT", n: "Air T, Inc." },
-  { s: "AISP", n: "Airship AI Holdings, Inc" },
-  { s: "AISPW", n: "Airship AI Holdings, Inc - Warrants" },
-  { s: "AIT", n: "Applied Industrial Technologies, Inc. Common Stock" },
-  { s: "AIV", n: "Apartment Investment and Management Company Common Stock" },
-  { s: "AIXC", n: "AIxCrypto Holdings, Inc." },
-  { s: "AIXI", n: "XIAO-I Corporation" },
-  { s: "AIZ", n: "Assurant, Inc. Common Stock" },
-  { s: "AJG", n: "Arthur J. Gallagher & Co. Common Stock" },
-  { s: "AKA", n: "a.k.a. Brands Holding Corp. Common Stock" },
-  { s: "AKAM", n: "Akamai Technologies, Inc." },
-  { s: "AKAN", n: "Akanda Corp. - Common Shares" },
-  { s: "AKBA", n: "Akebia Therapeutics, Inc." },
-  { s: "AKO-A", n: "Embotelladora Andina S.A. Common Stock" },
-  { s: "AKO-B", n: "Embotelladora Andina S.A. Common Stock" },
-  { s: "AKTS", n: "Aktis Oncology, Inc." },
-  { s: "AKTX", n: "Akari Therapeutics Plc" },
-  { s: "ALAB", n: "Astera Labs, Inc." },
-  { s: "ALAR", n: "Alarum Technologies Ltd." },
-  { s: "ALB", n: "Albemarle Corporation Common Stock" },
-  { s: "ALBT", n: "Avalon GloboCare Corp." },
-  { s: "ALC", n: "Alcon Inc. Ordinary Shares" },
-  { s: "ALCO", n: "Alico, Inc." },
-  { s: "ALDF", n: "Aldel Financial II Inc." },
-  { s: "ALDFU", n: "Aldel Financial II Inc. - Units" },
-  { s: "ALDFW", n: "Aldel Financial II Inc. - Warrants" },
-  { s: "ALDX", n: "Aldeyra Therapeutics, Inc." },
-  { s: "ALEC", n: "Alector, Inc." },
-  { s: "ALG", n: "Alamo Group, Inc. Common Stock" },
-  { s: "ALGM", n: "Allegro MicroSystems, Inc." },
-  { s: "ALGN", n: "Align Technology, Inc." },
-  { s: "ALGS", n: "Aligos Therapeutics, Inc." },
-  { s: "ALGT", n: "Allegiant Travel Company" },
-  { s: "ALH", n: "Alliance Laundry Holdings Inc. Common Stock" },
-  { s: "ALHC", n: "Alignment Healthcare, Inc." },
-  { s: "ALIT", n: "Alight, Inc. Class A Common Stock" },
-  { s: "ALK", n: "Alaska Air Group, Inc. Common Stock" },
-  { s: "ALKS", n: "Alkermes plc" },
-  { s: "ALKT", n: "Alkami Technology, Inc." },
-  { s: "ALL", n: "Allstate Corporation (The) Common Stock" },
-  { s: "ALLE", n: "Allegion plc Ordinary Shares" },
-  { s: "ALLO", n: "Allogene Therapeutics, Inc." },
-  { s: "ALLR", n: "Allarity Therapeutics, Inc." },
-  { s: "ALLT", n: "Allot Ltd." },
-  { s: "ALLY", n: "Ally Financial Inc. Common Stock" },
-  { s: "ALM", n: "Almonty Industries Inc. - Common Shares" },
-  { s: "ALMR", n: "Alamar Biosciences, Inc." },
-  { s: "ALMS", n: "Alumis Inc." },
-  { s: "ALMU", n: "Aeluma, Inc." },
-  { s: "ALNT", n: "Allient Inc." },
-  { s: "ALNY", n: "Alnylam Pharmaceuticals, Inc." },
-  { s: "ALOT", n: "AstroNova, Inc." },
-  { s: "ALOV", n: "Aldabra 4 Liquidity Opportunity Vehicle, Inc." },
-  { s: "ALOVU", n: "Aldabra 4 Liquidity Opportunity Vehicle, Inc. - Units" },
-  { s: "ALOVW", n: "Aldabra 4 Liquidity Opportunity Vehicle, Inc. - Warrants" },
-  { s: "ALOY", n: "REalloys Inc." },
-  { s: "ALP", n: "Alpha Compute Corp" },
-  { s: "ALPS", n: "ALPS Group Inc - Ordinary Share" },
-  { s: "ALRM", n: "Alarm.com Holdings, Inc." },
-  { s: "ALRS", n: "Alerus Financial Corporation" },
-  { s: "ALSN", n: "Allison Transmission Holdings, Inc. Common Stock" },
-  { s: "ALT", n: "Altimmune, Inc." },
-  { s: "ALTG", n: "Alta Equipment Group Inc. Class A Common Stock" },
-  { s: "ALTI", n: "AlTi Global, Inc." },
-  { s: "ALTO", n: "Alto Ingredients, Inc." },
-  { s: "ALV", n: "Autoliv, Inc. Common Stock" },
-  { s: "ALVO", n: "Alvotech" },
-  { s: "ALX", n: "Alexander's, Inc. Common Stock" },
-  { s: "ALXO", n: "ALX Oncology Holdings Inc." },
-  { s: "ALZN", n: "Alzamend Neuro, Inc." },
-  { s: "AM", n: "Antero Midstream Corporation Common Stock" },
-  { s: "AMAL", n: "Amalgamated Financial Corp." },
-  { s: "AMAT", n: "Applied Materials, Inc." },
-  { s: "AMBA", n: "Ambarella, Inc." },
-  { s: "AMBO", n: "Ambow Education Holding Ltd. American Depository Shares (each representing twenty (20) Class A Ordinary Shares)" },
-  { s: "AMBP", n: "Ardagh Metal Packaging S.A. Ordinary Shares" },
-  { s: "AMBQ", n: "Ambiq Micro, Inc. Common Stock" },
-  { s: "AMBR", n: "Amber International Holding Limited" },
-  { s: "AMC", n: "AMC Entertainment Holdings, Inc. Class A Common Stock" },
-  { s: "AMCI", n: "AMC Robotics Corporation" },
-  { s: "AMCR", n: "Amcor plc Ordinary Shares" },
-  { s: "AMCX", n: "AMC Global Media Inc." },
-  { s: "AMD", n: "Advanced Micro Devices, Inc." },
-  { s: "AME", n: "AMETEK, Inc." },
-  { s: "AMG", n: "Affiliated Managers Group, Inc. Common Stock" },
-  { s: "AMGN", n: "Amgen Inc." },
-  { s: "AMH", n: "American Homes 4 Rent Common Shares of Beneficial Interest" },
-  { s: "AMIX", n: "Autonomix Medical, Inc." },
-  { s: "AMKR", n: "Amkor Technology, Inc." },
-  { s: "AMLX", n: "Amylyx Pharmaceuticals, Inc." },
-  { s: "AMN", n: "AMN Healthcare Services Inc" },
-  { s: "AMOD", n: "Alpha Modus Holdings, Inc." },
-  { s: "AMP", n: "Ameriprise Financial, Inc. Common Stock" },
-  { s: "AMPG", n: "Amplitech Group, Inc." },
-  { s: "AMPH", n: "Amphastar Pharmaceuticals, Inc." },
-  { s: "AMPL", n: "Amplitude, Inc." },
-  { s: "AMPX", n: "Amprius Technologies, Inc. Common Stock" },
-  { s: "AMPY", n: "Amplify Energy Corp. Common Stock" },
-  { s: "AMR", n: "Alpha Metallurgical Resources, Inc. Common Stock" },
-  { s: "AMRC", n: "Ameresco, Inc. Class A Common Stock" },
-  { s: "AMRN", n: "Amarin Corporation plc" },
-  { s: "AMRX", n: "Amneal Pharmaceuticals, Inc." },
-  { s: "AMRZ", n: "Amrize Ltd Ordinary Shares" },
-  { s: "AMS", n: "American Shared Hospital Services Common Stock" },
-  { s: "AMSC", n: "American Superconductor Corporation" },
-  { s: "AMSF", n: "AMERISAFE, Inc." },
-  { s: "AMSS", n: "AMASS Brands Inc." },
-  { s: "AMST", n: "Amesite Inc." },
-  { s: "AMTB", n: "Amerant Bancorp Inc. Class A Common Stock" },
-  { s: "AMTD", n: "AMTD IDEA Group American Depositary Shares, each representing six (6) Class A Ordinary Shares" },
-  { s: "AMTM", n: "Amentum Holdings, Inc. Common Stock" },
-  { s: "AMTX", n: "Aemetis, Inc" },
-  { s: "AMWL", n: "American Well Corporation Class A Common Stock" },
-  { s: "AMZE", n: "Amaze Holdings, Inc. Common Stock" },
-  { s: "AMZN", n: "Amazon.com, Inc." },
-  { s: "AN", n: "AutoNation, Inc. Common Stock" },
-  { s: "ANAB", n: "AnaptysBio, Inc." },
-  { s: "ANDE", n: "The Andersons, Inc." },
-  { s: "ANDG", n: "Andersen Group Inc. Class A Common Stock" },
-  { s: "ANET", n: "Arista Networks, Inc. Common Stock" },
-  { s: "ANF", n: "Abercrombie & Fitch Company Common Stock" },
-  { s: "ANGH", n: "Anghami Inc." },
-  { s: "ANGHW", n: "Anghami Inc. - Warrants" },
-  { s: "ANGI", n: "Angi Inc." },
-  { s: "ANGO", n: "AngioDynamics, Inc." },
-  { s: "ANGX", n: "Angel Studios, Inc. Class A Common Stock" },
-  { s: "ANIK", n: "Anika Therapeutics Inc." },
-  { s: "ANIP", n: "ANI Pharmaceuticals, Inc." },
-  { s: "ANIX", n: "Anixa Biosciences, Inc." },
-  { s: "ANL", n: "Adlai Nortye Ltd." },
-  { s: "ANNA", n: "AleAnna, Inc." },
-  { s: "ANNX", n: "Annexon, Inc." },
-  { s: "ANPA", n: "Rich Sparkle Holdings Limited" },
-  { s: "ANRO", n: "Alto Neuroscience, Inc. Common Stock" },
-  { s: "ANTA", n: "Antalpha Platform Holding Company" },
-  { s: "ANTX", n: "AN2 Therapeutics, Inc." },
-  { s: "ANVS", n: "Annovis Bio, Inc. Common Stock" },
-  { s: "ANY", n: "Sphere 3D Corp. - Common Shares" },
-  { s: "AON", n: "Aon plc Class A Ordinary Shares (Ireland)" },
-  { s: "AORT", n: "Artivion, Inc. Common Stock" },
-  { s: "AOS", n: "A.O. Smith Corporation Common Stock" },
-  { s: "AOSL", n: "Alpha and Omega Semiconductor Limited - Common Shares" },
-  { s: "AOUT", n: "American Outdoor Brands, Inc." },
-  { s: "AP", n: "Ampco-Pittsburgh Corporation Common Stock" },
-  { s: "APA", n: "APA Corporation" },
-  { s: "APAM", n: "Artisan Partners Asset Management Inc. Class A Common Stock" },
-  { s: "APC", n: "ARKO Petroleum Corp." },
-  { s: "APD", n: "Air Products and Chemicals, Inc. Common Stock" },
-  { s: "APEI", n: "American Public Education, Inc." },
-  { s: "APG", n: "APi Group Corporation Common Stock" },
-  { s: "APGE", n: "Apogee Therapeutics, Inc." },
-  { s: "APH", n: "Amphenol Corporation Common Stock" },
-  { s: "API", n: "Agora, Inc." },
-  { s: "APLD", n: "Applied Digital Corporation" },
-  { s: "APLM", n: "Apollomics Inc." },
-  { s: "APM", n: "Aptorum Group Limited" },
-  { s: "APO", n: "Apollo Global Management, Inc. (New) Common Stock" },
-  { s: "APOG", n: "Apogee Enterprises, Inc." },
-  { s: "APP", n: "Applovin Corporation" },
-  { s: "APPF", n: "AppFolio, Inc." },
-  { s: "APPN", n: "Appian Corporation" },
-  { s: "APPS", n: "Digital Turbine, Inc." },
-  { s: "APRE", n: "Aprea Therapeutics, Inc." },
-  { s: "APT", n: "Alpha Pro Tech, Ltd. Common Stock" },
-  { s: "APTV", n: "Aptiv PLC Ordinary Shares" },
-  { s: "APUR", n: "Aperture AC" },
-  { s: "APUS", n: "Apimeds Pharmaceuticals US, Inc. Common Stock" },
-  { s: "APVO", n: "Aptevo Therapeutics Inc." },
-  { s: "APWC", n: "Asia Pacific Wire & Cable Corporation Limited - Common shares, Par value .01 per share" },
-  { s: "APXT", n: "Apex Treasury Corporation" },
-  { s: "APXTU", n: "Apex Treasury Corporation - Units" },
-  { s: "APXTW", n: "Apex Treasury Corporation - Warrants" },
-  { s: "APYX", n: "Apyx Medical Corporation" },
-  { s: "AQB", n: "AquaBounty Technologies, Inc." },
-  { s: "AQMS", n: "Aqua Metals, Inc." },
-  { s: "AQN", n: "Algonquin Power & Utilities Corp. Common Shares" },
-  { s: "AQST", n: "Aquestive Therapeutics, Inc." },
-  { s: "AR", n: "Antero Resources Corporation Common Stock" },
-  { s: "ARAI", n: "Arrive AI Inc." },
-  { s: "ARAY", n: "Accuray Incorporated" },
-  { s: "ARBB", n: "ARB IOT Group Limited" },
-  { s: "ARBE", n: "Arbe Robotics Ltd." },
-  { s: "ARBK", n: "Argo Blockchain plc" },
-  { s: "ARCB", n: "ArcBest Corporation" },
-  { s: "ARCO", n: "Arcos Dorados Holdings Inc. Class A Shares" },
-  { s: "ARCT", n: "Arcturus Therapeutics Holdings Inc." },
-  { s: "ARDT", n: "Ardent Health, Inc. Common Stock" },
-  { s: "ARDX", n: "Ardelyx, Inc." },
-  { s: "ARE", n: "Alexandria Real Estate Equities, Inc. Common Stock" },
-  { s: "AREC", n: "American Resources Corporation" },
-  { s: "AREN", n: "The Arena Group Holdings, Inc. Common Stock" },
-  { s: "ARES", n: "Ares Management Corporation Class A Common Stock" },
-  { s: "ARGX", n: "argenx SE" },
-  { s: "ARHS", n: "Arhaus, Inc." },
-  { s: "ARI", n: "Apollo Commercial Real Estate Finance, Inc" },
-  { s: "ARIS", n: "Aris Mining Corporation Common Shares" },
-  { s: "ARKO", n: "ARKO Corp." },
-  { s: "ARKR", n: "Ark Restaurants Corp." },
-  { s: "ARL", n: "American Realty Investors, Inc. Common Stock" },
-  { s: "ARLO", n: "Arlo Technologies, Inc. Common Stock" },
-  { s: "ARLP", n: "Alliance Resource Partners, L.P. - Common Units Representing Limited Partnership Interests" },
-  { s: "ARM", n: "Arm Holdings plc" },
-  { s: "ARMK", n: "Aramark Common Stock" },
-  { s: "ARMP", n: "Armata Pharmaceuticals, Inc. Common Stock" },
-  { s: "AROC", n: "Archrock, Inc. Common Stock" },
-  { s: "AROW", n: "Arrow Financial Corporation" },
-  { s: "ARQ", n: "Arq, Inc." },
-  { s: "ARQQ", n: "Arqit Quantum Inc." },
-  { s: "ARQQW", n: "Arqit Quantum Inc. - Warrants" },
-  { s: "ARQT", n: "Arcutis Biotherapeutics, Inc." },
-  { s: "ARRY", n: "Array Technologies, Inc." },
-  { s: "ARTL", n: "Artelo Biosciences, Inc." },
-  { s: "ARTNA", n: "Artesian Resources Corporation" },
-  { s: "ARTV", n: "Artiva Biotherapeutics, Inc." },
-  { s: "ARTW", n: "Art's-Way Manufacturing Co., Inc." },
-  { s: "ARVN", n: "Arvinas, Inc." },
-  { s: "ARW", n: "Arrow Electronics, Inc. Common Stock" },
-  { s: "ARWR", n: "Arrowhead Pharmaceuticals, Inc." },
-  { s: "ARX", n: "Accelerant Holdings Class A Common Shares" },
-  { s: "ARXS", n: "Arxis, Inc." },
-  { s: "AS", n: "Amer Sports, Inc. Ordinary Shares" },
-  { s: "ASA", n: "ASA Gold and Precious Metals Limited" },
-  { s: "ASAN", n: "Asana, Inc. Class A Common Stock" },
-  { s: "ASB", n: "Associated Banc-Corp Common Stock" },
-  { s: "ASBP", n: "Aspire Biopharma Holdings, Inc." },
-  { s: "ASC", n: "Ardmore Shipping Corporation Common Stock" },
-  { s: "ASH", n: "Ashland Inc. Common Stock" },
-  { s: "ASIC", n: "Ategrity Specialty Insurance Company Holdings Common Stock" },
-  { s: "ASIX", n: "AdvanSix Inc. Common Stock" },
-  { s: "ASLE", n: "AerSale Corporation" },
-  { s: "ASM", n: "Avino Silver & Gold Mines Ltd. Common Shares (Canada)" },
-  { s: "ASMB", n: "Assembly Biosciences, Inc." },
-  { s: "ASML", n: "ASML Holding N.V. - New York Registry Shares" },
-  { s: "ASND", n: "Ascendis Pharma A/S - Ordinary Share" },
-  { s: "ASO", n: "Academy Sports and Outdoors, Inc." },
-  { s: "ASPI", n: "ASP Isotopes Inc." },
-  { s: "ASPN", n: "Aspen Aerogels, Inc. Common Stock" },
-  { s: "ASR", n: "Grupo Aeroportuario del Sureste, S.A. de C.V. Common Stock" },
-  { s: "ASRV", n: "AmeriServ Financial Inc." },
-  { s: "ASST", n: "Strive, Inc." },
-  { s: "ASTC", n: "Astrotech Corporation" },
-  { s: "ASTE", n: "Astec Industries, Inc." },
-  { s: "ASTH", n: "Astrana Health Inc." },
-  { s: "ASTI", n: "Ascent Solar Technologies, Inc" },
-  { s: "ASTL", n: "Algoma Steel Group Inc. - Common Shares" },
-  { s: "ASTS", n: "AST SpaceMobile, Inc." },
-  { s: "ASUR", n: "Asure Software Inc" },
-  { s: "ASX", n: "ASE Technology Holding Co., Ltd. American Depositary Shares (each representing Two Common Shares)" },
-  { s: "ASYS", n: "Amtech Systems, Inc." },
-  { s: "ATAI", n: "AtaiBeckley Inc." },
-  { s: "ATAT", n: "Atour Lifestyle Holdings Limited" },
-  { s: "ATCH", n: "AtlasClear Holdings, Inc. Common Stock" },
-  { s: "ATCX", n: "Atlas Critical Minerals Corporation" },
-  { s: "ATEC", n: "Alphatec Holdings, Inc." },
-  { s: "ATEN", n: "A10 Networks, Inc. Common Stock" },
-  { s: "ATER", n: "Aterian, Inc." },
-  { s: "ATEX", n: "Anterix Inc." },
-  { s: "ATGL", n: "Alpha Technology Group Limited" },
-  { s: "ATHE", n: "Alterity Therapeutics Limited" },
-  { s: "ATHM", n: "Autohome Inc. American Depositary Shares, each representing four class A ordinary shares." },
-  { s: "ATHR", n: "Aether Holdings, Inc." },
-  { s: "ATHS", n: "Athene Holding Ltd. 7.250% Fixed-Rate Reset Junior Subordinated Debentures due 2064" },
-  { s: "ATI", n: "ATI Inc. Common Stock" },
-  { s: "ATKR", n: "Atkore Inc. Common Stock" },
-  { s: "ATLC", n: "Atlanticus Holdings Corporation" },
-  { s: "ATLO", n: "Ames National Corporation" },
-  { s: "ATLX", n: "Atlas Lithium Corporation" },
-  { s: "ATMU", n: "Atmus Filtration Technologies Inc. Common Stock" },
-  { s: "ATNI", n: "ATN International, Inc." },
-  { s: "ATNM", n: "Actinium Pharmaceuticals, Inc. (Delaware) Common Stock" },
-  { s: "ATO", n: "Atmos Energy Corporation Common Stock" },
-  { s: "ATOM", n: "Atomera Incorporated" },
-  { s: "ATOS", n: "Atossa Therapeutics, Inc." },
-  { s: "ATPC", n: "Agape ATP Corporation" },
-  { s: "ATR", n: "AptarGroup, Inc. Common Stock" },
-  { s: "ATRA", n: "Atara Biotherapeutics, Inc." },
-  { s: "ATRC", n: "AtriCure, Inc." },
-  { s: "ATRO", n: "Astronics Corporation" },
-  { s: "ATS", n: "ATS Corporation Common Shares" },
-  { s: "ATXG", n: "Addentax Group Corp." },
-  { s: "ATYR", n: "aTyr Pharma, Inc." },
-  { s: "AU", n: "AngloGold Ashanti PLC Ordinary Shares" },
-  { s: "AUB", n: "Atlantic Union Bankshares Corporation Common Stock" },
-  { s: "AUBN", n: "Auburn National Bancorporation, Inc." },
-  { s: "AUC", n: "ATIF Holdings Limited" },
-  { s: "AUDC", n: "AudioCodes Ltd." },
-  { s: "AUGO", n: "Aura Minerals Inc. - Common Shares" },
-  { s: "AUID", n: "authID Inc." },
-  { s: "AUNA", n: "Auna SA Class A Ordinary Shares" },
-  { s: "AUPH", n: "Aurinia Pharmaceuticals Inc - Common Shares" },
-  { s: "AUR", n: "Aurora Innovation, Inc." },
-  { s: "AURA", n: "Aura Biosciences, Inc." },
-  { s: "AURE", n: "Aurelion Inc." },
-  { s: "AUST", n: "Austin Gold Corp. Common Shares" },
-  { s: "AUTL", n: "Autolus Therapeutics plc" },
-  { s: "AUUD", n: "Auddia Inc." },
-  { s: "AVA", n: "Avista Corporation Common Stock" },
-  { s: "AVAH", n: "Aveanna Healthcare Holdings Inc." },
-  { s: "AVAT", n: "Avalanche Treasury Corporation" },
-  { s: "AVAV", n: "AeroVironment, Inc." },
-  { s: "AVB", n: "AvalonBay Communities, Inc. Common Stock" },
-  { s: "AVBC", n: "Avidia Bancorp, Inc. Common Stock" },
-  { s: "AVBH", n: "Avidbank Holdings, Inc." },
-  { s: "AVBP", n: "ArriVent BioPharma, Inc." },
-  { s: "AVD", n: "American Vanguard Corporation Common Stock ($0.10 Par Value)" },
-  { s: "AVEX", n: "AEVEX Corp. Class A Common Stock" },
-  { s: "AVGO", n: "Broadcom Inc." },
-  { s: "AVIR", n: "Atea Pharmaceuticals, Inc." },
-  { s: "AVLN", n: "Avalyn Pharma Inc." },
-  { s: "AVNS", n: "Avanos Medical, Inc. Common Stock" },
-  { s: "AVNT", n: "Avient Corporation Common Stock" },
-  { s: "AVNW", n: "Aviat Networks, Inc." },
-  { s: "AVO", n: "Mission Produce, Inc." },
-  { s: "AVPT", n: "AvePoint, Inc." },
-  { s: "AVR", n: "Anteris Technologies Global Corp." },
-  { s: "AVT", n: "Avnet, Inc." },
-  { s: "AVTR", n: "Avantor, Inc. Common Stock" },
-  { s: "AVTX", n: "Avalo Therapeutics, Inc." },
-  { s: "AVX", n: "Avax One Technology Ltd. - Common Shares" },
-  { s: "AVXL", n: "Anavex Life Sciences Corp." },
-  { s: "AVY", n: "Avery Dennison Corporation Common Stock" },
-  { s: "AWI", n: "Armstrong World Industries Inc Common Stock" },
-  { s: "AWK", n: "American Water Works Company, Inc. Common Stock" },
-  { s: "AWR", n: "American States Water Company Common Stock" },
-  { s: "AWRE", n: "Aware, Inc." },
-  { s: "AWX", n: "Avalon Holdings Corporation Common Stock" },
-  { s: "AX", n: "Axos Financial, Inc. Common Stock" },
-  { s: "AXG", n: "Solowin Holdings" },
-  { s: "AXGN", n: "Axogen, Inc." },
-  { s: "AXIA", n: "AXIA Energia American Depositary Shares (Each representing one Common Share)" },
-  { s: "AXIL", n: "AXIL Brands, Inc. Common Stock" },
-  { s: "AXON", n: "Axon Enterprise, Inc." },
-  { s: "AXP", n: "American Express Company Common Stock" },
-  { s: "AXR", n: "AMREP Corporation Common Stock" },
-  { s: "AXS", n: "Axis Capital Holdings Limited Common Stock" },
-  { s: "AXSM", n: "Axsome Therapeutics, Inc." },
-  { s: "AXTA", n: "Axalta Coating Systems Ltd. Common Shares" },
-  { s: "AXTI", n: "AXT Inc" },
-  { s: "AYA", n: "Aya Gold & Silver Inc. - Common Shares" },
-  { s: "AYI", n: "Acuity Inc. Common Stock" },
-  { s: "AYTU", n: "Aytu BioPharma, Inc." },
-  { s: "AZ", n: "A2Z Cust2Mate Solutions Corp. - Common Shares" },
-  { s: "AZI", n: "Autozi Internet Technology (Global) Ltd." },
-  { s: "AZIO", n: "Azio AI Holdings, Inc." },
-  { s: "AZN", n: "AstraZeneca PLC Ordinary Shares" },
-  { s: "AZO", n: "AutoZone, Inc. Common Stock" },
-  { s: "AZTA", n: "Azenta, Inc." },
-  { s: "AZTR", n: "Azitra Inc Common Stock" },
-  { s: "AZUL", n: "Azul S.A. American Depositary Shares, each representing two (2) Common Shares" },
-  { s: "AZZ", n: "AZZ Inc." },
-  { s: "B", n: "Barrick Mining Corporation Common Shares" },
-  { s: "BA", n: "Boeing Company (The) Common Stock" },
-  { s: "BABA", n: "Alibaba Group Holding Limited American Depositary Shares each representing eight Ordinary share" },
-  { s: "BAC", n: "Bank of America Corporation Common Stock" },
-  { s: "BAER", n: "Bridger Aerospace Group Holdings, Inc." },
-  { s: "BAFN", n: "BayFirst Financial Corp." },
-  { s: "BAH", n: "Booz Allen Hamilton Holding Corporation Common Stock" },
-  { s: "BALL", n: "Ball Corporation Common Stock" },
-  { s: "BALY", n: "Bally's Corporation Common Stock" },
-  { s: "BAM", n: "Brookfield Asset Management Inc Class A Limited Voting Shares" },
-  { s: "BANC", n: "Banc of California, Inc. Common Stock" },
-  { s: "BAND", n: "Bandwidth Inc." },
-  { s: "BANF", n: "BancFirst Corporation" },
-  { s: "BANL", n: "CBL International Limited" },
-  { s: "BANR", n: "Banner Corporation" },
-  { s: "BAOS", n: "Baosheng Media Group Holdings Limited" },
-  { s: "BAP", n: "Credicorp Ltd. Common Stock" },
-  { s: "BARK", n: "BARK, Inc. Class A Common Stock" },
-  { s: "BATL", n: "Battalion Oil Corporation Common Stock" },
-  { s: "BAX", n: "Baxter International Inc. Common Stock" },
-  { s: "BB", n: "BlackBerry Limited Common Stock" },
-  { s: "BBAI", n: "BigBear.ai, Inc. Common Stock" },
-  { s: "BBAR", n: "Banco BBVA Argentina S.A. ADS" },
-  { s: "BBBY", n: "Bed Bath & Beyond, Inc. Common Stock" },
-  { s: "BBCP", n: "Concrete Pumping Holdings, Inc." },
-  { s: "BBD", n: "Banco Bradesco Sa American Depositary Shares" },
-  { s: "BBDC", n: "Barings BDC, Inc. Common Stock" },
-  { s: "BBDO", n: "Banco Bradesco Sa American Depositary Shares (each representing one Common Share)" },
-  { s: "BBGI", n: "Beasley Broadcast Group, Inc." },
-  { s: "BBIO", n: "BridgeBio Pharma, Inc." },
-  { s: "BBLG", n: "Bone Biologics Corp" },
-  { s: "BBLGW", n: "Bone Biologics Corp - warrants" },
-  { s: "BBNX", n: "Beta Bionics, Inc." },
-  { s: "BBOT", n: "BridgeBio Oncology Therapeutics, Inc." },
-  { s: "BBSI", n: "Barrett Business Services, Inc." },
-  { s: "BBT", n: "Beacon Financial Corporation Common stock" },
-  { s: "BBUC", n: "Brookfield Business Corporation Class A Subordinate Voting Shares" },
-  { s: "BBVA", n: "Banco Bilbao Vizcaya Argentaria S.A. Common Stock" },
-  { s: "BBW", n: "Build-A-Bear Workshop, Inc. Common Stock" },
-  { s: "BBWI", n: "Bath & Body Works, Inc." },
-  { s: "BBY", n: "Best Buy Co., Inc. Common Stock" },
-  { s: "BC", n: "Brunswick Corporation Common Stock" },
-  { s: "BCAB", n: "BioAtla, Inc." },
-  { s: "BCAL", n: "California BanCorp" },
-  { s: "BCAX", n: "Bicara Therapeutics Inc." },
-  { s: "BCBP", n: "BCB Bancorp, Inc. (NJ)" },
-  { s: "BCC", n: "Boise Cascade, L.L.C. Common Stock" },
-  { s: "BCDA", n: "BioCardia, Inc." },
-  { s: "BCE", n: "BCE, Inc. Common Stock" },
-  { s: "BCG", n: "Binah Capital Group, Inc." },
-  { s: "BCGWW", n: "Binah Capital Group, Inc. - Warrants" },
-  { s: "BCH", n: "Banco De Chile ADS" },
-  { s: "BCHT", n: "Birchtech Corp. Common Stock" },
-  { s: "BCML", n: "BayCom Corp" },
-  { s: "BCO", n: "Brinks Company (The) Common Stock" },
-  { s: "BCPC", n: "Balchem Corporation" },
-  { s: "BCRX", n: "BioCryst Pharmaceuticals, Inc." },
-  { s: "BCS", n: "Barclays PLC Common Stock" },
-  { s: "BCSF", n: "Bain Capital Specialty Finance, Inc. Common Stock" },
-  { s: "BCSS", n: "Bain Capital GSS Investment Corp. Class A Ordinary Shares" },
-  { s: "BCTX", n: "BriaCell Therapeutics Corp. - Common Shares" },
-  { s: "BCTXL", n: "BriaCell Therapeutics Corp. - Warrants" },
-  { s: "BCX", n: "BlackRock Resources Common Shares of Beneficial Interest" },
-  { s: "BCYC", n: "Bicycle Therapeutics plc" },
-  { s: "BDC", n: "Belden Inc Common Stock" },
-  { s: "BDCI", n: "BTC Development Corp." },
-  { s: "BDL", n: "Flanigan's Enterprises, Inc. Common Stock" },
-  { s: "BDMD", n: "Baird Medical Investment Holdings Ltd - Ordinary Share" },
-  { s: "BDRX", n: "Biodexa Pharmaceuticals plc" },
-  { s: "BDSX", n: "Biodesix, Inc." },
-  { s: "BDTX", n: "Black Diamond Therapeutics, Inc." },
-  { s: "BDX", n: "Becton, Dickinson and Company Common Stock" },
-  { s: "BE", n: "Bloom Energy Corporation Class A Common Stock" },
-  { s: "BEAM", n: "Beam Therapeutics Inc." },
-  { s: "BEAT", n: "Heartbeam, Inc." },
-  { s: "BEBE", n: "TGE Value Creative Solutions Corp Class A Ordinary Shares" },
-  { s: "BEEM", n: "Beam Global" },
-  { s: "BEEP", n: "Mobile Infrastructure Corporation" },
-  { s: "BEKE", n: "KE Holdings Inc American Depositary Shares (each representing three Class A Ordinary Shares)" },
-  { s: "BELFA", n: "Bel Fuse Inc." },
-  { s: "BELFB", n: "Bel Fuse Inc." },
-  { s: "BEN", n: "Franklin Resources, Inc. Common Stock" },
-  { s: "BENF", n: "Beneficient" },
-  { s: "BEP", n: "Brookfield Renewable Partners L.P. Limited Partnership Units" },
-  { s: "BEPC", n: "Brookfield Renewable Corporation Brookfield Renewable Corporation Class A Subordinate Voting Shares" },
-  { s: "BESS", n: "Bimergen Energy Corporation Common Stock" },
-  { s: "BETA", n: "Beta Technologies, Inc. Class A Common Stock" },
-  { s: "BETR", n: "Better Home & Finance Holding Company" },
-  { s: "BF-A", n: "Brown Forman Inc Class A Common Stock" },
-  { s: "BF-B", n: "Brown Forman Inc Class B Common Stock" },
-  { s: "BFAM", n: "Bright Horizons Family Solutions Inc. Common Stock" },
-  { s: "BFC", n: "Bank First Corporation" },
-  { s: "BFH", n: "Bread Financial Holdings, Inc. Common Stock" },
-  { s: "BFLY", n: "Butterfly Network, Inc. Class A Common Stock" },
-  { s: "BFRG", n: "Bullfrog AI Holdings, Inc." },
-  { s: "BFRGW", n: "Bullfrog AI Holdings, Inc. - Warrants" },
-  { s: "BFRI", n: "Biofrontera Inc." },
-  { s: "BFRIW", n: "Biofrontera Inc. - Warrants" },
-  { s: "BFS", n: "Saul Centers, Inc. Common Stock" },
-  { s: "BFST", n: "Business First Bancshares, Inc." },
-  { s: "BG", n: "Bunge Limited Common Shares" },
-  { s: "BGC", n: "BGC Group, Inc." },
-  { s: "BGDE", n: "Big Digital Energy, Inc." },
-  { s: "BGI", n: "Birks Group Inc. Common Stock" },
-  { s: "BGIN", n: "Bgin Blockchain Limited" },
-  { s: "BGL", n: "Blue Gold Limited" },
-  { s: "BGLC", n: "BioNexus Gene Lab Corp" },
-  { s: "BGM", n: "BGM Group Ltd." },
-  { s: "BGMS", n: "Bio Green Med Solution, Inc." },
-  { s: "BGS", n: "B&G Foods, Inc. Common Stock" },
-  { s: "BGSF", n: "BGSF, Inc. Common Stock" },
-  { s: "BGSI", n: "Boyd Group Services Inc. Common Shares" },
-  { s: "BH", n: "Biglari Holdings Inc. Class B Common Stock" },
-  { s: "BH-A", n: "Biglari Holdings Inc. Class A Common Stock" },
-  { s: "BHB", n: "Bar Harbor Bankshares, Inc. Common Stock" },
-  { s: "BHC", n: "Bausch Health Companies Inc. Common Stock" },
-  { s: "BHE", n: "Benchmark Electronics, Inc. Common Stock" },
-  { s: "BHF", n: "Brighthouse Financial, Inc." },
-  { s: "BHFAL", n: "Brighthouse Financial, Inc. - Junior Subordinated Debentures due 2058" },
-  { s: "BHP", n: "BHP Group Limited American Depositary Shares (Each representing two Ordinary Shares)" },
-  { s: "BHR", n: "Braemar Hotels & Resorts Inc. Common Stock" },
-  { s: "BHRB", n: "Burke & Herbert Financial Services Corp." },
-  { s: "BHST", n: "BioHarvest Sciences Inc." },
-  { s: "BHVN", n: "Biohaven Ltd. Common Shares" },
-  { s: "BIAF", n: "bioAffinity Technologies, Inc." },
-  { s: "BIDU", n: "Baidu, Inc." },
-  { s: "BIIB", n: "Biogen Inc." },
-  { s: "BILI", n: "Bilibili Inc." },
-  { s: "BILL", n: "BILL Holdings, Inc. Common Stock" },
-  { s: "BIO", n: "Bio-Rad Laboratories, Inc. Class A Common Stock" },
-  { s: "BIO-B", n: "Bio-Rad Laboratories, Inc. Class B Common Stock" },
-  { s: "BIOA", n: "BioAge Labs, Inc." },
-  { s: "BIOX", n: "Bioceres Crop Solutions Corp." },
-  { s: "BIPC", n: "Brookfield Infrastructure Corporation Brookfield Infrastructure Corporation" },
-  { s: "BIRD", n: "Smartbird, Inc." },
-  { s: "BIRK", n: "Birkenstock Holding plc Ordinary Shares" },
-  { s: "BIVI", n: "BioVie Inc." },
-  { s: "BIYA", n: "Baiya International Group Inc." },
-  { s: "BJ", n: "BJ's Wholesale Club Holdings, Inc. Common Stock" },
-  { s: "BJDX", n: "Bluejay Diagnostics, Inc." },
-  { s: "BJRI", n: "BJ's Restaurants, Inc." },
-  { s: "BKD", n: "Brookdale Senior Living Inc. Common Stock" },
-  { s: "BKE", n: "Buckle, Inc. (The) Common Stock" },
-  { s: "BKH", n: "Black Hills Corporation Common Stock" },
-  { s: "BKKT", n: "Bakkt, Inc. Class A Common Stock" },
-  { s: "BKNG", n: "Booking Holdings Inc." },
-  { s: "BKR", n: "Baker Hughes Company" },
-  { s: "BKSY", n: "BlackSky Technology Inc. Class A Common Stock" },
-  { s: "BKTI", n: "BK Technologies Corporation Common Stock" },
-  { s: "BKU", n: "BankUnited, Inc. Common Stock" },
-  { s: "BKV", n: "BKV Corporation Common Stock" },
-  { s: "BKYI", n: "BIO-key International, Inc." },
-  { s: "BL", n: "BlackLine, Inc." },
-  { s: "BLBD", n: "Blue Bird Corporation" },
-  { s: "BLCO", n: "Bausch + Lomb Corporation Common Shares" },
-  { s: "BLDP", n: "Ballard Power Systems, Inc. - Common Shares" },
-  { s: "BLDR", n: "Builders FirstSource, Inc. Common Stock" },
-  { s: "BLFS", n: "BioLife Solutions, Inc." },
-  { s: "BLIN", n: "Bridgeline Digital, Inc." },
-  { s: "BLIV", n: "BeLive Holdings" },
-  { s: "BLK", n: "BlackRock, Inc. Common Stock" },
-  { s: "BLKB", n: "Blackbaud, Inc." },
-  { s: "BLLN", n: "BillionToOne, Inc." },
-  { s: "BLMN", n: "Bloomin' Brands, Inc." },
-  { s: "BLND", n: "Blend Labs, Inc. Class A Common Stock" },
-  { s: "BLNE", n: "Beeline Holdings, Inc." },
-  { s: "BLNK", n: "Blink Charging Co." },
-  { s: "BLRX", n: "BioLineRx Ltd." },
-  { s: "BLSH", n: "Bullish Ordinary Shares" },
-  { s: "BLTE", n: "Belite Bio, Inc" },
-  { s: "BLX", n: "Bladex, Inc. Class E Common Stock" },
-  { s: "BLZE", n: "Backblaze, Inc." },
-  { s: "BMBL", n: "Bumble Inc." },
-  { s: "BMEA", n: "Biomea Fusion, Inc." },
-  { s: "BMGL", n: "Basel Medical Group Ltd" },
-  { s: "BMHL", n: "Bluemount Holdings Limited" },
-  { s: "BMI", n: "Badger Meter, Inc. Common Stock" },
-  { s: "BMM", n: "Blue Moon Metals Inc. - Common Shares" },
-  { s: "BMNR", n: "BitMine Immersion Technologies, Inc. Common Stock" },
-  { s: "BMO", n: "Bank Of Montreal Common Stock" },
-  { s: "BMR", n: "Beamr Imaging Ltd. - Ordinary Share" },
-  { s: "BMRA", n: "Biomerica, Inc." },
-  { s: "BMRC", n: "Bank of Marin Bancorp" },
-  { s: "BMRN", n: "BioMarin Pharmaceutical Inc." },
-  { s: "BMY", n: "Bristol-Myers Squibb Company Common Stock" },
-  { s: "BN", n: "Brookfield Corporation Class A Limited Voting Shares" },
-  { s: "BNAI", n: "Brand Engagement Network Inc." },
-  { s: "BNC", n: "CEA Industries Inc." },
-  { s: "BNCWZ", n: "CEA Industries Inc. - Warrants" },
-  { s: "BNED", n: "Barnes & Noble Education, Inc Common Stock" },
-  { s: "BNGO", n: "Bionano Genomics, Inc." },
-  { s: "BNKK", n: "Bonk, Inc." },
-  { s: "BNL", n: "Broadstone Net Lease, Inc. Common Stock" },
-  { s: "BNR", n: "Burning Rock Biotech Limited" },
-  { s: "BNRG", n: "Brenmiller Energy Ltd" },
-  { s: "BNS", n: "Bank Nova Scotia Halifax Pfd 3 Ordinary Shares" },
-  { s: "BNT", n: "Brookfield Wealth Solutions Ltd. Class A Exchangeable Limited Voting Shares" },
-  { s: "BNTC", n: "Benitec Biopharma Inc." },
-  { s: "BNTX", n: "BioNTech SE" },
-  { s: "BNY", n: "The Bank of New York Mellon Corporation Common Stock" },
-  { s: "BNZI", n: "Banzai International, Inc." },
-  { s: "BOBS", n: "Bob's Discount Furniture, Inc. Common Stock" },
-  { s: "BOC", n: "Boston Omaha Corporation Class A Common Stock" },
-  { s: "BODI", n: "The Beachbody Company, Inc." },
-  { s: "BOF", n: "BranchOut Food Inc." },
-  { s: "BOH", n: "Bank of Hawaii Corporation Common Stock" },
-  { s: "BOKF", n: "BOK Financial Corporation" },
-  { s: "BOLD", n: "Boundless Bio, Inc." },
-  { s: "BOLT", n: "Bolt Biotherapeutics, Inc." },
-  { s: "BON", n: "Bon Natural Life Limited" },
-  { s: "BOOM", n: "DMC Global Inc." },
-  { s: "BOOT", n: "Boot Barn Holdings, Inc. Common Stock" },
-  { s: "BORR", n: "Borr Drilling Limited Common Shares" },
-  { s: "BOSC", n: "B.O.S. Better Online Solutions" },
-  { s: "BOT", n: "RoboStrategy, Inc." },
-  { s: "BOTJ", n: "Bank of the James Financial Group, Inc." },
-  { s: "BOW", n: "Bowhead Specialty Holdings Inc. Common Stock" },
-  { s: "BOX", n: "Box, Inc. Class A Common Stock" },
-  { s: "BOXL", n: "Boxlight Corporation" },
-  { s: "BP", n: "BP p.l.c. Common Stock" },
-  { s: "BPOP", n: "Popular, Inc." },
-  { s: "BPRN", n: "Princeton Bancorp, Inc." },
-  { s: "BQ", n: "Boqii Holding Limited Class A Ordinary Shares" },
-  { s: "BR", n: "Broadridge Financial Solutions, Inc. Common Stock" },
-  { s: "BRAG", n: "Bragg Gaming Group Inc. - Common Shares" },
-  { s: "BRAI", n: "Braiin Limited" },
-  { s: "BRBI", n: "BRBI BR Partners S.A. - ADSs" },
-  { s: "BRBR", n: "BellRing Brands, Inc. Common Stock" },
-  { s: "BRBS", n: "Blue Ridge Bankshares, Inc. Common Stock" },
-  { s: "BRC", n: "Brady Corporation Common Stock" },
-  { s: "BRCB", n: "Black Rock Coffee Bar, Inc." },
-  { s: "BRCC", n: "BRC Inc. Class A Common Stock" },
-  { s: "BRFH", n: "Barfresh Food Group Inc." },
-  { s: "BRIA", n: "BrilliA Inc Class A Ordinary Shares" },
-  { s: "BRID", n: "Bridgford Foods Corporation" },
-  { s: "BRK-A", n: "Berkshire Hathaway Inc. Common Stock" },
-  { s: "BRK-B", n: "Berkshire Hathaway Inc. New Common Stock" },
-  { s: "BRKR", n: "Bruker Corporation" },
-  { s: "BRLS", n: "Borealis Foods Inc." },
-  { s: "BRLT", n: "Brilliant Earth Group, Inc." },
-  { s: "BRN", n: "Barnwell Industries, Inc. Common Stock" },
-  { s: "BRNS", n: "Barinthus Biotherapeutics plc" },
-  { s: "BRO", n: "Brown & Brown, Inc. Common Stock" },
-  { s: "BROS", n: "Dutch Bros Inc. Class A Common Stock" },
-  { s: "BRR", n: "ProCap Financial, Inc." },
-  { s: "BRSL", n: "Brightstar Lottery PLC Trading under the Legal Name to begin at the market open on July 21, 2025. Ordinary Shares" },
-  { s: "BRSP", n: "BrightSpire Capital, Inc. Class A Common Stock" },
-  { s: "BRT", n: "BRT Apartments Corp. (MD) Common Stock" },
-  { s: "BRTX", n: "BioRestorative Therapies, Inc." },
-  { s: "BRUN", n: "Boost Run Inc." },
-  { s: "BRX", n: "Brixmor Property Group Inc. Common Stock" },
-  { s: "BRZE", n: "Braze, Inc." },
-  { s: "BSAC", n: "Banco Santander - Chile ADS" },
-  { s: "BSBK", n: "Bogota Financial Corp." },
-  { s: "BSET", n: "Bassett Furniture Industries, Incorporated" },
-  { s: "BSIN", n: "Big Sky Industrial Inc." },
-  { s: "BSM", n: "Black Stone Minerals, L.P. Common units representing limited partner interests" },
-  { s: "BSP", n: "Bending Spoons S.p.A." },
-  { s: "BSRR", n: "Sierra Bancorp" },
-  { s: "BSVN", n: "Bank7 Corp." },
-  { s: "BSX", n: "Boston Scientific Corporation Common Stock" },
-  { s: "BSY", n: "Bentley Systems, Incorporated" },
-  { s: "BTAI", n: "BioXcel Therapeutics, Inc." },
-  { s: "BTBD", n: "BT Brands, Inc." },
-  { s: "BTBT", n: "Bit Digital, Inc. - Ordinary Share" },
-  { s: "BTCS", n: "BTCS Inc." },
-  { s: "BTCT", n: "BTC Digital Ltd." },
-  { s: "BTDR", n: "Bitdeer Technologies Group" },
-  { s: "BTE", n: "Baytex Energy Corp Common Shares" },
-  { s: "BTG", n: "B2Gold Corp Common shares (Canada)" },
-  { s: "BTGO", n: "BitGo Holdings, Inc. Class A Common Stock" },
-  { s: "BTMD", n: "Biote Corp." },
-  { s: "BTOC", n: "Armlogi Holding Corp." },
-  { s: "BTOG", n: "Bit Origin Limited" },
-  { s: "BTQ", n: "BTQ Technologies Corp." },
-  { s: "BTSG", n: "BrightSpring Health Services, Inc." },
-  { s: "BTTC", n: "Black Titan Corp" },
-  { s: "BTU", n: "Peabody Energy Corporation Common Stock" },
-  { s: "BUDA", n: "Buda Juice, Inc. Common Stock" },
-  { s: "BULL", n: "Webull Corporation" },
-  { s: "BULLW", n: "Webull Corporation - Warrants" },
-  { s: "BUR", n: "Burford Capital Limited Ordinary Shares" },
-  { s: "BURL", n: "Burlington Stores, Inc. Common Stock" },
-  { s: "BURU", n: "Nuburu, Inc. Common Stock" },
-  { s: "BUSE", n: "First Busey Corporation" },
-  { s: "BUUU", n: "BUUU Group Limited" },
-  { s: "BV", n: "BrightView Holdings, Inc. Common Stock" },
-  { s: "BVC", n: "BitVentures Limited - Ordinary Share" },
-  { s: "BVFL", n: "BV Financial, Inc." },
-  { s: "BVN", n: "Buenaventura Mining Company Inc." },
-  { s: "BVS", n: "Bioventus Inc." },
-  { s: "BW", n: "Babcock & Wilcox Enterprises, Inc. Common Stock" },
-  { s: "BWA", n: "BorgWarner Inc. Common Stock" },
-  { s: "BWAY", n: "BrainsWay Ltd." },
-  { s: "BWB", n: "Bridgewater Bancshares, Inc." },
-  { s: "BWEN", n: "Broadwind, Inc." },
-  { s: "BWFG", n: "Bankwell Financial Group, Inc." },
-  { s: "BWIN", n: "The Baldwin Insurance Group, Inc." },
-  { s: "BWLP", n: "BW LPG Limited Common Shares" },
-  { s: "BWMN", n: "Bowman Consulting Group Ltd." },
-  { s: "BWMX", n: "Betterware de Mexico, S.A.P.I. de C.V. Ordinary Shares" },
-  { s: "BWXT", n: "BWX Technologies, Inc. Common Stock" },
-  { s: "BX", n: "Blackstone Inc. Common Stock" },
-  { s: "BXC", n: "Bluelinx Holdings Inc. Common Stock" },
-  { s: "BXP", n: "BXP, Inc. Common Stock" },
-  { s: "BY", n: "Byline Bancorp, Inc. Common Stock" },
-  { s: "BYAH", n: "Park Ha Biological Technology Co., Ltd." },
-  { s: "BYD", n: "Boyd Gaming Corporation Common Stock" },
-  { s: "BYFC", n: "Broadway Financial Corporation" },
-  { s: "BYND", n: "Beyond Meat, Inc." },
-  { s: "BYRN", n: "Byrna Technologies, Inc." },
-  { s: "BYSI", n: "BeyondSpring, Inc." },
-  { s: "BZ", n: "KANZHUN LIMITED - American Depository Shares" },
-  { s: "BZAI", n: "Blaize Holdings, Inc." },
-  { s: "BZFD", n: "BuzzFeed, Inc." },
-  { s: "BZH", n: "Beazer Homes USA, Inc. Common Stock" },
-  { s: "BZUN", n: "Baozun Inc." },
-  { s: "C", n: "Citigroup, Inc. Common Stock" },
-  { s: "CAAP", n: "Corporacion America Airports SA Common Shares" },
-  { s: "CAAS", n: "China Automotive Systems, Inc. - Ordinary Share" },
-  { s: "CABA", n: "Cabaletta Bio, Inc." },
-  { s: "CABO", n: "Cable One, Inc. Common Stock" },
-  { s: "CABR", n: "Caring Brands, Inc." },
-  { s: "CAC", n: "Camden National Corporation" },
-  { s: "CACC", n: "Credit Acceptance Corporation" },
-  { s: "CACI", n: "CACI International, Inc. Class A Common Stock" },
-  { s: "CADL", n: "Candel Therapeutics, Inc." },
-  { s: "CAE", n: "CAE Inc. Ordinary Shares" },
-  { s: "CAES", n: "Cantor Equity Partners VII, Inc." },
-  { s: "CAG", n: "ConAgra Brands, Inc. Common Stock" },
-  { s: "CAH", n: "Cardinal Health, Inc. Common Stock" },
-  { s: "CAI", n: "Caris Life Sciences, Inc." },
-  { s: "CAKE", n: "The Cheesecake Factory Incorporated" },
-  { s: "CAL", n: "Caleres, Inc. Common Stock" },
-  { s: "CALC", n: "CalciMedica, Inc." },
-  { s: "CALM", n: "Cal-Maine Foods, Inc." },
-  { s: "CALX", n: "Calix, Inc Common Stock" },
-  { s: "CALY", n: "Callaway Golf Company Common Stock" },
-  { s: "CAMP", n: "CAMP4 Therapeutics Corporation" },
-  { s: "CAMT", n: "Camtek Ltd." },
-  { s: "CAN", n: "Canaan Inc." },
-  { s: "CANF", n: "Can-Fite Biopharma Ltd American Depositary Shares, each representing two (2) Ordinary Shares" },
-  { s: "CANG", n: "Cango Inc. Class A Ordinary Shares" },
-  { s: "CAPR", n: "Capricor Therapeutics, Inc." },
-  { s: "CAPS", n: "Capstone Holding Corp." },
-  { s: "CAR", n: "Avis Budget Group, Inc." },
-  { s: "CARE", n: "Carter Bankshares, Inc." },
-  { s: "CARG", n: "CarGurus, Inc." },
-  { s: "CARL", n: "Carlsmed, Inc." },
-  { s: "CARR", n: "Carrier Global Corporation Common Stock" },
-  { s: "CARS", n: "Cars.com Inc. Common Stock" },
-  { s: "CART", n: "Maplebear Inc." },
-  { s: "CASH", n: "Pathward Financial, Inc." },
-  { s: "CASS", n: "Cass Information Systems, Inc" },
-  { s: "CAST", n: "FreeCast, Inc." },
-  { s: "CASY", n: "Caseys General Stores, Inc." },
-  { s: "CAT", n: "Caterpillar, Inc. Common Stock" },
-  { s: "CATO", n: "Cato Corporation (The) Class A Common Stock" },
-  { s: "CATX", n: "Perspective Therapeutics, Inc. Common Stock" },
-  { s: "CATY", n: "Cathay General Bancorp" },
-  { s: "CAVA", n: "CAVA Group, Inc. Common Stock" },
-  { s: "CB", n: "Chubb Limited Common Stock" },
-  { s: "CBAN", n: "Colony Bankcorp, Inc. Common Stock" },
-  { s: "CBAT", n: "CBAK Energy Technology Limited" },
-  { s: "CBC", n: "Central Bancompany, Inc." },
-  { s: "CBFV", n: "CB Financial Services, Inc." },
-  { s: "CBIO", n: "Crescent Biopharma, Inc." },
-  { s: "CBK", n: "Commercial Bancgroup, Inc." },
-  { s: "CBL", n: "CBL & Associates Properties, Inc. Common Stock" },
-  { s: "CBLL", n: "CeriBell, Inc." },
-  { s: "CBNA", n: "Chain Bridge Bancorp, Inc. Class A Common Stock" },
-  { s: "CBNK", n: "Capital Bancorp, Inc." },
-  { s: "CBOE", n: "Cboe Global Markets, Inc. Common Stock" },
-  { s: "CBRE", n: "CBRE Group Inc Common Stock Class A" },
-  { s: "CBRL", n: "Cracker Barrel Old Country Store, Inc." },
-  { s: "CBRS", n: "Cerebras Systems Inc." },
-  { s: "CBSH", n: "Commerce Bancshares, Inc." },
-  { s: "CBT", n: "Cabot Corporation Common Stock" },
-  { s: "CBU", n: "Community Financial System, Inc. Common Stock" },
-  { s: "CBUS", n: "Cibus, Inc." },
-  { s: "CBZ", n: "CBIZ, Inc. Common Stock" },
-  { s: "CC", n: "Chemours Company (The) Common Stock" },
-  { s: "CCAP", n: "Crescent Capital BDC, Inc." },
-  { s: "CCB", n: "Coastal Financial Corporation" },
-  { s: "CCBG", n: "Capital City Bank Group" },
-  { s: "CCC", n: "CCC Intelligent Solutions Holdings Inc." },
-  { s: "CCCC", n: "C4 Therapeutics, Inc." },
-  { s: "CCCTU", n: "Columbus Circle Capital Corp III - Units" },
-  { s: "CCEC", n: "Capital Clean Energy Carriers Corp. - Common Share" },
-  { s: "CCEL", n: "Cryo-Cell International, Inc. Common Stock" },
-  { s: "CCEP", n: "Coca-Cola Europacific Partners plc" },
-  { s: "CCG", n: "Cheche Group Inc." },
-  { s: "CCHH", n: "CCH Holdings Ltd" },
-  { s: "CCI", n: "Crown Castle Inc. Common Stock" },
-  { s: "CCIX", n: "Churchill Capital Corp IX" },
-  { s: "CCJ", n: "Cameco Corporation Common Stock" },
-  { s: "CCK", n: "Crown Holdings, Inc." },
-  { s: "CCL", n: "Carnival Corporation Ltd. Common Shares" },
-  { s: "CCLD", n: "CareCloud, Inc." },
-  { s: "CCM", n: "Concord Medical Services Holdings Limited American Depositary Shares (Each represents thirty (30) Class A ordinary shares)" },
-  { s: "CCNE", n: "CNB Financial Corporation" },
-  { s: "CCO", n: "Clear Channel Outdoor Holdings, Inc. Common Stock" },
-  { s: "CCOI", n: "Cogent Communications Holdings, Inc." },
-  { s: "CCRN", n: "Cross Country Healthcare, Inc." },
-  { s: "CCS", n: "Century Communities, Inc. Common Stock" },
-  { s: "CCSI", n: "Consensus Cloud Solutions, Inc." },
-  { s: "CCTG", n: "CCSC Technology International Holdings Limited" },
-  { s: "CCU", n: "Compania Cervecerias Unidas, S.A. Common Stock" },
-  { s: "CCXI", n: "Churchill Capital Corp XI" },
-  { s: "CCXIU", n: "Churchill Capital Corp XI - Units" },
-  { s: "CCXIW", n: "Churchill Capital Corp XI - Warrants" },
-  { s: "CCZ", n: "Comcast Holdings ZONES" },
-  { s: "CD", n: "Chaince Digital Holdings Inc. - American Ordinary Shares" },
-  { s: "CDE", n: "Coeur Mining, Inc. Common Stock" },
-  { s: "CDIO", n: "Cardio Diagnostics Holdings Inc." },
-  { s: "CDLR", n: "Cadeler A/S American Depositary Share (each representing four (4) Ordinary Shares)" },
-  { s: "CDLX", n: "Cardlytics, Inc." },
-  { s: "CDNA", n: "CareDx, Inc." },
-  { s: "CDNL", n: "Cardinal Infrastructure Group Inc." },
-  { s: "CDNS", n: "Cadence Design Systems, Inc." },
-  { s: "CDP", n: "COPT Defense Properties Common Shares of Beneficial Interest" },
-  { s: "CDRE", n: "Cadre Holdings, Inc. Common Stock" },
-  { s: "CDRO", n: "Codere Online Luxembourg, S.A." },
-  { s: "CDROW", n: "Codere Online Luxembourg, S.A. - Warrants" },
-  { s: "CDT", n: "CDT Equity Inc." },
-  { s: "CDTG", n: "CDT Environmental Technology Investment Holdings Limited" },
-  { s: "CDW", n: "CDW Corporation" },
-  { s: "CDXS", n: "Codexis, Inc." },
-  { s: "CDZI", n: "Cadiz, Inc." },
-  { s: "CDZIP", n: "Cadiz, Inc. - Depositary Shares" },
-  { s: "CE", n: "Celanese Corporation Common Stock" },
-  { s: "CECO", n: "CECO Environmental Corp." },
-  { s: "CEG", n: "Constellation Energy Corporation" },
-  { s: "CELC", n: "Celcuity Inc." },
-  { s: "CELH", n: "Celsius Holdings, Inc." },
-  { s: "CELU", n: "Celularity Inc." },
-  { s: "CELZ", n: "Creative Medical Technology Holdings, Inc." },
-  { s: "CENN", n: "Cenntro Inc." },
-  { s: "CENT", n: "Central Garden & Pet Company" },
-  { s: "CENTA", n: "Central Garden & Pet Company" },
-  { s: "CENX", n: "Century Aluminum Company" },
-  { s: "CEPF", n: "Cantor Equity Partners IV, Inc." },
-  { s: "CEPL", n: "Capstone Energy Plus, Inc." },
-  { s: "CEPO", n: "Cantor Equity Partners I, Inc." },
-  { s: "CEPS", n: "Cantor Equity Partners VI, Inc." },
-  { s: "CEPU", n: "Central Puerto S.A. American Depositary Shares (each represents ten Common Shares)" },
-  { s: "CEPV", n: "Cantor Equity Partners V, Inc." },
-  { s: "CERS", n: "Cerus Corporation" },
-  { s: "CERT", n: "Certara, Inc." },
-  { s: "CET", n: "Central Securities Corporation Common Stock" },
-  { s: "CETX", n: "Cemtrex Inc." },
-  { s: "CETY", n: "Clean Energy Technologies, Inc." },
-  { s: "CEVA", n: "CEVA, Inc." },
-  { s: "CF", n: "CF Industries Holdings, Inc. Common Stock" },
-  { s: "CFBK", n: "CF Bankshares Inc." },
-  { s: "CFFI", n: "C&F Financial Corporation" },
-  { s: "CFFN", n: "Capitol Federal Financial, Inc." },
-  { s: "CFG", n: "Citizens Financial Group, Inc. Common Stock" },
-  { s: "CFR", n: "Cullen/Frost Bankers, Inc. Common Stock" },
-  { s: "CG", n: "The Carlyle Group Inc." },
-  { s: "CGAU", n: "Centerra Gold Inc. Common Shares" },
-  { s: "CGC", n: "Canopy Growth Corporation - Common Shares" },
-  { s: "CGCFU", n: "Cartesian Growth Corporation IV - Units" },
-  { s: "CGEM", n: "Cullinan Therapeutics, Inc." },
-  { s: "CGEN", n: "Compugen Ltd." },
-  { s: "CGNT", n: "Cognyte Software Ltd." },
-  { s: "CGNX", n: "Cognex Corporation" },
-  { s: "CGON", n: "CG Oncology, Inc." },
-  { s: "CGTL", n: "Creative Global Technology Holdings Limited" },
-  { s: "CGTX", n: "Cognition Therapeutics, Inc." },
-  { s: "CHA", n: "Chagee Holdings Limited" },
-  { s: "CHAI", n: "Core AI Holdings, Inc. - Common Shares" },
-  { s: "CHCI", n: "Comstock Holding Companies, Inc." },
-  { s: "CHCO", n: "City Holding Company" },
-  { s: "CHD", n: "Church & Dwight Company, Inc. Common Stock" },
-  { s: "CHDN", n: "Churchill Downs, Incorporated" },
-  { s: "CHE", n: "Chemed Corp" },
-  { s: "CHEF", n: "The Chefs' Warehouse, Inc." },
-  { s: "CHGG", n: "Chegg, Inc. Common Stock" },
-  { s: "CHH", n: "Choice Hotels International, Inc. Common Stock" },
-  { s: "CHKP", n: "Check Point Software Technologies Ltd." },
-  { s: "CHMG", n: "Chemung Financial Corp" },
-  { s: "CHMI", n: "Cherry Hill Mortgage Investment Corporation Common Stock" },
-  { s: "CHNR", n: "China Natural Resources, Inc. - Common Shares" },
-  { s: "CHOW", n: "ChowChow Cloud International Holdings Limited Ordinary Shares" },
-  { s: "CHPT", n: "ChargePoint Holdings, Inc. Common Stock" },
-  { s: "CHR", n: "Cheer Holding, Inc." },
-  { s: "CHRD", n: "Chord Energy Corporation" },
-  { s: "CHRN", n: "ChronoScale Holdings Corporation" },
-  { s: "CHRS", n: "Coherus Oncology, Inc." },
-  { s: "CHRW", n: "C.H. Robinson Worldwide, Inc." },
-  { s: "CHSN", n: "Chanson International Holding" },
-  { s: "CHT", n: "Chunghwa Telecom Co., Ltd." },
-  { s: "CHTR", n: "Charter Communications, Inc." },
-  { s: "CHWY", n: "Chewy, Inc. Class A Common Stock" },
-  { s: "CHYM", n: "Chime Financial, Inc." },
-  { s: "CI", n: "The Cigna Group Common Stock" },
-  { s: "CIA", n: "Citizens, Inc. Class A Common Stock ($1.00 Par)" },
-  { s: "CIEN", n: "Ciena Corporation Common Stock" },
-  { s: "CIFR", n: "Cipher Digital Inc." },
-  { s: "CIG", n: "Comp En De Mn Cemig ADS American Depositary Shares" },
-  { s: "CIGI", n: "Colliers International Group Inc. - Subordinate Voting Shares" },
-  { s: "CIIT", n: "Tianci International, Inc." },
-  { s: "CIM", n: "Chimera Investment Corporation Common Stock" },
-  { s: "CINF", n: "Cincinnati Financial Corporation" },
-  { s: "CING", n: "Cingulate Inc." },
-  { s: "CINGW", n: "Cingulate Inc. - Warrants" },
-  { s: "CINT", n: "CI&T Inc Class A Common Shares" },
-  { s: "CION", n: "CION Investment Corporation Common Stock" },
-  { s: "CIRC", n: "Circle8 Group, Inc." },
-  { s: "CISO", n: "CISO Global, Inc." },
-  { s: "CISS", n: "C3is Inc." },
-  { s: "CITR", n: "CitroTech Inc. Common Stock" },
-  { s: "CIVB", n: "Civista Bancshares, Inc." },
-  { s: "CIX", n: "CompX International Inc. Common Stock" },
-  { s: "CJMB", n: "Callan JMB Inc." },
-  { s: "CKX", n: "CKX Lands, Inc. Common Stock" },
-  { s: "CL", n: "Colgate-Palmolive Company Common Stock" },
-  { s: "CLAR", n: "Clarus Corporation" },
-  { s: "CLB", n: "Core Laboratories Inc. Common Stock" },
-  { s: "CLBK", n: "Columbia Financial, Inc." },
-  { s: "CLBT", n: "Cellebrite DI Ltd." },
-  { s: "CLDI", n: "Calidi Biotherapeutics, Inc. Common Stock" },
-  { s: "CLDX", n: "Celldex Therapeutics, Inc." },
-  { s: "CLF", n: "Cleveland-Cliffs Inc. Common Stock" },
-  { s: "CLFD", n: "Clearfield, Inc." },
-  { s: "CLGN", n: "CollPlant Biotechnologies Ltd." },
-  { s: "CLH", n: "Clean Harbors, Inc. Common Stock" },
-  { s: "CLIK", n: "Click Holdings Limited - Ordinary Share" },
-  { s: "CLIR", n: "ClearSign Technologies Corporation" },
-  { s: "CLLS", n: "Cellectis S.A." },
-  { s: "CLMB", n: "Climb Global Solutions, Inc." },
-  { s: "CLMT", n: "Calumet, Inc" },
-  { s: "CLNE", n: "Clean Energy Fuels Corp." },
-  { s: "CLNN", n: "Clene Inc." },
-  { s: "CLOV", n: "Clover Health Investments, Corp." },
-  { s: "CLPR", n: "Clipper Realty Inc. Common Stock" },
-  { s: "CLPS", n: "CLPS Incorporation" },
-  { s: "CLPT", n: "ClearPoint Neuro Inc." },
-  { s: "CLRB", n: "Cellectar Biosciences, Inc." },
-  { s: "CLRO", n: "ClearOne, Inc." },
-  { s: "CLS", n: "Celestica, Inc. Common Stock" },
-  { s: "CLSK", n: "CleanSpark, Inc." },
-  { s: "CLST", n: "Catalyst Bancorp, Inc." },
-  { s: "CLVT", n: "Clarivate Plc Ordinary Shares" },
-  { s: "CLW", n: "Clearwater Paper Corporation Common Stock" },
-  { s: "CLWT", n: "Euro Tech Holdings Company Limited" },
-  { s: "CLX", n: "Clorox Company (The) Common Stock" },
-  { s: "CLYM", n: "Climb Bio, Inc." },
-  { s: "CM", n: "Canadian Imperial Bank of Commerce Common Stock" },
-  { s: "CMBT", n: "CMB.TECH NV Ordinary Shares" },
-  { s: "CMC", n: "Commercial Metals Company Common Stock" },
-  { s: "CMCL", n: "Caledonia Mining Corporation Plc Common Shares" },
-  { s: "CMCM", n: "Cheetah Mobile Inc. American Depositary Shares, each representing fifty (50) Class A Ordinary Shares" },
-  { s: "CMCO", n: "Columbus McKinnon Corporation" },
-  { s: "CMCSA", n: "Comcast Corporation" },
-  { s: "CMCT", n: "Creative Media" },
-  { s: "CMDB", n: "Costamare Bulkers Holdings Limited Common Stock" },
-  { s: "CME", n: "CME Group Inc." },
-  { s: "CMG", n: "Chipotle Mexican Grill, Inc. Common Stock" },
-  { s: "CMI", n: "Cummins Inc. Common Stock" },
-  { s: "CMII", n: "Columbus Circle Capital Corp II" },
-  { s: "CMMB", n: "Chemomab Therapeutics Ltd." },
-  { s: "CMND", n: "Clearmind Medicine Inc. - Common Shares" },
-  { s: "CMP", n: "Compass Minerals Intl Inc Common Stock" },
-  { s: "CMPR", n: "Cimpress plc" },
-  { s: "CMPS", n: "COMPASS Pathways Plc - American Depository Shares" },
-  { s: "CMPX", n: "Compass Therapeutics, Inc." },
-  { s: "CMRE", n: "Costamare Inc. Common Stock $0.0001 par value" },
-  { s: "CMS", n: "CMS Energy Corporation Common Stock" },
-  { s: "CMT", n: "Core Molding Technologies Inc Common Stock" },
-  { s: "CMTL", n: "Comtech Telecommunications Corp." },
-  { s: "CMTV", n: "Community Bancorp." },
-  { s: "CNA", n: "CNA Financial Corporation Common Stock" },
-  { s: "CNC", n: "Centene Corporation Common Stock" },
-  { s: "CNCK", n: "Coincheck Group N.V." },
-  { s: "CNCKW", n: "Coincheck Group N.V. - Warrants" },
-  { s: "CNDT", n: "Conduent Incorporated" },
-  { s: "CNET", n: "ZW Data Action Technologies Inc." },
-  { s: "CNEY", n: "CN Energy Group Inc." },
-  { s: "CNF", n: "CNFinance Holdings Limited American Depositary Shares, each representing two hundred (200) Ordinary Shares" },
-  { s: "CNH", n: "CNH Industrial N.V. Common Shares" },
-  { s: "CNI", n: "Canadian National Railway Company Common Stock" },
-  { s: "CNK", n: "Cinemark Holdings Inc Cinemark Holdings, Inc. Common Stock" },
-  { s: "CNL", n: "Collective Mining Ltd. Common Shares" },
-  { s: "CNM", n: "Core & Main, Inc. Class A Common Stock" },
-  { s: "CNMD", n: "CONMED Corporation Common Stock" },
-  { s: "CNNE", n: "Cannae Holdings, Inc. Common Stock" },
-  { s: "CNO", n: "CNO Financial Group, Inc. Common Stock" },
-  { s: "CNOB", n: "ConnectOne Bancorp, Inc." },
-  { s: "CNP", n: "CenterPoint Energy, Inc (Holding Co) Common Stock" },
-  { s: "CNQ", n: "Canadian Natural Resources Limited Common Stock" },
-  { s: "CNR", n: "Core Natural Resources, Inc. Common Stock" },
-  { s: "CNS", n: "Cohen & Steers Inc Common Stock" },
-  { s: "CNSP", n: "CNS Pharmaceuticals, Inc." },
-  { s: "CNTB", n: "Connect Biopharma Holdings Limited" },
-  { s: "CNTN", n: "Canton Strategic Holdings, Inc." },
-  { s: "CNTX", n: "Context Therapeutics Inc." },
-  { s: "CNTY", n: "Century Casinos, Inc." },
-  { s: "CNVS", n: "Cineverse Corp." },
-  { s: "CNX", n: "CNX Resources Corporation Common Stock" },
-  { s: "CNXC", n: "Concentrix Corporation" },
-  { s: "CNXN", n: "PC Connection, Inc." },
-  { s: "CNXU", n: "Conexeu Sciences Inc." },
-  { s: "COAG", n: "Hemab Therapeutics Holdings, Inc." },
-  { s: "COCH", n: "Envoy Medical, Inc." },
-  { s: "COCO", n: "The Vita Coco Company, Inc." },
-  { s: "COCP", n: "Cocrystal Pharma, Inc." },
-  { s: "CODA", n: "Coda Octopus Group, Inc." },
-  { s: "CODI", n: "D/B/A Compass Diversified Holdings Shares of Beneficial Interest" },
-  { s: "CODX", n: "Co-Diagnostics, Inc." },
-  { s: "COE", n: "51Talk Online Education Group American depositary shares, each representing 60 Class A ordinary shares" },
-  { s: "COF", n: "Capital One Financial Corporation Common Stock" },
-  { s: "COFS", n: "ChoiceOne Financial Services, Inc." },
-  { s: "COGT", n: "Cogent Biosciences, Inc." },
-  { s: "COHN", n: "Cohen & Company Inc." },
-  { s: "COHR", n: "Coherent Corp. Common Stock" },
-  { s: "COHU", n: "Cohu, Inc." },
-  { s: "COIN", n: "Coinbase Global, Inc." },
-  { s: "COKE", n: "Coca-Cola Consolidated, Inc." },
-  { s: "COLB", n: "Columbia Banking System, Inc." },
-  { s: "COLL", n: "Collegium Pharmaceutical, Inc." },
-  { s: "COLM", n: "Columbia Sportswear Company" },
-  { s: "COMP", n: "Compass, Inc. Class A Common Stock" },
-  { s: "CON", n: "Concentra Group Holdings Parent, Inc. Common Stock" },
-  { s: "COO", n: "The Cooper Companies, Inc." },
-  { s: "COOK", n: "Traeger, Inc. Common Stock" },
-  { s: "COOT", n: "Australian Oilseeds Holdings Limited" },
-  { s: "COP", n: "ConocoPhillips Common Stock" },
-  { s: "COPR", n: "Idaho Copper Corporation Common Stock" },
-  { s: "COR", n: "Cencora, Inc. Common Stock" },
-  { s: "CORT", n: "Corcept Therapeutics Incorporated" },
-  { s: "CORZ", n: "Core Scientific, Inc." },
-  { s: "CORZW", n: "Core Scientific, Inc. - Tranche 1 Warrants" },
-  { s: "CORZZ", n: "Core Scientific, Inc. - Tranche 2 Warrants" },
-  { s: "COSM", n: "Cosmos Health Inc." },
-  { s: "COSO", n: "CoastalSouth Bancshares, Inc. Common Stock" },
-  { s: "COST", n: "Costco Wholesale Corporation" },
-  { s: "COTY", n: "Coty Inc. Class A Common Stock" },
-  { s: "COUR", n: "Coursera, Inc. Common Stock" },
-  { s: "COYA", n: "Coya Therapeutics, Inc." },
-  { s: "CP", n: "Canadian Pacific Kansas City Limited Common Shares" },
-  { s: "CPA", n: "Copa Holdings, S.A. Class A Common Stock" },
-  { s: "CPAC", n: "Cementos Pacasmayo S.A.A. American Depositary Shares (Each representing five Common Shares)" },
-  { s: "CPAY", n: "Corpay, Inc. Common Stock" },
-  { s: "CPB", n: "The Campbell's Company" },
-  { s: "CPBI", n: "Central Plains Bancshares, Inc." },
-  { s: "CPF", n: "Central Pacific Financial Corp New" },
-  { s: "CPHC", n: "Canterbury Park Holding Corporation" },
-  { s: "CPHI", n: "China Pharma Holdings, Inc. Common Stock" },
-  { s: "CPIX", n: "Cumberland Pharmaceuticals Inc." },
-  { s: "CPK", n: "Chesapeake Utilities Corporation Common Stock" },
-  { s: "CPNG", n: "Coupang, Inc. Class A Common Stock" },
-  { s: "CPOP", n: "Pop Culture Group Co., Ltd" },
-  { s: "CPRI", n: "Capri Holdings Limited Ordinary Shares" },
-  { s: "CPRT", n: "Copart, Inc." },
-  { s: "CPS", n: "Cooper-Standard Holdings Inc. Common Stock" },
-  { s: "CPSH", n: "CPS Technologies Corp." },
-  { s: "CR", n: "Crane Company Common Stock" },
-  { s: "CRAI", n: "CRA International,Inc." },
-  { s: "CRBG", n: "Corebridge Financial Inc. Common Stock" },
-  { s: "CRBP", n: "Corbus Pharmaceuticals Holdings, Inc." },
-  { s: "CRBU", n: "Caribou Biosciences, Inc." },
-  { s: "CRC", n: "California Resources Corporation Common Stock" },
-  { s: "CRCL", n: "Circle Internet Group, Inc. Class A Common Stock" },
-  { s: "CRCT", n: "Cricut, Inc." },
-  { s: "CRD-A", n: "Crawford & Company Common Stock" },
-  { s: "CRD-B", n: "Crawford & Company Common Stock" },
-  { s: "CRDF", n: "Cardiff Oncology, Inc." },
-  { s: "CRDL", n: "Cardiol Therapeutics Inc." },
-  { s: "CRDO", n: "Credo Technology Group Holding Ltd" },
-  { s: "CRE", n: "Cre8 Enterprise Limited" },
-  { s: "CREG", n: "Smart Powerr Corp." },
-  { s: "CRESY", n: "Cresud S.A.C.I.F. y A." },
-  { s: "CREX", n: "Creative Realities, Inc." },
-  { s: "CRGO", n: "Freightos Limited" },
-  { s: "CRGOW", n: "Freightos Limited - Warrants" },
-  { s: "CRGY", n: "Crescent Energy Company Class A Common Stock" },
-  { s: "CRH", n: "CRH PLC Ordinary Shares" },
-  { s: "CRI", n: "Carter's, Inc. Common Stock" },
-  { s: "CRIS", n: "Curis, Inc." },
-  { s: "CRK", n: "Comstock Resources, Inc. Common Stock" },
-  { s: "CRL", n: "Charles River Laboratories International, Inc. Common Stock" },
-  { s: "CRM", n: "Salesforce, Inc. Common Stock" },
-  { s: "CRMD", n: "CorMedix Inc." },
-  { s: "CRML", n: "Critical Metals Corp." },
-  { s: "CRMLW", n: "Critical Metals Corp. - Warrants" },
-  { s: "CRMT", n: "America's Car-Mart, Inc." },
-  { s: "CRNC", n: "Cerence Inc." },
-  { s: "CRNT", n: "Ceragon Networks Ltd." },
-  { s: "CRNX", n: "Crinetics Pharmaceuticals, Inc." },
-  { s: "CRON", n: "Cronos Group Inc. - Common Share" },
-  { s: "CROX", n: "Crocs, Inc." },
-  { s: "CRS", n: "Carpenter Technology Corporation Common Stock" },
-  { s: "CRSP", n: "CRISPR Therapeutics AG - Common Shares" },
-  { s: "CRSR", n: "Corsair Gaming, Inc." },
-  { s: "CRTO", n: "Criteo S.A." },
-  { s: "CRUS", n: "Cirrus Logic, Inc." },
-  { s: "CRVL", n: "CorVel Corp." },
-  { s: "CRVO", n: "CervoMed Inc." },
-  { s: "CRVS", n: "Corvus Pharmaceuticals, Inc." },
-  { s: "CRWD", n: "CrowdStrike Holdings, Inc." },
-  { s: "CRWS", n: "Crown Crafts, Inc." },
-  { s: "CRWV", n: "CoreWeave, Inc." },
-  { s: "CSAI", n: "Cloudastructure, Inc." },
-  { s: "CSAN", n: "Cosan S.A. ADS" },
-  { s: "CSBR", n: "Champions Oncology, Inc." },
-  { s: "CSCO", n: "Cisco Systems, Inc." },
-  { s: "CSGP", n: "CoStar Group, Inc." },
-  { s: "CSHR", n: "CoinShares PLC" },
-  { s: "CSHRW", n: "CoinShares PLC - Warrants" },
-  { s: "CSIQ", n: "Canadian Solar Inc. - Common Shares" },
-  { s: "CSL", n: "Carlisle Companies Incorporated Common Stock" },
-  { s: "CSPI", n: "CSP Inc." },
-  { s: "CSQR", n: "Csquare, Inc. Common Stock" },
-  { s: "CSR", n: "D/B/A Centerspace Common Stock" },
-  { s: "CSTE", n: "Caesarstone Ltd." },
-  { s: "CSTL", n: "Castle Biosciences, Inc." },
-  { s: "CSTM", n: "Constellium SE Ordinary Shares (France)" },
-  { s: "CSV", n: "Carriage Services, Inc. Common Stock" },
-  { s: "CSW", n: "CSW Industrials, Inc. Common Stock" },
-  { s: "CSWC", n: "Capital Southwest Corporation" },
-  { s: "CSX", n: "CSX Corporation" },
-  { s: "CTAS", n: "Cintas Corporation" },
-  { s: "CTEV", n: "Claritev Corporation Class A Common Stock" },
-  { s: "CTGO", n: "Contango Silver & Gold Inc. Common Stock" },
-  { s: "CTKB", n: "Cytek Biosciences, Inc." },
-  { s: "CTM", n: "Castellum, Inc. Common Stock" },
-  { s: "CTMX", n: "CytomX Therapeutics, Inc." },
-  { s: "CTNM", n: "Contineum Therapeutics, Inc." },
-  { s: "CTNT", n: "Cheetah Net Supply Chain Service Inc." },
-  { s: "CTO", n: "CTO Realty Growth, Inc. Common Stock" },
-  { s: "CTOR", n: "Citius Oncology, Inc." },
-  { s: "CTOS", n: "Custom Truck One Source, Inc. Common Stock" },
-  { s: "CTRI", n: "Centuri Holdings, Inc. Common Stock" },
-  { s: "CTRM", n: "Castor Maritime Inc. - Common Shares" },
-  { s: "CTRN", n: "Citi Trends, Inc." },
-  { s: "CTS", n: "CTS Corporation Common Stock" },
-  { s: "CTSH", n: "Cognizant Technology Solutions Corporation" },
-  { s: "CTSO", n: "Cytosorbents Corporation" },
-  { s: "CTVA", n: "Corteva, Inc. Common Stock" },
-  { s: "CTW", n: "CTW" },
-  { s: "CTXR", n: "Citius Pharmaceuticals, Inc." },
-  { s: "CUB", n: "Lionheart Holdings" },
-  { s: "CUBE", n: "CubeSmart Common Shares" },
-  { s: "CUBI", n: "Customers Bancorp, Inc Common Stock" },
-  { s: "CUE", n: "Cue Biopharma, Inc." },
-  { s: "CULP", n: "Culp, Inc. - Common Shares" },
-  { s: "CUPR", n: "Cuprina Holdings (Cayman) Limited" },
-  { s: "CURB", n: "Curbline Properties Corp. Common Stock" },
-  { s: "CURI", n: "CuriosityStream Inc." },
-  { s: "CURR", n: "Currenc Group Inc." },
-  { s: "CURV", n: "Torrid Holdings Inc. Common Stock" },
-  { s: "CURX", n: "Curanex Pharmaceuticals Inc" },
-  { s: "CUZ", n: "Cousins Properties Incorporated Common Stock" },
-  { s: "CV", n: "CapsoVision, Inc." },
-  { s: "CVBF", n: "CVB Financial Corporation" },
-  { s: "CVCO", n: "Cavco Industries, Inc." },
-  { s: "CVE", n: "Cenovus Energy Inc Common Stock" },
-  { s: "CVEO", n: "Civeo Corporation (Canada) Common Shares" },
-  { s: "CVGI", n: "Commercial Vehicle Group, Inc." },
-  { s: "CVI", n: "CVR Energy Inc. Common Stock" },
-  { s: "CVKD", n: "Cadrenal Therapeutics, Inc." },
-  { s: "CVLG", n: "Covenant Logistics Group, Inc. Class A Common Stock" },
-  { s: "CVLT", n: "Commvault Systems, Inc." },
-  { s: "CVM", n: "Cel-Sci Corporation Common Stock" },
-  { s: "CVNA", n: "Carvana Co. Class A Common Stock" },
-  { s: "CVR", n: "Chicago Rivet & Machine Co. Common Stock" },
-  { s: "CVRX", n: "CVRx, Inc." },
-  { s: "CVS", n: "CVS Health Corporation Common Stock" },
-  { s: "CVSA", n: "Covista Inc. Common Shares" },
-  { s: "CVU", n: "CPI Aerostructures, Inc. Common Stock" },
-  { s: "CVV", n: "CVD Equipment Corporation" },
-  { s: "CVX", n: "Chevron Corporation Common Stock" },
-  { s: "CW", n: "Curtiss-Wright Corporation Common Stock" },
-  { s: "CWBC", n: "Community West Bancshares" },
-  { s: "CWCO", n: "Consolidated Water Co. Ltd." },
-  { s: "CWD", n: "CaliberCos Inc." },
-  { s: "CWEN", n: "Clearway Energy, Inc. Class C Common Stock" },
-  { s: "CWH", n: "Camping World Holdings, Inc. Class A Common Stock" },
-  { s: "CWK", n: "Cushman & Wakefield Ltd. Common Shares" },
-  { s: "CWST", n: "Casella Waste Systems, Inc." },
-  { s: "CWT", n: "California Water Service Group Common Stock" },
-  { s: "CXAI", n: "CXApp Inc." },
-  { s: "CXDO", n: "Crexendo, Inc." },
-  { s: "CXII", n: "Churchill Capital Corp XII" },
-  { s: "CXIIU", n: "Churchill Capital Corp XII - Units" },
-  { s: "CXIIW", n: "Churchill Capital Corp XII - Warrants" },
-  { s: "CXM", n: "Sprinklr, Inc. Class A Common Stock" },
-  { s: "CXT", n: "Crane NXT, Co. Common Stock" },
-  { s: "CXW", n: "CoreCivic, Inc. Common Stock" },
-  { s: "CYAB", n: "Cyabra, Inc." },
-  { s: "CYCN", n: "Cyclerion Therapeutics, Inc." },
-  { s: "CYCU", n: "Cycurion, Inc." },
-  { s: "CYCUW", n: "Cycurion, Inc. - Warrants" },
-  { s: "CYD", n: "China Yuchai International Limited Common Stock" },
-  { s: "CYH", n: "Community Health Systems, Inc. Common Stock" },
-  { s: "CYN", n: "Cyngn Inc." },
-  { s: "CYPH", n: "Cypherpunk Technologies Inc." },
-  { s: "CYRX", n: "CryoPort, Inc." },
-  { s: "CYTK", n: "Cytokinetics, Incorporated" },
-  { s: "CZFS", n: "Citizens Financial Services, Inc." },
-  { s: "CZNC", n: "Citizens & Northern Corp" },
-  { s: "CZR", n: "Caesars Entertainment, Inc." },
-  { s: "CZWI", n: "Citizens Community Bancorp, Inc." },
-  { s: "D", n: "Dominion Energy, Inc. Common Stock" },
-  { s: "DAC", n: "Danaos Corporation Common Stock" },
-  { s: "DAIC", n: "CID HoldCo, Inc." },
-  { s: "DAICW", n: "CID HoldCo, Inc. - Warrants" },
-  { s: "DAIO", n: "Data I/O Corporation" },
-  { s: "DAKT", n: "Daktronics, Inc." },
-  { s: "DAL", n: "Delta Air Lines, Inc. Common Stock" },
-  { s: "DAN", n: "Dana Incorporated Common Stock" },
-  { s: "DAO", n: "Youdao, Inc. American Depositary Shares, each representing one Class A Ordinary Share" },
-  { s: "DAR", n: "Darling Ingredients Inc. Common Stock" },
-  { s: "DARE", n: "Dare Bioscience, Inc." },
-  { s: "DASH", n: "DoorDash, Inc." },
-  { s: "DAVA", n: "Endava plc American Depositary Shares (each representing one Class A Ordinary Share)" },
-  { s: "DAVE", n: "Dave Inc." },
-  { s: "DAVEW", n: "Dave Inc. - Warrants" },
-  { s: "DB", n: "Deutsche Bank AG Common Stock" },
-  { s: "DBD", n: "Diebold Nixdorf Incorporated Common stock" },
-  { s: "DBGI", n: "Digital Brands Group, Inc." },
-  { s: "DBI", n: "Designer Brands Inc. Class A Common Stock" },
-  { s: "DBRG", n: "DigitalBridge Group, Inc." },
-  { s: "DBVT", n: "DBV Technologies S.A." },
-  { s: "DBX", n: "Dropbox, Inc." },
-  { s: "DC", n: "Dakota Gold Corp. Common Stock" },
-  { s: "DCBO", n: "Docebo Inc. - Common Shares" },
-  { s: "DCGO", n: "DocGo Inc." },
-  { s: "DCH", n: "Dauch Corporation Common Stock" },
-  { s: "DCI", n: "Donaldson Company, Inc. Common Stock" },
-  { s: "DCO", n: "Ducommun Incorporated Common Stock" },
-  { s: "DCOM", n: "Dime Commercial Bancshares, Inc. Common Stock" },
-  { s: "DCOY", n: "Decoy Therapeutics Inc." },
-  { s: "DCTH", n: "Delcath Systems, Inc." },
-  { s: "DCX", n: "Digital Currency X Technology Inc." },
-  { s: "DD", n: "DuPont de Nemours, Inc. Common Stock" },
-  { s: "DDC", n: "DDC Enterprise Limited Class A Ordinary Shares" },
-  { s: "DDD", n: "3D Systems Corporation Common Stock" },
-  { s: "DDI", n: "DoubleDown Interactive Co., Ltd. - American Depository Shares" },
-  { s: "DDL", n: "Dingdong (Cayman) Limited American Depositary Shares (each two representing three Ordinary Shares)" },
-  { s: "DDOG", n: "Datadog, Inc." },
-  { s: "DDS", n: "Dillard's, Inc. Common Stock" },
-  { s: "DE", n: "Deere & Company Common Stock" },
-  { s: "DEA", n: "Easterly Government Properties, Inc. Common Stock" },
-  { s: "DEC", n: "Diversified Energy Company Common Stock" },
-  { s: "DECK", n: "Deckers Outdoor Corporation Common Stock" },
-  { s: "DEFT", n: "Defi Technologies, Inc." },
-  { s: "DEI", n: "Douglas Emmett, Inc. Common Stock" },
-  { s: "DELL", n: "Dell Technologies Inc. Class C Common Stock" },
-  { s: "DEO", n: "Diageo plc Common Stock" },
-  { s: "DERM", n: "Journey Medical Corporation" },
-  { s: "DETX", n: "Liberty Defense Holdings, Ltd. - Common Shares" },
-  { s: "DFDV", n: "DeFi Development Corp." },
-  { s: "DFH", n: "Dream Finders Homes, Inc. Class A Common Stock" },
-  { s: "DFIN", n: "Donnelley Financial Solutions, Inc. Common Stock" },
-  { s: "DFLI", n: "Dragonfly Energy Holdings Corp" },
-  { s: "DFNS", n: "T3 Defense Inc." },
-  { s: "DFNSW", n: "T3 Defense Inc. - Warrants" },
-  { s: "DFSC", n: "DEFSEC Technologies Inc." },
-  { s: "DFTX", n: "Definium Therapeutics, Inc. - Common Shares" },
-  { s: "DG", n: "Dollar General Corporation Common Stock" },
-  { s: "DGICA", n: "Donegal Group, Inc." },
-  { s: "DGICB", n: "Donegal Group, Inc." },
-  { s: "DGII", n: "Digi International Inc." },
-  { s: "DGNX", n: "Diginex Limited" },
-  { s: "DGX", n: "Quest Diagnostics Incorporated Common Stock" },
-  { s: "DGXX", n: "Digi Power X Inc. - Common Subordinate Voting Shares" },
-  { s: "DH", n: "Definitive Healthcare Corp." },
-  { s: "DHI", n: "D.R. Horton, Inc. Common Stock" },
-  { s: "DHR", n: "Danaher Corporation Common Stock" },
-  { s: "DHT", n: "DHT Holdings, Inc." },
-  { s: "DHX", n: "DHI Group, Inc. Common Stock" },
-  { s: "DIBS", n: "1stdibs.com, Inc." },
-  { s: "DIN", n: "Dine Brands Global, Inc. Common Stock" },
-  { s: "DINO", n: "HF Sinclair Corporation Common Stock" },
-  { s: "DIOD", n: "Diodes Incorporated" },
-  { s: "DIS", n: "Walt Disney Company (The) Common Stock" },
-  { s: "DIT", n: "AMCON Distributing Company Common Stock" },
-  { s: "DJCO", n: "Daily Journal Corp. (S.C.)" },
-  { s: "DJT", n: "Trump Media & Technology Group Corp." },
-  { s: "DJTWW", n: "Trump Media & Technology Group Corp. - Warrants" },
-  { s: "DK", n: "Delek US Holdings, Inc. Common Stock" },
-  { s: "DKI", n: "DarkIris Inc." },
-  { s: "DKL", n: "Delek Logistics Partners, L.P. Common Units representing Limited Partner Interests" },
-  { s: "DKNG", n: "DraftKings Inc." },
-  { s: "DKS", n: "Dick's Sporting Goods Inc Common Stock" },
-  { s: "DLB", n: "Dolby Laboratories Common Stock" },
-  { s: "DLHC", n: "DLH Holdings Corp." },
-  { s: "DLO", n: "DLocal Limited" },
-  { s: "DLPN", n: "Dolphin Entertainment, Inc." },
-  { s: "DLTH", n: "Duluth Holdings Inc." },
-  { s: "DLTR", n: "Dollar Tree, Inc." },
-  { s: "DLX", n: "Deluxe Corporation Common Stock" },
-  { s: "DLXY", n: "Delixy Holdings Limited" },
-  { s: "DMAC", n: "DiaMedica Therapeutics Inc." },
-  { s: "DMC", n: "Del Monte Corporation Ordinary Shares" },
-  { s: "DMLP", n: "Dorchester Minerals, L.P. - Common Units Representing Limited Partnership Interests" },
-  { s: "DMRA", n: "Damora Therapeutics, Inc." },
-  { s: "DMRC", n: "Digimarc Corporation" },
-  { s: "DNA", n: "Ginkgo Bioworks Holdings, Inc. Class A Common Stock" },
-  { s: "DNLI", n: "Denali Therapeutics Inc." },
-  { s: "DNMX", n: "Dynamix Corporation III" },
-  { s: "DNMXW", n: "Dynamix Corporation III - Warrants" },
-  { s: "DNN", n: "Denison Mines Corp Ordinary Shares (Canada)" },
-  { s: "DNOW", n: "DNOW Inc. Common Stock" },
-  { s: "DNTH", n: "Dianthus Therapeutics, Inc." },
-  { s: "DNUT", n: "Krispy Kreme, Inc." },
-  { s: "DOC", n: "Healthpeak Properties, Inc. Common Stock" },
-  { s: "DOCN", n: "DigitalOcean Holdings, Inc. Common Stock" },
-  { s: "DOCS", n: "Doximity, Inc. Class A Common Stock" },
-  { s: "DOCU", n: "DocuSign, Inc." },
-  { s: "DOGZ", n: "Dogness (International) Corporation" },
-  { s: "DOLE", n: "Dole plc Ordinary Shares" },
-  { s: "DOMH", n: "Dominari Holdings Inc." },
-  { s: "DOMO", n: "Domo, Inc." },
-  { s: "DOO", n: "BRP Inc. - Common Subordinate Voting Shares" },
-  { s: "DORM", n: "Dorman Products, Inc." },
-  { s: "DOUG", n: "Douglas Elliman Inc. Common Stock" },
-  { s: "DOV", n: "Dover Corporation Common Stock" },
-  { s: "DOW", n: "Dow Inc. Common Stock" },
-  { s: "DOX", n: "Amdocs Limited" },
-  { s: "DOYU", n: "DouYu International Holdings Limited" },
-  { s: "DPC", n: "DPC Holdings PLC Ordinary Shares" },
-  { s: "DPRO", n: "Draganfly Inc. - Common Shares" },
-  { s: "DPU", n: "Top KingWin Ltd" },
-  { s: "DPZ", n: "Domino's Pizza Inc" },
-  { s: "DQ", n: "DAQO New Energy Corp. American Depositary Shares, each representing five ordinary shares" },
-  { s: "DRCT", n: "Direct Digital Holdings, Inc." },
-  { s: "DRD", n: "DRDGOLD Limited American Depositary Shares" },
-  { s: "DRH", n: "Diamondrock Hospitality Company" },
-  { s: "DRI", n: "Darden Restaurants, Inc. Common Stock" },
-  { s: "DRIO", n: "DarioHealth Corp." },
-  { s: "DRMA", n: "Dermata Therapeutics, Inc." },
-  { s: "DRS", n: "Leonardo DRS, Inc." },
-  { s: "DRTS", n: "Alpha Tau Medical Ltd." },
-  { s: "DRUG", n: "Bright Minds Biosciences Inc." },
-  { s: "DRVN", n: "Driven Brands Holdings Inc." },
-  { s: "DSC", n: "DSC Holdings Ltd." },
-  { s: "DSGN", n: "Design Therapeutics, Inc." },
-  { s: "DSGR", n: "Distribution Solutions Group, Inc." },
-  { s: "DSGX", n: "The Descartes Systems Group Inc." },
-  { s: "DSP", n: "Viant Technology Inc." },
-  { s: "DSS", n: "DSS, Inc. Common Stock" },
-  { s: "DSWL", n: "Deswell Industries, Inc. - Common Shares" },
-  { s: "DSX", n: "Diana Shipping inc. common stock" },
-  { s: "DSX-W", n: "Diana Shipping inc. Warrants" },
-  { s: "DSY", n: "Big Tree Cloud Holdings Limited" },
-  { s: "DSYWW", n: "Big Tree Cloud Holdings Limited - Warrants" },
-  { s: "DT", n: "Dynatrace, Inc. Common Stock" },
-  { s: "DTCX", n: "Datacentrex, Inc." },
-  { s: "DTE", n: "DTE Energy Company Common Stock" },
-  { s: "DTI", n: "Drilling Tools International Corporation" },
-  { s: "DTIL", n: "Precision BioSciences, Inc." },
-  { s: "DTM", n: "DT Midstream, Inc. Common Stock" },
-  { s: "DTSS", n: "Datasea Intelligent Technology Ltd." },
-  { s: "DTST", n: "Data Storage Corporation" },
-  { s: "DUK", n: "Duke Energy Corporation (Holding Company) Common Stock" },
-  { s: "DUKB", n: "Duke Energy Corporation 5.625% Junior Subordinated Debentures due 2078" },
-  { s: "DUKR", n: "DUKE Robotics Corp." },
-  { s: "DUO", n: "Fangdd Network Group Ltd." },
-  { s: "DUOL", n: "Duolingo, Inc." },
-  { s: "DUOT", n: "Duos Technologies Group, Inc." },
-  { s: "DV", n: "DoubleVerify Holdings, Inc. Common Stock" },
-  { s: "DVA", n: "DaVita Inc. Common Stock" },
-  { s: "DVLT", n: "Datavault AI Inc." },
-  { s: "DVN", n: "Devon Energy Corporation Common Stock" },
-  { s: "DWSN", n: "Dawson Geophysical Company" },
-  { s: "DWTX", n: "Dogwood Therapeutics, Inc." },
-  { s: "DX", n: "Dynex Capital, Inc. Common Stock" },
-  { s: "DXC", n: "DXC Technology Company Common Stock" },
-  { s: "DXCM", n: "DexCom, Inc." },
-  { s: "DXF", n: "Eason Technology Limited American Depositary Shares (each representing sixty-thousand (60,000) Ordinary Shares)" },
-  { s: "DXLG", n: "Destination XL Group, Inc." },
-  { s: "DXPE", n: "DXP Enterprises, Inc." },
-  { s: "DXST", n: "Decent Holding Inc." },
-  { s: "DXYZ", n: "Destiny Tech100 Inc. Common Stock" },
-  { s: "DY", n: "Dycom Industries, Inc. Common Stock" },
-  { s: "DYAI", n: "Dyadic International, Inc." },
-  { s: "DYN", n: "Dyne Therapeutics, Inc." },
-  { s: "DYNC", n: "Dynamix Corporation" },
-  { s: "DYOR", n: "Insight Digital Partners II" },
-  { s: "DYORU", n: "Insight Digital Partners II - Units" },
-  { s: "DYORW", n: "Insight Digital Partners II - Warrants" },
-  { s: "E", n: "ENI S.p.A. Common Stock" },
-  { s: "EA", n: "Electronic Arts Inc." },
-  { s: "EAF", n: "GrafTech International Ltd. Common Stock" },
-  { s: "EARN", n: "Ellington Credit Company Common Shares of Beneficial Interest" },
-  { s: "EAT", n: "Brinker International, Inc. Common Stock" },
-  { s: "EBAY", n: "eBay Inc." },
-  { s: "EBC", n: "Eastern Bankshares, Inc." },
-  { s: "EBF", n: "Ennis, Inc. Common Stock" },
-  { s: "EBMT", n: "Eagle Bancorp Montana, Inc." },
-  { s: "EBON", n: "Ebang International Holdings Inc." },
-  { s: "EBS", n: "Emergent BioSolutions Inc. Common Stock" },
-  { s: "EC", n: "Ecopetrol S.A. American Depositary Shares" },
-  { s: "ECBK", n: "ECB Bancorp, Inc." },
-  { s: "ECC", n: "Eagle Point Credit Company Common Share of Beneficial Interest" },
-  { s: "ECG", n: "Everus Construction Group, Inc. Common Stock" },
-  { s: "ECHO", n: "EchoStar Corporation" },
-  { s: "ECL", n: "Ecolab Inc. Common Stock" },
-  { s: "ECO", n: "Okeanis Eco Tankers Corp. Common Stock" },
-  { s: "ECOR", n: "electroCore, Inc." },
-  { s: "ECPG", n: "Encore Capital Group Inc" },
-  { s: "ECVT", n: "Ecovyst Inc. Common Stock" },
-  { s: "ECX", n: "ECARX Holdings Inc." },
-  { s: "ECXWW", n: "ECARX Holdings Inc. - Warrants" },
-  { s: "ED", n: "Consolidated Edison, Inc. Common Stock" },
-  { s: "EDBL", n: "Edible Garden AG Incorporated" },
-  { s: "EDHL", n: "Everbright Digital Holding Limited" },
-  { s: "EDIT", n: "Editas Medicine, Inc." },
-  { s: "EDN", n: "Empresa Distribuidora Y Comercializadora Norte S.A. (Edenor) American Depositary Shares" },
-  { s: "EDRY", n: "EuroDry Ltd. - Common Shares" },
-  { s: "EDSA", n: "Edesa Biotech, Inc. - Common Shares" },
-  { s: "EDTK", n: "Skillful Craftsman Education Technology Limited - Ordinary Share" },
-  { s: "EDUC", n: "Educational Development Corporation" },
-  { s: "EE", n: "Excelerate Energy, Inc. Class A Common Stock" },
-  { s: "EEFT", n: "Euronet Worldwide, Inc." },
-  { s: "EEIQ", n: "EpicQuest Education Group International Limited" },
-  { s: "EFC", n: "Ellington Financial Inc. Common Stock" },
-  { s: "EFOI", n: "Energy Focus, Inc." },
-  { s: "EFOR", n: "Everforth, Inc. Common Stock" },
-  { s: "EFSC", n: "Enterprise Financial Services Corporation" },
-  { s: "EFSI", n: "Eagle Financial Services Inc" },
-  { s: "EFTY", n: "Etoiles Capital Group Co., Ltd." },
-  { s: "EFX", n: "Equifax, Inc. Common Stock" },
-  { s: "EFXT", n: "Enerflex Ltd Common Shares" },
-  { s: "EG", n: "Everest Group, Ltd. Common Stock" },
-  { s: "EGAN", n: "eGain Corporation" },
-  { s: "EGBN", n: "Eagle Bancorp, Inc." },
-  { s: "EGG", n: "Enigmatig Limited Class A Ordinary Shares" },
-  { s: "EGHT", n: "8x8 Inc" },
-  { s: "EGO", n: "Eldorado Gold Corporation Ordinary Shares" },
-  { s: "EGP", n: "EastGroup Properties, Inc. Common Stock" },
-  { s: "EGY", n: "VAALCO Energy, Inc. Common Stock" },
-  { s: "EH", n: "EHang Holdings Limited" },
-  { s: "EHC", n: "Encompass Health Corporation Common Stock" },
-  { s: "EHGO", n: "Eshallgo Inc." },
-  { s: "EHLD", n: "Euroholdings Ltd." },
-  { s: "EHTH", n: "eHealth, Inc." },
-  { s: "EIC", n: "Eagle Point Income Company Inc. Common Stock" },
-  { s: "EIG", n: "Employers Holdings Inc Common Stock" },
-  { s: "EIKN", n: "Eikon Therapeutics, Inc." },
-  { s: "EIX", n: "Edison International Common Stock" },
-  { s: "EJH", n: "E-Home Household Service Holdings Limited" },
-  { s: "EL", n: "Estee Lauder Companies, Inc. (The) Common Stock" },
-  { s: "ELA", n: "Envela Corporation Common Stock" },
-  { s: "ELAB", n: "PMGC Holdings Inc." },
-  { s: "ELAN", n: "Elanco Animal Health Incorporated Common Stock" },
-  { s: "ELBM", n: "Electra Battery Materials Corporation" },
-  { s: "ELDN", n: "Eledon Pharmaceuticals, Inc." },
-  { s: "ELE", n: "Elemental Royalty Corporation" },
-  { s: "ELF", n: "e.l.f. Beauty, Inc. Common Stock" },
-  { s: "ELLO", n: "Ellomay Capital Ltd Ordinary Shares (Israel)" },
-  { s: "ELMD", n: "Electromed, Inc. Common Stock" },
-  { s: "ELME", n: "Elme Communities Common Stock" },
-  { s: "ELMT", n: "The Elmet Group Co." },
-  { s: "ELOG", n: "Eastern International Ltd." },
-  { s: "ELOX", n: "Eloxx Pharmaceuticals, Inc." },
-  { s: "ELPC", n: "Companhia Paranaense de Energia (COPEL) American Depositary Shares (each representing four (4) Common Shares)" },
-  { s: "ELPW", n: "Elong Power Holding Limited" },
-  { s: "ELS", n: "Equity Lifestyle Properties, Inc. Common Stock" },
-  { s: "ELSE", n: "Electro-Sensors, Inc." },
-  { s: "ELTK", n: "Eltek Ltd." },
-  { s: "ELTX", n: "Elicio Therapeutics, Inc." },
-  { s: "ELUT", n: "Elutia, Inc." },
-  { s: "ELV", n: "Elevance Health, Inc. Common Stock" },
-  { s: "ELVA", n: "Electrovaya Inc. - Common Shares" },
-  { s: "ELVN", n: "Enliven Therapeutics, Inc." },
-  { s: "ELVR", n: "Elevra Lithium Limited - American Depository Shares" },
-  { s: "ELWT", n: "Elauwit Connection, Inc." },
-  { s: "EMA", n: "Emera Incorporated Common Shares" },
-  { s: "EMAT", n: "Evolution Metals & Technologies Corp." },
-  { s: "EMBC", n: "Embecta Corp." },
-  { s: "EMBJ", n: "Embraer S.A. Common Stock" },
-  { s: "EME", n: "EMCOR Group, Inc. Common Stock" },
-  { s: "EML", n: "Eastern Company (The)" },
-  { s: "EMN", n: "Eastman Chemical Company Common Stock" },
-  { s: "EMPD", n: "Empery Digital Inc." },
-  { s: "EMPG", n: "Empro Group Inc." },
-  { s: "EMR", n: "Emerson Electric Company Common Stock" },
-  { s: "ENB", n: "Enbridge Inc Common Stock" },
-  { s: "ENGN", n: "enGene Therapeutics Inc." },
-  { s: "ENGNW", n: "enGene Therapeutics Inc. - Warrants" },
-  { s: "ENGS", n: "Energys Group Limited" },
-  { s: "ENHA", n: "Enhanced Group Inc. Class A Common Stock" },
-  { s: "ENIC", n: "Enel Chile S.A. American Depositary Shares (Each representing 50 shares of Common Stock)" },
-  { s: "ENLT", n: "Enlight Renewable Energy Ltd." },
-  { s: "ENLV", n: "Enlivex Ltd." },
-  { s: "ENOV", n: "Enovis Corporation Common Stock" },
-  { s: "ENPH", n: "Enphase Energy, Inc." },
-  { s: "ENR", n: "Energizer Holdings, Inc. Common Stock" },
-  { s: "ENRD", n: "Einride AB" },
-  { s: "ENRDW", n: "Einride AB - Warrants" },
-  { s: "ENS", n: "EnerSys Common Stock" },
-  { s: "ENSC", n: "Ensysce Biosciences, Inc." },
-  { s: "ENSG", n: "The Ensign Group, Inc." },
-  { s: "ENTA", n: "Enanta Pharmaceuticals, Inc." },
-  { s: "ENTG", n: "Entegris, Inc." },
-  { s: "ENTX", n: "Entera Bio Ltd." },
-  { s: "ENVA", n: "Enova International, Inc. Common Stock" },
-  { s: "ENVB", n: "Enveric Biosciences, Inc." },
-  { s: "ENVX", n: "Enovix Corporation" },
-  { s: "EOG", n: "EOG Resources, Inc. Common Stock" },
-  { s: "EOLS", n: "Evolus, Inc." },
-  { s: "EONR", n: "EON Resources Inc. Class A Common Stock" },
-  { s: "EOSE", n: "Eos Energy Enterprises, Inc." },
-  { s: "EP", n: "Empire Petroleum Corporation Common Stock" },
-  { s: "EPAC", n: "Enerpac Tool Group Corp. Common Stock" },
-  { s: "EPAM", n: "EPAM Systems, Inc. Common Stock" },
-  { s: "EPC", n: "Edgewell Personal Care Company Common Stock" },
-  { s: "EPD", n: "Enterprise Products Partners L.P. Common Stock" },
-  { s: "EPM", n: "Evolution Petroleum Corporation, Inc. Common Stock" },
-  { s: "EPOW", n: "E-Power Inc." },
-  { s: "EPR", n: "EPR Properties Common Stock" },
-  { s: "EPRX", n: "Eupraxia Pharmaceuticals Inc." },
-  { s: "EPSM", n: "Epsium Enterprise Limited" },
-  { s: "EPSN", n: "Epsilon Energy Ltd. - Common Shares" },
-  { s: "EQ", n: "Equillium, Inc." },
-  { s: "EQBK", n: "Equity Bancshares, Inc. Class A Common Stock" },
-  { s: "EQH", n: "Equitable Holdings, Inc. Common Stock" },
-  { s: "EQIX", n: "Equinix, Inc." },
-  { s: "EQNR", n: "Equinor ASA" },
-  { s: "EQPT", n: "EquipmentShare.com Inc" },
-  { s: "EQR", n: "Equity Residential Common Shares of Beneficial Interest" },
-  { s: "EQS", n: "Equus Total Return, Inc. Common Stock" },
-  { s: "EQT", n: "EQT Corporation Common Stock" },
-  { s: "EQX", n: "Equinox Gold Corp. Common Shares" },
-  { s: "ERAS", n: "Erasca, Inc." },
-  { s: "ERIC", n: "Ericsson" },
-  { s: "ERIE", n: "Erie Indemnity Company" },
-  { s: "ERII", n: "Energy Recovery, Inc." },
-  { s: "ERNA", n: "Ernexa Therapeutics Inc." },
-  { s: "ERNAW", n: "Ernexa Therapeutics Inc. - Warrants" },
-  { s: "ERO", n: "Ero Copper Corp. Common Shares" },
-  { s: "EROC", n: "ERock, Inc. Class A Common Stock" },
-  { s: "EROK", n: "EagleRock Land, LLC Class A shares representing limited liability company interests" },
-  { s: "ES", n: "Eversource Energy (D/B/A) Common Stock" },
-  { s: "ESAB", n: "ESAB Corporation Common Stock" },
-  { s: "ESCA", n: "Escalade, Incorporated" },
-  { s: "ESE", n: "ESCO Technologies Inc. Common Stock" },
-  { s: "ESEA", n: "Euroseas Ltd." },
-  { s: "ESI", n: "Element Solutions Inc. Common Stock" },
-  { s: "ESLA", n: "Estrella Immunopharma, Inc." },
-  { s: "ESLT", n: "Elbit Systems Ltd." },
-  { s: "ESNT", n: "Essent Group Ltd. Common Shares" },
-  { s: "ESOA", n: "Energy Services of America Corporation" },
-  { s: "ESP", n: "Espey Mfg. & Electronics Corp. Common Stock" },
-  { s: "ESQ", n: "Esquire Financial Holdings, Inc." },
-  { s: "ESTA", n: "Establishment Labs Holdings Inc. - Common Shares" },
-  { s: "ESTC", n: "Elastic N.V. Ordinary Shares" },
-  { s: "ETD", n: "Ethan Allen Interiors Inc. Common Stock" },
-  { s: "ETN", n: "Eaton Corporation, PLC Ordinary Shares" },
-  { s: "ETO", n: "Eaton Vance Tax-Advantage Global Dividend Opp Common Stock" },
-  { s: "ETON", n: "Eton Pharmaceuticals, Inc." },
-  { s: "ETOR", n: "eToro Group Ltd." },
-  { s: "ETR", n: "Entergy Corporation Common Stock" },
-  { s: "ETS", n: "Elite Express Holding Inc." },
-  { s: "ETSS", n: "Energy Transition Special Opportunities Class A Ordinary Shares" },
-  { s: "ETSY", n: "Etsy, Inc. Common Stock" },
-  { s: "EU", n: "enCore Energy Corp." },
-  { s: "EUDA", n: "Euda Health Holdings Limited" },
-  { s: "EVAX", n: "Evaxion A/S - American Depositary Share" },
-  { s: "EVC", n: "Entravision Communications Corporation Common Stock" },
-  { s: "EVCM", n: "EverCommerce Inc." },
-  { s: "EVER", n: "EverQuote, Inc." },
-  { s: "EVEX", n: "Eve Holding, Inc. Common Stock" },
-  { s: "EVGN", n: "Evogene Ltd." },
-  { s: "EVGO", n: "EVgo Inc." },
-  { s: "EVH", n: "Evolent Health, Inc Class A Common Stock" },
-  { s: "EVI", n: "EVI Industries, Inc. Common Stock" },
-  { s: "EVLV", n: "Evolv Technologies Holdings, Inc." },
-  { s: "EVMN", n: "Evommune, Inc. Common Stock" },
-  { s: "EVO", n: "Evotec SE" },
-  { s: "EVR", n: "Evercore Inc. Class A Common Stock" },
-  { s: "EVRG", n: "Evergy, Inc." },
-  { s: "EVTC", n: "Evertec, Inc. Common Stock" },
-  { s: "EVTL", n: "Vertical Aerospace Ltd. Ordinary Shares" },
-  { s: "EW", n: "Edwards Lifesciences Corporation Common Stock" },
-  { s: "EWBC", n: "East West Bancorp, Inc." },
-  { s: "EWTX", n: "Edgewise Therapeutics, Inc." },
-  { s: "EXC", n: "Exelon Corporation" },
-  { s: "EXE", n: "Expand Energy Corporation" },
-  { s: "EXEL", n: "Exelixis, Inc." },
-  { s: "EXFY", n: "Expensify, Inc." },
-  { s: "EXK", n: "Endeavour Silver Corporation Ordinary Shares (Canada)" },
-  { s: "EXLS", n: "ExlService Holdings, Inc." },
-  { s: "EXOD", n: "Exodus Movement, Inc. Class A Common Stock" },
-  { s: "EXOZ", n: "eXoZymes Inc." },
-  { s: "EXP", n: "Eagle Materials Inc Common Stock" },
-  { s: "EXPD", n: "Expeditors International of Washington, Inc. Common Stock" },
-  { s: "EXPE", n: "Expedia Group, Inc." },
-  { s: "EXPO", n: "Exponent, Inc." },
-  { s: "EXR", n: "Extra Space Storage Inc Common Stock" },
-  { s: "EXTR", n: "Extreme Networks, Inc." },
-  { s: "EXYN", n: "Exyn Technologies, Inc." },
-  { s: "EYE", n: "National Vision Holdings, Inc." },
-  { s: "EYPT", n: "EyePoint, Inc." },
-  { s: "EZGO", n: "EZGO Technologies Ltd." },
-  { s: "EZPW", n: "EZCORP, Inc." },
-  { s: "EZRA", n: "Reliance Global Group, Inc." },
-  { s: "F", n: "Ford Motor Company Common Stock" },
-  { s: "FA", n: "First Advantage Corporation" },
-  { s: "FABC", n: "Fabric.AI, Inc." },
-  { s: "FAC", n: "Factorial Energy Inc." },
-  { s: "FAF", n: "First American Corporation (New) Common Stock" },
-  { s: "FAMI", n: "Farmmi, Inc." },
-  { s: "FANG", n: "Diamondback Energy, Inc." },
-  { s: "FAST", n: "Fastenal Company" },
-  { s: "FATE", n: "Fate Therapeutics, Inc." },
-  { s: "FATN", n: "FatPipe, Inc." },
-  { s: "FBGL", n: "FBS Global Limited" },
-  { s: "FBIN", n: "Fortune Brands Innovations, Inc. Common Stock" },
-  { s: "FBIO", n: "Fortress Biotech, Inc." },
-  { s: "FBIZ", n: "First Business Financial Services, Inc." },
-  { s: "FBK", n: "FB Financial Corporation Common Stock" },
-  { s: "FBLA", n: "FB Bancorp, Inc." },
-  { s: "FBLG", n: "FibroBiologics, Inc." },
-  { s: "FBNC", n: "First Bancorp" },
-  { s: "FBP", n: "First BanCorp. New Common Stock" },
-  { s: "FBRX", n: "Forte Biosciences, Inc." },
-  { s: "FBYD", n: "Falcon's Beyond Global, Inc." },
-  { s: "FBYDW", n: "Falcon's Beyond Global, Inc. - Warrants" },
-  { s: "FC", n: "Franklin Covey Company Common Stock" },
-  { s: "FCAP", n: "First Capital, Inc." },
-  { s: "FCBC", n: "First Community Bankshares, Inc." },
-  { s: "FCBM", n: "First Carolina Financial Services, Inc. Common Stock" },
-  { s: "FCCO", n: "First Community Corporation" },
-  { s: "FCEL", n: "FuelCell Energy, Inc." },
-  { s: "FCF", n: "First Commonwealth Financial Corporation Common Stock" },
-  { s: "FCFS", n: "FirstCash Holdings, Inc." },
-  { s: "FCHL", n: "Fitness Champs Holdings Limited" },
-  { s: "FCN", n: "FTI Consulting, Inc. Common Stock" },
-  { s: "FCNCA", n: "First Citizens BancShares, Inc." },
-  { s: "FCUV", n: "Focus Universal Inc." },
-  { s: "FCX", n: "Freeport-McMoRan, Inc. Common Stock" },
-  { s: "FDBC", n: "Fidelity D & D Bancorp, Inc." },
-  { s: "FDMT", n: "4D Molecular Therapeutics, Inc." },
-  { s: "FDS", n: "FactSet Research Systems Inc. Common Stock" },
-  { s: "FDSB", n: "Fifth District Bancorp, Inc." },
-  { s: "FDX", n: "FedEx Corporation Common Stock" },
-  { s: "FDXF", n: "FedEx Freight Holding Company, Inc. Common Stock" },
-  { s: "FE", n: "FirstEnergy Corp. Common Stock" },
-  { s: "FEAM", n: "5E Advanced Materials, Inc." },
-  { s: "FEBO", n: "Fenbo Holdings Limited" },
-  { s: "FEDU", n: "Four Seasons Education (Cayman) Inc. American Depositary Shares, each ADS representing 10 ordinary shares" },
-  { s: "FEED", n: "ENvue Medical, Inc." },
-  { s: "FEIM", n: "Frequency Electronics, Inc." },
-  { s: "FELE", n: "Franklin Electric Co., Inc." },
-  { s: "FEMY", n: "Femasys Inc." },
-  { s: "FENC", n: "Fennec Pharmaceuticals Inc." },
-  { s: "FENG", n: "Phoenix New Media Limited American Depositary Shares, each representing 48 Class A ordinary shares." },
-  { s: "FER", n: "Ferrovial N.V." },
-  { s: "FERG", n: "Ferguson Enterprises Inc. Common Stock" },
-  { s: "FET", n: "Forum Energy Technologies, Inc. Common Stock" },
-  { s: "FF", n: "FutureFuel Corp. Common shares" },
-  { s: "FFAI", n: "Faraday Future Intelligent Electric Inc." },
-  { s: "FFBC", n: "First Financial Bancorp." },
-  { s: "FFIN", n: "First Financial Bankshares, Inc." },
-  { s: "FFIV", n: "F5, Inc." },
-  { s: "FG", n: "F&G Annuities & Life, Inc. Common Stock" },
-  { s: "FGBI", n: "First Guaranty Bancshares, Inc." },
-  { s: "FGI", n: "FGI Industries Ltd." },
-  { s: "FGL", n: "Founder Group Limited" },
-  { s: "FGMC", n: "FG Merger II Corp." },
-  { s: "FGNX", n: "FG Nexus Inc." },
-  { s: "FHB", n: "First Hawaiian, Inc." },
-  { s: "FHI", n: "Federated Hermes, Inc. Common Stock" },
-  { s: "FHN", n: "First Horizon Corporation Common Stock" },
-  { s: "FHTX", n: "Foghorn Therapeutics Inc." },
-  { s: "FIBK", n: "First Interstate BancSystem, Inc." },
-  { s: "FICO", n: "Fair Isaac Corporation Common Stock" },
-  { s: "FIEE", n: "FiEE, Inc" },
-  { s: "FIG", n: "Figma, Inc. Class A Common Stock" },
-  { s: "FIGR", n: "Figure Technology Solutions, Inc." },
-  { s: "FIGS", n: "FIGS, Inc. Class A Common Stock" },
-  { s: "FINV", n: "FinVolution Group American Depositary Shares" },
-  { s: "FINW", n: "FinWise Bancorp" },
-  { s: "FIP", n: "FTAI Infrastructure Inc." },
-  { s: "FIRY", n: "Firy Inc. Class A Common Stock" },
-  { s: "FIS", n: "Fidelity National Information Services, Inc. Common Stock" },
-  { s: "FISI", n: "Financial Institutions, Inc." },
-  { s: "FISN", n: "Deep Fission, Inc." },
-  { s: "FISV", n: "Fiserv, Inc." },
-  { s: "FITB", n: "Fifth Third Bancorp Common Stock" },
-  { s: "FIVE", n: "Five Below, Inc." },
-  { s: "FIVN", n: "Five9, Inc." },
-  { s: "FIX", n: "Comfort Systems USA, Inc. Common Stock" },
-  { s: "FIZZ", n: "National Beverage Corp." },
-  { s: "FJET", n: "Starfighters Space, Inc. Common Stock" },
-  { s: "FKWL", n: "Franklin Wireless Corp." },
-  { s: "FLD", n: "Fold Holdings, Inc." },
-  { s: "FLEX", n: "Flex Ltd." },
-  { s: "FLG", n: "Flagstar Bank, N.A. Common Stock" },
-  { s: "FLGT", n: "Fulgent Genetics, Inc." },
-  { s: "FLL", n: "Full House Resorts, Inc." },
-  { s: "FLNA", n: "Filana Therapeutics, Inc." },
-  { s: "FLNC", n: "Fluence Energy, Inc." },
-  { s: "FLNG", n: "FLEX LNG Ltd. Ordinary Shares" },
-  { s: "FLNT", n: "Fluent, Inc." },
-  { s: "FLO", n: "Flowers Foods, Inc. Common Stock" },
-  { s: "FLOC", n: "Flowco Holdings Inc. Class A Common Stock" },
-  { s: "FLR", n: "Fluor Corporation Common Stock" },
-  { s: "FLS", n: "Flowserve Corporation Common Stock" },
-  { s: "FLUT", n: "Flutter Entertainment plc Ordinary Shares" },
-  { s: "FLUX", n: "Flux Power Holdings, Inc." },
-  { s: "FLWS", n: "1-800-FLOWERS.COM, Inc." },
-  { s: "FLX", n: "BingEx Limited" },
-  { s: "FLXS", n: "Flexsteel Industries, Inc." },
-  { s: "FLY", n: "Firefly Aerospace Inc." },
-  { s: "FLYE", n: "Fly-E Group, Inc." },
-  { s: "FLYW", n: "Flywire Corporation - Voting Common Stock" },
-  { s: "FLYX", n: "flyExclusive, Inc. Class A Common Stock" },
-  { s: "FLZH", n: "Flash Sports & Media Holdings, Inc." },
-  { s: "FMAO", n: "Farmers & Merchants Bancorp, Inc." },
-  { s: "FMBH", n: "First Mid Bancshares, Inc." },
-  { s: "FMC", n: "FMC Corporation Common Stock" },
-  { s: "FMFC", n: "Kandal M Venture Limited" },
-  { s: "FMNB", n: "Farmers National Banc Corp." },
-  { s: "FMS", n: "Fresenius Medical Care AG American Depositary Shares (Each representing 1/2 of an Ordinary Share)" },
-  { s: "FMST", n: "Foremost Clean Energy Ltd. - Common Shares" },
-  { s: "FMX", n: "Fomento Economico Mexicano S.A.B. de C.V. Common Stock" },
-  { s: "FN", n: "Fabrinet Ordinary Shares" },
-  { s: "FNB", n: "F.N.B. Corporation Common Stock" },
-  { s: "FND", n: "Floor & Decor Holdings, Inc. Common Stock" },
-  { s: "FNF", n: "Fidelity National Financial, Inc. Common Stock" },
-  { s: "FNGR", n: "FingerMotion, Inc." },
-  { s: "FNKO", n: "Funko, Inc." },
-  { s: "FNLC", n: "First Bancorp, Inc (ME)" },
-  { s: "FNRN", n: "First Northern Community Bancorp" },
-  { s: "FNUC", n: "Frontier Nuclear and Minerals Inc. - Common Shares" },
-  { s: "FNV", n: "Franco-Nevada Corporation" },
-  { s: "FNWB", n: "First Northwest Bancorp" },
-  { s: "FNWD", n: "Finward Bancorp" },
-  { s: "FOA", n: "Finance of America Companies Inc. Class A Common Stock" },
-  { s: "FOCL", n: "EDAP TMS S.A." },
-  { s: "FOFO", n: "Hang Feng Technology Innovation Co., Ltd." },
-  { s: "FOR", n: "Forestar Group Inc Common Stock" },
-  { s: "FORM", n: "FormFactor, Inc." },
-  { s: "FORR", n: "Forrester Research, Inc." },
-  { s: "FORTY", n: "Formula Systems (1985) Ltd." },
-  { s: "FOSL", n: "Fossil Group, Inc." },
-  { s: "FOUR", n: "Shift4 Payments, Inc. Class A Common Stock" },
-  { s: "FOX", n: "Fox Corporation" },
-  { s: "FOXA", n: "Fox Corporation" },
-  { s: "FOXF", n: "Fox Factory Holding Corp." },
-  { s: "FOXX", n: "Foxx Development Holdings Inc." },
-  { s: "FPH", n: "Five Point Holdings, LLC Class A Common Shares" },
-  { s: "FPI", n: "Farmland Partners Inc. Common Stock" },
-  { s: "FPS", n: "Forgent Power Solutions, Inc. Class A Common Stock" },
-  { s: "FRAF", n: "Franklin Financial Services Corporation" },
-  { s: "FRBA", n: "First Bank" },
-  { s: "FRBT", n: "Forbright, Inc." },
-  { s: "FRD", n: "Friedman Industries Inc." },
-  { s: "FRGT", n: "Freight Technologies, Inc." },
-  { s: "FRHC", n: "Freedom Holding Corp." },
-  { s: "FRME", n: "First Merchants Corporation" },
-  { s: "FRMI", n: "Fermi Inc." },
-  { s: "FRMM", n: "Forum Markets, Incorporated" },
-  { s: "FRO", n: "Frontline Plc Ordinary Shares" },
-  { s: "FROG", n: "JFrog Ltd." },
-  { s: "FRPH", n: "FRP Holdings, Inc." },
-  { s: "FRPT", n: "Freshpet, Inc." },
-  { s: "FRSH", n: "Freshworks Inc." },
-  { s: "FRST", n: "Primis Financial Corp." },
-  { s: "FRSX", n: "Foresight Autonomous Holdings Ltd." },
-  { s: "FRTT", n: "Fort Technology Inc. - Common Shares" },
-  { s: "FRVO", n: "Fervo Energy Company" },
-  { s: "FSBC", n: "Five Star Bancorp" },
-  { s: "FSBW", n: "FS Bancorp, Inc." },
-  { s: "FSCO", n: "FS Credit Opportunities Corp. Common Stock" },
-  { s: "FSEA", n: "First Seacoast Bancorp, Inc." },
-  { s: "FSI", n: "Flexible Solutions International Inc. Common Stock (CDA)" },
-  { s: "FSK", n: "FS KKR Capital Corp. Common Stock" },
-  { s: "FSLR", n: "First Solar, Inc." },
-  { s: "FSLY", n: "Fastly, Inc." },
-  { s: "FSM", n: "Fortuna Mining Corp. Common Shares" },
-  { s: "FSP", n: "Franklin Street Properties Corp. Common Stock" },
-  { s: "FSS", n: "Federal Signal Corporation Common Stock" },
-  { s: "FSTR", n: "L.B. Foster Company" },
-  { s: "FSUN", n: "FirstSun Capital Bancorp" },
-  { s: "FSV", n: "FirstService Corporation - Common Shares" },
-  { s: "FTAI", n: "FTAI Aviation Ltd." },
-  { s: "FTCI", n: "FTC Solar, Inc." },
-  { s: "FTDR", n: "Frontdoor, Inc." },
-  { s: "FTEK", n: "Fuel Tech, Inc." },
-  { s: "FTFT", n: "Future FinTech Group Inc." },
-  { s: "FTH", n: "Faeth Therapeutics, Inc." },
-  { s: "FTHM", n: "Fathom Holdings Inc." },
-  { s: "FTI", n: "TechnipFMC plc Ordinary Share" },
-  { s: "FTK", n: "Flotek Industries, Inc. Common Stock" },
-  { s: "FTLF", n: "FitLife Brands, Inc." },
-  { s: "FTNT", n: "Fortinet, Inc." },
-  { s: "FTRE", n: "Fortrea Holdings Inc." },
-  { s: "FTRK", n: "FAST TRACK GROUP" },
-  { s: "FTS", n: "Fortis Inc. Common Shares" },
-  { s: "FTV", n: "Fortive Corporation Common Stock" },
-  { s: "FTW", n: "Presidio Production Company Class A Common Stock" },
-  { s: "FUBO", n: "FuboTV Inc. Class A Common Stock" },
-  { s: "FUFU", n: "BitFuFu Inc." },
-  { s: "FUL", n: "H. B. Fuller Company Common Stock" },
-  { s: "FULC", n: "Fulcrum Therapeutics, Inc." },
-  { s: "FULT", n: "Fulton Financial Corporation" },
-  { s: "FUN", n: "Six Flags Entertainment Corporation Common Stock New" },
-  { s: "FUNC", n: "First United Corporation" },
-  { s: "FURY", n: "Fury Gold Mines Limited Common Shares" },
-  { s: "FUSB", n: "First US Bancshares, Inc." },
-  { s: "FUSE", n: "Fusemachines Inc." },
-  { s: "FUSEW", n: "Fusemachines Inc. - Warrants" },
-  { s: "FUTU", n: "Futu Holdings Limited" },
-  { s: "FVCB", n: "FVCBankcorp, Inc." },
-  { s: "FVRR", n: "Fiverr International Ltd. Ordinary Shares, no par value" },
-  { s: "FWDI", n: "Forward Industries, Inc." },
-  { s: "FWRD", n: "Forward Air Corporation" },
-  { s: "FWRG", n: "First Watch Restaurant Group, Inc." },
-  { s: "FXHO", n: "UTime Limited" },
-  { s: "FXNC", n: "First National Corporation" },
-  { s: "G", n: "Genpact Limited Common Stock" },
-  { s: "GABC", n: "German American Bancorp, Inc." },
-  { s: "GAIA", n: "Gaia, Inc." },
-  { s: "GAIN", n: "Gladstone Investment Corporation - Business Development Company" },
-  { s: "GALT", n: "Galectin Therapeutics Inc." },
-  { s: "GAM", n: "General American Investors, Inc. Common Stock" },
-  { s: "GAMB", n: "Gambling.com Group Limited" },
-  { s: "GAME", n: "GameSquare Holdings, Inc." },
-  { s: "GANX", n: "Gain Therapeutics, Inc." },
-  { s: "GAP", n: "Gap, Inc. (The) Common Stock" },
-  { s: "GASS", n: "StealthGas, Inc." },
-  { s: "GATX", n: "GATX Corporation Common Stock" },
-  { s: "GAU", n: "Galiano Gold Inc." },
-  { s: "GAUZ", n: "Gauzy Ltd." },
-  { s: "GBCI", n: "Glacier Bancorp, Inc. Common Stock" },
-  { s: "GBFH", n: "GBank Financial Holdings Inc." },
-  { s: "GBLI", n: "Global Indemnity Group, LLC" },
-  { s: "GBR", n: "New Concept Energy, Inc Common Stock" },
-  { s: "GBTG", n: "Global Business Travel Group, Inc. Class A Common Stock" },
-  { s: "GBX", n: "Greenbrier Companies, Inc. (The) Common Stock" },
-  { s: "GCBC", n: "Greene County Bancorp, Inc." },
-  { s: "GCDT", n: "Green Circle Decarbonize Technology Limited Ordinary Shares" },
-  { s: "GCGR", n: "General Catalyst Global Resilience Merger Corp." },
-  { s: "GCGRU", n: "General Catalyst Global Resilience Merger Corp. - Units" },
-  { s: "GCGRW", n: "General Catalyst Global Resilience Merger Corp. - Warrants" },
-  { s: "GCL", n: "GCL Global Holdings Ltd" },
-  { s: "GCLWW", n: "GCL Global Holdings Ltd - Warrants" },
-  { s: "GCMG", n: "GCM Grosvenor Inc." },
-  { s: "GCO", n: "Genesco Inc. Common Stock" },
-  { s: "GCT", n: "GigaCloud Technology Inc" },
-  { s: "GCTK", n: "GlucoTrack, Inc." },
-  { s: "GCTS", n: "GCT Semiconductor Holding, Inc. Common Stock" },
-  { s: "GD", n: "General Dynamics Corporation Common Stock" },
-  { s: "GDC", n: "GD Culture Group Limited" },
-  { s: "GDDY", n: "GoDaddy Inc. Class A Common Stock" },
-  { s: "GDEV", n: "GDEV Inc." },
-  { s: "GDHG", n: "Golden Heaven Group Holdings Ltd." },
-  { s: "GDOT", n: "Green Dot Corporation Class A Common Stock, $0.001 par value" },
-  { s: "GDRX", n: "GoodRx Holdings, Inc." },
-  { s: "GDS", n: "GDS Holdings Limited" },
-  { s: "GDTC", n: "CytoMed Therapeutics Limited" },
-  { s: "GDYN", n: "Grid Dynamics Holdings, Inc." },
-  { s: "GE", n: "GE Aerospace Common Stock" },
-  { s: "GEF", n: "Greif Inc. Class A Common Stock" },
-  { s: "GEF-B", n: "Greif, Inc. Corporation Class B Common Stock" },
-  { s: "GEG", n: "Great Elm Group, Inc." },
-  { s: "GEHC", n: "GE HealthCare Technologies Inc." },
-  { s: "GEL", n: "Genesis Energy, L.P. Common Units" },
-  { s: "GELS", n: "Gelteq Limited" },
-  { s: "GEMI", n: "Gemini Space Station, Inc." },
-  { s: "GEN", n: "Gen Digital Inc." },
-  { s: "GENB", n: "Generate Biomedicines, Inc." },
-  { s: "GENC", n: "Gencor Industries, Inc. Common Stock" },
-  { s: "GENI", n: "Genius Sports Limited Ordinary Shares" },
-  { s: "GENK", n: "GEN Restaurant Group, Inc." },
-  { s: "GEOS", n: "Geospace Technologies Corporation" },
-  { s: "GERN", n: "Geron Corporation" },
-  { s: "GETY", n: "Getty Images Holdings, Inc. Class A Common Stock" },
-  { s: "GEV", n: "GE Vernova Inc. Common Stock" },
-  { s: "GEVO", n: "Gevo, Inc." },
-  { s: "GFAI", n: "Guardforce AI Co., Limited" },
-  { s: "GFF", n: "Griffon Corporation Common Stock" },
-  { s: "GFI", n: "Gold Fields Limited American Depositary Shares" },
-  { s: "GFL", n: "GFL Environmental Inc. Subordinate voting shares, no par value" },
-  { s: "GFR", n: "Greenfire Resources Ltd. Common Shares" },
-  { s: "GFS", n: "GlobalFoundries Inc. - Ordinary Share" },
-  { s: "GFUZ", n: "General Fusion Group Ltd. - Common Shares" },
-  { s: "GGAL", n: "Grupo Financiero Galicia S.A." },
-  { s: "GGB", n: "Gerdau S.A. Common Stock" },
-  { s: "GGG", n: "Graco Inc. Common Stock" },
-  { s: "GGR", n: "Gogoro Inc." },
-  { s: "GGRP", n: "The Glimpse Group, Inc." },
-  { s: "GH", n: "Guardant Health, Inc." },
-  { s: "GHC", n: "Graham Holdings Company Common Stock" },
-  { s: "GHG", n: "GreenTree Hospitality Group Ltd. American depositary shares, each representing one Class A ordinary share" },
-  { s: "GHM", n: "Graham Corporation Common Stock" },
-  { s: "GHRS", n: "GH Research PLC" },
-  { s: "GHXIU", n: "Gores Holdings XI, Inc. - Units" },
-  { s: "GIB", n: "CGI Inc. Common Stock" },
-  { s: "GIBO", n: "GIBO Holdings Limited" },
-  { s: "GIBOW", n: "GIBO Holdings Limited - Warrants" },
-  { s: "GIC", n: "Global Industrial Company Common Stock" },
-  { s: "GIFT", n: "Giftify, Inc." },
-  { s: "GIGM", n: "GigaMedia Limited" },
-  { s: "GIII", n: "G-III Apparel Group, LTD." },
-  { s: "GIL", n: "Gildan Activewear, Inc. Class A Sub. Vot. Common Stock" },
-  { s: "GILD", n: "Gilead Sciences, Inc." },
-  { s: "GILT", n: "Gilat Satellite Networks Ltd." },
-  { s: "GIPR", n: "Generation Income Properties Inc." },
-  { s: "GIS", n: "General Mills, Inc. Common Stock" },
-  { s: "GITS", n: "Global Interactive Technologies, Inc. Common Stock" },
-  { s: "GIW", n: "GigCapital8 Corp." },
-  { s: "GIWWU", n: "GigCapital8 Corp. - Units" },
-  { s: "GIX", n: "GigCapital9 Corp." },
-  { s: "GIXXU", n: "GigCapital9 Corp. - Units" },
-  { s: "GJH", n: "Synthetic Fixed-Income Securities Inc 6.375% (STRATS) Cl A-1" },
-  { s: "GKOS", n: "Glaukos Corporation Common Stock" },
-  { s: "GL", n: "Globe Life Inc. Common Stock" },
-  { s: "GLAS", n: "Glass House Brands Inc. Subordinate Voting Shares" },
-  { s: "GLBE", n: "Global-E Online Ltd." },
-  { s: "GLBS", n: "Globus Maritime Limited" },
-  { s: "GLDG", n: "GoldMining Inc. Common Shares" },
-  { s: "GLE", n: "Global Engine Group Holding Limited" },
-  { s: "GLMD", n: "Galmed Pharmaceuticals Ltd." },
-  { s: "GLND", n: "Greenland Energy Company" },
-  { s: "GLNG", n: "Golar LNG Limited - Common Shares" },
-  { s: "GLOB", n: "Globant S.A. Common Shares" },
-  { s: "GLOO", n: "Gloo Holdings, Inc." },
-  { s: "GLPI", n: "Gaming and Leisure Properties, Inc." },
-  { s: "GLRE", n: "Greenlight Reinsurance, Ltd." },
-  { s: "GLSI", n: "Greenwich LifeSciences, Inc." },
-  { s: "GLU", n: "Gabelli Global Utility Common Shares of Beneficial Ownership" },
-  { s: "GLUE", n: "Monte Rosa Therapeutics, Inc." },
-  { s: "GLW", n: "Corning Incorporated Common Stock" },
-  { s: "GLXG", n: "Galaxy Payroll Group Limited" },
-  { s: "GLXY", n: "Galaxy Digital Inc." },
-  { s: "GM", n: "General Motors Company Common Stock" },
-  { s: "GMAB", n: "Genmab A/S" },
-  { s: "GME", n: "GameStop Corporation Common Stock" },
-  { s: "GME-W", n: "GameStop Corporation Warrants to Purchase Common Stock" },
-  { s: "GMED", n: "Globus Medical, Inc. Class A Common Stock" },
-  { s: "GMEX", n: "GMEX ROBOTICS CORPORATION" },
-  { s: "GMHS", n: "Gamehaus Holdings Inc." },
-  { s: "GMM", n: "Global Mofy AI Limited" },
-  { s: "GMRS", n: "GMR Solutions Inc. Class A Common Stock" },
-  { s: "GMTL", n: "Guardian Metal Resources PLC ADS" },
-  { s: "GNE", n: "Genie Energy Ltd. Class B Common Stock Stock" },
-  { s: "GNK", n: "Genco Shipping & Trading Limited Ordinary Shares New (Marshall Islands)" },
-  { s: "GNL", n: "Global Net Lease, Inc. Common Stock" },
-  { s: "GNLN", n: "Greenlane Holdings, Inc." },
-  { s: "GNLX", n: "Genelux Corporation" },
-  { s: "GNPX", n: "Genprex, Inc." },
-  { s: "GNRC", n: "Generac Holdlings Inc. Common Stock" },
-  { s: "GNS", n: "Genius Group Limited Ordinary Shares" },
-  { s: "GNSS", n: "Genasys Inc." },
-  { s: "GNTA", n: "Genenta Science S.p.A." },
-  { s: "GNTX", n: "Gentex Corporation" },
-  { s: "GNW", n: "Genworth Financial Inc Common Stock" },
-  { s: "GO", n: "Grocery Outlet Holding Corp." },
-  { s: "GOAI", n: "Eva Live Inc." },
-  { s: "GOGO", n: "Gogo Inc." },
-  { s: "GOLD", n: "Gold.com, Inc. Common Stock" },
-  { s: "GOLF", n: "Acushnet Holdings Corp. Common Stock" },
-  { s: "GOOG", n: "Alphabet Inc." },
-  { s: "GOOGL", n: "Alphabet Inc." },
-  { s: "GOOS", n: "Canada Goose Holdings Inc. Subordinate Voting Shares" },
-  { s: "GORO", n: "Gold Resource Corporation Common Stock" },
-  { s: "GOSS", n: "Gossamer Bio, Inc." },
-  { s: "GOTU", n: "Gaotu Techedu Inc. American Depositary Shares" },
-  { s: "GOVX", n: "GeoVax Labs, Inc." },
-  { s: "GP", n: "GreenPower Motor Company Inc. - Common Shares" },
-  { s: "GPC", n: "Genuine Parts Company Common Stock" },
-  { s: "GPCR", n: "Structure Therapeutics Inc." },
-  { s: "GPGI", n: "GPGI, Inc. Class A Common Stock" },
-  { s: "GPI", n: "Group 1 Automotive, Inc. Common Stock" },
-  { s: "GPK", n: "Graphic Packaging Holding Company" },
-  { s: "GPN", n: "Global Payments Inc. Common Stock" },
-  { s: "GPOR", n: "Gulfport Energy Corporation Common Shares" },
-  { s: "GPRE", n: "Green Plains, Inc." },
-  { s: "GPRK", n: "Geopark Ltd Common Shares" },
-  { s: "GPRO", n: "GoPro, Inc." },
-  { s: "GPUS", n: "Hyperscale Data, Inc. Common Stock" },
-  { s: "GRAB", n: "Grab Holdings Limited" },
-  { s: "GRAF", n: "Graf Global Corp. Class A ordinary shares" },
-  { s: "GRAL", n: "GRAIL, Inc." },
-  { s: "GRAN", n: "Grande Group Limited" },
-  { s: "GRBK", n: "Green Brick Partners, Inc. Common Stock" },
-  { s: "GRC", n: "Gorman-Rupp Company (The) Common Stock" },
-  { s: "GRCE", n: "Grace Therapeutics, Inc." },
-  { s: "GRDN", n: "Guardian Pharmacy Services, Inc. Class A Common Stock" },
-  { s: "GRDX", n: "GridAI Technologies Corp." },
-  { s: "GREE", n: "Greenidge Generation Holdings Inc." },
-  { s: "GRFS", n: "Grifols, S.A." },
-  { s: "GRI", n: "GRI Bio, Inc." },
-  { s: "GRML", n: "Greenland Mines Ltd" },
-  { s: "GRMLW", n: "Greenland Mines Ltd - Warrants" },
-  { s: "GRMN", n: "Garmin Ltd. Common Stock (Switzerland)" },
-  { s: "GRND", n: "Grindr Inc. Common Stock" },
-  { s: "GRNQ", n: "Greenpro Capital Corp." },
-  { s: "GRNT", n: "Granite Ridge Resources, Inc. Common Stock" },
-  { s: "GRO", n: "Brazil Potash Corp. Common Shares" },
-  { s: "GROV", n: "Grove Collaborative Holdings, Inc. Class A Common Stock" },
-  { s: "GROW", n: "U.S. Global Investors, Inc." },
-  { s: "GROY", n: "Gold Royalty Corp. Common Shares" },
-  { s: "GRPN", n: "Groupon, Inc." },
-  { s: "GRRR", n: "Gorilla Technology Group Inc." },
-  { s: "GRVY", n: "GRAVITY Co., Ltd." },
-  { s: "GRWG", n: "GrowGeneration Corp." },
-  { s: "GS", n: "Goldman Sachs Group, Inc. (The) Common Stock" },
-  { s: "GSAT", n: "Globalstar, Inc." },
-  { s: "GSBC", n: "Great Southern Bancorp, Inc." },
-  { s: "GSBD", n: "Goldman Sachs BDC, Inc. Common Stock" },
-  { s: "GSHD", n: "Goosehead Insurance, Inc." },
-  { s: "GSIT", n: "GSI Technology, Inc." },
-  { s: "GSIW", n: "Garden Stage Limited" },
-  { s: "GSK", n: "GSK plc American Depositary Shares (Each representing two Ordinary Shares)" },
-  { s: "GSL", n: "Global Ship Lease Inc New Class A Common Shares" },
-  { s: "GSM", n: "Ferroglobe PLC" },
-  { s: "GSUN", n: "Golden Sun Technology Group Limited" },
-  { s: "GT", n: "The Goodyear Tire & Rubber Company" },
-  { s: "GTBP", n: "GT Biopharma, Inc." },
-  { s: "GTE", n: "Gran Tierra Energy Inc. Common Stock" },
-  { s: "GTEC", n: "Greenland Technologies Holding Corporation" },
-  { s: "GTEN", n: "Gores Holdings X, Inc." },
-  { s: "GTENU", n: "Gores Holdings X, Inc. - Units" },
-  { s: "GTENW", n: "Gores Holdings X, Inc. - Warrants" },
-  { s: "GTES", n: "Gates Industrial Corporation plc Ordinary Shares" },
-  { s: "GTIM", n: "Good Times Restaurants Inc." },
-  { s: "GTLB", n: "GitLab Inc." },
-  { s: "GTM", n: "ZoomInfo Technologies Inc." },
-  { s: "GTN", n: "Gray Media, Inc. Common Stock" },
-  { s: "GTN-A", n: "Gray Media, Inc. Class A Common Stock" },
-  { s: "GTX", n: "Garrett Motion Inc." },
-  { s: "GTY", n: "Getty Realty Corporation Common Stock" },
-  { s: "GURE", n: "Gulf Resources, Inc." },
-  { s: "GUTS", n: "Fractyl Health, Inc." },
-  { s: "GV", n: "Visionary Holdings Inc. - Common Shares" },
-  { s: "GVA", n: "Granite Construction Incorporated Common Stock" },
-  { s: "GVH", n: "Globavend Holdings Limited - Ord Shares" },
-  { s: "GWAV", n: "Greenwave Technology Solutions, Inc." },
-  { s: "GWH", n: "ESS Tech, Inc. Common Stock" },
-  { s: "GWRE", n: "Guidewire Software, Inc. Common Stock" },
-  { s: "GWRS", n: "Global Water Resources, Inc." },
-  { s: "GWW", n: "W.W. Grainger, Inc. Common Stock" },
-  { s: "GXAI", n: "Gaxos.ai Inc." },
-  { s: "GXO", n: "GXO Logistics, Inc. Common Stock" },
-  { s: "GYRE", n: "Gyre Therapeutics, Inc." },
-  { s: "GYRO", n: "Gyrodyne , LLC" },
-  { s: "H", n: "Hyatt Hotels Corporation Class A Common Stock" },
-  { s: "HAE", n: "Haemonetics Corporation Common Stock" },
-  { s: "HAFC", n: "Hanmi Financial Corporation" },
-  { s: "HAFN", n: "Hafnia Limited Common Shares" },
-  { s: "HAIN", n: "The Hain Celestial Group, Inc." },
-  { s: "HAL", n: "Halliburton Company Common Stock" },
-  { s: "HALO", n: "Halozyme Therapeutics, Inc." },
-  { s: "HAO", n: "Haoxi Health Technology Limited" },
-  { s: "HAPN", n: "Happen, Inc." },
-  { s: "HAS", n: "Hasbro, Inc." },
-  { s: "HASI", n: "HA Sustainable Infrastructure Capital, Inc. Common Stock" },
-  { s: "HAWK", n: "HawkEye 360, Inc. Common Stock" },
-  { s: "HAYW", n: "Hayward Holdings, Inc. Common Stock" },
-  { s: "HBAN", n: "Huntington Bancshares Incorporated" },
-  { s: "HBB", n: "Hamilton Beach Brands Holding Company Class A Common Stock" },
-  { s: "HBCP", n: "Home Bancorp, Inc." },
-  { s: "HBIO", n: "Harvard Bioscience, Inc." },
-  { s: "HBM", n: "Hudbay Minerals Inc. Ordinary Shares (Canada)" },
-  { s: "HBNB", n: "Hotel101 Global Holdings Corp." },
-  { s: "HBNC", n: "Horizon Bancorp, Inc." },
-  { s: "HBT", n: "HBT Financial, Inc." },
-  { s: "HCA", n: "HCA Healthcare, Inc. Common Stock" },
-  { s: "HCAI", n: "Huachen AI Parking Management Technology Holding Co., Ltd." },
-  { s: "HCAT", n: "Health Catalyst, Inc" },
-  { s: "HCC", n: "Warrior Met Coal, Inc. Common Stock" },
-  { s: "HCHL", n: "Happy City Holdings Limited" },
-  { s: "HCI", n: "HCI Group, Inc. Common Stock" },
-  { s: "HCIC", n: "Hennessy Capital Investment Corp. VIII" },
-  { s: "HCICU", n: "Hennessy Capital Investment Corp. VIII - Units" },
-  { s: "HCKT", n: "The Hackett Group, Inc." },
-  { s: "HCM", n: "HUTCHMED (China) Limited" },
-  { s: "HCSG", n: "Healthcare Services Group, Inc." },
-  { s: "HCTI", n: "Healthcare Triangle, Inc." },
-  { s: "HCWB", n: "HCW Biologics Inc." },
-  { s: "HCWC", n: "Healthy Choice Wellness Corp. Class A Common Stock" },
-  { s: "HD", n: "Home Depot, Inc. (The) Common Stock" },
-  { s: "HDB", n: "HDFC Bank Limited Common Stock" },
-  { s: "HDL", n: "SUPER HI INTERNATIONAL HOLDING LTD." },
-  { s: "HDRN", n: "Hadron Energy, Inc." },
-  { s: "HDSN", n: "Hudson Technologies, Inc." },
-  { s: "HE", n: "Hawaiian Electric Industries, Inc. Common Stock" },
-  { s: "HEI", n: "Heico Corporation Common Stock" },
-  { s: "HEI-A", n: "Heico Corporation Common Stock" },
-  { s: "HELE", n: "Helen of Troy Limited" },
-  { s: "HELP", n: "Cybin Inc." },
-  { s: "HEPS", n: "D-Market Electronic Services & Trading" },
-  { s: "HERE", n: "Here Group Limited" },
-  { s: "HFBL", n: "Home Federal Bancorp, Inc. of Louisiana" },
-  { s: "HFFG", n: "HF Foods Group Inc." },
-  { s: "HFWA", n: "Heritage Financial Corporation" },
-  { s: "HG", n: "Hamilton Insurance Group, Ltd. Class B Common Shares" },
-  { s: "HGBL", n: "Heritage Global Inc." },
-  { s: "HGTY", n: "Hagerty, Inc. Class A Common Stock" },
-  { s: "HGV", n: "Hilton Grand Vacations Inc. Common Stock" },
-  { s: "HHH", n: "Howard Hughes Holdings Inc. Common Stock" },
-  { s: "HHS", n: "Harte Hanks, Inc." },
-  { s: "HIFS", n: "Hingham Institution for Savings" },
-  { s: "HIG", n: "The Hartford Insurance Group, Inc. Common Stock" },
-  { s: "HIHO", n: "Highway Holdings Limited" },
-  { s: "HII", n: "Huntington Ingalls Industries, Inc. Common Stock" },
-  { s: "HIMS", n: "Hims & Hers Health, Inc. Class A Common Stock" },
-  { s: "HIMX", n: "Himax Technologies, Inc." },
-  { s: "HIND", n: "Vyome Holdings, Inc." },
-  { s: "HIPO", n: "Hippo Holdings Inc. Common Stock" },
-  { s: "HIT", n: "Health In Tech, Inc." },
-  { s: "HITI", n: "High Tide Inc. - Common Shares" },
-  { s: "HIVE", n: "HIVE Digital Technologies Ltd - Common Shares" },
-  { s: "HIW", n: "Highwoods Properties, Inc. Common Stock" },
-  { s: "HKD", n: "AMTD Digital Inc. American Depositary Shares (every five of which represent two Class A Ordinary Shares)" },
-  { s: "HKIT", n: "Hitek Global Inc." },
-  { s: "HKPD", n: "Cellyan Biotechnology Co., Ltd" },
-  { s: "HL", n: "Hecla Mining Company Common Stock" },
-  { s: "HLF", n: "Herbalife Ltd. Common Shares" },
-  { s: "HLI", n: "Houlihan Lokey, Inc. Class A Common Stock" },
-  { s: "HLIO", n: "Helios Technologies, Inc. Common Stock" },
-  { s: "HLIT", n: "Harmonic Inc." },
-  { s: "HLLY", n: "Holley Inc. Common Stock" },
-  { s: "HLMN", n: "Hillman Solutions Corp." },
-  { s: "HLN", n: "Haleon plc American Depositary Shares (Each representing two Ordinary Shares)" },
-  { s: "HLNE", n: "Hamilton Lane Incorporated" },
-  { s: "HLP", n: "Hongli Group Inc." },
-  { s: "HLT", n: "Hilton Worldwide Holdings Inc. Common Stock" },
-  { s: "HLX", n: "Helix Energy Solutions Group, Inc. Common Stock" },
-  { s: "HMC", n: "Honda Motor Company, Ltd. Common Stock" },
-  { s: "HMH", n: "HMH Holding Inc." },
-  { s: "HMN", n: "Horace Mann Educators Corporation Common Stock" },
-  { s: "HMR", n: "Heidmar Maritime Holdings Corp." },
-  { s: "HMY", n: "Harmony Gold Mining Company Limited" },
-  { s: "HNGE", n: "Hinge Health, Inc. Class A Common Stock" },
-  { s: "HNI", n: "HNI Corporation Common Stock" },
-  { s: "HNNA", n: "Hennessy Advisors, Inc." },
-  { s: "HNRG", n: "Hallador Energy Company" },
-  { s: "HNST", n: "The Honest Company, Inc." },
-  { s: "HNVR", n: "Hanover Bancorp, Inc." },
-  { s: "HODO", n: "House of Doge Inc." },
-  { s: "HOFT", n: "Hooker Furnishings Corporation" },
-  { s: "HOG", n: "Harley-Davidson, Inc. Common Stock" },
-  { s: "HOLO", n: "MicroCloud Hologram Inc." },
-  { s: "HOMB", n: "Home BancShares, Inc. Common Stock" },
-  { s: "HON", n: "Honeywell International Inc." },
-  { s: "HONA", n: "Honeywell Aerospace Inc." },
-  { s: "HOOD", n: "Robinhood Markets, Inc." },
-  { s: "HOPE", n: "Hope Bancorp, Inc." },
-  { s: "HOUR", n: "Hour Loop, Inc." },
-  { s: "HOV", n: "Hovnanian Enterprises, Inc. Class A Common Stock" },
-  { s: "HOVR", n: "New Horizon Aircraft Ltd." },
-  { s: "HOWL", n: "Werewolf Therapeutics, Inc." },
-  { s: "HP", n: "Helmerich & Payne, Inc. Common Stock" },
-  { s: "HPAI", n: "Helport AI Limited" },
-  { s: "HPAIW", n: "Helport AI Limited - Warrants" },
-  { s: "HPE", n: "Hewlett Packard Enterprise Company Common Stock" },
-  { s: "HPK", n: "HighPeak Energy, Inc." },
-  { s: "HPP", n: "Hudson Pacific Properties, Inc. Common Stock" },
-  { s: "HPQ", n: "HP Inc. Common Stock" },
-  { s: "HQ", n: "Horizon Quantum Holdings Ltd." },
-  { s: "HQH", n: "abrdn Healthcare Investors Shares of Beneficial Interest" },
-  { s: "HQI", n: "HireQuest, Inc." },
-  { s: "HQL", n: "abrdn Life Sciences Investors Shares of Beneficial Interest" },
-  { s: "HQY", n: "HealthEquity, Inc." },
-  { s: "HRB", n: "H&R Block, Inc. Common Stock" },
-  { s: "HRI", n: "Herc Holdings Inc. Common Stock" },
-  { s: "HRL", n: "Hormel Foods Corporation Common Stock" },
-  { s: "HRMY", n: "Harmony Biosciences Holdings, Inc." },
-  { s: "HROW", n: "Harrow, Inc." },
-  { s: "HRTG", n: "Heritage Insurance Holdings, Inc. Common Stock" },
-  { s: "HRTX", n: "Heron Therapeutics, Inc." },
-  { s: "HRZN", n: "Horizon Technology Finance Corporation" },
-  { s: "HSAI", n: "Hesai Group - American Depositary Share" },
-  { s: "HSBC", n: "HSBC Holdings, plc. Common Stock" },
-  { s: "HSCS", n: "HeartSciences Inc." },
-  { s: "HSDT", n: "Solana Company" },
-  { s: "HSHP", n: "Himalaya Shipping Ltd. Common Shares" },
-  { s: "HSIC", n: "Henry Schein, Inc." },
-  { s: "HSLV", n: "Highlander Silver Corp. Common Shares" },
-  { s: "HST", n: "Host Hotels & Resorts, Inc." },
-  { s: "HSTM", n: "HealthStream, Inc." },
-  { s: "HSY", n: "The Hershey Company Common Stock" },
-  { s: "HTB", n: "HomeTrust Bancshares, Inc. Common Stock" },
-  { s: "HTCO", n: "High-Trend International Group" },
-  { s: "HTCR", n: "Heartcore Enterprises, Inc." },
-  { s: "HTFL", n: "Heartflow, Inc." },
-  { s: "HTGC", n: "Hercules Capital, Inc. Common Stock" },
-  { s: "HTH", n: "Hilltop Holdings Inc." },
-  { s: "HTHT", n: "H World Group Limited" },
-  { s: "HTLD", n: "Heartland Express, Inc." },
-  { s: "HTLM", n: "HomesToLife Ltd" },
-  { s: "HTO", n: "H2O America" },
-  { s: "HTOO", n: "Fusion Fuel Green PLC" },
-  { s: "HTT", n: "High Templar Tech Limited American depositary shares, each representing one Class A ordinary share" },
-  { s: "HTZ", n: "Hertz Global Holdings, Inc" },
-  { s: "HUBB", n: "Hubbell Inc Common Stock" },
-  { s: "HUBC", n: "Hub Cyber Security Ltd." },
-  { s: "HUBG", n: "Hub Group, Inc." },
-  { s: "HUBS", n: "HubSpot, Inc. Common Stock" },
-  { s: "HUDI", n: "Huadi International Group Co., Ltd." },
-  { s: "HUHU", n: "HUHUTECH International Group Inc." },
-  { s: "HUIZ", n: "Huize Holding Limited" },
-  { s: "HUM", n: "Humana Inc. Common Stock" },
-  { s: "HUMA", n: "Humacyte, Inc." },
-  { s: "HUN", n: "Huntsman Corporation Common Stock" },
-  { s: "HURA", n: "TuHURA Biosciences, Inc." },
-  { s: "HURC", n: "Hurco Companies, Inc." },
-  { s: "HURN", n: "Huron Consulting Group Inc." },
-  { s: "HUT", n: "Hut 8 Corp." },
-  { s: "HUYA", n: "HUYA Inc. American depositary shares, each representing one Class A ordinary share" },
-  { s: "HVII", n: "Hennessy Capital Investment Corp. VII" },
-  { s: "HVMC", n: "Highview Merger Corp." },
-  { s: "HVMCU", n: "Highview Merger Corp. - Units" },
-  { s: "HVMCW", n: "Highview Merger Corp. - Warrants" },
-  { s: "HVT", n: "Haverty Furniture Companies, Inc. Common Stock" },
-  { s: "HVT-A", n: "Haverty Furniture Companies, Inc. Common Stock" },
-  { s: "HWBK", n: "Hawthorn Bancshares, Inc." },
-  { s: "HWC", n: "Hancock Whitney Corporation" },
-  { s: "HWH", n: "HWH International Inc." },
-  { s: "HWKN", n: "Hawkins, Inc." },
-  { s: "HWM", n: "Howmet Aerospace Inc. Common Stock" },
-  { s: "HXHX", n: "Haoxin Holdings Limited" },
-  { s: "HXL", n: "Hexcel Corporation Common Stock" },
-  { s: "HY", n: "Hyster-Yale, Inc. Class A common stock" },
-  { s: "HYFM", n: "Hydrofarm Holdings Group, Inc." },
-  { s: "HYFT", n: "MindWalk Holdings Corp." },
-  { s: "HYLN", n: "Hyliion Holdings Corp. Class A Common Stock" },
-  { s: "HYMC", n: "Hycroft Mining Holding Corporation" },
-  { s: "HYNE", n: "Hoyne Bancorp, Inc." },
-  { s: "HYPD", n: "Hyperion DeFi, Inc." },
-  { s: "HYPR", n: "Hyperfine, Inc." },
-  { s: "HZO", n: "MarineMax, Inc. (FL) Common Stock" },
-  { s: "IAG", n: "Iamgold Corporation Ordinary Shares" },
-  { s: "IART", n: "Integra LifeSciences Holdings Corporation" },
-  { s: "IAUX", n: "i-80 Gold Corp. Common Shares" },
-  { s: "IBCP", n: "Independent Bank Corporation" },
-  { s: "IBEX", n: "IBEX Limited - Common Share" },
-  { s: "IBG", n: "Innovation Beverage Group Limited" },
-  { s: "IBIO", n: "iBio, Inc." },
-  { s: "IBKR", n: "Interactive Brokers Group, Inc." },
-  { s: "IBM", n: "International Business Machines Corporation Common Stock" },
-  { s: "IBN", n: "ICICI Bank Limited Common Stock" },
-  { s: "IBO", n: "Impact BioMedical, Inc. Common Stock" },
-  { s: "IBOC", n: "International Bancshares Corporation" },
-  { s: "IBP", n: "Installed Building Products, Inc. Common Stock" },
-  { s: "IBRX", n: "ImmunityBio, Inc." },
-  { s: "IBTA", n: "Ibotta, Inc. Class A Common Stock" },
-  { s: "ICCC", n: "ImmuCell Corporation" },
-  { s: "ICCM", n: "IceCure Medical Ltd." },
-  { s: "ICE", n: "Intercontinental Exchange Inc. Common Stock" },
-  { s: "ICFI", n: "ICF International, Inc." },
-  { s: "ICG", n: "Intchains Group Limited" },
-  { s: "ICHR", n: "Ichor Holdings" },
-  { s: "ICL", n: "ICL Group Ltd. Ordinary Shares" },
-  { s: "ICLR", n: "ICON plc" },
-  { s: "ICMB", n: "Investcorp Credit Management BDC, Inc." },
-  { s: "ICON", n: "Icon Energy Corp." },
-  { s: "ICU", n: "SeaStar Medical Holding Corporation" },
-  { s: "ICUI", n: "ICU Medical, Inc." },
-  { s: "IDA", n: "IDACORP, Inc. Common Stock" },
-  { s: "IDAI", n: "T Stamp Inc." },
-  { s: "IDCC", n: "InterDigital, Inc." },
-  { s: "IDN", n: "Intellicheck, Inc." },
-  { s: "IDR", n: "Idaho Strategic Resources, Inc. Common Stock" },
-  { s: "IDT", n: "IDT Corporation Class B Common Stock" },
-  { s: "IDXX", n: "IDEXX Laboratories, Inc." },
-  { s: "IDYA", n: "IDEAYA Biosciences, Inc." },
-  { s: "IE", n: "Ivanhoe Electric Inc. Common Stock" },
-  { s: "IEP", n: "Icahn Enterprises L.P. - Depositary Units representing Limited Partner Interests" },
-  { s: "IESC", n: "IES Holdings, Inc." },
-  { s: "IEX", n: "IDEX Corporation Common Stock" },
-  { s: "IFBD", n: "Infobird Co., Ltd" },
-  { s: "IFF", n: "International Flavors & Fragrances, Inc. Common Stock" },
-  { s: "IFRX", n: "InflaRx N.V." },
-  { s: "IFS", n: "Intercorp Financial Services Inc. Common Shares" },
-  { s: "IGC", n: "IGC Pharma, Inc. Common Stock" },
-  { s: "IGIC", n: "International General Insurance Holdings Ltd." },
-  { s: "IH", n: "iHuman Inc. American depositary shares, each representing five Class A ordinary shares" },
-  { s: "IHG", n: "Intercontinental Hotels Group American Depositary Shares (Each representing one Ordinary Share)" },
-  { s: "IHRT", n: "iHeartMedia, Inc." },
-  { s: "IHS", n: "IHS Holding Limited Ordinary Shares" },
-  { s: "III", n: "Information Services Group, Inc." },
-  { s: "IIIN", n: "Insteel Industries, Inc. Common Stock" },
-  { s: "IIIV", n: "i3 Verticals, Inc." },
-  { s: "IIPR", n: "Innovative Industrial Properties, Inc. Common Stock" },
-  { s: "IKT", n: "Inhibikase Therapeutics, Inc." },
-  { s: "ILAG", n: "Intelligent Living Application Group Inc." },
-  { s: "ILLR", n: "Triller Group Inc." },
-  { s: "ILMN", n: "Illumina, Inc." },
-  { s: "IMA", n: "ImageneBio, Inc." },
-  { s: "IMAX", n: "Imax Corporation Common Stock" },
-  { s: "IMCC", n: "IM Cannabis Corp. - Common Shares" },
-  { s: "IMCR", n: "Immunocore Holdings plc" },
-  { s: "IMDX", n: "Insight Molecular Diagnostics Inc." },
-  { s: "IMKTA", n: "Ingles Markets, Incorporated" },
-  { s: "IMMP", n: "Immutep Limited" },
-  { s: "IMMR", n: "Immersion Corporation" },
-  { s: "IMMX", n: "Immix Biopharma, Inc." },
-  { s: "IMNM", n: "Immunome, Inc." },
-  { s: "IMNN", n: "Imunon, Inc." },
-  { s: "IMO", n: "Imperial Oil Limited Common Stock" },
-  { s: "IMOS", n: "ChipMOS TECHNOLOGIES INC." },
-  { s: "IMPP", n: "Imperial Petroleum Inc. - Common Shares" },
-  { s: "IMRN", n: "Immuron Limited" },
-  { s: "IMRX", n: "Immuneering Corporation" },
-  { s: "IMSR", n: "Terrestrial Energy Inc." },
-  { s: "IMTE", n: "Integrated Media Technology Limited" },
-  { s: "IMTX", n: "Immatics N.V." },
-  { s: "IMUX", n: "Immunic, Inc." },
-  { s: "IMVT", n: "Immunovant, Inc." },
-  { s: "IMXI", n: "International Money Express, Inc." },
-  { s: "INAB", n: "IN8bio, Inc." },
-  { s: "INBK", n: "First Internet Bancorp" },
-  { s: "INBS", n: "Intelligent Bio Solutions Inc." },
-  { s: "INBX", n: "Inhibrx Biosciences, Inc." },
-  { s: "INCR", n: "Intercure Ltd." },
-  { s: "INCY", n: "Incyte Corporation" },
-  { s: "INDB", n: "Independent Bank Corp." },
-  { s: "INDI", n: "indie Semiconductor, Inc." },
-  { s: "INDO", n: "Indonesia Energy Corporation Limited Ordinary Shares" },
-  { s: "INDP", n: "Indaptus Therapeutics, Inc." },
-  { s: "INDV", n: "Indivior Pharmaceuticals, Inc." },
-  { s: "INEO", n: "INNEOVA Holdings Limited" },
-  { s: "INFQ", n: "Infleqtion, Inc. Common Stock" },
-  { s: "INFU", n: "InfuSystems Holdings, Inc. Common Stock" },
-  { s: "INFY", n: "Infosys Limited American Depositary Shares" },
-  { s: "ING", n: "ING Group, N.V. Common Stock" },
-  { s: "INGM", n: "Ingram Micro Holding Corporation Common Stock" },
-  { s: "INGN", n: "Inogen, Inc" },
-  { s: "INGR", n: "Ingredion Incorporated Common Stock" },
-  { s: "INHD", n: "Inno Holdings Inc." },
-  { s: "INIO", n: "INNIO N.V." },
-  { s: "INKT", n: "MiNK Therapeutics, Inc." },
-  { s: "INLF", n: "INLIF LIMITED" },
-  { s: "INLX", n: "Intellinetics, Inc. Common Stock" },
-  { s: "INM", n: "InMed Pharmaceuticals Inc. - Common Shares" },
-  { s: "INMB", n: "INmune Bio Inc." },
-  { s: "INMD", n: "InMode Ltd." },
-  { s: "INN", n: "Summit Hotel Properties, Inc. Common Stock" },
-  { s: "INNV", n: "InnovAge Holding Corp." },
-  { s: "INO", n: "Inovio Pharmaceuticals, Inc." },
-  { s: "INOD", n: "Innodata Inc." },
-  { s: "INR", n: "Infinity Natural Resources, Inc. Class A Common Stock" },
-  { s: "INSE", n: "Inspired Entertainment, Inc." },
-  { s: "INSG", n: "Inseego Corp." },
-  { s: "INSM", n: "Insmed Incorporated" },
-  { s: "INSP", n: "Inspire Medical Systems, Inc. Common Stock" },
-  { s: "INSW", n: "International Seaways, Inc. Common Stock" },
-  { s: "INTA", n: "Intapp, Inc." },
-  { s: "INTC", n: "Intel Corporation" },
-  { s: "INTG", n: "The Intergroup Corporation" },
-  { s: "INTJ", n: "Intelligent Group Limited" },
-  { s: "INTR", n: "Inter & Co. Inc." },
-  { s: "INTS", n: "Intensity Therapeutics, Inc." },
-  { s: "INTT", n: "inTest Corporation Common Stock" },
-  { s: "INTU", n: "Intuit Inc." },
-  { s: "INTZ", n: "Intrusion Inc." },
-  { s: "INUV", n: "Inuvo, Inc." },
-  { s: "INV", n: "Innventure, Inc." },
-  { s: "INVA", n: "Innoviva, Inc." },
-  { s: "INVE", n: "Identiv, Inc." },
-  { s: "INVH", n: "Invitation Homes Inc. Common Stock" },
-  { s: "INVX", n: "Innovex International, Inc. Common Stock" },
-  { s: "INVZ", n: "Innoviz Technologies Ltd." },
-  { s: "IONQ", n: "IonQ, Inc. Common Stock" },
-  { s: "IONR", n: "ioneer Ltd" },
-  { s: "IONS", n: "Ionis Pharmaceuticals, Inc." },
-  { s: "IOR", n: "Income Opportunity Realty Investors, Inc. Common Stock" },
-  { s: "IOSP", n: "Innospec Inc." },
-  { s: "IOT", n: "Samsara Inc. Class A Common Stock" },
-  { s: "IOTR", n: "iOThree Limited" },
-  { s: "IOVA", n: "Iovance Biotherapeutics, Inc." },
-  { s: "IP", n: "International Paper Company Common Stock" },
-  { s: "IPAR", n: "Interparfums, Inc." },
-  { s: "IPDN", n: "Professional Diversity Network, Inc." },
-  { s: "IPGP", n: "IPG Photonics Corporation" },
-  { s: "IPHA", n: "Innate Pharma S.A." },
-  { s: "IPI", n: "Intrepid Potash, Inc Common Stock" },
-  { s: "IPM", n: "Intelligent Protection Management Corp." },
-  { s: "IPSC", n: "Century Therapeutics, Inc." },
-  { s: "IPST", n: "IP Strategy Holdings, Inc." },
-  { s: "IPVVU", n: "InterPrivate Investment Partners V, Inc. - Units" },
-  { s: "IPW", n: "iPower Inc." },
-  { s: "IPWR", n: "Ideal Power Inc." },
-  { s: "IPX", n: "IperionX Limited - American Depositary Share" },
-  { s: "IQ", n: "iQIYI, Inc." },
-  { s: "IQMX", n: "IQM Quantum Computers Oyj" },
-  { s: "IQMXW", n: "IQM Quantum Computers Oyj - Warrants to purchase American Depositary Shares" },
-  { s: "IQST", n: "iQSTEL Inc." },
-  { s: "IQV", n: "IQVIA Holdings, Inc. Common Stock" },
-  { s: "IR", n: "Ingersoll Rand Inc. Common Stock" },
-  { s: "IRD", n: "Opus Genetics, Inc." },
-  { s: "IRDM", n: "Iridium Communications Inc" },
-  { s: "IREN", n: "IREN Limited" },
-  { s: "IRHO", n: "Iron Horse Acquisitions II Corp." },
-  { s: "IRHOU", n: "Iron Horse Acquisitions II Corp. - Units" },
-  { s: "IRIX", n: "IRIDEX Corporation" },
-  { s: "IRMD", n: "iRadimed Corporation" },
-  { s: "IRON", n: "Disc Medicine, Inc." },
-  { s: "IRS", n: "IRSA Inversiones Y Representaciones S.A. Global Depositary Shares (Each representing ten shares of Common Stock)" },
-  { s: "IRTC", n: "iRhythm Holdings, Inc." },
-  { s: "IRWD", n: "Ironwood Pharmaceuticals, Inc." },
-  { s: "ISBA", n: "Isabella Bank Corporation" },
-  { s: "ISOU", n: "IsoEnergy Ltd. Common Shares" },
-  { s: "ISPC", n: "iSpecimen Inc." },
-  { s: "ISPR", n: "Ispire Technology Inc." },
-  { s: "ISRG", n: "Intuitive Surgical, Inc." },
-  { s: "ISSC", n: "Innovative Solutions and Support, Inc." },
-  { s: "ISTR", n: "Investar Holding Corporation" },
-  { s: "IT", n: "Gartner, Inc. Common Stock" },
-  { s: "ITG", n: "ITG, Inc." },
-  { s: "ITGR", n: "Integer Holdings Corporation Common Stock" },
-  { s: "ITIC", n: "Investors Title Company" },
-  { s: "ITOC", n: "iTonic Holdings Ltd" },
-  { s: "ITP", n: "IT Tech Packaging, Inc. Common Stock" },
-  { s: "ITRG", n: "Integra Resources Corp. Common Shares" },
-  { s: "ITRI", n: "Itron, Inc." },
-  { s: "ITRN", n: "Ituran Location and Control Ltd." },
-  { s: "ITT", n: "ITT Inc. Common Stock" },
-  { s: "ITW", n: "Illinois Tool Works Inc. Common Stock" },
-  { s: "IVA", n: "Inventiva S.A. - American Depository Shares" },
-  { s: "IVDA", n: "Iveda Solutions, Inc." },
-  { s: "IVF", n: "INVO Fertility, Inc." },
-  { s: "IVR", n: "INVESCO MORTGAGE CAPITAL INC Common Stock" },
-  { s: "IVT", n: "InvenTrust Properties Corp. Common Stock" },
-  { s: "IVVD", n: "Invivyd, Inc." },
-  { s: "IVZ", n: "Invesco Ltd Common Stock" },
-  { s: "IX", n: "ORIX Corporation American Depositary Shares" },
-  { s: "IXHL", n: "Incannex Healthcare Inc." },
-  { s: "IZEA", n: "IZEA Worldwide, Inc." },
-  { s: "IZM", n: "ICZOOM Group Inc." },
-  { s: "J", n: "Jacobs Solutions Inc. Common Stock" },
-  { s: "JACK", n: "Jack In The Box Inc." },
-  { s: "JAGU", n: "Jaguar Uranium Corp. Class A Common Shares" },
-  { s: "JAGX", n: "Jaguar Health, Inc." },
-  { s: "JAKK", n: "JAKKS Pacific, Inc." },
-  { s: "JAN", n: "Janus Living, Inc. Class A-1 Common Stock" },
-  { s: "JANX", n: "Janux Therapeutics, Inc." },
-  { s: "JAZZ", n: "Jazz Pharmaceuticals plc" },
-  { s: "JBDI", n: "JBDI Holdings Limited" },
-  { s: "JBGS", n: "JBG SMITH Properties Common Shares" },
-  { s: "JBHT", n: "J.B. Hunt Transport Services, Inc." },
-  { s: "JBI", n: "Janus International Group, Inc. Common Stock" },
-  { s: "JBIO", n: "Jade Biosciences, Inc." },
-  { s: "JBK", n: "Lehman ABS 3.50 3.50% Adjustable Corp Backed Tr Certs GS Cap I" },
-  { s: "JBL", n: "Jabil Inc. Common Stock" },
-  { s: "JBLU", n: "JetBlue Airways Corporation" },
-  { s: "JBS", n: "JBS N.V. Class A Common Shares" },
-  { s: "JBSS", n: "John B. Sanfilippo & Son, Inc." },
-  { s: "JBTM", n: "JBT Marel Corporation Common Stock" },
-  { s: "JCAP", n: "Jefferson Capital, Inc." },
-  { s: "JCI", n: "Johnson Controls International plc Ordinary Share" },
-  { s: "JCSE", n: "JE Cleantech Holdings Limited" },
-  { s: "JCTC", n: "Jewett-Cameron Trading Company - Common Shares" },
-  { s: "JD", n: "JD.com, Inc." },
-  { s: "JDZG", n: "JIADE LIMITED" },
-  { s: "JEF", n: "Jefferies Financial Group Inc. Common Stock" },
-  { s: "JELD", n: "JELD-WEN Holding, Inc. Common Stock" },
-  { s: "JEM", n: "707 Cayman Holdings Limited" },
-  { s: "JF", n: "J and Friends Holdings Limited" },
-  { s: "JFB", n: "JFB Construction Holdings" },
-  { s: "JFIN", n: "Jiayin Group Inc." },
-  { s: "JFU", n: "9F Inc." },
-  { s: "JG", n: "Aurora Mobile Limited" },
-  { s: "JHX", n: "James Hardie Industries plc. Ordinary Shares" },
-  { s: "JILL", n: "J. Jill, Inc. Common Stock" },
-  { s: "JJSF", n: "J & J Snack Foods Corp." },
-  { s: "JKHY", n: "Jack Henry & Associates, Inc." },
-  { s: "JKS", n: "JinkoSolar Holding Company Limited American Depositary Shares (each representing 4 Common Shares)" },
-  { s: "JL", n: "J-Long Group Limited" },
-  { s: "JLHL", n: "Julong Holding Limited" },
-  { s: "JLL", n: "Jones Lang LaSalle Incorporated Common Stock" },
-  { s: "JMIA", n: "Jumia Technologies AG American Depositary Shares, each representing two Ordinary Shares" },
-  { s: "JMSB", n: "John Marshall Bancorp, Inc." },
-  { s: "JNJ", n: "Johnson & Johnson Common Stock" },
-  { s: "JOB", n: "GEE Group Inc. Common Stock" },
-  { s: "JOBY", n: "Joby Aviation, Inc. Common Stock" },
-  { s: "JOE", n: "St. Joe Company (The) Common Stock" },
-  { s: "JONEU", n: "Jones Ventures INTL Acquisition1 Corp - Units" },
-  { s: "JOUT", n: "Johnson Outdoors Inc." },
-  { s: "JOYY", n: "JOYY Inc." },
-  { s: "JPM", n: "JP Morgan Chase & Co. Common Stock" },
-  { s: "JRSH", n: "Jerash Holdings (US), Inc." },
-  { s: "JRVR", n: "James River Group Holdings, Inc." },
-  { s: "JSPR", n: "Jasper Therapeutics, Inc." },
-  { s: "JTAI", n: "Jet.AI Inc." },
-  { s: "JUNS", n: "Jupiter Neurosciences, Inc." },
-  { s: "JVA", n: "Coffee Holding Co., Inc." },
-  { s: "JWEL", n: "Jowell Global Ltd." },
-  { s: "JXG", n: "JX Luxventure Group Inc." },
-  { s: "JXN", n: "Jackson Financial Inc. Class A Common Stock" },
-  { s: "JYD", n: "Jayud Global Logistics Limited" },
-  { s: "JYNT", n: "The Joint Corp." },
-  { s: "JZ", n: "Jianzhi Education Technology Group Company Limited" },
-  { s: "JZXN", n: "Jiuzi Holdings, Inc." },
-  { s: "KAI", n: "Kadant Inc Common Stock" },
-  { s: "KALA", n: "KALA BIO, Inc." },
-  { s: "KALU", n: "Kaiser Aluminum Corporation" },
-  { s: "KAPA", n: "Kairos Pharma, Ltd. Common Stock" },
-  { s: "KARD", n: "Kardigan, Inc." },
-  { s: "KARO", n: "Karooooo Ltd." },
-  { s: "KAZR", n: "Skyline Builders Group Holding Limited" },
-  { s: "KB", n: "KB Financial Group Inc" },
-  { s: "KBDC", n: "Kayne Anderson BDC, Inc. Common Stock" },
-  { s: "KBH", n: "KB Home Common Stock" },
-  { s: "KBON", n: "Karbon Capital Partners Corp." },
-  { s: "KBONU", n: "Karbon Capital Partners Corp. - Units" },
-  { s: "KBR", n: "KBR, Inc. Common Stock" },
-  { s: "KBSX", n: "FST Corp." },
-  { s: "KC", n: "Kingsoft Cloud Holdings Limited" },
-  { s: "KD", n: "Kyndryl Holdings, Inc. Common Stock" },
-  { s: "KDK", n: "Kodiak AI, Inc." },
-  { s: "KDP", n: "Keurig Dr Pepper Inc." },
-  { s: "KE", n: "Kimball Electronics, Inc." },
-  { s: "KEEL", n: "Keel Infrastructure Corp." },
-  { s: "KELYA", n: "Kelly Services, Inc." },
-  { s: "KELYB", n: "Kelly Services, Inc." },
-  { s: "KEN", n: "Kenon Holdings Ltd. Ordinary Shares" },
-  { s: "KEP", n: "Korea Electric Power Corporation Common Stock" },
-  { s: "KEQU", n: "Kewaunee Scientific Corporation" },
-  { s: "KEX", n: "Kirby Corporation Common Stock" },
-  { s: "KEY", n: "KeyCorp Common Stock" },
-  { s: "KEYS", n: "Keysight Technologies Inc. Common Stock" },
-  { s: "KFFB", n: "Kentucky First Federal Bancorp" },
-  { s: "KFRC", n: "Kforce, Inc. Common Stock" },
-  { s: "KFY", n: "Korn Ferry Common Stock" },
-  { s: "KG", n: "Kestrel Group, Ltd." },
-  { s: "KGC", n: "Kinross Gold Corporation Common Stock" },
-  { s: "KGEI", n: "Kolibri Global Energy Inc." },
-  { s: "KGS", n: "Kodiak Gas Services, Inc. Common Stock" },
-  { s: "KHC", n: "The Kraft Heinz Company" },
-  { s: "KIDS", n: "OrthoPediatrics Corp." },
-  { s: "KIDZ", n: "KIDZ AI Inc." },
-  { s: "KIDZW", n: "KIDZ AI Inc. - Warrants" },
-  { s: "KIM", n: "Kimco Realty Corporation (HC) Common Stock" },
-  { s: "KINS", n: "Kingstone Companies, Inc" },
-  { s: "KITT", n: "Nauticus Robotics, Inc." },
-  { s: "KKR", n: "KKR & Co. Inc. Common Stock" },
-  { s: "KLAC", n: "KLA Corporation" },
-  { s: "KLAR", n: "Klarna Group plc Ordinary Shares" },
-  { s: "KLC", n: "KinderCare Learning Companies, Inc. Common Stock" },
-  { s: "KLIC", n: "Kulicke and Soffa Industries, Inc." },
-  { s: "KLRA", n: "Kailera Therapeutics, Inc." },
-  { s: "KLRS", n: "Kalaris Therapeutics, Inc." },
-  { s: "KLTR", n: "Kaltura, Inc." },
-  { s: "KLXE", n: "KLX Energy Services Holdings, Inc." },
-  { s: "KMB", n: "Kimberly-Clark Corporation" },
-  { s: "KMDA", n: "Kamada Ltd." },
-  { s: "KMI", n: "Kinder Morgan, Inc. Common Stock" },
-  { s: "KMPB", n: "Kemper Corporation 5.875% Fixed-Rate Reset Junior Subordinated Debentures due 2062" },
-  { s: "KMPR", n: "Kemper Corporation" },
-  { s: "KMRK", n: "K-Tech Solutions Company Limited" },
-  { s: "KMT", n: "Kennametal Inc. Common Stock" },
-  { s: "KMTS", n: "Kestra Medical Technologies, Ltd." },
-  { s: "KMX", n: "CarMax Inc" },
-  { s: "KN", n: "Knowles Corporation Common Stock" },
-  { s: "KNDI", n: "Kandi Technologies Group, Inc." },
-  { s: "KNF", n: "Knife Riv Holding Co. Common Stock" },
-  { s: "KNRX", n: "KNOREX LTD. Class A Ordinary Shares" },
-  { s: "KNSA", n: "Kiniksa Pharmaceuticals International, plc" },
-  { s: "KNSL", n: "Kinsale Capital Group, Inc. Common Stock" },
-  { s: "KNTK", n: "Kinetik Holdings Inc. Class A Common Stock" },
-  { s: "KNX", n: "Knight-Swift Transportation Holdings Inc." },
-  { s: "KO", n: "Coca-Cola Company (The) Common Stock" },
-  { s: "KOD", n: "Kodiak Sciences Inc" },
-  { s: "KODK", n: "Eastman Kodak Company Common New" },
-  { s: "KOP", n: "Koppers Holdings Inc. Common Stock" },
-  { s: "KOPN", n: "Kopin Corporation" },
-  { s: "KORE", n: "KORE Group Holdings, Inc. Common Stock" },
-  { s: "KOS", n: "Kosmos Energy Ltd. Common Shares (DE)" },
-  { s: "KOSS", n: "Koss Corporation" },
-  { s: "KPET", n: "KPET Ultra Paceline Corporation Class A Ordinary Shares" },
-  { s: "KPLT", n: "Katapult Holdings, Inc." },
-  { s: "KPRX", n: "Kiora Pharmaceuticals, Inc." },
-  { s: "KPTI", n: "Karyopharm Therapeutics Inc." },
-  { s: "KR", n: "Kroger Company (The) Common Stock" },
-  { s: "KRAQ", n: "KRAKacquisition Corp" },
-  { s: "KRAQW", n: "KRAKacquisition Corp - Warrants" },
-  { s: "KRC", n: "Kilroy Realty Corporation Common Stock" },
-  { s: "KRKR", n: "36Kr Holdings Inc." },
-  { s: "KRMD", n: "KORU Medical Systems, Inc." },
-  { s: "KRMN", n: "Karman Holdings Inc. Common Stock" },
-  { s: "KRNT", n: "Kornit Digital Ltd." },
-  { s: "KRNY", n: "Kearny Financial" },
-  { s: "KRO", n: "Kronos Worldwide Inc Common Stock" },
-  { s: "KROS", n: "Keros Therapeutics, Inc." },
-  { s: "KRP", n: "Kimbell Royalty Partners Common Units Representing Limited Partner Interests" },
-  { s: "KRRO", n: "Korro Bio, Inc." },
-  { s: "KRT", n: "Karat Packaging Inc." },
-  { s: "KRUS", n: "Kura Sushi USA, Inc." },
-  { s: "KRYS", n: "Krystal Biotech, Inc." },
-  { s: "KSCP", n: "Knightscope, Inc." },
-  { s: "KSPI", n: "Joint Stock Company Kaspi.kz - American Depository Shares" },
-  { s: "KSS", n: "Kohl's Corporation Common Stock" },
-  { s: "KT", n: "KT Corporation Common Stock" },
-  { s: "KTB", n: "Kontoor Brands, Inc. Common Stock" },
-  { s: "KTCC", n: "Key Tronic Corporation" },
-  { s: "KTOS", n: "Kratos Defense & Security Solutions, Inc." },
-  { s: "KTTA", n: "Pasithea Therapeutics Corp." },
-  { s: "KULR", n: "KULR Technology Group, Inc. Common Stock" },
-  { s: "KURA", n: "Kura Oncology, Inc." },
-  { s: "KUST", n: "Kustom Entertainment, Inc." },
-  { s: "KVHI", n: "KVH Industries, Inc." },
-  { s: "KVUE", n: "Kenvue Inc. Common Stock" },
-  { s: "KWM", n: "K Wave Media, Ltd." },
-  { s: "KWR", n: "Quaker Houghton Common Stock" },
-  { s: "KWY", n: "Kingsway Corporation Common Stock" },
-  { s: "KXIN", n: "Kaixin Holdings" },
-  { s: "KYIV", n: "Kyivstar Group Ltd. - Common Shares" },
-  { s: "KYMR", n: "Kymera Therapeutics, Inc." },
-  { s: "KYNB", n: "Kyntra Bio, Inc." },
-  { s: "KYTX", n: "Kyverna Therapeutics, Inc." },
-  { s: "KZIA", n: "Kazia Therapeutics Limited" },
-  { s: "L", n: "Loews Corporation Common Stock" },
-  { s: "LAB", n: "Standard BioTools Inc." },
-  { s: "LABT", n: "Lakewood-Amedex Biotherapeutics Inc." },
-  { s: "LAC", n: "Lithium Americas Corp. Common Shares" },
-  { s: "LAD", n: "Lithia Motors, Inc. Common Stock" },
-  { s: "LADR", n: "Ladder Capital Corp Class A Common Stock" },
-  { s: "LAES", n: "SEALSQ Corp" },
-  { s: "LAKE", n: "Lakeland Industries, Inc." },
-  { s: "LAMR", n: "Lamar Advertising Company" },
-  { s: "LAND", n: "Gladstone Land Corporation" },
-  { s: "LANV", n: "Lanvin Group Holdings Limited Ordinary Shares" },
-  { s: "LAR", n: "Lithium Argentina AG Common Shares" },
-  { s: "LARK", n: "Landmark Bancorp Inc." },
-  { s: "LASE", n: "Laser Photonics Corporation" },
-  { s: "LASR", n: "nLIGHT, Inc." },
-  { s: "LAUR", n: "Laureate Education, Inc." },
-  { s: "LAW", n: "CS Disco, Inc. Common Stock" },
-  { s: "LAWR", n: "Robot Consulting Co., Ltd." },
-  { s: "LAZ", n: "Lazard, Inc. Common Stock" },
-  { s: "LB", n: "LandBridge Company LLC Class A Shares Representing Limited Liability Company Interests" },
-  { s: "LBGJ", n: "Li Bang International Corporation Inc." },
-  { s: "LBRDA", n: "Liberty Broadband Corporation" },
-  { s: "LBRDK", n: "Liberty Broadband Corporation" },
-  { s: "LBRT", n: "Liberty Energy Inc. Class A common stock" },
-  { s: "LBRX", n: "LB Pharmaceuticals Inc" },
-  { s: "LBTYA", n: "Liberty Global Ltd." },
-  { s: "LBTYB", n: "Liberty Global Ltd." },
-  { s: "LBTYK", n: "Liberty Global Ltd." },
-  { s: "LCFY", n: "Locafy Limited - Ordinary Share" },
-  { s: "LCID", n: "Lucid Group, Inc." },
-  { s: "LCII", n: "LCI Industries" },
-  { s: "LCLN", n: "Lincoln International, Inc. Class A Common Stock" },
-  { s: "LCNB", n: "LCNB Corporation" },
-  { s: "LCTX", n: "Lineage Cell Therapeutics, Inc. Common Stock" },
-  { s: "LCUT", n: "Lifetime Brands, Inc." },
-  { s: "LDI", n: "loanDepot, Inc. Class A Common Stock" },
-  { s: "LDOS", n: "Leidos Holdings, Inc. Common Stock" },
-  { s: "LE", n: "Lands' End, Inc." },
-  { s: "LEA", n: "Lear Corporation Common Stock" },
-  { s: "LECO", n: "Lincoln Electric Holdings, Inc. - Common Shares" },
-  { s: "LEDS", n: "SemiLEDS Corporation" },
-  { s: "LEE", n: "Lee Enterprises, Incorporated" },
-  { s: "LEG", n: "Leggett & Platt, Incorporated Common Stock" },
-  { s: "LEGH", n: "Legacy Housing Corporation" },
-  { s: "LEGN", n: "Legend Biotech Corporation" },
-  { s: "LEGO", n: "Legato Merger Corp. IV Ordinary Shares" },
-  { s: "LEN", n: "Lennar Corporation Class A Common Stock" },
-  { s: "LEN-B", n: "Lennar Corporation Class B" },
-  { s: "LENZ", n: "LENZ Therapeutics, Inc." },
-  { s: "LEO", n: "BNY Mellon Strategic Municipals, Inc. Common Stock" },
-  { s: "LESL", n: "Leslie's, Inc." },
-  { s: "LEU", n: "Centrus Energy Corp. Class A Common Stock" },
-  { s: "LEVI", n: "Levi Strauss & Co Class A Common Stock" },
-  { s: "LEXX", n: "Lexaria Bioscience Corp." },
-  { s: "LFCR", n: "Lifecore Biomedical, Inc." },
-  { s: "LFMD", n: "LifeMD, Inc." },
-  { s: "LFS", n: "LEIFRAS Co., Ltd." },
-  { s: "LFST", n: "LifeStance Health Group, Inc." },
-  { s: "LFTO", n: "Liftoff Mobile, Inc." },
-  { s: "LFUS", n: "Littelfuse, Inc." },
-  { s: "LFVN", n: "Lifevantage Corporation" },
-  { s: "LFWD", n: "Lifeward Ltd." },
-  { s: "LGCL", n: "Lucas GC Limited" },
-  { s: "LGCY", n: "Legacy Education Inc. Common Stock" },
-  { s: "LGHL", n: "Lion Group Holding Ltd. - American Depositary Share" },
-  { s: "LGIH", n: "LGI Homes, Inc." },
-  { s: "LGL", n: "LGL Group, Inc. (The) Common Stock" },
-  { s: "LGN", n: "Legence Corp." },
-  { s: "LGND", n: "Ligand Pharmaceuticals Incorporated" },
-  { s: "LGO", n: "Largo Inc. - Common Shares" },
-  { s: "LGPS", n: "LogProstyle Inc. Common Shares" },
-  { s: "LGVN", n: "Longeveron Inc." },
-  { s: "LH", n: "Labcorp Holdings Inc. Common Stock" },
-  { s: "LHAI", n: "Linkhome Holdings Inc." },
-  { s: "LHSW", n: "Lianhe Sowell International Group Ltd" },
-  { s: "LHX", n: "L3Harris Technologies, Inc. Common Stock" },
-  { s: "LI", n: "Li Auto Inc." },
-  { s: "LICN", n: "Lichen International Limited" },
-  { s: "LIDR", n: "AEye, Inc." },
-  { s: "LIEN", n: "Chicago Atlantic BDC, Inc." },
-  { s: "LIF", n: "Life360, Inc." },
-  { s: "LIFE", n: "Ethos Technologies Inc." },
-  { s: "LII", n: "Lennox International, Inc. Common Stock" },
-  { s: "LILA", n: "Liberty Latin America Ltd." },
-  { s: "LILAK", n: "Liberty Latin America Ltd." },
-  { s: "LIME", n: "Neutron Holdings, Inc." },
-  { s: "LIMN", n: "Liminatus Pharma, Inc." },
-  { s: "LIMNW", n: "Liminatus Pharma, Inc. - Warrants" },
-  { s: "LIN", n: "Linde plc" },
-  { s: "LINC", n: "Lincoln Educational Services Corporation" },
-  { s: "LIND", n: "Lindblad Expeditions Holdings Inc." },
-  { s: "LINE", n: "Lineage, Inc." },
-  { s: "LINK", n: "Interlink Electronics, Inc." },
-  { s: "LION", n: "Lionsgate Studios Corp Common Shares" },
-  { s: "LIQT", n: "LiqTech International, Inc." },
-  { s: "LITB", n: "LightInTheBox Holding Co., Ltd. American Depositary Shares, each representing twelve ordinary shares" },
-  { s: "LITE", n: "Lumentum Holdings Inc." },
-  { s: "LITS", n: "Lite Strategy, Inc." },
-  { s: "LIVE", n: "Live Ventures Incorporated" },
-  { s: "LIVN", n: "LivaNova PLC" },
-  { s: "LKFN", n: "Lakeland Financial Corporation" },
-  { s: "LKFT", n: "Lakefront Biotherapeutics" },
-  { s: "LKQ", n: "LKQ Corporation" },
-  { s: "LLY", n: "Eli Lilly and Company Common Stock" },
-  { s: "LMAT", n: "LeMaitre Vascular, Inc." },
-  { s: "LMB", n: "Limbach Holdings, Inc." },
-  { s: "LMFA", n: "LM Funding America, Inc." },
-  { s: "LMND", n: "Lemonade, Inc. Common Stock" },
-  { s: "LMNR", n: "Limoneira Co" },
-  { s: "LMRI", n: "Lumexa Imaging Holdings, Inc." },
-  { s: "LMT", n: "Lockheed Martin Corporation Common Stock" },
-  { s: "LNAI", n: "Lunai Bioworks Inc." },
-  { s: "LNC", n: "Lincoln National Corporation Common Stock" },
-  { s: "LNG", n: "Cheniere Energy, Inc. Common Stock" },
-  { s: "LNKS", n: "Linkers Industries Limited" },
-  { s: "LNN", n: "Lindsay Corporation Common Stock" },
-  { s: "LNSR", n: "LENSAR, Inc." },
-  { s: "LNT", n: "Alliant Energy Corporation" },
-  { s: "LNTH", n: "Lantheus Holdings, Inc." },
-  { s: "LNZA", n: "LanzaTech Global, Inc." },
-  { s: "LOAN", n: "Manhattan Bridge Capital, Inc" },
-  { s: "LOAR", n: "Loar Holdings Inc. Common Stock" },
-  { s: "LOB", n: "Live Oak Bancshares, Inc. Common Stock" },
-  { s: "LOBO", n: "LOBO TECHNOLOGIES LTD." },
-  { s: "LOCL", n: "Local Bounti Corporation Common Stock" },
-  { s: "LOCO", n: "El Pollo Loco Holdings, Inc." },
-  { s: "LODE", n: "Comstock Inc. Common Stock" },
-  { s: "LOGI", n: "Logitech International S.A. - Registered Shares" },
-  { s: "LOMA", n: "Loma Negra Compania Industrial Argentina Sociedad Anonima ADS" },
-  { s: "LONA", n: "LeonaBio, Inc." },
-  { s: "LOOP", n: "Loop Industries, Inc." },
-  { s: "LOPE", n: "Grand Canyon Education, Inc." },
-  { s: "LOT", n: "Lotus Technology Inc." },
-  { s: "LOTWW", n: "Lotus Technology Inc. - Warrants" },
-  { s: "LOVE", n: "The Lovesac Company" },
-  { s: "LOW", n: "Lowe's Companies, Inc. Common Stock" },
-  { s: "LPA", n: "Logistic Properties of the Americas Ordinary Shares" },
-  { s: "LPCN", n: "Lipocine Inc." },
-  { s: "LPG", n: "Dorian LPG Ltd. Common Stock" },
-  { s: "LPL", n: "LG Display Co, Ltd AMERICAN DEPOSITORY SHARES" },
-  { s: "LPLA", n: "LPL Financial Holdings Inc." },
-  { s: "LPRO", n: "Open Lending Corporation" },
-  { s: "LPSN", n: "LivePerson, Inc." },
-  { s: "LPTH", n: "LightPath Technologies, Inc." },
-  { s: "LPX", n: "Louisiana-Pacific Corporation Common Stock" },
-  { s: "LQDA", n: "Liquidia Corporation" },
-  { s: "LQDT", n: "Liquidity Services, Inc." },
-  { s: "LRCX", n: "Lam Research Corporation" },
-  { s: "LRE", n: "Lead Real Estate Co., Ltd" },
-  { s: "LRHC", n: "La Rosa Holdings Corp." },
-  { s: "LRMR", n: "Larimar Therapeutics, Inc." },
-  { s: "LRN", n: "Stride, Inc. Common Stock" },
-  { s: "LSAK", n: "Lesaka Technologies, Inc." },
-  { s: "LSBK", n: "Lake Shore Bancorp, Inc." },
-  { s: "LSCC", n: "Lattice Semiconductor Corporation" },
-  { s: "LSE", n: "Leishen Energy Holding Co., Ltd." },
-  { s: "LSF", n: "Laird Superfood, Inc. Common Stock" },
-  { s: "LSH", n: "Lakeside Holding Limited" },
-  { s: "LSPD", n: "Lightspeed Commerce Inc. Subordinate Voting Shares" },
-  { s: "LSTA", n: "Lisata Therapeutics, Inc." },
-  { s: "LSTR", n: "Landstar System, Inc." },
-  { s: "LTBR", n: "Lightbridge Corporation" },
-  { s: "LTC", n: "LTC Properties, Inc. Common Stock" },
-  { s: "LTGRU", n: "Long Table Growth Corp. - Units" },
-  { s: "LTH", n: "Life Time Group Holdings, Inc. Common Stock" },
-  { s: "LTM", n: "LATAM Airlines Group S.A. American Depositary Shares (each representing two thousand (2,000) shares of Common Stock)" },
-  { s: "LTRN", n: "Lantern Pharma Inc." },
-  { s: "LTRX", n: "Lantronix, Inc." },
-  { s: "LU", n: "Lufax Holding Ltd American Depositary Shares, each representing two (2) Ordinary Shares" },
-  { s: "LUCD", n: "Lucid Diagnostics Inc." },
-  { s: "LUCK", n: "Lucky Strike Entertainment Corporation Class A Common Stock" },
-  { s: "LUCY", n: "Innovative Eyewear, Inc." },
-  { s: "LUCYW", n: "Innovative Eyewear, Inc. - Warrants" },
-  { s: "LUD", n: "Luda Technology Group Limited Ordinary Shares" },
-  { s: "LULU", n: "lululemon athletica inc." },
-  { s: "LUMN", n: "Lumen Technologies, Inc. Common Stock" },
-  { s: "LUNG", n: "Pulmonx Corporation" },
-  { s: "LUNR", n: "Intuitive Machines, Inc." },
-  { s: "LUV", n: "Southwest Airlines Company Common Stock" },
-  { s: "LUXE", n: "LuxExperience B.V. American Depositary Shares, each representing one Ordinary Share" },
-  { s: "LVLU", n: "Lulu's Fashion Lounge Holdings, Inc." },
-  { s: "LVO", n: "LiveOne, Inc." },
-  { s: "LVS", n: "Las Vegas Sands Corp. Common Stock" },
-  { s: "LVWR", n: "LiveWire Group, Inc. Common Stock" },
-  { s: "LW", n: "Lamb Weston Holdings, Inc. Common Stock" },
-  { s: "LWAY", n: "Lifeway Foods, Inc." },
-  { s: "LWLG", n: "Lightwave Logic, Inc." },
-  { s: "LX", n: "LexinFintech Holdings Ltd." },
-  { s: "LXEH", n: "Lixiang Education Holding Co., Ltd." },
-  { s: "LXEO", n: "Lexeo Therapeutics, Inc." },
-  { s: "LXFR", n: "Luxfer Holdings PLC Ordinary Shares" },
-  { s: "LXRX", n: "Lexicon Pharmaceuticals, Inc." },
-  { s: "LXU", n: "LSB Industries, Inc. Common Stock" },
-  { s: "LYB", n: "LyondellBasell Industries NV Ordinary Shares Class A (Netherlands)" },
-  { s: "LYEL", n: "Lyell Immunopharma, Inc." },
-  { s: "LYFT", n: "Lyft, Inc." },
-  { s: "LYG", n: "Lloyds Banking Group Plc American Depositary Shares" },
-  { s: "LYTS", n: "LSI Industries Inc." },
-  { s: "LYV", n: "Live Nation Entertainment, Inc. Common Stock" },
-  { s: "LZ", n: "LegalZoom.com, Inc." },
-  { s: "LZB", n: "La-Z-Boy Incorporated Common Stock" },
-  { s: "LZM", n: "Lifezone Metals Limited Ordinary Shares" },
-  { s: "LZM-W", n: "Lifezone Metals Limited Warrants" },
-  { s: "LZMH", n: "LZ Technology Holdings Limited" },
-  { s: "M", n: "Macy's Inc Common Stock" },
-  { s: "MA", n: "Mastercard Incorporated Common Stock" },
-  { s: "MAA", n: "Mid-America Apartment Communities, Inc. Common Stock" },
-  { s: "MAAS", n: "Maase Inc." },
-  { s: "MAC", n: "Macerich Company (The) Common Stock" },
-  { s: "MAGH", n: "Magnitude International Ltd" },
-  { s: "MAGN", n: "Magnera Corporation Common Stock" },
-  { s: "MAIA", n: "MAIA Biotechnology, Inc. Common Stock" },
-  { s: "MAIN", n: "Main Street Capital Corporation Common Stock" },
-  { s: "MAIR", n: "Madison Air Solutions Corporation Class A Common Stock" },
-  { s: "MAKO", n: "Mako Mining Corp" },
-  { s: "MAMA", n: "Mama's Creations, Inc." },
-  { s: "MAMK", n: "MaxsMaking Inc." },
-  { s: "MAMO", n: "Massimo Group" },
-  { s: "MAN", n: "ManpowerGroup Common Stock" },
-  { s: "MANE", n: "Veradermics, Incorporated Common Stock" },
-  { s: "MANH", n: "Manhattan Associates, Inc." },
-  { s: "MANU", n: "Manchester United Ltd. Class A Ordinary Shares" },
-  { s: "MAR", n: "Marriott International" },
-  { s: "MARA", n: "MARA Holdings, Inc." },
-  { s: "MAS", n: "Masco Corporation Common Stock" },
-  { s: "MASK", n: "3 E Network Technology Group Ltd" },
-  { s: "MASS", n: "908 Devices Inc." },
-  { s: "MAT", n: "Mattel, Inc." },
-  { s: "MATH", n: "Metalpha Technology Holding Limited" },
-  { s: "MATV", n: "Mativ Holdings, Inc. Common Stock" },
-  { s: "MATW", n: "Matthews International Corporation" },
-  { s: "MATX", n: "Matson, Inc. Common Stock" },
-  { s: "MAX", n: "MediaAlpha, Inc. Class A Common Stock" },
-  { s: "MAYS", n: "J. W. Mays, Inc." },
-  { s: "MAZE", n: "Maze Therapeutics, Inc." },
-  { s: "MB", n: "MasterBeef Group" },
-  { s: "MBAI", n: "Check-Cap Ltd. - Ordinary Share" },
-  { s: "MBBC", n: "Marathon Bancorp, Inc." },
-  { s: "MBC", n: "MasterBrand, Inc. Common Stock" },
-  { s: "MBGL", n: "Mobility Global Inc. Common Stock" },
-  { s: "MBI", n: "MBIA Inc. Common Stock" },
-  { s: "MBIN", n: "Merchants Bancorp" },
-  { s: "MBIO", n: "Mustang Bio, Inc." },
-  { s: "MBLY", n: "Mobileye Global Inc." },
-  { s: "MBOT", n: "Microbot Medical Inc." },
-  { s: "MBRX", n: "Moleculin Biotech, Inc." },
-  { s: "MBUU", n: "Malibu Boats, Inc." },
-  { s: "MBWM", n: "Mercantile Bank Corporation" },
-  { s: "MBX", n: "MBX Biosciences, Inc." },
-  { s: "MC", n: "Moelis & Company Class A Common Stock" },
-  { s: "MCB", n: "Metropolitan Bank Holding Corp. Common Stock" },
-  { s: "MCBS", n: "MetroCity Bankshares, Inc." },
-  { s: "MCD", n: "McDonald's Corporation Common Stock" },
-  { s: "MCFT", n: "MasterCraft Boat Holdings, Inc." },
-  { s: "MCHB", n: "Mechanics Bancorp" },
-  { s: "MCHP", n: "Microchip Technology Incorporated" },
-  { s: "MCHX", n: "Marchex, Inc." },
-  { s: "MCI", n: "Barings Corporate Investors Common Stock" },
-  { s: "MCK", n: "McKesson Corporation Common Stock" },
-  { s: "MCO", n: "Moody's Corporation Common Stock" },
-  { s: "MCRB", n: "Seres Therapeutics, Inc." },
-  { s: "MCRI", n: "Monarch Casino & Resort, Inc." },
-  { s: "MCRP", n: "Micropolis AI Robotics Ordinary Shares" },
-  { s: "MCS", n: "Marcus Corporation (The) Common Stock" },
-  { s: "MCTA", n: "Charming Medical Limited" },
-  { s: "MCY", n: "Mercury General Corporation Common Stock" },
-  { s: "MD", n: "Pediatrix Medical Group, Inc. Common Stock" },
-  { s: "MDA", n: "MDA Space Ltd. Common Shares" },
-  { s: "MDAI", n: "Spectral AI, Inc." },
-  { s: "MDAIW", n: "Spectral AI, Inc. - Warrants" },
-  { s: "MDB", n: "MongoDB, Inc." },
-  { s: "MDBH", n: "MDB Capital Holdings, LLC" },
-  { s: "MDCX", n: "Medicus Pharma Ltd." },
-  { s: "MDGL", n: "Madrigal Pharmaceuticals, Inc." },
-  { s: "MDIA", n: "Mediaco Holding Inc." },
-  { s: "MDLN", n: "Medline Inc." },
-  { s: "MDLZ", n: "Mondelez International, Inc." },
-  { s: "MDRR", n: "Medalist Diversified, Inc." },
-  { s: "MDT", n: "Medtronic plc. Ordinary Shares" },
-  { s: "MDU", n: "MDU Resources Group, Inc. Common Stock (Holding Company)" },
-  { s: "MDV", n: "Modiv Industrial, Inc. Class C Common Stock" },
-  { s: "MDWD", n: "MediWound Ltd." },
-  { s: "MDXG", n: "MiMedx Group, Inc" },
-  { s: "MDXH", n: "MDxHealth SA" },
-  { s: "MEC", n: "Mayville Engineering Company, Inc. Common Stock" },
-  { s: "MED", n: "MEDIFAST INC Common Stock" },
-  { s: "MEDP", n: "Medpace Holdings, Inc." },
-  { s: "MEGL", n: "Magic Empire Global Limited" },
-  { s: "MEI", n: "Methode Electronics, Inc. Common Stock" },
-  { s: "MELI", n: "MercadoLibre, Inc." },
-  { s: "MENS", n: "Jyong Biotech Ltd." },
-  { s: "MEOH", n: "Methanex Corporation" },
-  { s: "MERC", n: "Mercer International Inc." },
-  { s: "MESO", n: "Mesoblast Limited" },
-  { s: "MET", n: "MetLife, Inc. Common Stock" },
-  { s: "META", n: "Meta Platforms, Inc." },
-  { s: "METC", n: "Ramaco Resources, Inc." },
-  { s: "METCB", n: "Ramaco Resources, Inc." },
-  { s: "MFA", n: "MFA Financial, Inc." },
-  { s: "MFC", n: "Manulife Financial Corporation Common Stock" },
-  { s: "MFI", n: "mF International Limited" },
-  { s: "MFIN", n: "Medallion Financial Corp." },
-  { s: "MFP", n: "Midera Food Processing, Inc." },
-  { s: "MG", n: "Mistras Group Inc Common Stock" },
-  { s: "MGA", n: "Magna International, Inc. Common Stock" },
-  { s: "MGEE", n: "MGE Energy Inc." },
-  { s: "MGIH", n: "Millennium Group International Holdings Limited" },
-  { s: "MGLD", n: "The Marygold Companies, Inc. Common Stock" },
-  { s: "MGM", n: "MGM Resorts International Common Stock" },
-  { s: "MGN", n: "Megan Holdings Limited" },
-  { s: "MGNI", n: "Magnite, Inc." },
-  { s: "MGNX", n: "MacroGenics, Inc." },
-  { s: "MGPI", n: "MGP Ingredients, Inc." },
-  { s: "MGRC", n: "McGrath RentCorp" },
-  { s: "MGRT", n: "Mega Fortune Company Limited" },
-  { s: "MGRX", n: "Mangoceuticals, Inc." },
-  { s: "MGTX", n: "MeiraGTx Holdings plc" },
-  { s: "MGX", n: "Metagenomi Therapeutics, Inc." },
-  { s: "MGY", n: "Magnolia Oil & Gas Corporation Class A Common Stock" },
-  { s: "MGYR", n: "Magyar Bancorp, Inc." },
-  { s: "MH", n: "McGraw Hill, Inc. Common Stock" },
-  { s: "MHH", n: "Mastech Digital, Inc Common Stock" },
-  { s: "MHK", n: "Mohawk Industries, Inc. Common Stock" },
-  { s: "MHO", n: "M/I Homes, Inc. Common Stock" },
-  { s: "MI", n: "NFT Limited Class A Ordinary Share" },
-  { s: "MIAX", n: "Miami International Holdings, Inc. Common Stock" },
-  { s: "MICC", n: "The Magnum Ice Cream Company N.V. Ordinary Shares" },
-  { s: "MIDD", n: "The Middleby Corporation" },
-  { s: "MIMI", n: "Mint Incorporation Limited" },
-  { s: "MIND", n: "MIND Technology, Inc." },
-  { s: "MINE", n: "Mayfair Gold Corp. Common Shares" },
-  { s: "MIR", n: "Mirion Technologies, Inc. Class A Common Stock" },
-  { s: "MIRA", n: "MIRA Pharmaceuticals, Inc." },
-  { s: "MIRM", n: "Mirum Pharmaceuticals, Inc." },
-  { s: "MIST", n: "Milestone Pharmaceuticals Inc. - Common Shares" },
-  { s: "MITK", n: "Mitek Systems, Inc." },
-  { s: "MITQ", n: "Moving iMage Technologies, Inc. Common Stock" },
-  { s: "MKC", n: "McCormick & Company, Incorporated Common Stock" },
-  { s: "MKC-V", n: "McCormick & Company, Incorporated Common Stock" },
-  { s: "MKDW", n: "MKDWELL Tech Inc." },
-  { s: "MKDWW", n: "MKDWELL Tech Inc. - Warrants" },
-  { s: "MKL", n: "Markel Group Inc. Common Stock" },
-  { s: "MKSI", n: "MKS Inc." },
-  { s: "MKTW", n: "MarketWise, Inc." },
-  { s: "MKTX", n: "MarketAxess Holdings, Inc." },
-  { s: "MKZR", n: "MacKenzie Realty Capital, Inc." },
-  { s: "MLAB", n: "Mesa Laboratories, Inc." },
-  { s: "MLCI", n: "Mount Logan Capital Inc." },
-  { s: "MLCO", n: "Melco Resorts & Entertainment Limited" },
-  { s: "MLEC", n: "Moolec Science SA" },
-  { s: "MLGO", n: "MicroAlgo, Inc." },
-  { s: "MLI", n: "Mueller Industries, Inc. Common Stock" },
-  { s: "MLKN", n: "MillerKnoll, Inc." },
-  { s: "MLM", n: "Martin Marietta Materials, Inc. Common Stock" },
-  { s: "MLP", n: "Maui Land & Pineapple Company, Inc. Common Stock" },
-  { s: "MLR", n: "Miller Industries, Inc. Common Stock" },
-  { s: "MLSS", n: "Milestone Scientific, Inc. Common Stock" },
-  { s: "MLTX", n: "MoonLake Immunotherapeutics" },
-  { s: "MLYS", n: "Mineralys Therapeutics, Inc." },
-  { s: "MMA", n: "Mixed Martial Arts Group Limited Ordinary Shares" },
-  { s: "MMED", n: "MiniMed Group, Inc." },
-  { s: "MMI", n: "Marcus & Millichap, Inc. Common Stock" },
-  { s: "MMLP", n: "Martin Midstream Partners L.P. - Common Units Representing Limited Partnership Interests" },
-  { s: "MMM", n: "3M Company Common Stock" },
-  { s: "MMS", n: "Maximus, Inc. Common Stock" },
-  { s: "MMSI", n: "Merit Medical Systems, Inc." },
-  { s: "MMYT", n: "MakeMyTrip Limited" },
-  { s: "MNDO", n: "MIND C.T.I. Ltd." },
-  { s: "MNDR", n: "Mobile-health Network Solutions" },
-  { s: "MNDY", n: "monday.com Ltd." },
-  { s: "MNKD", n: "MannKind Corporation" },
-  { s: "MNOV", n: "MediciNova, Inc." },
-  { s: "MNPR", n: "Monopar Therapeutics Inc." },
-  { s: "MNRO", n: "Monro, Inc." },
-  { s: "MNSB", n: "MainStreet Bancshares, Inc." },
-  { s: "MNSBP", n: "MainStreet Bancshares, Inc. - Depositary Shares" },
-  { s: "MNSO", n: "MINISO Group Holding Limited American Depositary Shares, each representing four Ordinary Shares" },
-  { s: "MNST", n: "Monster Beverage Corporation" },
-  { s: "MNTK", n: "Montauk Renewables, Inc." },
-  { s: "MNTN", n: "MNTN, Inc. Class A Common Stock" },
-  { s: "MNTS", n: "Momentus Inc." },
-  { s: "MNY", n: "MoneyHero Limited" },
-  { s: "MNYWW", n: "MoneyHero Limited - Warrants" },
-  { s: "MO", n: "Altria Group, Inc." },
-  { s: "MOB", n: "Mobilicom Limited" },
-  { s: "MOBBW", n: "Mobilicom Limited - Warrants" },
-  { s: "MOBI", n: "Mobia Medical, Inc." },
-  { s: "MOBX", n: "Mobix Labs, Inc." },
-  { s: "MOBXW", n: "Mobix Labs, Inc. - Warrants" },
-  { s: "MOD", n: "Modine Manufacturing Company Common Stock" },
-  { s: "MODD", n: "Modular Medical, Inc." },
-  { s: "MOG-A", n: "Moog Inc. Class A Common Stock" },
-  { s: "MOG-B", n: "Moog Inc. Class B Common Stock" },
-  { s: "MOGU", n: "MOGU Inc. American Depositary Shares (each representing 25 Class A Ordinary Shares)" },
-  { s: "MOH", n: "Molina Healthcare Inc Common Stock" },
-  { s: "MOLN", n: "Molecular Partners AG" },
-  { s: "MOMO", n: "Hello Group Inc." },
-  { s: "MORN", n: "Morningstar, Inc." },
-  { s: "MOS", n: "Mosaic Company (The) Common Stock" },
-  { s: "MOV", n: "Movado Group Inc. Common Stock" },
-  { s: "MOVE", n: "Corvex, Inc." },
-  { s: "MP", n: "MP Materials Corp. Common Stock" },
-  { s: "MPAA", n: "Motorcar Parts of America, Inc." },
-  { s: "MPB", n: "Mid Penn Bancorp" },
-  { s: "MPC", n: "Marathon Petroleum Corporation Common Stock" },
-  { s: "MPLT", n: "MapLight Therapeutics, Inc." },
-  { s: "MPTI", n: "M-tron Industries, Inc. Common Stock" },
-  { s: "MPU", n: "Mega Matrix Inc. Class A Ordinary Shares" },
-  { s: "MPV", n: "Barings Participation Investors Common Stock" },
-  { s: "MPWR", n: "Monolithic Power Systems, Inc." },
-  { s: "MQ", n: "Marqeta, Inc." },
-  { s: "MRAM", n: "Everspin Technologies, Inc." },
-  { s: "MRBK", n: "Meridian Corporation" },
-  { s: "MRCY", n: "Mercury Systems Inc" },
-  { s: "MRDN", n: "Meridian Holdings Inc." },
-  { s: "MREO", n: "Mereo BioPharma Group plc" },
-  { s: "MRK", n: "Merck & Company, Inc. Common Stock (new)" },
-  { s: "MRKR", n: "Marker Therapeutics, Inc." },
-  { s: "MRLN", n: "Merlin, Inc." },
-  { s: "MRM", n: "MEDIROM Healthcare Technologies Inc. - American Depositary Share" },
-  { s: "MRNA", n: "Moderna, Inc." },
-  { s: "MRNO", n: "Murano Global Investments PLC" },
-  { s: "MRNOW", n: "Murano Global Investments PLC - Warrants" },
-  { s: "MRP", n: "Millrose Properties, Inc. Class A Common Stock" },
-  { s: "MRSH", n: "Marsh Common Stock" },
-  { s: "MRT", n: "Marti Technologies, Inc. Class A Ordinary Shares" },
-  { s: "MRTN", n: "Marten Transport, Ltd." },
-  { s: "MRVI", n: "Maravai LifeSciences Holdings, Inc." },
-  { s: "MRVL", n: "Marvell Technology, Inc." },
-  { s: "MRX", n: "Marex Group Limited" },
-  { s: "MS", n: "Morgan Stanley Common Stock" },
-  { s: "MSA", n: "MSA Safety Incorporated Common Stock" },
-  { s: "MSAI", n: "MultiSensor AI Holdings, Inc." },
-  { s: "MSAIW", n: "MultiSensor AI Holdings, Inc. - Warrants" },
-  { s: "MSBI", n: "Midland States Bancorp, Inc." },
-  { s: "MSC", n: "Studio City International Holdings Limited American depositary shares, each representing four Class A ordinary shares" },
-  { s: "MSCI", n: "MSCI Inc. Common Stock" },
-  { s: "MSEX", n: "Middlesex Water Company" },
-  { s: "MSFT", n: "Microsoft Corporation" },
-  { s: "MSGE", n: "Madison Square Garden Entertainment Corp. Class A Common Stock" },
-  { s: "MSGM", n: "Motorsport Games Inc." },
-  { s: "MSGS", n: "Madison Square Garden Sports Corp. Class A Common Stock (New)" },
-  { s: "MSGY", n: "Masonglory Limited" },
-  { s: "MSI", n: "Motorola Solutions, Inc. Common Stock" },
-  { s: "MSLE", n: "Satellos Bioscience Inc." },
-  { s: "MSM", n: "MSC Industrial Direct Company, Inc. Common Stock" },
-  { s: "MSN", n: "Emerson Radio Corporation Common Stock" },
-  { s: "MSS", n: "Maison Solutions Inc." },
-  { s: "MSTR", n: "Strategy Inc" },
-  { s: "MT", n: "Arcelor Mittal NY Registry Shares NEW" },
-  { s: "MTA", n: "Metalla Royalty & Streaming Ltd. Common Shares" },
-  { s: "MTB", n: "M&T Bank Corporation Common Stock" },
-  { s: "MTC", n: "MMTec, Inc. - Common Shares" },
-  { s: "MTCH", n: "Match Group, Inc." },
-  { s: "MTD", n: "Mettler-Toledo International, Inc. Common Stock" },
-  { s: "MTDR", n: "Matador Resources Company Common Stock" },
-  { s: "MTEK", n: "Maris-Tech Ltd." },
-  { s: "MTEKW", n: "Maris-Tech Ltd. - Warrants" },
-  { s: "MTEN", n: "Mingteng International Corporation Inc." },
-  { s: "MTEX", n: "Mannatech, Incorporated" },
-  { s: "MTG", n: "MGIC Investment Corporation Common Stock" },
-  { s: "MTH", n: "Meritage Homes Corporation Common Stock" },
-  { s: "MTLS", n: "Materialise NV" },
-  { s: "MTN", n: "Vail Resorts, Inc. Common Stock" },
-  { s: "MTNB", n: "Matinas Biopharma Holdings, Inc. Common Stock" },
-  { s: "MTNE", n: "CH4 Natural Solutions Corporation Class A Ordinary Shares" },
-  { s: "MTRN", n: "Materion Corporation" },
-  { s: "MTRX", n: "Matrix Service Company" },
-  { s: "MTSI", n: "MACOM Technology Solutions Holdings, Inc." },
-  { s: "MTUS", n: "Metallus Inc. Common Shares" },
-  { s: "MTVA", n: "MetaVia Inc." },
-  { s: "MTW", n: "Manitowoc Company, Inc. (The) Common Stock" },
-  { s: "MTX", n: "Minerals Technologies Inc. Common Stock" },
-  { s: "MTZ", n: "MasTec, Inc. Common Stock" },
-  { s: "MU", n: "Micron Technology, Inc." },
-  { s: "MUFG", n: "Mitsubishi UFJ Financial Group, Inc. Common Stock" },
-  { s: "MUR", n: "Murphy Oil Corporation Common Stock" },
-  { s: "MUSA", n: "Murphy USA Inc. Common Stock" },
-  { s: "MUX", n: "McEwen Inc. Common Stock" },
-  { s: "MVBF", n: "MVB Financial Corp." },
-  { s: "MVIS", n: "MicroVision, Inc." },
-  { s: "MVST", n: "Microvast Holdings, Inc." },
-  { s: "MWA", n: "MUELLER WATER PRODUCTS Common Stock" },
-  { s: "MWC", n: "Micware Co., Ltd." },
-  { s: "MWG", n: "Multi Ways Holdings Limited Class A Ordinary Shares" },
-  { s: "MWH", n: "SOLV Energy, Inc." },
-  { s: "MWYN", n: "Marwynn Holdings, Inc." },
-  { s: "MX", n: "Magnachip Semiconductor Corporation Common Stock" },
-  { s: "MXC", n: "Mexco Energy Corporation Common Stock" },
-  { s: "MXCT", n: "MaxCyte, Inc." },
-  { s: "MXL", n: "MaxLinear, Inc" },
-  { s: "MYE", n: "Myers Industries, Inc. Common Stock" },
-  { s: "MYFW", n: "First Western Financial, Inc." },
-  { s: "MYGN", n: "Myriad Genetics, Inc." },
-  { s: "MYND", n: "Mynd.ai, Inc. American Depositary Shares" },
-  { s: "MYO", n: "Myomo Inc. Common Stock" },
-  { s: "MYPS", n: "PLAYSTUDIOS, Inc." },
-  { s: "MYRG", n: "MYR Group, Inc." },
-  { s: "MYSE", n: "Myseum.AI, Inc." },
-  { s: "MYSZ", n: "My Size, Inc." },
-  { s: "MZTI", n: "The Marzetti Company" },
-  { s: "NA", n: "Nano Labs Ltd" },
-  { s: "NAAS", n: "NaaS Technology Inc." },
-  { s: "NABL", n: "N-able, Inc. Common Stock" },
-  { s: "NAGE", n: "Niagen Bioscience, Inc." },
-  { s: "NAII", n: "Natural Alternatives International, Inc." },
-  { s: "NAK", n: "Northern Dynasty Minerals, Ltd. Common Stock" },
-  { s: "NAKA", n: "Nakamoto Inc." },
-  { s: "NAMI", n: "Jinxin Technology Holding Company" },
-  { s: "NAMM", n: "Namib Minerals" },
-  { s: "NAMMW", n: "Namib Minerals - Warrants" },
-  { s: "NAMS", n: "NewAmsterdam Pharma Company N.V." },
-  { s: "NAT", n: "Nordic American Tankers Limited Common Stock" },
-  { s: "NATH", n: "Nathan's Famous, Inc." },
-  { s: "NATL", n: "NCR Atleos Corporation Common Stock" },
-  { s: "NATR", n: "Nature's Sunshine Products, Inc." },
-  { s: "NAUT", n: "Nautilus Biotechnology, Inc." },
-  { s: "NAVI", n: "Navient Corporation" },
-  { s: "NAVN", n: "Navan, Inc." },
-  { s: "NB", n: "NioCorp Developments Ltd." },
-  { s: "NBBK", n: "NB Bancorp, Inc." },
-  { s: "NBHC", n: "National Bank Holdings Corporation Common Stock" },
-  { s: "NBIS", n: "Nebius Group N.V." },
-  { s: "NBIX", n: "Neurocrine Biosciences, Inc." },
-  { s: "NBN", n: "Northeast Bank" },
-  { s: "NBP", n: "NovaBridge Biosciences" },
-  { s: "NBR", n: "Nabors Industries Ltd." },
-  { s: "NBTB", n: "NBT Bancorp Inc." },
-  { s: "NBTX", n: "Nanobiotix S.A. - ADSs" },
-  { s: "NC", n: "NACCO Industries, Inc. Common Stock" },
-  { s: "NCDL", n: "Nuveen Churchill Direct Lending Corp. Common Stock" },
-  { s: "NCEL", n: "NewcelX Ltd." },
-  { s: "NCEW", n: "New Century Logistics (BVI) Limited" },
-  { s: "NCI", n: "Neo-Concept International Group Holdings Limited" },
-  { s: "NCL", n: "Northann Corp. Common Stock" },
-  { s: "NCLH", n: "Norwegian Cruise Line Holdings Ltd. Ordinary Shares" },
-  { s: "NCMI", n: "National CineMedia, Inc." },
-  { s: "NCNA", n: "NuCana plc" },
-  { s: "NCNO", n: "nCino, Inc." },
-  { s: "NCPL", n: "Netcapital Inc." },
-  { s: "NCPLW", n: "Netcapital Inc. - warrants" },
-  { s: "NCRA", n: "Nocera, Inc." },
-  { s: "NCSM", n: "NCS Multistage Holdings, Inc." },
-  { s: "NCT", n: "Intercont (Cayman) Limited" },
-  { s: "NCTY", n: "The9 Limited - American Depository Shares" },
-  { s: "NDAQ", n: "Nasdaq, Inc." },
-  { s: "NDLS", n: "Noodles & Company" },
-  { s: "NDRA", n: "ENDRA Life Sciences Inc." },
-  { s: "NDSN", n: "Nordson Corporation" },
-  { s: "NE", n: "Noble Corporation plc A Ordinary Shares" },
-  { s: "NE-A", n: "Noble Corporation plc Tranche 2 Warrants" },
-  { s: "NE-W", n: "Noble Corporation plc Tranche 1 Warrants" },
-  { s: "NECB", n: "NorthEast Community Bancorp, Inc." },
-  { s: "NEE", n: "NextEra Energy, Inc. Common Stock" },
-  { s: "NEGG", n: "Newegg Commerce, Inc. - Common Shares" },
-  { s: "NEM", n: "Newmont Corporation" },
-  { s: "NEO", n: "NeoGenomics, Inc." },
-  { s: "NEOG", n: "Neogen Corporation" },
-  { s: "NEON", n: "Neonode Inc." },
-  { s: "NEOV", n: "NeoVolta Inc." },
-  { s: "NEPH", n: "Nephros, Inc." },
-  { s: "NERV", n: "Minerva Neurosciences, Inc" },
-  { s: "NESR", n: "National Energy Services Reunited Corp" },
-  { s: "NET", n: "Cloudflare, Inc. Class A Common Stock" },
-  { s: "NEU", n: "NewMarket Corp Common Stock" },
-  { s: "NEUP", n: "Neuphoria Therapeutics Inc." },
-  { s: "NEWP", n: "New Pacific Metals Corp. Common Shares" },
-  { s: "NEWT", n: "NewtekOne, Inc." },
-  { s: "NEXA", n: "Nexa Resources S.A. Common Shares" },
-  { s: "NEXM", n: "NexMetals Mining Corp." },
-  { s: "NEXN", n: "Nexxen International Ltd." },
-  { s: "NEXR", n: "Nexera Technologies Ltd" },
-  { s: "NEXT", n: "NextDecade Corporation" },
-  { s: "NFBK", n: "Northfield Bancorp, Inc." },
-  { s: "NFE", n: "New Fortress Energy Inc." },
-  { s: "NFG", n: "National Fuel Gas Company Common Stock" },
-  { s: "NFGC", n: "New Found Gold Corp Common Shares" },
-  { s: "NFLX", n: "Netflix, Inc." },
-  { s: "NG", n: "Novagold Resources Inc." },
-  { s: "NGEN", n: "NervGen Pharma Corp." },
-  { s: "NGG", n: "National Grid Transco, PLC National Grid PLC (NEW) American Depositary Shares" },
-  { s: "NGNE", n: "Neurogene Inc." },
-  { s: "NGS", n: "Natural Gas Services Group, Inc. Common Stock" },
-  { s: "NGVC", n: "Natural Grocers by Vitamin Cottage, Inc. Common Stock" },
-  { s: "NGVT", n: "Ingevity Corporation Common Stock" },
-  { s: "NHC", n: "National HealthCare Corporation Common Stock" },
-  { s: "NHI", n: "National Health Investors, Inc. Common Stock" },
-  { s: "NHIC", n: "NewHold Investment Corp III" },
-  { s: "NHICU", n: "NewHold Investment Corp III - Units" },
-  { s: "NHICW", n: "NewHold Investment Corp III - Warrants" },
-  { s: "NHIV", n: "NewHold Investment Corp IV" },
-  { s: "NHIVU", n: "NewHold Investment Corp IV - Units" },
-  { s: "NHIVW", n: "NewHold Investment Corp IV - Warrants" },
-  { s: "NHP", n: "National Healthcare Properties, Inc." },
-  { s: "NHTC", n: "Natural Health Trends Corp." },
-  { s: "NI", n: "NiSource Inc Common Stock" },
-  { s: "NIC", n: "Nicolet Bankshares Inc. Common Stock" },
-  { s: "NICE", n: "NICE Ltd" },
-  { s: "NICM", n: "Nicola Mining Inc." },
-  { s: "NINE", n: "Nine Energy Service, Inc. Common Stock" },
-  { s: "NIO", n: "NIO Inc. American depositary shares, each representing one Class A ordinary share" },
-  { s: "NIPG", n: "NIP Group Inc." },
-  { s: "NIQ", n: "NIQ Global Intelligence plc Ordinary Shares" },
-  { s: "NIU", n: "Niu Technologies" },
-  { s: "NIVF", n: "NewGenIvf Group Limited" },
-  { s: "NIVFW", n: "NewGenIvf Group Limited - Warrants" },
-  { s: "NIXX", n: "Nixxy, Inc." },
-  { s: "NJR", n: "NewJersey Resources Corporation Common Stock" },
-  { s: "NKE", n: "Nike, Inc. Common Stock" },
-  { s: "NKLR", n: "Terra Innovatum Global N.V." },
-  { s: "NKSH", n: "National Bankshares, Inc." },
-  { s: "NKTR", n: "Nektar Therapeutics" },
-  { s: "NKTX", n: "Nkarta, Inc." },
-  { s: "NL", n: "NLI Holdings, Inc. Common Stock" },
-  { s: "NLOP", n: "Net Lease Office Properties Common Shares of Beneficial Interest" },
-  { s: "NLY", n: "Annaly Capital Management Inc. Common Stock" },
-  { s: "NMAD", n: "Nomad Power Solutions, Inc." },
-  { s: "NMAX", n: "Newsmax, Inc. Class B Common Stock" },
-  { s: "NMFC", n: "New Mountain Finance Corporation" },
-  { s: "NMG", n: "Nouveau Monde Graphite Inc. Common Shares" },
-  { s: "NMIH", n: "NMI Holdings Inc" },
-  { s: "NMRA", n: "Neumora Therapeutics, Inc." },
-  { s: "NMRK", n: "Newmark Group, Inc." },
-  { s: "NMTC", n: "NeuroOne Medical Technologies Corporation" },
-  { s: "NN", n: "NextNav Inc." },
-  { s: "NNBR", n: "NN, Inc." },
-  { s: "NNDM", n: "Nano Dimension Ltd." },
-  { s: "NNE", n: "Nano Nuclear Energy Inc." },
-  { s: "NNI", n: "Nelnet, Inc. Common Stock" },
-  { s: "NNNN", n: "Anbio Biotechnology" },
-  { s: "NNOX", n: "NANO-X IMAGING LTD" },
-  { s: "NNVC", n: "NanoViricides, Inc. Common Stock" },
-  { s: "NOA", n: "North American Construction Group Ltd. Common Shares (no par)" },
-  { s: "NOAH", n: "Noah Holdings Limited American Depositary Shares" },
-  { s: "NOC", n: "Northrop Grumman Corporation Common Stock" },
-  { s: "NODK", n: "NI Holdings, Inc." },
-  { s: "NOEM", n: "CO2 Energy Transition Corp." },
-  { s: "NOG", n: "Northern Oil and Gas, Inc. Common Stock" },
-  { s: "NOK", n: "Nokia Corporation Sponsored American Depositary Shares" },
-  { s: "NOMA", n: "NOMADAR Corp." },
-  { s: "NOMD", n: "Nomad Foods Limited Ordinary Shares" },
-  { s: "NOV", n: "NOV Inc. Common Stock" },
-  { s: "NOVT", n: "Novanta Inc. - Common Shares" },
-  { s: "NOVTU", n: "Novanta Inc. - Tangible Equity Units" },
-  { s: "NOW", n: "ServiceNow, Inc. Common Stock" },
-  { s: "NP", n: "Neptune Insurance Holdings Inc. Class A Common Stock" },
-  { s: "NPB", n: "Northpointe Bancshares, Inc. Common Stock" },
-  { s: "NPCE", n: "Neuropace, Inc." },
-  { s: "NPK", n: "National Presto Industries, Inc. Common Stock" },
-  { s: "NPKI", n: "NPK International Inc. Common Stock" },
-  { s: "NPO", n: "Enpro Inc. Common Stock" },
-  { s: "NPT", n: "Texxon Holding Limited" },
-  { s: "NPWR", n: "NET Power Inc. Class A Common Stock" },
-  { s: "NRC", n: "NRC Health" },
-  { s: "NRDS", n: "NerdWallet, Inc." },
-  { s: "NRDY", n: "Nerdy Inc. Class A Common Stock" },
-  { s: "NREF", n: "NexPoint Real Estate Finance, Inc. Common Stock" },
-  { s: "NRG", n: "NRG Energy, Inc. Common Stock" },
-  { s: "NRGV", n: "Energy Vault Holdings, Inc. Common Stock" },
-  { s: "NRIM", n: "Northrim BanCorp Inc" },
-  { s: "NRIX", n: "Nurix Therapeutics, Inc." },
-  { s: "NRSN", n: "NeuroSense Therapeutics Ltd." },
-  { s: "NRXP", n: "NRX Pharmaceuticals, Inc." },
-  { s: "NRXS", n: "Neuraxis, Inc. Common Stock" },
-  { s: "NSC", n: "Norfolk Southern Corporation Common Stock" },
-  { s: "NSIT", n: "Insight Enterprises, Inc." },
-  { s: "NSP", n: "Insperity, Inc. Common Stock" },
-  { s: "NSPR", n: "InspireMD Inc." },
-  { s: "NSRX", n: "Nasus Pharma Ltd. Ordinary Shares" },
-  { s: "NSSC", n: "NAPCO Security Technologies, Inc." },
-  { s: "NSTS", n: "NSTS Bancorp, Inc." },
-  { s: "NSYS", n: "Nortech Systems Incorporated" },
-  { s: "NTAP", n: "NetApp, Inc." },
-  { s: "NTB", n: "Bank of N.T. Butterfield & Son Limited (The) Voting Ordinary Shares" },
-  { s: "NTCL", n: "NETCLASS TECHNOLOGY INC" },
-  { s: "NTCT", n: "NetScout Systems, Inc." },
-  { s: "NTES", n: "NetEase, Inc." },
-  { s: "NTGR", n: "NETGEAR, Inc." },
-  { s: "NTHI", n: "NeOnc Technologies Holdings, Inc." },
-  { s: "NTIC", n: "Northern Technologies International Corporation" },
-  { s: "NTIP", n: "Network-1 Technologies, Inc. Common Stock" },
-  { s: "NTLA", n: "Intellia Therapeutics, Inc." },
-  { s: "NTNX", n: "Nutanix, Inc." },
-  { s: "NTR", n: "Nutrien Ltd. Common Shares" },
-  { s: "NTRA", n: "Natera, Inc." },
-  { s: "NTRB", n: "Nutriband Inc." },
-  { s: "NTRP", n: "NextTrip, Inc." },
-  { s: "NTSK", n: "Netskope, Inc." },
-  { s: "NTST", n: "NetSTREIT Corp. Common Stock" },
-  { s: "NTWK", n: "NETSOL Technologies Inc." },
-  { s: "NTZ", n: "Natuzzi, S.p.A." },
-  { s: "NU", n: "Nu Holdings Ltd. Class A Ordinary Shares" },
-  { s: "NUAI", n: "New Era Energy & Digital, Inc." },
-  { s: "NUAIW", n: "New Era Energy & Digital, Inc. - Warrants" },
-  { s: "NUCL", n: "Eagle Nuclear Energy Corp." },
-  { s: "NUCLW", n: "Eagle Nuclear Energy Corp. - Warrants" },
-  { s: "NUE", n: "Nucor Corporation Common Stock" },
-  { s: "NUS", n: "Nu Skin Enterprises, Inc. Common Stock" },
-  { s: "NUTR", n: "Nusatrip Incorporated" },
-  { s: "NUTX", n: "Nutex Health Inc." },
-  { s: "NUVB", n: "Nuvation Bio Inc. Class A Common Stock" },
-  { s: "NUWE", n: "Nuwellis, Inc." },
-  { s: "NVA", n: "Nova Minerals Corp Common Stock" },
-  { s: "NVA-W", n: "Nova Minerals Corp Warrants to Purchase Common Stock" },
-  { s: "NVAX", n: "Novavax, Inc." },
-  { s: "NVCR", n: "NovoCure Limited" },
-  { s: "NVCT", n: "Nuvectis Pharma, Inc." },
-  { s: "NVDA", n: "NVIDIA Corporation" },
-  { s: "NVEC", n: "NVE Corporation" },
-  { s: "NVGS", n: "Navigator Holdings Ltd. Ordinary Shares (Marshall Islands)" },
-  { s: "NVMI", n: "Nova Ltd." },
-  { s: "NVNI", n: "Nvni Group Limited" },
-  { s: "NVNIW", n: "Nvni Group Limited - Warrants" },
-  { s: "NVNO", n: "enVVeno Medical Corporation" },
-  { s: "NVO", n: "Novo Nordisk A/S Common Stock" },
-  { s: "NVR", n: "NVR, Inc. Common Stock" },
-  { s: "NVRI", n: "Enviri Corporation Common Stock" },
-  { s: "NVS", n: "Novartis AG Common Stock" },
-  { s: "NVST", n: "Envista Holdings Corporation Common Stock" },
-  { s: "NVT", n: "nVent Electric plc Ordinary Shares" },
-  { s: "NVTS", n: "Navitas Semiconductor Corporation" },
-  { s: "NVVE", n: "Nuvve Holding Corp." },
-  { s: "NVX", n: "NOVONIX Limited - American Depository Shares" },
-  { s: "NWBI", n: "Northwest Bancshares, Inc." },
-  { s: "NWE", n: "NorthWestern Energy Group, Inc." },
-  { s: "NWFL", n: "Norwood Financial Corp." },
-  { s: "NWG", n: "NatWest Group plc American Depositary Shares, (each representing two (2) Ordinary Shares)" },
-  { s: "NWGL", n: "CL Workshop Group Limited" },
-  { s: "NWL", n: "Newell Brands Inc." },
-  { s: "NWN", n: "Northwest Natural Holding Company Common Stock" },
-  { s: "NWPX", n: "NWPX Infrastructure, Inc." },
-  { s: "NWS", n: "News Corporation" },
-  { s: "NWSA", n: "News Corporation" },
-  { s: "NWTG", n: "Newton Golf Company, Inc." },
-  { s: "NX", n: "Quanex Building Products Corporation Common Stock" },
-  { s: "NXB", n: "NextBoat Inc. Common Stcok" },
-  { s: "NXDR", n: "Nextdoor Holdings, Inc. Class A Common Stock" },
-  { s: "NXE", n: "Nexgen Energy Ltd. Common Shares" },
-  { s: "NXGL", n: "NexGel, Inc" },
-  { s: "NXL", n: "Nexalin Technology, Inc." },
-  { s: "NXPI", n: "NXP Semiconductors N.V." },
-  { s: "NXPL", n: "NextPlat Corp" },
-  { s: "NXST", n: "Nexstar Media Group, Inc." },
-  { s: "NXT", n: "Nextpower Inc." },
-  { s: "NXTC", n: "NextCure, Inc." },
-  { s: "NXTS", n: "Nexentis Technologies Inc." },
-  { s: "NXTT", n: "Next Technology Holding Inc." },
-  { s: "NXXT", n: "NextNRG, Inc." },
-  { s: "NYAX", n: "Nayax Ltd." },
-  { s: "NYC", n: "American Strategic Investment Co. Class A Common Stock" },
-  { s: "NYT", n: "New York Times Company (The) Common Stock" },
-  { s: "NYXH", n: "Nyxoah SA" },
-  { s: "O", n: "Realty Income Corporation Common Stock" },
-  { s: "OABI", n: "OmniAb, Inc." },
-  { s: "OBAI", n: "Our Bond, Inc." },
-  { s: "OBDC", n: "Blue Owl Capital Corporation Common Stock" },
-  { s: "OBE", n: "Obsidian Energy Ltd. Common Shares" },
-  { s: "OBIO", n: "Orchestra BioMed Holdings, Inc." },
-  { s: "OBK", n: "Origin Bancorp, Inc. Common Stock" },
-  { s: "OBT", n: "Orange County Bancorp, Inc." },
-  { s: "OC", n: "Owens Corning Inc Common Stock New" },
-  { s: "OCC", n: "Optical Cable Corporation" },
-  { s: "OCFC", n: "OceanFirst Financial Corp." },
-  { s: "OCG", n: "Oriental Culture Holding LTD" },
-  { s: "OCGN", n: "Ocugen, Inc." },
-  { s: "OCS", n: "Oculis Holding AG" },
-  { s: "OCSAW", n: "Oculis Holding AG - Warrants" },
-  { s: "OCTV", n: "Octave Intelligence plc" },
-  { s: "OCUL", n: "Ocular Therapeutix, Inc." },
-  { s: "ODC", n: "Oil-Dri Corporation Of America Common Stock" },
-  { s: "ODD", n: "ODDITY Tech Ltd." },
-  { s: "ODFL", n: "Old Dominion Freight Line, Inc." },
-  { s: "ODTX", n: "Odyssey Therapeutics, Inc." },
-  { s: "ODV", n: "Osisko Development Corp. Common Shares" },
-  { s: "ODYS", n: "Odysight.ai Inc." },
-  { s: "OEC", n: "Orion S.A. Common Shares" },
-  { s: "OESX", n: "Orion Energy Systems, Inc." },
-  { s: "OFAL", n: "OFA Group" },
-  { s: "OFG", n: "OFG Bancorp Common Stock" },
-  { s: "OFIX", n: "Orthofix Medical Inc." },
-  { s: "OFLX", n: "Omega Flex, Inc." },
-  { s: "OFRM", n: "Once Upon a Farm, PBC Common Stock" },
-  { s: "OGC", n: "OceanaGold Corporation Common Shares" },
-  { s: "OGE", n: "OGE Energy Corp Common Stock" },
-  { s: "OGEN", n: "Oragenics Inc. Common Stock" },
-  { s: "OGI", n: "Organigram Global Inc. - Common Shares" },
-  { s: "OGN", n: "Organon & Co. Common Stock" },
-  { s: "OGS", n: "ONE Gas, Inc. Common Stock" },
-  { s: "OHI", n: "Omega Healthcare Investors, Inc. Common Stock" },
-  { s: "OI", n: "O-I Glass, Inc. Common Stock" },
-  { s: "OII", n: "Oceaneering International, Inc. Common Stock" },
-  { s: "OIO", n: "OIO Group" },
-  { s: "OIOWW", n: "OIO Group - Warrants" },
-  { s: "OIS", n: "Oil States International, Inc. Common Stock" },
-  { s: "OKE", n: "ONEOK, Inc. Common Stock" },
-  { s: "OKLO", n: "Oklo Inc. Class A common stock" },
-  { s: "OKTA", n: "Okta, Inc." },
-  { s: "OKUR", n: "OnKure Therapeutics, Inc." },
-  { s: "OKYO", n: "OKYO Pharma Limited" },
-  { s: "OLB", n: "The OLB Group, Inc." },
-  { s: "OLED", n: "Universal Display Corporation" },
-  { s: "OLLI", n: "Ollie's Bargain Outlet Holdings, Inc." },
-  { s: "OLMA", n: "Olema Pharmaceuticals, Inc." },
-  { s: "OLN", n: "Olin Corporation Common Stock" },
-  { s: "OLOX", n: "Olenox Industries Inc." },
-  { s: "OLP", n: "One Liberty Properties, Inc. Common Stock" },
-  { s: "OM", n: "Outset Medical, Inc." },
-  { s: "OMC", n: "Omnicom Group Inc. Common Stock" },
-  { s: "OMCL", n: "Omnicell, Inc." },
-  { s: "OMDA", n: "Omada Health, Inc." },
-  { s: "OMER", n: "Omeros Corporation" },
-  { s: "OMEX", n: "Odyssey Marine Exploration, Inc." },
-  { s: "OMF", n: "OneMain Holdings, Inc. Common Stock" },
-  { s: "OMH", n: "Ohmyhome Limited" },
-  { s: "OMSE", n: "OMS Energy Technologies Inc." },
-  { s: "ON", n: "ON Semiconductor Corporation" },
-  { s: "ONB", n: "Old National Bancorp" },
-  { s: "ONC", n: "BeOne Medicines Ltd." },
-  { s: "ONCO", n: "Onconetix, Inc." },
-  { s: "ONCY", n: "Oncolytics Biotech Inc." },
-  { s: "ONDS", n: "Ondas Inc" },
-  { s: "ONEG", n: "OneConstruction Group Limited" },
-  { s: "ONEW", n: "OneWater Marine Inc." },
-  { s: "ONFO", n: "Onfolio Holdings Inc." },
-  { s: "ONIT", n: "Onity Group Inc. Common Stock" },
-  { s: "ONL", n: "Orion Properties Inc. Common Stock" },
-  { s: "ONMD", n: "OneMedNet Corp" },
-  { s: "ONON", n: "On Holding AG Class A Ordinary Shares" },
-  { s: "ONT", n: "Onterris, Inc. Common Stock" },
-  { s: "ONTO", n: "Onto Innovation Inc. Common Stock" },
-  { s: "OOMA", n: "Ooma, Inc. Common Stock" },
-  { s: "OPAD", n: "Offerpad Solutions Inc. Class A Common Stock" },
-  { s: "OPAL", n: "OPAL Fuels Inc." },
-  { s: "OPBK", n: "OP Bancorp" },
-  { s: "OPCH", n: "Option Care Health, Inc." },
-  { s: "OPEN", n: "Opendoor Technologies Inc" },
-  { s: "OPFI", n: "OppFi Inc. Class A Common Stock" },
-  { s: "OPHC", n: "OptimumBank Holdings, Inc. Common Stock" },
-  { s: "OPK", n: "Opko Health, Inc." },
-  { s: "OPLN", n: "OPENLANE, Inc. Common Stock" },
-  { s: "OPRA", n: "Opera Limited" },
-  { s: "OPRT", n: "Oportun Financial Corporation" },
-  { s: "OPRX", n: "OptimizeRx Corporation" },
-  { s: "OPTH", n: "Optimi Health Corp. - Common Shares" },
-  { s: "OPTT", n: "Ocean Power Technologies, Inc. Common Stock" },
-  { s: "OPTU", n: "Optimum Communications, Inc. Class A common stock" },
-  { s: "OPTX", n: "Syntec Optics Holdings, Inc." },
-  { s: "OPXS", n: "Optex Systems Holdings, Inc." },
-  { s: "OPY", n: "Oppenheimer Holdings, Inc. Class A Common Stock (DE)" },
-  { s: "OR", n: "OR Royalties Inc. Common Shares" },
-  { s: "ORA", n: "Ormat Technologies, Inc. Common Stock" },
-  { s: "ORBS", n: "Eightco Holdings Inc." },
-  { s: "ORC", n: "Orchid Island Capital, Inc. Common Stock" },
-  { s: "ORCL", n: "Oracle Corporation Common Stock" },
-  { s: "ORGO", n: "Organogenesis Holdings Inc." },
-  { s: "ORI", n: "Old Republic International Corporation Common Stock" },
-  { s: "ORIC", n: "Oric Pharmaceuticals, Inc." },
-  { s: "ORIO", n: "Orion Digital Corp. - Common Shares" },
-  { s: "ORIQ", n: "Origin Investment Corp I" },
-  { s: "ORIQU", n: "Origin Investment Corp I - Units" },
-  { s: "ORKA", n: "Oruka Therapeutics, Inc." },
-  { s: "ORKT", n: "Orangekloud Technology Inc." },
-  { s: "ORLA", n: "Orla Mining Ltd. Common Shares" },
-  { s: "ORLY", n: "O'Reilly Automotive, Inc." },
-  { s: "ORMP", n: "Oramed Pharmaceuticals Inc." },
-  { s: "ORN", n: "Orion Group Holdings, Inc. Common" },
-  { s: "ORRF", n: "Orrstown Financial Services, Inc." },
-  { s: "OSBC", n: "Old Second Bancorp, Inc." },
-  { s: "OSCR", n: "Oscar Health, Inc. Class A Common Stock" },
-  { s: "OSG", n: "Octave Specialty Group, Inc. Common Stock" },
-  { s: "OSIS", n: "OSI Systems, Inc." },
-  { s: "OSK", n: "Oshkosh Corporation (Holding Company)Common Stock" },
-  { s: "OSPN", n: "OneSpan Inc." },
-  { s: "OSRH", n: "OSR Health, Inc." },
-  { s: "OSS", n: "One Stop Systems, Inc." },
-  { s: "OST", n: "Ostin Technology Group Co., Ltd." },
-  { s: "OSTX", n: "OS Therapies Incorporated Common Stock" },
-  { s: "OSUR", n: "OraSure Technologies, Inc." },
-  { s: "OSW", n: "OneSpaWorld Holdings Limited - Common Shares" },
-  { s: "OTEX", n: "Open Text Corporation - Common Shares" },
-  { s: "OTF", n: "Blue Owl Technology Finance Corp. Common Stock" },
-  { s: "OTIS", n: "Otis Worldwide Corporation Common Stock" },
-  { s: "OTLK", n: "Outlook Therapeutics, Inc." },
-  { s: "OTLY", n: "Oatly Group AB" },
-  { s: "OTTR", n: "Otter Tail Corporation" },
-  { s: "OUST", n: "Ouster, Inc." },
-  { s: "OUT", n: "OUTFRONT Media Inc. Common Stock" },
-  { s: "OVBC", n: "Ohio Valley Banc Corp." },
-  { s: "OVID", n: "Ovid Therapeutics Inc." },
-  { s: "OVLY", n: "Oak Valley Bancorp (CA)" },
-  { s: "OVV", n: "Ovintiv Inc. (DE)" },
-  { s: "OWL", n: "Blue Owl Capital Inc. Class A Common Stock" },
-  { s: "OWLS", n: "OBOOK Holdings Inc." },
-  { s: "OWLT", n: "Owlet, Inc. Class A Common Stock" },
-  { s: "OXBR", n: "Oxbridge Re Holdings Limited" },
-  { s: "OXM", n: "Oxford Industries, Inc. Common Stock" },
-  { s: "OXY", n: "Occidental Petroleum Corporation Common Stock" },
-  { s: "OXY-W", n: "Occidental Petroleum Corporation Warrants" },
-  { s: "OZ", n: "Belpointe PREP, LLC Class A Units" },
-  { s: "OZK", n: "Bank OZK" },
-  { s: "P", n: "Everpure, Inc. Class A common stock" },
-  { s: "PAA", n: "Plains All American Pipeline, L.P. - Common Units representing Limited Partner Interests" },
-  { s: "PAAS", n: "Pan American Silver Corp. Common Stock" },
-  { s: "PACB", n: "Pacific Biosciences of California, Inc." },
-  { s: "PACK", n: "Ranpak Holdings Corp Class A Common Stock" },
-  { s: "PACS", n: "PACS Group, Inc. Common Stock" },
-  { s: "PAG", n: "Penske Automotive Group, Inc. Common Stock" },
-  { s: "PAGP", n: "Plains GP Holdings, L.P." },
-  { s: "PAGS", n: "PagSeguro Digital Ltd. Class A Common Shares" },
-  { s: "PAHC", n: "Phibro Animal Health Corporation" },
-  { s: "PAL", n: "Proficient Auto Logistics, Inc." },
-  { s: "PALI", n: "Palisade Bio, Inc." },
-  { s: "PAM", n: "Pampa Energia S.A." },
-  { s: "PAMT", n: "PAMT CORP" },
-  { s: "PANL", n: "Pangaea Logistics Solutions Ltd." },
-  { s: "PANW", n: "Palo Alto Networks, Inc." },
-  { s: "PAPL", n: "Pineapple Financial Inc. Common Stock" },
-  { s: "PAR", n: "PAR Technology Corporation Common Stock" },
-  { s: "PARK", n: "Park Dental Partners, Inc." },
-  { s: "PARR", n: "Par Pacific Holdings, Inc. Common Stock" },
-  { s: "PASG", n: "Passage Bio, Inc." },
-  { s: "PASW", n: "Ping An Biomedical Co., Ltd." },
-  { s: "PATH", n: "UiPath, Inc. Class A Common Stock" },
-  { s: "PATK", n: "Patrick Industries, Inc." },
-  { s: "PAVM", n: "PAVmed Inc." },
-  { s: "PAVS", n: "Paranovus Entertainment Technology Ltd." },
-  { s: "PAX", n: "Patria Investments Limited" },
-  { s: "PAY", n: "Paymentus Holdings, Inc. Class A Common Stock" },
-  { s: "PAYC", n: "Paycom Software, Inc. Common Stock" },
-  { s: "PAYO", n: "Payoneer Global Inc." },
-  { s: "PAYP", n: "PayPay Corporation - American Depository Shares" },
-  { s: "PAYS", n: "Paysign, Inc." },
-  { s: "PAYX", n: "Paychex, Inc." },
-  { s: "PB", n: "Prosperity Bancshares, Inc. Common Stock" },
-  { s: "PBA", n: "Pembina Pipeline Corp. Ordinary Shares (Canada)" },
-  { s: "PBF", n: "PBF Energy Inc. Class A Common Stock" },
-  { s: "PBFS", n: "Pioneer Bancorp, Inc." },
-  { s: "PBH", n: "Prestige Consumer Healthcare Inc. Common Stock" },
-  { s: "PBHC", n: "Pathfinder Bancorp, Inc." },
-  { s: "PBI", n: "Pitney Bowes Inc. Common Stock" },
-  { s: "PBK", n: "PowerBank Corporation" },
-  { s: "PBLS", n: "Parabilis Medicines, Inc." },
-  { s: "PBM", n: "Psyence Biomedical Ltd. - Common Shares" },
-  { s: "PBR", n: "Petroleo Brasileiro S.A. Petrobras ADS" },
-  { s: "PBYI", n: "Puma Biotechnology Inc" },
-  { s: "PC", n: "Premium Catering (Holdings) Limited" },
-  { s: "PCAR", n: "PACCAR Inc." },
-  { s: "PCB", n: "PCB Bancorp" },
-  { s: "PCG", n: "Pacific Gas & Electric Co. Common Stock" },
-  { s: "PCLA", n: "PicoCELA Inc." },
-  { s: "PCOR", n: "Procore Technologies, Inc. Common Stock" },
-  { s: "PCRX", n: "Pacira BioSciences, Inc." },
-  { s: "PCSA", n: "Processa Pharmaceuticals, Inc." },
-  { s: "PCSC", n: "Perceptive Capital Solutions Corp" },
-  { s: "PCT", n: "PureCycle Technologies, Inc." },
-  { s: "PCTY", n: "Paylocity Holding Corporation" },
-  { s: "PCVX", n: "Vaxcyte, Inc." },
-  { s: "PCYO", n: "Pure Cycle Corporation" },
-  { s: "PD", n: "PagerDuty, Inc. Common Stock" },
-  { s: "PDC", n: "Perpetuals.com Ltd" },
-  { s: "PDCC", n: "Pearl Diver Credit Company Inc. Common Stock" },
-  { s: "PDD", n: "PDD Holdings Inc." },
-  { s: "PDEX", n: "Pro-Dex, Inc." },
-  { s: "PDFS", n: "PDF Solutions, Inc." },
-  { s: "PDLB", n: "Ponce Financial Group, Inc." },
-  { s: "PDS", n: "Precision Drilling Corporation Common Stock" },
-  { s: "PDSB", n: "PDS Biotechnology Corporation" },
-  { s: "PDYN", n: "Palladyne AI Corp." },
-  { s: "PEBK", n: "Peoples Bancorp of North Carolina, Inc." },
-  { s: "PEBO", n: "Peoples Bancorp Inc." },
-  { s: "PECO", n: "Phillips Edison & Company, Inc." },
-  { s: "PED", n: "Pedevco Corp. Common Stock" },
-  { s: "PEG", n: "Public Service Enterprise Group Incorporated Common Stock" },
-  { s: "PEGA", n: "Pegasystems Inc." },
-  { s: "PEN", n: "Penumbra, Inc. Common Stock" },
-  { s: "PENG", n: "Penguin Solutions, Inc." },
-  { s: "PENN", n: "PENN Entertainment, Inc." },
-  { s: "PEP", n: "PepsiCo, Inc." },
-  { s: "PEPG", n: "PepGen Inc." },
-  { s: "PERF", n: "Perfect Corp. Class A Ordinary Share" },
-  { s: "PERI", n: "Perion Network Ltd" },
-  { s: "PESI", n: "Perma-Fix Environmental Services, Inc." },
-  { s: "PETS", n: "PetMed Express, Inc." },
-  { s: "PETZ", n: "TDH Holdings, Inc. - Common Shares" },
-  { s: "PEW", n: "GrabAGun Digital Holdings Inc. Common Stock" },
-  { s: "PFAI", n: "Pinnacle Food Group Limited" },
-  { s: "PFE", n: "Pfizer, Inc. Common Stock" },
-  { s: "PFG", n: "Principal Financial Group Inc" },
-  { s: "PFGC", n: "Performance Food Group Company Common Stock" },
-  { s: "PFIS", n: "Peoples Financial Services Corp." },
-  { s: "PFLT", n: "PennantPark Floating Rate Capital Ltd. Common Stock" },
-  { s: "PFS", n: "Provident Financial Services, Inc Common Stock" },
-  { s: "PFSA", n: "Profusa, Inc." },
-  { s: "PFSI", n: "PennyMac Financial Services, Inc. Common Stock" },
-  { s: "PFX", n: "PhenixFIN Corporation" },
-  { s: "PG", n: "Procter & Gamble Company (The) Common Stock" },
-  { s: "PGC", n: "Peapack-Gladstone Financial Corporation" },
-  { s: "PGEN", n: "Precigen, Inc." },
-  { s: "PGNY", n: "Progyny, Inc." },
-  { s: "PGR", n: "Progressive Corporation (The) Common Stock" },
-  { s: "PGY", n: "Pagaya Technologies Ltd." },
-  { s: "PGYWW", n: "Pagaya Technologies Ltd. - Warrants" },
-  { s: "PH", n: "Parker-Hannifin Corporation Common Stock" },
-  { s: "PHAR", n: "Pharming Group N.V." },
-  { s: "PHAT", n: "Phathom Pharmaceuticals, Inc." },
-  { s: "PHG", n: "Koninklijke Philips N.V. NY Registry Shares" },
-  { s: "PHGE", n: "BiomX Inc. COmmon Stock" },
-  { s: "PHIN", n: "PHINIA Inc. Common Stock" },
-  { s: "PHIO", n: "Phio Pharmaceuticals Corp." },
-  { s: "PHM", n: "PulteGroup, Inc. Common Stock" },
-  { s: "PHOE", n: "Phoenix Asia Holdings Limited" },
-  { s: "PHR", n: "Phreesia, Inc. Common Stock" },
-  { s: "PHUN", n: "Phunware, Inc." },
-  { s: "PHVS", n: "Pharvaris N.V." },
-  { s: "PI", n: "Impinj, Inc." },
-  { s: "PICS", n: "PicS N.V." },
-  { s: "PII", n: "Polaris Inc. Common Stock" },
-  { s: "PIII", n: "P3 Health Partners Inc." },
-  { s: "PINS", n: "Pinterest, Inc. Class A Common Stock" },
-  { s: "PIPR", n: "Piper Sandler Companies Common Stock" },
-  { s: "PJT", n: "PJT Partners Inc. Class A Common Stock" },
-  { s: "PK", n: "Park Hotels & Resorts Inc. Common Stock" },
-  { s: "PKBK", n: "Parke Bancorp, Inc." },
-  { s: "PKE", n: "Park Aerospace Corp. Common Stock" },
-  { s: "PKG", n: "Packaging Corporation of America Common Stock" },
-  { s: "PKOH", n: "Park-Ohio Holdings Corp." },
-  { s: "PKX", n: "POSCO HOLDINGS INC. American Depositary Shares (Each representing 1/4th of a share of Common Stock)" },
-  { s: "PL", n: "Planet Labs PBC Class A Common Stock" },
-  { s: "PLAB", n: "Photronics, Inc." },
-  { s: "PLAG", n: "Planet Green Holdings Corp. Common Stock" },
-  { s: "PLAY", n: "Dave & Buster's Entertainment, Inc." },
-  { s: "PLBC", n: "Plumas Bancorp" },
-  { s: "PLBL", n: "Polibeli Group Ltd" },
-  { s: "PLBY", n: "Playboy, Inc." },
-  { s: "PLCE", n: "Children's Place, Inc. (The)" },
-  { s: "PLD", n: "Prologis, Inc. Common Stock" },
-  { s: "PLG", n: "Platinum Group Metals Ltd. Ordinary Shares (Canada)" },
-  { s: "PLGO", n: "Pelagos Insurance Capital Limited Common Shares" },
-  { s: "PLMR", n: "Palomar Holdings, Inc." },
-  { s: "PLNT", n: "Planet Fitness, Inc. Common Stock" },
-  { s: "PLOW", n: "Douglas Dynamics, Inc. Common Stock" },
-  { s: "PLPC", n: "Preformed Line Products Company" },
-  { s: "PLRX", n: "Pliant Therapeutics, Inc." },
-  { s: "PLRZ", n: "Polyrizon Ltd." },
-  { s: "PLSE", n: "Pulse Biosciences, Inc" },
-  { s: "PLSM", n: "Pulsenmore Ltd." },
-  { s: "PLTK", n: "Playtika Holding Corp." },
-  { s: "PLTR", n: "Palantir Technologies Inc." },
-  { s: "PLTS", n: "Platinum Analytics Cayman Limited" },
-  { s: "PLUG", n: "Plug Power, Inc." },
-  { s: "PLUR", n: "Pluri Inc." },
-  { s: "PLUS", n: "ePlus inc." },
-  { s: "PLUT", n: "Plutus Financial Group Limited" },
-  { s: "PLX", n: "Protalix BioTherapeutics, Inc. (DE) Common Stock" },
-  { s: "PLXS", n: "Plexus Corp." },
-  { s: "PLYX", n: "Polaryx Therapeutics, Inc." },
-  { s: "PM", n: "Philip Morris International Inc Common Stock" },
-  { s: "PMA", n: "Ming Shing Group Holdings Limited" },
-  { s: "PMAX", n: "Powell Max Limited" },
-  { s: "PMCB", n: "PharmaCyte Biotech, Inc." },
-  { s: "PMEC", n: "Primech Holdings Ltd." },
-  { s: "PMI", n: "Picard Medical, Inc. Common Stock" },
-  { s: "PMN", n: "ProMIS Neurosciences Inc. - Common Shares" },
-  { s: "PMTS", n: "CPI Card Group Inc." },
-  { s: "PMVP", n: "PMV Pharmaceuticals, Inc." },
-  { s: "PN", n: "PN Smart Energy Limited" },
-  { s: "PNBK", n: "Patriot National Bancorp Inc." },
-  { s: "PNC", n: "PNC Financial Services Group, Inc. (The) Common Stock" },
-  { s: "PNFP", n: "Pinnacle Financial Partners, Inc. Common stock" },
-  { s: "PNNT", n: "PennantPark Investment Corporation Common Stock" },
-  { s: "PNR", n: "Pentair plc. Ordinary Share" },
-  { s: "PNRG", n: "PrimeEnergy Resources Corporation" },
-  { s: "PNTG", n: "The Pennant Group, Inc." },
-  { s: "PNW", n: "Pinnacle West Capital Corporation Common Stock" },
-  { s: "POAS", n: "Phaos Technology Holdings (Cayman) Limited Class A Ordinary Shares" },
-  { s: "POCI", n: "Precision Optics Corporation, Inc." },
-  { s: "PODC", n: "PodcastOne, Inc." },
-  { s: "PODD", n: "Insulet Corporation" },
-  { s: "POET", n: "POET Technologies Inc. - Common Shares" },
-  { s: "POLA", n: "Polar Power, Inc." },
-  { s: "POM", n: "POMDOCTOR LIMITED" },
-  { s: "PONO", n: "Pono Capital Four, Inc." },
-  { s: "PONOU", n: "Pono Capital Four, Inc. - Units" },
-  { s: "PONY", n: "Pony AI Inc." },
-  { s: "POOL", n: "Pool Corporation" },
-  { s: "POR", n: "Portland General Electric Co Common Stock" },
-  { s: "POST", n: "Post Holdings, Inc. Common Stock" },
-  { s: "POWI", n: "Power Integrations, Inc." },
-  { s: "POWL", n: "Powell Industries, Inc." },
-  { s: "POWW", n: "Outdoor Holding Company" },
-  { s: "PPBT", n: "Purple Biotech Ltd." },
-  { s: "PPC", n: "Pilgrim's Pride Corporation" },
-  { s: "PPCB", n: "Propanc Biopharma, Inc." },
-  { s: "PPG", n: "PPG Industries, Inc. Common Stock" },
-  { s: "PPHC", n: "Public Policy Holding Company, Inc." },
-  { s: "PPIH", n: "Perma-Pipe International Holdings, Inc." },
-  { s: "PPL", n: "PPL Corporation Common Stock" },
-  { s: "PPLC", n: "PPL Corporation Corporate Units" },
-  { s: "PPLI", n: "People Incorporated" },
-  { s: "PPSI", n: "Pioneer Power Solutions, Inc." },
-  { s: "PPTA", n: "Perpetua Resources Corp. - Common Shares" },
-  { s: "PR", n: "Permian Resources Corporation Class A Common Stock" },
-  { s: "PRAA", n: "PRA Group, Inc." },
-  { s: "PRAX", n: "Praxis Precision Medicines, Inc." },
-  { s: "PRCH", n: "Porch Group, Inc." },
-  { s: "PRCT", n: "PROCEPT BioRobotics Corporation" },
-  { s: "PRDO", n: "Perdoceo Education Corporation" },
-  { s: "PRE", n: "Prenetics Global Limited" },
-  { s: "PRFX", n: "PRF Technologies Ltd." },
-  { s: "PRG", n: "PROG Holdings, Inc. Common Stock" },
-  { s: "PRGO", n: "Perrigo Company plc Ordinary Shares" },
-  { s: "PRGS", n: "Progress Software Corporation" },
-  { s: "PRHI", n: "Presurance Holdings, Inc." },
-  { s: "PRI", n: "Primerica, Inc. Common Stock" },
-  { s: "PRIM", n: "Primoris Services Corporation Common Stock" },
-  { s: "PRK", n: "Park National Corporation Common Stock" },
-  { s: "PRKS", n: "United Parks & Resorts Inc. Common Stock" },
-  { s: "PRLB", n: "Proto Labs, Inc. Common stock" },
-  { s: "PRLD", n: "Prelude Therapeutics Incorporated" },
-  { s: "PRM", n: "Perimeter Solutions, SA Common Stock" },
-  { s: "PRMB", n: "Primo Brands Corporation Class A Common Stock" },
-  { s: "PRME", n: "Prime Medicine, Inc." },
-  { s: "PROF", n: "Profound Medical Corp." },
-  { s: "PROK", n: "ProKidney Corp." },
-  { s: "PROP", n: "Prairie Operating Co." },
-  { s: "PROV", n: "Provident Financial Holdings, Inc." },
-  { s: "PRPL", n: "Purple Innovation, Inc." },
-  { s: "PRPO", n: "Precipio, Inc." },
-  { s: "PRQR", n: "ProQR Therapeutics N.V." },
-  { s: "PRSO", n: "Peraso Inc." },
-  { s: "PRSU", n: "Pursuit Attractions and Hospitality, Inc. Common Stock" },
-  { s: "PRTA", n: "Prothena Corporation plc" },
-  { s: "PRTH", n: "Priority Technology Holdings, Inc." },
-  { s: "PRTS", n: "CarParts.com, Inc." },
-  { s: "PRU", n: "Prudential Financial, Inc. Common Stock" },
-  { s: "PRVA", n: "Privia Health Group, Inc." },
-  { s: "PRZO", n: "ParaZero Technologies Ltd." },
-  { s: "PS", n: "Pershing Square Inc. Common Stock" },
-  { s: "PSA", n: "Public Storage Common Stock" },
-  { s: "PSBD", n: "Palmer Square Capital BDC Inc. Common Stock" },
-  { s: "PSFE", n: "Paysafe Limited Common Shares" },
-  { s: "PSHG", n: "Performance Shipping Inc. - Common Shares" },
-  { s: "PSIG", n: "PS International Group Ltd." },
-  { s: "PSIX", n: "Power Solutions International, Inc." },
-  { s: "PSKY", n: "Paramount Skydance Corporation" },
-  { s: "PSMT", n: "PriceSmart, Inc." },
-  { s: "PSN", n: "Parsons Corporation Common Stock" },
-  { s: "PSNL", n: "Personalis, Inc." },
-  { s: "PSNY", n: "Polestar Automotive Holding UK Limited" },
-  { s: "PSNYW", n: "Polestar Automotive Holding UK Limited" },
-  { s: "PSO", n: "Pearson, Plc Common Stock" },
-  { s: "PSQH", n: "PSQ Holdings, Inc. Class A Common Stock" },
-  { s: "PSTV", n: "PLUS THERAPEUTICS, Inc." },
-  { s: "PSUS", n: "Pershing Square USA, Ltd. Common Shares" },
-  { s: "PSX", n: "Phillips 66 Common Stock" },
-  { s: "PTC", n: "PTC Inc." },
-  { s: "PTCT", n: "PTC Therapeutics, Inc." },
-  { s: "PTEN", n: "Patterson-UTI Energy, Inc." },
-  { s: "PTGX", n: "Protagonist Therapeutics, Inc." },
-  { s: "PTHS", n: "Pelthos Therapeutics Inc. Common Stock" },
-  { s: "PTLE", n: "PTL LTD" },
-  { s: "PTLO", n: "Portillo's Inc." },
-  { s: "PTN", n: "Palatin Technologies, Inc." },
-  { s: "PTON", n: "Peloton Interactive, Inc." },
-  { s: "PUBM", n: "PubMatic, Inc." },
-  { s: "PUK", n: "Prudential Public Limited Company Common Stock" },
-  { s: "PULM", n: "Pulmatrix, Inc." },
-  { s: "PUMP", n: "ProPetro Holding Corp. Common Stock" },
-  { s: "PURR", n: "Hyperliquid Strategies Inc" },
-  { s: "PUSA", n: "Aureus Greenway Holdings Inc." },
-  { s: "PVH", n: "PVH Corp. Common Stock" },
-  { s: "PVLA", n: "Palvella Therapeutics, Inc." },
-  { s: "PWP", n: "Perella Weinberg Partners" },
-  { s: "PWR", n: "Quanta Services, Inc. Common Stock" },
-  { s: "PWRL", n: "Powerlaw Corp." },
-  { s: "PXED", n: "Phoenix Education Partners, Inc. Common Stock" },
-  { s: "PXLW", n: "Pixelworks, Inc." },
-  { s: "PXS", n: "Pyxis Tankers Inc." },
-  { s: "PYPD", n: "PolyPid Ltd." },
-  { s: "PYPL", n: "PayPal Holdings, Inc." },
-  { s: "PYT", n: "PPlus Tr GSC-2 Tr Ctf Fltg Rate" },
-  { s: "PYXS", n: "Pyxis Oncology, Inc." },
-  { s: "PZG", n: "Paramount Gold Nevada Corp. Common Stock" },
-  { s: "PZZA", n: "Papa John's International, Inc." },
-  { s: "Q", n: "Qnity Electronics, Inc. Common Stock" },
-  { s: "QBTS", n: "D-Wave Quantum Inc. Common Shares" },
-  { s: "QCLS", n: "Q/C Technologies, Inc." },
-  { s: "QCOM", n: "QUALCOMM Incorporated" },
-  { s: "QCRH", n: "QCR Holdings, Inc." },
-  { s: "QDEL", n: "QuidelOrtho Corporation" },
-  { s: "QFIN", n: "Qfin Holdings, Inc." },
-  { s: "QGEN", n: "Qiagen N.V. Common Shares" },
-  { s: "QH", n: "Quhuo Limited" },
-  { s: "QLYS", n: "Qualys, Inc." },
-  { s: "QMCO", n: "Quantum Corporation" },
-  { s: "QMLS", n: "QumulusAI, Inc." },
-  { s: "QMMM", n: "QMMM Holdings Limited" },
-  { s: "QNC", n: "Quantum eMotion Corp. Common Shares" },
-  { s: "QNCX", n: "Quince Therapeutics, Inc." },
-  { s: "QNRX", n: "Quoin Pharmaceuticals, Ltd." },
-  { s: "QNST", n: "QuinStreet, Inc." },
-  { s: "QNT", n: "Quantinuum Inc." },
-  { s: "QNTM", n: "Quantum Biopharma Ltd." },
-  { s: "QRHC", n: "Quest Resource Holding Corporation" },
-  { s: "QRVO", n: "Qorvo, Inc." },
-  { s: "QS", n: "QuantumScape Corporation" },
-  { s: "QSI", n: "Quantum-Si Incorporated" },
-  { s: "QSR", n: "Restaurant Brands International Inc. Common Shares" },
-  { s: "QTEX", n: "QTREX Quantum Ltd." },
-  { s: "QTI", n: "QT Imaging Holdings, Inc." },
-  { s: "QTRX", n: "Quanterix Corporation" },
-  { s: "QTTB", n: "Q32 Bio Inc." },
-  { s: "QTWO", n: "Q2 Holdings, Inc. Common Stock" },
-  { s: "QUAD", n: "Quad Graphics, Inc Class A Common Stock" },
-  { s: "QUBT", n: "Quantum Computing Inc." },
-  { s: "QUCY", n: "Quantum Cyber N.V." },
-  { s: "QUIK", n: "QuickLogic Corporation" },
-  { s: "QURE", n: "uniQure N.V." },
-  { s: "QXL", n: "Quantum X Labs Inc." },
-  { s: "QXO", n: "QXO, Inc. Common Stock" },
-  { s: "R", n: "Ryder System, Inc. Common Stock" },
-  { s: "RACC", n: "Research Alliance Corporation III" },
-  { s: "RACD", n: "Research Alliance Corporation IV" },
-  { s: "RACE", n: "Ferrari N.V. Common Shares" },
-  { s: "RADX", n: "Radiopharm Theranostics Limited" },
-  { s: "RAIL", n: "Freightcar America, Inc." },
-  { s: "RAIN", n: "Rain Enhancement Technologies Holdco, Inc." },
-  { s: "RAINW", n: "Rain Enhancement Technologies Holdco, Inc. - Warrants" },
-  { s: "RAL", n: "Ralliant Corporation Common Stock" },
-  { s: "RAMP", n: "LiveRamp Holdings, Inc. Common Stock" },
-  { s: "RANI", n: "Rani Therapeutics Holdings, Inc." },
-  { s: "RAPP", n: "Rapport Therapeutics, Inc." },
-  { s: "RARE", n: "Ultragenyx Pharmaceutical Inc." },
-  { s: "RAVE", n: "Rave Restaurant Group, Inc." },
-  { s: "RAY", n: "Raytech Holding Limited" },
-  { s: "RAYA", n: "Erayak Power Solution Group Inc." },
-  { s: "RBA", n: "RB Global, Inc. Common Stock" },
-  { s: "RBB", n: "RBB Bancorp" },
-  { s: "RBBN", n: "Ribbon Communications Inc." },
-  { s: "RBC", n: "RBC Bearings Incorporated Common Stock" },
-  { s: "RBCAA", n: "Republic Bancorp, Inc." },
-  { s: "RBKB", n: "Rhinebeck Bancorp, Inc." },
-  { s: "RBLX", n: "Roblox Corporation Class A Common Stock" },
-  { s: "RBNE", n: "Robin Energy Ltd." },
-  { s: "RBRK", n: "Rubrik, Inc. Class A Common Stock" },
-  { s: "RC", n: "Ready Capital Corporation Common Stock" },
-  { s: "RCAT", n: "Red Cat Holdings, Inc." },
-  { s: "RCEL", n: "Avita Medical, Inc." },
-  { s: "RCI", n: "Rogers Communication, Inc. Common Stock" },
-  { s: "RCKT", n: "Rocket Pharmaceuticals, Inc." },
-  { s: "RCKY", n: "Rocky Brands, Inc." },
-  { s: "RCL", n: "Royal Caribbean Cruises Ltd. Common Stock" },
-  { s: "RCMT", n: "RCM Technologies, Inc." },
-  { s: "RCON", n: "Recon Technology, Ltd." },
-  { s: "RCT", n: "RedCloud Holdings plc" },
-  { s: "RCUS", n: "Arcus Biosciences, Inc. Common Stock" },
-  { s: "RDCM", n: "Radcom Ltd." },
-  { s: "RDDT", n: "Reddit, Inc. Class A Common Stock" },
-  { s: "RDGT", n: "Ridgetech, Inc." },
-  { s: "RDHL", n: "Redhill Biopharma Ltd." },
-  { s: "RDI", n: "Reading International Inc" },
-  { s: "RDIB", n: "Reading International Inc" },
-  { s: "RDN", n: "Radian Group Inc. Common Stock" },
-  { s: "RDNT", n: "RadNet, Inc." },
-  { s: "RDNW", n: "RideNow Group, Inc." },
-  { s: "RDVT", n: "Red Violet, Inc." },
-  { s: "RDW", n: "Redwire Corporation Common Stock" },
-  { s: "RDWR", n: "Radware Ltd." },
-  { s: "RDY", n: "Dr. Reddy's Laboratories Ltd Common Stock" },
-  { s: "RDZN", n: "Roadzen, Inc." },
-  { s: "RDZNW", n: "Roadzen, Inc. - Warrants" },
-  { s: "REA", n: "Rare Earths Americas, Inc. Common Stock" },
-  { s: "REAL", n: "The RealReal, Inc." },
-  { s: "REAX", n: "The Real Brokerage, Inc. - Common Shares" },
-  { s: "REBN", n: "Reborn Coffee, Inc." },
-  { s: "RECT", n: "Rectitude Holdings Ltd" },
-  { s: "REED", n: "Reed's, Inc. Common Stock" },
-  { s: "REFI", n: "Chicago Atlantic Real Estate Finance, Inc." },
-  { s: "REFR", n: "Research Frontiers Incorporated" },
-  { s: "REG", n: "Regency Centers Corporation" },
-  { s: "REGN", n: "Regeneron Pharmaceuticals, Inc." },
-  { s: "REI", n: "Ring Energy, Inc. Common Stock" },
-  { s: "REKR", n: "Rekor Systems, Inc." },
-  { s: "RELL", n: "Richardson Electronics, Ltd." },
-  { s: "RELX", n: "RELX PLC PLC American Depositary Shares (Each representing One Ordinary Share)" },
-  { s: "RELY", n: "Remitly Global, Inc." },
-  { s: "RENT", n: "Rent the Runway, Inc." },
-  { s: "RENX", n: "RenX Enterprises Corp." },
-  { s: "REPL", n: "Replimune Group, Inc." },
-  { s: "REPX", n: "Riley Exploration Permian, Inc. Common Stock" },
-  { s: "RERE", n: "ATRenew Inc. American Depositary Shares (every three of which representing two Class A ordinary shares)" },
-  { s: "RES", n: "RPC, Inc. Common Stock" },
-  { s: "RETO", n: "ReTo Eco-Solutions, Inc." },
-  { s: "REVB", n: "Revelation Biosciences, Inc." },
-  { s: "REX", n: "REX American Resources Corporation" },
-  { s: "REXR", n: "Rexford Industrial Realty, Inc. Common Stock" },
-  { s: "REYN", n: "Reynolds Consumer Products Inc." },
-  { s: "REZI", n: "Resideo Technologies, Inc. Common Stock" },
-  { s: "RF", n: "Regions Financial Corporation Common Stock" },
-  { s: "RFIL", n: "RF Industries, Ltd." },
-  { s: "RFL", n: "Rafael Holdings, Inc. Class B Common Stock" },
-  { s: "RGA", n: "Reinsurance Group of America, Incorporated Common Stock" },
-  { s: "RGC", n: "Regencell Bioscience Holdings Limited" },
-  { s: "RGCO", n: "RGC Resources Inc." },
-  { s: "RGEN", n: "Repligen Corporation" },
-  { s: "RGLD", n: "Royal Gold, Inc." },
-  { s: "RGNT", n: "Regentis Biomaterials Ltd. Ordinary Shares" },
-  { s: "RGNX", n: "REGENXBIO Inc." },
-  { s: "RGP", n: "Resources Connection, Inc." },
-  { s: "RGR", n: "Sturm, Ruger & Company, Inc. Common Stock" },
-  { s: "RGS", n: "Regis Corporation" },
-  { s: "RGTI", n: "Rigetti Computing, Inc." },
-  { s: "RH", n: "RH Common Stock" },
-  { s: "RHI", n: "Robert Half Inc. Common Stock" },
-  { s: "RHLD", n: "Resolute Holdings Management Common Stock" },
-  { s: "RICK", n: "RCI Hospitality Holdings, Inc." },
-  { s: "RIG", n: "Transocean Ltd (Switzerland) Common Stock" },
-  { s: "RIGL", n: "Rigel Pharmaceuticals, Inc." },
-  { s: "RILY", n: "BRC Group Holdings, Inc." },
-  { s: "RIME", n: "Algorhythm Holdings, Inc." },
-  { s: "RIO", n: "Rio Tinto Plc Common Stock" },
-  { s: "RIOT", n: "Riot Platforms, Inc." },
-  { s: "RITM", n: "Rithm Capital Corp. Common Stock" },
-  { s: "RITR", n: "Reitar Logtech Holdings Limited" },
-  { s: "RIVN", n: "Rivian Automotive, Inc." },
-  { s: "RJET", n: "Republic Airways Holdings Inc." },
-  { s: "RJF", n: "Raymond James Financial, Inc. Common Stock" },
-  { s: "RKDA", n: "Arcadia Biosciences, Inc." },
-  { s: "RKLB", n: "Rocket Lab Corporation" },
-  { s: "RKT", n: "Rocket Companies, Inc. Class A Common Stock" },
-  { s: "RKTO", n: "Rocket One Inc." },
-  { s: "RL", n: "Ralph Lauren Corporation Common Stock" },
-  { s: "RLAY", n: "Relay Therapeutics, Inc." },
-  { s: "RLGT", n: "Radiant Logistics, Inc. Common Stock" },
-  { s: "RLI", n: "RLI Corp. Common Stock (DE)" },
-  { s: "RLMD", n: "Relmada Therapeutics, Inc." },
-  { s: "RLYB", n: "Rallybio Corporation" },
-  { s: "RM", n: "Regional Management Corp. Common Stock" },
-  { s: "RMAX", n: "RE/MAX Holdings, Inc. Class A Common Stock" },
-  { s: "RMBI", n: "Richmond Mutual Bancorporation, Inc." },
-  { s: "RMBS", n: "Rambus, Inc." },
-  { s: "RMCF", n: "Rocky Mountain Chocolate Factory, Inc." },
-  { s: "RMCO", n: "Royalty Management Holding Corporation" },
-  { s: "RMD", n: "ResMed Inc. Common Stock" },
-  { s: "RMIX", n: "Suncrete, Inc." },
-  { s: "RMNI", n: "Rimini Street, Inc." },
-  { s: "RMR", n: "The RMR Group Inc." },
-  { s: "RMSG", n: "Real Messenger Corporation" },
-  { s: "RMSGW", n: "Real Messenger Corporation - Warrants" },
-  { s: "RMTI", n: "Rockwell Medical, Inc." },
-  { s: "RNA", n: "Atrium Therapeutics, Inc." },
-  { s: "RNAC", n: "Cartesian Therapeutics, Inc." },
-  { s: "RNAZ", n: "TransCode Therapeutics, Inc." },
-  { s: "RNG", n: "RingCentral, Inc. Class A Common Stock" },
-  { s: "RNGR", n: "Ranger Energy Services, Inc. Class A Common Stock" },
-  { s: "RNR", n: "RenaissanceRe Holdings Ltd. Common Stock" },
-  { s: "RNST", n: "Renasant Corporation Common Stock" },
-  { s: "RNTX", n: "Rein Therapeutics, Inc." },
-  { s: "RNW", n: "ReNew Energy Global plc" },
-  { s: "RNXT", n: "RenovoRx, Inc." },
-  { s: "ROAD", n: "Construction Partners, Inc." },
-  { s: "ROC", n: "Rank One Computing Corporation" },
-  { s: "ROCK", n: "Gibraltar Industries, Inc." },
-  { s: "ROG", n: "Rogers Corporation Common Stock" },
-  { s: "ROIV", n: "Roivant Sciences Ltd. - Common Shares" },
-  { s: "ROK", n: "Rockwell Automation, Inc. Common Stock" },
-  { s: "ROKU", n: "Roku, Inc." },
-  { s: "ROL", n: "Rollins, Inc. Common Stock" },
-  { s: "ROLR", n: "High Roller Technologies, Inc. Common Stock" },
-  { s: "ROMA", n: "Roma Green Finance Limited" },
-  { s: "ROOT", n: "Root, Inc." },
-  { s: "ROP", n: "Roper Technologies, Inc." },
-  { s: "ROST", n: "Ross Stores, Inc." },
-  { s: "RPAY", n: "Repay Holdings Corporation" },
-  { s: "RPC", n: "Ridgepost Capital, Inc. Class A Common Stock" },
-  { s: "RPD", n: "Rapid7, Inc." },
-  { s: "RPGL", n: "Republic Power Group Limited" },
-  { s: "RPID", n: "Rapid Micro Biosystems, Inc." },
-  { s: "RPM", n: "RPM International Inc. Common Stock" },
-  { s: "RPRX", n: "Royalty Pharma plc" },
-  { s: "RR", n: "Richtech Robotics Inc." },
-  { s: "RRBI", n: "Red River Bancshares, Inc." },
-  { s: "RRC", n: "Range Resources Corporation Common Stock" },
-  { s: "RRGB", n: "Red Robin Gourmet Burgers, Inc." },
-  { s: "RRR", n: "Red Rock Resorts, Inc." },
-  { s: "RRX", n: "Regal Rexnord Corporation Common Stock" },
-  { s: "RS", n: "Reliance, Inc. Common Stock" },
-  { s: "RSG", n: "Republic Services, Inc. Common Stock" },
-  { s: "RSI", n: "Rush Street Interactive, Inc. Class A Common Stock" },
-  { s: "RSKD", n: "Riskified Ltd. Class A Ordinary Shares" },
-  { s: "RSSS", n: "Research Solutions, Inc" },
-  { s: "RSVR", n: "Reservoir Media, Inc.." },
-  { s: "RTB", n: "RTB Digital, Inc." },
-  { s: "RTO", n: "Rentokil Initial plc American Depositary Shares (each representing five (5) Ordinary Shares)" },
-  { s: "RTX", n: "RTX Corporation Common Stock" },
-  { s: "RUBI", n: "Rubico Inc." },
-  { s: "RUM", n: "RUM Group Inc." },
-  { s: "RUN", n: "Sunrun Inc." },
-  { s: "RUSHA", n: "Rush Enterprises, Inc." },
-  { s: "RUSHB", n: "Rush Enterprises, Inc." },
-  { s: "RVLV", n: "Revolve Group, Inc. Class A Common Stock" },
-  { s: "RVMD", n: "Revolution Medicines, Inc." },
-  { s: "RVP", n: "Retractable Technologies, Inc. Common Stock" },
-  { s: "RVSB", n: "Riverview Bancorp Inc" },
-  { s: "RVSN", n: "Rail Vision Ltd." },
-  { s: "RVTY", n: "Revvity, Inc. Common Stock" },
-  { s: "RWAY", n: "Runway Growth Finance Corp." },
-  { s: "RXO", n: "RXO, Inc. Common Stock" },
-  { s: "RXRX", n: "Recursion Pharmaceuticals, Inc." },
-  { s: "RXST", n: "RxSight, Inc." },
-  { s: "RXT", n: "Rackspace Technology, Inc." },
-  { s: "RY", n: "Royal Bank Of Canada Common Stock" },
-  { s: "RYAAY", n: "Ryanair Holdings plc" },
-  { s: "RYAM", n: "Rayonier Advanced Materials Inc. Common Stock" },
-  { s: "RYAN", n: "Ryan Specialty Holdings, Inc. Class A Common Stock" },
-  { s: "RYDE", n: "Ryde Group Ltd. Class A Ordinary Shares" },
-  { s: "RYET", n: "Ruanyun Edai Technology Inc." },
-  { s: "RYM", n: "RYTHM, Inc." },
-  { s: "RYOJ", n: "rYojbaba Co., Ltd. - Common Shares" },
-  { s: "RYTM", n: "Rhythm Pharmaceuticals, Inc." },
-  { s: "RYZ", n: "Ryerson Holding Corporation Common Stock" },
-  { s: "RZC", n: "Reinsurance Group of America, Incorporated 7.125% Fixed-Rate Reset Subordinated Debentures due 2052" },
-  { s: "RZLT", n: "Rezolute, Inc." },
-  { s: "RZLV", n: "Rezolve AI PLC" },
-  { s: "RZLVW", n: "Rezolve AI PLC - Warrants" },
-  { s: "S", n: "SentinelOne, Inc. Class A Common Stock" },
-  { s: "SA", n: "Seabridge Gold, Inc. Common Shares New" },
-  { s: "SABR", n: "Sabre Corporation" },
-  { s: "SABS", n: "SAB Biotherapeutics, Inc." },
-  { s: "SACH", n: "Sachem Capital Corp. Common Shares" },
-  { s: "SAFE", n: "Safehold Inc. New Common Stock" },
-  { s: "SAFT", n: "Safety Insurance Group, Inc." },
-  { s: "SAFX", n: "XCF Global, Inc." },
-  { s: "SAGT", n: "SAGTEC GLOBAL LIMITED" },
-  { s: "SAH", n: "Sonic Automotive, Inc. Common Stock" },
-  { s: "SAIA", n: "Saia, Inc." },
-  { s: "SAIC", n: "Science Applications International Corporation" },
-  { s: "SAIH", n: "SAIHEAT Limited" },
-  { s: "SAIL", n: "SailPoint, Inc." },
-  { s: "SAM", n: "Boston Beer Company, Inc. (The) Common Stock" },
-  { s: "SAMG", n: "Silvercrest Asset Management Group Inc." },
-  { s: "SANA", n: "Sana Biotechnology, Inc." },
-  { s: "SANG", n: "Sangoma Technologies Corporation - Common Shares" },
-  { s: "SANM", n: "Sanmina Corporation" },
-  { s: "SAP", n: "SAP SE ADS" },
-  { s: "SAR", n: "Saratoga Investment Corp New" },
-  { s: "SARO", n: "StandardAero, Inc. Common Stock" },
-  { s: "SATL", n: "Satellogic Inc." },
-  { s: "SB", n: "Safe Bulkers, Inc Common Stock ($0.001 par value)" },
-  { s: "SBAC", n: "SBA Communications Corporation" },
-  { s: "SBC", n: "SBC Medical Group Holdings Incorporated" },
-  { s: "SBCF", n: "Seacoast Banking Corporation of Florida" },
-  { s: "SBCWW", n: "SBC Medical Group Holdings Incorporated - Warrants" },
-  { s: "SBET", n: "Sharplink, Inc." },
-  { s: "SBEV", n: "Splash Beverage Group, Inc. (NV) Common Stock" },
-  { s: "SBFG", n: "SB Financial Group, Inc." },
-  { s: "SBFM", n: "Sunshine Biopharma Inc." },
-  { s: "SBGI", n: "Sinclair, Inc." },
-  { s: "SBH", n: "Sally Beauty Holdings, Inc. (Name to be changed from Sally Holdings, Inc.) Common Stock" },
-  { s: "SBLK", n: "Star Bulk Carriers Corp. - Common Shares" },
-  { s: "SBMT", n: "Silver Bow Mining Corp. Common Shares" },
-  { s: "SBS", n: "Companhia de saneamento Basico Do Estado De Sao Paulo - Sabesp American Depositary Shares (Each repstg 250 Common Shares)" },
-  { s: "SBSI", n: "Southside Bancshares, Inc. Common Stock" },
-  { s: "SBSW", n: "D/B/A Sibanye-Stillwater Limited ADS" },
-  { s: "SBUX", n: "Starbucks Corporation" },
-  { s: "SBXD", n: "SilverBox Corp IV Class A Ordinary Shares" },
-  { s: "SBXE", n: "SilverBox Corp V Class A Ordinary Shares" },
-  { s: "SCAG", n: "Scage Future" },
-  { s: "SCAGW", n: "Scage Future - Warrants" },
-  { s: "SCCO", n: "Southern Copper Corporation Common Stock" },
-  { s: "SCHL", n: "Scholastic Corporation" },
-  { s: "SCHW", n: "Charles Schwab Corporation (The) Common Stock" },
-  { s: "SCI", n: "Service Corporation International Common Stock" },
-  { s: "SCKT", n: "Socket Mobile, Inc." },
-  { s: "SCL", n: "Stepan Company Common Stock" },
-  { s: "SCLX", n: "Scilex Holding Company" },
-  { s: "SCM", n: "Stellus Capital Investment Corporation Common Stock" },
-  { s: "SCNI", n: "Scinai Immunotherapeutics Ltd." },
-  { s: "SCNX", n: "Scienture Holdings, Inc." },
-  { s: "SCOR", n: "comScore, Inc." },
-  { s: "SCPQ", n: "Social Commerce Partners Corporation" },
-  { s: "SCSC", n: "ScanSource, Inc." },
-  { s: "SCWO", n: "374Water Inc." },
-  { s: "SCYX", n: "SCYNEXIS, Inc." },
-  { s: "SCZM", n: "Santacruz Silver Mining Ltd. - Common Shares" },
-  { s: "SD", n: "SandRidge Energy, Inc. Common Stock" },
-  { s: "SDA", n: "SunCar Technology Group Inc." },
-  { s: "SDEV", n: "Stablecoin Development Corporation Common Stock" },
-  { s: "SDGR", n: "Schrodinger, Inc." },
-  { s: "SDHC", n: "Smith Douglas Homes Corp. Class A Common Stock" },
-  { s: "SDOT", n: "Sadot Group Inc." },
-  { s: "SDRL", n: "Seadrill Limited Common Shares" },
-  { s: "SDST", n: "Stardust Power Inc." },
-  { s: "SE", n: "Sea Limited American Depositary Shares, each representing one Class A Ordinary Share" },
-  { s: "SEAT", n: "Vivid Seats Inc." },
-  { s: "SEB", n: "Seaboard Corporation Common Stock" },
-  { s: "SECZ", n: "Securitize Corp. Common Stock" },
-  { s: "SEDG", n: "SolarEdge Technologies, Inc." },
-  { s: "SEED", n: "Origin Agritech Limited" },
-  { s: "SEER", n: "Seer, Inc." },
-  { s: "SEG", n: "Seaport Entertainment Group Inc. Common Stock" },
-  { s: "SEGG", n: "Sports Entertainment Gaming Global Corporation" },
-  { s: "SEI", n: "Solaris Energy Infrastructure, Inc. Class A Common Stock" },
-  { s: "SEIC", n: "SEI Investments Company" },
-  { s: "SELF", n: "Global Self Storage, Inc." },
-  { s: "SENEA", n: "Seneca Foods Corp." },
-  { s: "SENEB", n: "Seneca Foods Corp." },
-  { s: "SENS", n: "Senseonics Holdings, Inc." },
-  { s: "SEPN", n: "Septerna, Inc." },
-  { s: "SER", n: "Serina Therapeutics, Inc. Common Stock" },
-  { s: "SERA", n: "Sera Prognostics, Inc." },
-  { s: "SERV", n: "Serve Robotics Inc." },
-  { s: "SES", n: "SES AI Corporation Class A Common Stock" },
-  { s: "SEV", n: "Aptera Motors Corp." },
-  { s: "SEZL", n: "Sezzle Inc." },
-  { s: "SF", n: "Stifel Financial Corporation Common Stock" },
-  { s: "SFBC", n: "Sound Financial Bancorp, Inc." },
-  { s: "SFBS", n: "ServisFirst Bancshares, Inc. Common Stock" },
-  { s: "SFD", n: "Smithfield Foods, Inc." },
-  { s: "SFHG", n: "Samfine Creation Holdings Group Limited" },
-  { s: "SFIX", n: "Stitch Fix, Inc." },
-  { s: "SFL", n: "SFL Corporation Ltd" },
-  { s: "SFM", n: "Sprouts Farmers Market, Inc." },
-  { s: "SFNC", n: "Simmons First National Corporation" },
-  { s: "SFST", n: "Southern First Bancshares, Inc." },
-  { s: "SFWL", n: "Shengfeng Development Limited" },
-  { s: "SG", n: "Sweetgreen, Inc. Class A Common Stock" },
-  { s: "SGA", n: "Saga Communications, Inc." },
-  { s: "SGC", n: "Superior Group of Companies, Inc." },
-  { s: "SGHC", n: "Super Group (SGHC) Limited Ordinary Shares" },
-  { s: "SGHT", n: "Sight Sciences, Inc." },
-  { s: "SGI", n: "Somnigroup International Inc. Common Stock" },
-  { s: "SGLY", n: "Singularity Future Technology Ltd." },
-  { s: "SGML", n: "Sigma Lithium Corporation - common shares" },
-  { s: "SGP", n: "SpyGlass Pharma, Inc." },
-  { s: "SGRP", n: "SPAR Group, Inc." },
-  { s: "SGRY", n: "Surgery Partners, Inc." },
-  { s: "SGU", n: "Star Group L.P. Common Stock" },
-  { s: "SHAK", n: "Shake Shack, Inc. Class A Common Stock" },
-  { s: "SHAZ", n: "SharonAI Holdings, Inc." },
-  { s: "SHBI", n: "Shore Bancshares, Inc." },
-  { s: "SHC", n: "Sotera Health Company" },
-  { s: "SHEL", n: "Shell PLC American Depositary Shares (each representing two (2) Ordinary Shares)" },
-  { s: "SHEN", n: "Shenandoah Telecommunications Co" },
-  { s: "SHFS", n: "SHF Holdings, Inc." },
-  { s: "SHFSW", n: "SHF Holdings, Inc. - Warrants" },
-  { s: "SHG", n: "Shinhan Financial Group Co Ltd American Depositary Shares" },
-  { s: "SHIM", n: "Shimmick Corporation" },
-  { s: "SHIP", n: "Seanergy Maritime Holdings Corp." },
-  { s: "SHLS", n: "Shoals Technologies Group, Inc." },
-  { s: "SHMD", n: "SCHMID Group N.V." },
-  { s: "SHMDW", n: "SCHMID Group N.V. - Warrants" },
-  { s: "SHO", n: "Sunstone Hotel Investors, Inc. Sunstone Hotel Investors, Inc. Common Shares" },
-  { s: "SHOE", n: "Shoe Station Group, Inc." },
-  { s: "SHOO", n: "Steven Madden, Ltd." },
-  { s: "SHOP", n: "Shopify Inc." },
-  { s: "SHOT", n: "RMG ML Sports Holdings" },
-  { s: "SHPH", n: "Shuttle Pharmaceuticals Holdings, Inc." },
-  { s: "SHW", n: "Sherwin-Williams Company (The) Common Stock" },
-  { s: "SI", n: "Shoulder Innovations, Inc. Common Stock" },
-  { s: "SIBN", n: "SI-BONE, Inc." },
-  { s: "SID", n: "Companhia Siderurgica Nacional S.A. Common Stock" },
-  { s: "SIDU", n: "Sidus Space, Inc." },
-  { s: "SIEB", n: "Siebert Financial Corp." },
-  { s: "SIF", n: "SIFCO Industries, Inc. Common Stock" },
-  { s: "SIFY", n: "Sify Technologies Limited - American Depository Shares" },
-  { s: "SIG", n: "Signet Jewelers Limited Common Shares" },
-  { s: "SIGA", n: "SIGA Technologies Inc." },
-  { s: "SIGI", n: "Selective Insurance Group, Inc." },
-  { s: "SII", n: "Sprott Inc. Common Shares" },
-  { s: "SILC", n: "Silicom Ltd" },
-  { s: "SILO", n: "Silo Pharma, Inc." },
-  { s: "SIM", n: "Grupo Simec, S.A.B. de C.V. American Depositary Shares" },
-  { s: "SIMO", n: "Silicon Motion Technology Corporation" },
-  { s: "SIND", n: "Sinda Ltd. Common Stock" },
-  { s: "SINT", n: "SiNtx Technologies, Inc." },
-  { s: "SION", n: "Sionna Therapeutics, Inc." },
-  { s: "SIRI", n: "SiriusXM Holdings Inc." },
-  { s: "SITC", n: "SITE Centers Corp. Common Stock" },
-  { s: "SITE", n: "SiteOne Landscape Supply, Inc. Common Stock" },
-  { s: "SITM", n: "SiTime Corporation" },
-  { s: "SJ", n: "Scienjoy Holding Corporation" },
-  { s: "SJM", n: "The J.M. Smucker Company Common Stock" },
-  { s: "SKE", n: "Skeena Resources Limited Common Shares" },
-  { s: "SKHY", n: "SK hynix Inc." },
-  { s: "SKIL", n: "Skillsoft Corp. Class A Common Stock" },
-  { s: "SKIN", n: "SkinHealth Systems Inc." },
-  { s: "SKK", n: "SKK Holdings Limited" },
-  { s: "SKM", n: "SK Telecom Co., Ltd. Common Stock" },
-  { s: "SKT", n: "Tanger Inc. Common Stock" },
-  { s: "SKWD", n: "Skyward Specialty Insurance Group, Inc." },
-  { s: "SKY", n: "Champion Homes, Inc. Common Stock" },
-  { s: "SKYA", n: "SkyAI, Inc." },
-  { s: "SKYE", n: "Skye Bioscience, Inc." },
-  { s: "SKYH", n: "Sky Harbour Group Corporation Class A Common Stock" },
-  { s: "SKYQ", n: "Sky Quarry Inc." },
-  { s: "SKYT", n: "SkyWater Technology, Inc." },
-  { s: "SKYW", n: "SkyWest, Inc." },
-  { s: "SKYX", n: "SKYX Platforms Corp." },
-  { s: "SLAB", n: "Silicon Laboratories, Inc." },
-  { s: "SLB", n: "SLB Limited Common Shares" },
-  { s: "SLBT", n: "SL Science Holding Limited" },
-  { s: "SLDB", n: "Solid Biosciences Inc." },
-  { s: "SLDE", n: "Slide Insurance Holdings, Inc." },
-  { s: "SLDP", n: "Solid Power, Inc." },
-  { s: "SLE", n: "Super League Enterprise, Inc." },
-  { s: "SLF", n: "Sun Life Financial Inc. Common Stock" },
-  { s: "SLG", n: "SL Green Realty Corp Common Stock" },
-  { s: "SLGB", n: "Smart Logistics Global Limited" },
-  { s: "SLGL", n: "Sol-Gel Technologies Ltd." },
-  { s: "SLGN", n: "Silgan Holdings Inc. Common Stock" },
-  { s: "SLI", n: "Standard Lithium Ltd. Common Shares" },
-  { s: "SLM", n: "SLM Corporation" },
-  { s: "SLMT", n: "Brera Holdings PLC" },
-  { s: "SLN", n: "Silence Therapeutics Plc - American Depository Share" },
-  { s: "SLND", n: "Southland Holdings, Inc. Common Stock" },
-  { s: "SLNG", n: "Stabilis Solutions, Inc." },
-  { s: "SLNH", n: "Soluna Holdings, Inc." },
-  { s: "SLP", n: "Simulations Plus, Inc." },
-  { s: "SLQT", n: "SelectQuote, Inc. Common Stock" },
-  { s: "SLS", n: "SELLAS Life Sciences Group, Inc." },
-  { s: "SLSN", n: "Solesence, Inc." },
-  { s: "SLSR", n: "Solaris Resources Inc. Common Shares" },
-  { s: "SLVM", n: "Sylvamo Corporation Common Stock" },
-  { s: "SLXN", n: "Silexion Therapeutics Corp" },
-  { s: "SM", n: "SM Energy Company Common Stock" },
-  { s: "SMBC", n: "Southern Missouri Bancorp, Inc." },
-  { s: "SMBK", n: "SmartFinancial, Inc. Common Stock" },
-  { s: "SMC", n: "Summit Midstream Corporation Common Stock" },
-  { s: "SMCI", n: "Super Micro Computer, Inc." },
-  { s: "SMFG", n: "Sumitomo Mitsui Financial Group Inc Unsponsored American Depositary Shares (Japan)" },
-  { s: "SMG", n: "Scotts Miracle-Gro Company (The) Common Stock" },
-  { s: "SMHI", n: "SEACOR Marine Holdings Inc. Common Stock" },
-  { s: "SMID", n: "Smith-Midland Corporation" },
-  { s: "SMJF", n: "SMJ International Holdings Inc. Class A Ordinary Shares" },
-  { s: "SMMT", n: "Summit Therapeutics Inc." },
-  { s: "SMP", n: "Standard Motor Products, Inc. Common Stock" },
-  { s: "SMPL", n: "The Simply Good Foods Company" },
-  { s: "SMR", n: "NuScale Power Corporation Class A Common Stock" },
-  { s: "SMRT", n: "SmartRent, Inc. Class A Common Stock" },
-  { s: "SMSI", n: "Smith Micro Software, Inc." },
-  { s: "SMTC", n: "Semtech Corporation" },
-  { s: "SMTI", n: "Sanara MedTech Inc." },
-  { s: "SMTK", n: "SmartKem, Inc." },
-  { s: "SMWB", n: "Similarweb Ltd. Ordinary Shares" },
-  { s: "SMX", n: "SMX (Security Matters) Public Limited Company" },
-  { s: "SMXT", n: "Solarmax Technology Inc." },
-  { s: "SN", n: "SharkNinja, Inc. Ordinary Shares" },
-  { s: "SNA", n: "Snap-On Incorporated Common Stock" },
-  { s: "SNAL", n: "Snail, Inc." },
-  { s: "SNAP", n: "Snap Inc. Class A Common Stock" },
-  { s: "SND", n: "Smart Sand, Inc." },
-  { s: "SNDA", n: "Sonida Senior Living, Inc. Common Stock" },
-  { s: "SNDK", n: "Sandisk Corporation" },
-  { s: "SNDL", n: "SNDL Inc. - Common Shares" },
-  { s: "SNDR", n: "Schneider National, Inc. Common Stock" },
-  { s: "SNDX", n: "Syndax Pharmaceuticals, Inc." },
-  { s: "SNES", n: "SenesTech, Inc." },
-  { s: "SNEX", n: "StoneX Group Inc." },
-  { s: "SNFCA", n: "Security National Financial Corporation" },
-  { s: "SNGX", n: "Soligenix, Inc." },
-  { s: "SNN", n: "Smith & Nephew SNATS, Inc. Common Stock" },
-  { s: "SNOA", n: "Sonoma Pharmaceuticals, Inc." },
-  { s: "SNOW", n: "Snowflake Inc. Common Stock" },
-  { s: "SNPS", n: "Synopsys, Inc." },
-  { s: "SNT", n: "Senstar Technologies Corporation - Common Shares" },
-  { s: "SNTG", n: "Sentage Holdings Inc." },
-  { s: "SNTI", n: "Senti Biosciences Holdings, Inc." },
-  { s: "SNWV", n: "SANUWAVE Health, Inc." },
-  { s: "SNX", n: "TD SYNNEX Corporation Common Stock" },
-  { s: "SNY", n: "Sanofi" },
-  { s: "SNYR", n: "Synergy CHC Corp." },
-  { s: "SO", n: "Southern Company (The) Common Stock" },
-  { s: "SOAR", n: "Volato Group, Inc. Class A Common Stock" },
-  { s: "SOBO", n: "South Bow Corporation Common Shares" },
-  { s: "SOBR", n: "SOBR Safe, Inc." },
-  { s: "SOC", n: "Sable Offshore Corp. Common Stock" },
-  { s: "SOFI", n: "SoFi Technologies, Inc." },
-  { s: "SOGP", n: "Sound Group Inc." },
-  { s: "SOHU", n: "Sohu.com Limited" },
-  { s: "SOLS", n: "Solstice Advanced Materials Inc." },
-  { s: "SOLV", n: "Solventum Corporation Common Stock" },
-  { s: "SON", n: "Sonoco Products Company Common Stock" },
-  { s: "SONM", n: "DNA X, Inc." },
-  { s: "SONO", n: "Sonos, Inc." },
-  { s: "SONY", n: "Sony Group Corporation American Depositary Shares" },
-  { s: "SOPH", n: "SOPHiA GENETICS SA" },
-  { s: "SOR", n: "Source Capital, Inc. Cmn Shs of BI" },
-  { s: "SORA", n: "AsiaStrategy" },
-  { s: "SOS", n: "SOS Limited Class A Ordinary Shares" },
-  { s: "SOTK", n: "Sono-Tek Corporation" },
-  { s: "SOUN", n: "SoundHound AI, Inc." },
-  { s: "SOWG", n: "Sow Good Inc." },
-  { s: "SPAI", n: "Safe Pro Group Inc." },
-  { s: "SPB", n: "Spectrum Brands Holdings, Inc. Common Stock" },
-  { s: "SPCB", n: "SuperCom, Ltd." },
-  { s: "SPCE", n: "Virgin Galactic Holdings, Inc. Common Stock" },
-  { s: "SPCX", n: "Space Exploration Technologies Corp." },
-  { s: "SPFI", n: "South Plains Financial, Inc." },
-  { s: "SPG", n: "Simon Property Group, Inc. Common Stock" },
-  { s: "SPGI", n: "S&P Global Inc. Common Stock" },
-  { s: "SPH", n: "Suburban Propane Partners, L.P. Common Stock" },
-  { s: "SPHL", n: "Springview Holdings Ltd" },
-  { s: "SPHR", n: "Sphere Entertainment Co. Class A Common Stock" },
-  { s: "SPIR", n: "Spire Global, Inc. Class A Common Stock" },
-  { s: "SPMC", n: "Sound Point Meridian Capital, Inc. Common Stock" },
-  { s: "SPNT", n: "SiriusPoint Ltd. Common Shares" },
-  { s: "SPOK", n: "Spok Holdings, Inc." },
-  { s: "SPOT", n: "Spotify Technology S.A. Ordinary Shares" },
-  { s: "SPPL", n: "SIMPPLE LTD." },
-  { s: "SPRB", n: "Spruce Biosciences, Inc." },
-  { s: "SPRC", n: "SciSparc Ltd." },
-  { s: "SPRO", n: "Spero Therapeutics, Inc." },
-  { s: "SPRU", n: "Spruce Power Holding Corporation Class A Common Stock" },
-  { s: "SPRY", n: "ARS Pharmaceuticals, Inc." },
-  { s: "SPSC", n: "SPS Commerce, Inc." },
-  { s: "SPT", n: "Sprout Social, Inc" },
-  { s: "SPTX", n: "Seaport Therapeutics, Inc." },
-  { s: "SPWH", n: "Sportsman's Warehouse Holdings, Inc." },
-  { s: "SPWR", n: "SunPower Inc." },
-  { s: "SPXC", n: "SPX Technologies, Inc. Common Stock" },
-  { s: "SQM", n: "Sociedad Quimica y Minera S.A. Common Stock" },
-  { s: "SQNS", n: "Sequans Communications S.A. American Depositary Shares (each representing one hundred (100) Ordinary Shares)" },
-  { s: "SR", n: "Spire Inc. Common Stock" },
-  { s: "SRAD", n: "Sportradar Group AG" },
-  { s: "SRBK", n: "SR Bancorp, Inc." },
-  { s: "SRCE", n: "1st Source Corporation" },
-  { s: "SRE", n: "DBA Sempra Common Stock" },
-  { s: "SRFM", n: "Surf Air Mobility Inc. Common Stock" },
-  { s: "SRG", n: "Seritage Growth Properties Class A Common Stock" },
-  { s: "SRI", n: "Stoneridge, Inc. Common Stock" },
-  { s: "SRL", n: "Scully Royalty Ltd." },
-  { s: "SRPT", n: "Sarepta Therapeutics, Inc." },
-  { s: "SRRK", n: "Scholar Rock Holding Corporation" },
-  { s: "SRTA", n: "Strata Critical Medical, Inc." },
-  { s: "SRTS", n: "Sensus Healthcare, Inc." },
-  { s: "SRXH", n: "SRX Global Inc. Common Stock" },
-  { s: "SRZN", n: "Surrozen, Inc." },
-  { s: "SSB", n: "SouthState Bank Corporation Common Stock" },
-  { s: "SSBI", n: "Summit State Bank" },
-  { s: "SSD", n: "Simpson Manufacturing Company, Inc. Common Stock" },
-  { s: "SSII", n: "SS Innovations International Inc." },
-  { s: "SSL", n: "Sasol Ltd. American Depositary Shares" },
-  { s: "SSM", n: "Sono Group N.V." },
-  { s: "SSMR", n: "Sunshine Silver Mining & Refining Company Common Stock" },
-  { s: "SSNC", n: "SS&C Technologies Holdings, Inc." },
-  { s: "SSP", n: "E.W. Scripps Company (The)" },
-  { s: "SSRM", n: "SSR Mining Inc." },
-  { s: "SST", n: "System1, Inc. Class A Common Stock" },
-  { s: "SSTI", n: "SoundThinking, Inc." },
-  { s: "SSTK", n: "Shutterstock, Inc. Common Stock" },
-  { s: "SSYS", n: "Stratasys, Ltd." },
-  { s: "ST", n: "Sensata Technologies Holding plc Ordinary Shares" },
-  { s: "STAA", n: "STAAR Surgical Company" },
-  { s: "STAG", n: "Stag Industrial, Inc. Common Stock" },
-  { s: "STAK", n: "STAK Inc." },
-  { s: "STBA", n: "S&T Bancorp, Inc." },
-  { s: "STC", n: "Stewart Information Services Corporation Common Stock" },
-  { s: "STDN", n: "Standard Nuclear, Inc. Class A Common Stock" },
-  { s: "STE", n: "STERIS plc (Ireland) Ordinary Shares" },
-  { s: "STEM", n: "Stem, Inc. Class A Common Stock" },
-  { s: "STEP", n: "StepStone Group Inc." },
-  { s: "STEX", n: "Streamex Corp." },
-  { s: "STFS", n: "Star Fashion Culture Holdings Limited" },
-  { s: "STG", n: "Sunlands Technology Group American Depositary Shares, representing Class A ordinary shares" },
-  { s: "STGW", n: "Stagwell Inc." },
-  { s: "STHO", n: "Star Holdings - Shares of Beneficial Interest" },
-  { s: "STI", n: "Solidion Technology, Inc." },
-  { s: "STIM", n: "Neuronetics, Inc." },
-  { s: "STKE", n: "Sol Strategies Inc. - Common Shares" },
-  { s: "STKH", n: "Steakholder Foods Ltd." },
-  { s: "STKS", n: "The ONE Group Hospitality, Inc." },
-  { s: "STLA", n: "Stellantis N.V. Common Shares" },
-  { s: "STLD", n: "Steel Dynamics, Inc." },
-  { s: "STM", n: "STMicroelectronics N.V. Common Stock" },
-  { s: "STN", n: "Stantec Inc Common Stock" },
-  { s: "STNE", n: "StoneCo Ltd." },
-  { s: "STNG", n: "Scorpio Tankers Inc. Common Shares" },
-  { s: "STOK", n: "Stoke Therapeutics, Inc." },
-  { s: "STRA", n: "Strategic Education, Inc." },
-  { s: "STRL", n: "Sterling Infrastructure, Inc." },
-  { s: "STRO", n: "Sutro Biopharma, Inc." },
-  { s: "STRR", n: "Star Equity Holdings, Inc." },
-  { s: "STRS", n: "Stratus Properties Inc." },
-  { s: "STRT", n: "STRATTEC SECURITY CORPORATION" },
-  { s: "STRZ", n: "Starz Entertainment Corp. - Common Shares" },
-  { s: "STT", n: "State Street Corporation Common Stock" },
-  { s: "STTK", n: "Shattuck Labs, Inc." },
-  { s: "STUB", n: "StubHub Holdings, Inc. Class A Common Stock" },
-  { s: "STVN", n: "Stevanato Group S.p.A. Ordinary Shares" },
-  { s: "STX", n: "Seagate Technology Holdings PLC" },
-  { s: "STXS", n: "Stereotaxis, Inc. Common Stock" },
-  { s: "STZ", n: "Constellation Brands, Inc. Common Stock" },
-  { s: "SU", n: "Suncor Energy Inc. Common Stock" },
-  { s: "SUGP", n: "SU Group Holdings Limited" },
-  { s: "SUI", n: "Sun Communities, Inc. Common Stock" },
-  { s: "SUIG", n: "Sui Group Holdings Limited" },
-  { s: "SUJA", n: "Suja Life, Inc." },
-  { s: "SUNB", n: "Sunbelt Rentals Holdings, Inc. Common Stock" },
-  { s: "SUNC", n: "SunocoCorp LLC Common Units, representing limited liability company interests" },
-  { s: "SUNE", n: "SUNation Energy, Inc." },
-  { s: "SUPN", n: "Supernus Pharmaceuticals, Inc." },
-  { s: "SUPV", n: "Grupo Supervielle S.A. American Depositary Shares each Representing five Class B shares" },
-  { s: "SUPX", n: "SuperX AI Technology Limited" },
-  { s: "SURG", n: "SurgePays, Inc." },
-  { s: "SUZ", n: "Suzano S.A. American Depositary Shares (each representing One Ordinary Share)" },
-  { s: "SVA", n: "Sinovac Biotech, Ltd." },
-  { s: "SVCC", n: "Stellar V Capital Corp." },
-  { s: "SVCO", n: "Silvaco Group, Inc." },
-  { s: "SVM", n: "Silvercorp Metals Inc. Common Shares" },
-  { s: "SVRA", n: "Savara, Inc." },
-  { s: "SVRE", n: "SaverOne 2014 Ltd." },
-  { s: "SVRN", n: "OceanPal Inc." },
-  { s: "SVV", n: "Savers Value Village, Inc. Common Stock" },
-  { s: "SW", n: "Smurfit WestRock plc Ordinary Shares" },
-  { s: "SWAG", n: "Stran & Company, Inc." },
-  { s: "SWBI", n: "Smith & Wesson Brands, Inc." },
-  { s: "SWIM", n: "Latham Group, Inc." },
-  { s: "SWK", n: "Stanley Black & Decker, Inc. Common Stock" },
-  { s: "SWKS", n: "Skyworks Solutions, Inc." },
-  { s: "SWMR", n: "Swarmer, Inc" },
-  { s: "SWVL", n: "Swvl Holdings Corp" },
-  { s: "SWX", n: "Southwest Gas Holdings, Inc. Common Stock (DE)" },
-  { s: "SXC", n: "SunCoke Energy, Inc. Common Stock" },
-  { s: "SXI", n: "Standex International Corporation Common Stock" },
-  { s: "SXT", n: "Sensient Technologies Corporation Common Stock" },
-  { s: "SXTC", n: "China SXT Pharmaceuticals, Inc." },
-  { s: "SXTP", n: "60 Degrees Pharmaceuticals, Inc." },
-  { s: "SY", n: "So-Young International Inc. - American Depository Shares" },
-  { s: "SYBT", n: "Stock Yards Bancorp, Inc." },
-  { s: "SYF", n: "Synchrony Financial Common Stock" },
-  { s: "SYK", n: "Stryker Corporation Common Stock" },
-  { s: "SYM", n: "Symbotic Inc." },
-  { s: "SYNA", n: "Synaptics Incorporated" },
-  { s: "SYNX", n: "Silynxcom Ltd. Ordinary Shares" },
-  { s: "SYPR", n: "Sypris Solutions, Inc." },
-  { s: "SYRE", n: "Spyre Therapeutics, Inc." },
-  { s: "SYY", n: "Sysco Corporation Common Stock" },
-  { s: "T", n: "AT&T Inc." },
-  { s: "TAC", n: "TransAlta Corporation Ordinary Shares" },
-  { s: "TACT", n: "TransAct Technologies Incorporated" },
-  { s: "TAK", n: "Takeda Pharmaceutical Company Limited American Depositary Shares (each representing 1/2 of a share of Common Stock)" },
-  { s: "TAL", n: "TAL Education Group American Depositary Shares" },
-  { s: "TALK", n: "Talkspace, Inc." },
-  { s: "TALO", n: "Talos Energy, Inc. Common Stock" },
-  { s: "TANH", n: "Tantech Holdings Ltd." },
-  { s: "TAOP", n: "Taoping Inc." },
-  { s: "TAOX", n: "Tao Synergies Inc." },
-  { s: "TAP", n: "Molson Coors Beverage Company Class B Common Stock" },
-  { s: "TAP-A", n: "Molson Coors Beverage Company Class A Common Stock" },
-  { s: "TARA", n: "Protara Therapeutics, Inc." },
-  { s: "TARS", n: "Tarsus Pharmaceuticals, Inc." },
-  { s: "TASK", n: "TaskUs, Inc." },
-  { s: "TATT", n: "TAT Technologies Ltd." },
-  { s: "TAYD", n: "Taylor Devices, Inc." },
-  { s: "TBBB", n: "BBB Foods Inc. Class A Common Shares" },
-  { s: "TBBK", n: "The Bancorp, Inc." },
-  { s: "TBCH", n: "Turtle Beach Corporation" },
-  { s: "TBI", n: "TrueBlue, Inc. Common Stock" },
-  { s: "TBLA", n: "Taboola.com Ltd." },
-  { s: "TBN", n: "Tamboran Resources Corporation Common stock" },
-  { s: "TBPH", n: "Theravance Biopharma, Inc." },
-  { s: "TC", n: "Token Cat Limited" },
-  { s: "TCBI", n: "Texas Capital Bancshares, Inc." },
-  { s: "TCBK", n: "TriCo Bancshares" },
-  { s: "TCBS", n: "Texas Community Bancshares, Inc." },
-  { s: "TCBX", n: "Third Coast Bancshares, Inc. Common Stock" },
-  { s: "TCI", n: "Transcontinental Realty Investors, Inc. Common Stock" },
-  { s: "TCMD", n: "Tactile Systems Technology, Inc." },
-  { s: "TCOM", n: "Trip.com Group Limited" },
-  { s: "TCRT", n: "Alaunos Therapeutics, Inc." },
-  { s: "TCRX", n: "TScan Therapeutics, Inc." },
-  { s: "TCX", n: "Tucows Inc." },
-  { s: "TD", n: "Toronto Dominion Bank (The) Common Stock" },
-  { s: "TDAY", n: "USA TODAY Co., Inc. Common Stock" },
-  { s: "TDC", n: "Teradata Corporation Common Stock" },
-  { s: "TDG", n: "Transdigm Group Incorporated Common Stock" },
-  { s: "TDIC", n: "Dreamland Limited" },
-  { s: "TDOC", n: "Teladoc Health, Inc. Common Stock" },
-  { s: "TDS", n: "Telephone and Data Systems, Inc. Common Shares" },
-  { s: "TDTH", n: "Trident Digital Tech Holdings Ltd" },
-  { s: "TDUP", n: "ThredUp Inc." },
-  { s: "TDW", n: "Tidewater Inc. Common Stock" },
-  { s: "TDY", n: "Teledyne Technologies Incorporated Common Stock" },
-  { s: "TE", n: "T1 Energy Inc. Common Stock" },
-  { s: "TEAD", n: "Teads Holding Co." },
-  { s: "TEAM", n: "Atlassian Corporation" },
-  { s: "TECH", n: "Bio-Techne Corp" },
-  { s: "TECK", n: "Teck Resources Ltd Ordinary Shares" },
-  { s: "TECX", n: "Tectonic Therapeutic, Inc." },
-  { s: "TEL", n: "TE Connectivity plc Ordinary Shares" },
-  { s: "TELA", n: "TELA Bio, Inc." },
-  { s: "TELO", n: "Telomir Pharmaceuticals, Inc." },
-  { s: "TEM", n: "Tempus AI, Inc." },
-  { s: "TEN", n: "Tsakos Energy Navigation Ltd Common Shares" },
-  { s: "TENB", n: "Tenable Holdings, Inc." },
-  { s: "TENX", n: "Tenax Therapeutics, Inc." },
-  { s: "TEO", n: "Telecom Argentina SA" },
-  { s: "TER", n: "Teradyne, Inc." },
-  { s: "TEVA", n: "Teva Pharmaceutical Industries Limited American Depositary Shares" },
-  { s: "TEX", n: "Terex Corporation Common Stock" },
-  { s: "TFC", n: "Truist Financial Corporation Common Stock" },
-  { s: "TFII", n: "TFI International Inc. Common Shares" },
-  { s: "TFIN", n: "Triumph Financial, Inc. Common Stock" },
-  { s: "TFPM", n: "Triple Flag Precious Metals Corp. Common Shares" },
-  { s: "TFSL", n: "TFS Financial Corporation" },
-  { s: "TFX", n: "Teleflex Incorporated Common Stock" },
-  { s: "TG", n: "Tredegar Corporation Common Stock" },
-  { s: "TGB", n: "Trekor Metals Limited Common Shares" },
-  { s: "TGE", n: "The Generation Essentials Group Class A Ordinary Shares" },
-  { s: "TGEN", n: "Tecogen Inc. Common Stock" },
-  { s: "TGHL", n: "The GrowHub Limited" },
-  { s: "TGL", n: "Treasure Global Inc." },
-  { s: "TGLS", n: "Tecnoglass Inc. Common Stock" },
-  { s: "TGS", n: "Transportadora de Gas del Sur SA TGS Common Stock" },
-  { s: "TGT", n: "Target Corporation Common Stock" },
-  { s: "TGTX", n: "TG Therapeutics, Inc." },
-  { s: "TH", n: "Target Hospitality Corp." },
-  { s: "THC", n: "Tenet Healthcare Corporation Common Stock" },
-  { s: "THCH", n: "TH International Limited" },
-  { s: "THFF", n: "First Financial Corporation" },
-  { s: "THG", n: "Hanover Insurance Group Inc" },
-  { s: "THH", n: "TryHard Holdings Limited" },
-  { s: "THM", n: "International Tower Hill Mines, Ltd. Ordinary Shares (Canada)" },
-  { s: "THO", n: "Thor Industries, Inc. Common Stock" },
-  { s: "THRM", n: "Gentherm Inc" },
-  { s: "THRY", n: "Thryv Holdings, Inc." },
-  { s: "TIC", n: "TIC Solutions, Inc. Common Stock" },
-  { s: "TIGO", n: "Millicom International Cellular S.A." },
-  { s: "TIGR", n: "UP Fintech Holding Limited" },
-  { s: "TII", n: "Titan Mining Corporation Common Shares" },
-  { s: "TIL", n: "Instil Bio, Inc." },
-  { s: "TILE", n: "Interface, Inc." },
-  { s: "TIMB", n: "TIM S.A. American Depositary Shares (Each representing 5 Common Shares)" },
-  { s: "TIPT", n: "Tiptree Inc." },
-  { s: "TISI", n: "Team, Inc. Common Stock" },
-  { s: "TITN", n: "Titan Machinery Inc." },
-  { s: "TJGC", n: "TJGC Group Limited" },
-  { s: "TJX", n: "TJX Companies, Inc. (The) Common Stock" },
-  { s: "TK", n: "Teekay Corporation Ltd. Common Stock" },
-  { s: "TKC", n: "Turkcell Iletisim Hizmetleri AS Common Stock" },
-  { s: "TKLF", n: "Tokyo Lifestyle Co., Ltd." },
-  { s: "TKNO", n: "Alpha Teknova, Inc." },
-  { s: "TKO", n: "TKO Group Holdings, Inc. Class A Common Stock" },
-  { s: "TKR", n: "Timken Company (The) Common Stock" },
-  { s: "TLF", n: "Tandy Leather Factory, Inc." },
-  { s: "TLIH", n: "Ten-League International Holdings Limited" },
-  { s: "TLK", n: "PT Telekomunikasi Indonesia, Tbk" },
-  { s: "TLN", n: "Talen Energy Corporation" },
-  { s: "TLNC", n: "Talon Capital Corp." },
-  { s: "TLNCU", n: "Talon Capital Corp. - Units" },
-  { s: "TLNCW", n: "Talon Capital Corp. - Warrants" },
-  { s: "TLPH", n: "Talphera, Inc." },
-  { s: "TLRY", n: "Tilray Brands, Inc." },
-  { s: "TLS", n: "Telos Corporation" },
-  { s: "TLSA", n: "Tiziana Life Sciences Ltd - Common Shares" },
-  { s: "TLSI", n: "TriSalus Life Sciences, Inc." },
-  { s: "TLX", n: "Telix Pharmaceuticals Limited" },
-  { s: "TLYS", n: "Tilly's, Inc. Common Stock" },
-  { s: "TM", n: "Toyota Motor Corporation Common Stock" },
-  { s: "TMC", n: "TMC the metals company Inc." },
-  { s: "TMCI", n: "Treace Medical Concepts, Inc." },
-  { s: "TMCR", n: "The Metals Royalty Company Inc." },
-  { s: "TMDE", n: "TMD Energy Limited Ordinary Shares" },
-  { s: "TMDX", n: "TransMedics Group, Inc." },
-  { s: "TME", n: "Tencent Music Entertainment Group American Depositary Shares, each representing two Class A Ordinary Shares" },
-  { s: "TMHC", n: "Taylor Morrison Home Corporation Common Stock" },
-  { s: "TMO", n: "Thermo Fisher Scientific Inc Common Stock" },
-  { s: "TMP", n: "Tompkins Financial Corporation Common Stock" },
-  { s: "TMQ", n: "Trilogy Metals Inc. Common Stock" },
-  { s: "TMS", n: "Teamshares Inc." },
-  { s: "TMSWW", n: "Teamshares Inc. - Warrants" },
-  { s: "TMUS", n: "T-Mobile US, Inc." },
-  { s: "TNC", n: "Tennant Company Common Stock" },
-  { s: "TNDM", n: "Tandem Diabetes Care, Inc." },
-  { s: "TNET", n: "TriNet Group, Inc. Common Stock" },
-  { s: "TNGX", n: "Tango Therapeutics, Inc." },
-  { s: "TNK", n: "Teekay Tankers Ltd." },
-  { s: "TNL", n: "Travel Leisure Co. Common Stock" },
-  { s: "TNMG", n: "TNL Mediagene" },
-  { s: "TNON", n: "Tenon Medical, Inc." },
-  { s: "TNXP", n: "Tonix Pharmaceuticals Holding Corp." },
-  { s: "TNYA", n: "Tenaya Therapeutics, Inc." },
-  { s: "TOI", n: "The Oncology Institute, Inc." },
-  { s: "TOL", n: "Toll Brothers, Inc. Common Stock" },
-  { s: "TOMZ", n: "TOMI Environmental Solutions, Inc." },
-  { s: "TONX", n: "TON Strategy Company" },
-  { s: "TOON", n: "Kartoon Studios, Inc. Common Stock" },
-  { s: "TOP", n: "TOP Financial Group Limited" },
-  { s: "TOPP", n: "Toppoint Holdings Inc. Common Stock" },
-  { s: "TOPS", n: "TOP Ships, Inc. Common Stock" },
-  { s: "TORO", n: "Toro Corp." },
-  { s: "TOST", n: "Toast, Inc. Class A Common Stock" },
-  { s: "TOUR", n: "Tuniu Corporation" },
-  { s: "TOVX", n: "Theriva Biologics, Inc. Common Stock" },
-  { s: "TOWN", n: "Towne Bank" },
-  { s: "TOYO", n: "TOYO Co., Ltd" },
-  { s: "TPB", n: "Turning Point Brands, Inc. Common Stock" },
-  { s: "TPC", n: "Tutor Perini Corporation Common Stock" },
-  { s: "TPCS", n: "TechPrecision Corporation" },
-  { s: "TPET", n: "Trio Petroleum Corp. Common Stock" },
-  { s: "TPG", n: "TPG Inc." },
-  { s: "TPL", n: "Texas Pacific Land Corporation Common Stock" },
-  { s: "TPR", n: "Tapestry, Inc. Common Stock" },
-  { s: "TPST", n: "Tempest Therapeutics, Inc." },
-  { s: "TPVG", n: "TriplePoint Venture Growth BDC Corp. Common Stock" },
-  { s: "TR", n: "Tootsie Roll Industries, Inc. Common Stock" },
-  { s: "TRAK", n: "ReposiTrak, Inc. Common Stock" },
-  { s: "TRAW", n: "Traws Pharma, Inc." },
-  { s: "TRAX", n: "First Tracks Biotherapeutics, Inc." },
-  { s: "TRC", n: "Tejon Ranch Co Common Stock" },
-  { s: "TRDA", n: "Entrada Therapeutics, Inc." },
-  { s: "TREE", n: "LendingTree, Inc." },
-  { s: "TREX", n: "Trex Company, Inc. Common Stock" },
-  { s: "TRGP", n: "Targa Resources, Inc. Common Stock" },
-  { s: "TRGS", n: "TRG Latin America Acquisitions Corp." },
-  { s: "TRGSU", n: "TRG Latin America Acquisitions Corp. - Units" },
-  { s: "TRI", n: "Thomson Reuters Corp - Common Shares" },
-  { s: "TRIB", n: "Trinity Biotech plc" },
-  { s: "TRIN", n: "Trinity Capital Inc." },
-  { s: "TRIP", n: "TripAdvisor, Inc." },
-  { s: "TRLV", n: "Trulieve Cannabis Corp. Subordinate Voting Shares" },
-  { s: "TRMB", n: "Trimble Inc." },
-  { s: "TRMD", n: "TORM plc" },
-  { s: "TRMK", n: "Trustmark Corporation" },
-  { s: "TRN", n: "Trinity Industries, Inc. Common Stock" },
-  { s: "TRNO", n: "Terreno Realty Corporation Common Stock" },
-  { s: "TRNR", n: "Interactive Strength Inc." },
-  { s: "TRNS", n: "Transcat, Inc." },
-  { s: "TRON", n: "Tron Inc." },
-  { s: "TROO", n: "TROOPS, Inc." },
-  { s: "TROW", n: "T. Rowe Price Group, Inc." },
-  { s: "TROX", n: "Tronox Holdings plc Ordinary Shares (UK)" },
-  { s: "TRP", n: "TC Energy Corporation Common Stock" },
-  { s: "TRS", n: "TriMas Corporation" },
-  { s: "TRSG", n: "Tungray Technologies Inc" },
-  { s: "TRST", n: "TrustCo Bank Corp NY" },
-  { s: "TRT", n: "Trio-Tech International Common Stock" },
-  { s: "TRU", n: "TransUnion Common Stock" },
-  { s: "TRUG", n: "TruGolf Holdings, Inc." },
-  { s: "TRUP", n: "Trupanion, Inc." },
-  { s: "TRV", n: "The Travelers Companies, Inc. Common Stock" },
-  { s: "TRVG", n: "trivago N.V." },
-  { s: "TRVI", n: "Trevi Therapeutics, Inc." },
-  { s: "TRX", n: "TRX Gold Corporation Common Stock" },
-  { s: "TS", n: "Tenaris S.A. American Depositary Shares" },
-  { s: "TSAT", n: "Telesat Corporation" },
-  { s: "TSBK", n: "Timberland Bancorp, Inc." },
-  { s: "TSCO", n: "Tractor Supply Company" },
-  { s: "TSEM", n: "Tower Semiconductor Ltd." },
-  { s: "TSHA", n: "Taysha Gene Therapies, Inc." },
-  { s: "TSLA", n: "Tesla, Inc." },
-  { s: "TSLX", n: "Sixth Street Specialty Lending, Inc. Common Stock" },
-  { s: "TSM", n: "Taiwan Semiconductor Manufacturing Company Ltd." },
-  { s: "TSN", n: "Tyson Foods, Inc. Common Stock" },
-  { s: "TSQ", n: "Townsquare Media, Inc. Class A Common Stock" },
-  { s: "TSSI", n: "TSS, Inc." },
-  { s: "TT", n: "Trane Technologies plc" },
-  { s: "TTAM", n: "Titan America SA Common Shares" },
-  { s: "TTAN", n: "ServiceTitan, Inc." },
-  { s: "TTC", n: "Toro Company (The) Common Stock" },
-  { s: "TTD", n: "The Trade Desk, Inc." },
-  { s: "TTE", n: "TotalEnergies SE Ordinary Shares" },
-  { s: "TTEC", n: "TTEC Holdings, Inc." },
-  { s: "TTEK", n: "Tetra Tech, Inc." },
-  { s: "TTGT", n: "TechTarget, Inc." },
-  { s: "TTI", n: "Tetra Technologies, Inc. Common Stock" },
-  { s: "TTMI", n: "TTM Technologies, Inc." },
-  { s: "TTRX", n: "Turn Therapeutics Inc." },
-  { s: "TTWO", n: "Take-Two Interactive Software, Inc." },
-  { s: "TU", n: "Telus Corporation Ordinary Shares" },
-  { s: "TULP", n: "Bloomia Holdings, Inc." },
-  { s: "TURB", n: "Turbo Energy, S.A." },
-  { s: "TUSK", n: "Mammoth Energy Services, Inc." },
-  { s: "TUYA", n: "Tuya Inc. American Depositary Shares, each representing one Class A Ordinary Share" },
-  { s: "TV", n: "Grupo Televisa S.A.B. Common Stock" },
-  { s: "TVC", n: "Tennessee Valley Authority Common Stock" },
-  { s: "TVE", n: "Tennessee Valley Authority" },
-  { s: "TVGN", n: "Tevogen Bio Holdings Inc." },
-  { s: "TVRD", n: "Tvardi Therapeutics, Inc." },
-  { s: "TVTX", n: "Travere Therapeutics, Inc." },
-  { s: "TW", n: "Tradeweb Markets Inc." },
-  { s: "TWAV", n: "TaoWeave, Inc." },
-  { s: "TWFG", n: "TWFG, Inc." },
-  { s: "TWG", n: "Top Wealth Group Holding Limited" },
-  { s: "TWI", n: "Titan International, Inc. (DE) Common Stock" },
-  { s: "TWIN", n: "Twin Disc, Incorporated" },
-  { s: "TWLO", n: "Twilio Inc. Class A Common Stock" },
-  { s: "TWLV", n: "Twelve Seas Investment Company III" },
-  { s: "TWLVU", n: "Twelve Seas Investment Company III - Units" },
-  { s: "TWO", n: "Two Harbors Investment Corp" },
-  { s: "TWST", n: "Twist Bioscience Corporation" },
-  { s: "TX", n: "Ternium S.A. Ternium S.A. American Depositary Shares (each representing ten shares, USD1.00 par value)" },
-  { s: "TXG", n: "10x Genomics, Inc." },
-  { s: "TXMD", n: "TherapeuticsMD, Inc." },
-  { s: "TXN", n: "Texas Instruments Incorporated" },
-  { s: "TXNM", n: "TXNM Energy, Inc. Common Stock" },
-  { s: "TXO", n: "TXO Partners, L.P. Common Units Representing Limited Partner Interests" },
-  { s: "TXRH", n: "Texas Roadhouse, Inc." },
-  { s: "TXT", n: "Textron Inc. Common Stock" },
-  { s: "TY", n: "Tri Continental Corporation Common Stock" },
-  { s: "TYG", n: "Tortoise Energy Infrastructure Corporation Common Stock" },
-  { s: "TYGO", n: "Tigo Energy, Inc." },
-  { s: "TYL", n: "Tyler Technologies, Inc. Common Stock" },
-  { s: "TYRA", n: "Tyra Biosciences, Inc." },
-  { s: "TZOO", n: "Travelzoo" },
-  { s: "U", n: "Unity Software Inc. Common Stock" },
-  { s: "UA", n: "Under Armour, Inc. Class C Common Stock" },
-  { s: "UAA", n: "Under Armour, Inc. Class A Common Stock" },
-  { s: "UAL", n: "United Airlines Holdings, Inc." },
-  { s: "UAMY", n: "United States Antimony Corporation Common Stock" },
-  { s: "UAVS", n: "AgEagle Aerial Systems, Inc. Common Stock" },
-  { s: "UBCP", n: "United Bancorp, Inc." },
-  { s: "UBER", n: "Uber Technologies, Inc. Common Stock" },
-  { s: "UBS", n: "UBS Group AG Registered Ordinary Shares" },
-  { s: "UBSI", n: "United Bankshares, Inc." },
-  { s: "UBXG", n: "U-BX Technology Ltd." },
-  { s: "UCAR", n: "U Power Limited" },
-  { s: "UCB", n: "United Community Banks, Inc. Common Stock" },
-  { s: "UCFI", n: "CN Healthy Food Tech Group Corp." },
-  { s: "UCL", n: "uCloudlink Group Inc." },
-  { s: "UCTT", n: "Ultra Clean Holdings, Inc." },
-  { s: "UDR", n: "UDR, Inc. Common Stock" },
-  { s: "UE", n: "Urban Edge Properties Common Shares of Beneficial Interest" },
-  { s: "UEC", n: "Uranium Energy Corp. Common Stock" },
-  { s: "UEIC", n: "Universal Electronics Inc." },
-  { s: "UFCS", n: "United Fire Group, Inc" },
-  { s: "UFG", n: "Uni-Fuels Holdings Limited" },
-  { s: "UFI", n: "Unifi, Inc. New Common Stock" },
-  { s: "UFPI", n: "UFP Industries, Inc." },
-  { s: "UFPT", n: "UFP Technologies, Inc." },
-  { s: "UG", n: "United-Guardian, Inc." },
-  { s: "UGI", n: "UGI Corporation Common Stock" },
-  { s: "UGP", n: "Ultrapar Participacoes S.A. (New) American Depositary Shares (Each representing one Common Share)" },
-  { s: "UHAL", n: "U-Haul Holding Company Common Stock" },
-  { s: "UHS", n: "Universal Health Services, Inc. Common Stock" },
-  { s: "UI", n: "Ubiquiti Inc. Common Stock" },
-  { s: "UIS", n: "Unisys Corporation New Common Stock" },
-  { s: "UK", n: "Ucommune International Ltd" },
-  { s: "UL", n: "Unilever PLC American Depositary Shares (each representing One Ordinary Share)" },
-  { s: "ULBI", n: "Ultralife Corporation" },
-  { s: "ULCC", n: "Frontier Group Holdings, Inc." },
-  { s: "ULH", n: "Universal Logistics Holdings, Inc." },
-  { s: "ULS", n: "UL Solutions Inc. Class A Common Stock" },
-  { s: "ULTA", n: "Ulta Beauty, Inc." },
-  { s: "UMAC", n: "Unusual Machines, Inc. Common Stock" },
-  { s: "UMBF", n: "UMB Financial Corporation" },
-  { s: "UMC", n: "United Microelectronics Corporation (NEW) Common Stock" },
-  { s: "UMH", n: "UMH Properties, Inc. Common Stock" },
-  { s: "UNB", n: "Union Bankshares, Inc." },
-  { s: "UNCY", n: "Unicycive Therapeutics, Inc." },
-  { s: "UNF", n: "Unifirst Corporation Common Stock" },
-  { s: "UNFI", n: "United Natural Foods, Inc. Common Stock" },
-  { s: "UNH", n: "UnitedHealth Group Incorporated Common Stock (DE)" },
-  { s: "UNIT", n: "Uniti Group Inc." },
-  { s: "UNM", n: "Unum Group Common Stock" },
-  { s: "UNP", n: "Union Pacific Corporation Common Stock" },
-  { s: "UNTY", n: "Unity Bancorp, Inc." },
-  { s: "UONE", n: "Urban One, Inc." },
-  { s: "UONEK", n: "Urban One, Inc." },
-  { s: "UP", n: "Wheels Up Experience Inc. Class A Common Stock" },
-  { s: "UPB", n: "Upstream Bio, Inc." },
-  { s: "UPBD", n: "Upbound Group, Inc." },
-  { s: "UPC", n: "Universe Pharmaceuticals Inc" },
-  { s: "UPLD", n: "Upland Software, Inc." },
-  { s: "UPS", n: "United Parcel Service, Inc. Common Stock" },
-  { s: "UPST", n: "Upstart Holdings, Inc." },
-  { s: "UPWK", n: "Upwork Inc." },
-  { s: "UPXI", n: "Upexi, Inc." },
-  { s: "URBN", n: "Urban Outfitters, Inc." },
-  { s: "URG", n: "Ur Energy Inc Common Shares (Canada)" },
-  { s: "URGN", n: "UroGen Pharma Ltd." },
-  { s: "URI", n: "United Rentals, Inc. Common Stock" },
-  { s: "UROY", n: "Uranium Royalty Corp." },
-  { s: "USAR", n: "USA Rare Earth, Inc." },
-  { s: "USAS", n: "Americas Gold and Silver Corporation Common Shares, no par value" },
-  { s: "USAU", n: "U.S. Gold Corp." },
-  { s: "USB", n: "U.S. Bancorp Common Stock" },
-  { s: "USBC", n: "USBC, Inc. Common Stock" },
-  { s: "USCB", n: "USCB Financial Holdings, Inc." },
-  { s: "USDE", n: "StablecoinX Inc." },
-  { s: "USDEW", n: "StablecoinX Inc. - Warrants" },
-  { s: "USEA", n: "United Maritime Corporation" },
-  { s: "USFD", n: "US Foods Holding Corp. Common Stock" },
-  { s: "USGO", n: "U.S. GoldMining Inc." },
-  { s: "USIO", n: "Usio, Inc." },
-  { s: "USLM", n: "United States Lime & Minerals, Inc." },
-  { s: "USNA", n: "USANA Health Sciences, Inc. Common Stock" },
-  { s: "USPH", n: "U.S. Physical Therapy, Inc. Common Stock" },
-  { s: "UTHR", n: "United Therapeutics Corporation" },
-  { s: "UTI", n: "Universal Technical Institute Inc Common Stock" },
-  { s: "UTL", n: "UNITIL Corporation Common Stock" },
-  { s: "UTMD", n: "Utah Medical Products, Inc." },
-  { s: "UTSI", n: "UTStarcom Holdings Corp" },
-  { s: "UTZ", n: "Utz Brands Inc Class A Common Stock" },
-  { s: "UUU", n: "Universal Safety Products, Inc. Common Stock" },
-  { s: "UUUU", n: "Energy Fuels Inc Ordinary Shares (Canada)" },
-  { s: "UVE", n: "UNIVERSAL INSURANCE HOLDINGS INC Common Stock" },
-  { s: "UVSP", n: "Univest Financial Corporation" },
-  { s: "UVV", n: "Universal Corporation Common Stock" },
-  { s: "UWMC", n: "UWM Holdings Corporation Class A Common Stock" },
-  { s: "UXIN", n: "Uxin Limited" },
-  { s: "UZX", n: "Linkage Global Inc" },
-  { s: "V", n: "Visa Inc." },
-  { s: "VABK", n: "Virginia National Bankshares Corporation" },
-  { s: "VAC", n: "Marriott Vacations Worldwide Corporation Common Stock" },
-  { s: "VAL", n: "Valaris Limited Common Shares" },
-  { s: "VAL-W", n: "Valaris Limited Warrants" },
-  { s: "VALE", n: "VALE S.A. American Depositary Shares Each Representing one common share" },
-  { s: "VALN", n: "Valneva SE" },
-  { s: "VALU", n: "Value Line, Inc." },
-  { s: "VANI", n: "Vivani Medical, Inc." },
-  { s: "VATE", n: "INNOVATE Corp. Common Stock" },
-  { s: "VBIO", n: "Valion Bio, Inc." },
-  { s: "VBNK", n: "VersaBank - Common Shares" },
-  { s: "VC", n: "Visteon Corporation" },
-  { s: "VCEL", n: "Vericel Corporation" },
-  { s: "VCIG", n: "VCI Global Limited - Ordinary Share" },
-  { s: "VCRE", n: "Vicore Pharma Holding AB" },
-  { s: "VCTR", n: "Victory Capital Holdings, Inc." },
-  { s: "VCYT", n: "Veracyte, Inc." },
-  { s: "VECO", n: "Veeco Instruments Inc." },
-  { s: "VEEA", n: "Veea Inc." },
-  { s: "VEEE", n: "Twin Vee PowerCats Co." },
-  { s: "VEEV", n: "Veeva Systems Inc. Class A Common Stock" },
-  { s: "VEL", n: "Velocity Financial, Inc. Common Stock" },
-  { s: "VELO", n: "Velo3D, Inc." },
-  { s: "VENU", n: "Venu Holding Corporation Common Stock" },
-  { s: "VEON", n: "VEON Ltd." },
-  { s: "VERA", n: "Vera Therapeutics, Inc." },
-  { s: "VERI", n: "Veritone, Inc." },
-  { s: "VERU", n: "Veru Inc." },
-  { s: "VERX", n: "Vertex, Inc." },
-  { s: "VET", n: "Vermilion Energy Inc. Common (Canada)" },
-  { s: "VFC", n: "V.F. Corporation Common Stock" },
-  { s: "VFF", n: "Village Farms International, Inc. - Common Shares" },
-  { s: "VFS", n: "VinFast Auto Ltd." },
-  { s: "VG", n: "Venture Global, Inc. Class A common stock" },
-  { s: "VGAS", n: "Verde Clean Fuels, Inc." },
-  { s: "VGNT", n: "Versigent PLC Ordinary Shares" },
-  { s: "VGZ", n: "Vista Gold Corp Common Stock" },
-  { s: "VHC", n: "VirnetX Holding Corp" },
-  { s: "VHCP", n: "Vine Hill Capital Investment Corp. II" },
-  { s: "VHCPU", n: "Vine Hill Capital Investment Corp. II - Units" },
-  { s: "VHCPW", n: "Vine Hill Capital Investment Corp. II - Warrants" },
-  { s: "VHI", n: "Valhi, Inc. Common Stock" },
-  { s: "VHUB", n: "VenHub Global, Inc." },
-  { s: "VIA", n: "Via Transportation, Inc. Class A Common Stock" },
-  { s: "VIAV", n: "Viavi Solutions Inc." },
-  { s: "VICI", n: "VICI Properties Inc. Common Stock" },
-  { s: "VICR", n: "Vicor Corporation" },
-  { s: "VIDA", n: "VIDA Global Inc. Class A Common Stock" },
-  { s: "VIK", n: "Viking Holdings Ltd Ordinary Shares" },
-  { s: "VINP", n: "Vinci Compass Investments Ltd." },
-  { s: "VIOT", n: "Viomi Technology Co., Ltd" },
-  { s: "VIPS", n: "Vipshop Holdings Limited American Depositary Shares, each representing two ordinary shares" },
-  { s: "VIR", n: "Vir Biotechnology, Inc." },
-  { s: "VIRC", n: "Virco Manufacturing Corporation" },
-  { s: "VIRT", n: "Virtu Financial, Inc. Class A Common Stock" },
-  { s: "VISN", n: "Vistance Networks, Inc." },
-  { s: "VITL", n: "Vital Farms, Inc." },
-  { s: "VIV", n: "Telefonica Brasil S.A. American Depositary Shares (Each representing One Common Share)" },
-  { s: "VIVK", n: "Vivakor, Inc." },
-  { s: "VIVO", n: "VivoPower PLC" },
-  { s: "VIVS", n: "VivoSim Labs, Inc." },
-  { s: "VKTX", n: "Viking Therapeutics, Inc." },
-  { s: "VLGEA", n: "Village Super Market, Inc." },
-  { s: "VLN", n: "Valens Semiconductor Ltd. Ordinary Shares" },
-  { s: "VLO", n: "Valero Energy Corporation Common Stock" },
-  { s: "VLRS", n: "Controladora Vuela Compania de Aviacion, S.A.B. de C.V. American Depositary Shares, each representing ten (10) Ordinary Participation Certificates" },
-  { s: "VLTO", n: "Veralto Corp Common Stock" },
-  { s: "VLY", n: "Valley National Bancorp" },
-  { s: "VMAR", n: "Vision Marine Technologies Inc. - Common Shares" },
-  { s: "VMC", n: "Vulcan Materials Company (Holding Company) Common Stock" },
-  { s: "VMD", n: "Viemed Healthcare, Inc. - Common Shares" },
-  { s: "VMET", n: "Versamet Royalties Corporation" },
-  { s: "VMI", n: "Valmont Industries, Inc. Common Stock" },
-  { s: "VNCE", n: "Vince Holding Corp." },
-  { s: "VNDA", n: "Vanda Pharmaceuticals Inc." },
-  { s: "VNET", n: "VNET Group, Inc." },
-  { s: "VNOM", n: "Viper Energy, Inc." },
-  { s: "VNRX", n: "VolitionRX Limited Common Stock" },
-  { s: "VNT", n: "Vontier Corporation Common Stock" },
-  { s: "VNTG", n: "Vantage Corp Class A Ordinary Shares" },
-  { s: "VOD", n: "Vodafone Group Plc" },
-  { s: "VOR", n: "Vor Biopharma Inc." },
-  { s: "VOXR", n: "Vox Royalty Corp." },
-  { s: "VOYA", n: "Voya Financial, Inc. Common Stock" },
-  { s: "VOYG", n: "Voyager Technologies, Inc. Class A Common Stock" },
-  { s: "VPG", n: "Vishay Precision Group, Inc. Common Stock" },
-  { s: "VRA", n: "Vera Bradley, Inc." },
-  { s: "VRAX", n: "Virax Biolabs Group Limited" },
-  { s: "VRCA", n: "Verrica Pharmaceuticals Inc." },
-  { s: "VRDN", n: "Viridian Therapeutics, Inc." },
-  { s: "VREX", n: "Varex Imaging Corporation" },
-  { s: "VRM", n: "Vroom, Inc." },
-  { s: "VRME", n: "VerifyMe, Inc." },
-  { s: "VRNS", n: "Varonis Systems, Inc." },
-  { s: "VRRM", n: "Verra Mobility Corporation" },
-  { s: "VRSK", n: "Verisk Analytics, Inc." },
-  { s: "VRSN", n: "VeriSign, Inc." },
-  { s: "VRT", n: "Vertiv Holdings, LLC Class A Common Stock" },
-  { s: "VRTS", n: "Virtus Investment Partners, Inc. Common Stock" },
-  { s: "VRTX", n: "Vertex Pharmaceuticals Incorporated" },
-  { s: "VRXA", n: "Veraxa Biotech AG" },
-  { s: "VRXAW", n: "Veraxa Biotech AG - Warrants" },
-  { s: "VS", n: "Versus Systems Inc." },
-  { s: "VSA", n: "VisionSys AI Inc." },
-  { s: "VSAT", n: "ViaSat, Inc." },
-  { s: "VSEC", n: "VSE Corporation" },
-  { s: "VSECU", n: "VSE Corporation - Tangible Equity Units" },
-  { s: "VSEE", n: "VSee Health, Inc." },
-  { s: "VSH", n: "Vishay Intertechnology, Inc. Common Stock" },
-  { s: "VSME", n: "VS Media Holdings Limited" },
-  { s: "VSNT", n: "Versant Media Group, Inc." },
-  { s: "VST", n: "Vistra Corp. Common Stock" },
-  { s: "VSTD", n: "Vestand Inc." },
-  { s: "VSTM", n: "Verastem, Inc." },
-  { s: "VSTS", n: "Vestis Corporation Common Stock" },
-  { s: "VSXY", n: "Victorias Secret & Co. Common Stock" },
-  { s: "VTAK", n: "Catheter Precision, Inc. Common Stock" },
-  { s: "VTEX", n: "VTEX Class A Common Shares" },
-  { s: "VTGN", n: "Vistagen Therapeutics, Inc." },
-  { s: "VTIX", n: "Virtuix Holdings Inc." },
-  { s: "VTMX", n: "Corporacion Inmobiliaria Vesta, S.A.B de C.V. American Depositary Shares, each representing ten (10) Common Shares" },
-  { s: "VTOL", n: "Bristow Group, Inc. Common Stock" },
-  { s: "VTR", n: "Ventas, Inc. Common Stock" },
-  { s: "VTRS", n: "Viatris Inc." },
-  { s: "VTS", n: "Vitesse Energy, Inc. Common Stock" },
-  { s: "VTSI", n: "VirTra, Inc." },
-  { s: "VTVT", n: "vTv Therapeutics Inc." },
-  { s: "VUZI", n: "Vuzix Corporation" },
-  { s: "VVOS", n: "Vivos Therapeutics, Inc." },
-  { s: "VVV", n: "Valvoline Inc. Common Stock" },
-  { s: "VVX", n: "V2X, Inc. Common Stock" },
-  { s: "VWAV", n: "VisionWave Holdings, Inc." },
-  { s: "VYGR", n: "Voyager Therapeutics, Inc." },
-  { s: "VYNE", n: "VYNE Therapeutics Inc." },
-  { s: "VYX", n: "NCR Voyix Corporation Common Stock" },
-  { s: "VZ", n: "Verizon Communications Inc. Common Stock" },
-  { s: "VZLA", n: "Vizsla Silver Corp. Common Shares" },
-  { s: "W", n: "Wayfair Inc. Class A Common Stock" },
-  { s: "WAB", n: "Westinghouse Air Brake Technologies Corporation Common Stock" },
-  { s: "WABC", n: "Westamerica Bancorporation" },
-  { s: "WAFD", n: "WaFd, Inc." },
-  { s: "WAFDP", n: "WaFd, Inc. - Depositary Shares" },
-  { s: "WAFU", n: "Wah Fu Education Group Limited" },
-  { s: "WAL", n: "Western Alliance Bancorporation Common Stock (DE)" },
-  { s: "WALD", n: "Waldencast plc" },
-  { s: "WAT", n: "Waters Corporation Common Stock" },
-  { s: "WATT", n: "Energous Corporation" },
-  { s: "WAVE", n: "Eco Wave Power Global AB (publ)" },
-  { s: "WAY", n: "Waystar Holding Corp." },
-  { s: "WB", n: "Weibo Corporation" },
-  { s: "WBI", n: "WaterBridge Infrastructure LLC Class A Shares Representing Limited Liability Company Interests" },
-  { s: "WBS", n: "Webster Financial Corporation Common Stock" },
-  { s: "WBTN", n: "WEBTOON Entertainment Inc." },
-  { s: "WBUY", n: "WEBUY GLOBAL LTD." },
-  { s: "WBX", n: "Wallbox N.V. Class A Ordinary Shares" },
-  { s: "WCC", n: "WESCO International, Inc. Common Stock" },
-  { s: "WCN", n: "Waste Connections, Inc. Common Shares" },
-  { s: "WCT", n: "Wellchange Holdings Company Limited" },
-  { s: "WD", n: "Walker & Dunlop, Inc Common Stock" },
-  { s: "WDAY", n: "Workday, Inc." },
-  { s: "WDC", n: "Western Digital Corporation" },
-  { s: "WDFC", n: "WD-40 Company" },
-  { s: "WDS", n: "Woodside Energy Group Limited American Depositary Shares, each representing one Ordinary Share" },
-  { s: "WEAV", n: "Weave Communications, Inc. Common Stock" },
-  { s: "WEC", n: "WEC Energy Group, Inc. Common Stock" },
-  { s: "WELL", n: "Welltower Inc. Common Stock" },
-  { s: "WEN", n: "Wendy's Company (The)" },
-  { s: "WENC", n: "West Enclave Merger Corp. Ordinary Shares" },
-  { s: "WERN", n: "Werner Enterprises, Inc." },
-  { s: "WEST", n: "Westrock Coffee Company" },
-  { s: "WETH", n: "Wetouch Technology Inc." },
-  { s: "WETO", n: "Wetour Robotics Limited" },
-  { s: "WEX", n: "WEX Inc. common stock" },
-  { s: "WEYS", n: "Weyco Group, Inc." },
-  { s: "WF", n: "Woori Financial Group Inc. American Depositary Shares (each representing three (3) shares of Common Stock)" },
-  { s: "WFC", n: "Wells Fargo & Company Common Stock" },
-  { s: "WFCF", n: "Where Food Comes From, Inc." },
-  { s: "WFF", n: "WF Holding Limited" },
-  { s: "WFG", n: "West Fraser Timber Co. Ltd Common stock" },
-  { s: "WFRD", n: "Weatherford International plc" },
-  { s: "WGO", n: "Winnebago Industries, Inc. Common Stock" },
-  { s: "WGRX", n: "Wellgistics Health, Inc." },
-  { s: "WGS", n: "GeneDx Holdings Corp." },
-  { s: "WH", n: "Wyndham Hotels & Resorts, Inc. Common Stock" },
-  { s: "WHD", n: "Cactus, Inc. Class A Common Stock" },
-  { s: "WHG", n: "Westwood Holdings Group Inc Common Stock" },
-  { s: "WHK", n: "WhiteHawk Minerals Corp Class A Common Stock" },
-  { s: "WHR", n: "Whirlpool Corporation Common Stock" },
-  { s: "WHWK", n: "Whitehawk Therapeutics, Inc." },
-  { s: "WILC", n: "G. Willi-Food International, Ltd." },
-  { s: "WIMI", n: "WiMi Hologram Cloud Inc." },
-  { s: "WINA", n: "Winmark Corporation" },
-  { s: "WING", n: "Wingstop Inc." },
-  { s: "WIT", n: "Wipro Limited Common Stock" },
-  { s: "WIX", n: "Wix.com Ltd." },
-  { s: "WK", n: "Workiva Inc. Class A Common Stock" },
-  { s: "WKC", n: "World Kinect Corporation Common Stock" },
-  { s: "WKEY", n: "WISeKey International Holding Ltd" },
-  { s: "WKHS", n: "Workhorse Group, Inc." },
-  { s: "WKSP", n: "Worksport, Ltd." },
-  { s: "WLCOU", n: "Wilco 63 Corporation - Units" },
-  { s: "WLDN", n: "Willdan Group, Inc." },
-  { s: "WLDS", n: "Wearable Devices Ltd. - Ordinary Share" },
-  { s: "WLFC", n: "Willis Lease Finance Corporation" },
-  { s: "WLK", n: "Westlake Corporation Common Stock" },
-  { s: "WLTH", n: "Wealthfront Corporation" },
-  { s: "WLY", n: "John Wiley & Sons, Inc. Common Stock" },
-  { s: "WLYB", n: "John Wiley & Sons, Inc. Common Stock" },
-  { s: "WM", n: "Waste Management, Inc. Common Stock" },
-  { s: "WMB", n: "Williams Companies, Inc. (The) Common Stock" },
-  { s: "WMG", n: "Warner Music Group Corp." },
-  { s: "WMK", n: "Weis Markets, Inc. Common Stock" },
-  { s: "WMS", n: "Advanced Drainage Systems, Inc. Common Stock" },
-  { s: "WMT", n: "Walmart Inc." },
-  { s: "WNC", n: "Wabash National Corporation Common Stock" },
-  { s: "WNEB", n: "Western New England Bancorp, Inc." },
-  { s: "WNW", n: "Meiwu Technology Company Limited" },
-  { s: "WOK", n: "WORK Medical Technology Group LTD" },
-  { s: "WOLF", n: "Wolfspeed, Inc. Common Stock New" },
-  { s: "WOOF", n: "Petco Health and Wellness Company, Inc." },
-  { s: "WOR", n: "Worthington Enterprises, Inc. Common Shares" },
-  { s: "WPM", n: "Wheaton Precious Metals Corp Common Shares (Canada)" },
-  { s: "WPP", n: "WPP plc American Depositary Shares" },
-  { s: "WPRT", n: "Westport Fuel Systems Inc - Common Shares" },
-  { s: "WRAP", n: "Wrap Technologies, Inc." },
-  { s: "WRB", n: "W.R. Berkley Corporation Common Stock" },
-  { s: "WRBY", n: "Warby Parker Inc. Class A Common Stock" },
-  { s: "WRD", n: "WeRide Inc." },
-  { s: "WRLD", n: "World Acceptance Corporation" },
-  { s: "WRN", n: "Western Copper and Gold Corporation Common Stock" },
-  { s: "WS", n: "Worthington Steel, Inc. Common Shares" },
-  { s: "WSBC", n: "WesBanco, Inc." },
-  { s: "WSBF", n: "Waterstone Financial, Inc." },
-  { s: "WSBK", n: "Winchester Bancorp, Inc." },
-  { s: "WSC", n: "WillScot Holdings Corporation" },
-  { s: "WSE", n: "Wise Group plc" },
-  { s: "WSFS", n: "WSFS Financial Corporation" },
-  { s: "WSHP", n: "WeShop Holdings Limited" },
-  { s: "WSM", n: "Williams-Sonoma, Inc. Common Stock (DE)" },
-  { s: "WSO", n: "Watsco, Inc. Common Stock" },
-  { s: "WSO-B", n: "Watsco, Inc. Class B Common Stock" },
-  { s: "WST", n: "West Pharmaceutical Services, Inc. Common Stock" },
-  { s: "WT", n: "WisdomTree, Inc. Common Stock" },
-  { s: "WTBA", n: "West Bancorporation" },
-  { s: "WTF", n: "Waton Financial Limited" },
-  { s: "WTFC", n: "Wintrust Financial Corporation" },
-  { s: "WTI", n: "W&T Offshore, Inc. Common Stock" },
-  { s: "WTM", n: "White Mountains Insurance Group, Ltd. Common Stock" },
-  { s: "WTRG", n: "Essential Utilities, Inc. Common Stock" },
-  { s: "WTS", n: "Watts Water Technologies, Inc. Class A Common Stock" },
-  { s: "WTTR", n: "Select Water Solutions, Inc. Class A common stock" },
-  { s: "WTW", n: "Willis Towers Watson Public Limited Company" },
-  { s: "WU", n: "Western Union Company (The) Common Stock" },
-  { s: "WULF", n: "TeraWulf Inc." },
-  { s: "WVE", n: "Wave Life Sciences Ltd." },
-  { s: "WVVI", n: "Willamette Valley Vineyards, Inc." },
-  { s: "WW", n: "WW International, Inc." },
-  { s: "WWD", n: "Woodward, Inc." },
-  { s: "WWR", n: "Westwater Resources, Inc. Common Stock" },
-  { s: "WWW", n: "Wolverine World Wide, Inc. Common Stock" },
-  { s: "WXM", n: "WF International Limited" },
-  { s: "WY", n: "Weyerhaeuser Company Common Stock" },
-  { s: "WYFI", n: "WhiteFiber, Inc." },
-  { s: "WYHG", n: "Wing Yip Food Holdings Group Limited" },
-  { s: "WYNN", n: "Wynn Resorts, Limited" },
-  { s: "WYY", n: "WidePoint Corporation Common Stock" },
-  { s: "XAIR", n: "Beyond Air, Inc." },
-  { s: "XBIO", n: "Xenetic Biosciences, Inc." },
-  { s: "XBIT", n: "XBiotech Inc." },
-  { s: "XBP", n: "XBP Global Holdings, Inc." },
-  { s: "XCH", n: "XCHG Limited" },
-  { s: "XCUR", n: "Exicure, Inc." },
-  { s: "XE", n: "X-Energy, Inc." },
-  { s: "XEL", n: "Xcel Energy Inc." },
-  { s: "XELB", n: "Xcel Brands, Inc" },
-  { s: "XENE", n: "Xenon Pharmaceuticals Inc. - Common Shares" },
-  { s: "XERS", n: "Xeris Biopharma Holdings, Inc." },
-  { s: "XFLH", n: "XFLH Capital Corporation Ordinary Shares" },
-  { s: "XFOR", n: "X4 Pharmaceuticals, Inc." },
-  { s: "XGN", n: "Exagen Inc." },
-  { s: "XHG", n: "XChange TEC.INC" },
-  { s: "XHLD", n: "TEN Holdings, Inc." },
-  { s: "XHR", n: "Xenia Hotels & Resorts, Inc. Common Stock" },
-  { s: "XLO", n: "Xilio Therapeutics, Inc." },
-  { s: "XMAX", n: "XMAX, Inc." },
-  { s: "XMTR", n: "Xometry, Inc." },
-  { s: "XNCR", n: "Xencor, Inc." },
-  { s: "XNDU", n: "Xanadu Quantum Technologies Limited" },
-  { s: "XNET", n: "Xunlei Limited" },
-  { s: "XOM", n: "ExxonMobil Holdings Corporation Common Stock" },
-  { s: "XOS", n: "Xos, Inc." },
-  { s: "XOSWW", n: "Xos, Inc. - Warrants" },
-  { s: "XP", n: "XP Inc." },
-  { s: "XPEL", n: "XPEL, Inc." },
-  { s: "XPER", n: "Xperi Inc. Common Stock" },
-  { s: "XPEV", n: "XPeng Inc. American depositary shares, each representing two Class A ordinary shares" },
-  { s: "XPL", n: "Solitario Resources Corp. Common Stock" },
-  { s: "XPO", n: "XPO, Inc. Common Stock" },
-  { s: "XPOF", n: "Xponential Fitness, Inc. Class A Common Stock" },
-  { s: "XPON", n: "Expion360 Inc." },
-  { s: "XPRO", n: "Expro Ltd Ordinary Shares" },
-  { s: "XRAY", n: "DENTSPLY SIRONA Inc." },
-  { s: "XRN", n: "Chiron Real Estate Inc. Common Stock" },
-  { s: "XRTX", n: "XORTX Therapeutics Inc. - Common Shares" },
-  { s: "XRX", n: "Xerox Holdings Corporation" },
-  { s: "XRXDW", n: "Xerox Holdings Corporation - Warrants" },
-  { s: "XTIA", n: "XTI Aerospace, Inc. Common Stock" },
-  { s: "XTLB", n: "XTL Biopharmaceuticals Ltd." },
-  { s: "XTNT", n: "Xtant Medical Holdings, Inc. Common Stock" },
-  { s: "XWEL", n: "XWELL, Inc." },
-  { s: "XXI", n: "Twenty One Capital, Inc. Class A Common Stock" },
-  { s: "XXII", n: "22nd Century Group, Inc" },
-  { s: "XYF", n: "X Financial American Depositary Shares, each representing six Class A Ordinary Shares" },
-  { s: "XYL", n: "Xylem Inc. Common Stock New" },
-  { s: "XYZ", n: "Block, Inc. Class A Common Stock," },
-  { s: "XZO", n: "Exzeo Group, Inc. Common Stock" },
-  { s: "YAAS", n: "Youxin Technology Ltd" },
-  { s: "YALA", n: "Yalla Group Limited American Depositary Shares, each representing one Class A Ordinary Share" },
-  { s: "YB", n: "Yuanbao Inc." },
-  { s: "YCBD", n: "cbdMD, Inc. Common Stock" },
-  { s: "YDDL", n: "One and One Green Technologies. INC" },
-  { s: "YDES", n: "YD Bio Limited" },
-  { s: "YDESW", n: "YD Bio Limited - Warrants" },
-  { s: "YDKG", n: "Yueda Digital Holding" },
-  { s: "YELP", n: "Yelp Inc. Common Stock" },
-  { s: "YETI", n: "YETI Holdings, Inc. Common Stock" },
-  { s: "YEXT", n: "Yext, Inc. Common Stock" },
-  { s: "YHC", n: "LQR House Inc." },
-  { s: "YHGJ", n: "Yunhong Green CTI Ltd." },
-  { s: "YI", n: "111, Inc." },
-  { s: "YIBO", n: "Planet Image International Limited" },
-  { s: "YICC", n: "Yorkville International Capital Corp." },
-  { s: "YICCU", n: "Yorkville International Capital Corp. - Units" },
-  { s: "YICCW", n: "Yorkville International Capital Corp. - Warrants" },
-  { s: "YJ", n: "Yunji Inc. - American Depository Shares" },
-  { s: "YMAT", n: "J-Star Holding Co., Ltd." },
-  { s: "YMM", n: "Full Truck Alliance Co. Ltd. American Depositary Shares (each representing 20 Class A Ordinary Shares)" },
-  { s: "YMT", n: "Yimutian Inc." },
-  { s: "YOOV", n: "Concorde International Group Ltd" },
-  { s: "YORW", n: "The York Water Company" },
-  { s: "YOU", n: "Clear Secure, Inc. Class A Common Stock" },
-  { s: "YOUL", n: "Youlife Group Inc." },
-  { s: "YPF", n: "YPF Sociedad Anonima Common Stock" },
-  { s: "YQ", n: "17 Education & Technology Group Inc." },
-  { s: "YRD", n: "Yiren Digital Ltd. American Depositary Shares, each representing two ordinary shares" },
-  { s: "YSG", n: "Yatsen Holding Limited American Depositary Shares, each representing twenty (20) Class A Ordinary Shares" },
-  { s: "YSS", n: "York Space Systems Inc. Common Stock" },
-  { s: "YSWY", n: "Yesway, Inc." },
-  { s: "YSXT", n: "YSX Tech. Co., Ltd" },
-  { s: "YTRA", n: "Yatra Online, Inc." },
-  { s: "YUM", n: "Yum! Brands, Inc." },
-  { s: "YUMC", n: "Yum China Holdings, Inc. Common Stock" },
-  { s: "YXT", n: "YXT.COM GROUP HOLDING LIMITED - American Depository Shares" },
-  { s: "YYAI", n: "AiRWA Inc." },
-  { s: "YYGH", n: "YY Group Holding Limited" },
-  { s: "Z", n: "Zillow Group, Inc." },
-  { s: "ZBAO", n: "Zhibao Technology Inc." },
-  { s: "ZBH", n: "Zimmer Biomet Holdings, Inc. Common Stock" },
-  { s: "ZBIO", n: "Zenas BioPharma, Inc." },
-  { s: "ZBRA", n: "Zebra Technologies Corporation" },
-  { s: "ZCMD", n: "Zhongchao Inc." },
-  { s: "ZD", n: "Ziff Davis, Inc." },
-  { s: "ZDAI", n: "DirectBooking Technology Co., Ltd." },
-  { s: "ZDGE", n: "Zedge, Inc. Class B Common Stock" },
-  { s: "ZENA", n: "ZenaTech, Inc." },
-  { s: "ZEO", n: "Zeo Energy Corporation" },
-  { s: "ZEOWW", n: "Zeo Energy Corporation - Warrants" },
-  { s: "ZEPP", n: "Zepp Health Corporation American depositary shares, each representing sixteen Class A ordinary shares" },
-  { s: "ZETA", n: "Zeta Global Holdings Corp. Class A Common Stock" },
-  { s: "ZG", n: "Zillow Group, Inc." },
-  { s: "ZGN", n: "Ermenegildo Zegna N.V. Ordinary Shares" },
-  { s: "ZH", n: "Zhihu Inc. American Depositary Shares, each representing three (3) Class A Ordinary Shares" },
-  { s: "ZIM", n: "ZIM Integrated Shipping Services Ltd. Ordinary Shares" },
-  { s: "ZION", n: "Zions Bancorporation N.A." },
-  { s: "ZIP", n: "ZipRecruiter, Inc. Class A Common Stock" },
-  { s: "ZJK", n: "ZJK Industrial Co., Ltd." },
-  { s: "ZJYL", n: "JIN MEDICAL INTERNATIONAL LTD." },
-  { s: "ZKH", n: "ZKH Group Limited American Depositary Shares, each representing thirty-five (35) Class A Ordinary Shares" },
-  { s: "ZKIN", n: "ZK International Group Co., Ltd - Ordinary Share" },
-  { s: "ZLAB", n: "Zai Lab Limited" },
-  { s: "ZM", n: "Zoom Communications, Inc." },
-  { s: "ZNB", n: "Zeta Network Group" },
-  { s: "ZNTL", n: "Zentalis Pharmaceuticals, Inc." },
-  { s: "ZONE", n: "CleanCore Solutions Inc. Class B Common Stock" },
-  { s: "ZOOZ", n: "ZOOZ Strategy Ltd." },
-  { s: "ZS", n: "Zscaler, Inc." },
-  { s: "ZSQR", n: "Z Squared Inc." },
-  { s: "ZSTK", n: "ZeroStack Corp." },
-  { s: "ZTEK", n: "Zentek Ltd." },
-  { s: "ZTG", n: "Zenta Group Company Limited" },
-  { s: "ZTO", n: "ZTO Express (Cayman) Inc. American Depositary Shares, each representing one Class A ordinary share." },
-  { s: "ZTS", n: "Zoetis Inc. Class A Common Stock" },
-  { s: "ZUMZ", n: "Zumiez Inc." },
-  { s: "ZURA", n: "Zura Bio Limited" },
-  { s: "ZVIA", n: "Zevia PBC Class A Common Stock" },
-  { s: "ZVRA", n: "Zevra Therapeutics, Inc." },
-  { s: "ZWS", n: "Zurn Elkay Water Solutions Corporation Common Stock" },
-  { s: "ZYBT", n: "Zhengye Biotechnology Holding Limited" },
-  { s: "ZYME", n: "Zymeworks Inc." },
-];
+const TICKER_DATA = [{"s":"A","n":"Agilent Technologies, Inc. Common Stock"},{"s":"AA","n":"Alcoa Corporation Common Stock"},{"s":"AACG","n":"ATA Creativity Global"},{"s":"AADX","n":"Applied Aerospace & Defense, Inc. Common Stock"},{"s":"AAL","n":"American Airlines Group, Inc."},{"s":"AAME","n":"Atlantic American Corporation"},{"s":"AAMI","n":"Acadian Asset Management Inc. Common Stock"},{"s":"AAOI","n":"Applied Optoelectronics, Inc."},{"s":"AAON","n":"AAON, Inc."},{"s":"AAP","n":"Advance Auto Parts Inc."},{"s":"AAPG","n":"Ascentage Pharma Group International - American Depository Shares"},{"s":"AAPL","n":"Apple Inc."},{"s":"AARD","n":"Aardvark Therapeutics, Inc."},{"s":"AAUC","n":"Allied Gold Corporation Common Shares"},{"s":"AB","n":"AllianceBernstein Holding L.P. Units"},{"s":"ABAT","n":"American Battery Technology Company"},{"s":"ABBV","n":"AbbVie Inc. Common Stock"},{"s":"ABCB","n":"Ameris Bancorp Common Stock"},{"s":"ABCL","n":"AbCellera Biologics Inc. - Common Shares"},{"s":"ABEO","n":"Abeona Therapeutics Inc."},{"s":"ABEV","n":"Ambev S.A. American Depositary Shares (Each representing 1 Common Share)"},{"s":"ABG","n":"Asbury Automotive Group Inc Common Stock"},{"s":"ABLV","n":"Able View Global Inc."},{"s":"ABM","n":"ABM Industries Incorporated Common Stock"},{"s":"ABNB","n":"Airbnb, Inc."},{"s":"ABOS","n":"Acumen Pharmaceuticals, Inc."},{"s":"ABSI","n":"Absci Corporation"},{"s":"ABT","n":"Abbott Laboratories Common Stock"},{"s":"ABTC","n":"American Bitcoin Corp."},{"s":"ABTS","n":"Abits Group Inc"},{"s":"ABUS","n":"Arbutus Biopharma Corporation"},{"s":"ABVC","n":"ABVC BioPharma, Inc."},{"s":"ABVX","n":"Abivax SA"},{"s":"ABX","n":"Abacus Global Management, Inc. Class A Common Stock"},{"s":"ACA","n":"Arcosa, Inc. Common Stock"},{"s":"ACAD","n":"ACADIA Pharmaceuticals Inc."},{"s":"ACB","n":"Aurora Cannabis Inc. - Common Shares"},{"s":"ACCL","n":"Acco Group Holdings Limited"},{"s":"ACCO","n":"Acco Brands Corporation Common Stock"},{"s":"ACCS","n":"ACCESS Newswire Inc. Common Stock"},{"s":"ACDC","n":"ProFrac Holding Corp."},{"s":"ACEL","n":"Accel Entertainment, Inc."},{"s":"ACET","n":"Adicet Bio, Inc."},{"s":"ACFN","n":"Acorn Energy, Inc."},{"s":"ACGL","n":"Arch Capital Group Ltd."},{"s":"ACH","n":"Accendra Health, Inc. Common Stock"},{"s":"ACHC","n":"Acadia Healthcare Company, Inc."},{"s":"ACHR","n":"Archer Aviation Inc. Class A Common Stock"},{"s":"ACHV","n":"Achieve Life Sciences, Inc. - Common Shares"},{"s":"ACI","n":"Albertsons Companies, Inc. Class A Common Stock"},{"s":"ACIC","n":"American Coastal Insurance Corporation"},{"s":"ACIU","n":"AC Immune SA"},{"s":"ACIW","n":"ACI Worldwide, Inc."},{"s":"ACLS","n":"Axcelis Technologies, Inc."},{"s":"ACM","n":"AECOM Common Stock"},{"s":"ACMR","n":"ACM Research, Inc."},{"s":"ACN","n":"Accenture plc Class A Ordinary Shares (Ireland)"},{"s":"ACNB","n":"ACNB Corporation"},{"s":"ACNT","n":"Ascent Industries Co."},{"s":"ACOG","n":"Alpha Cognition Inc."},{"s":"ACON","n":"Aclarion, Inc."},{"s":"ACR","n":"ACRES Commercial Realty Corp. Common Stock"},{"s":"ACRE","n":"Ares Commercial Real Estate Corporation Common Stock"},{"s":"ACRS","n":"Aclaris Therapeutics, Inc."},{"s":"ACRV","n":"Acrivon Therapeutics, Inc."},{"s":"ACT","n":"Enact Holdings, Inc."},{"s":"ACTG","n":"Acacia Research Corporation"},{"s":"ACTU","n":"Actuate Therapeutics, Inc."},{"s":"ACU","n":"Acme United Corporation. Common Stock"},{"s":"ACVA","n":"ACV Auctions Inc. Class A Common Stock"},{"s":"ACXP","n":"Acurx Pharmaceuticals, Inc."},{"s":"AD","n":"Array Digital Infrastructure, Inc. Common Shares"},{"s":"ADAG","n":"Adagene Inc."},{"s":"ADBE","n":"Adobe Inc."},{"s":"ADC","n":"Agree Realty Corporation Common Stock"},{"s":"ADCT","n":"ADC Therapeutics SA Common Shares"},{"s":"ADEA","n":"Adeia Inc."},{"s":"ADGM","n":"Adagio Medical Holdings, Inc"},{"s":"ADI","n":"Analog Devices, Inc."},{"s":"ADIL","n":"Adial Pharmaceuticals, Inc"},{"s":"ADM","n":"Archer-Daniels-Midland Company Common Stock"},{"s":"ADMA","n":"ADMA Biologics Inc"},{"s":"ADNT","n":"Adient plc Ordinary Shares"},{"s":"ADP","n":"Automatic Data Processing, Inc."},{"s":"ADPT","n":"Adaptive Biotechnologies Corporation"},{"s":"ADSE","n":"ADS-TEC ENERGY PLC"},{"s":"ADSK","n":"Autodesk, Inc."},{"s":"ADT","n":"ADT Inc. Common Stock"},{"s":"ADTN","n":"ADTRAN Holdings, Inc."},{"s":"ADUR","n":"Aduro Clean Technologies Inc."},{"s":"ADUS","n":"Addus HomeCare Corporation"},{"s":"ADV","n":"Advantage Solutions Inc."},{"s":"ADVB","n":"Advanced Biomed Inc."},{"s":"ADXN","n":"Addex Therapeutics Ltd"},{"s":"AEBI","n":"Aebi Schmidt Holding AG"},{"s":"AEC","n":"Anfield Energy Inc. - Common Shares"},{"s":"AEE","n":"Ameren Corporation Common Stock"},{"s":"AEG","n":"Aegon Ltd. New York Registry Shares"},{"s":"AEHL","n":"Antelope Enterprise Holdings Limited"},{"s":"AEHR","n":"Aehr Test Systems"},{"s":"AEI","n":"Alset Inc."},{"s":"AEIS","n":"Advanced Energy Industries, Inc."},{"s":"AEM","n":"Agnico Eagle Mines Limited Common Stock"},{"s":"AEMD","n":"Aethlon Medical, Inc."},{"s":"AENT","n":"Alliance Entertainment Holding Corporation"},{"s":"AENTW","n":"Alliance Entertainment Holding Corporation - Warrants"},{"s":"AEO","n":"American Eagle Outfitters, Inc. Common Stock"},{"s":"AEON","n":"AEON Biopharma, Inc. Class A Common Stock"},{"s":"AEP","n":"American Electric Power Company, Inc."},{"s":"AER","n":"AerCap Holdings N.V. Ordinary Shares"},{"s":"AERO","n":"Grupo Aeromexico, S.A.B. de C.V. American Depositary Shares (each representing ten (10) Common Shares)"},{"s":"AERT","n":"Aeries Technology, Inc."},{"s":"AES","n":"The AES Corporation Common Stock"},{"s":"AESI","n":"Atlas Energy Solutions Inc. Common Stock"},{"s":"AEVA","n":"Aeva Technologies, Inc."},{"s":"AEYE","n":"AudioEye, Inc."},{"s":"AFBI","n":"Affinity Bancshares, Inc."},{"s":"AFCG","n":"Advanced Flower Capital Inc."},{"s":"AFG","n":"American Financial Group, Inc. Common Stock"},{"s":"AFGB","n":"American Financial Group, Inc. 5.875% Subordinated Debentures due 2059"},{"s":"AFGC","n":"American Financial Group, Inc. 5.125% Subordinated Debentures due 2059"},{"s":"AFGD","n":"American Financial Group, Inc. 5.625% Subordinated Debentures due 2060"},{"s":"AFGE","n":"American Financial Group, Inc. 4.500% Subordinated Debentures due 2060"},{"s":"AFJK","n":"Aimei Health Technology Co., Ltd - Ordinary Share"},{"s":"AFL","n":"AFLAC Incorporated Common Stock"},{"s":"AFRI","n":"Forafric Global PLC"},{"s":"AFRIW","n":"Forafric Global PLC - Warrants"},{"s":"AFRM","n":"Affirm Holdings, Inc."},{"s":"AFYA","n":"Afya Limited"},{"s":"AG","n":"First Majestic Silver Corp. Ordinary Shares (Canada)"},{"s":"AGBK","n":"AGI Inc Class A Common Shares"},{"s":"AGCC","n":"Agencia Comercial Spirits Ltd"},{"s":"AGCO","n":"AGCO Corporation Common Stock"},{"s":"AGEN","n":"Agenus Inc."},{"s":"AGI","n":"Alamos Gold Inc. Class A Common Shares"},{"s":"AGIG","n":"Abundia Global Impact Group Inc. Common stock"},{"s":"AGIO","n":"Agios Pharmaceuticals, Inc."},{"s":"AGL","n":"agilon health, inc. Common Stock"},{"s":"AGM","n":"Federal Agricultural Mortgage Corporation Common Stock"},{"s":"AGM-A","n":"Federal Agricultural Mortgage Corporation Common Stock"},{"s":"AGMH","n":"AGM Group Holdings Inc."},{"s":"AGNC","n":"AGNC Investment Corp."},{"s":"AGNT","n":"AGNT, Inc."},{"s":"AGO","n":"Assured Guaranty Ltd. Common Stock"},{"s":"AGPU","n":"Axe Compute Inc."},{"s":"AGRO","n":"Adecoagro S.A. Common Shares"},{"s":"AGRZ","n":"Agroz Inc."},{"s":"AGX","n":"Argan, Inc. Common Stock"},{"s":"AGYS","n":"Agilysys, Inc."},{"s":"AHCO","n":"AdaptHealth Corp."},{"s":"AHG","n":"Akso Health Group"},{"s":"AHMA","n":"Ambitions Enterprise Management Co. L.L.C"},{"s":"AI","n":"C3.ai, Inc. Class A Common Stock"},{"s":"AIAI","n":"AIAI Holdings Corporation"},{"s":"AIB","n":"AIB Data Centers Inc. Common Stock"},{"s":"AIBZ","n":"Bitzero Holdings Inc. - Common Shares"},{"s":"AIDX","n":"20/20 Biolabs, Inc."},{"s":"AIFA","n":"All In FutureTech Alliance, Inc."},{"s":"AIFC","n":"AI Financial Corporation"},{"s":"AIFF","n":"Firefly Neuroscience, Inc."},{"s":"AIFU","n":"AIFU Inc."},{"s":"AIG","n":"American International Group, Inc. New Common Stock"},{"s":"AIHS","n":"Senmiao Technology Limited"},{"s":"AII","n":"American Integrity Insurance Group, Inc. Common Stock"},{"s":"AIIO","n":"Robo.ai Inc."},{"s":"AIIR","n":"Air Global PLC"},{"s":"AIM","n":"AIM ImmunoTech Inc. Common Stock"},{"s":"AIMD","n":"Ainos, Inc."},{"s":"AIMDW","n":"Ainos, Inc. - warrants"},{"s":"AIN","n":"Albany International Corporation Common Stock"},{"s":"AIOS","n":"AIOS Tech Inc."},{"s":"AIOT","n":"PowerFleet, Inc."},{"s":"AIP","n":"Arteris, Inc."},{"s":"AIR","n":"AAR Corp. Common Stock"},{"s":"AIRE","n":"reAlpha Tech Corp."},{"s":"AIRG","n":"Airgain, Inc."},{"s":"AIRI","n":"Air Industries Group Common Stock"},{"s":"AIRJ","n":"AirJoule Technologies Corporation"},{"s":"AIRO","n":"AIRO Group Holdings, Inc."},{"s":"AIRS","n":"AirSculpt Technologies, Inc."},{"s":"AIRT","n":"Air T, Inc."},{"s":"AISP","n":"Airship AI Holdings, Inc"},{"s":"AISPW","n":"Airship AI Holdings, Inc - Warrants"},{"s":"AIT","n":"Applied Industrial Technologies, Inc. Common Stock"},{"s":"AIV","n":"Apartment Investment and Management Company Common Stock"},{"s":"AIXC","n":"AIxCrypto Holdings, Inc."},{"s":"AIXI","n":"XIAO-I Corporation"},{"s":"AIZ","n":"Assurant, Inc. Common Stock"},{"s":"AJG","n":"Arthur J. Gallagher & Co. Common Stock"},{"s":"AKA","n":"a.k.a. Brands Holding Corp. Common Stock"},{"s":"AKAM","n":"Akamai Technologies, Inc."},{"s":"AKAN","n":"Akanda Corp. - Common Shares"},{"s":"AKBA","n":"Akebia Therapeutics, Inc."},{"s":"AKO-A","n":"Embotelladora Andina S.A. Common Stock"},{"s":"AKO-B","n":"Embotelladora Andina S.A. Common Stock"},{"s":"AKTS","n":"Aktis Oncology, Inc."},{"s":"AKTX","n":"Akari Therapeutics Plc"},{"s":"ALAB","n":"Astera Labs, Inc."},{"s":"ALAR","n":"Alarum Technologies Ltd."},{"s":"ALB","n":"Albemarle Corporation Common Stock"},{"s":"ALBT","n":"Avalon GloboCare Corp."},{"s":"ALC","n":"Alcon Inc. Ordinary Shares"},{"s":"ALCO","n":"Alico, Inc."},{"s":"ALDF","n":"Aldel Financial II Inc."},{"s":"ALDFU","n":"Aldel Financial II Inc. - Units"},{"s":"ALDFW","n":"Aldel Financial II Inc. - Warrants"},{"s":"ALDX","n":"Aldeyra Therapeutics, Inc."},{"s":"ALEC","n":"Alector, Inc."},{"s":"ALG","n":"Alamo Group, Inc. Common Stock"},{"s":"ALGM","n":"Allegro MicroSystems, Inc."},{"s":"ALGN","n":"Align Technology, Inc."},{"s":"ALGS","n":"Aligos Therapeutics, Inc."},{"s":"ALGT","n":"Allegiant Travel Company"},{"s":"ALH","n":"Alliance Laundry Holdings Inc. Common Stock"},{"s":"ALHC","n":"Alignment Healthcare, Inc."},{"s":"ALIT","n":"Alight, Inc. Class A Common Stock"},{"s":"ALK","n":"Alaska Air Group, Inc. Common Stock"},{"s":"ALKS","n":"Alkermes plc"},{"s":"ALKT","n":"Alkami Technology, Inc."},{"s":"ALL","n":"Allstate Corporation (The) Common Stock"},{"s":"ALLE","n":"Allegion plc Ordinary Shares"},{"s":"ALLO","n":"Allogene Therapeutics, Inc."},{"s":"ALLR","n":"Allarity Therapeutics, Inc."},{"s":"ALLT","n":"Allot Ltd."},{"s":"ALLY","n":"Ally Financial Inc. Common Stock"},{"s":"ALM","n":"Almonty Industries Inc. - Common Shares"},{"s":"ALMR","n":"Alamar Biosciences, Inc."},{"s":"ALMS","n":"Alumis Inc."},{"s":"ALMU","n":"Aeluma, Inc."},{"s":"ALNT","n":"Allient Inc."},{"s":"ALNY","n":"Alnylam Pharmaceuticals, Inc."},{"s":"ALOT","n":"AstroNova, Inc."},{"s":"ALOV","n":"Aldabra 4 Liquidity Opportunity Vehicle, Inc."},{"s":"ALOVU","n":"Aldabra 4 Liquidity Opportunity Vehicle, Inc. - Units"},{"s":"ALOVW","n":"Aldabra 4 Liquidity Opportunity Vehicle, Inc. - Warrants"},{"s":"ALOY","n":"REalloys Inc."},{"s":"ALP","n":"Alpha Compute Corp"},{"s":"ALPS","n":"ALPS Group Inc - Ordinary Share"},{"s":"ALRM","n":"Alarm.com Holdings, Inc."},{"s":"ALRS","n":"Alerus Financial Corporation"},{"s":"ALSN","n":"Allison Transmission Holdings, Inc. Common Stock"},{"s":"ALT","n":"Altimmune, Inc."},{"s":"ALTG","n":"Alta Equipment Group Inc. Class A Common Stock"},{"s":"ALTI","n":"AlTi Global, Inc."},{"s":"ALTO","n":"Alto Ingredients, Inc."},{"s":"ALV","n":"Autoliv, Inc. Common Stock"},{"s":"ALVO","n":"Alvotech"},{"s":"ALX","n":"Alexander's, Inc. Common Stock"},{"s":"ALXO","n":"ALX Oncology Holdings Inc."},{"s":"ALZN","n":"Alzamend Neuro, Inc."},{"s":"AM","n":"Antero Midstream Corporation Common Stock"},{"s":"AMAL","n":"Amalgamated Financial Corp."},{"s":"AMAT","n":"Applied Materials, Inc."},{"s":"AMBA","n":"Ambarella, Inc."},{"s":"AMBO","n":"Ambow Education Holding Ltd. American Depository Shares (each representing twenty (20) Class A Ordinary Shares)"},{"s":"AMBP","n":"Ardagh Metal Packaging S.A. Ordinary Shares"},{"s":"AMBQ","n":"Ambiq Micro, Inc. Common Stock"},{"s":"AMBR","n":"Amber International Holding Limited"},{"s":"AMC","n":"AMC Entertainment Holdings, Inc. Class A Common Stock"},{"s":"AMCI","n":"AMC Robotics Corporation"},{"s":"AMCR","n":"Amcor plc Ordinary Shares"},{"s":"AMCX","n":"AMC Global Media Inc."},{"s":"AMD","n":"Advanced Micro Devices, Inc."},{"s":"AME","n":"AMETEK, Inc."},{"s":"AMG","n":"Affiliated Managers Group, Inc. Common Stock"},{"s":"AMGN","n":"Amgen Inc."},{"s":"AMH","n":"American Homes 4 Rent Common Shares of Beneficial Interest"},{"s":"AMIX","n":"Autonomix Medical, Inc."},{"s":"AMKR","n":"Amkor Technology, Inc."},{"s":"AMLX","n":"Amylyx Pharmaceuticals, Inc."},{"s":"AMN","n":"AMN Healthcare Services Inc"},{"s":"AMOD","n":"Alpha Modus Holdings, Inc."},{"s":"AMP","n":"Ameriprise Financial, Inc. Common Stock"},{"s":"AMPG","n":"Amplitech Group, Inc."},{"s":"AMPH","n":"Amphastar Pharmaceuticals, Inc."},{"s":"AMPL","n":"Amplitude, Inc."},{"s":"AMPX","n":"Amprius Technologies, Inc. Common Stock"},{"s":"AMPY","n":"Amplify Energy Corp. Common Stock"},{"s":"AMR","n":"Alpha Metallurgical Resources, Inc. Common Stock"},{"s":"AMRC","n":"Ameresco, Inc. Class A Common Stock"},{"s":"AMRN","n":"Amarin Corporation plc"},{"s":"AMRX","n":"Amneal Pharmaceuticals, Inc."},{"s":"AMRZ","n":"Amrize Ltd Ordinary Shares"},{"s":"AMS","n":"American Shared Hospital Services Common Stock"},{"s":"AMSC","n":"American Superconductor Corporation"},{"s":"AMSF","n":"AMERISAFE, Inc."},{"s":"AMSS","n":"AMASS Brands Inc."},{"s":"AMST","n":"Amesite Inc."},{"s":"AMTB","n":"Amerant Bancorp Inc. Class A Common Stock"},{"s":"AMTD","n":"AMTD IDEA Group American Depositary Shares, each representing six (6) Class A Ordinary Shares"},{"s":"AMTM","n":"Amentum Holdings, Inc. Common Stock"},{"s":"AMTX","n":"Aemetis, Inc"},{"s":"AMWL","n":"American Well Corporation Class A Common Stock"},{"s":"AMZE","n":"Amaze Holdings, Inc. Common Stock"},{"s":"AMZN","n":"Amazon.com, Inc."},{"s":"AN","n":"AutoNation, Inc. Common Stock"},{"s":"ANAB","n":"AnaptysBio, Inc."},{"s":"ANDE","n":"The Andersons, Inc."},{"s":"ANDG","n":"Andersen Group Inc. Class A Common Stock"},{"s":"ANET","n":"Arista Networks, Inc. Common Stock"},{"s":"ANF","n":"Abercrombie & Fitch Company Common Stock"},{"s":"ANGH","n":"Anghami Inc."},{"s":"ANGHW","n":"Anghami Inc. - Warrants"},{"s":"ANGI","n":"Angi Inc."},{"s":"ANGO","n":"AngioDynamics, Inc."},{"s":"ANGX","n":"Angel Studios, Inc. Class A Common Stock"},{"s":"ANIK","n":"Anika Therapeutics Inc."},{"s":"ANIP","n":"ANI Pharmaceuticals, Inc."},{"s":"ANIX","n":"Anixa Biosciences, Inc."},{"s":"ANL","n":"Adlai Nortye Ltd."},{"s":"ANNA","n":"AleAnna, Inc."},{"s":"ANNX","n":"Annexon, Inc."},{"s":"ANPA","n":"Rich Sparkle Holdings Limited"},{"s":"ANRO","n":"Alto Neuroscience, Inc. Common Stock"},{"s":"ANTA","n":"Antalpha Platform Holding Company"},{"s":"ANTX","n":"AN2 Therapeutics, Inc."},{"s":"ANVS","n":"Annovis Bio, Inc. Common Stock"},{"s":"ANY","n":"Sphere 3D Corp. - Common Shares"},{"s":"AON","n":"Aon plc Class A Ordinary Shares (Ireland)"},{"s":"AORT","n":"Artivion, Inc. Common Stock"},{"s":"AOS","n":"A.O. Smith Corporation Common Stock"},{"s":"AOSL","n":"Alpha and Omega Semiconductor Limited - Common Shares"},{"s":"AOUT","n":"American Outdoor Brands, Inc."},{"s":"AP","n":"Ampco-Pittsburgh Corporation Common Stock"},{"s":"APA","n":"APA Corporation"},{"s":"APAM","n":"Artisan Partners Asset Management Inc. Class A Common Stock"},{"s":"APC","n":"ARKO Petroleum Corp."},{"s":"APD","n":"Air Products and Chemicals, Inc. Common Stock"},{"s":"APEI","n":"American Public Education, Inc."},{"s":"APG","n":"APi Group Corporation Common Stock"},{"s":"APGE","n":"Apogee Therapeutics, Inc."},{"s":"APH","n":"Amphenol Corporation Common Stock"},{"s":"API","n":"Agora, Inc."},{"s":"APLD","n":"Applied Digital Corporation"},{"s":"APLM","n":"Apollomics Inc."},{"s":"APM","n":"Aptorum Group Limited"},{"s":"APO","n":"Apollo Global Management, Inc. (New) Common Stock"},{"s":"APOG","n":"Apogee Enterprises, Inc."},{"s":"APP","n":"Applovin Corporation"},{"s":"APPF","n":"AppFolio, Inc."},{"s":"APPN","n":"Appian Corporation"},{"s":"APPS","n":"Digital Turbine, Inc."},{"s":"APRE","n":"Aprea Therapeutics, Inc."},{"s":"APT","n":"Alpha Pro Tech, Ltd. Common Stock"},{"s":"APTV","n":"Aptiv PLC Ordinary Shares"},{"s":"APUR","n":"Aperture AC"},{"s":"APUS","n":"Apimeds Pharmaceuticals US, Inc. Common Stock"},{"s":"APVO","n":"Aptevo Therapeutics Inc."},{"s":"APWC","n":"Asia Pacific Wire & Cable Corporation Limited - Common shares, Par value .01 per share"},{"s":"APXT","n":"Apex Treasury Corporation"},{"s":"APXTU","n":"Apex Treasury Corporation - Units"},{"s":"APXTW","n":"Apex Treasury Corporation - Warrants"},{"s":"APYX","n":"Apyx Medical Corporation"},{"s":"AQB","n":"AquaBounty Technologies, Inc."},{"s":"AQMS","n":"Aqua Metals, Inc."},{"s":"AQN","n":"Algonquin Power & Utilities Corp. Common Shares"},{"s":"AQST","n":"Aquestive Therapeutics, Inc."},{"s":"AR","n":"Antero Resources Corporation Common Stock"},{"s":"ARAI","n":"Arrive AI Inc."},{"s":"ARAY","n":"Accuray Incorporated"},{"s":"ARBB","n":"ARB IOT Group Limited"},{"s":"ARBE","n":"Arbe Robotics Ltd."},{"s":"ARBK","n":"Argo Blockchain plc"},{"s":"ARCB","n":"ArcBest Corporation"},{"s":"ARCO","n":"Arcos Dorados Holdings Inc. Class A Shares"},{"s":"ARCT","n":"Arcturus Therapeutics Holdings Inc."},{"s":"ARDT","n":"Ardent Health, Inc. Common Stock"},{"s":"ARDX","n":"Ardelyx, Inc."},{"s":"ARE","n":"Alexandria Real Estate Equities, Inc. Common Stock"},{"s":"AREC","n":"American Resources Corporation"},{"s":"AREN","n":"The Arena Group Holdings, Inc. Common Stock"},{"s":"ARES","n":"Ares Management Corporation Class A Common Stock"},{"s":"ARGX","n":"argenx SE"},{"s":"ARHS","n":"Arhaus, Inc."},{"s":"ARI","n":"Apollo Commercial Real Estate Finance, Inc"},{"s":"ARIS","n":"Aris Mining Corporation Common Shares"},{"s":"ARKO","n":"ARKO Corp."},{"s":"ARKR","n":"Ark Restaurants Corp."},{"s":"ARL","n":"American Realty Investors, Inc. Common Stock"},{"s":"ARLO","n":"Arlo Technologies, Inc. Common Stock"},{"s":"ARLP","n":"Alliance Resource Partners, L.P. - Common Units Representing Limited Partnership Interests"},{"s":"ARM","n":"Arm Holdings plc"},{"s":"ARMK","n":"Aramark Common Stock"},{"s":"ARMP","n":"Armata Pharmaceuticals, Inc. Common Stock"},{"s":"AROC","n":"Archrock, Inc. Common Stock"},{"s":"AROW","n":"Arrow Financial Corporation"},{"s":"ARQ","n":"Arq, Inc."},{"s":"ARQQ","n":"Arqit Quantum Inc."},{"s":"ARQQW","n":"Arqit Quantum Inc. - Warrants"},{"s":"ARQT","n":"Arcutis Biotherapeutics, Inc."},{"s":"ARRY","n":"Array Technologies, Inc."},{"s":"ARTL","n":"Artelo Biosciences, Inc."},{"s":"ARTNA","n":"Artesian Resources Corporation"},{"s":"ARTV","n":"Artiva Biotherapeutics, Inc."},{"s":"ARTW","n":"Art's-Way Manufacturing Co., Inc."},{"s":"ARVN","n":"Arvinas, Inc."},{"s":"ARW","n":"Arrow Electronics, Inc. Common Stock"},{"s":"ARWR","n":"Arrowhead Pharmaceuticals, Inc."},{"s":"ARX","n":"Accelerant Holdings Class A Common Shares"},{"s":"ARXS","n":"Arxis, Inc."},{"s":"AS","n":"Amer Sports, Inc. Ordinary Shares"},{"s":"ASA","n":"ASA Gold and Precious Metals Limited"},{"s":"ASAN","n":"Asana, Inc. Class A Common Stock"},{"s":"ASB","n":"Associated Banc-Corp Common Stock"},{"s":"ASBP","n":"Aspire Biopharma Holdings, Inc."},{"s":"ASC","n":"Ardmore Shipping Corporation Common Stock"},{"s":"ASH","n":"Ashland Inc. Common Stock"},{"s":"ASIC","n":"Ategrity Specialty Insurance Company Holdings Common Stock"},{"s":"ASIX","n":"AdvanSix Inc. Common Stock"},{"s":"ASLE","n":"AerSale Corporation"},{"s":"ASM","n":"Avino Silver & Gold Mines Ltd. Common Shares (Canada)"},{"s":"ASMB","n":"Assembly Biosciences, Inc."},{"s":"ASML","n":"ASML Holding N.V. - New York Registry Shares"},{"s":"ASND","n":"Ascendis Pharma A/S - Ordinary Share"},{"s":"ASO","n":"Academy Sports and Outdoors, Inc."},{"s":"ASPI","n":"ASP Isotopes Inc."},{"s":"ASPN","n":"Aspen Aerogels, Inc. Common Stock"},{"s":"ASR","n":"Grupo Aeroportuario del Sureste, S.A. de C.V. Common Stock"},{"s":"ASRV","n":"AmeriServ Financial Inc."},{"s":"ASST","n":"Strive, Inc."},{"s":"ASTC","n":"Astrotech Corporation"},{"s":"ASTE","n":"Astec Industries, Inc."},{"s":"ASTH","n":"Astrana Health Inc."},{"s":"ASTI","n":"Ascent Solar Technologies, Inc"},{"s":"ASTL","n":"Algoma Steel Group Inc. - Common Shares"},{"s":"ASTS","n":"AST SpaceMobile, Inc."},{"s":"ASUR","n":"Asure Software Inc"},{"s":"ASX","n":"ASE Technology Holding Co., Ltd. American Depositary Shares (each representing Two Common Shares)"},{"s":"ASYS","n":"Amtech Systems, Inc."},{"s":"ATAI","n":"AtaiBeckley Inc."},{"s":"ATAT","n":"Atour Lifestyle Holdings Limited"},{"s":"ATCH","n":"AtlasClear Holdings, Inc. Common Stock"},{"s":"ATCX","n":"Atlas Critical Minerals Corporation"},{"s":"ATEC","n":"Alphatec Holdings, Inc."},{"s":"ATEN","n":"A10 Networks, Inc. Common Stock"},{"s":"ATER","n":"Aterian, Inc."},{"s":"ATEX","n":"Anterix Inc."},{"s":"ATGL","n":"Alpha Technology Group Limited"},{"s":"ATHE","n":"Alterity Therapeutics Limited"},{"s":"ATHM","n":"Autohome Inc. American Depositary Shares, each representing four class A ordinary shares."},{"s":"ATHR","n":"Aether Holdings, Inc."},{"s":"ATHS","n":"Athene Holding Ltd. 7.250% Fixed-Rate Reset Junior Subordinated Debentures due 2064"},{"s":"ATI","n":"ATI Inc. Common Stock"},{"s":"ATKR","n":"Atkore Inc. Common Stock"},{"s":"ATLC","n":"Atlanticus Holdings Corporation"},{"s":"ATLO","n":"Ames National Corporation"},{"s":"ATLX","n":"Atlas Lithium Corporation"},{"s":"ATMU","n":"Atmus Filtration Technologies Inc. Common Stock"},{"s":"ATNI","n":"ATN International, Inc."},{"s":"ATNM","n":"Actinium Pharmaceuticals, Inc. (Delaware) Common Stock"},{"s":"ATO","n":"Atmos Energy Corporation Common Stock"},{"s":"ATOM","n":"Atomera Incorporated"},{"s":"ATOS","n":"Atossa Therapeutics, Inc."},{"s":"ATPC","n":"Agape ATP Corporation"},{"s":"ATR","n":"AptarGroup, Inc. Common Stock"},{"s":"ATRA","n":"Atara Biotherapeutics, Inc."},{"s":"ATRC","n":"AtriCure, Inc."},{"s":"ATRO","n":"Astronics Corporation"},{"s":"ATS","n":"ATS Corporation Common Shares"},{"s":"ATXG","n":"Addentax Group Corp."},{"s":"ATYR","n":"aTyr Pharma, Inc."},{"s":"AU","n":"AngloGold Ashanti PLC Ordinary Shares"},{"s":"AUB","n":"Atlantic Union Bankshares Corporation Common Stock"},{"s":"AUBN","n":"Auburn National Bancorporation, Inc."},{"s":"AUC","n":"ATIF Holdings Limited"},{"s":"AUDC","n":"AudioCodes Ltd."},{"s":"AUGO","n":"Aura Minerals Inc. - Common Shares"},{"s":"AUID","n":"authID Inc."},{"s":"AUNA","n":"Auna SA Class A Ordinary Shares"},{"s":"AUPH","n":"Aurinia Pharmaceuticals Inc - Common Shares"},{"s":"AUR","n":"Aurora Innovation, Inc."},{"s":"AURA","n":"Aura Biosciences, Inc."},{"s":"AURE","n":"Aurelion Inc."},{"s":"AUST","n":"Austin Gold Corp. Common Shares"},{"s":"AUTL","n":"Autolus Therapeutics plc"},{"s":"AUUD","n":"Auddia Inc."},{"s":"AVA","n":"Avista Corporation Common Stock"},{"s":"AVAH","n":"Aveanna Healthcare Holdings Inc."},{"s":"AVAT","n":"Avalanche Treasury Corporation"},{"s":"AVAV","n":"AeroVironment, Inc."},{"s":"AVB","n":"AvalonBay Communities, Inc. Common Stock"},{"s":"AVBC","n":"Avidia Bancorp, Inc. Common Stock"},{"s":"AVBH","n":"Avidbank Holdings, Inc."},{"s":"AVBP","n":"ArriVent BioPharma, Inc."},{"s":"AVD","n":"American Vanguard Corporation Common Stock ($0.10 Par Value)"},{"s":"AVEX","n":"AEVEX Corp. Class A Common Stock"},{"s":"AVGO","n":"Broadcom Inc."},{"s":"AVIR","n":"Atea Pharmaceuticals, Inc."},{"s":"AVLN","n":"Avalyn Pharma Inc."},{"s":"AVNS","n":"Avanos Medical, Inc. Common Stock"},{"s":"AVNT","n":"Avient Corporation Common Stock"},{"s":"AVNW","n":"Aviat Networks, Inc."},{"s":"AVO","n":"Mission Produce, Inc."},{"s":"AVPT","n":"AvePoint, Inc."},{"s":"AVR","n":"Anteris Technologies Global Corp."},{"s":"AVT","n":"Avnet, Inc."},{"s":"AVTR","n":"Avantor, Inc. Common Stock"},{"s":"AVTX","n":"Avalo Therapeutics, Inc."},{"s":"AVX","n":"Avax One Technology Ltd. - Common Shares"},{"s":"AVXL","n":"Anavex Life Sciences Corp."},{"s":"AVY","n":"Avery Dennison Corporation Common Stock"},{"s":"AWI","n":"Armstrong World Industries Inc Common Stock"},{"s":"AWK","n":"American Water Works Company, Inc. Common Stock"},{"s":"AWR","n":"American States Water Company Common Stock"},{"s":"AWRE","n":"Aware, Inc."},{"s":"AWX","n":"Avalon Holdings Corporation Common Stock"},{"s":"AX","n":"Axos Financial, Inc. Common Stock"},{"s":"AXG","n":"Solowin Holdings"},{"s":"AXGN","n":"Axogen, Inc."},{"s":"AXIA","n":"AXIA Energia American Depositary Shares (Each representing one Common Share)"},{"s":"AXIL","n":"AXIL Brands, Inc. Common Stock"},{"s":"AXON","n":"Axon Enterprise, Inc."},{"s":"AXP","n":"American Express Company Common Stock"},{"s":"AXR","n":"AMREP Corporation Common Stock"},{"s":"AXS","n":"Axis Capital Holdings Limited Common Stock"},{"s":"AXSM","n":"Axsome Therapeutics, Inc."},{"s":"AXTA","n":"Axalta Coating Systems Ltd. Common Shares"},{"s":"AXTI","n":"AXT Inc"},{"s":"AYA","n":"Aya Gold & Silver Inc. - Common Shares"},{"s":"AYI","n":"Acuity Inc. Common Stock"},{"s":"AYTU","n":"Aytu BioPharma, Inc."},{"s":"AZ","n":"A2Z Cust2Mate Solutions Corp. - Common Shares"},{"s":"AZI","n":"Autozi Internet Technology (Global) Ltd."},{"s":"AZIO","n":"Azio AI Holdings, Inc."},{"s":"AZN","n":"AstraZeneca PLC Ordinary Shares"},{"s":"AZO","n":"AutoZone, Inc. Common Stock"},{"s":"AZTA","n":"Azenta, Inc."},{"s":"AZTR","n":"Azitra Inc Common Stock"},{"s":"AZUL","n":"Azul S.A. American Depositary Shares, each representing two (2) Common Shares"},{"s":"AZZ","n":"AZZ Inc."},{"s":"B","n":"Barrick Mining Corporation Common Shares"},{"s":"BA","n":"Boeing Company (The) Common Stock"},{"s":"BABA","n":"Alibaba Group Holding Limited American Depositary Shares each representing eight Ordinary share"},{"s":"BAC","n":"Bank of America Corporation Common Stock"},{"s":"BAER","n":"Bridger Aerospace Group Holdings, Inc."},{"s":"BAFN","n":"BayFirst Financial Corp."},{"s":"BAH","n":"Booz Allen Hamilton Holding Corporation Common Stock"},{"s":"BALL","n":"Ball Corporation Common Stock"},{"s":"BALY","n":"Bally's Corporation Common Stock"},{"s":"BAM","n":"Brookfield Asset Management Inc Class A Limited Voting Shares"},{"s":"BANC","n":"Banc of California, Inc. Common Stock"},{"s":"BAND","n":"Bandwidth Inc."},{"s":"BANF","n":"BancFirst Corporation"},{"s":"BANL","n":"CBL International Limited"},{"s":"BANR","n":"Banner Corporation"},{"s":"BAOS","n":"Baosheng Media Group Holdings Limited"},{"s":"BAP","n":"Credicorp Ltd. Common Stock"},{"s":"BARK","n":"BARK, Inc. Class A Common Stock"},{"s":"BATL","n":"Battalion Oil Corporation Common Stock"},{"s":"BAX","n":"Baxter International Inc. Common Stock"},{"s":"BB","n":"BlackBerry Limited Common Stock"},{"s":"BBAI","n":"BigBear.ai, Inc. Common Stock"},{"s":"BBAR","n":"Banco BBVA Argentina S.A. ADS"},{"s":"BBBY","n":"Bed Bath & Beyond, Inc. Common Stock"},{"s":"BBCP","n":"Concrete Pumping Holdings, Inc."},{"s":"BBD","n":"Banco Bradesco Sa American Depositary Shares"},{"s":"BBDC","n":"Barings BDC, Inc. Common Stock"},{"s":"BBDO","n":"Banco Bradesco Sa American Depositary Shares (each representing one Common Share)"},{"s":"BBGI","n":"Beasley Broadcast Group, Inc."},{"s":"BBIO","n":"BridgeBio Pharma, Inc."},{"s":"BBLG","n":"Bone Biologics Corp"},{"s":"BBLGW","n":"Bone Biologics Corp - warrants"},{"s":"BBNX","n":"Beta Bionics, Inc."},{"s":"BBOT","n":"BridgeBio Oncology Therapeutics, Inc."},{"s":"BBSI","n":"Barrett Business Services, Inc."},{"s":"BBT","n":"Beacon Financial Corporation Common stock"},{"s":"BBUC","n":"Brookfield Business Corporation Class A Subordinate Voting Shares"},{"s":"BBVA","n":"Banco Bilbao Vizcaya Argentaria S.A. Common Stock"},{"s":"BBW","n":"Build-A-Bear Workshop, Inc. Common Stock"},{"s":"BBWI","n":"Bath & Body Works, Inc."},{"s":"BBY","n":"Best Buy Co., Inc. Common Stock"},{"s":"BC","n":"Brunswick Corporation Common Stock"},{"s":"BCAB","n":"BioAtla, Inc."},{"s":"BCAL","n":"California BanCorp"},{"s":"BCAX","n":"Bicara Therapeutics Inc."},{"s":"BCBP","n":"BCB Bancorp, Inc. (NJ)"},{"s":"BCC","n":"Boise Cascade, L.L.C. Common Stock"},{"s":"BCDA","n":"BioCardia, Inc."},{"s":"BCE","n":"BCE, Inc. Common Stock"},{"s":"BCG","n":"Binah Capital Group, Inc."},{"s":"BCGWW","n":"Binah Capital Group, Inc. - Warrants"},{"s":"BCH","n":"Banco De Chile ADS"},{"s":"BCHT","n":"Birchtech Corp. Common Stock"},{"s":"BCML","n":"BayCom Corp"},{"s":"BCO","n":"Brinks Company (The) Common Stock"},{"s":"BCPC","n":"Balchem Corporation"},{"s":"BCRX","n":"BioCryst Pharmaceuticals, Inc."},{"s":"BCS","n":"Barclays PLC Common Stock"},{"s":"BCSF","n":"Bain Capital Specialty Finance, Inc. Common Stock"},{"s":"BCSS","n":"Bain Capital GSS Investment Corp. Class A Ordinary Shares"},{"s":"BCTX","n":"BriaCell Therapeutics Corp. - Common Shares"},{"s":"BCTXL","n":"BriaCell Therapeutics Corp. - Warrants"},{"s":"BCX","n":"BlackRock Resources Common Shares of Beneficial Interest"},{"s":"BCYC","n":"Bicycle Therapeutics plc"},{"s":"BDC","n":"Belden Inc Common Stock"},{"s":"BDCI","n":"BTC Development Corp."},{"s":"BDL","n":"Flanigan's Enterprises, Inc. Common Stock"},{"s":"BDMD","n":"Baird Medical Investment Holdings Ltd - Ordinary Share"},{"s":"BDRX","n":"Biodexa Pharmaceuticals plc"},{"s":"BDSX","n":"Biodesix, Inc."},{"s":"BDTX","n":"Black Diamond Therapeutics, Inc."},{"s":"BDX","n":"Becton, Dickinson and Company Common Stock"},{"s":"BE","n":"Bloom Energy Corporation Class A Common Stock"},{"s":"BEAM","n":"Beam Therapeutics Inc."},{"s":"BEAT","n":"Heartbeam, Inc."},{"s":"BEBE","n":"TGE Value Creative Solutions Corp Class A Ordinary Shares"},{"s":"BEEM","n":"Beam Global"},{"s":"BEEP","n":"Mobile Infrastructure Corporation"},{"s":"BEKE","n":"KE Holdings Inc American Depositary Shares (each representing three Class A Ordinary Shares)"},{"s":"BELFA","n":"Bel Fuse Inc."},{"s":"BELFB","n":"Bel Fuse Inc."},{"s":"BEN","n":"Franklin Resources, Inc. Common Stock"},{"s":"BENF","n":"Beneficient"},{"s":"BEP","n":"Brookfield Renewable Partners L.P. Limited Partnership Units"},{"s":"BEPC","n":"Brookfield Renewable Corporation Brookfield Renewable Corporation Class A Subordinate Voting Shares"},{"s":"BESS","n":"Bimergen Energy Corporation Common Stock"},{"s":"BETA","n":"Beta Technologies, Inc. Class A Common Stock"},{"s":"BETR","n":"Better Home & Finance Holding Company"},{"s":"BF-A","n":"Brown Forman Inc Class A Common Stock"},{"s":"BF-B","n":"Brown Forman Inc Class B Common Stock"},{"s":"BFAM","n":"Bright Horizons Family Solutions Inc. Common Stock"},{"s":"BFC","n":"Bank First Corporation"},{"s":"BFH","n":"Bread Financial Holdings, Inc. Common Stock"},{"s":"BFLY","n":"Butterfly Network, Inc. Class A Common Stock"},{"s":"BFRG","n":"Bullfrog AI Holdings, Inc."},{"s":"BFRGW","n":"Bullfrog AI Holdings, Inc. - Warrants"},{"s":"BFRI","n":"Biofrontera Inc."},{"s":"BFRIW","n":"Biofrontera Inc. - Warrants"},{"s":"BFS","n":"Saul Centers, Inc. Common Stock"},{"s":"BFST","n":"Business First Bancshares, Inc."},{"s":"BG","n":"Bunge Limited Common Shares"},{"s":"BGC","n":"BGC Group, Inc."},{"s":"BGDE","n":"Big Digital Energy, Inc."},{"s":"BGI","n":"Birks Group Inc. Common Stock"},{"s":"BGIN","n":"Bgin Blockchain Limited"},{"s":"BGL","n":"Blue Gold Limited"},{"s":"BGLC","n":"BioNexus Gene Lab Corp"},{"s":"BGM","n":"BGM Group Ltd."},{"s":"BGMS","n":"Bio Green Med Solution, Inc."},{"s":"BGS","n":"B&G Foods, Inc. Common Stock"},{"s":"BGSF","n":"BGSF, Inc. Common Stock"},{"s":"BGSI","n":"Boyd Group Services Inc. Common Shares"},{"s":"BH","n":"Biglari Holdings Inc. Class B Common Stock"},{"s":"BH-A","n":"Biglari Holdings Inc. Class A Common Stock"},{"s":"BHB","n":"Bar Harbor Bankshares, Inc. Common Stock"},{"s":"BHC","n":"Bausch Health Companies Inc. Common Stock"},{"s":"BHE","n":"Benchmark Electronics, Inc. Common Stock"},{"s":"BHF","n":"Brighthouse Financial, Inc."},{"s":"BHFAL","n":"Brighthouse Financial, Inc. - Junior Subordinated Debentures due 2058"},{"s":"BHP","n":"BHP Group Limited American Depositary Shares (Each representing two Ordinary Shares)"},{"s":"BHR","n":"Braemar Hotels & Resorts Inc. Common Stock"},{"s":"BHRB","n":"Burke & Herbert Financial Services Corp."},{"s":"BHST","n":"BioHarvest Sciences Inc."},{"s":"BHVN","n":"Biohaven Ltd. Common Shares"},{"s":"BIAF","n":"bioAffinity Technologies, Inc."},{"s":"BIDU","n":"Baidu, Inc."},{"s":"BIIB","n":"Biogen Inc."},{"s":"BILI","n":"Bilibili Inc."},{"s":"BILL","n":"BILL Holdings, Inc. Common Stock"},{"s":"BIO","n":"Bio-Rad Laboratories, Inc. Class A Common Stock"},{"s":"BIO-B","n":"Bio-Rad Laboratories, Inc. Class B Common Stock"},{"s":"BIOA","n":"BioAge Labs, Inc."},{"s":"BIOX","n":"Bioceres Crop Solutions Corp."},{"s":"BIPC","n":"Brookfield Infrastructure Corporation Brookfield Infrastructure Corporation"},{"s":"BIRD","n":"Smartbird, Inc."},{"s":"BIRK","n":"Birkenstock Holding plc Ordinary Shares"},{"s":"BIVI","n":"BioVie Inc."},{"s":"BIYA","n":"Baiya International Group Inc."},{"s":"BJ","n":"BJ's Wholesale Club Holdings, Inc. Common Stock"},{"s":"BJDX","n":"Bluejay Diagnostics, Inc."},{"s":"BJRI","n":"BJ's Restaurants, Inc."},{"s":"BKD","n":"Brookdale Senior Living Inc. Common Stock"},{"s":"BKE","n":"Buckle, Inc. (The) Common Stock"},{"s":"BKH","n":"Black Hills Corporation Common Stock"},{"s":"BKKT","n":"Bakkt, Inc. Class A Common Stock"},{"s":"BKNG","n":"Booking Holdings Inc."},{"s":"BKR","n":"Baker Hughes Company"},{"s":"BKSY","n":"BlackSky Technology Inc. Class A Common Stock"},{"s":"BKTI","n":"BK Technologies Corporation Common Stock"},{"s":"BKU","n":"BankUnited, Inc. Common Stock"},{"s":"BKV","n":"BKV Corporation Common Stock"},{"s":"BKYI","n":"BIO-key International, Inc."},{"s":"BL","n":"BlackLine, Inc."},{"s":"BLBD","n":"Blue Bird Corporation"},{"s":"BLCO","n":"Bausch + Lomb Corporation Common Shares"},{"s":"BLDP","n":"Ballard Power Systems, Inc. - Common Shares"},{"s":"BLDR","n":"Builders FirstSource, Inc. Common Stock"},{"s":"BLFS","n":"BioLife Solutions, Inc."},{"s":"BLIN","n":"Bridgeline Digital, Inc."},{"s":"BLIV","n":"BeLive Holdings"},{"s":"BLK","n":"BlackRock, Inc. Common Stock"},{"s":"BLKB","n":"Blackbaud, Inc."},{"s":"BLLN","n":"BillionToOne, Inc."},{"s":"BLMN","n":"Bloomin' Brands, Inc."},{"s":"BLND","n":"Blend Labs, Inc. Class A Common Stock"},{"s":"BLNE","n":"Beeline Holdings, Inc."},{"s":"BLNK","n":"Blink Charging Co."},{"s":"BLRX","n":"BioLineRx Ltd."},{"s":"BLSH","n":"Bullish Ordinary Shares"},{"s":"BLTE","n":"Belite Bio, Inc"},{"s":"BLX","n":"Bladex, Inc. Class E Common Stock"},{"s":"BLZE","n":"Backblaze, Inc."},{"s":"BMBL","n":"Bumble Inc."},{"s":"BMEA","n":"Biomea Fusion, Inc."},{"s":"BMGL","n":"Basel Medical Group Ltd"},{"s":"BMHL","n":"Bluemount Holdings Limited"},{"s":"BMI","n":"Badger Meter, Inc. Common Stock"},{"s":"BMM","n":"Blue Moon Metals Inc. - Common Shares"},{"s":"BMNR","n":"BitMine Immersion Technologies, Inc. Common Stock"},{"s":"BMO","n":"Bank Of Montreal Common Stock"},{"s":"BMR","n":"Beamr Imaging Ltd. - Ordinary Share"},{"s":"BMRA","n":"Biomerica, Inc."},{"s":"BMRC","n":"Bank of Marin Bancorp"},{"s":"BMRN","n":"BioMarin Pharmaceutical Inc."},{"s":"BMY","n":"Bristol-Myers Squibb Company Common Stock"},{"s":"BN","n":"Brookfield Corporation Class A Limited Voting Shares"},{"s":"BNAI","n":"Brand Engagement Network Inc."},{"s":"BNC","n":"CEA Industries Inc."},{"s":"BNCWZ","n":"CEA Industries Inc. - Warrants"},{"s":"BNED","n":"Barnes & Noble Education, Inc Common Stock"},{"s":"BNGO","n":"Bionano Genomics, Inc."},{"s":"BNKK","n":"Bonk, Inc."},{"s":"BNL","n":"Broadstone Net Lease, Inc. Common Stock"},{"s":"BNR","n":"Burning Rock Biotech Limited"},{"s":"BNRG","n":"Brenmiller Energy Ltd"},{"s":"BNS","n":"Bank Nova Scotia Halifax Pfd 3 Ordinary Shares"},{"s":"BNT","n":"Brookfield Wealth Solutions Ltd. Class A Exchangeable Limited Voting Shares"},{"s":"BNTC","n":"Benitec Biopharma Inc."},{"s":"BNTX","n":"BioNTech SE"},{"s":"BNY","n":"The Bank of New York Mellon Corporation Common Stock"},{"s":"BNZI","n":"Banzai International, Inc."},{"s":"BOBS","n":"Bob's Discount Furniture, Inc. Common Stock"},{"s":"BOC","n":"Boston Omaha Corporation Class A Common Stock"},{"s":"BODI","n":"The Beachbody Company, Inc."},{"s":"BOF","n":"BranchOut Food Inc."},{"s":"BOH","n":"Bank of Hawaii Corporation Common Stock"},{"s":"BOKF","n":"BOK Financial Corporation"},{"s":"BOLD","n":"Boundless Bio, Inc."},{"s":"BOLT","n":"Bolt Biotherapeutics, Inc."},{"s":"BON","n":"Bon Natural Life Limited"},{"s":"BOOM","n":"DMC Global Inc."},{"s":"BOOT","n":"Boot Barn Holdings, Inc. Common Stock"},{"s":"BORR","n":"Borr Drilling Limited Common Shares"},{"s":"BOSC","n":"B.O.S. Better Online Solutions"},{"s":"BOT","n":"RoboStrategy, Inc."},{"s":"BOTJ","n":"Bank of the James Financial Group, Inc."},{"s":"BOW","n":"Bowhead Specialty Holdings Inc. Common Stock"},{"s":"BOX","n":"Box, Inc. Class A Common Stock"},{"s":"BOXL","n":"Boxlight Corporation"},{"s":"BP","n":"BP p.l.c. Common Stock"},{"s":"BPOP","n":"Popular, Inc."},{"s":"BPRN","n":"Princeton Bancorp, Inc."},{"s":"BQ","n":"Boqii Holding Limited Class A Ordinary Shares"},{"s":"BR","n":"Broadridge Financial Solutions, Inc. Common Stock"},{"s":"BRAG","n":"Bragg Gaming Group Inc. - Common Shares"},{"s":"BRAI","n":"Braiin Limited"},{"s":"BRBI","n":"BRBI BR Partners S.A. - ADSs"},{"s":"BRBR","n":"BellRing Brands, Inc. Common Stock"},{"s":"BRBS","n":"Blue Ridge Bankshares, Inc. Common Stock"},{"s":"BRC","n":"Brady Corporation Common Stock"},{"s":"BRCB","n":"Black Rock Coffee Bar, Inc."},{"s":"BRCC","n":"BRC Inc. Class A Common Stock"},{"s":"BRFH","n":"Barfresh Food Group Inc."},{"s":"BRIA","n":"BrilliA Inc Class A Ordinary Shares"},{"s":"BRID","n":"Bridgford Foods Corporation"},{"s":"BRK-A","n":"Berkshire Hathaway Inc. Common Stock"},{"s":"BRK-B","n":"Berkshire Hathaway Inc. New Common Stock"},{"s":"BRKR","n":"Bruker Corporation"},{"s":"BRLS","n":"Borealis Foods Inc."},{"s":"BRLT","n":"Brilliant Earth Group, Inc."},{"s":"BRN","n":"Barnwell Industries, Inc. Common Stock"},{"s":"BRNS","n":"Barinthus Biotherapeutics plc"},{"s":"BRO","n":"Brown & Brown, Inc. Common Stock"},{"s":"BROS","n":"Dutch Bros Inc. Class A Common Stock"},{"s":"BRR","n":"ProCap Financial, Inc."},{"s":"BRSL","n":"Brightstar Lottery PLC Trading under the Legal Name to begin at the market open on July 21, 2025. Ordinary Shares"},{"s":"BRSP","n":"BrightSpire Capital, Inc. Class A Common Stock"},{"s":"BRT","n":"BRT Apartments Corp. (MD) Common Stock"},{"s":"BRTX","n":"BioRestorative Therapies, Inc."},{"s":"BRUN","n":"Boost Run Inc."},{"s":"BRX","n":"Brixmor Property Group Inc. Common Stock"},{"s":"BRZE","n":"Braze, Inc."},{"s":"BSAC","n":"Banco Santander - Chile ADS"},{"s":"BSBK","n":"Bogota Financial Corp."},{"s":"BSET","n":"Bassett Furniture Industries, Incorporated"},{"s":"BSIN","n":"Big Sky Industrial Inc."},{"s":"BSM","n":"Black Stone Minerals, L.P. Common units representing limited partner interests"},{"s":"BSP","n":"Bending Spoons S.p.A."},{"s":"BSRR","n":"Sierra Bancorp"},{"s":"BSVN","n":"Bank7 Corp."},{"s":"BSX","n":"Boston Scientific Corporation Common Stock"},{"s":"BSY","n":"Bentley Systems, Incorporated"},{"s":"BTAI","n":"BioXcel Therapeutics, Inc."},{"s":"BTBD","n":"BT Brands, Inc."},{"s":"BTBT","n":"Bit Digital, Inc. - Ordinary Share"},{"s":"BTCS","n":"BTCS Inc."},{"s":"BTCT","n":"BTC Digital Ltd."},{"s":"BTDR","n":"Bitdeer Technologies Group"},{"s":"BTE","n":"Baytex Energy Corp Common Shares"},{"s":"BTG","n":"B2Gold Corp Common shares (Canada)"},{"s":"BTGO","n":"BitGo Holdings, Inc. Class A Common Stock"},{"s":"BTMD","n":"Biote Corp."},{"s":"BTOC","n":"Armlogi Holding Corp."},{"s":"BTOG","n":"Bit Origin Limited"},{"s":"BTQ","n":"BTQ Technologies Corp."},{"s":"BTSG","n":"BrightSpring Health Services, Inc."},{"s":"BTTC","n":"Black Titan Corp"},{"s":"BTU","n":"Peabody Energy Corporation Common Stock"},{"s":"BUDA","n":"Buda Juice, Inc. Common Stock"},{"s":"BULL","n":"Webull Corporation"},{"s":"BULLW","n":"Webull Corporation - Warrants"},{"s":"BUR","n":"Burford Capital Limited Ordinary Shares"},{"s":"BURL","n":"Burlington Stores, Inc. Common Stock"},{"s":"BURU","n":"Nuburu, Inc. Common Stock"},{"s":"BUSE","n":"First Busey Corporation"},{"s":"BUUU","n":"BUUU Group Limited"},{"s":"BV","n":"BrightView Holdings, Inc. Common Stock"},{"s":"BVC","n":"BitVentures Limited - Ordinary Share"},{"s":"BVFL","n":"BV Financial, Inc."},{"s":"BVN","n":"Buenaventura Mining Company Inc."},{"s":"BVS","n":"Bioventus Inc."},{"s":"BW","n":"Babcock & Wilcox Enterprises, Inc. Common Stock"},{"s":"BWA","n":"BorgWarner Inc. Common Stock"},{"s":"BWAY","n":"BrainsWay Ltd."},{"s":"BWB","n":"Bridgewater Bancshares, Inc."},{"s":"BWEN","n":"Broadwind, Inc."},{"s":"BWFG","n":"Bankwell Financial Group, Inc."},{"s":"BWIN","n":"The Baldwin Insurance Group, Inc."},{"s":"BWLP","n":"BW LPG Limited Common Shares"},{"s":"BWMN","n":"Bowman Consulting Group Ltd."},{"s":"BWMX","n":"Betterware de Mexico, S.A.P.I. de C.V. Ordinary Shares"},{"s":"BWXT","n":"BWX Technologies, Inc. Common Stock"},{"s":"BX","n":"Blackstone Inc. Common Stock"},{"s":"BXC","n":"Bluelinx Holdings Inc. Common Stock"},{"s":"BXP","n":"BXP, Inc. Common Stock"},{"s":"BY","n":"Byline Bancorp, Inc. Common Stock"},{"s":"BYAH","n":"Park Ha Biological Technology Co., Ltd."},{"s":"BYD","n":"Boyd Gaming Corporation Common Stock"},{"s":"BYFC","n":"Broadway Financial Corporation"},{"s":"BYND","n":"Beyond Meat, Inc."},{"s":"BYRN","n":"Byrna Technologies, Inc."},{"s":"BYSI","n":"BeyondSpring, Inc."},{"s":"BZ","n":"KANZHUN LIMITED - American Depository Shares"},{"s":"BZAI","n":"Blaize Holdings, Inc."},{"s":"BZFD","n":"BuzzFeed, Inc."},{"s":"BZH","n":"Beazer Homes USA, Inc. Common Stock"},{"s":"BZUN","n":"Baozun Inc."},{"s":"C","n":"Citigroup, Inc. Common Stock"},{"s":"CAAP","n":"Corporacion America Airports SA Common Shares"},{"s":"CAAS","n":"China Automotive Systems, Inc. - Ordinary Share"},{"s":"CABA","n":"Cabaletta Bio, Inc."},{"s":"CABO","n":"Cable One, Inc. Common Stock"},{"s":"CABR","n":"Caring Brands, Inc."},{"s":"CAC","n":"Camden National Corporation"},{"s":"CACC","n":"Credit Acceptance Corporation"},{"s":"CACI","n":"CACI International, Inc. Class A Common Stock"},{"s":"CADL","n":"Candel Therapeutics, Inc."},{"s":"CAE","n":"CAE Inc. Ordinary Shares"},{"s":"CAES","n":"Cantor Equity Partners VII, Inc."},{"s":"CAG","n":"ConAgra Brands, Inc. Common Stock"},{"s":"CAH","n":"Cardinal Health, Inc. Common Stock"},{"s":"CAI","n":"Caris Life Sciences, Inc."},{"s":"CAKE","n":"The Cheesecake Factory Incorporated"},{"s":"CAL","n":"Caleres, Inc. Common Stock"},{"s":"CALC","n":"CalciMedica, Inc."},{"s":"CALM","n":"Cal-Maine Foods, Inc."},{"s":"CALX","n":"Calix, Inc Common Stock"},{"s":"CALY","n":"Callaway Golf Company Common Stock"},{"s":"CAMP","n":"CAMP4 Therapeutics Corporation"},{"s":"CAMT","n":"Camtek Ltd."},{"s":"CAN","n":"Canaan Inc."},{"s":"CANF","n":"Can-Fite Biopharma Ltd American Depositary Shares, each representing two (2) Ordinary Shares"},{"s":"CANG","n":"Cango Inc. Class A Ordinary Shares"},{"s":"CAPR","n":"Capricor Therapeutics, Inc."},{"s":"CAPS","n":"Capstone Holding Corp."},{"s":"CAR","n":"Avis Budget Group, Inc."},{"s":"CARE","n":"Carter Bankshares, Inc."},{"s":"CARG","n":"CarGurus, Inc."},{"s":"CARL","n":"Carlsmed, Inc."},{"s":"CARR","n":"Carrier Global Corporation Common Stock"},{"s":"CARS","n":"Cars.com Inc. Common Stock"},{"s":"CART","n":"Maplebear Inc."},{"s":"CASH","n":"Pathward Financial, Inc."},{"s":"CASS","n":"Cass Information Systems, Inc"},{"s":"CAST","n":"FreeCast, Inc."},{"s":"CASY","n":"Caseys General Stores, Inc."},{"s":"CAT","n":"Caterpillar, Inc. Common Stock"},{"s":"CATO","n":"Cato Corporation (The) Class A Common Stock"},{"s":"CATX","n":"Perspective Therapeutics, Inc. Common Stock"},{"s":"CATY","n":"Cathay General Bancorp"},{"s":"CAVA","n":"CAVA Group, Inc. Common Stock"},{"s":"CB","n":"Chubb Limited Common Stock"},{"s":"CBAN","n":"Colony Bankcorp, Inc. Common Stock"},{"s":"CBAT","n":"CBAK Energy Technology Limited"},{"s":"CBC","n":"Central Bancompany, Inc."},{"s":"CBFV","n":"CB Financial Services, Inc."},{"s":"CBIO","n":"Crescent Biopharma, Inc."},{"s":"CBK","n":"Commercial Bancgroup, Inc."},{"s":"CBL","n":"CBL & Associates Properties, Inc. Common Stock"},{"s":"CBLL","n":"CeriBell, Inc."},{"s":"CBNA","n":"Chain Bridge Bancorp, Inc. Class A Common Stock"},{"s":"CBNK","n":"Capital Bancorp, Inc."},{"s":"CBOE","n":"Cboe Global Markets, Inc. Common Stock"},{"s":"CBRE","n":"CBRE Group Inc Common Stock Class A"},{"s":"CBRL","n":"Cracker Barrel Old Country Store, Inc."},{"s":"CBRS","n":"Cerebras Systems Inc."},{"s":"CBSH","n":"Commerce Bancshares, Inc."},{"s":"CBT","n":"Cabot Corporation Common Stock"},{"s":"CBU","n":"Community Financial System, Inc. Common Stock"},{"s":"CBUS","n":"Cibus, Inc."},{"s":"CBZ","n":"CBIZ, Inc. Common Stock"},{"s":"CC","n":"Chemours Company (The) Common Stock"},{"s":"CCAP","n":"Crescent Capital BDC, Inc."},{"s":"CCB","n":"Coastal Financial Corporation"},{"s":"CCBG","n":"Capital City Bank Group"},{"s":"CCC","n":"CCC Intelligent Solutions Holdings Inc."},{"s":"CCCC","n":"C4 Therapeutics, Inc."},{"s":"CCCTU","n":"Columbus Circle Capital Corp III - Units"},{"s":"CCEC","n":"Capital Clean Energy Carriers Corp. - Common Share"},{"s":"CCEL","n":"Cryo-Cell International, Inc. Common Stock"},{"s":"CCEP","n":"Coca-Cola Europacific Partners plc"},{"s":"CCG","n":"Cheche Group Inc."},{"s":"CCHH","n":"CCH Holdings Ltd"},{"s":"CCI","n":"Crown Castle Inc. Common Stock"},{"s":"CCIX","n":"Churchill Capital Corp IX"},{"s":"CCJ","n":"Cameco Corporation Common Stock"},{"s":"CCK","n":"Crown Holdings, Inc."},{"s":"CCL","n":"Carnival Corporation Ltd. Common Shares"},{"s":"CCLD","n":"CareCloud, Inc."},{"s":"CCM","n":"Concord Medical Services Holdings Limited American Depositary Shares (Each represents thirty (30) Class A ordinary shares)"},{"s":"CCNE","n":"CNB Financial Corporation"},{"s":"CCO","n":"Clear Channel Outdoor Holdings, Inc. Common Stock"},{"s":"CCOI","n":"Cogent Communications Holdings, Inc."},{"s":"CCRN","n":"Cross Country Healthcare, Inc."},{"s":"CCS","n":"Century Communities, Inc. Common Stock"},{"s":"CCSI","n":"Consensus Cloud Solutions, Inc."},{"s":"CCTG","n":"CCSC Technology International Holdings Limited"},{"s":"CCU","n":"Compania Cervecerias Unidas, S.A. Common Stock"},{"s":"CCXI","n":"Churchill Capital Corp XI"},{"s":"CCXIU","n":"Churchill Capital Corp XI - Units"},{"s":"CCXIW","n":"Churchill Capital Corp XI - Warrants"},{"s":"CCZ","n":"Comcast Holdings ZONES"},{"s":"CD","n":"Chaince Digital Holdings Inc. - American Ordinary Shares"},{"s":"CDE","n":"Coeur Mining, Inc. Common Stock"},{"s":"CDIO","n":"Cardio Diagnostics Holdings Inc."},{"s":"CDLR","n":"Cadeler A/S American Depositary Share (each representing four (4) Ordinary Shares)"},{"s":"CDLX","n":"Cardlytics, Inc."},{"s":"CDNA","n":"CareDx, Inc."},{"s":"CDNL","n":"Cardinal Infrastructure Group Inc."},{"s":"CDNS","n":"Cadence Design Systems, Inc."},{"s":"CDP","n":"COPT Defense Properties Common Shares of Beneficial Interest"},{"s":"CDRE","n":"Cadre Holdings, Inc. Common Stock"},{"s":"CDRO","n":"Codere Online Luxembourg, S.A."},{"s":"CDROW","n":"Codere Online Luxembourg, S.A. - Warrants"},{"s":"CDT","n":"CDT Equity Inc."},{"s":"CDTG","n":"CDT Environmental Technology Investment Holdings Limited"},{"s":"CDW","n":"CDW Corporation"},{"s":"CDXS","n":"Codexis, Inc."},{"s":"CDZI","n":"Cadiz, Inc."},{"s":"CDZIP","n":"Cadiz, Inc. - Depositary Shares"},{"s":"CE","n":"Celanese Corporation Common Stock"},{"s":"CECO","n":"CECO Environmental Corp."},{"s":"CEG","n":"Constellation Energy Corporation"},{"s":"CELC","n":"Celcuity Inc."},{"s":"CELH","n":"Celsius Holdings, Inc."},{"s":"CELU","n":"Celularity Inc."},{"s":"CELZ","n":"Creative Medical Technology Holdings, Inc."},{"s":"CENN","n":"Cenntro Inc."},{"s":"CENT","n":"Central Garden & Pet Company"},{"s":"CENTA","n":"Central Garden & Pet Company"},{"s":"CENX","n":"Century Aluminum Company"},{"s":"CEPF","n":"Cantor Equity Partners IV, Inc."},{"s":"CEPL","n":"Capstone Energy Plus, Inc."},{"s":"CEPO","n":"Cantor Equity Partners I, Inc."},{"s":"CEPS","n":"Cantor Equity Partners VI, Inc."},{"s":"CEPU","n":"Central Puerto S.A. American Depositary Shares (each represents ten Common Shares)"},{"s":"CEPV","n":"Cantor Equity Partners V, Inc."},{"s":"CERS","n":"Cerus Corporation"},{"s":"CERT","n":"Certara, Inc."},{"s":"CET","n":"Central Securities Corporation Common Stock"},{"s":"CETX","n":"Cemtrex Inc."},{"s":"CETY","n":"Clean Energy Technologies, Inc."},{"s":"CEVA","n":"CEVA, Inc."},{"s":"CF","n":"CF Industries Holdings, Inc. Common Stock"},{"s":"CFBK","n":"CF Bankshares Inc."},{"s":"CFFI","n":"C&F Financial Corporation"},{"s":"CFFN","n":"Capitol Federal Financial, Inc."},{"s":"CFG","n":"Citizens Financial Group, Inc. Common Stock"},{"s":"CFR","n":"Cullen/Frost Bankers, Inc. Common Stock"},{"s":"CG","n":"The Carlyle Group Inc."},{"s":"CGAU","n":"Centerra Gold Inc. Common Shares"},{"s":"CGC","n":"Canopy Growth Corporation - Common Shares"},{"s":"CGCFU","n":"Cartesian Growth Corporation IV - Units"},{"s":"CGEM","n":"Cullinan Therapeutics, Inc."},{"s":"CGEN","n":"Compugen Ltd."},{"s":"CGNT","n":"Cognyte Software Ltd."},{"s":"CGNX","n":"Cognex Corporation"},{"s":"CGON","n":"CG Oncology, Inc."},{"s":"CGTL","n":"Creative Global Technology Holdings Limited"},{"s":"CGTX","n":"Cognition Therapeutics, Inc."},{"s":"CHA","n":"Chagee Holdings Limited"},{"s":"CHAI","n":"Core AI Holdings, Inc. - Common Shares"},{"s":"CHCI","n":"Comstock Holding Companies, Inc."},{"s":"CHCO","n":"City Holding Company"},{"s":"CHD","n":"Church & Dwight Company, Inc. Common Stock"},{"s":"CHDN","n":"Churchill Downs, Incorporated"},{"s":"CHE","n":"Chemed Corp"},{"s":"CHEF","n":"The Chefs' Warehouse, Inc."},{"s":"CHGG","n":"Chegg, Inc. Common Stock"},{"s":"CHH","n":"Choice Hotels International, Inc. Common Stock"},{"s":"CHKP","n":"Check Point Software Technologies Ltd."},{"s":"CHMG","n":"Chemung Financial Corp"},{"s":"CHMI","n":"Cherry Hill Mortgage Investment Corporation Common Stock"},{"s":"CHNR","n":"China Natural Resources, Inc. - Common Shares"},{"s":"CHOW","n":"ChowChow Cloud International Holdings Limited Ordinary Shares"},{"s":"CHPT","n":"ChargePoint Holdings, Inc. Common Stock"},{"s":"CHR","n":"Cheer Holding, Inc."},{"s":"CHRD","n":"Chord Energy Corporation"},{"s":"CHRN","n":"ChronoScale Holdings Corporation"},{"s":"CHRS","n":"Coherus Oncology, Inc."},{"s":"CHRW","n":"C.H. Robinson Worldwide, Inc."},{"s":"CHSN","n":"Chanson International Holding"},{"s":"CHT","n":"Chunghwa Telecom Co., Ltd."},{"s":"CHTR","n":"Charter Communications, Inc."},{"s":"CHWY","n":"Chewy, Inc. Class A Common Stock"},{"s":"CHYM","n":"Chime Financial, Inc."},{"s":"CI","n":"The Cigna Group Common Stock"},{"s":"CIA","n":"Citizens, Inc. Class A Common Stock ($1.00 Par)"},{"s":"CIEN","n":"Ciena Corporation Common Stock"},{"s":"CIFR","n":"Cipher Digital Inc."},{"s":"CIG","n":"Comp En De Mn Cemig ADS American Depositary Shares"},{"s":"CIGI","n":"Colliers International Group Inc. - Subordinate Voting Shares"},{"s":"CIIT","n":"Tianci International, Inc."},{"s":"CIM","n":"Chimera Investment Corporation Common Stock"},{"s":"CINF","n":"Cincinnati Financial Corporation"},{"s":"CING","n":"Cingulate Inc."},{"s":"CINGW","n":"Cingulate Inc. - Warrants"},{"s":"CINT","n":"CI&T Inc Class A Common Shares"},{"s":"CION","n":"CION Investment Corporation Common Stock"},{"s":"CIRC","n":"Circle8 Group, Inc."},{"s":"CISO","n":"CISO Global, Inc."},{"s":"CISS","n":"C3is Inc."},{"s":"CITR","n":"CitroTech Inc. Common Stock"},{"s":"CIVB","n":"Civista Bancshares, Inc."},{"s":"CIX","n":"CompX International Inc. Common Stock"},{"s":"CJMB","n":"Callan JMB Inc."},{"s":"CKX","n":"CKX Lands, Inc. Common Stock"},{"s":"CL","n":"Colgate-Palmolive Company Common Stock"},{"s":"CLAR","n":"Clarus Corporation"},{"s":"CLB","n":"Core Laboratories Inc. Common Stock"},{"s":"CLBK","n":"Columbia Financial, Inc."},{"s":"CLBT","n":"Cellebrite DI Ltd."},{"s":"CLDI","n":"Calidi Biotherapeutics, Inc. Common Stock"},{"s":"CLDX","n":"Celldex Therapeutics, Inc."},{"s":"CLF","n":"Cleveland-Cliffs Inc. Common Stock"},{"s":"CLFD","n":"Clearfield, Inc."},{"s":"CLGN","n":"CollPlant Biotechnologies Ltd."},{"s":"CLH","n":"Clean Harbors, Inc. Common Stock"},{"s":"CLIK","n":"Click Holdings Limited - Ordinary Share"},{"s":"CLIR","n":"ClearSign Technologies Corporation"},{"s":"CLLS","n":"Cellectis S.A."},{"s":"CLMB","n":"Climb Global Solutions, Inc."},{"s":"CLMT","n":"Calumet, Inc"},{"s":"CLNE","n":"Clean Energy Fuels Corp."},{"s":"CLNN","n":"Clene Inc."},{"s":"CLOV","n":"Clover Health Investments, Corp."},{"s":"CLPR","n":"Clipper Realty Inc. Common Stock"},{"s":"CLPS","n":"CLPS Incorporation"},{"s":"CLPT","n":"ClearPoint Neuro Inc."},{"s":"CLRB","n":"Cellectar Biosciences, Inc."},{"s":"CLRO","n":"ClearOne, Inc."},{"s":"CLS","n":"Celestica, Inc. Common Stock"},{"s":"CLSK","n":"CleanSpark, Inc."},{"s":"CLST","n":"Catalyst Bancorp, Inc."},{"s":"CLVT","n":"Clarivate Plc Ordinary Shares"},{"s":"CLW","n":"Clearwater Paper Corporation Common Stock"},{"s":"CLWT","n":"Euro Tech Holdings Company Limited"},{"s":"CLX","n":"Clorox Company (The) Common Stock"},{"s":"CLYM","n":"Climb Bio, Inc."},{"s":"CM","n":"Canadian Imperial Bank of Commerce Common Stock"},{"s":"CMBT","n":"CMB.TECH NV Ordinary Shares"},{"s":"CMC","n":"Commercial Metals Company Common Stock"},{"s":"CMCL","n":"Caledonia Mining Corporation Plc Common Shares"},{"s":"CMCM","n":"Cheetah Mobile Inc. American Depositary Shares, each representing fifty (50) Class A Ordinary Shares"},{"s":"CMCO","n":"Columbus McKinnon Corporation"},{"s":"CMCSA","n":"Comcast Corporation"},{"s":"CMCT","n":"Creative Media"},{"s":"CMDB","n":"Costamare Bulkers Holdings Limited Common Stock"},{"s":"CME","n":"CME Group Inc."},{"s":"CMG","n":"Chipotle Mexican Grill, Inc. Common Stock"},{"s":"CMI","n":"Cummins Inc. Common Stock"},{"s":"CMII","n":"Columbus Circle Capital Corp II"},{"s":"CMMB","n":"Chemomab Therapeutics Ltd."},{"s":"CMND","n":"Clearmind Medicine Inc. - Common Shares"},{"s":"CMP","n":"Compass Minerals Intl Inc Common Stock"},{"s":"CMPR","n":"Cimpress plc"},{"s":"CMPS","n":"COMPASS Pathways Plc - American Depository Shares"},{"s":"CMPX","n":"Compass Therapeutics, Inc."},{"s":"CMRE","n":"Costamare Inc. Common Stock $0.0001 par value"},{"s":"CMS","n":"CMS Energy Corporation Common Stock"},{"s":"CMT","n":"Core Molding Technologies Inc Common Stock"},{"s":"CMTL","n":"Comtech Telecommunications Corp."},{"s":"CMTV","n":"Community Bancorp."},{"s":"CNA","n":"CNA Financial Corporation Common Stock"},{"s":"CNC","n":"Centene Corporation Common Stock"},{"s":"CNCK","n":"Coincheck Group N.V."},{"s":"CNCKW","n":"Coincheck Group N.V. - Warrants"},{"s":"CNDT","n":"Conduent Incorporated"},{"s":"CNET","n":"ZW Data Action Technologies Inc."},{"s":"CNEY","n":"CN Energy Group Inc."},{"s":"CNF","n":"CNFinance Holdings Limited American Depositary Shares, each representing two hundred (200) Ordinary Shares"},{"s":"CNH","n":"CNH Industrial N.V. Common Shares"},{"s":"CNI","n":"Canadian National Railway Company Common Stock"},{"s":"CNK","n":"Cinemark Holdings Inc Cinemark Holdings, Inc. Common Stock"},{"s":"CNL","n":"Collective Mining Ltd. Common Shares"},{"s":"CNM","n":"Core & Main, Inc. Class A Common Stock"},{"s":"CNMD","n":"CONMED Corporation Common Stock"},{"s":"CNNE","n":"Cannae Holdings, Inc. Common Stock"},{"s":"CNO","n":"CNO Financial Group, Inc. Common Stock"},{"s":"CNOB","n":"ConnectOne Bancorp, Inc."},{"s":"CNP","n":"CenterPoint Energy, Inc (Holding Co) Common Stock"},{"s":"CNQ","n":"Canadian Natural Resources Limited Common Stock"},{"s":"CNR","n":"Core Natural Resources, Inc. Common Stock"},{"s":"CNS","n":"Cohen & Steers Inc Common Stock"},{"s":"CNSP","n":"CNS Pharmaceuticals, Inc."},{"s":"CNTB","n":"Connect Biopharma Holdings Limited"},{"s":"CNTN","n":"Canton Strategic Holdings, Inc."},{"s":"CNTX","n":"Context Therapeutics Inc."},{"s":"CNTY","n":"Century Casinos, Inc."},{"s":"CNVS","n":"Cineverse Corp."},{"s":"CNX","n":"CNX Resources Corporation Common Stock"},{"s":"CNXC","n":"Concentrix Corporation"},{"s":"CNXN","n":"PC Connection, Inc."},{"s":"CNXU","n":"Conexeu Sciences Inc."},{"s":"COAG","n":"Hemab Therapeutics Holdings, Inc."},{"s":"COCH","n":"Envoy Medical, Inc."},{"s":"COCO","n":"The Vita Coco Company, Inc."},{"s":"COCP","n":"Cocrystal Pharma, Inc."},{"s":"CODA","n":"Coda Octopus Group, Inc."},{"s":"CODI","n":"D/B/A Compass Diversified Holdings Shares of Beneficial Interest"},{"s":"CODX","n":"Co-Diagnostics, Inc."},{"s":"COE","n":"51Talk Online Education Group American depositary shares, each representing 60 Class A ordinary shares"},{"s":"COF","n":"Capital One Financial Corporation Common Stock"},{"s":"COFS","n":"ChoiceOne Financial Services, Inc."},{"s":"COGT","n":"Cogent Biosciences, Inc."},{"s":"COHN","n":"Cohen & Company Inc."},{"s":"COHR","n":"Coherent Corp. Common Stock"},{"s":"COHU","n":"Cohu, Inc."},{"s":"COIN","n":"Coinbase Global, Inc."},{"s":"COKE","n":"Coca-Cola Consolidated, Inc."},{"s":"COLB","n":"Columbia Banking System, Inc."},{"s":"COLL","n":"Collegium Pharmaceutical, Inc."},{"s":"COLM","n":"Columbia Sportswear Company"},{"s":"COMP","n":"Compass, Inc. Class A Common Stock"},{"s":"CON","n":"Concentra Group Holdings Parent, Inc. Common Stock"},{"s":"COO","n":"The Cooper Companies, Inc."},{"s":"COOK","n":"Traeger, Inc. Common Stock"},{"s":"COOT","n":"Australian Oilseeds Holdings Limited"},{"s":"COP","n":"ConocoPhillips Common Stock"},{"s":"COPR","n":"Idaho Copper Corporation Common Stock"},{"s":"COR","n":"Cencora, Inc. Common Stock"},{"s":"CORT","n":"Corcept Therapeutics Incorporated"},{"s":"CORZ","n":"Core Scientific, Inc."},{"s":"CORZW","n":"Core Scientific, Inc. - Tranche 1 Warrants"},{"s":"CORZZ","n":"Core Scientific, Inc. - Tranche 2 Warrants"},{"s":"COSM","n":"Cosmos Health Inc."},{"s":"COSO","n":"CoastalSouth Bancshares, Inc. Common Stock"},{"s":"COST","n":"Costco Wholesale Corporation"},{"s":"COTY","n":"Coty Inc. Class A Common Stock"},{"s":"COUR","n":"Coursera, Inc. Common Stock"},{"s":"COYA","n":"Coya Therapeutics, Inc."},{"s":"CP","n":"Canadian Pacific Kansas City Limited Common Shares"},{"s":"CPA","n":"Copa Holdings, S.A. Class A Common Stock"},{"s":"CPAC","n":"Cementos Pacasmayo S.A.A. American Depositary Shares (Each representing five Common Shares)"},{"s":"CPAY","n":"Corpay, Inc. Common Stock"},{"s":"CPB","n":"The Campbell's Company"},{"s":"CPBI","n":"Central Plains Bancshares, Inc."},{"s":"CPF","n":"Central Pacific Financial Corp New"},{"s":"CPHC","n":"Canterbury Park Holding Corporation"},{"s":"CPHI","n":"China Pharma Holdings, Inc. Common Stock"},{"s":"CPIX","n":"Cumberland Pharmaceuticals Inc."},{"s":"CPK","n":"Chesapeake Utilities Corporation Common Stock"},{"s":"CPNG","n":"Coupang, Inc. Class A Common Stock"},{"s":"CPOP","n":"Pop Culture Group Co., Ltd"},{"s":"CPRI","n":"Capri Holdings Limited Ordinary Shares"},{"s":"CPRT","n":"Copart, Inc."},{"s":"CPS","n":"Cooper-Standard Holdings Inc. Common Stock"},{"s":"CPSH","n":"CPS Technologies Corp."},{"s":"CR","n":"Crane Company Common Stock"},{"s":"CRAI","n":"CRA International,Inc."},{"s":"CRBG","n":"Corebridge Financial Inc. Common Stock"},{"s":"CRBP","n":"Corbus Pharmaceuticals Holdings, Inc."},{"s":"CRBU","n":"Caribou Biosciences, Inc."},{"s":"CRC","n":"California Resources Corporation Common Stock"},{"s":"CRCL","n":"Circle Internet Group, Inc. Class A Common Stock"},{"s":"CRCT","n":"Cricut, Inc."},{"s":"CRD-A","n":"Crawford & Company Common Stock"},{"s":"CRD-B","n":"Crawford & Company Common Stock"},{"s":"CRDF","n":"Cardiff Oncology, Inc."},{"s":"CRDL","n":"Cardiol Therapeutics Inc."},{"s":"CRDO","n":"Credo Technology Group Holding Ltd"},{"s":"CRE","n":"Cre8 Enterprise Limited"},{"s":"CREG","n":"Smart Powerr Corp."},{"s":"CRESY","n":"Cresud S.A.C.I.F. y A."},{"s":"CREX","n":"Creative Realities, Inc."},{"s":"CRGO","n":"Freightos Limited"},{"s":"CRGOW","n":"Freightos Limited - Warrants"},{"s":"CRGY","n":"Crescent Energy Company Class A Common Stock"},{"s":"CRH","n":"CRH PLC Ordinary Shares"},{"s":"CRI","n":"Carter's, Inc. Common Stock"},{"s":"CRIS","n":"Curis, Inc."},{"s":"CRK","n":"Comstock Resources, Inc. Common Stock"},{"s":"CRL","n":"Charles River Laboratories International, Inc. Common Stock"},{"s":"CRM","n":"Salesforce, Inc. Common Stock"},{"s":"CRMD","n":"CorMedix Inc."},{"s":"CRML","n":"Critical Metals Corp."},{"s":"CRMLW","n":"Critical Metals Corp. - Warrants"},{"s":"CRMT","n":"America's Car-Mart, Inc."},{"s":"CRNC","n":"Cerence Inc."},{"s":"CRNT","n":"Ceragon Networks Ltd."},{"s":"CRNX","n":"Crinetics Pharmaceuticals, Inc."},{"s":"CRON","n":"Cronos Group Inc. - Common Share"},{"s":"CROX","n":"Crocs, Inc."},{"s":"CRS","n":"Carpenter Technology Corporation Common Stock"},{"s":"CRSP","n":"CRISPR Therapeutics AG - Common Shares"},{"s":"CRSR","n":"Corsair Gaming, Inc."},{"s":"CRTO","n":"Criteo S.A."},{"s":"CRUS","n":"Cirrus Logic, Inc."},{"s":"CRVL","n":"CorVel Corp."},{"s":"CRVO","n":"CervoMed Inc."},{"s":"CRVS","n":"Corvus Pharmaceuticals, Inc."},{"s":"CRWD","n":"CrowdStrike Holdings, Inc."},{"s":"CRWS","n":"Crown Crafts, Inc."},{"s":"CRWV","n":"CoreWeave, Inc."},{"s":"CSAI","n":"Cloudastructure, Inc."},{"s":"CSAN","n":"Cosan S.A. ADS"},{"s":"CSBR","n":"Champions Oncology, Inc."},{"s":"CSCO","n":"Cisco Systems, Inc."},{"s":"CSGP","n":"CoStar Group, Inc."},{"s":"CSHR","n":"CoinShares PLC"},{"s":"CSHRW","n":"CoinShares PLC - Warrants"},{"s":"CSIQ","n":"Canadian Solar Inc. - Common Shares"},{"s":"CSL","n":"Carlisle Companies Incorporated Common Stock"},{"s":"CSPI","n":"CSP Inc."},{"s":"CSQR","n":"Csquare, Inc. Common Stock"},{"s":"CSR","n":"D/B/A Centerspace Common Stock"},{"s":"CSTE","n":"Caesarstone Ltd."},{"s":"CSTL","n":"Castle Biosciences, Inc."},{"s":"CSTM","n":"Constellium SE Ordinary Shares (France)"},{"s":"CSV","n":"Carriage Services, Inc. Common Stock"},{"s":"CSW","n":"CSW Industrials, Inc. Common Stock"},{"s":"CSWC","n":"Capital Southwest Corporation"},{"s":"CSX","n":"CSX Corporation"},{"s":"CTAS","n":"Cintas Corporation"},{"s":"CTEV","n":"Claritev Corporation Class A Common Stock"},{"s":"CTGO","n":"Contango Silver & Gold Inc. Common Stock"},{"s":"CTKB","n":"Cytek Biosciences, Inc."},{"s":"CTM","n":"Castellum, Inc. Common Stock"},{"s":"CTMX","n":"CytomX Therapeutics, Inc."},{"s":"CTNM","n":"Contineum Therapeutics, Inc."},{"s":"CTNT","n":"Cheetah Net Supply Chain Service Inc."},{"s":"CTO","n":"CTO Realty Growth, Inc. Common Stock"},{"s":"CTOR","n":"Citius Oncology, Inc."},{"s":"CTOS","n":"Custom Truck One Source, Inc. Common Stock"},{"s":"CTRI","n":"Centuri Holdings, Inc. Common Stock"},{"s":"CTRM","n":"Castor Maritime Inc. - Common Shares"},{"s":"CTRN","n":"Citi Trends, Inc."},{"s":"CTS","n":"CTS Corporation Common Stock"},{"s":"CTSH","n":"Cognizant Technology Solutions Corporation"},{"s":"CTSO","n":"Cytosorbents Corporation"},{"s":"CTVA","n":"Corteva, Inc. Common Stock"},{"s":"CTW","n":"CTW"},{"s":"CTXR","n":"Citius Pharmaceuticals, Inc."},{"s":"CUB","n":"Lionheart Holdings"},{"s":"CUBE","n":"CubeSmart Common Shares"},{"s":"CUBI","n":"Customers Bancorp, Inc Common Stock"},{"s":"CUE","n":"Cue Biopharma, Inc."},{"s":"CULP","n":"Culp, Inc. - Common Shares"},{"s":"CUPR","n":"Cuprina Holdings (Cayman) Limited"},{"s":"CURB","n":"Curbline Properties Corp. Common Stock"},{"s":"CURI","n":"CuriosityStream Inc."},{"s":"CURR","n":"Currenc Group Inc."},{"s":"CURV","n":"Torrid Holdings Inc. Common Stock"},{"s":"CURX","n":"Curanex Pharmaceuticals Inc"},{"s":"CUZ","n":"Cousins Properties Incorporated Common Stock"},{"s":"CV","n":"CapsoVision, Inc."},{"s":"CVBF","n":"CVB Financial Corporation"},{"s":"CVCO","n":"Cavco Industries, Inc."},{"s":"CVE","n":"Cenovus Energy Inc Common Stock"},{"s":"CVEO","n":"Civeo Corporation (Canada) Common Shares"},{"s":"CVGI","n":"Commercial Vehicle Group, Inc."},{"s":"CVI","n":"CVR Energy Inc. Common Stock"},{"s":"CVKD","n":"Cadrenal Therapeutics, Inc."},{"s":"CVLG","n":"Covenant Logistics Group, Inc. Class A Common Stock"},{"s":"CVLT","n":"Commvault Systems, Inc."},{"s":"CVM","n":"Cel-Sci Corporation Common Stock"},{"s":"CVNA","n":"Carvana Co. Class A Common Stock"},{"s":"CVR","n":"Chicago Rivet & Machine Co. Common Stock"},{"s":"CVRX","n":"CVRx, Inc."},{"s":"CVS","n":"CVS Health Corporation Common Stock"},{"s":"CVSA","n":"Covista Inc. Common Shares"},{"s":"CVU","n":"CPI Aerostructures, Inc. Common Stock"},{"s":"CVV","n":"CVD Equipment Corporation"},{"s":"CVX","n":"Chevron Corporation Common Stock"},{"s":"CW","n":"Curtiss-Wright Corporation Common Stock"},{"s":"CWBC","n":"Community West Bancshares"},{"s":"CWCO","n":"Consolidated Water Co. Ltd."},{"s":"CWD","n":"CaliberCos Inc."},{"s":"CWEN","n":"Clearway Energy, Inc. Class C Common Stock"},{"s":"CWH","n":"Camping World Holdings, Inc. Class A Common Stock"},{"s":"CWK","n":"Cushman & Wakefield Ltd. Common Shares"},{"s":"CWST","n":"Casella Waste Systems, Inc."},{"s":"CWT","n":"California Water Service Group Common Stock"},{"s":"CXAI","n":"CXApp Inc."},{"s":"CXDO","n":"Crexendo, Inc."},{"s":"CXII","n":"Churchill Capital Corp XII"},{"s":"CXIIU","n":"Churchill Capital Corp XII - Units"},{"s":"CXIIW","n":"Churchill Capital Corp XII - Warrants"},{"s":"CXM","n":"Sprinklr, Inc. Class A Common Stock"},{"s":"CXT","n":"Crane NXT, Co. Common Stock"},{"s":"CXW","n":"CoreCivic, Inc. Common Stock"},{"s":"CYAB","n":"Cyabra, Inc."},{"s":"CYCN","n":"Cyclerion Therapeutics, Inc."},{"s":"CYCU","n":"Cycurion, Inc."},{"s":"CYCUW","n":"Cycurion, Inc. - Warrants"},{"s":"CYD","n":"China Yuchai International Limited Common Stock"},{"s":"CYH","n":"Community Health Systems, Inc. Common Stock"},{"s":"CYN","n":"Cyngn Inc."},{"s":"CYPH","n":"Cypherpunk Technologies Inc."},{"s":"CYRX","n":"CryoPort, Inc."},{"s":"CYTK","n":"Cytokinetics, Incorporated"},{"s":"CZFS","n":"Citizens Financial Services, Inc."},{"s":"CZNC","n":"Citizens & Northern Corp"},{"s":"CZR","n":"Caesars Entertainment, Inc."},{"s":"CZWI","n":"Citizens Community Bancorp, Inc."},{"s":"D","n":"Dominion Energy, Inc. Common Stock"},{"s":"DAC","n":"Danaos Corporation Common Stock"},{"s":"DAIC","n":"CID HoldCo, Inc."},{"s":"DAICW","n":"CID HoldCo, Inc. - Warrants"},{"s":"DAIO","n":"Data I/O Corporation"},{"s":"DAKT","n":"Daktronics, Inc."},{"s":"DAL","n":"Delta Air Lines, Inc. Common Stock"},{"s":"DAN","n":"Dana Incorporated Common Stock"},{"s":"DAO","n":"Youdao, Inc. American Depositary Shares, each representing one Class A Ordinary Share"},{"s":"DAR","n":"Darling Ingredients Inc. Common Stock"},{"s":"DARE","n":"Dare Bioscience, Inc."},{"s":"DASH","n":"DoorDash, Inc."},{"s":"DAVA","n":"Endava plc American Depositary Shares (each representing one Class A Ordinary Share)"},{"s":"DAVE","n":"Dave Inc."},{"s":"DAVEW","n":"Dave Inc. - Warrants"},{"s":"DB","n":"Deutsche Bank AG Common Stock"},{"s":"DBD","n":"Diebold Nixdorf Incorporated Common stock"},{"s":"DBGI","n":"Digital Brands Group, Inc."},{"s":"DBI","n":"Designer Brands Inc. Class A Common Stock"},{"s":"DBRG","n":"DigitalBridge Group, Inc."},{"s":"DBVT","n":"DBV Technologies S.A."},{"s":"DBX","n":"Dropbox, Inc."},{"s":"DC","n":"Dakota Gold Corp. Common Stock"},{"s":"DCBO","n":"Docebo Inc. - Common Shares"},{"s":"DCGO","n":"DocGo Inc."},{"s":"DCH","n":"Dauch Corporation Common Stock"},{"s":"DCI","n":"Donaldson Company, Inc. Common Stock"},{"s":"DCO","n":"Ducommun Incorporated Common Stock"},{"s":"DCOM","n":"Dime Commercial Bancshares, Inc. Common Stock"},{"s":"DCOY","n":"Decoy Therapeutics Inc."},{"s":"DCTH","n":"Delcath Systems, Inc."},{"s":"DCX","n":"Digital Currency X Technology Inc."},{"s":"DD","n":"DuPont de Nemours, Inc. Common Stock"},{"s":"DDC","n":"DDC Enterprise Limited Class A Ordinary Shares"},{"s":"DDD","n":"3D Systems Corporation Common Stock"},{"s":"DDI","n":"DoubleDown Interactive Co., Ltd. - American Depository Shares"},{"s":"DDL","n":"Dingdong (Cayman) Limited American Depositary Shares (each two representing three Ordinary Shares)"},{"s":"DDOG","n":"Datadog, Inc."},{"s":"DDS","n":"Dillard's, Inc. Common Stock"},{"s":"DE","n":"Deere & Company Common Stock"},{"s":"DEA","n":"Easterly Government Properties, Inc. Common Stock"},{"s":"DEC","n":"Diversified Energy Company Common Stock"},{"s":"DECK","n":"Deckers Outdoor Corporation Common Stock"},{"s":"DEFT","n":"Defi Technologies, Inc."},{"s":"DEI","n":"Douglas Emmett, Inc. Common Stock"},{"s":"DELL","n":"Dell Technologies Inc. Class C Common Stock"},{"s":"DEO","n":"Diageo plc Common Stock"},{"s":"DERM","n":"Journey Medical Corporation"},{"s":"DETX","n":"Liberty Defense Holdings, Ltd. - Common Shares"},{"s":"DFDV","n":"DeFi Development Corp."},{"s":"DFH","n":"Dream Finders Homes, Inc. Class A Common Stock"},{"s":"DFIN","n":"Donnelley Financial Solutions, Inc. Common Stock"},{"s":"DFLI","n":"Dragonfly Energy Holdings Corp"},{"s":"DFNS","n":"T3 Defense Inc."},{"s":"DFNSW","n":"T3 Defense Inc. - Warrants"},{"s":"DFSC","n":"DEFSEC Technologies Inc."},{"s":"DFTX","n":"Definium Therapeutics, Inc. - Common Shares"},{"s":"DG","n":"Dollar General Corporation Common Stock"},{"s":"DGICA","n":"Donegal Group, Inc."},{"s":"DGICB","n":"Donegal Group, Inc."},{"s":"DGII","n":"Digi International Inc."},{"s":"DGNX","n":"Diginex Limited"},{"s":"DGX","n":"Quest Diagnostics Incorporated Common Stock"},{"s":"DGXX","n":"Digi Power X Inc. - Common Subordinate Voting Shares"},{"s":"DH","n":"Definitive Healthcare Corp."},{"s":"DHI","n":"D.R. Horton, Inc. Common Stock"},{"s":"DHR","n":"Danaher Corporation Common Stock"},{"s":"DHT","n":"DHT Holdings, Inc."},{"s":"DHX","n":"DHI Group, Inc. Common Stock"},{"s":"DIBS","n":"1stdibs.com, Inc."},{"s":"DIN","n":"Dine Brands Global, Inc. Common Stock"},{"s":"DINO","n":"HF Sinclair Corporation Common Stock"},{"s":"DIOD","n":"Diodes Incorporated"},{"s":"DIS","n":"Walt Disney Company (The) Common Stock"},{"s":"DIT","n":"AMCON Distributing Company Common Stock"},{"s":"DJCO","n":"Daily Journal Corp. (S.C.)"},{"s":"DJT","n":"Trump Media & Technology Group Corp."},{"s":"DJTWW","n":"Trump Media & Technology Group Corp. - Warrants"},{"s":"DK","n":"Delek US Holdings, Inc. Common Stock"},{"s":"DKI","n":"DarkIris Inc."},{"s":"DKL","n":"Delek Logistics Partners, L.P. Common Units representing Limited Partner Interests"},{"s":"DKNG","n":"DraftKings Inc."},{"s":"DKS","n":"Dick's Sporting Goods Inc Common Stock"},{"s":"DLB","n":"Dolby Laboratories Common Stock"},{"s":"DLHC","n":"DLH Holdings Corp."},{"s":"DLO","n":"DLocal Limited"},{"s":"DLPN","n":"Dolphin Entertainment, Inc."},{"s":"DLTH","n":"Duluth Holdings Inc."},{"s":"DLTR","n":"Dollar Tree, Inc."},{"s":"DLX","n":"Deluxe Corporation Common Stock"},{"s":"DLXY","n":"Delixy Holdings Limited"},{"s":"DMAC","n":"DiaMedica Therapeutics Inc."},{"s":"DMC","n":"Del Monte Corporation Ordinary Shares"},{"s":"DMLP","n":"Dorchester Minerals, L.P. - Common Units Representing Limited Partnership Interests"},{"s":"DMRA","n":"Damora Therapeutics, Inc."},{"s":"DMRC","n":"Digimarc Corporation"},{"s":"DNA","n":"Ginkgo Bioworks Holdings, Inc. Class A Common Stock"},{"s":"DNLI","n":"Denali Therapeutics Inc."},{"s":"DNMX","n":"Dynamix Corporation III"},{"s":"DNMXW","n":"Dynamix Corporation III - Warrants"},{"s":"DNN","n":"Denison Mines Corp Ordinary Shares (Canada)"},{"s":"DNOW","n":"DNOW Inc. Common Stock"},{"s":"DNTH","n":"Dianthus Therapeutics, Inc."},{"s":"DNUT","n":"Krispy Kreme, Inc."},{"s":"DOC","n":"Healthpeak Properties, Inc. Common Stock"},{"s":"DOCN","n":"DigitalOcean Holdings, Inc. Common Stock"},{"s":"DOCS","n":"Doximity, Inc. Class A Common Stock"},{"s":"DOCU","n":"DocuSign, Inc."},{"s":"DOGZ","n":"Dogness (International) Corporation"},{"s":"DOLE","n":"Dole plc Ordinary Shares"},{"s":"DOMH","n":"Dominari Holdings Inc."},{"s":"DOMO","n":"Domo, Inc."},{"s":"DOO","n":"BRP Inc. - Common Subordinate Voting Shares"},{"s":"DORM","n":"Dorman Products, Inc."},{"s":"DOUG","n":"Douglas Elliman Inc. Common Stock"},{"s":"DOV","n":"Dover Corporation Common Stock"},{"s":"DOW","n":"Dow Inc. Common Stock"},{"s":"DOX","n":"Amdocs Limited"},{"s":"DOYU","n":"DouYu International Holdings Limited"},{"s":"DPC","n":"DPC Holdings PLC Ordinary Shares"},{"s":"DPRO","n":"Draganfly Inc. - Common Shares"},{"s":"DPU","n":"Top KingWin Ltd"},{"s":"DPZ","n":"Domino's Pizza Inc"},{"s":"DQ","n":"DAQO New Energy Corp. American Depositary Shares, each representing five ordinary shares"},{"s":"DRCT","n":"Direct Digital Holdings, Inc."},{"s":"DRD","n":"DRDGOLD Limited American Depositary Shares"},{"s":"DRH","n":"Diamondrock Hospitality Company"},{"s":"DRI","n":"Darden Restaurants, Inc. Common Stock"},{"s":"DRIO","n":"DarioHealth Corp."},{"s":"DRMA","n":"Dermata Therapeutics, Inc."},{"s":"DRS","n":"Leonardo DRS, Inc."},{"s":"DRTS","n":"Alpha Tau Medical Ltd."},{"s":"DRUG","n":"Bright Minds Biosciences Inc."},{"s":"DRVN","n":"Driven Brands Holdings Inc."},{"s":"DSC","n":"DSC Holdings Ltd."},{"s":"DSGN","n":"Design Therapeutics, Inc."},{"s":"DSGR","n":"Distribution Solutions Group, Inc."},{"s":"DSGX","n":"The Descartes Systems Group Inc."},{"s":"DSP","n":"Viant Technology Inc."},{"s":"DSS","n":"DSS, Inc. Common Stock"},{"s":"DSWL","n":"Deswell Industries, Inc. - Common Shares"},{"s":"DSX","n":"Diana Shipping inc. common stock"},{"s":"DSX-W","n":"Diana Shipping inc. Warrants"},{"s":"DSY","n":"Big Tree Cloud Holdings Limited"},{"s":"DSYWW","n":"Big Tree Cloud Holdings Limited - Warrants"},{"s":"DT","n":"Dynatrace, Inc. Common Stock"},{"s":"DTCX","n":"Datacentrex, Inc."},{"s":"DTE","n":"DTE Energy Company Common Stock"},{"s":"DTI","n":"Drilling Tools International Corporation"},{"s":"DTIL","n":"Precision BioSciences, Inc."},{"s":"DTM","n":"DT Midstream, Inc. Common Stock"},{"s":"DTSS","n":"Datasea Intelligent Technology Ltd."},{"s":"DTST","n":"Data Storage Corporation"},{"s":"DUK","n":"Duke Energy Corporation (Holding Company) Common Stock"},{"s":"DUKB","n":"Duke Energy Corporation 5.625% Junior Subordinated Debentures due 2078"},{"s":"DUKR","n":"DUKE Robotics Corp."},{"s":"DUO","n":"Fangdd Network Group Ltd."},{"s":"DUOL","n":"Duolingo, Inc."},{"s":"DUOT","n":"Duos Technologies Group, Inc."},{"s":"DV","n":"DoubleVerify Holdings, Inc. Common Stock"},{"s":"DVA","n":"DaVita Inc. Common Stock"},{"s":"DVLT","n":"Datavault AI Inc."},{"s":"DVN","n":"Devon Energy Corporation Common Stock"},{"s":"DWSN","n":"Dawson Geophysical Company"},{"s":"DWTX","n":"Dogwood Therapeutics, Inc."},{"s":"DX","n":"Dynex Capital, Inc. Common Stock"},{"s":"DXC","n":"DXC Technology Company Common Stock"},{"s":"DXCM","n":"DexCom, Inc."},{"s":"DXF","n":"Eason Technology Limited American Depositary Shares (each representing sixty-thousand (60,000) Ordinary Shares)"},{"s":"DXLG","n":"Destination XL Group, Inc."},{"s":"DXPE","n":"DXP Enterprises, Inc."},{"s":"DXST","n":"Decent Holding Inc."},{"s":"DXYZ","n":"Destiny Tech100 Inc. Common Stock"},{"s":"DY","n":"Dycom Industries, Inc. Common Stock"},{"s":"DYAI","n":"Dyadic International, Inc."},{"s":"DYN","n":"Dyne Therapeutics, Inc."},{"s":"DYNC","n":"Dynamix Corporation"},{"s":"DYOR","n":"Insight Digital Partners II"},{"s":"DYORU","n":"Insight Digital Partners II - Units"},{"s":"DYORW","n":"Insight Digital Partners II - Warrants"},{"s":"E","n":"ENI S.p.A. Common Stock"},{"s":"EA","n":"Electronic Arts Inc."},{"s":"EAF","n":"GrafTech International Ltd. Common Stock"},{"s":"EARN","n":"Ellington Credit Company Common Shares of Beneficial Interest"},{"s":"EAT","n":"Brinker International, Inc. Common Stock"},{"s":"EBAY","n":"eBay Inc."},{"s":"EBC","n":"Eastern Bankshares, Inc."},{"s":"EBF","n":"Ennis, Inc. Common Stock"},{"s":"EBMT","n":"Eagle Bancorp Montana, Inc."},{"s":"EBON","n":"Ebang International Holdings Inc."},{"s":"EBS","n":"Emergent BioSolutions Inc. Common Stock"},{"s":"EC","n":"Ecopetrol S.A. American Depositary Shares"},{"s":"ECBK","n":"ECB Bancorp, Inc."},{"s":"ECC","n":"Eagle Point Credit Company Common Share of Beneficial Interest"},{"s":"ECG","n":"Everus Construction Group, Inc. Common Stock"},{"s":"ECHO","n":"EchoStar Corporation"},{"s":"ECL","n":"Ecolab Inc. Common Stock"},{"s":"ECO","n":"Okeanis Eco Tankers Corp. Common Stock"},{"s":"ECOR","n":"electroCore, Inc."},{"s":"ECPG","n":"Encore Capital Group Inc"},{"s":"ECVT","n":"Ecovyst Inc. Common Stock"},{"s":"ECX","n":"ECARX Holdings Inc."},{"s":"ECXWW","n":"ECARX Holdings Inc. - Warrants"},{"s":"ED","n":"Consolidated Edison, Inc. Common Stock"},{"s":"EDBL","n":"Edible Garden AG Incorporated"},{"s":"EDHL","n":"Everbright Digital Holding Limited"},{"s":"EDIT","n":"Editas Medicine, Inc."},{"s":"EDN","n":"Empresa Distribuidora Y Comercializadora Norte S.A. (Edenor) American Depositary Shares"},{"s":"EDRY","n":"EuroDry Ltd. - Common Shares"},{"s":"EDSA","n":"Edesa Biotech, Inc. - Common Shares"},{"s":"EDTK","n":"Skillful Craftsman Education Technology Limited - Ordinary Share"},{"s":"EDUC","n":"Educational Development Corporation"},{"s":"EE","n":"Excelerate Energy, Inc. Class A Common Stock"},{"s":"EEFT","n":"Euronet Worldwide, Inc."},{"s":"EEIQ","n":"EpicQuest Education Group International Limited"},{"s":"EFC","n":"Ellington Financial Inc. Common Stock"},{"s":"EFOI","n":"Energy Focus, Inc."},{"s":"EFOR","n":"Everforth, Inc. Common Stock"},{"s":"EFSC","n":"Enterprise Financial Services Corporation"},{"s":"EFSI","n":"Eagle Financial Services Inc"},{"s":"EFTY","n":"Etoiles Capital Group Co., Ltd."},{"s":"EFX","n":"Equifax, Inc. Common Stock"},{"s":"EFXT","n":"Enerflex Ltd Common Shares"},{"s":"EG","n":"Everest Group, Ltd. Common Stock"},{"s":"EGAN","n":"eGain Corporation"},{"s":"EGBN","n":"Eagle Bancorp, Inc."},{"s":"EGG","n":"Enigmatig Limited Class A Ordinary Shares"},{"s":"EGHT","n":"8x8 Inc"},{"s":"EGO","n":"Eldorado Gold Corporation Ordinary Shares"},{"s":"EGP","n":"EastGroup Properties, Inc. Common Stock"},{"s":"EGY","n":"VAALCO Energy, Inc. Common Stock"},{"s":"EH","n":"EHang Holdings Limited"},{"s":"EHC","n":"Encompass Health Corporation Common Stock"},{"s":"EHGO","n":"Eshallgo Inc."},{"s":"EHLD","n":"Euroholdings Ltd."},{"s":"EHTH","n":"eHealth, Inc."},{"s":"EIC","n":"Eagle Point Income Company Inc. Common Stock"},{"s":"EIG","n":"Employers Holdings Inc Common Stock"},{"s":"EIKN","n":"Eikon Therapeutics, Inc."},{"s":"EIX","n":"Edison International Common Stock"},{"s":"EJH","n":"E-Home Household Service Holdings Limited"},{"s":"EL","n":"Estee Lauder Companies, Inc. (The) Common Stock"},{"s":"ELA","n":"Envela Corporation Common Stock"},{"s":"ELAB","n":"PMGC Holdings Inc."},{"s":"ELAN","n":"Elanco Animal Health Incorporated Common Stock"},{"s":"ELBM","n":"Electra Battery Materials Corporation"},{"s":"ELDN","n":"Eledon Pharmaceuticals, Inc."},{"s":"ELE","n":"Elemental Royalty Corporation"},{"s":"ELF","n":"e.l.f. Beauty, Inc. Common Stock"},{"s":"ELLO","n":"Ellomay Capital Ltd Ordinary Shares (Israel)"},{"s":"ELMD","n":"Electromed, Inc. Common Stock"},{"s":"ELME","n":"Elme Communities Common Stock"},{"s":"ELMT","n":"The Elmet Group Co."},{"s":"ELOG","n":"Eastern International Ltd."},{"s":"ELOX","n":"Eloxx Pharmaceuticals, Inc."},{"s":"ELPC","n":"Companhia Paranaense de Energia (COPEL) American Depositary Shares (each representing four (4) Common Shares)"},{"s":"ELPW","n":"Elong Power Holding Limited"},{"s":"ELS","n":"Equity Lifestyle Properties, Inc. Common Stock"},{"s":"ELSE","n":"Electro-Sensors, Inc."},{"s":"ELTK","n":"Eltek Ltd."},{"s":"ELTX","n":"Elicio Therapeutics, Inc."},{"s":"ELUT","n":"Elutia, Inc."},{"s":"ELV","n":"Elevance Health, Inc. Common Stock"},{"s":"ELVA","n":"Electrovaya Inc. - Common Shares"},{"s":"ELVN","n":"Enliven Therapeutics, Inc."},{"s":"ELVR","n":"Elevra Lithium Limited - American Depository Shares"},{"s":"ELWT","n":"Elauwit Connection, Inc."},{"s":"EMA","n":"Emera Incorporated Common Shares"},{"s":"EMAT","n":"Evolution Metals & Technologies Corp."},{"s":"EMBC","n":"Embecta Corp."},{"s":"EMBJ","n":"Embraer S.A. Common Stock"},{"s":"EME","n":"EMCOR Group, Inc. Common Stock"},{"s":"EML","n":"Eastern Company (The)"},{"s":"EMN","n":"Eastman Chemical Company Common Stock"},{"s":"EMPD","n":"Empery Digital Inc."},{"s":"EMPG","n":"Empro Group Inc."},{"s":"EMR","n":"Emerson Electric Company Common Stock"},{"s":"ENB","n":"Enbridge Inc Common Stock"},{"s":"ENGN","n":"enGene Therapeutics Inc."},{"s":"ENGNW","n":"enGene Therapeutics Inc. - Warrants"},{"s":"ENGS","n":"Energys Group Limited"},{"s":"ENHA","n":"Enhanced Group Inc. Class A Common Stock"},{"s":"ENIC","n":"Enel Chile S.A. American Depositary Shares (Each representing 50 shares of Common Stock)"},{"s":"ENLT","n":"Enlight Renewable Energy Ltd."},{"s":"ENLV","n":"Enlivex Ltd."},{"s":"ENOV","n":"Enovis Corporation Common Stock"},{"s":"ENPH","n":"Enphase Energy, Inc."},{"s":"ENR","n":"Energizer Holdings, Inc. Common Stock"},{"s":"ENRD","n":"Einride AB"},{"s":"ENRDW","n":"Einride AB - Warrants"},{"s":"ENS","n":"EnerSys Common Stock"},{"s":"ENSC","n":"Ensysce Biosciences, Inc."},{"s":"ENSG","n":"The Ensign Group, Inc."},{"s":"ENTA","n":"Enanta Pharmaceuticals, Inc."},{"s":"ENTG","n":"Entegris, Inc."},{"s":"ENTX","n":"Entera Bio Ltd."},{"s":"ENVA","n":"Enova International, Inc. Common Stock"},{"s":"ENVB","n":"Enveric Biosciences, Inc."},{"s":"ENVX","n":"Enovix Corporation"},{"s":"EOG","n":"EOG Resources, Inc. Common Stock"},{"s":"EOLS","n":"Evolus, Inc."},{"s":"EONR","n":"EON Resources Inc. Class A Common Stock"},{"s":"EOSE","n":"Eos Energy Enterprises, Inc."},{"s":"EP","n":"Empire Petroleum Corporation Common Stock"},{"s":"EPAC","n":"Enerpac Tool Group Corp. Common Stock"},{"s":"EPAM","n":"EPAM Systems, Inc. Common Stock"},{"s":"EPC","n":"Edgewell Personal Care Company Common Stock"},{"s":"EPD","n":"Enterprise Products Partners L.P. Common Stock"},{"s":"EPM","n":"Evolution Petroleum Corporation, Inc. Common Stock"},{"s":"EPOW","n":"E-Power Inc."},{"s":"EPR","n":"EPR Properties Common Stock"},{"s":"EPRX","n":"Eupraxia Pharmaceuticals Inc."},{"s":"EPSM","n":"Epsium Enterprise Limited"},{"s":"EPSN","n":"Epsilon Energy Ltd. - Common Shares"},{"s":"EQ","n":"Equillium, Inc."},{"s":"EQBK","n":"Equity Bancshares, Inc. Class A Common Stock"},{"s":"EQH","n":"Equitable Holdings, Inc. Common Stock"},{"s":"EQIX","n":"Equinix, Inc."},{"s":"EQNR","n":"Equinor ASA"},{"s":"EQPT","n":"EquipmentShare.com Inc"},{"s":"EQR","n":"Equity Residential Common Shares of Beneficial Interest"},{"s":"EQS","n":"Equus Total Return, Inc. Common Stock"},{"s":"EQT","n":"EQT Corporation Common Stock"},{"s":"EQX","n":"Equinox Gold Corp. Common Shares"},{"s":"ERAS","n":"Erasca, Inc."},{"s":"ERIC","n":"Ericsson"},{"s":"ERIE","n":"Erie Indemnity Company"},{"s":"ERII","n":"Energy Recovery, Inc."},{"s":"ERNA","n":"Ernexa Therapeutics Inc."},{"s":"ERNAW","n":"Ernexa Therapeutics Inc. - Warrants"},{"s":"ERO","n":"Ero Copper Corp. Common Shares"},{"s":"EROC","n":"ERock, Inc. Class A Common Stock"},{"s":"EROK","n":"EagleRock Land, LLC Class A shares representing limited liability company interests"},{"s":"ES","n":"Eversource Energy (D/B/A) Common Stock"},{"s":"ESAB","n":"ESAB Corporation Common Stock"},{"s":"ESCA","n":"Escalade, Incorporated"},{"s":"ESE","n":"ESCO Technologies Inc. Common Stock"},{"s":"ESEA","n":"Euroseas Ltd."},{"s":"ESI","n":"Element Solutions Inc. Common Stock"},{"s":"ESLA","n":"Estrella Immunopharma, Inc."},{"s":"ESLT","n":"Elbit Systems Ltd."},{"s":"ESNT","n":"Essent Group Ltd. Common Shares"},{"s":"ESOA","n":"Energy Services of America Corporation"},{"s":"ESP","n":"Espey Mfg. & Electronics Corp. Common Stock"},{"s":"ESQ","n":"Esquire Financial Holdings, Inc."},{"s":"ESTA","n":"Establishment Labs Holdings Inc. - Common Shares"},{"s":"ESTC","n":"Elastic N.V. Ordinary Shares"},{"s":"ETD","n":"Ethan Allen Interiors Inc. Common Stock"},{"s":"ETN","n":"Eaton Corporation, PLC Ordinary Shares"},{"s":"ETO","n":"Eaton Vance Tax-Advantage Global Dividend Opp Common Stock"},{"s":"ETON","n":"Eton Pharmaceuticals, Inc."},{"s":"ETOR","n":"eToro Group Ltd."},{"s":"ETR","n":"Entergy Corporation Common Stock"},{"s":"ETS","n":"Elite Express Holding Inc."},{"s":"ETSS","n":"Energy Transition Special Opportunities Class A Ordinary Shares"},{"s":"ETSY","n":"Etsy, Inc. Common Stock"},{"s":"EU","n":"enCore Energy Corp."},{"s":"EUDA","n":"Euda Health Holdings Limited"},{"s":"EVAX","n":"Evaxion A/S - American Depositary Share"},{"s":"EVC","n":"Entravision Communications Corporation Common Stock"},{"s":"EVCM","n":"EverCommerce Inc."},{"s":"EVER","n":"EverQuote, Inc."},{"s":"EVEX","n":"Eve Holding, Inc. Common Stock"},{"s":"EVGN","n":"Evogene Ltd."},{"s":"EVGO","n":"EVgo Inc."},{"s":"EVH","n":"Evolent Health, Inc Class A Common Stock"},{"s":"EVI","n":"EVI Industries, Inc. Common Stock"},{"s":"EVLV","n":"Evolv Technologies Holdings, Inc."},{"s":"EVMN","n":"Evommune, Inc. Common Stock"},{"s":"EVO","n":"Evotec SE"},{"s":"EVR","n":"Evercore Inc. Class A Common Stock"},{"s":"EVRG","n":"Evergy, Inc."},{"s":"EVTC","n":"Evertec, Inc. Common Stock"},{"s":"EVTL","n":"Vertical Aerospace Ltd. Ordinary Shares"},{"s":"EW","n":"Edwards Lifesciences Corporation Common Stock"},{"s":"EWBC","n":"East West Bancorp, Inc."},{"s":"EWTX","n":"Edgewise Therapeutics, Inc."},{"s":"EXC","n":"Exelon Corporation"},{"s":"EXE","n":"Expand Energy Corporation"},{"s":"EXEL","n":"Exelixis, Inc."},{"s":"EXFY","n":"Expensify, Inc."},{"s":"EXK","n":"Endeavour Silver Corporation Ordinary Shares (Canada)"},{"s":"EXLS","n":"ExlService Holdings, Inc."},{"s":"EXOD","n":"Exodus Movement, Inc. Class A Common Stock"},{"s":"EXOZ","n":"eXoZymes Inc."},{"s":"EXP","n":"Eagle Materials Inc Common Stock"},{"s":"EXPD","n":"Expeditors International of Washington, Inc. Common Stock"},{"s":"EXPE","n":"Expedia Group, Inc."},{"s":"EXPO","n":"Exponent, Inc."},{"s":"EXR","n":"Extra Space Storage Inc Common Stock"},{"s":"EXTR","n":"Extreme Networks, Inc."},{"s":"EXYN","n":"Exyn Technologies, Inc."},{"s":"EYE","n":"National Vision Holdings, Inc."},{"s":"EYPT","n":"EyePoint, Inc."},{"s":"EZGO","n":"EZGO Technologies Ltd."},{"s":"EZPW","n":"EZCORP, Inc."},{"s":"EZRA","n":"Reliance Global Group, Inc."},{"s":"F","n":"Ford Motor Company Common Stock"},{"s":"FA","n":"First Advantage Corporation"},{"s":"FABC","n":"Fabric.AI, Inc."},{"s":"FAC","n":"Factorial Energy Inc."},{"s":"FAF","n":"First American Corporation (New) Common Stock"},{"s":"FAMI","n":"Farmmi, Inc."},{"s":"FANG","n":"Diamondback Energy, Inc."},{"s":"FAST","n":"Fastenal Company"},{"s":"FATE","n":"Fate Therapeutics, Inc."},{"s":"FATN","n":"FatPipe, Inc."},{"s":"FBGL","n":"FBS Global Limited"},{"s":"FBIN","n":"Fortune Brands Innovations, Inc. Common Stock"},{"s":"FBIO","n":"Fortress Biotech, Inc."},{"s":"FBIZ","n":"First Business Financial Services, Inc."},{"s":"FBK","n":"FB Financial Corporation Common Stock"},{"s":"FBLA","n":"FB Bancorp, Inc."},{"s":"FBLG","n":"FibroBiologics, Inc."},{"s":"FBNC","n":"First Bancorp"},{"s":"FBP","n":"First BanCorp. New Common Stock"},{"s":"FBRX","n":"Forte Biosciences, Inc."},{"s":"FBYD","n":"Falcon's Beyond Global, Inc."},{"s":"FBYDW","n":"Falcon's Beyond Global, Inc. - Warrants"},{"s":"FC","n":"Franklin Covey Company Common Stock"},{"s":"FCAP","n":"First Capital, Inc."},{"s":"FCBC","n":"First Community Bankshares, Inc."},{"s":"FCBM","n":"First Carolina Financial Services, Inc. Common Stock"},{"s":"FCCO","n":"First Community Corporation"},{"s":"FCEL","n":"FuelCell Energy, Inc."},{"s":"FCF","n":"First Commonwealth Financial Corporation Common Stock"},{"s":"FCFS","n":"FirstCash Holdings, Inc."},{"s":"FCHL","n":"Fitness Champs Holdings Limited"},{"s":"FCN","n":"FTI Consulting, Inc. Common Stock"},{"s":"FCNCA","n":"First Citizens BancShares, Inc."},{"s":"FCUV","n":"Focus Universal Inc."},{"s":"FCX","n":"Freeport-McMoRan, Inc. Common Stock"},{"s":"FDBC","n":"Fidelity D & D Bancorp, Inc."},{"s":"FDMT","n":"4D Molecular Therapeutics, Inc."},{"s":"FDS","n":"FactSet Research Systems Inc. Common Stock"},{"s":"FDSB","n":"Fifth District Bancorp, Inc."},{"s":"FDX","n":"FedEx Corporation Common Stock"},{"s":"FDXF","n":"FedEx Freight Holding Company, Inc. Common Stock"},{"s":"FE","n":"FirstEnergy Corp. Common Stock"},{"s":"FEAM","n":"5E Advanced Materials, Inc."},{"s":"FEBO","n":"Fenbo Holdings Limited"},{"s":"FEDU","n":"Four Seasons Education (Cayman) Inc. American Depositary Shares, each ADS representing 10 ordinary shares"},{"s":"FEED","n":"ENvue Medical, Inc."},{"s":"FEIM","n":"Frequency Electronics, Inc."},{"s":"FELE","n":"Franklin Electric Co., Inc."},{"s":"FEMY","n":"Femasys Inc."},{"s":"FENC","n":"Fennec Pharmaceuticals Inc."},{"s":"FENG","n":"Phoenix New Media Limited American Depositary Shares, each representing 48 Class A ordinary shares."},{"s":"FER","n":"Ferrovial N.V."},{"s":"FERG","n":"Ferguson Enterprises Inc. Common Stock"},{"s":"FET","n":"Forum Energy Technologies, Inc. Common Stock"},{"s":"FF","n":"FutureFuel Corp. Common shares"},{"s":"FFAI","n":"Faraday Future Intelligent Electric Inc."},{"s":"FFBC","n":"First Financial Bancorp."},{"s":"FFIN","n":"First Financial Bankshares, Inc."},{"s":"FFIV","n":"F5, Inc."},{"s":"FG","n":"F&G Annuities & Life, Inc. Common Stock"},{"s":"FGBI","n":"First Guaranty Bancshares, Inc."},{"s":"FGI","n":"FGI Industries Ltd."},{"s":"FGL","n":"Founder Group Limited"},{"s":"FGMC","n":"FG Merger II Corp."},{"s":"FGNX","n":"FG Nexus Inc."},{"s":"FHB","n":"First Hawaiian, Inc."},{"s":"FHI","n":"Federated Hermes, Inc. Common Stock"},{"s":"FHN","n":"First Horizon Corporation Common Stock"},{"s":"FHTX","n":"Foghorn Therapeutics Inc."},{"s":"FIBK","n":"First Interstate BancSystem, Inc."},{"s":"FICO","n":"Fair Isaac Corporation Common Stock"},{"s":"FIEE","n":"FiEE, Inc"},{"s":"FIG","n":"Figma, Inc. Class A Common Stock"},{"s":"FIGR","n":"Figure Technology Solutions, Inc."},{"s":"FIGS","n":"FIGS, Inc. Class A Common Stock"},{"s":"FINV","n":"FinVolution Group American Depositary Shares"},{"s":"FINW","n":"FinWise Bancorp"},{"s":"FIP","n":"FTAI Infrastructure Inc."},{"s":"FIRY","n":"Firy Inc. Class A Common Stock"},{"s":"FIS","n":"Fidelity National Information Services, Inc. Common Stock"},{"s":"FISI","n":"Financial Institutions, Inc."},{"s":"FISN","n":"Deep Fission, Inc."},{"s":"FISV","n":"Fiserv, Inc."},{"s":"FITB","n":"Fifth Third Bancorp Common Stock"},{"s":"FIVE","n":"Five Below, Inc."},{"s":"FIVN","n":"Five9, Inc."},{"s":"FIX","n":"Comfort Systems USA, Inc. Common Stock"},{"s":"FIZZ","n":"National Beverage Corp."},{"s":"FJET","n":"Starfighters Space, Inc. Common Stock"},{"s":"FKWL","n":"Franklin Wireless Corp."},{"s":"FLD","n":"Fold Holdings, Inc."},{"s":"FLEX","n":"Flex Ltd."},{"s":"FLG","n":"Flagstar Bank, N.A. Common Stock"},{"s":"FLGT","n":"Fulgent Genetics, Inc."},{"s":"FLL","n":"Full House Resorts, Inc."},{"s":"FLNA","n":"Filana Therapeutics, Inc."},{"s":"FLNC","n":"Fluence Energy, Inc."},{"s":"FLNG","n":"FLEX LNG Ltd. Ordinary Shares"},{"s":"FLNT","n":"Fluent, Inc."},{"s":"FLO","n":"Flowers Foods, Inc. Common Stock"},{"s":"FLOC","n":"Flowco Holdings Inc. Class A Common Stock"},{"s":"FLR","n":"Fluor Corporation Common Stock"},{"s":"FLS","n":"Flowserve Corporation Common Stock"},{"s":"FLUT","n":"Flutter Entertainment plc Ordinary Shares"},{"s":"FLUX","n":"Flux Power Holdings, Inc."},{"s":"FLWS","n":"1-800-FLOWERS.COM, Inc."},{"s":"FLX","n":"BingEx Limited"},{"s":"FLXS","n":"Flexsteel Industries, Inc."},{"s":"FLY","n":"Firefly Aerospace Inc."},{"s":"FLYE","n":"Fly-E Group, Inc."},{"s":"FLYW","n":"Flywire Corporation - Voting Common Stock"},{"s":"FLYX","n":"flyExclusive, Inc. Class A Common Stock"},{"s":"FLZH","n":"Flash Sports & Media Holdings, Inc."},{"s":"FMAO","n":"Farmers & Merchants Bancorp, Inc."},{"s":"FMBH","n":"First Mid Bancshares, Inc."},{"s":"FMC","n":"FMC Corporation Common Stock"},{"s":"FMFC","n":"Kandal M Venture Limited"},{"s":"FMNB","n":"Farmers National Banc Corp."},{"s":"FMS","n":"Fresenius Medical Care AG American Depositary Shares (Each representing 1/2 of an Ordinary Share)"},{"s":"FMST","n":"Foremost Clean Energy Ltd. - Common Shares"},{"s":"FMX","n":"Fomento Economico Mexicano S.A.B. de C.V. Common Stock"},{"s":"FN","n":"Fabrinet Ordinary Shares"},{"s":"FNB","n":"F.N.B. Corporation Common Stock"},{"s":"FND","n":"Floor & Decor Holdings, Inc. Common Stock"},{"s":"FNF","n":"Fidelity National Financial, Inc. Common Stock"},{"s":"FNGR","n":"FingerMotion, Inc."},{"s":"FNKO","n":"Funko, Inc."},{"s":"FNLC","n":"First Bancorp, Inc (ME)"},{"s":"FNRN","n":"First Northern Community Bancorp"},{"s":"FNUC","n":"Frontier Nuclear and Minerals Inc. - Common Shares"},{"s":"FNV","n":"Franco-Nevada Corporation"},{"s":"FNWB","n":"First Northwest Bancorp"},{"s":"FNWD","n":"Finward Bancorp"},{"s":"FOA","n":"Finance of America Companies Inc. Class A Common Stock"},{"s":"FOCL","n":"EDAP TMS S.A."},{"s":"FOFO","n":"Hang Feng Technology Innovation Co., Ltd."},{"s":"FOR","n":"Forestar Group Inc Common Stock"},{"s":"FORM","n":"FormFactor, Inc."},{"s":"FORR","n":"Forrester Research, Inc."},{"s":"FORTY","n":"Formula Systems (1985) Ltd."},{"s":"FOSL","n":"Fossil Group, Inc."},{"s":"FOUR","n":"Shift4 Payments, Inc. Class A Common Stock"},{"s":"FOX","n":"Fox Corporation"},{"s":"FOXA","n":"Fox Corporation"},{"s":"FOXF","n":"Fox Factory Holding Corp."},{"s":"FOXX","n":"Foxx Development Holdings Inc."},{"s":"FPH","n":"Five Point Holdings, LLC Class A Common Shares"},{"s":"FPI","n":"Farmland Partners Inc. Common Stock"},{"s":"FPS","n":"Forgent Power Solutions, Inc. Class A Common Stock"},{"s":"FRAF","n":"Franklin Financial Services Corporation"},{"s":"FRBA","n":"First Bank"},{"s":"FRBT","n":"Forbright, Inc."},{"s":"FRD","n":"Friedman Industries Inc."},{"s":"FRGT","n":"Freight Technologies, Inc."},{"s":"FRHC","n":"Freedom Holding Corp."},{"s":"FRME","n":"First Merchants Corporation"},{"s":"FRMI","n":"Fermi Inc."},{"s":"FRMM","n":"Forum Markets, Incorporated"},{"s":"FRO","n":"Frontline Plc Ordinary Shares"},{"s":"FROG","n":"JFrog Ltd."},{"s":"FRPH","n":"FRP Holdings, Inc."},{"s":"FRPT","n":"Freshpet, Inc."},{"s":"FRSH","n":"Freshworks Inc."},{"s":"FRST","n":"Primis Financial Corp."},{"s":"FRSX","n":"Foresight Autonomous Holdings Ltd."},{"s":"FRTT","n":"Fort Technology Inc. - Common Shares"},{"s":"FRVO","n":"Fervo Energy Company"},{"s":"FSBC","n":"Five Star Bancorp"},{"s":"FSBW","n":"FS Bancorp, Inc."},{"s":"FSCO","n":"FS Credit Opportunities Corp. Common Stock"},{"s":"FSEA","n":"First Seacoast Bancorp, Inc."},{"s":"FSI","n":"Flexible Solutions International Inc. Common Stock (CDA)"},{"s":"FSK","n":"FS KKR Capital Corp. Common Stock"},{"s":"FSLR","n":"First Solar, Inc."},{"s":"FSLY","n":"Fastly, Inc."},{"s":"FSM","n":"Fortuna Mining Corp. Common Shares"},{"s":"FSP","n":"Franklin Street Properties Corp. Common Stock"},{"s":"FSS","n":"Federal Signal Corporation Common Stock"},{"s":"FSTR","n":"L.B. Foster Company"},{"s":"FSUN","n":"FirstSun Capital Bancorp"},{"s":"FSV","n":"FirstService Corporation - Common Shares"},{"s":"FTAI","n":"FTAI Aviation Ltd."},{"s":"FTCI","n":"FTC Solar, Inc."},{"s":"FTDR","n":"Frontdoor, Inc."},{"s":"FTEK","n":"Fuel Tech, Inc."},{"s":"FTFT","n":"Future FinTech Group Inc."},{"s":"FTH","n":"Faeth Therapeutics, Inc."},{"s":"FTHM","n":"Fathom Holdings Inc."},{"s":"FTI","n":"TechnipFMC plc Ordinary Share"},{"s":"FTK","n":"Flotek Industries, Inc. Common Stock"},{"s":"FTLF","n":"FitLife Brands, Inc."},{"s":"FTNT","n":"Fortinet, Inc."},{"s":"FTRE","n":"Fortrea Holdings Inc."},{"s":"FTRK","n":"FAST TRACK GROUP"},{"s":"FTS","n":"Fortis Inc. Common Shares"},{"s":"FTV","n":"Fortive Corporation Common Stock"},{"s":"FTW","n":"Presidio Production Company Class A Common Stock"},{"s":"FUBO","n":"FuboTV Inc. Class A Common Stock"},{"s":"FUFU","n":"BitFuFu Inc."},{"s":"FUL","n":"H. B. Fuller Company Common Stock"},{"s":"FULC","n":"Fulcrum Therapeutics, Inc."},{"s":"FULT","n":"Fulton Financial Corporation"},{"s":"FUN","n":"Six Flags Entertainment Corporation Common Stock New"},{"s":"FUNC","n":"First United Corporation"},{"s":"FURY","n":"Fury Gold Mines Limited Common Shares"},{"s":"FUSB","n":"First US Bancshares, Inc."},{"s":"FUSE","n":"Fusemachines Inc."},{"s":"FUSEW","n":"Fusemachines Inc. - Warrants"},{"s":"FUTU","n":"Futu Holdings Limited"},{"s":"FVCB","n":"FVCBankcorp, Inc."},{"s":"FVRR","n":"Fiverr International Ltd. Ordinary Shares, no par value"},{"s":"FWDI","n":"Forward Industries, Inc."},{"s":"FWRD","n":"Forward Air Corporation"},{"s":"FWRG","n":"First Watch Restaurant Group, Inc."},{"s":"FXHO","n":"UTime Limited"},{"s":"FXNC","n":"First National Corporation"},{"s":"G","n":"Genpact Limited Common Stock"},{"s":"GABC","n":"German American Bancorp, Inc."},{"s":"GAIA","n":"Gaia, Inc."},{"s":"GAIN","n":"Gladstone Investment Corporation - Business Development Company"},{"s":"GALT","n":"Galectin Therapeutics Inc."},{"s":"GAM","n":"General American Investors, Inc. Common Stock"},{"s":"GAMB","n":"Gambling.com Group Limited"},{"s":"GAME","n":"GameSquare Holdings, Inc."},{"s":"GANX","n":"Gain Therapeutics, Inc."},{"s":"GAP","n":"Gap, Inc. (The) Common Stock"},{"s":"GASS","n":"StealthGas, Inc."},{"s":"GATX","n":"GATX Corporation Common Stock"},{"s":"GAU","n":"Galiano Gold Inc."},{"s":"GAUZ","n":"Gauzy Ltd."},{"s":"GBCI","n":"Glacier Bancorp, Inc. Common Stock"},{"s":"GBFH","n":"GBank Financial Holdings Inc."},{"s":"GBLI","n":"Global Indemnity Group, LLC"},{"s":"GBR","n":"New Concept Energy, Inc Common Stock"},{"s":"GBTG","n":"Global Business Travel Group, Inc. Class A Common Stock"},{"s":"GBX","n":"Greenbrier Companies, Inc. (The) Common Stock"},{"s":"GCBC","n":"Greene County Bancorp, Inc."},{"s":"GCDT","n":"Green Circle Decarbonize Technology Limited Ordinary Shares"},{"s":"GCGR","n":"General Catalyst Global Resilience Merger Corp."},{"s":"GCGRU","n":"General Catalyst Global Resilience Merger Corp. - Units"},{"s":"GCGRW","n":"General Catalyst Global Resilience Merger Corp. - Warrants"},{"s":"GCL","n":"GCL Global Holdings Ltd"},{"s":"GCLWW","n":"GCL Global Holdings Ltd - Warrants"},{"s":"GCMG","n":"GCM Grosvenor Inc."},{"s":"GCO","n":"Genesco Inc. Common Stock"},{"s":"GCT","n":"GigaCloud Technology Inc"},{"s":"GCTK","n":"GlucoTrack, Inc."},{"s":"GCTS","n":"GCT Semiconductor Holding, Inc. Common Stock"},{"s":"GD","n":"General Dynamics Corporation Common Stock"},{"s":"GDC","n":"GD Culture Group Limited"},{"s":"GDDY","n":"GoDaddy Inc. Class A Common Stock"},{"s":"GDEV","n":"GDEV Inc."},{"s":"GDHG","n":"Golden Heaven Group Holdings Ltd."},{"s":"GDOT","n":"Green Dot Corporation Class A Common Stock, $0.001 par value"},{"s":"GDRX","n":"GoodRx Holdings, Inc."},{"s":"GDS","n":"GDS Holdings Limited"},{"s":"GDTC","n":"CytoMed Therapeutics Limited"},{"s":"GDYN","n":"Grid Dynamics Holdings, Inc."},{"s":"GE","n":"GE Aerospace Common Stock"},{"s":"GEF","n":"Greif Inc. Class A Common Stock"},{"s":"GEF-B","n":"Greif, Inc. Corporation Class B Common Stock"},{"s":"GEG","n":"Great Elm Group, Inc."},{"s":"GEHC","n":"GE HealthCare Technologies Inc."},{"s":"GEL","n":"Genesis Energy, L.P. Common Units"},{"s":"GELS","n":"Gelteq Limited"},{"s":"GEMI","n":"Gemini Space Station, Inc."},{"s":"GEN","n":"Gen Digital Inc."},{"s":"GENB","n":"Generate Biomedicines, Inc."},{"s":"GENC","n":"Gencor Industries, Inc. Common Stock"},{"s":"GENI","n":"Genius Sports Limited Ordinary Shares"},{"s":"GENK","n":"GEN Restaurant Group, Inc."},{"s":"GEOS","n":"Geospace Technologies Corporation"},{"s":"GERN","n":"Geron Corporation"},{"s":"GETY","n":"Getty Images Holdings, Inc. Class A Common Stock"},{"s":"GEV","n":"GE Vernova Inc. Common Stock"},{"s":"GEVO","n":"Gevo, Inc."},{"s":"GFAI","n":"Guardforce AI Co., Limited"},{"s":"GFF","n":"Griffon Corporation Common Stock"},{"s":"GFI","n":"Gold Fields Limited American Depositary Shares"},{"s":"GFL","n":"GFL Environmental Inc. Subordinate voting shares, no par value"},{"s":"GFR","n":"Greenfire Resources Ltd. Common Shares"},{"s":"GFS","n":"GlobalFoundries Inc. - Ordinary Share"},{"s":"GFUZ","n":"General Fusion Group Ltd. - Common Shares"},{"s":"GGAL","n":"Grupo Financiero Galicia S.A."},{"s":"GGB","n":"Gerdau S.A. Common Stock"},{"s":"GGG","n":"Graco Inc. Common Stock"},{"s":"GGR","n":"Gogoro Inc."},{"s":"GGRP","n":"The Glimpse Group, Inc."},{"s":"GH","n":"Guardant Health, Inc."},{"s":"GHC","n":"Graham Holdings Company Common Stock"},{"s":"GHG","n":"GreenTree Hospitality Group Ltd. American depositary shares, each representing one Class A ordinary share"},{"s":"GHM","n":"Graham Corporation Common Stock"},{"s":"GHRS","n":"GH Research PLC"},{"s":"GHXIU","n":"Gores Holdings XI, Inc. - Units"},{"s":"GIB","n":"CGI Inc. Common Stock"},{"s":"GIBO","n":"GIBO Holdings Limited"},{"s":"GIBOW","n":"GIBO Holdings Limited - Warrants"},{"s":"GIC","n":"Global Industrial Company Common Stock"},{"s":"GIFT","n":"Giftify, Inc."},{"s":"GIGM","n":"GigaMedia Limited"},{"s":"GIII","n":"G-III Apparel Group, LTD."},{"s":"GIL","n":"Gildan Activewear, Inc. Class A Sub. Vot. Common Stock"},{"s":"GILD","n":"Gilead Sciences, Inc."},{"s":"GILT","n":"Gilat Satellite Networks Ltd."},{"s":"GIPR","n":"Generation Income Properties Inc."},{"s":"GIS","n":"General Mills, Inc. Common Stock"},{"s":"GITS","n":"Global Interactive Technologies, Inc. Common Stock"},{"s":"GIW","n":"GigCapital8 Corp."},{"s":"GIWWU","n":"GigCapital8 Corp. - Units"},{"s":"GIX","n":"GigCapital9 Corp."},{"s":"GIXXU","n":"GigCapital9 Corp. - Units"},{"s":"GJH","n":"Synthetic Fixed-Income Securities Inc 6.375% (STRATS) Cl A-1"},{"s":"GKOS","n":"Glaukos Corporation Common Stock"},{"s":"GL","n":"Globe Life Inc. Common Stock"},{"s":"GLAS","n":"Glass House Brands Inc. Subordinate Voting Shares"},{"s":"GLBE","n":"Global-E Online Ltd."},{"s":"GLBS","n":"Globus Maritime Limited"},{"s":"GLDG","n":"GoldMining Inc. Common Shares"},{"s":"GLE","n":"Global Engine Group Holding Limited"},{"s":"GLMD","n":"Galmed Pharmaceuticals Ltd."},{"s":"GLND","n":"Greenland Energy Company"},{"s":"GLNG","n":"Golar LNG Limited - Common Shares"},{"s":"GLOB","n":"Globant S.A. Common Shares"},{"s":"GLOO","n":"Gloo Holdings, Inc."},{"s":"GLPI","n":"Gaming and Leisure Properties, Inc."},{"s":"GLRE","n":"Greenlight Reinsurance, Ltd."},{"s":"GLSI","n":"Greenwich LifeSciences, Inc."},{"s":"GLU","n":"Gabelli Global Utility Common Shares of Beneficial Ownership"},{"s":"GLUE","n":"Monte Rosa Therapeutics, Inc."},{"s":"GLW","n":"Corning Incorporated Common Stock"},{"s":"GLXG","n":"Galaxy Payroll Group Limited"},{"s":"GLXY","n":"Galaxy Digital Inc."},{"s":"GM","n":"General Motors Company Common Stock"},{"s":"GMAB","n":"Genmab A/S"},{"s":"GME","n":"GameStop Corporation Common Stock"},{"s":"GME-W","n":"GameStop Corporation Warrants to Purchase Common Stock"},{"s":"GMED","n":"Globus Medical, Inc. Class A Common Stock"},{"s":"GMEX","n":"GMEX ROBOTICS CORPORATION"},{"s":"GMHS","n":"Gamehaus Holdings Inc."},{"s":"GMM","n":"Global Mofy AI Limited"},{"s":"GMRS","n":"GMR Solutions Inc. Class A Common Stock"},{"s":"GMTL","n":"Guardian Metal Resources PLC ADS"},{"s":"GNE","n":"Genie Energy Ltd. Class B Common Stock Stock"},{"s":"GNK","n":"Genco Shipping & Trading Limited Ordinary Shares New (Marshall Islands)"},{"s":"GNL","n":"Global Net Lease, Inc. Common Stock"},{"s":"GNLN","n":"Greenlane Holdings, Inc."},{"s":"GNLX","n":"Genelux Corporation"},{"s":"GNPX","n":"Genprex, Inc."},{"s":"GNRC","n":"Generac Holdlings Inc. Common Stock"},{"s":"GNS","n":"Genius Group Limited Ordinary Shares"},{"s":"GNSS","n":"Genasys Inc."},{"s":"GNTA","n":"Genenta Science S.p.A."},{"s":"GNTX","n":"Gentex Corporation"},{"s":"GNW","n":"Genworth Financial Inc Common Stock"},{"s":"GO","n":"Grocery Outlet Holding Corp."},{"s":"GOAI","n":"Eva Live Inc."},{"s":"GOGO","n":"Gogo Inc."},{"s":"GOLD","n":"Gold.com, Inc. Common Stock"},{"s":"GOLF","n":"Acushnet Holdings Corp. Common Stock"},{"s":"GOOG","n":"Alphabet Inc."},{"s":"GOOGL","n":"Alphabet Inc."},{"s":"GOOS","n":"Canada Goose Holdings Inc. Subordinate Voting Shares"},{"s":"GORO","n":"Gold Resource Corporation Common Stock"},{"s":"GOSS","n":"Gossamer Bio, Inc."},{"s":"GOTU","n":"Gaotu Techedu Inc. American Depositary Shares"},{"s":"GOVX","n":"GeoVax Labs, Inc."},{"s":"GP","n":"GreenPower Motor Company Inc. - Common Shares"},{"s":"GPC","n":"Genuine Parts Company Common Stock"},{"s":"GPCR","n":"Structure Therapeutics Inc."},{"s":"GPGI","n":"GPGI, Inc. Class A Common Stock"},{"s":"GPI","n":"Group 1 Automotive, Inc. Common Stock"},{"s":"GPK","n":"Graphic Packaging Holding Company"},{"s":"GPN","n":"Global Payments Inc. Common Stock"},{"s":"GPOR","n":"Gulfport Energy Corporation Common Shares"},{"s":"GPRE","n":"Green Plains, Inc."},{"s":"GPRK","n":"Geopark Ltd Common Shares"},{"s":"GPRO","n":"GoPro, Inc."},{"s":"GPUS","n":"Hyperscale Data, Inc. Common Stock"},{"s":"GRAB","n":"Grab Holdings Limited"},{"s":"GRAF","n":"Graf Global Corp. Class A ordinary shares"},{"s":"GRAL","n":"GRAIL, Inc."},{"s":"GRAN","n":"Grande Group Limited"},{"s":"GRBK","n":"Green Brick Partners, Inc. Common Stock"},{"s":"GRC","n":"Gorman-Rupp Company (The) Common Stock"},{"s":"GRCE","n":"Grace Therapeutics, Inc."},{"s":"GRDN","n":"Guardian Pharmacy Services, Inc. Class A Common Stock"},{"s":"GRDX","n":"GridAI Technologies Corp."},{"s":"GREE","n":"Greenidge Generation Holdings Inc."},{"s":"GRFS","n":"Grifols, S.A."},{"s":"GRI","n":"GRI Bio, Inc."},{"s":"GRML","n":"Greenland Mines Ltd"},{"s":"GRMLW","n":"Greenland Mines Ltd - Warrants"},{"s":"GRMN","n":"Garmin Ltd. Common Stock (Switzerland)"},{"s":"GRND","n":"Grindr Inc. Common Stock"},{"s":"GRNQ","n":"Greenpro Capital Corp."},{"s":"GRNT","n":"Granite Ridge Resources, Inc. Common Stock"},{"s":"GRO","n":"Brazil Potash Corp. Common Shares"},{"s":"GROV","n":"Grove Collaborative Holdings, Inc. Class A Common Stock"},{"s":"GROW","n":"U.S. Global Investors, Inc."},{"s":"GROY","n":"Gold Royalty Corp. Common Shares"},{"s":"GRPN","n":"Groupon, Inc."},{"s":"GRRR","n":"Gorilla Technology Group Inc."},{"s":"GRVY","n":"GRAVITY Co., Ltd."},{"s":"GRWG","n":"GrowGeneration Corp."},{"s":"GS","n":"Goldman Sachs Group, Inc. (The) Common Stock"},{"s":"GSAT","n":"Globalstar, Inc."},{"s":"GSBC","n":"Great Southern Bancorp, Inc."},{"s":"GSBD","n":"Goldman Sachs BDC, Inc. Common Stock"},{"s":"GSHD","n":"Goosehead Insurance, Inc."},{"s":"GSIT","n":"GSI Technology, Inc."},{"s":"GSIW","n":"Garden Stage Limited"},{"s":"GSK","n":"GSK plc American Depositary Shares (Each representing two Ordinary Shares)"},{"s":"GSL","n":"Global Ship Lease Inc New Class A Common Shares"},{"s":"GSM","n":"Ferroglobe PLC"},{"s":"GSUN","n":"Golden Sun Technology Group Limited"},{"s":"GT","n":"The Goodyear Tire & Rubber Company"},{"s":"GTBP","n":"GT Biopharma, Inc."},{"s":"GTE","n":"Gran Tierra Energy Inc. Common Stock"},{"s":"GTEC","n":"Greenland Technologies Holding Corporation"},{"s":"GTEN","n":"Gores Holdings X, Inc."},{"s":"GTENU","n":"Gores Holdings X, Inc. - Units"},{"s":"GTENW","n":"Gores Holdings X, Inc. - Warrants"},{"s":"GTES","n":"Gates Industrial Corporation plc Ordinary Shares"},{"s":"GTIM","n":"Good Times Restaurants Inc."},{"s":"GTLB","n":"GitLab Inc."},{"s":"GTM","n":"ZoomInfo Technologies Inc."},{"s":"GTN","n":"Gray Media, Inc. Common Stock"},{"s":"GTN-A","n":"Gray Media, Inc. Class A Common Stock"},{"s":"GTX","n":"Garrett Motion Inc."},{"s":"GTY","n":"Getty Realty Corporation Common Stock"},{"s":"GURE","n":"Gulf Resources, Inc."},{"s":"GUTS","n":"Fractyl Health, Inc."},{"s":"GV","n":"Visionary Holdings Inc. - Common Shares"},{"s":"GVA","n":"Granite Construction Incorporated Common Stock"},{"s":"GVH","n":"Globavend Holdings Limited - Ord Shares"},{"s":"GWAV","n":"Greenwave Technology Solutions, Inc."},{"s":"GWH","n":"ESS Tech, Inc. Common Stock"},{"s":"GWRE","n":"Guidewire Software, Inc. Common Stock"},{"s":"GWRS","n":"Global Water Resources, Inc."},{"s":"GWW","n":"W.W. Grainger, Inc. Common Stock"},{"s":"GXAI","n":"Gaxos.ai Inc."},{"s":"GXO","n":"GXO Logistics, Inc. Common Stock"},{"s":"GYRE","n":"Gyre Therapeutics, Inc."},{"s":"GYRO","n":"Gyrodyne , LLC"},{"s":"H","n":"Hyatt Hotels Corporation Class A Common Stock"},{"s":"HAE","n":"Haemonetics Corporation Common Stock"},{"s":"HAFC","n":"Hanmi Financial Corporation"},{"s":"HAFN","n":"Hafnia Limited Common Shares"},{"s":"HAIN","n":"The Hain Celestial Group, Inc."},{"s":"HAL","n":"Halliburton Company Common Stock"},{"s":"HALO","n":"Halozyme Therapeutics, Inc."},{"s":"HAO","n":"Haoxi Health Technology Limited"},{"s":"HAPN","n":"Happen, Inc."},{"s":"HAS","n":"Hasbro, Inc."},{"s":"HASI","n":"HA Sustainable Infrastructure Capital, Inc. Common Stock"},{"s":"HAWK","n":"HawkEye 360, Inc. Common Stock"},{"s":"HAYW","n":"Hayward Holdings, Inc. Common Stock"},{"s":"HBAN","n":"Huntington Bancshares Incorporated"},{"s":"HBB","n":"Hamilton Beach Brands Holding Company Class A Common Stock"},{"s":"HBCP","n":"Home Bancorp, Inc."},{"s":"HBIO","n":"Harvard Bioscience, Inc."},{"s":"HBM","n":"Hudbay Minerals Inc. Ordinary Shares (Canada)"},{"s":"HBNB","n":"Hotel101 Global Holdings Corp."},{"s":"HBNC","n":"Horizon Bancorp, Inc."},{"s":"HBT","n":"HBT Financial, Inc."},{"s":"HCA","n":"HCA Healthcare, Inc. Common Stock"},{"s":"HCAI","n":"Huachen AI Parking Management Technology Holding Co., Ltd."},{"s":"HCAT","n":"Health Catalyst, Inc"},{"s":"HCC","n":"Warrior Met Coal, Inc. Common Stock"},{"s":"HCHL","n":"Happy City Holdings Limited"},{"s":"HCI","n":"HCI Group, Inc. Common Stock"},{"s":"HCIC","n":"Hennessy Capital Investment Corp. VIII"},{"s":"HCICU","n":"Hennessy Capital Investment Corp. VIII - Units"},{"s":"HCKT","n":"The Hackett Group, Inc."},{"s":"HCM","n":"HUTCHMED (China) Limited"},{"s":"HCSG","n":"Healthcare Services Group, Inc."},{"s":"HCTI","n":"Healthcare Triangle, Inc."},{"s":"HCWB","n":"HCW Biologics Inc."},{"s":"HCWC","n":"Healthy Choice Wellness Corp. Class A Common Stock"},{"s":"HD","n":"Home Depot, Inc. (The) Common Stock"},{"s":"HDB","n":"HDFC Bank Limited Common Stock"},{"s":"HDL","n":"SUPER HI INTERNATIONAL HOLDING LTD."},{"s":"HDRN","n":"Hadron Energy, Inc."},{"s":"HDSN","n":"Hudson Technologies, Inc."},{"s":"HE","n":"Hawaiian Electric Industries, Inc. Common Stock"},{"s":"HEI","n":"Heico Corporation Common Stock"},{"s":"HEI-A","n":"Heico Corporation Common Stock"},{"s":"HELE","n":"Helen of Troy Limited"},{"s":"HELP","n":"Cybin Inc."},{"s":"HEPS","n":"D-Market Electronic Services & Trading"},{"s":"HERE","n":"Here Group Limited"},{"s":"HFBL","n":"Home Federal Bancorp, Inc. of Louisiana"},{"s":"HFFG","n":"HF Foods Group Inc."},{"s":"HFWA","n":"Heritage Financial Corporation"},{"s":"HG","n":"Hamilton Insurance Group, Ltd. Class B Common Shares"},{"s":"HGBL","n":"Heritage Global Inc."},{"s":"HGTY","n":"Hagerty, Inc. Class A Common Stock"},{"s":"HGV","n":"Hilton Grand Vacations Inc. Common Stock"},{"s":"HHH","n":"Howard Hughes Holdings Inc. Common Stock"},{"s":"HHS","n":"Harte Hanks, Inc."},{"s":"HIFS","n":"Hingham Institution for Savings"},{"s":"HIG","n":"The Hartford Insurance Group, Inc. Common Stock"},{"s":"HIHO","n":"Highway Holdings Limited"},{"s":"HII","n":"Huntington Ingalls Industries, Inc. Common Stock"},{"s":"HIMS","n":"Hims & Hers Health, Inc. Class A Common Stock"},{"s":"HIMX","n":"Himax Technologies, Inc."},{"s":"HIND","n":"Vyome Holdings, Inc."},{"s":"HIPO","n":"Hippo Holdings Inc. Common Stock"},{"s":"HIT","n":"Health In Tech, Inc."},{"s":"HITI","n":"High Tide Inc. - Common Shares"},{"s":"HIVE","n":"HIVE Digital Technologies Ltd - Common Shares"},{"s":"HIW","n":"Highwoods Properties, Inc. Common Stock"},{"s":"HKD","n":"AMTD Digital Inc. American Depositary Shares (every five of which represent two Class A Ordinary Shares)"},{"s":"HKIT","n":"Hitek Global Inc."},{"s":"HKPD","n":"Cellyan Biotechnology Co., Ltd"},{"s":"HL","n":"Hecla Mining Company Common Stock"},{"s":"HLF","n":"Herbalife Ltd. Common Shares"},{"s":"HLI","n":"Houlihan Lokey, Inc. Class A Common Stock"},{"s":"HLIO","n":"Helios Technologies, Inc. Common Stock"},{"s":"HLIT","n":"Harmonic Inc."},{"s":"HLLY","n":"Holley Inc. Common Stock"},{"s":"HLMN","n":"Hillman Solutions Corp."},{"s":"HLN","n":"Haleon plc American Depositary Shares (Each representing two Ordinary Shares)"},{"s":"HLNE","n":"Hamilton Lane Incorporated"},{"s":"HLP","n":"Hongli Group Inc."},{"s":"HLT","n":"Hilton Worldwide Holdings Inc. Common Stock"},{"s":"HLX","n":"Helix Energy Solutions Group, Inc. Common Stock"},{"s":"HMC","n":"Honda Motor Company, Ltd. Common Stock"},{"s":"HMH","n":"HMH Holding Inc."},{"s":"HMN","n":"Horace Mann Educators Corporation Common Stock"},{"s":"HMR","n":"Heidmar Maritime Holdings Corp."},{"s":"HMY","n":"Harmony Gold Mining Company Limited"},{"s":"HNGE","n":"Hinge Health, Inc. Class A Common Stock"},{"s":"HNI","n":"HNI Corporation Common Stock"},{"s":"HNNA","n":"Hennessy Advisors, Inc."},{"s":"HNRG","n":"Hallador Energy Company"},{"s":"HNST","n":"The Honest Company, Inc."},{"s":"HNVR","n":"Hanover Bancorp, Inc."},{"s":"HODO","n":"House of Doge Inc."},{"s":"HOFT","n":"Hooker Furnishings Corporation"},{"s":"HOG","n":"Harley-Davidson, Inc. Common Stock"},{"s":"HOLO","n":"MicroCloud Hologram Inc."},{"s":"HOMB","n":"Home BancShares, Inc. Common Stock"},{"s":"HON","n":"Honeywell International Inc."},{"s":"HONA","n":"Honeywell Aerospace Inc."},{"s":"HOOD","n":"Robinhood Markets, Inc."},{"s":"HOPE","n":"Hope Bancorp, Inc."},{"s":"HOUR","n":"Hour Loop, Inc."},{"s":"HOV","n":"Hovnanian Enterprises, Inc. Class A Common Stock"},{"s":"HOVR","n":"New Horizon Aircraft Ltd."},{"s":"HOWL","n":"Werewolf Therapeutics, Inc."},{"s":"HP","n":"Helmerich & Payne, Inc. Common Stock"},{"s":"HPAI","n":"Helport AI Limited"},{"s":"HPAIW","n":"Helport AI Limited - Warrants"},{"s":"HPE","n":"Hewlett Packard Enterprise Company Common Stock"},{"s":"HPK","n":"HighPeak Energy, Inc."},{"s":"HPP","n":"Hudson Pacific Properties, Inc. Common Stock"},{"s":"HPQ","n":"HP Inc. Common Stock"},{"s":"HQ","n":"Horizon Quantum Holdings Ltd."},{"s":"HQH","n":"abrdn Healthcare Investors Shares of Beneficial Interest"},{"s":"HQI","n":"HireQuest, Inc."},{"s":"HQL","n":"abrdn Life Sciences Investors Shares of Beneficial Interest"},{"s":"HQY","n":"HealthEquity, Inc."},{"s":"HRB","n":"H&R Block, Inc. Common Stock"},{"s":"HRI","n":"Herc Holdings Inc. Common Stock"},{"s":"HRL","n":"Hormel Foods Corporation Common Stock"},{"s":"HRMY","n":"Harmony Biosciences Holdings, Inc."},{"s":"HROW","n":"Harrow, Inc."},{"s":"HRTG","n":"Heritage Insurance Holdings, Inc. Common Stock"},{"s":"HRTX","n":"Heron Therapeutics, Inc."},{"s":"HRZN","n":"Horizon Technology Finance Corporation"},{"s":"HSAI","n":"Hesai Group - American Depositary Share"},{"s":"HSBC","n":"HSBC Holdings, plc. Common Stock"},{"s":"HSCS","n":"HeartSciences Inc."},{"s":"HSDT","n":"Solana Company"},{"s":"HSHP","n":"Himalaya Shipping Ltd. Common Shares"},{"s":"HSIC","n":"Henry Schein, Inc."},{"s":"HSLV","n":"Highlander Silver Corp. Common Shares"},{"s":"HST","n":"Host Hotels & Resorts, Inc."},{"s":"HSTM","n":"HealthStream, Inc."},{"s":"HSY","n":"The Hershey Company Common Stock"},{"s":"HTB","n":"HomeTrust Bancshares, Inc. Common Stock"},{"s":"HTCO","n":"High-Trend International Group"},{"s":"HTCR","n":"Heartcore Enterprises, Inc."},{"s":"HTFL","n":"Heartflow, Inc."},{"s":"HTGC","n":"Hercules Capital, Inc. Common Stock"},{"s":"HTH","n":"Hilltop Holdings Inc."},{"s":"HTHT","n":"H World Group Limited"},{"s":"HTLD","n":"Heartland Express, Inc."},{"s":"HTLM","n":"HomesToLife Ltd"},{"s":"HTO","n":"H2O America"},{"s":"HTOO","n":"Fusion Fuel Green PLC"},{"s":"HTT","n":"High Templar Tech Limited American depositary shares, each representing one Class A ordinary share"},{"s":"HTZ","n":"Hertz Global Holdings, Inc"},{"s":"HUBB","n":"Hubbell Inc Common Stock"},{"s":"HUBC","n":"Hub Cyber Security Ltd."},{"s":"HUBG","n":"Hub Group, Inc."},{"s":"HUBS","n":"HubSpot, Inc. Common Stock"},{"s":"HUDI","n":"Huadi International Group Co., Ltd."},{"s":"HUHU","n":"HUHUTECH International Group Inc."},{"s":"HUIZ","n":"Huize Holding Limited"},{"s":"HUM","n":"Humana Inc. Common Stock"},{"s":"HUMA","n":"Humacyte, Inc."},{"s":"HUN","n":"Huntsman Corporation Common Stock"},{"s":"HURA","n":"TuHURA Biosciences, Inc."},{"s":"HURC","n":"Hurco Companies, Inc."},{"s":"HURN","n":"Huron Consulting Group Inc."},{"s":"HUT","n":"Hut 8 Corp."},{"s":"HUYA","n":"HUYA Inc. American depositary shares, each representing one Class A ordinary share"},{"s":"HVII","n":"Hennessy Capital Investment Corp. VII"},{"s":"HVMC","n":"Highview Merger Corp."},{"s":"HVMCU","n":"Highview Merger Corp. - Units"},{"s":"HVMCW","n":"Highview Merger Corp. - Warrants"},{"s":"HVT","n":"Haverty Furniture Companies, Inc. Common Stock"},{"s":"HVT-A","n":"Haverty Furniture Companies, Inc. Common Stock"},{"s":"HWBK","n":"Hawthorn Bancshares, Inc."},{"s":"HWC","n":"Hancock Whitney Corporation"},{"s":"HWH","n":"HWH International Inc."},{"s":"HWKN","n":"Hawkins, Inc."},{"s":"HWM","n":"Howmet Aerospace Inc. Common Stock"},{"s":"HXHX","n":"Haoxin Holdings Limited"},{"s":"HXL","n":"Hexcel Corporation Common Stock"},{"s":"HY","n":"Hyster-Yale, Inc. Class A common stock"},{"s":"HYFM","n":"Hydrofarm Holdings Group, Inc."},{"s":"HYFT","n":"MindWalk Holdings Corp."},{"s":"HYLN","n":"Hyliion Holdings Corp. Class A Common Stock"},{"s":"HYMC","n":"Hycroft Mining Holding Corporation"},{"s":"HYNE","n":"Hoyne Bancorp, Inc."},{"s":"HYPD","n":"Hyperion DeFi, Inc."},{"s":"HYPR","n":"Hyperfine, Inc."},{"s":"HZO","n":"MarineMax, Inc. (FL) Common Stock"},{"s":"IAG","n":"Iamgold Corporation Ordinary Shares"},{"s":"IART","n":"Integra LifeSciences Holdings Corporation"},{"s":"IAUX","n":"i-80 Gold Corp. Common Shares"},{"s":"IBCP","n":"Independent Bank Corporation"},{"s":"IBEX","n":"IBEX Limited - Common Share"},{"s":"IBG","n":"Innovation Beverage Group Limited"},{"s":"IBIO","n":"iBio, Inc."},{"s":"IBKR","n":"Interactive Brokers Group, Inc."},{"s":"IBM","n":"International Business Machines Corporation Common Stock"},{"s":"IBN","n":"ICICI Bank Limited Common Stock"},{"s":"IBO","n":"Impact BioMedical, Inc. Common Stock"},{"s":"IBOC","n":"International Bancshares Corporation"},{"s":"IBP","n":"Installed Building Products, Inc. Common Stock"},{"s":"IBRX","n":"ImmunityBio, Inc."},{"s":"IBTA","n":"Ibotta, Inc. Class A Common Stock"},{"s":"ICCC","n":"ImmuCell Corporation"},{"s":"ICCM","n":"IceCure Medical Ltd."},{"s":"ICE","n":"Intercontinental Exchange Inc. Common Stock"},{"s":"ICFI","n":"ICF International, Inc."},{"s":"ICG","n":"Intchains Group Limited"},{"s":"ICHR","n":"Ichor Holdings"},{"s":"ICL","n":"ICL Group Ltd. Ordinary Shares"},{"s":"ICLR","n":"ICON plc"},{"s":"ICMB","n":"Investcorp Credit Management BDC, Inc."},{"s":"ICON","n":"Icon Energy Corp."},{"s":"ICU","n":"SeaStar Medical Holding Corporation"},{"s":"ICUI","n":"ICU Medical, Inc."},{"s":"IDA","n":"IDACORP, Inc. Common Stock"},{"s":"IDAI","n":"T Stamp Inc."},{"s":"IDCC","n":"InterDigital, Inc."},{"s":"IDN","n":"Intellicheck, Inc."},{"s":"IDR","n":"Idaho Strategic Resources, Inc. Common Stock"},{"s":"IDT","n":"IDT Corporation Class B Common Stock"},{"s":"IDXX","n":"IDEXX Laboratories, Inc."},{"s":"IDYA","n":"IDEAYA Biosciences, Inc."},{"s":"IE","n":"Ivanhoe Electric Inc. Common Stock"},{"s":"IEP","n":"Icahn Enterprises L.P. - Depositary Units representing Limited Partner Interests"},{"s":"IESC","n":"IES Holdings, Inc."},{"s":"IEX","n":"IDEX Corporation Common Stock"},{"s":"IFBD","n":"Infobird Co., Ltd"},{"s":"IFF","n":"International Flavors & Fragrances, Inc. Common Stock"},{"s":"IFRX","n":"InflaRx N.V."},{"s":"IFS","n":"Intercorp Financial Services Inc. Common Shares"},{"s":"IGC","n":"IGC Pharma, Inc. Common Stock"},{"s":"IGIC","n":"International General Insurance Holdings Ltd."},{"s":"IH","n":"iHuman Inc. American depositary shares, each representing five Class A ordinary shares"},{"s":"IHG","n":"Intercontinental Hotels Group American Depositary Shares (Each representing one Ordinary Share)"},{"s":"IHRT","n":"iHeartMedia, Inc."},{"s":"IHS","n":"IHS Holding Limited Ordinary Shares"},{"s":"III","n":"Information Services Group, Inc."},{"s":"IIIN","n":"Insteel Industries, Inc. Common Stock"},{"s":"IIIV","n":"i3 Verticals, Inc."},{"s":"IIPR","n":"Innovative Industrial Properties, Inc. Common Stock"},{"s":"IKT","n":"Inhibikase Therapeutics, Inc."},{"s":"ILAG","n":"Intelligent Living Application Group Inc."},{"s":"ILLR","n":"Triller Group Inc."},{"s":"ILMN","n":"Illumina, Inc."},{"s":"IMA","n":"ImageneBio, Inc."},{"s":"IMAX","n":"Imax Corporation Common Stock"},{"s":"IMCC","n":"IM Cannabis Corp. - Common Shares"},{"s":"IMCR","n":"Immunocore Holdings plc"},{"s":"IMDX","n":"Insight Molecular Diagnostics Inc."},{"s":"IMKTA","n":"Ingles Markets, Incorporated"},{"s":"IMMP","n":"Immutep Limited"},{"s":"IMMR","n":"Immersion Corporation"},{"s":"IMMX","n":"Immix Biopharma, Inc."},{"s":"IMNM","n":"Immunome, Inc."},{"s":"IMNN","n":"Imunon, Inc."},{"s":"IMO","n":"Imperial Oil Limited Common Stock"},{"s":"IMOS","n":"ChipMOS TECHNOLOGIES INC."},{"s":"IMPP","n":"Imperial Petroleum Inc. - Common Shares"},{"s":"IMRN","n":"Immuron Limited"},{"s":"IMRX","n":"Immuneering Corporation"},{"s":"IMSR","n":"Terrestrial Energy Inc."},{"s":"IMTE","n":"Integrated Media Technology Limited"},{"s":"IMTX","n":"Immatics N.V."},{"s":"IMUX","n":"Immunic, Inc."},{"s":"IMVT","n":"Immunovant, Inc."},{"s":"IMXI","n":"International Money Express, Inc."},{"s":"INAB","n":"IN8bio, Inc."},{"s":"INBK","n":"First Internet Bancorp"},{"s":"INBS","n":"Intelligent Bio Solutions Inc."},{"s":"INBX","n":"Inhibrx Biosciences, Inc."},{"s":"INCR","n":"Intercure Ltd."},{"s":"INCY","n":"Incyte Corporation"},{"s":"INDB","n":"Independent Bank Corp."},{"s":"INDI","n":"indie Semiconductor, Inc."},{"s":"INDO","n":"Indonesia Energy Corporation Limited Ordinary Shares"},{"s":"INDP","n":"Indaptus Therapeutics, Inc."},{"s":"INDV","n":"Indivior Pharmaceuticals, Inc."},{"s":"INEO","n":"INNEOVA Holdings Limited"},{"s":"INFQ","n":"Infleqtion, Inc. Common Stock"},{"s":"INFU","n":"InfuSystems Holdings, Inc. Common Stock"},{"s":"INFY","n":"Infosys Limited American Depositary Shares"},{"s":"ING","n":"ING Group, N.V. Common Stock"},{"s":"INGM","n":"Ingram Micro Holding Corporation Common Stock"},{"s":"INGN","n":"Inogen, Inc"},{"s":"INGR","n":"Ingredion Incorporated Common Stock"},{"s":"INHD","n":"Inno Holdings Inc."},{"s":"INIO","n":"INNIO N.V."},{"s":"INKT","n":"MiNK Therapeutics, Inc."},{"s":"INLF","n":"INLIF LIMITED"},{"s":"INLX","n":"Intellinetics, Inc. Common Stock"},{"s":"INM","n":"InMed Pharmaceuticals Inc. - Common Shares"},{"s":"INMB","n":"INmune Bio Inc."},{"s":"INMD","n":"InMode Ltd."},{"s":"INN","n":"Summit Hotel Properties, Inc. Common Stock"},{"s":"INNV","n":"InnovAge Holding Corp."},{"s":"INO","n":"Inovio Pharmaceuticals, Inc."},{"s":"INOD","n":"Innodata Inc."},{"s":"INR","n":"Infinity Natural Resources, Inc. Class A Common Stock"},{"s":"INSE","n":"Inspired Entertainment, Inc."},{"s":"INSG","n":"Inseego Corp."},{"s":"INSM","n":"Insmed Incorporated"},{"s":"INSP","n":"Inspire Medical Systems, Inc. Common Stock"},{"s":"INSW","n":"International Seaways, Inc. Common Stock"},{"s":"INTA","n":"Intapp, Inc."},{"s":"INTC","n":"Intel Corporation"},{"s":"INTG","n":"The Intergroup Corporation"},{"s":"INTJ","n":"Intelligent Group Limited"},{"s":"INTR","n":"Inter & Co. Inc."},{"s":"INTS","n":"Intensity Therapeutics, Inc."},{"s":"INTT","n":"inTest Corporation Common Stock"},{"s":"INTU","n":"Intuit Inc."},{"s":"INTZ","n":"Intrusion Inc."},{"s":"INUV","n":"Inuvo, Inc."},{"s":"INV","n":"Innventure, Inc."},{"s":"INVA","n":"Innoviva, Inc."},{"s":"INVE","n":"Identiv, Inc."},{"s":"INVH","n":"Invitation Homes Inc. Common Stock"},{"s":"INVX","n":"Innovex International, Inc. Common Stock"},{"s":"INVZ","n":"Innoviz Technologies Ltd."},{"s":"IONQ","n":"IonQ, Inc. Common Stock"},{"s":"IONR","n":"ioneer Ltd"},{"s":"IONS","n":"Ionis Pharmaceuticals, Inc."},{"s":"IOR","n":"Income Opportunity Realty Investors, Inc. Common Stock"},{"s":"IOSP","n":"Innospec Inc."},{"s":"IOT","n":"Samsara Inc. Class A Common Stock"},{"s":"IOTR","n":"iOThree Limited"},{"s":"IOVA","n":"Iovance Biotherapeutics, Inc."},{"s":"IP","n":"International Paper Company Common Stock"},{"s":"IPAR","n":"Interparfums, Inc."},{"s":"IPDN","n":"Professional Diversity Network, Inc."},{"s":"IPGP","n":"IPG Photonics Corporation"},{"s":"IPHA","n":"Innate Pharma S.A."},{"s":"IPI","n":"Intrepid Potash, Inc Common Stock"},{"s":"IPM","n":"Intelligent Protection Management Corp."},{"s":"IPSC","n":"Century Therapeutics, Inc."},{"s":"IPST","n":"IP Strategy Holdings, Inc."},{"s":"IPVVU","n":"InterPrivate Investment Partners V, Inc. - Units"},{"s":"IPW","n":"iPower Inc."},{"s":"IPWR","n":"Ideal Power Inc."},{"s":"IPX","n":"IperionX Limited - American Depositary Share"},{"s":"IQ","n":"iQIYI, Inc."},{"s":"IQMX","n":"IQM Quantum Computers Oyj"},{"s":"IQMXW","n":"IQM Quantum Computers Oyj - Warrants to purchase American Depositary Shares"},{"s":"IQST","n":"iQSTEL Inc."},{"s":"IQV","n":"IQVIA Holdings, Inc. Common Stock"},{"s":"IR","n":"Ingersoll Rand Inc. Common Stock"},{"s":"IRD","n":"Opus Genetics, Inc."},{"s":"IRDM","n":"Iridium Communications Inc"},{"s":"IREN","n":"IREN Limited"},{"s":"IRHO","n":"Iron Horse Acquisitions II Corp."},{"s":"IRHOU","n":"Iron Horse Acquisitions II Corp. - Units"},{"s":"IRIX","n":"IRIDEX Corporation"},{"s":"IRMD","n":"iRadimed Corporation"},{"s":"IRON","n":"Disc Medicine, Inc."},{"s":"IRS","n":"IRSA Inversiones Y Representaciones S.A. Global Depositary Shares (Each representing ten shares of Common Stock)"},{"s":"IRTC","n":"iRhythm Holdings, Inc."},{"s":"IRWD","n":"Ironwood Pharmaceuticals, Inc."},{"s":"ISBA","n":"Isabella Bank Corporation"},{"s":"ISOU","n":"IsoEnergy Ltd. Common Shares"},{"s":"ISPC","n":"iSpecimen Inc."},{"s":"ISPR","n":"Ispire Technology Inc."},{"s":"ISRG","n":"Intuitive Surgical, Inc."},{"s":"ISSC","n":"Innovative Solutions and Support, Inc."},{"s":"ISTR","n":"Investar Holding Corporation"},{"s":"IT","n":"Gartner, Inc. Common Stock"},{"s":"ITG","n":"ITG, Inc."},{"s":"ITGR","n":"Integer Holdings Corporation Common Stock"},{"s":"ITIC","n":"Investors Title Company"},{"s":"ITOC","n":"iTonic Holdings Ltd"},{"s":"ITP","n":"IT Tech Packaging, Inc. Common Stock"},{"s":"ITRG","n":"Integra Resources Corp. Common Shares"},{"s":"ITRI","n":"Itron, Inc."},{"s":"ITRN","n":"Ituran Location and Control Ltd."},{"s":"ITT","n":"ITT Inc. Common Stock"},{"s":"ITW","n":"Illinois Tool Works Inc. Common Stock"},{"s":"IVA","n":"Inventiva S.A. - American Depository Shares"},{"s":"IVDA","n":"Iveda Solutions, Inc."},{"s":"IVF","n":"INVO Fertility, Inc."},{"s":"IVR","n":"INVESCO MORTGAGE CAPITAL INC Common Stock"},{"s":"IVT","n":"InvenTrust Properties Corp. Common Stock"},{"s":"IVVD","n":"Invivyd, Inc."},{"s":"IVZ","n":"Invesco Ltd Common Stock"},{"s":"IX","n":"ORIX Corporation American Depositary Shares"},{"s":"IXHL","n":"Incannex Healthcare Inc."},{"s":"IZEA","n":"IZEA Worldwide, Inc."},{"s":"IZM","n":"ICZOOM Group Inc."},{"s":"J","n":"Jacobs Solutions Inc. Common Stock"},{"s":"JACK","n":"Jack In The Box Inc."},{"s":"JAGU","n":"Jaguar Uranium Corp. Class A Common Shares"},{"s":"JAGX","n":"Jaguar Health, Inc."},{"s":"JAKK","n":"JAKKS Pacific, Inc."},{"s":"JAN","n":"Janus Living, Inc. Class A-1 Common Stock"},{"s":"JANX","n":"Janux Therapeutics, Inc."},{"s":"JAZZ","n":"Jazz Pharmaceuticals plc"},{"s":"JBDI","n":"JBDI Holdings Limited"},{"s":"JBGS","n":"JBG SMITH Properties Common Shares"},{"s":"JBHT","n":"J.B. Hunt Transport Services, Inc."},{"s":"JBI","n":"Janus International Group, Inc. Common Stock"},{"s":"JBIO","n":"Jade Biosciences, Inc."},{"s":"JBK","n":"Lehman ABS 3.50 3.50% Adjustable Corp Backed Tr Certs GS Cap I"},{"s":"JBL","n":"Jabil Inc. Common Stock"},{"s":"JBLU","n":"JetBlue Airways Corporation"},{"s":"JBS","n":"JBS N.V. Class A Common Shares"},{"s":"JBSS","n":"John B. Sanfilippo & Son, Inc."},{"s":"JBTM","n":"JBT Marel Corporation Common Stock"},{"s":"JCAP","n":"Jefferson Capital, Inc."},{"s":"JCI","n":"Johnson Controls International plc Ordinary Share"},{"s":"JCSE","n":"JE Cleantech Holdings Limited"},{"s":"JCTC","n":"Jewett-Cameron Trading Company - Common Shares"},{"s":"JD","n":"JD.com, Inc."},{"s":"JDZG","n":"JIADE LIMITED"},{"s":"JEF","n":"Jefferies Financial Group Inc. Common Stock"},{"s":"JELD","n":"JELD-WEN Holding, Inc. Common Stock"},{"s":"JEM","n":"707 Cayman Holdings Limited"},{"s":"JF","n":"J and Friends Holdings Limited"},{"s":"JFB","n":"JFB Construction Holdings"},{"s":"JFIN","n":"Jiayin Group Inc."},{"s":"JFU","n":"9F Inc."},{"s":"JG","n":"Aurora Mobile Limited"},{"s":"JHX","n":"James Hardie Industries plc. Ordinary Shares"},{"s":"JILL","n":"J. Jill, Inc. Common Stock"},{"s":"JJSF","n":"J & J Snack Foods Corp."},{"s":"JKHY","n":"Jack Henry & Associates, Inc."},{"s":"JKS","n":"JinkoSolar Holding Company Limited American Depositary Shares (each representing 4 Common Shares)"},{"s":"JL","n":"J-Long Group Limited"},{"s":"JLHL","n":"Julong Holding Limited"},{"s":"JLL","n":"Jones Lang LaSalle Incorporated Common Stock"},{"s":"JMIA","n":"Jumia Technologies AG American Depositary Shares, each representing two Ordinary Shares"},{"s":"JMSB","n":"John Marshall Bancorp, Inc."},{"s":"JNJ","n":"Johnson & Johnson Common Stock"},{"s":"JOB","n":"GEE Group Inc. Common Stock"},{"s":"JOBY","n":"Joby Aviation, Inc. Common Stock"},{"s":"JOE","n":"St. Joe Company (The) Common Stock"},{"s":"JONEU","n":"Jones Ventures INTL Acquisition1 Corp - Units"},{"s":"JOUT","n":"Johnson Outdoors Inc."},{"s":"JOYY","n":"JOYY Inc."},{"s":"JPM","n":"JP Morgan Chase & Co. Common Stock"},{"s":"JRSH","n":"Jerash Holdings (US), Inc."},{"s":"JRVR","n":"James River Group Holdings, Inc."},{"s":"JSPR","n":"Jasper Therapeutics, Inc."},{"s":"JTAI","n":"Jet.AI Inc."},{"s":"JUNS","n":"Jupiter Neurosciences, Inc."},{"s":"JVA","n":"Coffee Holding Co., Inc."},{"s":"JWEL","n":"Jowell Global Ltd."},{"s":"JXG","n":"JX Luxventure Group Inc."},{"s":"JXN","n":"Jackson Financial Inc. Class A Common Stock"},{"s":"JYD","n":"Jayud Global Logistics Limited"},{"s":"JYNT","n":"The Joint Corp."},{"s":"JZ","n":"Jianzhi Education Technology Group Company Limited"},{"s":"JZXN","n":"Jiuzi Holdings, Inc."},{"s":"KAI","n":"Kadant Inc Common Stock"},{"s":"KALA","n":"KALA BIO, Inc."},{"s":"KALU","n":"Kaiser Aluminum Corporation"},{"s":"KAPA","n":"Kairos Pharma, Ltd. Common Stock"},{"s":"KARD","n":"Kardigan, Inc."},{"s":"KARO","n":"Karooooo Ltd."},{"s":"KAZR","n":"Skyline Builders Group Holding Limited"},{"s":"KB","n":"KB Financial Group Inc"},{"s":"KBDC","n":"Kayne Anderson BDC, Inc. Common Stock"},{"s":"KBH","n":"KB Home Common Stock"},{"s":"KBON","n":"Karbon Capital Partners Corp."},{"s":"KBONU","n":"Karbon Capital Partners Corp. - Units"},{"s":"KBR","n":"KBR, Inc. Common Stock"},{"s":"KBSX","n":"FST Corp."},{"s":"KC","n":"Kingsoft Cloud Holdings Limited"},{"s":"KD","n":"Kyndryl Holdings, Inc. Common Stock"},{"s":"KDK","n":"Kodiak AI, Inc."},{"s":"KDP","n":"Keurig Dr Pepper Inc."},{"s":"KE","n":"Kimball Electronics, Inc."},{"s":"KEEL","n":"Keel Infrastructure Corp."},{"s":"KELYA","n":"Kelly Services, Inc."},{"s":"KELYB","n":"Kelly Services, Inc."},{"s":"KEN","n":"Kenon Holdings Ltd. Ordinary Shares"},{"s":"KEP","n":"Korea Electric Power Corporation Common Stock"},{"s":"KEQU","n":"Kewaunee Scientific Corporation"},{"s":"KEX","n":"Kirby Corporation Common Stock"},{"s":"KEY","n":"KeyCorp Common Stock"},{"s":"KEYS","n":"Keysight Technologies Inc. Common Stock"},{"s":"KFFB","n":"Kentucky First Federal Bancorp"},{"s":"KFRC","n":"Kforce, Inc. Common Stock"},{"s":"KFY","n":"Korn Ferry Common Stock"},{"s":"KG","n":"Kestrel Group, Ltd."},{"s":"KGC","n":"Kinross Gold Corporation Common Stock"},{"s":"KGEI","n":"Kolibri Global Energy Inc."},{"s":"KGS","n":"Kodiak Gas Services, Inc. Common Stock"},{"s":"KHC","n":"The Kraft Heinz Company"},{"s":"KIDS","n":"OrthoPediatrics Corp."},{"s":"KIDZ","n":"KIDZ AI Inc."},{"s":"KIDZW","n":"KIDZ AI Inc. - Warrants"},{"s":"KIM","n":"Kimco Realty Corporation (HC) Common Stock"},{"s":"KINS","n":"Kingstone Companies, Inc"},{"s":"KITT","n":"Nauticus Robotics, Inc."},{"s":"KKR","n":"KKR & Co. Inc. Common Stock"},{"s":"KLAC","n":"KLA Corporation"},{"s":"KLAR","n":"Klarna Group plc Ordinary Shares"},{"s":"KLC","n":"KinderCare Learning Companies, Inc. Common Stock"},{"s":"KLIC","n":"Kulicke and Soffa Industries, Inc."},{"s":"KLRA","n":"Kailera Therapeutics, Inc."},{"s":"KLRS","n":"Kalaris Therapeutics, Inc."},{"s":"KLTR","n":"Kaltura, Inc."},{"s":"KLXE","n":"KLX Energy Services Holdings, Inc."},{"s":"KMB","n":"Kimberly-Clark Corporation"},{"s":"KMDA","n":"Kamada Ltd."},{"s":"KMI","n":"Kinder Morgan, Inc. Common Stock"},{"s":"KMPB","n":"Kemper Corporation 5.875% Fixed-Rate Reset Junior Subordinated Debentures due 2062"},{"s":"KMPR","n":"Kemper Corporation"},{"s":"KMRK","n":"K-Tech Solutions Company Limited"},{"s":"KMT","n":"Kennametal Inc. Common Stock"},{"s":"KMTS","n":"Kestra Medical Technologies, Ltd."},{"s":"KMX","n":"CarMax Inc"},{"s":"KN","n":"Knowles Corporation Common Stock"},{"s":"KNDI","n":"Kandi Technologies Group, Inc."},{"s":"KNF","n":"Knife Riv Holding Co. Common Stock"},{"s":"KNRX","n":"KNOREX LTD. Class A Ordinary Shares"},{"s":"KNSA","n":"Kiniksa Pharmaceuticals International, plc"},{"s":"KNSL","n":"Kinsale Capital Group, Inc. Common Stock"},{"s":"KNTK","n":"Kinetik Holdings Inc. Class A Common Stock"},{"s":"KNX","n":"Knight-Swift Transportation Holdings Inc."},{"s":"KO","n":"Coca-Cola Company (The) Common Stock"},{"s":"KOD","n":"Kodiak Sciences Inc"},{"s":"KODK","n":"Eastman Kodak Company Common New"},{"s":"KOP","n":"Koppers Holdings Inc. Common Stock"},{"s":"KOPN","n":"Kopin Corporation"},{"s":"KORE","n":"KORE Group Holdings, Inc. Common Stock"},{"s":"KOS","n":"Kosmos Energy Ltd. Common Shares (DE)"},{"s":"KOSS","n":"Koss Corporation"},{"s":"KPET","n":"KPET Ultra Paceline Corporation Class A Ordinary Shares"},{"s":"KPLT","n":"Katapult Holdings, Inc."},{"s":"KPRX","n":"Kiora Pharmaceuticals, Inc."},{"s":"KPTI","n":"Karyopharm Therapeutics Inc."},{"s":"KR","n":"Kroger Company (The) Common Stock"},{"s":"KRAQ","n":"KRAKacquisition Corp"},{"s":"KRAQW","n":"KRAKacquisition Corp - Warrants"},{"s":"KRC","n":"Kilroy Realty Corporation Common Stock"},{"s":"KRKR","n":"36Kr Holdings Inc."},{"s":"KRMD","n":"KORU Medical Systems, Inc."},{"s":"KRMN","n":"Karman Holdings Inc. Common Stock"},{"s":"KRNT","n":"Kornit Digital Ltd."},{"s":"KRNY","n":"Kearny Financial"},{"s":"KRO","n":"Kronos Worldwide Inc Common Stock"},{"s":"KROS","n":"Keros Therapeutics, Inc."},{"s":"KRP","n":"Kimbell Royalty Partners Common Units Representing Limited Partner Interests"},{"s":"KRRO","n":"Korro Bio, Inc."},{"s":"KRT","n":"Karat Packaging Inc."},{"s":"KRUS","n":"Kura Sushi USA, Inc."},{"s":"KRYS","n":"Krystal Biotech, Inc."},{"s":"KSCP","n":"Knightscope, Inc."},{"s":"KSPI","n":"Joint Stock Company Kaspi.kz - American Depository Shares"},{"s":"KSS","n":"Kohl's Corporation Common Stock"},{"s":"KT","n":"KT Corporation Common Stock"},{"s":"KTB","n":"Kontoor Brands, Inc. Common Stock"},{"s":"KTCC","n":"Key Tronic Corporation"},{"s":"KTOS","n":"Kratos Defense & Security Solutions, Inc."},{"s":"KTTA","n":"Pasithea Therapeutics Corp."},{"s":"KULR","n":"KULR Technology Group, Inc. Common Stock"},{"s":"KURA","n":"Kura Oncology, Inc."},{"s":"KUST","n":"Kustom Entertainment, Inc."},{"s":"KVHI","n":"KVH Industries, Inc."},{"s":"KVUE","n":"Kenvue Inc. Common Stock"},{"s":"KWM","n":"K Wave Media, Ltd."},{"s":"KWR","n":"Quaker Houghton Common Stock"},{"s":"KWY","n":"Kingsway Corporation Common Stock"},{"s":"KXIN","n":"Kaixin Holdings"},{"s":"KYIV","n":"Kyivstar Group Ltd. - Common Shares"},{"s":"KYMR","n":"Kymera Therapeutics, Inc."},{"s":"KYNB","n":"Kyntra Bio, Inc."},{"s":"KYTX","n":"Kyverna Therapeutics, Inc."},{"s":"KZIA","n":"Kazia Therapeutics Limited"},{"s":"L","n":"Loews Corporation Common Stock"},{"s":"LAB","n":"Standard BioTools Inc."},{"s":"LABT","n":"Lakewood-Amedex Biotherapeutics Inc."},{"s":"LAC","n":"Lithium Americas Corp. Common Shares"},{"s":"LAD","n":"Lithia Motors, Inc. Common Stock"},{"s":"LADR","n":"Ladder Capital Corp Class A Common Stock"},{"s":"LAES","n":"SEALSQ Corp"},{"s":"LAKE","n":"Lakeland Industries, Inc."},{"s":"LAMR","n":"Lamar Advertising Company"},{"s":"LAND","n":"Gladstone Land Corporation"},{"s":"LANV","n":"Lanvin Group Holdings Limited Ordinary Shares"},{"s":"LAR","n":"Lithium Argentina AG Common Shares"},{"s":"LARK","n":"Landmark Bancorp Inc."},{"s":"LASE","n":"Laser Photonics Corporation"},{"s":"LASR","n":"nLIGHT, Inc."},{"s":"LAUR","n":"Laureate Education, Inc."},{"s":"LAW","n":"CS Disco, Inc. Common Stock"},{"s":"LAWR","n":"Robot Consulting Co., Ltd."},{"s":"LAZ","n":"Lazard, Inc. Common Stock"},{"s":"LB","n":"LandBridge Company LLC Class A Shares Representing Limited Liability Company Interests"},{"s":"LBGJ","n":"Li Bang International Corporation Inc."},{"s":"LBRDA","n":"Liberty Broadband Corporation"},{"s":"LBRDK","n":"Liberty Broadband Corporation"},{"s":"LBRT","n":"Liberty Energy Inc. Class A common stock"},{"s":"LBRX","n":"LB Pharmaceuticals Inc"},{"s":"LBTYA","n":"Liberty Global Ltd."},{"s":"LBTYB","n":"Liberty Global Ltd."},{"s":"LBTYK","n":"Liberty Global Ltd."},{"s":"LCFY","n":"Locafy Limited - Ordinary Share"},{"s":"LCID","n":"Lucid Group, Inc."},{"s":"LCII","n":"LCI Industries"},{"s":"LCLN","n":"Lincoln International, Inc. Class A Common Stock"},{"s":"LCNB","n":"LCNB Corporation"},{"s":"LCTX","n":"Lineage Cell Therapeutics, Inc. Common Stock"},{"s":"LCUT","n":"Lifetime Brands, Inc."},{"s":"LDI","n":"loanDepot, Inc. Class A Common Stock"},{"s":"LDOS","n":"Leidos Holdings, Inc. Common Stock"},{"s":"LE","n":"Lands' End, Inc."},{"s":"LEA","n":"Lear Corporation Common Stock"},{"s":"LECO","n":"Lincoln Electric Holdings, Inc. - Common Shares"},{"s":"LEDS","n":"SemiLEDS Corporation"},{"s":"LEE","n":"Lee Enterprises, Incorporated"},{"s":"LEG","n":"Leggett & Platt, Incorporated Common Stock"},{"s":"LEGH","n":"Legacy Housing Corporation"},{"s":"LEGN","n":"Legend Biotech Corporation"},{"s":"LEGO","n":"Legato Merger Corp. IV Ordinary Shares"},{"s":"LEN","n":"Lennar Corporation Class A Common Stock"},{"s":"LEN-B","n":"Lennar Corporation Class B"},{"s":"LENZ","n":"LENZ Therapeutics, Inc."},{"s":"LEO","n":"BNY Mellon Strategic Municipals, Inc. Common Stock"},{"s":"LESL","n":"Leslie's, Inc."},{"s":"LEU","n":"Centrus Energy Corp. Class A Common Stock"},{"s":"LEVI","n":"Levi Strauss & Co Class A Common Stock"},{"s":"LEXX","n":"Lexaria Bioscience Corp."},{"s":"LFCR","n":"Lifecore Biomedical, Inc."},{"s":"LFMD","n":"LifeMD, Inc."},{"s":"LFS","n":"LEIFRAS Co., Ltd."},{"s":"LFST","n":"LifeStance Health Group, Inc."},{"s":"LFTO","n":"Liftoff Mobile, Inc."},{"s":"LFUS","n":"Littelfuse, Inc."},{"s":"LFVN","n":"Lifevantage Corporation"},{"s":"LFWD","n":"Lifeward Ltd."},{"s":"LGCL","n":"Lucas GC Limited"},{"s":"LGCY","n":"Legacy Education Inc. Common Stock"},{"s":"LGHL","n":"Lion Group Holding Ltd. - American Depositary Share"},{"s":"LGIH","n":"LGI Homes, Inc."},{"s":"LGL","n":"LGL Group, Inc. (The) Common Stock"},{"s":"LGN","n":"Legence Corp."},{"s":"LGND","n":"Ligand Pharmaceuticals Incorporated"},{"s":"LGO","n":"Largo Inc. - Common Shares"},{"s":"LGPS","n":"LogProstyle Inc. Common Shares"},{"s":"LGVN","n":"Longeveron Inc."},{"s":"LH","n":"Labcorp Holdings Inc. Common Stock"},{"s":"LHAI","n":"Linkhome Holdings Inc."},{"s":"LHSW","n":"Lianhe Sowell International Group Ltd"},{"s":"LHX","n":"L3Harris Technologies, Inc. Common Stock"},{"s":"LI","n":"Li Auto Inc."},{"s":"LICN","n":"Lichen International Limited"},{"s":"LIDR","n":"AEye, Inc."},{"s":"LIEN","n":"Chicago Atlantic BDC, Inc."},{"s":"LIF","n":"Life360, Inc."},{"s":"LIFE","n":"Ethos Technologies Inc."},{"s":"LII","n":"Lennox International, Inc. Common Stock"},{"s":"LILA","n":"Liberty Latin America Ltd."},{"s":"LILAK","n":"Liberty Latin America Ltd."},{"s":"LIME","n":"Neutron Holdings, Inc."},{"s":"LIMN","n":"Liminatus Pharma, Inc."},{"s":"LIMNW","n":"Liminatus Pharma, Inc. - Warrants"},{"s":"LIN","n":"Linde plc"},{"s":"LINC","n":"Lincoln Educational Services Corporation"},{"s":"LIND","n":"Lindblad Expeditions Holdings Inc."},{"s":"LINE","n":"Lineage, Inc."},{"s":"LINK","n":"Interlink Electronics, Inc."},{"s":"LION","n":"Lionsgate Studios Corp Common Shares"},{"s":"LIQT","n":"LiqTech International, Inc."},{"s":"LITB","n":"LightInTheBox Holding Co., Ltd. American Depositary Shares, each representing twelve ordinary shares"},{"s":"LITE","n":"Lumentum Holdings Inc."},{"s":"LITS","n":"Lite Strategy, Inc."},{"s":"LIVE","n":"Live Ventures Incorporated"},{"s":"LIVN","n":"LivaNova PLC"},{"s":"LKFN","n":"Lakeland Financial Corporation"},{"s":"LKFT","n":"Lakefront Biotherapeutics"},{"s":"LKQ","n":"LKQ Corporation"},{"s":"LLY","n":"Eli Lilly and Company Common Stock"},{"s":"LMAT","n":"LeMaitre Vascular, Inc."},{"s":"LMB","n":"Limbach Holdings, Inc."},{"s":"LMFA","n":"LM Funding America, Inc."},{"s":"LMND","n":"Lemonade, Inc. Common Stock"},{"s":"LMNR","n":"Limoneira Co"},{"s":"LMRI","n":"Lumexa Imaging Holdings, Inc."},{"s":"LMT","n":"Lockheed Martin Corporation Common Stock"},{"s":"LNAI","n":"Lunai Bioworks Inc."},{"s":"LNC","n":"Lincoln National Corporation Common Stock"},{"s":"LNG","n":"Cheniere Energy, Inc. Common Stock"},{"s":"LNKS","n":"Linkers Industries Limited"},{"s":"LNN","n":"Lindsay Corporation Common Stock"},{"s":"LNSR","n":"LENSAR, Inc."},{"s":"LNT","n":"Alliant Energy Corporation"},{"s":"LNTH","n":"Lantheus Holdings, Inc."},{"s":"LNZA","n":"LanzaTech Global, Inc."},{"s":"LOAN","n":"Manhattan Bridge Capital, Inc"},{"s":"LOAR","n":"Loar Holdings Inc. Common Stock"},{"s":"LOB","n":"Live Oak Bancshares, Inc. Common Stock"},{"s":"LOBO","n":"LOBO TECHNOLOGIES LTD."},{"s":"LOCL","n":"Local Bounti Corporation Common Stock"},{"s":"LOCO","n":"El Pollo Loco Holdings, Inc."},{"s":"LODE","n":"Comstock Inc. Common Stock"},{"s":"LOGI","n":"Logitech International S.A. - Registered Shares"},{"s":"LOMA","n":"Loma Negra Compania Industrial Argentina Sociedad Anonima ADS"},{"s":"LONA","n":"LeonaBio, Inc."},{"s":"LOOP","n":"Loop Industries, Inc."},{"s":"LOPE","n":"Grand Canyon Education, Inc."},{"s":"LOT","n":"Lotus Technology Inc."},{"s":"LOTWW","n":"Lotus Technology Inc. - Warrants"},{"s":"LOVE","n":"The Lovesac Company"},{"s":"LOW","n":"Lowe's Companies, Inc. Common Stock"},{"s":"LPA","n":"Logistic Properties of the Americas Ordinary Shares"},{"s":"LPCN","n":"Lipocine Inc."},{"s":"LPG","n":"Dorian LPG Ltd. Common Stock"},{"s":"LPL","n":"LG Display Co, Ltd AMERICAN DEPOSITORY SHARES"},{"s":"LPLA","n":"LPL Financial Holdings Inc."},{"s":"LPRO","n":"Open Lending Corporation"},{"s":"LPSN","n":"LivePerson, Inc."},{"s":"LPTH","n":"LightPath Technologies, Inc."},{"s":"LPX","n":"Louisiana-Pacific Corporation Common Stock"},{"s":"LQDA","n":"Liquidia Corporation"},{"s":"LQDT","n":"Liquidity Services, Inc."},{"s":"LRCX","n":"Lam Research Corporation"},{"s":"LRE","n":"Lead Real Estate Co., Ltd"},{"s":"LRHC","n":"La Rosa Holdings Corp."},{"s":"LRMR","n":"Larimar Therapeutics, Inc."},{"s":"LRN","n":"Stride, Inc. Common Stock"},{"s":"LSAK","n":"Lesaka Technologies, Inc."},{"s":"LSBK","n":"Lake Shore Bancorp, Inc."},{"s":"LSCC","n":"Lattice Semiconductor Corporation"},{"s":"LSE","n":"Leishen Energy Holding Co., Ltd."},{"s":"LSF","n":"Laird Superfood, Inc. Common Stock"},{"s":"LSH","n":"Lakeside Holding Limited"},{"s":"LSPD","n":"Lightspeed Commerce Inc. Subordinate Voting Shares"},{"s":"LSTA","n":"Lisata Therapeutics, Inc."},{"s":"LSTR","n":"Landstar System, Inc."},{"s":"LTBR","n":"Lightbridge Corporation"},{"s":"LTC","n":"LTC Properties, Inc. Common Stock"},{"s":"LTGRU","n":"Long Table Growth Corp. - Units"},{"s":"LTH","n":"Life Time Group Holdings, Inc. Common Stock"},{"s":"LTM","n":"LATAM Airlines Group S.A. American Depositary Shares (each representing two thousand (2,000) shares of Common Stock)"},{"s":"LTRN","n":"Lantern Pharma Inc."},{"s":"LTRX","n":"Lantronix, Inc."},{"s":"LU","n":"Lufax Holding Ltd American Depositary Shares, each representing two (2) Ordinary Shares"},{"s":"LUCD","n":"Lucid Diagnostics Inc."},{"s":"LUCK","n":"Lucky Strike Entertainment Corporation Class A Common Stock"},{"s":"LUCY","n":"Innovative Eyewear, Inc."},{"s":"LUCYW","n":"Innovative Eyewear, Inc. - Warrants"},{"s":"LUD","n":"Luda Technology Group Limited Ordinary Shares"},{"s":"LULU","n":"lululemon athletica inc."},{"s":"LUMN","n":"Lumen Technologies, Inc. Common Stock"},{"s":"LUNG","n":"Pulmonx Corporation"},{"s":"LUNR","n":"Intuitive Machines, Inc."},{"s":"LUV","n":"Southwest Airlines Company Common Stock"},{"s":"LUXE","n":"LuxExperience B.V. American Depositary Shares, each representing one Ordinary Share"},{"s":"LVLU","n":"Lulu's Fashion Lounge Holdings, Inc."},{"s":"LVO","n":"LiveOne, Inc."},{"s":"LVS","n":"Las Vegas Sands Corp. Common Stock"},{"s":"LVWR","n":"LiveWire Group, Inc. Common Stock"},{"s":"LW","n":"Lamb Weston Holdings, Inc. Common Stock"},{"s":"LWAY","n":"Lifeway Foods, Inc."},{"s":"LWLG","n":"Lightwave Logic, Inc."},{"s":"LX","n":"LexinFintech Holdings Ltd."},{"s":"LXEH","n":"Lixiang Education Holding Co., Ltd."},{"s":"LXEO","n":"Lexeo Therapeutics, Inc."},{"s":"LXFR","n":"Luxfer Holdings PLC Ordinary Shares"},{"s":"LXRX","n":"Lexicon Pharmaceuticals, Inc."},{"s":"LXU","n":"LSB Industries, Inc. Common Stock"},{"s":"LYB","n":"LyondellBasell Industries NV Ordinary Shares Class A (Netherlands)"},{"s":"LYEL","n":"Lyell Immunopharma, Inc."},{"s":"LYFT","n":"Lyft, Inc."},{"s":"LYG","n":"Lloyds Banking Group Plc American Depositary Shares"},{"s":"LYTS","n":"LSI Industries Inc."},{"s":"LYV","n":"Live Nation Entertainment, Inc. Common Stock"},{"s":"LZ","n":"LegalZoom.com, Inc."},{"s":"LZB","n":"La-Z-Boy Incorporated Common Stock"},{"s":"LZM","n":"Lifezone Metals Limited Ordinary Shares"},{"s":"LZM-W","n":"Lifezone Metals Limited Warrants"},{"s":"LZMH","n":"LZ Technology Holdings Limited"},{"s":"M","n":"Macy's Inc Common Stock"},{"s":"MA","n":"Mastercard Incorporated Common Stock"},{"s":"MAA","n":"Mid-America Apartment Communities, Inc. Common Stock"},{"s":"MAAS","n":"Maase Inc."},{"s":"MAC","n":"Macerich Company (The) Common Stock"},{"s":"MAGH","n":"Magnitude International Ltd"},{"s":"MAGN","n":"Magnera Corporation Common Stock"},{"s":"MAIA","n":"MAIA Biotechnology, Inc. Common Stock"},{"s":"MAIN","n":"Main Street Capital Corporation Common Stock"},{"s":"MAIR","n":"Madison Air Solutions Corporation Class A Common Stock"},{"s":"MAKO","n":"Mako Mining Corp"},{"s":"MAMA","n":"Mama's Creations, Inc."},{"s":"MAMK","n":"MaxsMaking Inc."},{"s":"MAMO","n":"Massimo Group"},{"s":"MAN","n":"ManpowerGroup Common Stock"},{"s":"MANE","n":"Veradermics, Incorporated Common Stock"},{"s":"MANH","n":"Manhattan Associates, Inc."},{"s":"MANU","n":"Manchester United Ltd. Class A Ordinary Shares"},{"s":"MAR","n":"Marriott International"},{"s":"MARA","n":"MARA Holdings, Inc."},{"s":"MAS","n":"Masco Corporation Common Stock"},{"s":"MASK","n":"3 E Network Technology Group Ltd"},{"s":"MASS","n":"908 Devices Inc."},{"s":"MAT","n":"Mattel, Inc."},{"s":"MATH","n":"Metalpha Technology Holding Limited"},{"s":"MATV","n":"Mativ Holdings, Inc. Common Stock"},{"s":"MATW","n":"Matthews International Corporation"},{"s":"MATX","n":"Matson, Inc. Common Stock"},{"s":"MAX","n":"MediaAlpha, Inc. Class A Common Stock"},{"s":"MAYS","n":"J. W. Mays, Inc."},{"s":"MAZE","n":"Maze Therapeutics, Inc."},{"s":"MB","n":"MasterBeef Group"},{"s":"MBAI","n":"Check-Cap Ltd. - Ordinary Share"},{"s":"MBBC","n":"Marathon Bancorp, Inc."},{"s":"MBC","n":"MasterBrand, Inc. Common Stock"},{"s":"MBGL","n":"Mobility Global Inc. Common Stock"},{"s":"MBI","n":"MBIA Inc. Common Stock"},{"s":"MBIN","n":"Merchants Bancorp"},{"s":"MBIO","n":"Mustang Bio, Inc."},{"s":"MBLY","n":"Mobileye Global Inc."},{"s":"MBOT","n":"Microbot Medical Inc."},{"s":"MBRX","n":"Moleculin Biotech, Inc."},{"s":"MBUU","n":"Malibu Boats, Inc."},{"s":"MBWM","n":"Mercantile Bank Corporation"},{"s":"MBX","n":"MBX Biosciences, Inc."},{"s":"MC","n":"Moelis & Company Class A Common Stock"},{"s":"MCB","n":"Metropolitan Bank Holding Corp. Common Stock"},{"s":"MCBS","n":"MetroCity Bankshares, Inc."},{"s":"MCD","n":"McDonald's Corporation Common Stock"},{"s":"MCFT","n":"MasterCraft Boat Holdings, Inc."},{"s":"MCHB","n":"Mechanics Bancorp"},{"s":"MCHP","n":"Microchip Technology Incorporated"},{"s":"MCHX","n":"Marchex, Inc."},{"s":"MCI","n":"Barings Corporate Investors Common Stock"},{"s":"MCK","n":"McKesson Corporation Common Stock"},{"s":"MCO","n":"Moody's Corporation Common Stock"},{"s":"MCRB","n":"Seres Therapeutics, Inc."},{"s":"MCRI","n":"Monarch Casino & Resort, Inc."},{"s":"MCRP","n":"Micropolis AI Robotics Ordinary Shares"},{"s":"MCS","n":"Marcus Corporation (The) Common Stock"},{"s":"MCTA","n":"Charming Medical Limited"},{"s":"MCY","n":"Mercury General Corporation Common Stock"},{"s":"MD","n":"Pediatrix Medical Group, Inc. Common Stock"},{"s":"MDA","n":"MDA Space Ltd. Common Shares"},{"s":"MDAI","n":"Spectral AI, Inc."},{"s":"MDAIW","n":"Spectral AI, Inc. - Warrants"},{"s":"MDB","n":"MongoDB, Inc."},{"s":"MDBH","n":"MDB Capital Holdings, LLC"},{"s":"MDCX","n":"Medicus Pharma Ltd."},{"s":"MDGL","n":"Madrigal Pharmaceuticals, Inc."},{"s":"MDIA","n":"Mediaco Holding Inc."},{"s":"MDLN","n":"Medline Inc."},{"s":"MDLZ","n":"Mondelez International, Inc."},{"s":"MDRR","n":"Medalist Diversified, Inc."},{"s":"MDT","n":"Medtronic plc. Ordinary Shares"},{"s":"MDU","n":"MDU Resources Group, Inc. Common Stock (Holding Company)"},{"s":"MDV","n":"Modiv Industrial, Inc. Class C Common Stock"},{"s":"MDWD","n":"MediWound Ltd."},{"s":"MDXG","n":"MiMedx Group, Inc"},{"s":"MDXH","n":"MDxHealth SA"},{"s":"MEC","n":"Mayville Engineering Company, Inc. Common Stock"},{"s":"MED","n":"MEDIFAST INC Common Stock"},{"s":"MEDP","n":"Medpace Holdings, Inc."},{"s":"MEGL","n":"Magic Empire Global Limited"},{"s":"MEI","n":"Methode Electronics, Inc. Common Stock"},{"s":"MELI","n":"MercadoLibre, Inc."},{"s":"MENS","n":"Jyong Biotech Ltd."},{"s":"MEOH","n":"Methanex Corporation"},{"s":"MERC","n":"Mercer International Inc."},{"s":"MESO","n":"Mesoblast Limited"},{"s":"MET","n":"MetLife, Inc. Common Stock"},{"s":"META","n":"Meta Platforms, Inc."},{"s":"METC","n":"Ramaco Resources, Inc."},{"s":"METCB","n":"Ramaco Resources, Inc."},{"s":"MFA","n":"MFA Financial, Inc."},{"s":"MFC","n":"Manulife Financial Corporation Common Stock"},{"s":"MFI","n":"mF International Limited"},{"s":"MFIN","n":"Medallion Financial Corp."},{"s":"MFP","n":"Midera Food Processing, Inc."},{"s":"MG","n":"Mistras Group Inc Common Stock"},{"s":"MGA","n":"Magna International, Inc. Common Stock"},{"s":"MGEE","n":"MGE Energy Inc."},{"s":"MGIH","n":"Millennium Group International Holdings Limited"},{"s":"MGLD","n":"The Marygold Companies, Inc. Common Stock"},{"s":"MGM","n":"MGM Resorts International Common Stock"},{"s":"MGN","n":"Megan Holdings Limited"},{"s":"MGNI","n":"Magnite, Inc."},{"s":"MGNX","n":"MacroGenics, Inc."},{"s":"MGPI","n":"MGP Ingredients, Inc."},{"s":"MGRC","n":"McGrath RentCorp"},{"s":"MGRT","n":"Mega Fortune Company Limited"},{"s":"MGRX","n":"Mangoceuticals, Inc."},{"s":"MGTX","n":"MeiraGTx Holdings plc"},{"s":"MGX","n":"Metagenomi Therapeutics, Inc."},{"s":"MGY","n":"Magnolia Oil & Gas Corporation Class A Common Stock"},{"s":"MGYR","n":"Magyar Bancorp, Inc."},{"s":"MH","n":"McGraw Hill, Inc. Common Stock"},{"s":"MHH","n":"Mastech Digital, Inc Common Stock"},{"s":"MHK","n":"Mohawk Industries, Inc. Common Stock"},{"s":"MHO","n":"M/I Homes, Inc. Common Stock"},{"s":"MI","n":"NFT Limited Class A Ordinary Share"},{"s":"MIAX","n":"Miami International Holdings, Inc. Common Stock"},{"s":"MICC","n":"The Magnum Ice Cream Company N.V. Ordinary Shares"},{"s":"MIDD","n":"The Middleby Corporation"},{"s":"MIMI","n":"Mint Incorporation Limited"},{"s":"MIND","n":"MIND Technology, Inc."},{"s":"MINE","n":"Mayfair Gold Corp. Common Shares"},{"s":"MIR","n":"Mirion Technologies, Inc. Class A Common Stock"},{"s":"MIRA","n":"MIRA Pharmaceuticals, Inc."},{"s":"MIRM","n":"Mirum Pharmaceuticals, Inc."},{"s":"MIST","n":"Milestone Pharmaceuticals Inc. - Common Shares"},{"s":"MITK","n":"Mitek Systems, Inc."},{"s":"MITQ","n":"Moving iMage Technologies, Inc. Common Stock"},{"s":"MKC","n":"McCormick & Company, Incorporated Common Stock"},{"s":"MKC-V","n":"McCormick & Company, Incorporated Common Stock"},{"s":"MKDW","n":"MKDWELL Tech Inc."},{"s":"MKDWW","n":"MKDWELL Tech Inc. - Warrants"},{"s":"MKL","n":"Markel Group Inc. Common Stock"},{"s":"MKSI","n":"MKS Inc."},{"s":"MKTW","n":"MarketWise, Inc."},{"s":"MKTX","n":"MarketAxess Holdings, Inc."},{"s":"MKZR","n":"MacKenzie Realty Capital, Inc."},{"s":"MLAB","n":"Mesa Laboratories, Inc."},{"s":"MLCI","n":"Mount Logan Capital Inc."},{"s":"MLCO","n":"Melco Resorts & Entertainment Limited"},{"s":"MLEC","n":"Moolec Science SA"},{"s":"MLGO","n":"MicroAlgo, Inc."},{"s":"MLI","n":"Mueller Industries, Inc. Common Stock"},{"s":"MLKN","n":"MillerKnoll, Inc."},{"s":"MLM","n":"Martin Marietta Materials, Inc. Common Stock"},{"s":"MLP","n":"Maui Land & Pineapple Company, Inc. Common Stock"},{"s":"MLR","n":"Miller Industries, Inc. Common Stock"},{"s":"MLSS","n":"Milestone Scientific, Inc. Common Stock"},{"s":"MLTX","n":"MoonLake Immunotherapeutics"},{"s":"MLYS","n":"Mineralys Therapeutics, Inc."},{"s":"MMA","n":"Mixed Martial Arts Group Limited Ordinary Shares"},{"s":"MMED","n":"MiniMed Group, Inc."},{"s":"MMI","n":"Marcus & Millichap, Inc. Common Stock"},{"s":"MMLP","n":"Martin Midstream Partners L.P. - Common Units Representing Limited Partnership Interests"},{"s":"MMM","n":"3M Company Common Stock"},{"s":"MMS","n":"Maximus, Inc. Common Stock"},{"s":"MMSI","n":"Merit Medical Systems, Inc."},{"s":"MMYT","n":"MakeMyTrip Limited"},{"s":"MNDO","n":"MIND C.T.I. Ltd."},{"s":"MNDR","n":"Mobile-health Network Solutions"},{"s":"MNDY","n":"monday.com Ltd."},{"s":"MNKD","n":"MannKind Corporation"},{"s":"MNOV","n":"MediciNova, Inc."},{"s":"MNPR","n":"Monopar Therapeutics Inc."},{"s":"MNRO","n":"Monro, Inc."},{"s":"MNSB","n":"MainStreet Bancshares, Inc."},{"s":"MNSBP","n":"MainStreet Bancshares, Inc. - Depositary Shares"},{"s":"MNSO","n":"MINISO Group Holding Limited American Depositary Shares, each representing four Ordinary Shares"},{"s":"MNST","n":"Monster Beverage Corporation"},{"s":"MNTK","n":"Montauk Renewables, Inc."},{"s":"MNTN","n":"MNTN, Inc. Class A Common Stock"},{"s":"MNTS","n":"Momentus Inc."},{"s":"MNY","n":"MoneyHero Limited"},{"s":"MNYWW","n":"MoneyHero Limited - Warrants"},{"s":"MO","n":"Altria Group, Inc."},{"s":"MOB","n":"Mobilicom Limited"},{"s":"MOBBW","n":"Mobilicom Limited - Warrants"},{"s":"MOBI","n":"Mobia Medical, Inc."},{"s":"MOBX","n":"Mobix Labs, Inc."},{"s":"MOBXW","n":"Mobix Labs, Inc. - Warrants"},{"s":"MOD","n":"Modine Manufacturing Company Common Stock"},{"s":"MODD","n":"Modular Medical, Inc."},{"s":"MOG-A","n":"Moog Inc. Class A Common Stock"},{"s":"MOG-B","n":"Moog Inc. Class B Common Stock"},{"s":"MOGU","n":"MOGU Inc. American Depositary Shares (each representing 25 Class A Ordinary Shares)"},{"s":"MOH","n":"Molina Healthcare Inc Common Stock"},{"s":"MOLN","n":"Molecular Partners AG"},{"s":"MOMO","n":"Hello Group Inc."},{"s":"MORN","n":"Morningstar, Inc."},{"s":"MOS","n":"Mosaic Company (The) Common Stock"},{"s":"MOV","n":"Movado Group Inc. Common Stock"},{"s":"MOVE","n":"Corvex, Inc."},{"s":"MP","n":"MP Materials Corp. Common Stock"},{"s":"MPAA","n":"Motorcar Parts of America, Inc."},{"s":"MPB","n":"Mid Penn Bancorp"},{"s":"MPC","n":"Marathon Petroleum Corporation Common Stock"},{"s":"MPLT","n":"MapLight Therapeutics, Inc."},{"s":"MPTI","n":"M-tron Industries, Inc. Common Stock"},{"s":"MPU","n":"Mega Matrix Inc. Class A Ordinary Shares"},{"s":"MPV","n":"Barings Participation Investors Common Stock"},{"s":"MPWR","n":"Monolithic Power Systems, Inc."},{"s":"MQ","n":"Marqeta, Inc."},{"s":"MRAM","n":"Everspin Technologies, Inc."},{"s":"MRBK","n":"Meridian Corporation"},{"s":"MRCY","n":"Mercury Systems Inc"},{"s":"MRDN","n":"Meridian Holdings Inc."},{"s":"MREO","n":"Mereo BioPharma Group plc"},{"s":"MRK","n":"Merck & Company, Inc. Common Stock (new)"},{"s":"MRKR","n":"Marker Therapeutics, Inc."},{"s":"MRLN","n":"Merlin, Inc."},{"s":"MRM","n":"MEDIROM Healthcare Technologies Inc. - American Depositary Share"},{"s":"MRNA","n":"Moderna, Inc."},{"s":"MRNO","n":"Murano Global Investments PLC"},{"s":"MRNOW","n":"Murano Global Investments PLC - Warrants"},{"s":"MRP","n":"Millrose Properties, Inc. Class A Common Stock"},{"s":"MRSH","n":"Marsh Common Stock"},{"s":"MRT","n":"Marti Technologies, Inc. Class A Ordinary Shares"},{"s":"MRTN","n":"Marten Transport, Ltd."},{"s":"MRVI","n":"Maravai LifeSciences Holdings, Inc."},{"s":"MRVL","n":"Marvell Technology, Inc."},{"s":"MRX","n":"Marex Group Limited"},{"s":"MS","n":"Morgan Stanley Common Stock"},{"s":"MSA","n":"MSA Safety Incorporated Common Stock"},{"s":"MSAI","n":"MultiSensor AI Holdings, Inc."},{"s":"MSAIW","n":"MultiSensor AI Holdings, Inc. - Warrants"},{"s":"MSBI","n":"Midland States Bancorp, Inc."},{"s":"MSC","n":"Studio City International Holdings Limited American depositary shares, each representing four Class A ordinary shares"},{"s":"MSCI","n":"MSCI Inc. Common Stock"},{"s":"MSEX","n":"Middlesex Water Company"},{"s":"MSFT","n":"Microsoft Corporation"},{"s":"MSGE","n":"Madison Square Garden Entertainment Corp. Class A Common Stock"},{"s":"MSGM","n":"Motorsport Games Inc."},{"s":"MSGS","n":"Madison Square Garden Sports Corp. Class A Common Stock (New)"},{"s":"MSGY","n":"Masonglory Limited"},{"s":"MSI","n":"Motorola Solutions, Inc. Common Stock"},{"s":"MSLE","n":"Satellos Bioscience Inc."},{"s":"MSM","n":"MSC Industrial Direct Company, Inc. Common Stock"},{"s":"MSN","n":"Emerson Radio Corporation Common Stock"},{"s":"MSS","n":"Maison Solutions Inc."},{"s":"MSTR","n":"Strategy Inc"},{"s":"MT","n":"Arcelor Mittal NY Registry Shares NEW"},{"s":"MTA","n":"Metalla Royalty & Streaming Ltd. Common Shares"},{"s":"MTB","n":"M&T Bank Corporation Common Stock"},{"s":"MTC","n":"MMTec, Inc. - Common Shares"},{"s":"MTCH","n":"Match Group, Inc."},{"s":"MTD","n":"Mettler-Toledo International, Inc. Common Stock"},{"s":"MTDR","n":"Matador Resources Company Common Stock"},{"s":"MTEK","n":"Maris-Tech Ltd."},{"s":"MTEKW","n":"Maris-Tech Ltd. - Warrants"},{"s":"MTEN","n":"Mingteng International Corporation Inc."},{"s":"MTEX","n":"Mannatech, Incorporated"},{"s":"MTG","n":"MGIC Investment Corporation Common Stock"},{"s":"MTH","n":"Meritage Homes Corporation Common Stock"},{"s":"MTLS","n":"Materialise NV"},{"s":"MTN","n":"Vail Resorts, Inc. Common Stock"},{"s":"MTNB","n":"Matinas Biopharma Holdings, Inc. Common Stock"},{"s":"MTNE","n":"CH4 Natural Solutions Corporation Class A Ordinary Shares"},{"s":"MTRN","n":"Materion Corporation"},{"s":"MTRX","n":"Matrix Service Company"},{"s":"MTSI","n":"MACOM Technology Solutions Holdings, Inc."},{"s":"MTUS","n":"Metallus Inc. Common Shares"},{"s":"MTVA","n":"MetaVia Inc."},{"s":"MTW","n":"Manitowoc Company, Inc. (The) Common Stock"},{"s":"MTX","n":"Minerals Technologies Inc. Common Stock"},{"s":"MTZ","n":"MasTec, Inc. Common Stock"},{"s":"MU","n":"Micron Technology, Inc."},{"s":"MUFG","n":"Mitsubishi UFJ Financial Group, Inc. Common Stock"},{"s":"MUR","n":"Murphy Oil Corporation Common Stock"},{"s":"MUSA","n":"Murphy USA Inc. Common Stock"},{"s":"MUX","n":"McEwen Inc. Common Stock"},{"s":"MVBF","n":"MVB Financial Corp."},{"s":"MVIS","n":"MicroVision, Inc."},{"s":"MVST","n":"Microvast Holdings, Inc."},{"s":"MWA","n":"MUELLER WATER PRODUCTS Common Stock"},{"s":"MWC","n":"Micware Co., Ltd."},{"s":"MWG","n":"Multi Ways Holdings Limited Class A Ordinary Shares"},{"s":"MWH","n":"SOLV Energy, Inc."},{"s":"MWYN","n":"Marwynn Holdings, Inc."},{"s":"MX","n":"Magnachip Semiconductor Corporation Common Stock"},{"s":"MXC","n":"Mexco Energy Corporation Common Stock"},{"s":"MXCT","n":"MaxCyte, Inc."},{"s":"MXL","n":"MaxLinear, Inc"},{"s":"MYE","n":"Myers Industries, Inc. Common Stock"},{"s":"MYFW","n":"First Western Financial, Inc."},{"s":"MYGN","n":"Myriad Genetics, Inc."},{"s":"MYND","n":"Mynd.ai, Inc. American Depositary Shares"},{"s":"MYO","n":"Myomo Inc. Common Stock"},{"s":"MYPS","n":"PLAYSTUDIOS, Inc."},{"s":"MYRG","n":"MYR Group, Inc."},{"s":"MYSE","n":"Myseum.AI, Inc."},{"s":"MYSZ","n":"My Size, Inc."},{"s":"MZTI","n":"The Marzetti Company"},{"s":"NA","n":"Nano Labs Ltd"},{"s":"NAAS","n":"NaaS Technology Inc."},{"s":"NABL","n":"N-able, Inc. Common Stock"},{"s":"NAGE","n":"Niagen Bioscience, Inc."},{"s":"NAII","n":"Natural Alternatives International, Inc."},{"s":"NAK","n":"Northern Dynasty Minerals, Ltd. Common Stock"},{"s":"NAKA","n":"Nakamoto Inc."},{"s":"NAMI","n":"Jinxin Technology Holding Company"},{"s":"NAMM","n":"Namib Minerals"},{"s":"NAMMW","n":"Namib Minerals - Warrants"},{"s":"NAMS","n":"NewAmsterdam Pharma Company N.V."},{"s":"NAT","n":"Nordic American Tankers Limited Common Stock"},{"s":"NATH","n":"Nathan's Famous, Inc."},{"s":"NATL","n":"NCR Atleos Corporation Common Stock"},{"s":"NATR","n":"Nature's Sunshine Products, Inc."},{"s":"NAUT","n":"Nautilus Biotechnology, Inc."},{"s":"NAVI","n":"Navient Corporation"},{"s":"NAVN","n":"Navan, Inc."},{"s":"NB","n":"NioCorp Developments Ltd."},{"s":"NBBK","n":"NB Bancorp, Inc."},{"s":"NBHC","n":"National Bank Holdings Corporation Common Stock"},{"s":"NBIS","n":"Nebius Group N.V."},{"s":"NBIX","n":"Neurocrine Biosciences, Inc."},{"s":"NBN","n":"Northeast Bank"},{"s":"NBP","n":"NovaBridge Biosciences"},{"s":"NBR","n":"Nabors Industries Ltd."},{"s":"NBTB","n":"NBT Bancorp Inc."},{"s":"NBTX","n":"Nanobiotix S.A. - ADSs"},{"s":"NC","n":"NACCO Industries, Inc. Common Stock"},{"s":"NCDL","n":"Nuveen Churchill Direct Lending Corp. Common Stock"},{"s":"NCEL","n":"NewcelX Ltd."},{"s":"NCEW","n":"New Century Logistics (BVI) Limited"},{"s":"NCI","n":"Neo-Concept International Group Holdings Limited"},{"s":"NCL","n":"Northann Corp. Common Stock"},{"s":"NCLH","n":"Norwegian Cruise Line Holdings Ltd. Ordinary Shares"},{"s":"NCMI","n":"National CineMedia, Inc."},{"s":"NCNA","n":"NuCana plc"},{"s":"NCNO","n":"nCino, Inc."},{"s":"NCPL","n":"Netcapital Inc."},{"s":"NCPLW","n":"Netcapital Inc. - warrants"},{"s":"NCRA","n":"Nocera, Inc."},{"s":"NCSM","n":"NCS Multistage Holdings, Inc."},{"s":"NCT","n":"Intercont (Cayman) Limited"},{"s":"NCTY","n":"The9 Limited - American Depository Shares"},{"s":"NDAQ","n":"Nasdaq, Inc."},{"s":"NDLS","n":"Noodles & Company"},{"s":"NDRA","n":"ENDRA Life Sciences Inc."},{"s":"NDSN","n":"Nordson Corporation"},{"s":"NE","n":"Noble Corporation plc A Ordinary Shares"},{"s":"NE-A","n":"Noble Corporation plc Tranche 2 Warrants"},{"s":"NE-W","n":"Noble Corporation plc Tranche 1 Warrants"},{"s":"NECB","n":"NorthEast Community Bancorp, Inc."},{"s":"NEE","n":"NextEra Energy, Inc. Common Stock"},{"s":"NEGG","n":"Newegg Commerce, Inc. - Common Shares"},{"s":"NEM","n":"Newmont Corporation"},{"s":"NEO","n":"NeoGenomics, Inc."},{"s":"NEOG","n":"Neogen Corporation"},{"s":"NEON","n":"Neonode Inc."},{"s":"NEOV","n":"NeoVolta Inc."},{"s":"NEPH","n":"Nephros, Inc."},{"s":"NERV","n":"Minerva Neurosciences, Inc"},{"s":"NESR","n":"National Energy Services Reunited Corp"},{"s":"NET","n":"Cloudflare, Inc. Class A Common Stock"},{"s":"NEU","n":"NewMarket Corp Common Stock"},{"s":"NEUP","n":"Neuphoria Therapeutics Inc."},{"s":"NEWP","n":"New Pacific Metals Corp. Common Shares"},{"s":"NEWT","n":"NewtekOne, Inc."},{"s":"NEXA","n":"Nexa Resources S.A. Common Shares"},{"s":"NEXM","n":"NexMetals Mining Corp."},{"s":"NEXN","n":"Nexxen International Ltd."},{"s":"NEXR","n":"Nexera Technologies Ltd"},{"s":"NEXT","n":"NextDecade Corporation"},{"s":"NFBK","n":"Northfield Bancorp, Inc."},{"s":"NFE","n":"New Fortress Energy Inc."},{"s":"NFG","n":"National Fuel Gas Company Common Stock"},{"s":"NFGC","n":"New Found Gold Corp Common Shares"},{"s":"NFLX","n":"Netflix, Inc."},{"s":"NG","n":"Novagold Resources Inc."},{"s":"NGEN","n":"NervGen Pharma Corp."},{"s":"NGG","n":"National Grid Transco, PLC National Grid PLC (NEW) American Depositary Shares"},{"s":"NGNE","n":"Neurogene Inc."},{"s":"NGS","n":"Natural Gas Services Group, Inc. Common Stock"},{"s":"NGVC","n":"Natural Grocers by Vitamin Cottage, Inc. Common Stock"},{"s":"NGVT","n":"Ingevity Corporation Common Stock"},{"s":"NHC","n":"National HealthCare Corporation Common Stock"},{"s":"NHI","n":"National Health Investors, Inc. Common Stock"},{"s":"NHIC","n":"NewHold Investment Corp III"},{"s":"NHICU","n":"NewHold Investment Corp III - Units"},{"s":"NHICW","n":"NewHold Investment Corp III - Warrants"},{"s":"NHIV","n":"NewHold Investment Corp IV"},{"s":"NHIVU","n":"NewHold Investment Corp IV - Units"},{"s":"NHIVW","n":"NewHold Investment Corp IV - Warrants"},{"s":"NHP","n":"National Healthcare Properties, Inc."},{"s":"NHTC","n":"Natural Health Trends Corp."},{"s":"NI","n":"NiSource Inc Common Stock"},{"s":"NIC","n":"Nicolet Bankshares Inc. Common Stock"},{"s":"NICE","n":"NICE Ltd"},{"s":"NICM","n":"Nicola Mining Inc."},{"s":"NINE","n":"Nine Energy Service, Inc. Common Stock"},{"s":"NIO","n":"NIO Inc. American depositary shares, each representing one Class A ordinary share"},{"s":"NIPG","n":"NIP Group Inc."},{"s":"NIQ","n":"NIQ Global Intelligence plc Ordinary Shares"},{"s":"NIU","n":"Niu Technologies"},{"s":"NIVF","n":"NewGenIvf Group Limited"},{"s":"NIVFW","n":"NewGenIvf Group Limited - Warrants"},{"s":"NIXX","n":"Nixxy, Inc."},{"s":"NJR","n":"NewJersey Resources Corporation Common Stock"},{"s":"NKE","n":"Nike, Inc. Common Stock"},{"s":"NKLR","n":"Terra Innovatum Global N.V."},{"s":"NKSH","n":"National Bankshares, Inc."},{"s":"NKTR","n":"Nektar Therapeutics"},{"s":"NKTX","n":"Nkarta, Inc."},{"s":"NL","n":"NLI Holdings, Inc. Common Stock"},{"s":"NLOP","n":"Net Lease Office Properties Common Shares of Beneficial Interest"},{"s":"NLY","n":"Annaly Capital Management Inc. Common Stock"},{"s":"NMAD","n":"Nomad Power Solutions, Inc."},{"s":"NMAX","n":"Newsmax, Inc. Class B Common Stock"},{"s":"NMFC","n":"New Mountain Finance Corporation"},{"s":"NMG","n":"Nouveau Monde Graphite Inc. Common Shares"},{"s":"NMIH","n":"NMI Holdings Inc"},{"s":"NMRA","n":"Neumora Therapeutics, Inc."},{"s":"NMRK","n":"Newmark Group, Inc."},{"s":"NMTC","n":"NeuroOne Medical Technologies Corporation"},{"s":"NN","n":"NextNav Inc."},{"s":"NNBR","n":"NN, Inc."},{"s":"NNDM","n":"Nano Dimension Ltd."},{"s":"NNE","n":"Nano Nuclear Energy Inc."},{"s":"NNI","n":"Nelnet, Inc. Common Stock"},{"s":"NNNN","n":"Anbio Biotechnology"},{"s":"NNOX","n":"NANO-X IMAGING LTD"},{"s":"NNVC","n":"NanoViricides, Inc. Common Stock"},{"s":"NOA","n":"North American Construction Group Ltd. Common Shares (no par)"},{"s":"NOAH","n":"Noah Holdings Limited American Depositary Shares"},{"s":"NOC","n":"Northrop Grumman Corporation Common Stock"},{"s":"NODK","n":"NI Holdings, Inc."},{"s":"NOEM","n":"CO2 Energy Transition Corp."},{"s":"NOG","n":"Northern Oil and Gas, Inc. Common Stock"},{"s":"NOK","n":"Nokia Corporation Sponsored American Depositary Shares"},{"s":"NOMA","n":"NOMADAR Corp."},{"s":"NOMD","n":"Nomad Foods Limited Ordinary Shares"},{"s":"NOV","n":"NOV Inc. Common Stock"},{"s":"NOVT","n":"Novanta Inc. - Common Shares"},{"s":"NOVTU","n":"Novanta Inc. - Tangible Equity Units"},{"s":"NOW","n":"ServiceNow, Inc. Common Stock"},{"s":"NP","n":"Neptune Insurance Holdings Inc. Class A Common Stock"},{"s":"NPB","n":"Northpointe Bancshares, Inc. Common Stock"},{"s":"NPCE","n":"Neuropace, Inc."},{"s":"NPK","n":"National Presto Industries, Inc. Common Stock"},{"s":"NPKI","n":"NPK International Inc. Common Stock"},{"s":"NPO","n":"Enpro Inc. Common Stock"},{"s":"NPT","n":"Texxon Holding Limited"},{"s":"NPWR","n":"NET Power Inc. Class A Common Stock"},{"s":"NRC","n":"NRC Health"},{"s":"NRDS","n":"NerdWallet, Inc."},{"s":"NRDY","n":"Nerdy Inc. Class A Common Stock"},{"s":"NREF","n":"NexPoint Real Estate Finance, Inc. Common Stock"},{"s":"NRG","n":"NRG Energy, Inc. Common Stock"},{"s":"NRGV","n":"Energy Vault Holdings, Inc. Common Stock"},{"s":"NRIM","n":"Northrim BanCorp Inc"},{"s":"NRIX","n":"Nurix Therapeutics, Inc."},{"s":"NRSN","n":"NeuroSense Therapeutics Ltd."},{"s":"NRXP","n":"NRX Pharmaceuticals, Inc."},{"s":"NRXS","n":"Neuraxis, Inc. Common Stock"},{"s":"NSC","n":"Norfolk Southern Corporation Common Stock"},{"s":"NSIT","n":"Insight Enterprises, Inc."},{"s":"NSP","n":"Insperity, Inc. Common Stock"},{"s":"NSPR","n":"InspireMD Inc."},{"s":"NSRX","n":"Nasus Pharma Ltd. Ordinary Shares"},{"s":"NSSC","n":"NAPCO Security Technologies, Inc."},{"s":"NSTS","n":"NSTS Bancorp, Inc."},{"s":"NSYS","n":"Nortech Systems Incorporated"},{"s":"NTAP","n":"NetApp, Inc."},{"s":"NTB","n":"Bank of N.T. Butterfield & Son Limited (The) Voting Ordinary Shares"},{"s":"NTCL","n":"NETCLASS TECHNOLOGY INC"},{"s":"NTCT","n":"NetScout Systems, Inc."},{"s":"NTES","n":"NetEase, Inc."},{"s":"NTGR","n":"NETGEAR, Inc."},{"s":"NTHI","n":"NeOnc Technologies Holdings, Inc."},{"s":"NTIC","n":"Northern Technologies International Corporation"},{"s":"NTIP","n":"Network-1 Technologies, Inc. Common Stock"},{"s":"NTLA","n":"Intellia Therapeutics, Inc."},{"s":"NTNX","n":"Nutanix, Inc."},{"s":"NTR","n":"Nutrien Ltd. Common Shares"},{"s":"NTRA","n":"Natera, Inc."},{"s":"NTRB","n":"Nutriband Inc."},{"s":"NTRP","n":"NextTrip, Inc."},{"s":"NTSK","n":"Netskope, Inc."},{"s":"NTST","n":"NetSTREIT Corp. Common Stock"},{"s":"NTWK","n":"NETSOL Technologies Inc."},{"s":"NTZ","n":"Natuzzi, S.p.A."},{"s":"NU","n":"Nu Holdings Ltd. Class A Ordinary Shares"},{"s":"NUAI","n":"New Era Energy & Digital, Inc."},{"s":"NUAIW","n":"New Era Energy & Digital, Inc. - Warrants"},{"s":"NUCL","n":"Eagle Nuclear Energy Corp."},{"s":"NUCLW","n":"Eagle Nuclear Energy Corp. - Warrants"},{"s":"NUE","n":"Nucor Corporation Common Stock"},{"s":"NUS","n":"Nu Skin Enterprises, Inc. Common Stock"},{"s":"NUTR","n":"Nusatrip Incorporated"},{"s":"NUTX","n":"Nutex Health Inc."},{"s":"NUVB","n":"Nuvation Bio Inc. Class A Common Stock"},{"s":"NUWE","n":"Nuwellis, Inc."},{"s":"NVA","n":"Nova Minerals Corp Common Stock"},{"s":"NVA-W","n":"Nova Minerals Corp Warrants to Purchase Common Stock"},{"s":"NVAX","n":"Novavax, Inc."},{"s":"NVCR","n":"NovoCure Limited"},{"s":"NVCT","n":"Nuvectis Pharma, Inc."},{"s":"NVDA","n":"NVIDIA Corporation"},{"s":"NVEC","n":"NVE Corporation"},{"s":"NVGS","n":"Navigator Holdings Ltd. Ordinary Shares (Marshall Islands)"},{"s":"NVMI","n":"Nova Ltd."},{"s":"NVNI","n":"Nvni Group Limited"},{"s":"NVNIW","n":"Nvni Group Limited - Warrants"},{"s":"NVNO","n":"enVVeno Medical Corporation"},{"s":"NVO","n":"Novo Nordisk A/S Common Stock"},{"s":"NVR","n":"NVR, Inc. Common Stock"},{"s":"NVRI","n":"Enviri Corporation Common Stock"},{"s":"NVS","n":"Novartis AG Common Stock"},{"s":"NVST","n":"Envista Holdings Corporation Common Stock"},{"s":"NVT","n":"nVent Electric plc Ordinary Shares"},{"s":"NVTS","n":"Navitas Semiconductor Corporation"},{"s":"NVVE","n":"Nuvve Holding Corp."},{"s":"NVX","n":"NOVONIX Limited - American Depository Shares"},{"s":"NWBI","n":"Northwest Bancshares, Inc."},{"s":"NWE","n":"NorthWestern Energy Group, Inc."},{"s":"NWFL","n":"Norwood Financial Corp."},{"s":"NWG","n":"NatWest Group plc American Depositary Shares, (each representing two (2) Ordinary Shares)"},{"s":"NWGL","n":"CL Workshop Group Limited"},{"s":"NWL","n":"Newell Brands Inc."},{"s":"NWN","n":"Northwest Natural Holding Company Common Stock"},{"s":"NWPX","n":"NWPX Infrastructure, Inc."},{"s":"NWS","n":"News Corporation"},{"s":"NWSA","n":"News Corporation"},{"s":"NWTG","n":"Newton Golf Company, Inc."},{"s":"NX","n":"Quanex Building Products Corporation Common Stock"},{"s":"NXB","n":"NextBoat Inc. Common Stcok"},{"s":"NXDR","n":"Nextdoor Holdings, Inc. Class A Common Stock"},{"s":"NXE","n":"Nexgen Energy Ltd. Common Shares"},{"s":"NXGL","n":"NexGel, Inc"},{"s":"NXL","n":"Nexalin Technology, Inc."},{"s":"NXPI","n":"NXP Semiconductors N.V."},{"s":"NXPL","n":"NextPlat Corp"},{"s":"NXST","n":"Nexstar Media Group, Inc."},{"s":"NXT","n":"Nextpower Inc."},{"s":"NXTC","n":"NextCure, Inc."},{"s":"NXTS","n":"Nexentis Technologies Inc."},{"s":"NXTT","n":"Next Technology Holding Inc."},{"s":"NXXT","n":"NextNRG, Inc."},{"s":"NYAX","n":"Nayax Ltd."},{"s":"NYC","n":"American Strategic Investment Co. Class A Common Stock"},{"s":"NYT","n":"New York Times Company (The) Common Stock"},{"s":"NYXH","n":"Nyxoah SA"},{"s":"O","n":"Realty Income Corporation Common Stock"},{"s":"OABI","n":"OmniAb, Inc."},{"s":"OBAI","n":"Our Bond, Inc."},{"s":"OBDC","n":"Blue Owl Capital Corporation Common Stock"},{"s":"OBE","n":"Obsidian Energy Ltd. Common Shares"},{"s":"OBIO","n":"Orchestra BioMed Holdings, Inc."},{"s":"OBK","n":"Origin Bancorp, Inc. Common Stock"},{"s":"OBT","n":"Orange County Bancorp, Inc."},{"s":"OC","n":"Owens Corning Inc Common Stock New"},{"s":"OCC","n":"Optical Cable Corporation"},{"s":"OCFC","n":"OceanFirst Financial Corp."},{"s":"OCG","n":"Oriental Culture Holding LTD"},{"s":"OCGN","n":"Ocugen, Inc."},{"s":"OCS","n":"Oculis Holding AG"},{"s":"OCSAW","n":"Oculis Holding AG - Warrants"},{"s":"OCTV","n":"Octave Intelligence plc"},{"s":"OCUL","n":"Ocular Therapeutix, Inc."},{"s":"ODC","n":"Oil-Dri Corporation Of America Common Stock"},{"s":"ODD","n":"ODDITY Tech Ltd."},{"s":"ODFL","n":"Old Dominion Freight Line, Inc."},{"s":"ODTX","n":"Odyssey Therapeutics, Inc."},{"s":"ODV","n":"Osisko Development Corp. Common Shares"},{"s":"ODYS","n":"Odysight.ai Inc."},{"s":"OEC","n":"Orion S.A. Common Shares"},{"s":"OESX","n":"Orion Energy Systems, Inc."},{"s":"OFAL","n":"OFA Group"},{"s":"OFG","n":"OFG Bancorp Common Stock"},{"s":"OFIX","n":"Orthofix Medical Inc."},{"s":"OFLX","n":"Omega Flex, Inc."},{"s":"OFRM","n":"Once Upon a Farm, PBC Common Stock"},{"s":"OGC","n":"OceanaGold Corporation Common Shares"},{"s":"OGE","n":"OGE Energy Corp Common Stock"},{"s":"OGEN","n":"Oragenics Inc. Common Stock"},{"s":"OGI","n":"Organigram Global Inc. - Common Shares"},{"s":"OGN","n":"Organon & Co. Common Stock"},{"s":"OGS","n":"ONE Gas, Inc. Common Stock"},{"s":"OHI","n":"Omega Healthcare Investors, Inc. Common Stock"},{"s":"OI","n":"O-I Glass, Inc. Common Stock"},{"s":"OII","n":"Oceaneering International, Inc. Common Stock"},{"s":"OIO","n":"OIO Group"},{"s":"OIOWW","n":"OIO Group - Warrants"},{"s":"OIS","n":"Oil States International, Inc. Common Stock"},{"s":"OKE","n":"ONEOK, Inc. Common Stock"},{"s":"OKLO","n":"Oklo Inc. Class A common stock"},{"s":"OKTA","n":"Okta, Inc."},{"s":"OKUR","n":"OnKure Therapeutics, Inc."},{"s":"OKYO","n":"OKYO Pharma Limited"},{"s":"OLB","n":"The OLB Group, Inc."},{"s":"OLED","n":"Universal Display Corporation"},{"s":"OLLI","n":"Ollie's Bargain Outlet Holdings, Inc."},{"s":"OLMA","n":"Olema Pharmaceuticals, Inc."},{"s":"OLN","n":"Olin Corporation Common Stock"},{"s":"OLOX","n":"Olenox Industries Inc."},{"s":"OLP","n":"One Liberty Properties, Inc. Common Stock"},{"s":"OM","n":"Outset Medical, Inc."},{"s":"OMC","n":"Omnicom Group Inc. Common Stock"},{"s":"OMCL","n":"Omnicell, Inc."},{"s":"OMDA","n":"Omada Health, Inc."},{"s":"OMER","n":"Omeros Corporation"},{"s":"OMEX","n":"Odyssey Marine Exploration, Inc."},{"s":"OMF","n":"OneMain Holdings, Inc. Common Stock"},{"s":"OMH","n":"Ohmyhome Limited"},{"s":"OMSE","n":"OMS Energy Technologies Inc."},{"s":"ON","n":"ON Semiconductor Corporation"},{"s":"ONB","n":"Old National Bancorp"},{"s":"ONC","n":"BeOne Medicines Ltd."},{"s":"ONCO","n":"Onconetix, Inc."},{"s":"ONCY","n":"Oncolytics Biotech Inc."},{"s":"ONDS","n":"Ondas Inc"},{"s":"ONEG","n":"OneConstruction Group Limited"},{"s":"ONEW","n":"OneWater Marine Inc."},{"s":"ONFO","n":"Onfolio Holdings Inc."},{"s":"ONIT","n":"Onity Group Inc. Common Stock"},{"s":"ONL","n":"Orion Properties Inc. Common Stock"},{"s":"ONMD","n":"OneMedNet Corp"},{"s":"ONON","n":"On Holding AG Class A Ordinary Shares"},{"s":"ONT","n":"Onterris, Inc. Common Stock"},{"s":"ONTO","n":"Onto Innovation Inc. Common Stock"},{"s":"OOMA","n":"Ooma, Inc. Common Stock"},{"s":"OPAD","n":"Offerpad Solutions Inc. Class A Common Stock"},{"s":"OPAL","n":"OPAL Fuels Inc."},{"s":"OPBK","n":"OP Bancorp"},{"s":"OPCH","n":"Option Care Health, Inc."},{"s":"OPEN","n":"Opendoor Technologies Inc"},{"s":"OPFI","n":"OppFi Inc. Class A Common Stock"},{"s":"OPHC","n":"OptimumBank Holdings, Inc. Common Stock"},{"s":"OPK","n":"Opko Health, Inc."},{"s":"OPLN","n":"OPENLANE, Inc. Common Stock"},{"s":"OPRA","n":"Opera Limited"},{"s":"OPRT","n":"Oportun Financial Corporation"},{"s":"OPRX","n":"OptimizeRx Corporation"},{"s":"OPTH","n":"Optimi Health Corp. - Common Shares"},{"s":"OPTT","n":"Ocean Power Technologies, Inc. Common Stock"},{"s":"OPTU","n":"Optimum Communications, Inc. Class A common stock"},{"s":"OPTX","n":"Syntec Optics Holdings, Inc."},{"s":"OPXS","n":"Optex Systems Holdings, Inc."},{"s":"OPY","n":"Oppenheimer Holdings, Inc. Class A Common Stock (DE)"},{"s":"OR","n":"OR Royalties Inc. Common Shares"},{"s":"ORA","n":"Ormat Technologies, Inc. Common Stock"},{"s":"ORBS","n":"Eightco Holdings Inc."},{"s":"ORC","n":"Orchid Island Capital, Inc. Common Stock"},{"s":"ORCL","n":"Oracle Corporation Common Stock"},{"s":"ORGO","n":"Organogenesis Holdings Inc."},{"s":"ORI","n":"Old Republic International Corporation Common Stock"},{"s":"ORIC","n":"Oric Pharmaceuticals, Inc."},{"s":"ORIO","n":"Orion Digital Corp. - Common Shares"},{"s":"ORIQ","n":"Origin Investment Corp I"},{"s":"ORIQU","n":"Origin Investment Corp I - Units"},{"s":"ORKA","n":"Oruka Therapeutics, Inc."},{"s":"ORKT","n":"Orangekloud Technology Inc."},{"s":"ORLA","n":"Orla Mining Ltd. Common Shares"},{"s":"ORLY","n":"O'Reilly Automotive, Inc."},{"s":"ORMP","n":"Oramed Pharmaceuticals Inc."},{"s":"ORN","n":"Orion Group Holdings, Inc. Common"},{"s":"ORRF","n":"Orrstown Financial Services, Inc."},{"s":"OSBC","n":"Old Second Bancorp, Inc."},{"s":"OSCR","n":"Oscar Health, Inc. Class A Common Stock"},{"s":"OSG","n":"Octave Specialty Group, Inc. Common Stock"},{"s":"OSIS","n":"OSI Systems, Inc."},{"s":"OSK","n":"Oshkosh Corporation (Holding Company)Common Stock"},{"s":"OSPN","n":"OneSpan Inc."},{"s":"OSRH","n":"OSR Health, Inc."},{"s":"OSS","n":"One Stop Systems, Inc."},{"s":"OST","n":"Ostin Technology Group Co., Ltd."},{"s":"OSTX","n":"OS Therapies Incorporated Common Stock"},{"s":"OSUR","n":"OraSure Technologies, Inc."},{"s":"OSW","n":"OneSpaWorld Holdings Limited - Common Shares"},{"s":"OTEX","n":"Open Text Corporation - Common Shares"},{"s":"OTF","n":"Blue Owl Technology Finance Corp. Common Stock"},{"s":"OTIS","n":"Otis Worldwide Corporation Common Stock"},{"s":"OTLK","n":"Outlook Therapeutics, Inc."},{"s":"OTLY","n":"Oatly Group AB"},{"s":"OTTR","n":"Otter Tail Corporation"},{"s":"OUST","n":"Ouster, Inc."},{"s":"OUT","n":"OUTFRONT Media Inc. Common Stock"},{"s":"OVBC","n":"Ohio Valley Banc Corp."},{"s":"OVID","n":"Ovid Therapeutics Inc."},{"s":"OVLY","n":"Oak Valley Bancorp (CA)"},{"s":"OVV","n":"Ovintiv Inc. (DE)"},{"s":"OWL","n":"Blue Owl Capital Inc. Class A Common Stock"},{"s":"OWLS","n":"OBOOK Holdings Inc."},{"s":"OWLT","n":"Owlet, Inc. Class A Common Stock"},{"s":"OXBR","n":"Oxbridge Re Holdings Limited"},{"s":"OXM","n":"Oxford Industries, Inc. Common Stock"},{"s":"OXY","n":"Occidental Petroleum Corporation Common Stock"},{"s":"OXY-W","n":"Occidental Petroleum Corporation Warrants"},{"s":"OZ","n":"Belpointe PREP, LLC Class A Units"},{"s":"OZK","n":"Bank OZK"},{"s":"P","n":"Everpure, Inc. Class A common stock"},{"s":"PAA","n":"Plains All American Pipeline, L.P. - Common Units representing Limited Partner Interests"},{"s":"PAAS","n":"Pan American Silver Corp. Common Stock"},{"s":"PACB","n":"Pacific Biosciences of California, Inc."},{"s":"PACK","n":"Ranpak Holdings Corp Class A Common Stock"},{"s":"PACS","n":"PACS Group, Inc. Common Stock"},{"s":"PAG","n":"Penske Automotive Group, Inc. Common Stock"},{"s":"PAGP","n":"Plains GP Holdings, L.P."},{"s":"PAGS","n":"PagSeguro Digital Ltd. Class A Common Shares"},{"s":"PAHC","n":"Phibro Animal Health Corporation"},{"s":"PAL","n":"Proficient Auto Logistics, Inc."},{"s":"PALI","n":"Palisade Bio, Inc."},{"s":"PAM","n":"Pampa Energia S.A."},{"s":"PAMT","n":"PAMT CORP"},{"s":"PANL","n":"Pangaea Logistics Solutions Ltd."},{"s":"PANW","n":"Palo Alto Networks, Inc."},{"s":"PAPL","n":"Pineapple Financial Inc. Common Stock"},{"s":"PAR","n":"PAR Technology Corporation Common Stock"},{"s":"PARK","n":"Park Dental Partners, Inc."},{"s":"PARR","n":"Par Pacific Holdings, Inc. Common Stock"},{"s":"PASG","n":"Passage Bio, Inc."},{"s":"PASW","n":"Ping An Biomedical Co., Ltd."},{"s":"PATH","n":"UiPath, Inc. Class A Common Stock"},{"s":"PATK","n":"Patrick Industries, Inc."},{"s":"PAVM","n":"PAVmed Inc."},{"s":"PAVS","n":"Paranovus Entertainment Technology Ltd."},{"s":"PAX","n":"Patria Investments Limited"},{"s":"PAY","n":"Paymentus Holdings, Inc. Class A Common Stock"},{"s":"PAYC","n":"Paycom Software, Inc. Common Stock"},{"s":"PAYO","n":"Payoneer Global Inc."},{"s":"PAYP","n":"PayPay Corporation - American Depository Shares"},{"s":"PAYS","n":"Paysign, Inc."},{"s":"PAYX","n":"Paychex, Inc."},{"s":"PB","n":"Prosperity Bancshares, Inc. Common Stock"},{"s":"PBA","n":"Pembina Pipeline Corp. Ordinary Shares (Canada)"},{"s":"PBF","n":"PBF Energy Inc. Class A Common Stock"},{"s":"PBFS","n":"Pioneer Bancorp, Inc."},{"s":"PBH","n":"Prestige Consumer Healthcare Inc. Common Stock"},{"s":"PBHC","n":"Pathfinder Bancorp, Inc."},{"s":"PBI","n":"Pitney Bowes Inc. Common Stock"},{"s":"PBK","n":"PowerBank Corporation"},{"s":"PBLS","n":"Parabilis Medicines, Inc."},{"s":"PBM","n":"Psyence Biomedical Ltd. - Common Shares"},{"s":"PBR","n":"Petroleo Brasileiro S.A. Petrobras ADS"},{"s":"PBYI","n":"Puma Biotechnology Inc"},{"s":"PC","n":"Premium Catering (Holdings) Limited"},{"s":"PCAR","n":"PACCAR Inc."},{"s":"PCB","n":"PCB Bancorp"},{"s":"PCG","n":"Pacific Gas & Electric Co. Common Stock"},{"s":"PCLA","n":"PicoCELA Inc."},{"s":"PCOR","n":"Procore Technologies, Inc. Common Stock"},{"s":"PCRX","n":"Pacira BioSciences, Inc."},{"s":"PCSA","n":"Processa Pharmaceuticals, Inc."},{"s":"PCSC","n":"Perceptive Capital Solutions Corp"},{"s":"PCT","n":"PureCycle Technologies, Inc."},{"s":"PCTY","n":"Paylocity Holding Corporation"},{"s":"PCVX","n":"Vaxcyte, Inc."},{"s":"PCYO","n":"Pure Cycle Corporation"},{"s":"PD","n":"PagerDuty, Inc. Common Stock"},{"s":"PDC","n":"Perpetuals.com Ltd"},{"s":"PDCC","n":"Pearl Diver Credit Company Inc. Common Stock"},{"s":"PDD","n":"PDD Holdings Inc."},{"s":"PDEX","n":"Pro-Dex, Inc."},{"s":"PDFS","n":"PDF Solutions, Inc."},{"s":"PDLB","n":"Ponce Financial Group, Inc."},{"s":"PDS","n":"Precision Drilling Corporation Common Stock"},{"s":"PDSB","n":"PDS Biotechnology Corporation"},{"s":"PDYN","n":"Palladyne AI Corp."},{"s":"PEBK","n":"Peoples Bancorp of North Carolina, Inc."},{"s":"PEBO","n":"Peoples Bancorp Inc."},{"s":"PECO","n":"Phillips Edison & Company, Inc."},{"s":"PED","n":"Pedevco Corp. Common Stock"},{"s":"PEG","n":"Public Service Enterprise Group Incorporated Common Stock"},{"s":"PEGA","n":"Pegasystems Inc."},{"s":"PEN","n":"Penumbra, Inc. Common Stock"},{"s":"PENG","n":"Penguin Solutions, Inc."},{"s":"PENN","n":"PENN Entertainment, Inc."},{"s":"PEP","n":"PepsiCo, Inc."},{"s":"PEPG","n":"PepGen Inc."},{"s":"PERF","n":"Perfect Corp. Class A Ordinary Share"},{"s":"PERI","n":"Perion Network Ltd"},{"s":"PESI","n":"Perma-Fix Environmental Services, Inc."},{"s":"PETS","n":"PetMed Express, Inc."},{"s":"PETZ","n":"TDH Holdings, Inc. - Common Shares"},{"s":"PEW","n":"GrabAGun Digital Holdings Inc. Common Stock"},{"s":"PFAI","n":"Pinnacle Food Group Limited"},{"s":"PFE","n":"Pfizer, Inc. Common Stock"},{"s":"PFG","n":"Principal Financial Group Inc"},{"s":"PFGC","n":"Performance Food Group Company Common Stock"},{"s":"PFIS","n":"Peoples Financial Services Corp."},{"s":"PFLT","n":"PennantPark Floating Rate Capital Ltd. Common Stock"},{"s":"PFS","n":"Provident Financial Services, Inc Common Stock"},{"s":"PFSA","n":"Profusa, Inc."},{"s":"PFSI","n":"PennyMac Financial Services, Inc. Common Stock"},{"s":"PFX","n":"PhenixFIN Corporation"},{"s":"PG","n":"Procter & Gamble Company (The) Common Stock"},{"s":"PGC","n":"Peapack-Gladstone Financial Corporation"},{"s":"PGEN","n":"Precigen, Inc."},{"s":"PGNY","n":"Progyny, Inc."},{"s":"PGR","n":"Progressive Corporation (The) Common Stock"},{"s":"PGY","n":"Pagaya Technologies Ltd."},{"s":"PGYWW","n":"Pagaya Technologies Ltd. - Warrants"},{"s":"PH","n":"Parker-Hannifin Corporation Common Stock"},{"s":"PHAR","n":"Pharming Group N.V."},{"s":"PHAT","n":"Phathom Pharmaceuticals, Inc."},{"s":"PHG","n":"Koninklijke Philips N.V. NY Registry Shares"},{"s":"PHGE","n":"BiomX Inc. COmmon Stock"},{"s":"PHIN","n":"PHINIA Inc. Common Stock"},{"s":"PHIO","n":"Phio Pharmaceuticals Corp."},{"s":"PHM","n":"PulteGroup, Inc. Common Stock"},{"s":"PHOE","n":"Phoenix Asia Holdings Limited"},{"s":"PHR","n":"Phreesia, Inc. Common Stock"},{"s":"PHUN","n":"Phunware, Inc."},{"s":"PHVS","n":"Pharvaris N.V."},{"s":"PI","n":"Impinj, Inc."},{"s":"PICS","n":"PicS N.V."},{"s":"PII","n":"Polaris Inc. Common Stock"},{"s":"PIII","n":"P3 Health Partners Inc."},{"s":"PINS","n":"Pinterest, Inc. Class A Common Stock"},{"s":"PIPR","n":"Piper Sandler Companies Common Stock"},{"s":"PJT","n":"PJT Partners Inc. Class A Common Stock"},{"s":"PK","n":"Park Hotels & Resorts Inc. Common Stock"},{"s":"PKBK","n":"Parke Bancorp, Inc."},{"s":"PKE","n":"Park Aerospace Corp. Common Stock"},{"s":"PKG","n":"Packaging Corporation of America Common Stock"},{"s":"PKOH","n":"Park-Ohio Holdings Corp."},{"s":"PKX","n":"POSCO HOLDINGS INC. American Depositary Shares (Each representing 1/4th of a share of Common Stock)"},{"s":"PL","n":"Planet Labs PBC Class A Common Stock"},{"s":"PLAB","n":"Photronics, Inc."},{"s":"PLAG","n":"Planet Green Holdings Corp. Common Stock"},{"s":"PLAY","n":"Dave & Buster's Entertainment, Inc."},{"s":"PLBC","n":"Plumas Bancorp"},{"s":"PLBL","n":"Polibeli Group Ltd"},{"s":"PLBY","n":"Playboy, Inc."},{"s":"PLCE","n":"Children's Place, Inc. (The)"},{"s":"PLD","n":"Prologis, Inc. Common Stock"},{"s":"PLG","n":"Platinum Group Metals Ltd. Ordinary Shares (Canada)"},{"s":"PLGO","n":"Pelagos Insurance Capital Limited Common Shares"},{"s":"PLMR","n":"Palomar Holdings, Inc."},{"s":"PLNT","n":"Planet Fitness, Inc. Common Stock"},{"s":"PLOW","n":"Douglas Dynamics, Inc. Common Stock"},{"s":"PLPC","n":"Preformed Line Products Company"},{"s":"PLRX","n":"Pliant Therapeutics, Inc."},{"s":"PLRZ","n":"Polyrizon Ltd."},{"s":"PLSE","n":"Pulse Biosciences, Inc"},{"s":"PLSM","n":"Pulsenmore Ltd."},{"s":"PLTK","n":"Playtika Holding Corp."},{"s":"PLTR","n":"Palantir Technologies Inc."},{"s":"PLTS","n":"Platinum Analytics Cayman Limited"},{"s":"PLUG","n":"Plug Power, Inc."},{"s":"PLUR","n":"Pluri Inc."},{"s":"PLUS","n":"ePlus inc."},{"s":"PLUT","n":"Plutus Financial Group Limited"},{"s":"PLX","n":"Protalix BioTherapeutics, Inc. (DE) Common Stock"},{"s":"PLXS","n":"Plexus Corp."},{"s":"PLYX","n":"Polaryx Therapeutics, Inc."},{"s":"PM","n":"Philip Morris International Inc Common Stock"},{"s":"PMA","n":"Ming Shing Group Holdings Limited"},{"s":"PMAX","n":"Powell Max Limited"},{"s":"PMCB","n":"PharmaCyte Biotech, Inc."},{"s":"PMEC","n":"Primech Holdings Ltd."},{"s":"PMI","n":"Picard Medical, Inc. Common Stock"},{"s":"PMN","n":"ProMIS Neurosciences Inc. - Common Shares"},{"s":"PMTS","n":"CPI Card Group Inc."},{"s":"PMVP","n":"PMV Pharmaceuticals, Inc."},{"s":"PN","n":"PN Smart Energy Limited"},{"s":"PNBK","n":"Patriot National Bancorp Inc."},{"s":"PNC","n":"PNC Financial Services Group, Inc. (The) Common Stock"},{"s":"PNFP","n":"Pinnacle Financial Partners, Inc. Common stock"},{"s":"PNNT","n":"PennantPark Investment Corporation Common Stock"},{"s":"PNR","n":"Pentair plc. Ordinary Share"},{"s":"PNRG","n":"PrimeEnergy Resources Corporation"},{"s":"PNTG","n":"The Pennant Group, Inc."},{"s":"PNW","n":"Pinnacle West Capital Corporation Common Stock"},{"s":"POAS","n":"Phaos Technology Holdings (Cayman) Limited Class A Ordinary Shares"},{"s":"POCI","n":"Precision Optics Corporation, Inc."},{"s":"PODC","n":"PodcastOne, Inc."},{"s":"PODD","n":"Insulet Corporation"},{"s":"POET","n":"POET Technologies Inc. - Common Shares"},{"s":"POLA","n":"Polar Power, Inc."},{"s":"POM","n":"POMDOCTOR LIMITED"},{"s":"PONO","n":"Pono Capital Four, Inc."},{"s":"PONOU","n":"Pono Capital Four, Inc. - Units"},{"s":"PONY","n":"Pony AI Inc."},{"s":"POOL","n":"Pool Corporation"},{"s":"POR","n":"Portland General Electric Co Common Stock"},{"s":"POST","n":"Post Holdings, Inc. Common Stock"},{"s":"POWI","n":"Power Integrations, Inc."},{"s":"POWL","n":"Powell Industries, Inc."},{"s":"POWW","n":"Outdoor Holding Company"},{"s":"PPBT","n":"Purple Biotech Ltd."},{"s":"PPC","n":"Pilgrim's Pride Corporation"},{"s":"PPCB","n":"Propanc Biopharma, Inc."},{"s":"PPG","n":"PPG Industries, Inc. Common Stock"},{"s":"PPHC","n":"Public Policy Holding Company, Inc."},{"s":"PPIH","n":"Perma-Pipe International Holdings, Inc."},{"s":"PPL","n":"PPL Corporation Common Stock"},{"s":"PPLC","n":"PPL Corporation Corporate Units"},{"s":"PPLI","n":"People Incorporated"},{"s":"PPSI","n":"Pioneer Power Solutions, Inc."},{"s":"PPTA","n":"Perpetua Resources Corp. - Common Shares"},{"s":"PR","n":"Permian Resources Corporation Class A Common Stock"},{"s":"PRAA","n":"PRA Group, Inc."},{"s":"PRAX","n":"Praxis Precision Medicines, Inc."},{"s":"PRCH","n":"Porch Group, Inc."},{"s":"PRCT","n":"PROCEPT BioRobotics Corporation"},{"s":"PRDO","n":"Perdoceo Education Corporation"},{"s":"PRE","n":"Prenetics Global Limited"},{"s":"PRFX","n":"PRF Technologies Ltd."},{"s":"PRG","n":"PROG Holdings, Inc. Common Stock"},{"s":"PRGO","n":"Perrigo Company plc Ordinary Shares"},{"s":"PRGS","n":"Progress Software Corporation"},{"s":"PRHI","n":"Presurance Holdings, Inc."},{"s":"PRI","n":"Primerica, Inc. Common Stock"},{"s":"PRIM","n":"Primoris Services Corporation Common Stock"},{"s":"PRK","n":"Park National Corporation Common Stock"},{"s":"PRKS","n":"United Parks & Resorts Inc. Common Stock"},{"s":"PRLB","n":"Proto Labs, Inc. Common stock"},{"s":"PRLD","n":"Prelude Therapeutics Incorporated"},{"s":"PRM","n":"Perimeter Solutions, SA Common Stock"},{"s":"PRMB","n":"Primo Brands Corporation Class A Common Stock"},{"s":"PRME","n":"Prime Medicine, Inc."},{"s":"PROF","n":"Profound Medical Corp."},{"s":"PROK","n":"ProKidney Corp."},{"s":"PROP","n":"Prairie Operating Co."},{"s":"PROV","n":"Provident Financial Holdings, Inc."},{"s":"PRPL","n":"Purple Innovation, Inc."},{"s":"PRPO","n":"Precipio, Inc."},{"s":"PRQR","n":"ProQR Therapeutics N.V."},{"s":"PRSO","n":"Peraso Inc."},{"s":"PRSU","n":"Pursuit Attractions and Hospitality, Inc. Common Stock"},{"s":"PRTA","n":"Prothena Corporation plc"},{"s":"PRTH","n":"Priority Technology Holdings, Inc."},{"s":"PRTS","n":"CarParts.com, Inc."},{"s":"PRU","n":"Prudential Financial, Inc. Common Stock"},{"s":"PRVA","n":"Privia Health Group, Inc."},{"s":"PRZO","n":"ParaZero Technologies Ltd."},{"s":"PS","n":"Pershing Square Inc. Common Stock"},{"s":"PSA","n":"Public Storage Common Stock"},{"s":"PSBD","n":"Palmer Square Capital BDC Inc. Common Stock"},{"s":"PSFE","n":"Paysafe Limited Common Shares"},{"s":"PSHG","n":"Performance Shipping Inc. - Common Shares"},{"s":"PSIG","n":"PS International Group Ltd."},{"s":"PSIX","n":"Power Solutions International, Inc."},{"s":"PSKY","n":"Paramount Skydance Corporation"},{"s":"PSMT","n":"PriceSmart, Inc."},{"s":"PSN","n":"Parsons Corporation Common Stock"},{"s":"PSNL","n":"Personalis, Inc."},{"s":"PSNY","n":"Polestar Automotive Holding UK Limited"},{"s":"PSNYW","n":"Polestar Automotive Holding UK Limited"},{"s":"PSO","n":"Pearson, Plc Common Stock"},{"s":"PSQH","n":"PSQ Holdings, Inc. Class A Common Stock"},{"s":"PSTV","n":"PLUS THERAPEUTICS, Inc."},{"s":"PSUS","n":"Pershing Square USA, Ltd. Common Shares"},{"s":"PSX","n":"Phillips 66 Common Stock"},{"s":"PTC","n":"PTC Inc."},{"s":"PTCT","n":"PTC Therapeutics, Inc."},{"s":"PTEN","n":"Patterson-UTI Energy, Inc."},{"s":"PTGX","n":"Protagonist Therapeutics, Inc."},{"s":"PTHS","n":"Pelthos Therapeutics Inc. Common Stock"},{"s":"PTLE","n":"PTL LTD"},{"s":"PTLO","n":"Portillo's Inc."},{"s":"PTN","n":"Palatin Technologies, Inc."},{"s":"PTON","n":"Peloton Interactive, Inc."},{"s":"PUBM","n":"PubMatic, Inc."},{"s":"PUK","n":"Prudential Public Limited Company Common Stock"},{"s":"PULM","n":"Pulmatrix, Inc."},{"s":"PUMP","n":"ProPetro Holding Corp. Common Stock"},{"s":"PURR","n":"Hyperliquid Strategies Inc"},{"s":"PUSA","n":"Aureus Greenway Holdings Inc."},{"s":"PVH","n":"PVH Corp. Common Stock"},{"s":"PVLA","n":"Palvella Therapeutics, Inc."},{"s":"PWP","n":"Perella Weinberg Partners"},{"s":"PWR","n":"Quanta Services, Inc. Common Stock"},{"s":"PWRL","n":"Powerlaw Corp."},{"s":"PXED","n":"Phoenix Education Partners, Inc. Common Stock"},{"s":"PXLW","n":"Pixelworks, Inc."},{"s":"PXS","n":"Pyxis Tankers Inc."},{"s":"PYPD","n":"PolyPid Ltd."},{"s":"PYPL","n":"PayPal Holdings, Inc."},{"s":"PYT","n":"PPlus Tr GSC-2 Tr Ctf Fltg Rate"},{"s":"PYXS","n":"Pyxis Oncology, Inc."},{"s":"PZG","n":"Paramount Gold Nevada Corp. Common Stock"},{"s":"PZZA","n":"Papa John's International, Inc."},{"s":"Q","n":"Qnity Electronics, Inc. Common Stock"},{"s":"QBTS","n":"D-Wave Quantum Inc. Common Shares"},{"s":"QCLS","n":"Q/C Technologies, Inc."},{"s":"QCOM","n":"QUALCOMM Incorporated"},{"s":"QCRH","n":"QCR Holdings, Inc."},{"s":"QDEL","n":"QuidelOrtho Corporation"},{"s":"QFIN","n":"Qfin Holdings, Inc."},{"s":"QGEN","n":"Qiagen N.V. Common Shares"},{"s":"QH","n":"Quhuo Limited"},{"s":"QLYS","n":"Qualys, Inc."},{"s":"QMCO","n":"Quantum Corporation"},{"s":"QMLS","n":"QumulusAI, Inc."},{"s":"QMMM","n":"QMMM Holdings Limited"},{"s":"QNC","n":"Quantum eMotion Corp. Common Shares"},{"s":"QNCX","n":"Quince Therapeutics, Inc."},{"s":"QNRX","n":"Quoin Pharmaceuticals, Ltd."},{"s":"QNST","n":"QuinStreet, Inc."},{"s":"QNT","n":"Quantinuum Inc."},{"s":"QNTM","n":"Quantum Biopharma Ltd."},{"s":"QRHC","n":"Quest Resource Holding Corporation"},{"s":"QRVO","n":"Qorvo, Inc."},{"s":"QS","n":"QuantumScape Corporation"},{"s":"QSI","n":"Quantum-Si Incorporated"},{"s":"QSR","n":"Restaurant Brands International Inc. Common Shares"},{"s":"QTEX","n":"QTREX Quantum Ltd."},{"s":"QTI","n":"QT Imaging Holdings, Inc."},{"s":"QTRX","n":"Quanterix Corporation"},{"s":"QTTB","n":"Q32 Bio Inc."},{"s":"QTWO","n":"Q2 Holdings, Inc. Common Stock"},{"s":"QUAD","n":"Quad Graphics, Inc Class A Common Stock"},{"s":"QUBT","n":"Quantum Computing Inc."},{"s":"QUCY","n":"Quantum Cyber N.V."},{"s":"QUIK","n":"QuickLogic Corporation"},{"s":"QURE","n":"uniQure N.V."},{"s":"QXL","n":"Quantum X Labs Inc."},{"s":"QXO","n":"QXO, Inc. Common Stock"},{"s":"R","n":"Ryder System, Inc. Common Stock"},{"s":"RACC","n":"Research Alliance Corporation III"},{"s":"RACD","n":"Research Alliance Corporation IV"},{"s":"RACE","n":"Ferrari N.V. Common Shares"},{"s":"RADX","n":"Radiopharm Theranostics Limited"},{"s":"RAIL","n":"Freightcar America, Inc."},{"s":"RAIN","n":"Rain Enhancement Technologies Holdco, Inc."},{"s":"RAINW","n":"Rain Enhancement Technologies Holdco, Inc. - Warrants"},{"s":"RAL","n":"Ralliant Corporation Common Stock"},{"s":"RAMP","n":"LiveRamp Holdings, Inc. Common Stock"},{"s":"RANI","n":"Rani Therapeutics Holdings, Inc."},{"s":"RAPP","n":"Rapport Therapeutics, Inc."},{"s":"RARE","n":"Ultragenyx Pharmaceutical Inc."},{"s":"RAVE","n":"Rave Restaurant Group, Inc."},{"s":"RAY","n":"Raytech Holding Limited"},{"s":"RAYA","n":"Erayak Power Solution Group Inc."},{"s":"RBA","n":"RB Global, Inc. Common Stock"},{"s":"RBB","n":"RBB Bancorp"},{"s":"RBBN","n":"Ribbon Communications Inc."},{"s":"RBC","n":"RBC Bearings Incorporated Common Stock"},{"s":"RBCAA","n":"Republic Bancorp, Inc."},{"s":"RBKB","n":"Rhinebeck Bancorp, Inc."},{"s":"RBLX","n":"Roblox Corporation Class A Common Stock"},{"s":"RBNE","n":"Robin Energy Ltd."},{"s":"RBRK","n":"Rubrik, Inc. Class A Common Stock"},{"s":"RC","n":"Ready Capital Corporation Common Stock"},{"s":"RCAT","n":"Red Cat Holdings, Inc."},{"s":"RCEL","n":"Avita Medical, Inc."},{"s":"RCI","n":"Rogers Communication, Inc. Common Stock"},{"s":"RCKT","n":"Rocket Pharmaceuticals, Inc."},{"s":"RCKY","n":"Rocky Brands, Inc."},{"s":"RCL","n":"Royal Caribbean Cruises Ltd. Common Stock"},{"s":"RCMT","n":"RCM Technologies, Inc."},{"s":"RCON","n":"Recon Technology, Ltd."},{"s":"RCT","n":"RedCloud Holdings plc"},{"s":"RCUS","n":"Arcus Biosciences, Inc. Common Stock"},{"s":"RDCM","n":"Radcom Ltd."},{"s":"RDDT","n":"Reddit, Inc. Class A Common Stock"},{"s":"RDGT","n":"Ridgetech, Inc."},{"s":"RDHL","n":"Redhill Biopharma Ltd."},{"s":"RDI","n":"Reading International Inc"},{"s":"RDIB","n":"Reading International Inc"},{"s":"RDN","n":"Radian Group Inc. Common Stock"},{"s":"RDNT","n":"RadNet, Inc."},{"s":"RDNW","n":"RideNow Group, Inc."},{"s":"RDVT","n":"Red Violet, Inc."},{"s":"RDW","n":"Redwire Corporation Common Stock"},{"s":"RDWR","n":"Radware Ltd."},{"s":"RDY","n":"Dr. Reddy's Laboratories Ltd Common Stock"},{"s":"RDZN","n":"Roadzen, Inc."},{"s":"RDZNW","n":"Roadzen, Inc. - Warrants"},{"s":"REA","n":"Rare Earths Americas, Inc. Common Stock"},{"s":"REAL","n":"The RealReal, Inc."},{"s":"REAX","n":"The Real Brokerage, Inc. - Common Shares"},{"s":"REBN","n":"Reborn Coffee, Inc."},{"s":"RECT","n":"Rectitude Holdings Ltd"},{"s":"REED","n":"Reed's, Inc. Common Stock"},{"s":"REFI","n":"Chicago Atlantic Real Estate Finance, Inc."},{"s":"REFR","n":"Research Frontiers Incorporated"},{"s":"REG","n":"Regency Centers Corporation"},{"s":"REGN","n":"Regeneron Pharmaceuticals, Inc."},{"s":"REI","n":"Ring Energy, Inc. Common Stock"},{"s":"REKR","n":"Rekor Systems, Inc."},{"s":"RELL","n":"Richardson Electronics, Ltd."},{"s":"RELX","n":"RELX PLC PLC American Depositary Shares (Each representing One Ordinary Share)"},{"s":"RELY","n":"Remitly Global, Inc."},{"s":"RENT","n":"Rent the Runway, Inc."},{"s":"RENX","n":"RenX Enterprises Corp."},{"s":"REPL","n":"Replimune Group, Inc."},{"s":"REPX","n":"Riley Exploration Permian, Inc. Common Stock"},{"s":"RERE","n":"ATRenew Inc. American Depositary Shares (every three of which representing two Class A ordinary shares)"},{"s":"RES","n":"RPC, Inc. Common Stock"},{"s":"RETO","n":"ReTo Eco-Solutions, Inc."},{"s":"REVB","n":"Revelation Biosciences, Inc."},{"s":"REX","n":"REX American Resources Corporation"},{"s":"REXR","n":"Rexford Industrial Realty, Inc. Common Stock"},{"s":"REYN","n":"Reynolds Consumer Products Inc."},{"s":"REZI","n":"Resideo Technologies, Inc. Common Stock"},{"s":"RF","n":"Regions Financial Corporation Common Stock"},{"s":"RFIL","n":"RF Industries, Ltd."},{"s":"RFL","n":"Rafael Holdings, Inc. Class B Common Stock"},{"s":"RGA","n":"Reinsurance Group of America, Incorporated Common Stock"},{"s":"RGC","n":"Regencell Bioscience Holdings Limited"},{"s":"RGCO","n":"RGC Resources Inc."},{"s":"RGEN","n":"Repligen Corporation"},{"s":"RGLD","n":"Royal Gold, Inc."},{"s":"RGNT","n":"Regentis Biomaterials Ltd. Ordinary Shares"},{"s":"RGNX","n":"REGENXBIO Inc."},{"s":"RGP","n":"Resources Connection, Inc."},{"s":"RGR","n":"Sturm, Ruger & Company, Inc. Common Stock"},{"s":"RGS","n":"Regis Corporation"},{"s":"RGTI","n":"Rigetti Computing, Inc."},{"s":"RH","n":"RH Common Stock"},{"s":"RHI","n":"Robert Half Inc. Common Stock"},{"s":"RHLD","n":"Resolute Holdings Management Common Stock"},{"s":"RICK","n":"RCI Hospitality Holdings, Inc."},{"s":"RIG","n":"Transocean Ltd (Switzerland) Common Stock"},{"s":"RIGL","n":"Rigel Pharmaceuticals, Inc."},{"s":"RILY","n":"BRC Group Holdings, Inc."},{"s":"RIME","n":"Algorhythm Holdings, Inc."},{"s":"RIO","n":"Rio Tinto Plc Common Stock"},{"s":"RIOT","n":"Riot Platforms, Inc."},{"s":"RITM","n":"Rithm Capital Corp. Common Stock"},{"s":"RITR","n":"Reitar Logtech Holdings Limited"},{"s":"RIVN","n":"Rivian Automotive, Inc."},{"s":"RJET","n":"Republic Airways Holdings Inc."},{"s":"RJF","n":"Raymond James Financial, Inc. Common Stock"},{"s":"RKDA","n":"Arcadia Biosciences, Inc."},{"s":"RKLB","n":"Rocket Lab Corporation"},{"s":"RKT","n":"Rocket Companies, Inc. Class A Common Stock"},{"s":"RKTO","n":"Rocket One Inc."},{"s":"RL","n":"Ralph Lauren Corporation Common Stock"},{"s":"RLAY","n":"Relay Therapeutics, Inc."},{"s":"RLGT","n":"Radiant Logistics, Inc. Common Stock"},{"s":"RLI","n":"RLI Corp. Common Stock (DE)"},{"s":"RLMD","n":"Relmada Therapeutics, Inc."},{"s":"RLYB","n":"Rallybio Corporation"},{"s":"RM","n":"Regional Management Corp. Common Stock"},{"s":"RMAX","n":"RE/MAX Holdings, Inc. Class A Common Stock"},{"s":"RMBI","n":"Richmond Mutual Bancorporation, Inc."},{"s":"RMBS","n":"Rambus, Inc."},{"s":"RMCF","n":"Rocky Mountain Chocolate Factory, Inc."},{"s":"RMCO","n":"Royalty Management Holding Corporation"},{"s":"RMD","n":"ResMed Inc. Common Stock"},{"s":"RMIX","n":"Suncrete, Inc."},{"s":"RMNI","n":"Rimini Street, Inc."},{"s":"RMR","n":"The RMR Group Inc."},{"s":"RMSG","n":"Real Messenger Corporation"},{"s":"RMSGW","n":"Real Messenger Corporation - Warrants"},{"s":"RMTI","n":"Rockwell Medical, Inc."},{"s":"RNA","n":"Atrium Therapeutics, Inc."},{"s":"RNAC","n":"Cartesian Therapeutics, Inc."},{"s":"RNAZ","n":"TransCode Therapeutics, Inc."},{"s":"RNG","n":"RingCentral, Inc. Class A Common Stock"},{"s":"RNGR","n":"Ranger Energy Services, Inc. Class A Common Stock"},{"s":"RNR","n":"RenaissanceRe Holdings Ltd. Common Stock"},{"s":"RNST","n":"Renasant Corporation Common Stock"},{"s":"RNTX","n":"Rein Therapeutics, Inc."},{"s":"RNW","n":"ReNew Energy Global plc"},{"s":"RNXT","n":"RenovoRx, Inc."},{"s":"ROAD","n":"Construction Partners, Inc."},{"s":"ROC","n":"Rank One Computing Corporation"},{"s":"ROCK","n":"Gibraltar Industries, Inc."},{"s":"ROG","n":"Rogers Corporation Common Stock"},{"s":"ROIV","n":"Roivant Sciences Ltd. - Common Shares"},{"s":"ROK","n":"Rockwell Automation, Inc. Common Stock"},{"s":"ROKU","n":"Roku, Inc."},{"s":"ROL","n":"Rollins, Inc. Common Stock"},{"s":"ROLR","n":"High Roller Technologies, Inc. Common Stock"},{"s":"ROMA","n":"Roma Green Finance Limited"},{"s":"ROOT","n":"Root, Inc."},{"s":"ROP","n":"Roper Technologies, Inc."},{"s":"ROST","n":"Ross Stores, Inc."},{"s":"RPAY","n":"Repay Holdings Corporation"},{"s":"RPC","n":"Ridgepost Capital, Inc. Class A Common Stock"},{"s":"RPD","n":"Rapid7, Inc."},{"s":"RPGL","n":"Republic Power Group Limited"},{"s":"RPID","n":"Rapid Micro Biosystems, Inc."},{"s":"RPM","n":"RPM International Inc. Common Stock"},{"s":"RPRX","n":"Royalty Pharma plc"},{"s":"RR","n":"Richtech Robotics Inc."},{"s":"RRBI","n":"Red River Bancshares, Inc."},{"s":"RRC","n":"Range Resources Corporation Common Stock"},{"s":"RRGB","n":"Red Robin Gourmet Burgers, Inc."},{"s":"RRR","n":"Red Rock Resorts, Inc."},{"s":"RRX","n":"Regal Rexnord Corporation Common Stock"},{"s":"RS","n":"Reliance, Inc. Common Stock"},{"s":"RSG","n":"Republic Services, Inc. Common Stock"},{"s":"RSI","n":"Rush Street Interactive, Inc. Class A Common Stock"},{"s":"RSKD","n":"Riskified Ltd. Class A Ordinary Shares"},{"s":"RSSS","n":"Research Solutions, Inc"},{"s":"RSVR","n":"Reservoir Media, Inc.."},{"s":"RTB","n":"RTB Digital, Inc."},{"s":"RTO","n":"Rentokil Initial plc American Depositary Shares (each representing five (5) Ordinary Shares)"},{"s":"RTX","n":"RTX Corporation Common Stock"},{"s":"RUBI","n":"Rubico Inc."},{"s":"RUM","n":"RUM Group Inc."},{"s":"RUN","n":"Sunrun Inc."},{"s":"RUSHA","n":"Rush Enterprises, Inc."},{"s":"RUSHB","n":"Rush Enterprises, Inc."},{"s":"RVLV","n":"Revolve Group, Inc. Class A Common Stock"},{"s":"RVMD","n":"Revolution Medicines, Inc."},{"s":"RVP","n":"Retractable Technologies, Inc. Common Stock"},{"s":"RVSB","n":"Riverview Bancorp Inc"},{"s":"RVSN","n":"Rail Vision Ltd."},{"s":"RVTY","n":"Revvity, Inc. Common Stock"},{"s":"RWAY","n":"Runway Growth Finance Corp."},{"s":"RXO","n":"RXO, Inc. Common Stock"},{"s":"RXRX","n":"Recursion Pharmaceuticals, Inc."},{"s":"RXST","n":"RxSight, Inc."},{"s":"RXT","n":"Rackspace Technology, Inc."},{"s":"RY","n":"Royal Bank Of Canada Common Stock"},{"s":"RYAAY","n":"Ryanair Holdings plc"},{"s":"RYAM","n":"Rayonier Advanced Materials Inc. Common Stock"},{"s":"RYAN","n":"Ryan Specialty Holdings, Inc. Class A Common Stock"},{"s":"RYDE","n":"Ryde Group Ltd. Class A Ordinary Shares"},{"s":"RYET","n":"Ruanyun Edai Technology Inc."},{"s":"RYM","n":"RYTHM, Inc."},{"s":"RYOJ","n":"rYojbaba Co., Ltd. - Common Shares"},{"s":"RYTM","n":"Rhythm Pharmaceuticals, Inc."},{"s":"RYZ","n":"Ryerson Holding Corporation Common Stock"},{"s":"RZC","n":"Reinsurance Group of America, Incorporated 7.125% Fixed-Rate Reset Subordinated Debentures due 2052"},{"s":"RZLT","n":"Rezolute, Inc."},{"s":"RZLV","n":"Rezolve AI PLC"},{"s":"RZLVW","n":"Rezolve AI PLC - Warrants"},{"s":"S","n":"SentinelOne, Inc. Class A Common Stock"},{"s":"SA","n":"Seabridge Gold, Inc. Common Shares New"},{"s":"SABR","n":"Sabre Corporation"},{"s":"SABS","n":"SAB Biotherapeutics, Inc."},{"s":"SACH","n":"Sachem Capital Corp. Common Shares"},{"s":"SAFE","n":"Safehold Inc. New Common Stock"},{"s":"SAFT","n":"Safety Insurance Group, Inc."},{"s":"SAFX","n":"XCF Global, Inc."},{"s":"SAGT","n":"SAGTEC GLOBAL LIMITED"},{"s":"SAH","n":"Sonic Automotive, Inc. Common Stock"},{"s":"SAIA","n":"Saia, Inc."},{"s":"SAIC","n":"Science Applications International Corporation"},{"s":"SAIH","n":"SAIHEAT Limited"},{"s":"SAIL","n":"SailPoint, Inc."},{"s":"SAM","n":"Boston Beer Company, Inc. (The) Common Stock"},{"s":"SAMG","n":"Silvercrest Asset Management Group Inc."},{"s":"SANA","n":"Sana Biotechnology, Inc."},{"s":"SANG","n":"Sangoma Technologies Corporation - Common Shares"},{"s":"SANM","n":"Sanmina Corporation"},{"s":"SAP","n":"SAP SE ADS"},{"s":"SAR","n":"Saratoga Investment Corp New"},{"s":"SARO","n":"StandardAero, Inc. Common Stock"},{"s":"SATL","n":"Satellogic Inc."},{"s":"SB","n":"Safe Bulkers, Inc Common Stock ($0.001 par value)"},{"s":"SBAC","n":"SBA Communications Corporation"},{"s":"SBC","n":"SBC Medical Group Holdings Incorporated"},{"s":"SBCF","n":"Seacoast Banking Corporation of Florida"},{"s":"SBCWW","n":"SBC Medical Group Holdings Incorporated - Warrants"},{"s":"SBET","n":"Sharplink, Inc."},{"s":"SBEV","n":"Splash Beverage Group, Inc. (NV) Common Stock"},{"s":"SBFG","n":"SB Financial Group, Inc."},{"s":"SBFM","n":"Sunshine Biopharma Inc."},{"s":"SBGI","n":"Sinclair, Inc."},{"s":"SBH","n":"Sally Beauty Holdings, Inc. (Name to be changed from Sally Holdings, Inc.) Common Stock"},{"s":"SBLK","n":"Star Bulk Carriers Corp. - Common Shares"},{"s":"SBMT","n":"Silver Bow Mining Corp. Common Shares"},{"s":"SBS","n":"Companhia de saneamento Basico Do Estado De Sao Paulo - Sabesp American Depositary Shares (Each repstg 250 Common Shares)"},{"s":"SBSI","n":"Southside Bancshares, Inc. Common Stock"},{"s":"SBSW","n":"D/B/A Sibanye-Stillwater Limited ADS"},{"s":"SBUX","n":"Starbucks Corporation"},{"s":"SBXD","n":"SilverBox Corp IV Class A Ordinary Shares"},{"s":"SBXE","n":"SilverBox Corp V Class A Ordinary Shares"},{"s":"SCAG","n":"Scage Future"},{"s":"SCAGW","n":"Scage Future - Warrants"},{"s":"SCCO","n":"Southern Copper Corporation Common Stock"},{"s":"SCHL","n":"Scholastic Corporation"},{"s":"SCHW","n":"Charles Schwab Corporation (The) Common Stock"},{"s":"SCI","n":"Service Corporation International Common Stock"},{"s":"SCKT","n":"Socket Mobile, Inc."},{"s":"SCL","n":"Stepan Company Common Stock"},{"s":"SCLX","n":"Scilex Holding Company"},{"s":"SCM","n":"Stellus Capital Investment Corporation Common Stock"},{"s":"SCNI","n":"Scinai Immunotherapeutics Ltd."},{"s":"SCNX","n":"Scienture Holdings, Inc."},{"s":"SCOR","n":"comScore, Inc."},{"s":"SCPQ","n":"Social Commerce Partners Corporation"},{"s":"SCSC","n":"ScanSource, Inc."},{"s":"SCWO","n":"374Water Inc."},{"s":"SCYX","n":"SCYNEXIS, Inc."},{"s":"SCZM","n":"Santacruz Silver Mining Ltd. - Common Shares"},{"s":"SD","n":"SandRidge Energy, Inc. Common Stock"},{"s":"SDA","n":"SunCar Technology Group Inc."},{"s":"SDEV","n":"Stablecoin Development Corporation Common Stock"},{"s":"SDGR","n":"Schrodinger, Inc."},{"s":"SDHC","n":"Smith Douglas Homes Corp. Class A Common Stock"},{"s":"SDOT","n":"Sadot Group Inc."},{"s":"SDRL","n":"Seadrill Limited Common Shares"},{"s":"SDST","n":"Stardust Power Inc."},{"s":"SE","n":"Sea Limited American Depositary Shares, each representing one Class A Ordinary Share"},{"s":"SEAT","n":"Vivid Seats Inc."},{"s":"SEB","n":"Seaboard Corporation Common Stock"},{"s":"SECZ","n":"Securitize Corp. Common Stock"},{"s":"SEDG","n":"SolarEdge Technologies, Inc."},{"s":"SEED","n":"Origin Agritech Limited"},{"s":"SEER","n":"Seer, Inc."},{"s":"SEG","n":"Seaport Entertainment Group Inc. Common Stock"},{"s":"SEGG","n":"Sports Entertainment Gaming Global Corporation"},{"s":"SEI","n":"Solaris Energy Infrastructure, Inc. Class A Common Stock"},{"s":"SEIC","n":"SEI Investments Company"},{"s":"SELF","n":"Global Self Storage, Inc."},{"s":"SENEA","n":"Seneca Foods Corp."},{"s":"SENEB","n":"Seneca Foods Corp."},{"s":"SENS","n":"Senseonics Holdings, Inc."},{"s":"SEPN","n":"Septerna, Inc."},{"s":"SER","n":"Serina Therapeutics, Inc. Common Stock"},{"s":"SERA","n":"Sera Prognostics, Inc."},{"s":"SERV","n":"Serve Robotics Inc."},{"s":"SES","n":"SES AI Corporation Class A Common Stock"},{"s":"SEV","n":"Aptera Motors Corp."},{"s":"SEZL","n":"Sezzle Inc."},{"s":"SF","n":"Stifel Financial Corporation Common Stock"},{"s":"SFBC","n":"Sound Financial Bancorp, Inc."},{"s":"SFBS","n":"ServisFirst Bancshares, Inc. Common Stock"},{"s":"SFD","n":"Smithfield Foods, Inc."},{"s":"SFHG","n":"Samfine Creation Holdings Group Limited"},{"s":"SFIX","n":"Stitch Fix, Inc."},{"s":"SFL","n":"SFL Corporation Ltd"},{"s":"SFM","n":"Sprouts Farmers Market, Inc."},{"s":"SFNC","n":"Simmons First National Corporation"},{"s":"SFST","n":"Southern First Bancshares, Inc."},{"s":"SFWL","n":"Shengfeng Development Limited"},{"s":"SG","n":"Sweetgreen, Inc. Class A Common Stock"},{"s":"SGA","n":"Saga Communications, Inc."},{"s":"SGC","n":"Superior Group of Companies, Inc."},{"s":"SGHC","n":"Super Group (SGHC) Limited Ordinary Shares"},{"s":"SGHT","n":"Sight Sciences, Inc."},{"s":"SGI","n":"Somnigroup International Inc. Common Stock"},{"s":"SGLY","n":"Singularity Future Technology Ltd."},{"s":"SGML","n":"Sigma Lithium Corporation - common shares"},{"s":"SGP","n":"SpyGlass Pharma, Inc."},{"s":"SGRP","n":"SPAR Group, Inc."},{"s":"SGRY","n":"Surgery Partners, Inc."},{"s":"SGU","n":"Star Group L.P. Common Stock"},{"s":"SHAK","n":"Shake Shack, Inc. Class A Common Stock"},{"s":"SHAZ","n":"SharonAI Holdings, Inc."},{"s":"SHBI","n":"Shore Bancshares, Inc."},{"s":"SHC","n":"Sotera Health Company"},{"s":"SHEL","n":"Shell PLC American Depositary Shares (each representing two (2) Ordinary Shares)"},{"s":"SHEN","n":"Shenandoah Telecommunications Co"},{"s":"SHFS","n":"SHF Holdings, Inc."},{"s":"SHFSW","n":"SHF Holdings, Inc. - Warrants"},{"s":"SHG","n":"Shinhan Financial Group Co Ltd American Depositary Shares"},{"s":"SHIM","n":"Shimmick Corporation"},{"s":"SHIP","n":"Seanergy Maritime Holdings Corp."},{"s":"SHLS","n":"Shoals Technologies Group, Inc."},{"s":"SHMD","n":"SCHMID Group N.V."},{"s":"SHMDW","n":"SCHMID Group N.V. - Warrants"},{"s":"SHO","n":"Sunstone Hotel Investors, Inc. Sunstone Hotel Investors, Inc. Common Shares"},{"s":"SHOE","n":"Shoe Station Group, Inc."},{"s":"SHOO","n":"Steven Madden, Ltd."},{"s":"SHOP","n":"Shopify Inc."},{"s":"SHOT","n":"RMG ML Sports Holdings"},{"s":"SHPH","n":"Shuttle Pharmaceuticals Holdings, Inc."},{"s":"SHW","n":"Sherwin-Williams Company (The) Common Stock"},{"s":"SI","n":"Shoulder Innovations, Inc. Common Stock"},{"s":"SIBN","n":"SI-BONE, Inc."},{"s":"SID","n":"Companhia Siderurgica Nacional S.A. Common Stock"},{"s":"SIDU","n":"Sidus Space, Inc."},{"s":"SIEB","n":"Siebert Financial Corp."},{"s":"SIF","n":"SIFCO Industries, Inc. Common Stock"},{"s":"SIFY","n":"Sify Technologies Limited - American Depository Shares"},{"s":"SIG","n":"Signet Jewelers Limited Common Shares"},{"s":"SIGA","n":"SIGA Technologies Inc."},{"s":"SIGI","n":"Selective Insurance Group, Inc."},{"s":"SII","n":"Sprott Inc. Common Shares"},{"s":"SILC","n":"Silicom Ltd"},{"s":"SILO","n":"Silo Pharma, Inc."},{"s":"SIM","n":"Grupo Simec, S.A.B. de C.V. American Depositary Shares"},{"s":"SIMO","n":"Silicon Motion Technology Corporation"},{"s":"SIND","n":"Sinda Ltd. Common Stock"},{"s":"SINT","n":"SiNtx Technologies, Inc."},{"s":"SION","n":"Sionna Therapeutics, Inc."},{"s":"SIRI","n":"SiriusXM Holdings Inc."},{"s":"SITC","n":"SITE Centers Corp. Common Stock"},{"s":"SITE","n":"SiteOne Landscape Supply, Inc. Common Stock"},{"s":"SITM","n":"SiTime Corporation"},{"s":"SJ","n":"Scienjoy Holding Corporation"},{"s":"SJM","n":"The J.M. Smucker Company Common Stock"},{"s":"SKE","n":"Skeena Resources Limited Common Shares"},{"s":"SKHY","n":"SK hynix Inc."},{"s":"SKIL","n":"Skillsoft Corp. Class A Common Stock"},{"s":"SKIN","n":"SkinHealth Systems Inc."},{"s":"SKK","n":"SKK Holdings Limited"},{"s":"SKM","n":"SK Telecom Co., Ltd. Common Stock"},{"s":"SKT","n":"Tanger Inc. Common Stock"},{"s":"SKWD","n":"Skyward Specialty Insurance Group, Inc."},{"s":"SKY","n":"Champion Homes, Inc. Common Stock"},{"s":"SKYA","n":"SkyAI, Inc."},{"s":"SKYE","n":"Skye Bioscience, Inc."},{"s":"SKYH","n":"Sky Harbour Group Corporation Class A Common Stock"},{"s":"SKYQ","n":"Sky Quarry Inc."},{"s":"SKYT","n":"SkyWater Technology, Inc."},{"s":"SKYW","n":"SkyWest, Inc."},{"s":"SKYX","n":"SKYX Platforms Corp."},{"s":"SLAB","n":"Silicon Laboratories, Inc."},{"s":"SLB","n":"SLB Limited Common Shares"},{"s":"SLBT","n":"SL Science Holding Limited"},{"s":"SLDB","n":"Solid Biosciences Inc."},{"s":"SLDE","n":"Slide Insurance Holdings, Inc."},{"s":"SLDP","n":"Solid Power, Inc."},{"s":"SLE","n":"Super League Enterprise, Inc."},{"s":"SLF","n":"Sun Life Financial Inc. Common Stock"},{"s":"SLG","n":"SL Green Realty Corp Common Stock"},{"s":"SLGB","n":"Smart Logistics Global Limited"},{"s":"SLGL","n":"Sol-Gel Technologies Ltd."},{"s":"SLGN","n":"Silgan Holdings Inc. Common Stock"},{"s":"SLI","n":"Standard Lithium Ltd. Common Shares"},{"s":"SLM","n":"SLM Corporation"},{"s":"SLMT","n":"Brera Holdings PLC"},{"s":"SLN","n":"Silence Therapeutics Plc - American Depository Share"},{"s":"SLND","n":"Southland Holdings, Inc. Common Stock"},{"s":"SLNG","n":"Stabilis Solutions, Inc."},{"s":"SLNH","n":"Soluna Holdings, Inc."},{"s":"SLP","n":"Simulations Plus, Inc."},{"s":"SLQT","n":"SelectQuote, Inc. Common Stock"},{"s":"SLS","n":"SELLAS Life Sciences Group, Inc."},{"s":"SLSN","n":"Solesence, Inc."},{"s":"SLSR","n":"Solaris Resources Inc. Common Shares"},{"s":"SLVM","n":"Sylvamo Corporation Common Stock"},{"s":"SLXN","n":"Silexion Therapeutics Corp"},{"s":"SM","n":"SM Energy Company Common Stock"},{"s":"SMBC","n":"Southern Missouri Bancorp, Inc."},{"s":"SMBK","n":"SmartFinancial, Inc. Common Stock"},{"s":"SMC","n":"Summit Midstream Corporation Common Stock"},{"s":"SMCI","n":"Super Micro Computer, Inc."},{"s":"SMFG","n":"Sumitomo Mitsui Financial Group Inc Unsponsored American Depositary Shares (Japan)"},{"s":"SMG","n":"Scotts Miracle-Gro Company (The) Common Stock"},{"s":"SMHI","n":"SEACOR Marine Holdings Inc. Common Stock"},{"s":"SMID","n":"Smith-Midland Corporation"},{"s":"SMJF","n":"SMJ International Holdings Inc. Class A Ordinary Shares"},{"s":"SMMT","n":"Summit Therapeutics Inc."},{"s":"SMP","n":"Standard Motor Products, Inc. Common Stock"},{"s":"SMPL","n":"The Simply Good Foods Company"},{"s":"SMR","n":"NuScale Power Corporation Class A Common Stock"},{"s":"SMRT","n":"SmartRent, Inc. Class A Common Stock"},{"s":"SMSI","n":"Smith Micro Software, Inc."},{"s":"SMTC","n":"Semtech Corporation"},{"s":"SMTI","n":"Sanara MedTech Inc."},{"s":"SMTK","n":"SmartKem, Inc."},{"s":"SMWB","n":"Similarweb Ltd. Ordinary Shares"},{"s":"SMX","n":"SMX (Security Matters) Public Limited Company"},{"s":"SMXT","n":"Solarmax Technology Inc."},{"s":"SN","n":"SharkNinja, Inc. Ordinary Shares"},{"s":"SNA","n":"Snap-On Incorporated Common Stock"},{"s":"SNAL","n":"Snail, Inc."},{"s":"SNAP","n":"Snap Inc. Class A Common Stock"},{"s":"SND","n":"Smart Sand, Inc."},{"s":"SNDA","n":"Sonida Senior Living, Inc. Common Stock"},{"s":"SNDK","n":"Sandisk Corporation"},{"s":"SNDL","n":"SNDL Inc. - Common Shares"},{"s":"SNDR","n":"Schneider National, Inc. Common Stock"},{"s":"SNDX","n":"Syndax Pharmaceuticals, Inc."},{"s":"SNES","n":"SenesTech, Inc."},{"s":"SNEX","n":"StoneX Group Inc."},{"s":"SNFCA","n":"Security National Financial Corporation"},{"s":"SNGX","n":"Soligenix, Inc."},{"s":"SNN","n":"Smith & Nephew SNATS, Inc. Common Stock"},{"s":"SNOA","n":"Sonoma Pharmaceuticals, Inc."},{"s":"SNOW","n":"Snowflake Inc. Common Stock"},{"s":"SNPS","n":"Synopsys, Inc."},{"s":"SNT","n":"Senstar Technologies Corporation - Common Shares"},{"s":"SNTG","n":"Sentage Holdings Inc."},{"s":"SNTI","n":"Senti Biosciences Holdings, Inc."},{"s":"SNWV","n":"SANUWAVE Health, Inc."},{"s":"SNX","n":"TD SYNNEX Corporation Common Stock"},{"s":"SNY","n":"Sanofi"},{"s":"SNYR","n":"Synergy CHC Corp."},{"s":"SO","n":"Southern Company (The) Common Stock"},{"s":"SOAR","n":"Volato Group, Inc. Class A Common Stock"},{"s":"SOBO","n":"South Bow Corporation Common Shares"},{"s":"SOBR","n":"SOBR Safe, Inc."},{"s":"SOC","n":"Sable Offshore Corp. Common Stock"},{"s":"SOFI","n":"SoFi Technologies, Inc."},{"s":"SOGP","n":"Sound Group Inc."},{"s":"SOHU","n":"Sohu.com Limited"},{"s":"SOLS","n":"Solstice Advanced Materials Inc."},{"s":"SOLV","n":"Solventum Corporation Common Stock"},{"s":"SON","n":"Sonoco Products Company Common Stock"},{"s":"SONM","n":"DNA X, Inc."},{"s":"SONO","n":"Sonos, Inc."},{"s":"SONY","n":"Sony Group Corporation American Depositary Shares"},{"s":"SOPH","n":"SOPHiA GENETICS SA"},{"s":"SOR","n":"Source Capital, Inc. Cmn Shs of BI"},{"s":"SORA","n":"AsiaStrategy"},{"s":"SOS","n":"SOS Limited Class A Ordinary Shares"},{"s":"SOTK","n":"Sono-Tek Corporation"},{"s":"SOUN","n":"SoundHound AI, Inc."},{"s":"SOWG","n":"Sow Good Inc."},{"s":"SPAI","n":"Safe Pro Group Inc."},{"s":"SPB","n":"Spectrum Brands Holdings, Inc. Common Stock"},{"s":"SPCB","n":"SuperCom, Ltd."},{"s":"SPCE","n":"Virgin Galactic Holdings, Inc. Common Stock"},{"s":"SPCX","n":"Space Exploration Technologies Corp."},{"s":"SPFI","n":"South Plains Financial, Inc."},{"s":"SPG","n":"Simon Property Group, Inc. Common Stock"},{"s":"SPGI","n":"S&P Global Inc. Common Stock"},{"s":"SPH","n":"Suburban Propane Partners, L.P. Common Stock"},{"s":"SPHL","n":"Springview Holdings Ltd"},{"s":"SPHR","n":"Sphere Entertainment Co. Class A Common Stock"},{"s":"SPIR","n":"Spire Global, Inc. Class A Common Stock"},{"s":"SPMC","n":"Sound Point Meridian Capital, Inc. Common Stock"},{"s":"SPNT","n":"SiriusPoint Ltd. Common Shares"},{"s":"SPOK","n":"Spok Holdings, Inc."},{"s":"SPOT","n":"Spotify Technology S.A. Ordinary Shares"},{"s":"SPPL","n":"SIMPPLE LTD."},{"s":"SPRB","n":"Spruce Biosciences, Inc."},{"s":"SPRC","n":"SciSparc Ltd."},{"s":"SPRO","n":"Spero Therapeutics, Inc."},{"s":"SPRU","n":"Spruce Power Holding Corporation Class A Common Stock"},{"s":"SPRY","n":"ARS Pharmaceuticals, Inc."},{"s":"SPSC","n":"SPS Commerce, Inc."},{"s":"SPT","n":"Sprout Social, Inc"},{"s":"SPTX","n":"Seaport Therapeutics, Inc."},{"s":"SPWH","n":"Sportsman's Warehouse Holdings, Inc."},{"s":"SPWR","n":"SunPower Inc."},{"s":"SPXC","n":"SPX Technologies, Inc. Common Stock"},{"s":"SQM","n":"Sociedad Quimica y Minera S.A. Common Stock"},{"s":"SQNS","n":"Sequans Communications S.A. American Depositary Shares (each representing one hundred (100) Ordinary Shares)"},{"s":"SR","n":"Spire Inc. Common Stock"},{"s":"SRAD","n":"Sportradar Group AG"},{"s":"SRBK","n":"SR Bancorp, Inc."},{"s":"SRCE","n":"1st Source Corporation"},{"s":"SRE","n":"DBA Sempra Common Stock"},{"s":"SRFM","n":"Surf Air Mobility Inc. Common Stock"},{"s":"SRG","n":"Seritage Growth Properties Class A Common Stock"},{"s":"SRI","n":"Stoneridge, Inc. Common Stock"},{"s":"SRL","n":"Scully Royalty Ltd."},{"s":"SRPT","n":"Sarepta Therapeutics, Inc."},{"s":"SRRK","n":"Scholar Rock Holding Corporation"},{"s":"SRTA","n":"Strata Critical Medical, Inc."},{"s":"SRTS","n":"Sensus Healthcare, Inc."},{"s":"SRXH","n":"SRX Global Inc. Common Stock"},{"s":"SRZN","n":"Surrozen, Inc."},{"s":"SSB","n":"SouthState Bank Corporation Common Stock"},{"s":"SSBI","n":"Summit State Bank"},{"s":"SSD","n":"Simpson Manufacturing Company, Inc. Common Stock"},{"s":"SSII","n":"SS Innovations International Inc."},{"s":"SSL","n":"Sasol Ltd. American Depositary Shares"},{"s":"SSM","n":"Sono Group N.V."},{"s":"SSMR","n":"Sunshine Silver Mining & Refining Company Common Stock"},{"s":"SSNC","n":"SS&C Technologies Holdings, Inc."},{"s":"SSP","n":"E.W. Scripps Company (The)"},{"s":"SSRM","n":"SSR Mining Inc."},{"s":"SST","n":"System1, Inc. Class A Common Stock"},{"s":"SSTI","n":"SoundThinking, Inc."},{"s":"SSTK","n":"Shutterstock, Inc. Common Stock"},{"s":"SSYS","n":"Stratasys, Ltd."},{"s":"ST","n":"Sensata Technologies Holding plc Ordinary Shares"},{"s":"STAA","n":"STAAR Surgical Company"},{"s":"STAG","n":"Stag Industrial, Inc. Common Stock"},{"s":"STAK","n":"STAK Inc."},{"s":"STBA","n":"S&T Bancorp, Inc."},{"s":"STC","n":"Stewart Information Services Corporation Common Stock"},{"s":"STDN","n":"Standard Nuclear, Inc. Class A Common Stock"},{"s":"STE","n":"STERIS plc (Ireland) Ordinary Shares"},{"s":"STEM","n":"Stem, Inc. Class A Common Stock"},{"s":"STEP","n":"StepStone Group Inc."},{"s":"STEX","n":"Streamex Corp."},{"s":"STFS","n":"Star Fashion Culture Holdings Limited"},{"s":"STG","n":"Sunlands Technology Group American Depositary Shares, representing Class A ordinary shares"},{"s":"STGW","n":"Stagwell Inc."},{"s":"STHO","n":"Star Holdings - Shares of Beneficial Interest"},{"s":"STI","n":"Solidion Technology, Inc."},{"s":"STIM","n":"Neuronetics, Inc."},{"s":"STKE","n":"Sol Strategies Inc. - Common Shares"},{"s":"STKH","n":"Steakholder Foods Ltd."},{"s":"STKS","n":"The ONE Group Hospitality, Inc."},{"s":"STLA","n":"Stellantis N.V. Common Shares"},{"s":"STLD","n":"Steel Dynamics, Inc."},{"s":"STM","n":"STMicroelectronics N.V. Common Stock"},{"s":"STN","n":"Stantec Inc Common Stock"},{"s":"STNE","n":"StoneCo Ltd."},{"s":"STNG","n":"Scorpio Tankers Inc. Common Shares"},{"s":"STOK","n":"Stoke Therapeutics, Inc."},{"s":"STRA","n":"Strategic Education, Inc."},{"s":"STRL","n":"Sterling Infrastructure, Inc."},{"s":"STRO","n":"Sutro Biopharma, Inc."},{"s":"STRR","n":"Star Equity Holdings, Inc."},{"s":"STRS","n":"Stratus Properties Inc."},{"s":"STRT","n":"STRATTEC SECURITY CORPORATION"},{"s":"STRZ","n":"Starz Entertainment Corp. - Common Shares"},{"s":"STT","n":"State Street Corporation Common Stock"},{"s":"STTK","n":"Shattuck Labs, Inc."},{"s":"STUB","n":"StubHub Holdings, Inc. Class A Common Stock"},{"s":"STVN","n":"Stevanato Group S.p.A. Ordinary Shares"},{"s":"STX","n":"Seagate Technology Holdings PLC"},{"s":"STXS","n":"Stereotaxis, Inc. Common Stock"},{"s":"STZ","n":"Constellation Brands, Inc. Common Stock"},{"s":"SU","n":"Suncor Energy Inc. Common Stock"},{"s":"SUGP","n":"SU Group Holdings Limited"},{"s":"SUI","n":"Sun Communities, Inc. Common Stock"},{"s":"SUIG","n":"Sui Group Holdings Limited"},{"s":"SUJA","n":"Suja Life, Inc."},{"s":"SUNB","n":"Sunbelt Rentals Holdings, Inc. Common Stock"},{"s":"SUNC","n":"SunocoCorp LLC Common Units, representing limited liability company interests"},{"s":"SUNE","n":"SUNation Energy, Inc."},{"s":"SUPN","n":"Supernus Pharmaceuticals, Inc."},{"s":"SUPV","n":"Grupo Supervielle S.A. American Depositary Shares each Representing five Class B shares"},{"s":"SUPX","n":"SuperX AI Technology Limited"},{"s":"SURG","n":"SurgePays, Inc."},{"s":"SUZ","n":"Suzano S.A. American Depositary Shares (each representing One Ordinary Share)"},{"s":"SVA","n":"Sinovac Biotech, Ltd."},{"s":"SVCC","n":"Stellar V Capital Corp."},{"s":"SVCO","n":"Silvaco Group, Inc."},{"s":"SVM","n":"Silvercorp Metals Inc. Common Shares"},{"s":"SVRA","n":"Savara, Inc."},{"s":"SVRE","n":"SaverOne 2014 Ltd."},{"s":"SVRN","n":"OceanPal Inc."},{"s":"SVV","n":"Savers Value Village, Inc. Common Stock"},{"s":"SW","n":"Smurfit WestRock plc Ordinary Shares"},{"s":"SWAG","n":"Stran & Company, Inc."},{"s":"SWBI","n":"Smith & Wesson Brands, Inc."},{"s":"SWIM","n":"Latham Group, Inc."},{"s":"SWK","n":"Stanley Black & Decker, Inc. Common Stock"},{"s":"SWKS","n":"Skyworks Solutions, Inc."},{"s":"SWMR","n":"Swarmer, Inc"},{"s":"SWVL","n":"Swvl Holdings Corp"},{"s":"SWX","n":"Southwest Gas Holdings, Inc. Common Stock (DE)"},{"s":"SXC","n":"SunCoke Energy, Inc. Common Stock"},{"s":"SXI","n":"Standex International Corporation Common Stock"},{"s":"SXT","n":"Sensient Technologies Corporation Common Stock"},{"s":"SXTC","n":"China SXT Pharmaceuticals, Inc."},{"s":"SXTP","n":"60 Degrees Pharmaceuticals, Inc."},{"s":"SY","n":"So-Young International Inc. - American Depository Shares"},{"s":"SYBT","n":"Stock Yards Bancorp, Inc."},{"s":"SYF","n":"Synchrony Financial Common Stock"},{"s":"SYK","n":"Stryker Corporation Common Stock"},{"s":"SYM","n":"Symbotic Inc."},{"s":"SYNA","n":"Synaptics Incorporated"},{"s":"SYNX","n":"Silynxcom Ltd. Ordinary Shares"},{"s":"SYPR","n":"Sypris Solutions, Inc."},{"s":"SYRE","n":"Spyre Therapeutics, Inc."},{"s":"SYY","n":"Sysco Corporation Common Stock"},{"s":"T","n":"AT&T Inc."},{"s":"TAC","n":"TransAlta Corporation Ordinary Shares"},{"s":"TACT","n":"TransAct Technologies Incorporated"},{"s":"TAK","n":"Takeda Pharmaceutical Company Limited American Depositary Shares (each representing 1/2 of a share of Common Stock)"},{"s":"TAL","n":"TAL Education Group American Depositary Shares"},{"s":"TALK","n":"Talkspace, Inc."},{"s":"TALO","n":"Talos Energy, Inc. Common Stock"},{"s":"TANH","n":"Tantech Holdings Ltd."},{"s":"TAOP","n":"Taoping Inc."},{"s":"TAOX","n":"Tao Synergies Inc."},{"s":"TAP","n":"Molson Coors Beverage Company Class B Common Stock"},{"s":"TAP-A","n":"Molson Coors Beverage Company Class A Common Stock"},{"s":"TARA","n":"Protara Therapeutics, Inc."},{"s":"TARS","n":"Tarsus Pharmaceuticals, Inc."},{"s":"TASK","n":"TaskUs, Inc."},{"s":"TATT","n":"TAT Technologies Ltd."},{"s":"TAYD","n":"Taylor Devices, Inc."},{"s":"TBBB","n":"BBB Foods Inc. Class A Common Shares"},{"s":"TBBK","n":"The Bancorp, Inc."},{"s":"TBCH","n":"Turtle Beach Corporation"},{"s":"TBI","n":"TrueBlue, Inc. Common Stock"},{"s":"TBLA","n":"Taboola.com Ltd."},{"s":"TBN","n":"Tamboran Resources Corporation Common stock"},{"s":"TBPH","n":"Theravance Biopharma, Inc."},{"s":"TC","n":"Token Cat Limited"},{"s":"TCBI","n":"Texas Capital Bancshares, Inc."},{"s":"TCBK","n":"TriCo Bancshares"},{"s":"TCBS","n":"Texas Community Bancshares, Inc."},{"s":"TCBX","n":"Third Coast Bancshares, Inc. Common Stock"},{"s":"TCI","n":"Transcontinental Realty Investors, Inc. Common Stock"},{"s":"TCMD","n":"Tactile Systems Technology, Inc."},{"s":"TCOM","n":"Trip.com Group Limited"},{"s":"TCRT","n":"Alaunos Therapeutics, Inc."},{"s":"TCRX","n":"TScan Therapeutics, Inc."},{"s":"TCX","n":"Tucows Inc."},{"s":"TD","n":"Toronto Dominion Bank (The) Common Stock"},{"s":"TDAY","n":"USA TODAY Co., Inc. Common Stock"},{"s":"TDC","n":"Teradata Corporation Common Stock"},{"s":"TDG","n":"Transdigm Group Incorporated Common Stock"},{"s":"TDIC","n":"Dreamland Limited"},{"s":"TDOC","n":"Teladoc Health, Inc. Common Stock"},{"s":"TDS","n":"Telephone and Data Systems, Inc. Common Shares"},{"s":"TDTH","n":"Trident Digital Tech Holdings Ltd"},{"s":"TDUP","n":"ThredUp Inc."},{"s":"TDW","n":"Tidewater Inc. Common Stock"},{"s":"TDY","n":"Teledyne Technologies Incorporated Common Stock"},{"s":"TE","n":"T1 Energy Inc. Common Stock"},{"s":"TEAD","n":"Teads Holding Co."},{"s":"TEAM","n":"Atlassian Corporation"},{"s":"TECH","n":"Bio-Techne Corp"},{"s":"TECK","n":"Teck Resources Ltd Ordinary Shares"},{"s":"TECX","n":"Tectonic Therapeutic, Inc."},{"s":"TEL","n":"TE Connectivity plc Ordinary Shares"},{"s":"TELA","n":"TELA Bio, Inc."},{"s":"TELO","n":"Telomir Pharmaceuticals, Inc."},{"s":"TEM","n":"Tempus AI, Inc."},{"s":"TEN","n":"Tsakos Energy Navigation Ltd Common Shares"},{"s":"TENB","n":"Tenable Holdings, Inc."},{"s":"TENX","n":"Tenax Therapeutics, Inc."},{"s":"TEO","n":"Telecom Argentina SA"},{"s":"TER","n":"Teradyne, Inc."},{"s":"TEVA","n":"Teva Pharmaceutical Industries Limited American Depositary Shares"},{"s":"TEX","n":"Terex Corporation Common Stock"},{"s":"TFC","n":"Truist Financial Corporation Common Stock"},{"s":"TFII","n":"TFI International Inc. Common Shares"},{"s":"TFIN","n":"Triumph Financial, Inc. Common Stock"},{"s":"TFPM","n":"Triple Flag Precious Metals Corp. Common Shares"},{"s":"TFSL","n":"TFS Financial Corporation"},{"s":"TFX","n":"Teleflex Incorporated Common Stock"},{"s":"TG","n":"Tredegar Corporation Common Stock"},{"s":"TGB","n":"Trekor Metals Limited Common Shares"},{"s":"TGE","n":"The Generation Essentials Group Class A Ordinary Shares"},{"s":"TGEN","n":"Tecogen Inc. Common Stock"},{"s":"TGHL","n":"The GrowHub Limited"},{"s":"TGL","n":"Treasure Global Inc."},{"s":"TGLS","n":"Tecnoglass Inc. Common Stock"},{"s":"TGS","n":"Transportadora de Gas del Sur SA TGS Common Stock"},{"s":"TGT","n":"Target Corporation Common Stock"},{"s":"TGTX","n":"TG Therapeutics, Inc."},{"s":"TH","n":"Target Hospitality Corp."},{"s":"THC","n":"Tenet Healthcare Corporation Common Stock"},{"s":"THCH","n":"TH International Limited"},{"s":"THFF","n":"First Financial Corporation"},{"s":"THG","n":"Hanover Insurance Group Inc"},{"s":"THH","n":"TryHard Holdings Limited"},{"s":"THM","n":"International Tower Hill Mines, Ltd. Ordinary Shares (Canada)"},{"s":"THO","n":"Thor Industries, Inc. Common Stock"},{"s":"THRM","n":"Gentherm Inc"},{"s":"THRY","n":"Thryv Holdings, Inc."},{"s":"TIC","n":"TIC Solutions, Inc. Common Stock"},{"s":"TIGO","n":"Millicom International Cellular S.A."},{"s":"TIGR","n":"UP Fintech Holding Limited"},{"s":"TII","n":"Titan Mining Corporation Common Shares"},{"s":"TIL","n":"Instil Bio, Inc."},{"s":"TILE","n":"Interface, Inc."},{"s":"TIMB","n":"TIM S.A. American Depositary Shares (Each representing 5 Common Shares)"},{"s":"TIPT","n":"Tiptree Inc."},{"s":"TISI","n":"Team, Inc. Common Stock"},{"s":"TITN","n":"Titan Machinery Inc."},{"s":"TJGC","n":"TJGC Group Limited"},{"s":"TJX","n":"TJX Companies, Inc. (The) Common Stock"},{"s":"TK","n":"Teekay Corporation Ltd. Common Stock"},{"s":"TKC","n":"Turkcell Iletisim Hizmetleri AS Common Stock"},{"s":"TKLF","n":"Tokyo Lifestyle Co., Ltd."},{"s":"TKNO","n":"Alpha Teknova, Inc."},{"s":"TKO","n":"TKO Group Holdings, Inc. Class A Common Stock"},{"s":"TKR","n":"Timken Company (The) Common Stock"},{"s":"TLF","n":"Tandy Leather Factory, Inc."},{"s":"TLIH","n":"Ten-League International Holdings Limited"},{"s":"TLK","n":"PT Telekomunikasi Indonesia, Tbk"},{"s":"TLN","n":"Talen Energy Corporation"},{"s":"TLNC","n":"Talon Capital Corp."},{"s":"TLNCU","n":"Talon Capital Corp. - Units"},{"s":"TLNCW","n":"Talon Capital Corp. - Warrants"},{"s":"TLPH","n":"Talphera, Inc."},{"s":"TLRY","n":"Tilray Brands, Inc."},{"s":"TLS","n":"Telos Corporation"},{"s":"TLSA","n":"Tiziana Life Sciences Ltd - Common Shares"},{"s":"TLSI","n":"TriSalus Life Sciences, Inc."},{"s":"TLX","n":"Telix Pharmaceuticals Limited"},{"s":"TLYS","n":"Tilly's, Inc. Common Stock"},{"s":"TM","n":"Toyota Motor Corporation Common Stock"},{"s":"TMC","n":"TMC the metals company Inc."},{"s":"TMCI","n":"Treace Medical Concepts, Inc."},{"s":"TMCR","n":"The Metals Royalty Company Inc."},{"s":"TMDE","n":"TMD Energy Limited Ordinary Shares"},{"s":"TMDX","n":"TransMedics Group, Inc."},{"s":"TME","n":"Tencent Music Entertainment Group American Depositary Shares, each representing two Class A Ordinary Shares"},{"s":"TMHC","n":"Taylor Morrison Home Corporation Common Stock"},{"s":"TMO","n":"Thermo Fisher Scientific Inc Common Stock"},{"s":"TMP","n":"Tompkins Financial Corporation Common Stock"},{"s":"TMQ","n":"Trilogy Metals Inc. Common Stock"},{"s":"TMS","n":"Teamshares Inc."},{"s":"TMSWW","n":"Teamshares Inc. - Warrants"},{"s":"TMUS","n":"T-Mobile US, Inc."},{"s":"TNC","n":"Tennant Company Common Stock"},{"s":"TNDM","n":"Tandem Diabetes Care, Inc."},{"s":"TNET","n":"TriNet Group, Inc. Common Stock"},{"s":"TNGX","n":"Tango Therapeutics, Inc."},{"s":"TNK","n":"Teekay Tankers Ltd."},{"s":"TNL","n":"Travel Leisure Co. Common Stock"},{"s":"TNMG","n":"TNL Mediagene"},{"s":"TNON","n":"Tenon Medical, Inc."},{"s":"TNXP","n":"Tonix Pharmaceuticals Holding Corp."},{"s":"TNYA","n":"Tenaya Therapeutics, Inc."},{"s":"TOI","n":"The Oncology Institute, Inc."},{"s":"TOL","n":"Toll Brothers, Inc. Common Stock"},{"s":"TOMZ","n":"TOMI Environmental Solutions, Inc."},{"s":"TONX","n":"TON Strategy Company"},{"s":"TOON","n":"Kartoon Studios, Inc. Common Stock"},{"s":"TOP","n":"TOP Financial Group Limited"},{"s":"TOPP","n":"Toppoint Holdings Inc. Common Stock"},{"s":"TOPS","n":"TOP Ships, Inc. Common Stock"},{"s":"TORO","n":"Toro Corp."},{"s":"TOST","n":"Toast, Inc. Class A Common Stock"},{"s":"TOUR","n":"Tuniu Corporation"},{"s":"TOVX","n":"Theriva Biologics, Inc. Common Stock"},{"s":"TOWN","n":"Towne Bank"},{"s":"TOYO","n":"TOYO Co., Ltd"},{"s":"TPB","n":"Turning Point Brands, Inc. Common Stock"},{"s":"TPC","n":"Tutor Perini Corporation Common Stock"},{"s":"TPCS","n":"TechPrecision Corporation"},{"s":"TPET","n":"Trio Petroleum Corp. Common Stock"},{"s":"TPG","n":"TPG Inc."},{"s":"TPL","n":"Texas Pacific Land Corporation Common Stock"},{"s":"TPR","n":"Tapestry, Inc. Common Stock"},{"s":"TPST","n":"Tempest Therapeutics, Inc."},{"s":"TPVG","n":"TriplePoint Venture Growth BDC Corp. Common Stock"},{"s":"TR","n":"Tootsie Roll Industries, Inc. Common Stock"},{"s":"TRAK","n":"ReposiTrak, Inc. Common Stock"},{"s":"TRAW","n":"Traws Pharma, Inc."},{"s":"TRAX","n":"First Tracks Biotherapeutics, Inc."},{"s":"TRC","n":"Tejon Ranch Co Common Stock"},{"s":"TRDA","n":"Entrada Therapeutics, Inc."},{"s":"TREE","n":"LendingTree, Inc."},{"s":"TREX","n":"Trex Company, Inc. Common Stock"},{"s":"TRGP","n":"Targa Resources, Inc. Common Stock"},{"s":"TRGS","n":"TRG Latin America Acquisitions Corp."},{"s":"TRGSU","n":"TRG Latin America Acquisitions Corp. - Units"},{"s":"TRI","n":"Thomson Reuters Corp - Common Shares"},{"s":"TRIB","n":"Trinity Biotech plc"},{"s":"TRIN","n":"Trinity Capital Inc."},{"s":"TRIP","n":"TripAdvisor, Inc."},{"s":"TRLV","n":"Trulieve Cannabis Corp. Subordinate Voting Shares"},{"s":"TRMB","n":"Trimble Inc."},{"s":"TRMD","n":"TORM plc"},{"s":"TRMK","n":"Trustmark Corporation"},{"s":"TRN","n":"Trinity Industries, Inc. Common Stock"},{"s":"TRNO","n":"Terreno Realty Corporation Common Stock"},{"s":"TRNR","n":"Interactive Strength Inc."},{"s":"TRNS","n":"Transcat, Inc."},{"s":"TRON","n":"Tron Inc."},{"s":"TROO","n":"TROOPS, Inc."},{"s":"TROW","n":"T. Rowe Price Group, Inc."},{"s":"TROX","n":"Tronox Holdings plc Ordinary Shares (UK)"},{"s":"TRP","n":"TC Energy Corporation Common Stock"},{"s":"TRS","n":"TriMas Corporation"},{"s":"TRSG","n":"Tungray Technologies Inc"},{"s":"TRST","n":"TrustCo Bank Corp NY"},{"s":"TRT","n":"Trio-Tech International Common Stock"},{"s":"TRU","n":"TransUnion Common Stock"},{"s":"TRUG","n":"TruGolf Holdings, Inc."},{"s":"TRUP","n":"Trupanion, Inc."},{"s":"TRV","n":"The Travelers Companies, Inc. Common Stock"},{"s":"TRVG","n":"trivago N.V."},{"s":"TRVI","n":"Trevi Therapeutics, Inc."},{"s":"TRX","n":"TRX Gold Corporation Common Stock"},{"s":"TS","n":"Tenaris S.A. American Depositary Shares"},{"s":"TSAT","n":"Telesat Corporation"},{"s":"TSBK","n":"Timberland Bancorp, Inc."},{"s":"TSCO","n":"Tractor Supply Company"},{"s":"TSEM","n":"Tower Semiconductor Ltd."},{"s":"TSHA","n":"Taysha Gene Therapies, Inc."},{"s":"TSLA","n":"Tesla, Inc."},{"s":"TSLX","n":"Sixth Street Specialty Lending, Inc. Common Stock"},{"s":"TSM","n":"Taiwan Semiconductor Manufacturing Company Ltd."},{"s":"TSN","n":"Tyson Foods, Inc. Common Stock"},{"s":"TSQ","n":"Townsquare Media, Inc. Class A Common Stock"},{"s":"TSSI","n":"TSS, Inc."},{"s":"TT","n":"Trane Technologies plc"},{"s":"TTAM","n":"Titan America SA Common Shares"},{"s":"TTAN","n":"ServiceTitan, Inc."},{"s":"TTC","n":"Toro Company (The) Common Stock"},{"s":"TTD","n":"The Trade Desk, Inc."},{"s":"TTE","n":"TotalEnergies SE Ordinary Shares"},{"s":"TTEC","n":"TTEC Holdings, Inc."},{"s":"TTEK","n":"Tetra Tech, Inc."},{"s":"TTGT","n":"TechTarget, Inc."},{"s":"TTI","n":"Tetra Technologies, Inc. Common Stock"},{"s":"TTMI","n":"TTM Technologies, Inc."},{"s":"TTRX","n":"Turn Therapeutics Inc."},{"s":"TTWO","n":"Take-Two Interactive Software, Inc."},{"s":"TU","n":"Telus Corporation Ordinary Shares"},{"s":"TULP","n":"Bloomia Holdings, Inc."},{"s":"TURB","n":"Turbo Energy, S.A."},{"s":"TUSK","n":"Mammoth Energy Services, Inc."},{"s":"TUYA","n":"Tuya Inc. American Depositary Shares, each representing one Class A Ordinary Share"},{"s":"TV","n":"Grupo Televisa S.A.B. Common Stock"},{"s":"TVC","n":"Tennessee Valley Authority Common Stock"},{"s":"TVE","n":"Tennessee Valley Authority"},{"s":"TVGN","n":"Tevogen Bio Holdings Inc."},{"s":"TVRD","n":"Tvardi Therapeutics, Inc."},{"s":"TVTX","n":"Travere Therapeutics, Inc."},{"s":"TW","n":"Tradeweb Markets Inc."},{"s":"TWAV","n":"TaoWeave, Inc."},{"s":"TWFG","n":"TWFG, Inc."},{"s":"TWG","n":"Top Wealth Group Holding Limited"},{"s":"TWI","n":"Titan International, Inc. (DE) Common Stock"},{"s":"TWIN","n":"Twin Disc, Incorporated"},{"s":"TWLO","n":"Twilio Inc. Class A Common Stock"},{"s":"TWLV","n":"Twelve Seas Investment Company III"},{"s":"TWLVU","n":"Twelve Seas Investment Company III - Units"},{"s":"TWO","n":"Two Harbors Investment Corp"},{"s":"TWST","n":"Twist Bioscience Corporation"},{"s":"TX","n":"Ternium S.A. Ternium S.A. American Depositary Shares (each representing ten shares, USD1.00 par value)"},{"s":"TXG","n":"10x Genomics, Inc."},{"s":"TXMD","n":"TherapeuticsMD, Inc."},{"s":"TXN","n":"Texas Instruments Incorporated"},{"s":"TXNM","n":"TXNM Energy, Inc. Common Stock"},{"s":"TXO","n":"TXO Partners, L.P. Common Units Representing Limited Partner Interests"},{"s":"TXRH","n":"Texas Roadhouse, Inc."},{"s":"TXT","n":"Textron Inc. Common Stock"},{"s":"TY","n":"Tri Continental Corporation Common Stock"},{"s":"TYG","n":"Tortoise Energy Infrastructure Corporation Common Stock"},{"s":"TYGO","n":"Tigo Energy, Inc."},{"s":"TYL","n":"Tyler Technologies, Inc. Common Stock"},{"s":"TYRA","n":"Tyra Biosciences, Inc."},{"s":"TZOO","n":"Travelzoo"},{"s":"U","n":"Unity Software Inc. Common Stock"},{"s":"UA","n":"Under Armour, Inc. Class C Common Stock"},{"s":"UAA","n":"Under Armour, Inc. Class A Common Stock"},{"s":"UAL","n":"United Airlines Holdings, Inc."},{"s":"UAMY","n":"United States Antimony Corporation Common Stock"},{"s":"UAVS","n":"AgEagle Aerial Systems, Inc. Common Stock"},{"s":"UBCP","n":"United Bancorp, Inc."},{"s":"UBER","n":"Uber Technologies, Inc. Common Stock"},{"s":"UBS","n":"UBS Group AG Registered Ordinary Shares"},{"s":"UBSI","n":"United Bankshares, Inc."},{"s":"UBXG","n":"U-BX Technology Ltd."},{"s":"UCAR","n":"U Power Limited"},{"s":"UCB","n":"United Community Banks, Inc. Common Stock"},{"s":"UCFI","n":"CN Healthy Food Tech Group Corp."},{"s":"UCL","n":"uCloudlink Group Inc."},{"s":"UCTT","n":"Ultra Clean Holdings, Inc."},{"s":"UDR","n":"UDR, Inc. Common Stock"},{"s":"UE","n":"Urban Edge Properties Common Shares of Beneficial Interest"},{"s":"UEC","n":"Uranium Energy Corp. Common Stock"},{"s":"UEIC","n":"Universal Electronics Inc."},{"s":"UFCS","n":"United Fire Group, Inc"},{"s":"UFG","n":"Uni-Fuels Holdings Limited"},{"s":"UFI","n":"Unifi, Inc. New Common Stock"},{"s":"UFPI","n":"UFP Industries, Inc."},{"s":"UFPT","n":"UFP Technologies, Inc."},{"s":"UG","n":"United-Guardian, Inc."},{"s":"UGI","n":"UGI Corporation Common Stock"},{"s":"UGP","n":"Ultrapar Participacoes S.A. (New) American Depositary Shares (Each representing one Common Share)"},{"s":"UHAL","n":"U-Haul Holding Company Common Stock"},{"s":"UHS","n":"Universal Health Services, Inc. Common Stock"},{"s":"UI","n":"Ubiquiti Inc. Common Stock"},{"s":"UIS","n":"Unisys Corporation New Common Stock"},{"s":"UK","n":"Ucommune International Ltd"},{"s":"UL","n":"Unilever PLC American Depositary Shares (each representing One Ordinary Share)"},{"s":"ULBI","n":"Ultralife Corporation"},{"s":"ULCC","n":"Frontier Group Holdings, Inc."},{"s":"ULH","n":"Universal Logistics Holdings, Inc."},{"s":"ULS","n":"UL Solutions Inc. Class A Common Stock"},{"s":"ULTA","n":"Ulta Beauty, Inc."},{"s":"UMAC","n":"Unusual Machines, Inc. Common Stock"},{"s":"UMBF","n":"UMB Financial Corporation"},{"s":"UMC","n":"United Microelectronics Corporation (NEW) Common Stock"},{"s":"UMH","n":"UMH Properties, Inc. Common Stock"},{"s":"UNB","n":"Union Bankshares, Inc."},{"s":"UNCY","n":"Unicycive Therapeutics, Inc."},{"s":"UNF","n":"Unifirst Corporation Common Stock"},{"s":"UNFI","n":"United Natural Foods, Inc. Common Stock"},{"s":"UNH","n":"UnitedHealth Group Incorporated Common Stock (DE)"},{"s":"UNIT","n":"Uniti Group Inc."},{"s":"UNM","n":"Unum Group Common Stock"},{"s":"UNP","n":"Union Pacific Corporation Common Stock"},{"s":"UNTY","n":"Unity Bancorp, Inc."},{"s":"UONE","n":"Urban One, Inc."},{"s":"UONEK","n":"Urban One, Inc."},{"s":"UP","n":"Wheels Up Experience Inc. Class A Common Stock"},{"s":"UPB","n":"Upstream Bio, Inc."},{"s":"UPBD","n":"Upbound Group, Inc."},{"s":"UPC","n":"Universe Pharmaceuticals Inc"},{"s":"UPLD","n":"Upland Software, Inc."},{"s":"UPS","n":"United Parcel Service, Inc. Common Stock"},{"s":"UPST","n":"Upstart Holdings, Inc."},{"s":"UPWK","n":"Upwork Inc."},{"s":"UPXI","n":"Upexi, Inc."},{"s":"URBN","n":"Urban Outfitters, Inc."},{"s":"URG","n":"Ur Energy Inc Common Shares (Canada)"},{"s":"URGN","n":"UroGen Pharma Ltd."},{"s":"URI","n":"United Rentals, Inc. Common Stock"},{"s":"UROY","n":"Uranium Royalty Corp."},{"s":"USAR","n":"USA Rare Earth, Inc."},{"s":"USAS","n":"Americas Gold and Silver Corporation Common Shares, no par value"},{"s":"USAU","n":"U.S. Gold Corp."},{"s":"USB","n":"U.S. Bancorp Common Stock"},{"s":"USBC","n":"USBC, Inc. Common Stock"},{"s":"USCB","n":"USCB Financial Holdings, Inc."},{"s":"USDE","n":"StablecoinX Inc."},{"s":"USDEW","n":"StablecoinX Inc. - Warrants"},{"s":"USEA","n":"United Maritime Corporation"},{"s":"USFD","n":"US Foods Holding Corp. Common Stock"},{"s":"USGO","n":"U.S. GoldMining Inc."},{"s":"USIO","n":"Usio, Inc."},{"s":"USLM","n":"United States Lime & Minerals, Inc."},{"s":"USNA","n":"USANA Health Sciences, Inc. Common Stock"},{"s":"USPH","n":"U.S. Physical Therapy, Inc. Common Stock"},{"s":"UTHR","n":"United Therapeutics Corporation"},{"s":"UTI","n":"Universal Technical Institute Inc Common Stock"},{"s":"UTL","n":"UNITIL Corporation Common Stock"},{"s":"UTMD","n":"Utah Medical Products, Inc."},{"s":"UTSI","n":"UTStarcom Holdings Corp"},{"s":"UTZ","n":"Utz Brands Inc Class A Common Stock"},{"s":"UUU","n":"Universal Safety Products, Inc. Common Stock"},{"s":"UUUU","n":"Energy Fuels Inc Ordinary Shares (Canada)"},{"s":"UVE","n":"UNIVERSAL INSURANCE HOLDINGS INC Common Stock"},{"s":"UVSP","n":"Univest Financial Corporation"},{"s":"UVV","n":"Universal Corporation Common Stock"},{"s":"UWMC","n":"UWM Holdings Corporation Class A Common Stock"},{"s":"UXIN","n":"Uxin Limited"},{"s":"UZX","n":"Linkage Global Inc"},{"s":"V","n":"Visa Inc."},{"s":"VABK","n":"Virginia National Bankshares Corporation"},{"s":"VAC","n":"Marriott Vacations Worldwide Corporation Common Stock"},{"s":"VAL","n":"Valaris Limited Common Shares"},{"s":"VAL-W","n":"Valaris Limited Warrants"},{"s":"VALE","n":"VALE S.A. American Depositary Shares Each Representing one common share"},{"s":"VALN","n":"Valneva SE"},{"s":"VALU","n":"Value Line, Inc."},{"s":"VANI","n":"Vivani Medical, Inc."},{"s":"VATE","n":"INNOVATE Corp. Common Stock"},{"s":"VBIO","n":"Valion Bio, Inc."},{"s":"VBNK","n":"VersaBank - Common Shares"},{"s":"VC","n":"Visteon Corporation"},{"s":"VCEL","n":"Vericel Corporation"},{"s":"VCIG","n":"VCI Global Limited - Ordinary Share"},{"s":"VCRE","n":"Vicore Pharma Holding AB"},{"s":"VCTR","n":"Victory Capital Holdings, Inc."},{"s":"VCYT","n":"Veracyte, Inc."},{"s":"VECO","n":"Veeco Instruments Inc."},{"s":"VEEA","n":"Veea Inc."},{"s":"VEEE","n":"Twin Vee PowerCats Co."},{"s":"VEEV","n":"Veeva Systems Inc. Class A Common Stock"},{"s":"VEL","n":"Velocity Financial, Inc. Common Stock"},{"s":"VELO","n":"Velo3D, Inc."},{"s":"VENU","n":"Venu Holding Corporation Common Stock"},{"s":"VEON","n":"VEON Ltd."},{"s":"VERA","n":"Vera Therapeutics, Inc."},{"s":"VERI","n":"Veritone, Inc."},{"s":"VERU","n":"Veru Inc."},{"s":"VERX","n":"Vertex, Inc."},{"s":"VET","n":"Vermilion Energy Inc. Common (Canada)"},{"s":"VFC","n":"V.F. Corporation Common Stock"},{"s":"VFF","n":"Village Farms International, Inc. - Common Shares"},{"s":"VFS","n":"VinFast Auto Ltd."},{"s":"VG","n":"Venture Global, Inc. Class A common stock"},{"s":"VGAS","n":"Verde Clean Fuels, Inc."},{"s":"VGNT","n":"Versigent PLC Ordinary Shares"},{"s":"VGZ","n":"Vista Gold Corp Common Stock"},{"s":"VHC","n":"VirnetX Holding Corp"},{"s":"VHCP","n":"Vine Hill Capital Investment Corp. II"},{"s":"VHCPU","n":"Vine Hill Capital Investment Corp. II - Units"},{"s":"VHCPW","n":"Vine Hill Capital Investment Corp. II - Warrants"},{"s":"VHI","n":"Valhi, Inc. Common Stock"},{"s":"VHUB","n":"VenHub Global, Inc."},{"s":"VIA","n":"Via Transportation, Inc. Class A Common Stock"},{"s":"VIAV","n":"Viavi Solutions Inc."},{"s":"VICI","n":"VICI Properties Inc. Common Stock"},{"s":"VICR","n":"Vicor Corporation"},{"s":"VIDA","n":"VIDA Global Inc. Class A Common Stock"},{"s":"VIK","n":"Viking Holdings Ltd Ordinary Shares"},{"s":"VINP","n":"Vinci Compass Investments Ltd."},{"s":"VIOT","n":"Viomi Technology Co., Ltd"},{"s":"VIPS","n":"Vipshop Holdings Limited American Depositary Shares, each representing two ordinary shares"},{"s":"VIR","n":"Vir Biotechnology, Inc."},{"s":"VIRC","n":"Virco Manufacturing Corporation"},{"s":"VIRT","n":"Virtu Financial, Inc. Class A Common Stock"},{"s":"VISN","n":"Vistance Networks, Inc."},{"s":"VITL","n":"Vital Farms, Inc."},{"s":"VIV","n":"Telefonica Brasil S.A. American Depositary Shares (Each representing One Common Share)"},{"s":"VIVK","n":"Vivakor, Inc."},{"s":"VIVO","n":"VivoPower PLC"},{"s":"VIVS","n":"VivoSim Labs, Inc."},{"s":"VKTX","n":"Viking Therapeutics, Inc."},{"s":"VLGEA","n":"Village Super Market, Inc."},{"s":"VLN","n":"Valens Semiconductor Ltd. Ordinary Shares"},{"s":"VLO","n":"Valero Energy Corporation Common Stock"},{"s":"VLRS","n":"Controladora Vuela Compania de Aviacion, S.A.B. de C.V. American Depositary Shares, each representing ten (10) Ordinary Participation Certificates"},{"s":"VLTO","n":"Veralto Corp Common Stock"},{"s":"VLY","n":"Valley National Bancorp"},{"s":"VMAR","n":"Vision Marine Technologies Inc. - Common Shares"},{"s":"VMC","n":"Vulcan Materials Company (Holding Company) Common Stock"},{"s":"VMD","n":"Viemed Healthcare, Inc. - Common Shares"},{"s":"VMET","n":"Versamet Royalties Corporation"},{"s":"VMI","n":"Valmont Industries, Inc. Common Stock"},{"s":"VNCE","n":"Vince Holding Corp."},{"s":"VNDA","n":"Vanda Pharmaceuticals Inc."},{"s":"VNET","n":"VNET Group, Inc."},{"s":"VNOM","n":"Viper Energy, Inc."},{"s":"VNRX","n":"VolitionRX Limited Common Stock"},{"s":"VNT","n":"Vontier Corporation Common Stock"},{"s":"VNTG","n":"Vantage Corp Class A Ordinary Shares"},{"s":"VOD","n":"Vodafone Group Plc"},{"s":"VOR","n":"Vor Biopharma Inc."},{"s":"VOXR","n":"Vox Royalty Corp."},{"s":"VOYA","n":"Voya Financial, Inc. Common Stock"},{"s":"VOYG","n":"Voyager Technologies, Inc. Class A Common Stock"},{"s":"VPG","n":"Vishay Precision Group, Inc. Common Stock"},{"s":"VRA","n":"Vera Bradley, Inc."},{"s":"VRAX","n":"Virax Biolabs Group Limited"},{"s":"VRCA","n":"Verrica Pharmaceuticals Inc."},{"s":"VRDN","n":"Viridian Therapeutics, Inc."},{"s":"VREX","n":"Varex Imaging Corporation"},{"s":"VRM","n":"Vroom, Inc."},{"s":"VRME","n":"VerifyMe, Inc."},{"s":"VRNS","n":"Varonis Systems, Inc."},{"s":"VRRM","n":"Verra Mobility Corporation"},{"s":"VRSK","n":"Verisk Analytics, Inc."},{"s":"VRSN","n":"VeriSign, Inc."},{"s":"VRT","n":"Vertiv Holdings, LLC Class A Common Stock"},{"s":"VRTS","n":"Virtus Investment Partners, Inc. Common Stock"},{"s":"VRTX","n":"Vertex Pharmaceuticals Incorporated"},{"s":"VRXA","n":"Veraxa Biotech AG"},{"s":"VRXAW","n":"Veraxa Biotech AG - Warrants"},{"s":"VS","n":"Versus Systems Inc."},{"s":"VSA","n":"VisionSys AI Inc."},{"s":"VSAT","n":"ViaSat, Inc."},{"s":"VSEC","n":"VSE Corporation"},{"s":"VSECU","n":"VSE Corporation - Tangible Equity Units"},{"s":"VSEE","n":"VSee Health, Inc."},{"s":"VSH","n":"Vishay Intertechnology, Inc. Common Stock"},{"s":"VSME","n":"VS Media Holdings Limited"},{"s":"VSNT","n":"Versant Media Group, Inc."},{"s":"VST","n":"Vistra Corp. Common Stock"},{"s":"VSTD","n":"Vestand Inc."},{"s":"VSTM","n":"Verastem, Inc."},{"s":"VSTS","n":"Vestis Corporation Common Stock"},{"s":"VSXY","n":"Victorias Secret & Co. Common Stock"},{"s":"VTAK","n":"Catheter Precision, Inc. Common Stock"},{"s":"VTEX","n":"VTEX Class A Common Shares"},{"s":"VTGN","n":"Vistagen Therapeutics, Inc."},{"s":"VTIX","n":"Virtuix Holdings Inc."},{"s":"VTMX","n":"Corporacion Inmobiliaria Vesta, S.A.B de C.V. American Depositary Shares, each representing ten (10) Common Shares"},{"s":"VTOL","n":"Bristow Group, Inc. Common Stock"},{"s":"VTR","n":"Ventas, Inc. Common Stock"},{"s":"VTRS","n":"Viatris Inc."},{"s":"VTS","n":"Vitesse Energy, Inc. Common Stock"},{"s":"VTSI","n":"VirTra, Inc."},{"s":"VTVT","n":"vTv Therapeutics Inc."},{"s":"VUZI","n":"Vuzix Corporation"},{"s":"VVOS","n":"Vivos Therapeutics, Inc."},{"s":"VVV","n":"Valvoline Inc. Common Stock"},{"s":"VVX","n":"V2X, Inc. Common Stock"},{"s":"VWAV","n":"VisionWave Holdings, Inc."},{"s":"VYGR","n":"Voyager Therapeutics, Inc."},{"s":"VYNE","n":"VYNE Therapeutics Inc."},{"s":"VYX","n":"NCR Voyix Corporation Common Stock"},{"s":"VZ","n":"Verizon Communications Inc. Common Stock"},{"s":"VZLA","n":"Vizsla Silver Corp. Common Shares"},{"s":"W","n":"Wayfair Inc. Class A Common Stock"},{"s":"WAB","n":"Westinghouse Air Brake Technologies Corporation Common Stock"},{"s":"WABC","n":"Westamerica Bancorporation"},{"s":"WAFD","n":"WaFd, Inc."},{"s":"WAFDP","n":"WaFd, Inc. - Depositary Shares"},{"s":"WAFU","n":"Wah Fu Education Group Limited"},{"s":"WAL","n":"Western Alliance Bancorporation Common Stock (DE)"},{"s":"WALD","n":"Waldencast plc"},{"s":"WAT","n":"Waters Corporation Common Stock"},{"s":"WATT","n":"Energous Corporation"},{"s":"WAVE","n":"Eco Wave Power Global AB (publ)"},{"s":"WAY","n":"Waystar Holding Corp."},{"s":"WB","n":"Weibo Corporation"},{"s":"WBI","n":"WaterBridge Infrastructure LLC Class A Shares Representing Limited Liability Company Interests"},{"s":"WBS","n":"Webster Financial Corporation Common Stock"},{"s":"WBTN","n":"WEBTOON Entertainment Inc."},{"s":"WBUY","n":"WEBUY GLOBAL LTD."},{"s":"WBX","n":"Wallbox N.V. Class A Ordinary Shares"},{"s":"WCC","n":"WESCO International, Inc. Common Stock"},{"s":"WCN","n":"Waste Connections, Inc. Common Shares"},{"s":"WCT","n":"Wellchange Holdings Company Limited"},{"s":"WD","n":"Walker & Dunlop, Inc Common Stock"},{"s":"WDAY","n":"Workday, Inc."},{"s":"WDC","n":"Western Digital Corporation"},{"s":"WDFC","n":"WD-40 Company"},{"s":"WDS","n":"Woodside Energy Group Limited American Depositary Shares, each representing one Ordinary Share"},{"s":"WEAV","n":"Weave Communications, Inc. Common Stock"},{"s":"WEC","n":"WEC Energy Group, Inc. Common Stock"},{"s":"WELL","n":"Welltower Inc. Common Stock"},{"s":"WEN","n":"Wendy's Company (The)"},{"s":"WENC","n":"West Enclave Merger Corp. Ordinary Shares"},{"s":"WERN","n":"Werner Enterprises, Inc."},{"s":"WEST","n":"Westrock Coffee Company"},{"s":"WETH","n":"Wetouch Technology Inc."},{"s":"WETO","n":"Wetour Robotics Limited"},{"s":"WEX","n":"WEX Inc. common stock"},{"s":"WEYS","n":"Weyco Group, Inc."},{"s":"WF","n":"Woori Financial Group Inc. American Depositary Shares (each representing three (3) shares of Common Stock)"},{"s":"WFC","n":"Wells Fargo & Company Common Stock"},{"s":"WFCF","n":"Where Food Comes From, Inc."},{"s":"WFF","n":"WF Holding Limited"},{"s":"WFG","n":"West Fraser Timber Co. Ltd Common stock"},{"s":"WFRD","n":"Weatherford International plc"},{"s":"WGO","n":"Winnebago Industries, Inc. Common Stock"},{"s":"WGRX","n":"Wellgistics Health, Inc."},{"s":"WGS","n":"GeneDx Holdings Corp."},{"s":"WH","n":"Wyndham Hotels & Resorts, Inc. Common Stock"},{"s":"WHD","n":"Cactus, Inc. Class A Common Stock"},{"s":"WHG","n":"Westwood Holdings Group Inc Common Stock"},{"s":"WHK","n":"WhiteHawk Minerals Corp Class A Common Stock"},{"s":"WHR","n":"Whirlpool Corporation Common Stock"},{"s":"WHWK","n":"Whitehawk Therapeutics, Inc."},{"s":"WILC","n":"G. Willi-Food International, Ltd."},{"s":"WIMI","n":"WiMi Hologram Cloud Inc."},{"s":"WINA","n":"Winmark Corporation"},{"s":"WING","n":"Wingstop Inc."},{"s":"WIT","n":"Wipro Limited Common Stock"},{"s":"WIX","n":"Wix.com Ltd."},{"s":"WK","n":"Workiva Inc. Class A Common Stock"},{"s":"WKC","n":"World Kinect Corporation Common Stock"},{"s":"WKEY","n":"WISeKey International Holding Ltd"},{"s":"WKHS","n":"Workhorse Group, Inc."},{"s":"WKSP","n":"Worksport, Ltd."},{"s":"WLCOU","n":"Wilco 63 Corporation - Units"},{"s":"WLDN","n":"Willdan Group, Inc."},{"s":"WLDS","n":"Wearable Devices Ltd. - Ordinary Share"},{"s":"WLFC","n":"Willis Lease Finance Corporation"},{"s":"WLK","n":"Westlake Corporation Common Stock"},{"s":"WLTH","n":"Wealthfront Corporation"},{"s":"WLY","n":"John Wiley & Sons, Inc. Common Stock"},{"s":"WLYB","n":"John Wiley & Sons, Inc. Common Stock"},{"s":"WM","n":"Waste Management, Inc. Common Stock"},{"s":"WMB","n":"Williams Companies, Inc. (The) Common Stock"},{"s":"WMG","n":"Warner Music Group Corp."},{"s":"WMK","n":"Weis Markets, Inc. Common Stock"},{"s":"WMS","n":"Advanced Drainage Systems, Inc. Common Stock"},{"s":"WMT","n":"Walmart Inc."},{"s":"WNC","n":"Wabash National Corporation Common Stock"},{"s":"WNEB","n":"Western New England Bancorp, Inc."},{"s":"WNW","n":"Meiwu Technology Company Limited"},{"s":"WOK","n":"WORK Medical Technology Group LTD"},{"s":"WOLF","n":"Wolfspeed, Inc. Common Stock New"},{"s":"WOOF","n":"Petco Health and Wellness Company, Inc."},{"s":"WOR","n":"Worthington Enterprises, Inc. Common Shares"},{"s":"WPM","n":"Wheaton Precious Metals Corp Common Shares (Canada)"},{"s":"WPP","n":"WPP plc American Depositary Shares"},{"s":"WPRT","n":"Westport Fuel Systems Inc - Common Shares"},{"s":"WRAP","n":"Wrap Technologies, Inc."},{"s":"WRB","n":"W.R. Berkley Corporation Common Stock"},{"s":"WRBY","n":"Warby Parker Inc. Class A Common Stock"},{"s":"WRD","n":"WeRide Inc."},{"s":"WRLD","n":"World Acceptance Corporation"},{"s":"WRN","n":"Western Copper and Gold Corporation Common Stock"},{"s":"WS","n":"Worthington Steel, Inc. Common Shares"},{"s":"WSBC","n":"WesBanco, Inc."},{"s":"WSBF","n":"Waterstone Financial, Inc."},{"s":"WSBK","n":"Winchester Bancorp, Inc."},{"s":"WSC","n":"WillScot Holdings Corporation"},{"s":"WSE","n":"Wise Group plc"},{"s":"WSFS","n":"WSFS Financial Corporation"},{"s":"WSHP","n":"WeShop Holdings Limited"},{"s":"WSM","n":"Williams-Sonoma, Inc. Common Stock (DE)"},{"s":"WSO","n":"Watsco, Inc. Common Stock"},{"s":"WSO-B","n":"Watsco, Inc. Class B Common Stock"},{"s":"WST","n":"West Pharmaceutical Services, Inc. Common Stock"},{"s":"WT","n":"WisdomTree, Inc. Common Stock"},{"s":"WTBA","n":"West Bancorporation"},{"s":"WTF","n":"Waton Financial Limited"},{"s":"WTFC","n":"Wintrust Financial Corporation"},{"s":"WTI","n":"W&T Offshore, Inc. Common Stock"},{"s":"WTM","n":"White Mountains Insurance Group, Ltd. Common Stock"},{"s":"WTRG","n":"Essential Utilities, Inc. Common Stock"},{"s":"WTS","n":"Watts Water Technologies, Inc. Class A Common Stock"},{"s":"WTTR","n":"Select Water Solutions, Inc. Class A common stock"},{"s":"WTW","n":"Willis Towers Watson Public Limited Company"},{"s":"WU","n":"Western Union Company (The) Common Stock"},{"s":"WULF","n":"TeraWulf Inc."},{"s":"WVE","n":"Wave Life Sciences Ltd."},{"s":"WVVI","n":"Willamette Valley Vineyards, Inc."},{"s":"WW","n":"WW International, Inc."},{"s":"WWD","n":"Woodward, Inc."},{"s":"WWR","n":"Westwater Resources, Inc. Common Stock"},{"s":"WWW","n":"Wolverine World Wide, Inc. Common Stock"},{"s":"WXM","n":"WF International Limited"},{"s":"WY","n":"Weyerhaeuser Company Common Stock"},{"s":"WYFI","n":"WhiteFiber, Inc."},{"s":"WYHG","n":"Wing Yip Food Holdings Group Limited"},{"s":"WYNN","n":"Wynn Resorts, Limited"},{"s":"WYY","n":"WidePoint Corporation Common Stock"},{"s":"XAIR","n":"Beyond Air, Inc."},{"s":"XBIO","n":"Xenetic Biosciences, Inc."},{"s":"XBIT","n":"XBiotech Inc."},{"s":"XBP","n":"XBP Global Holdings, Inc."},{"s":"XCH","n":"XCHG Limited"},{"s":"XCUR","n":"Exicure, Inc."},{"s":"XE","n":"X-Energy, Inc."},{"s":"XEL","n":"Xcel Energy Inc."},{"s":"XELB","n":"Xcel Brands, Inc"},{"s":"XENE","n":"Xenon Pharmaceuticals Inc. - Common Shares"},{"s":"XERS","n":"Xeris Biopharma Holdings, Inc."},{"s":"XFLH","n":"XFLH Capital Corporation Ordinary Shares"},{"s":"XFOR","n":"X4 Pharmaceuticals, Inc."},{"s":"XGN","n":"Exagen Inc."},{"s":"XHG","n":"XChange TEC.INC"},{"s":"XHLD","n":"TEN Holdings, Inc."},{"s":"XHR","n":"Xenia Hotels & Resorts, Inc. Common Stock"},{"s":"XLO","n":"Xilio Therapeutics, Inc."},{"s":"XMAX","n":"XMAX, Inc."},{"s":"XMTR","n":"Xometry, Inc."},{"s":"XNCR","n":"Xencor, Inc."},{"s":"XNDU","n":"Xanadu Quantum Technologies Limited"},{"s":"XNET","n":"Xunlei Limited"},{"s":"XOM","n":"ExxonMobil Holdings Corporation Common Stock"},{"s":"XOS","n":"Xos, Inc."},{"s":"XOSWW","n":"Xos, Inc. - Warrants"},{"s":"XP","n":"XP Inc."},{"s":"XPEL","n":"XPEL, Inc."},{"s":"XPER","n":"Xperi Inc. Common Stock"},{"s":"XPEV","n":"XPeng Inc. American depositary shares, each representing two Class A ordinary shares"},{"s":"XPL","n":"Solitario Resources Corp. Common Stock"},{"s":"XPO","n":"XPO, Inc. Common Stock"},{"s":"XPOF","n":"Xponential Fitness, Inc. Class A Common Stock"},{"s":"XPON","n":"Expion360 Inc."},{"s":"XPRO","n":"Expro Ltd Ordinary Shares"},{"s":"XRAY","n":"DENTSPLY SIRONA Inc."},{"s":"XRN","n":"Chiron Real Estate Inc. Common Stock"},{"s":"XRTX","n":"XORTX Therapeutics Inc. - Common Shares"},{"s":"XRX","n":"Xerox Holdings Corporation"},{"s":"XRXDW","n":"Xerox Holdings Corporation - Warrants"},{"s":"XTIA","n":"XTI Aerospace, Inc. Common Stock"},{"s":"XTLB","n":"XTL Biopharmaceuticals Ltd."},{"s":"XTNT","n":"Xtant Medical Holdings, Inc. Common Stock"},{"s":"XWEL","n":"XWELL, Inc."},{"s":"XXI","n":"Twenty One Capital, Inc. Class A Common Stock"},{"s":"XXII","n":"22nd Century Group, Inc"},{"s":"XYF","n":"X Financial American Depositary Shares, each representing six Class A Ordinary Shares"},{"s":"XYL","n":"Xylem Inc. Common Stock New"},{"s":"XYZ","n":"Block, Inc. Class A Common Stock,"},{"s":"XZO","n":"Exzeo Group, Inc. Common Stock"},{"s":"YAAS","n":"Youxin Technology Ltd"},{"s":"YALA","n":"Yalla Group Limited American Depositary Shares, each representing one Class A Ordinary Share"},{"s":"YB","n":"Yuanbao Inc."},{"s":"YCBD","n":"cbdMD, Inc. Common Stock"},{"s":"YDDL","n":"One and One Green Technologies. INC"},{"s":"YDES","n":"YD Bio Limited"},{"s":"YDESW","n":"YD Bio Limited - Warrants"},{"s":"YDKG","n":"Yueda Digital Holding"},{"s":"YELP","n":"Yelp Inc. Common Stock"},{"s":"YETI","n":"YETI Holdings, Inc. Common Stock"},{"s":"YEXT","n":"Yext, Inc. Common Stock"},{"s":"YHC","n":"LQR House Inc."},{"s":"YHGJ","n":"Yunhong Green CTI Ltd."},{"s":"YI","n":"111, Inc."},{"s":"YIBO","n":"Planet Image International Limited"},{"s":"YICC","n":"Yorkville International Capital Corp."},{"s":"YICCU","n":"Yorkville International Capital Corp. - Units"},{"s":"YICCW","n":"Yorkville International Capital Corp. - Warrants"},{"s":"YJ","n":"Yunji Inc. - American Depository Shares"},{"s":"YMAT","n":"J-Star Holding Co., Ltd."},{"s":"YMM","n":"Full Truck Alliance Co. Ltd. American Depositary Shares (each representing 20 Class A Ordinary Shares)"},{"s":"YMT","n":"Yimutian Inc."},{"s":"YOOV","n":"Concorde International Group Ltd"},{"s":"YORW","n":"The York Water Company"},{"s":"YOU","n":"Clear Secure, Inc. Class A Common Stock"},{"s":"YOUL","n":"Youlife Group Inc."},{"s":"YPF","n":"YPF Sociedad Anonima Common Stock"},{"s":"YQ","n":"17 Education & Technology Group Inc."},{"s":"YRD","n":"Yiren Digital Ltd. American Depositary Shares, each representing two ordinary shares"},{"s":"YSG","n":"Yatsen Holding Limited American Depositary Shares, each representing twenty (20) Class A Ordinary Shares"},{"s":"YSS","n":"York Space Systems Inc. Common Stock"},{"s":"YSWY","n":"Yesway, Inc."},{"s":"YSXT","n":"YSX Tech. Co., Ltd"},{"s":"YTRA","n":"Yatra Online, Inc."},{"s":"YUM","n":"Yum! Brands, Inc."},{"s":"YUMC","n":"Yum China Holdings, Inc. Common Stock"},{"s":"YXT","n":"YXT.COM GROUP HOLDING LIMITED - American Depository Shares"},{"s":"YYAI","n":"AiRWA Inc."},{"s":"YYGH","n":"YY Group Holding Limited"},{"s":"Z","n":"Zillow Group, Inc."},{"s":"ZBAO","n":"Zhibao Technology Inc."},{"s":"ZBH","n":"Zimmer Biomet Holdings, Inc. Common Stock"},{"s":"ZBIO","n":"Zenas BioPharma, Inc."},{"s":"ZBRA","n":"Zebra Technologies Corporation"},{"s":"ZCMD","n":"Zhongchao Inc."},{"s":"ZD","n":"Ziff Davis, Inc."},{"s":"ZDAI","n":"DirectBooking Technology Co., Ltd."},{"s":"ZDGE","n":"Zedge, Inc. Class B Common Stock"},{"s":"ZENA","n":"ZenaTech, Inc."},{"s":"ZEO","n":"Zeo Energy Corporation"},{"s":"ZEOWW","n":"Zeo Energy Corporation - Warrants"},{"s":"ZEPP","n":"Zepp Health Corporation American depositary shares, each representing sixteen Class A ordinary shares"},{"s":"ZETA","n":"Zeta Global Holdings Corp. Class A Common Stock"},{"s":"ZG","n":"Zillow Group, Inc."},{"s":"ZGN","n":"Ermenegildo Zegna N.V. Ordinary Shares"},{"s":"ZH","n":"Zhihu Inc. American Depositary Shares, each representing three (3) Class A Ordinary Shares"},{"s":"ZIM","n":"ZIM Integrated Shipping Services Ltd. Ordinary Shares"},{"s":"ZION","n":"Zions Bancorporation N.A."},{"s":"ZIP","n":"ZipRecruiter, Inc. Class A Common Stock"},{"s":"ZJK","n":"ZJK Industrial Co., Ltd."},{"s":"ZJYL","n":"JIN MEDICAL INTERNATIONAL LTD."},{"s":"ZKH","n":"ZKH Group Limited American Depositary Shares, each representing thirty-five (35) Class A Ordinary Shares"},{"s":"ZKIN","n":"ZK International Group Co., Ltd - Ordinary Share"},{"s":"ZLAB","n":"Zai Lab Limited"},{"s":"ZM","n":"Zoom Communications, Inc."},{"s":"ZNB","n":"Zeta Network Group"},{"s":"ZNTL","n":"Zentalis Pharmaceuticals, Inc."},{"s":"ZONE","n":"CleanCore Solutions Inc. Class B Common Stock"},{"s":"ZOOZ","n":"ZOOZ Strategy Ltd."},{"s":"ZS","n":"Zscaler, Inc."},{"s":"ZSQR","n":"Z Squared Inc."},{"s":"ZSTK","n":"ZeroStack Corp."},{"s":"ZTEK","n":"Zentek Ltd."},{"s":"ZTG","n":"Zenta Group Company Limited"},{"s":"ZTO","n":"ZTO Express (Cayman) Inc. American Depositary Shares, each representing one Class A ordinary share."},{"s":"ZTS","n":"Zoetis Inc. Class A Common Stock"},{"s":"ZUMZ","n":"Zumiez Inc."},{"s":"ZURA","n":"Zura Bio Limited"},{"s":"ZVIA","n":"Zevia PBC Class A Common Stock"},{"s":"ZVRA","n":"Zevra Therapeutics, Inc."},{"s":"ZWS","n":"Zurn Elkay Water Solutions Corporation Common Stock"},{"s":"ZYBT","n":"Zhengye Biotechnology Holding Limited"},{"s":"ZYME","n":"Zymeworks Inc."}];